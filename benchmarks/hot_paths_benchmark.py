@@ -0,0 +1,261 @@
+"""
+Offline micro-benchmarks for the serving and pipeline hot paths.
+
+Nothing touches the network: prices come from a deterministic stub provider
+plugged into the BarStore, news sources answer from canned RSS/JSON through a
+stub HTTP session, and the market snapshot is assembled from a canned bulk
+download. The trained models under flask_app/artifacts are used as-is.
+
+Every run is appended to a JSON-lines history. Medians are compared against a
+stored baseline and a case is flagged as a regression when it is more than
+--tolerance slower; the exit status is 1 if any case regressed. The committed
+baseline (benchmarks/results/hot_paths_baseline.json) was recorded on a 1-CPU
+machine; timings are machine-specific, so re-record it with --update-baseline
+on the machine that runs the comparisons before relying on the flags.
+
+Run from the repository root:
+    python -m benchmarks.hot_paths_benchmark [--repeat 20] [--tolerance 0.25] [--update-baseline]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+import zlib
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FLASK_APP_DIR = os.path.join(REPO_ROOT, "flask_app")
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+HISTORY_PATH = os.path.join(RESULTS_DIR, "hot_paths_history.jsonl")
+BASELINE_PATH = os.path.join(RESULTS_DIR, "hot_paths_baseline.json")
+
+CANNED_HEADLINES = [
+    "Apple beats earnings expectations as iPhone sales surge",
+    "Analysts downgrade Apple citing weak demand in China",
+    "Apple unveils new AI features at developer conference",
+    "Regulators open antitrust probe into App Store fees",
+    "Apple shares slip after supplier warns of shortages",
+    "Investors cheer record buyback program from Apple",
+    "Apple stock flat ahead of Federal Reserve decision",
+    "Lawsuit alleges Apple misled customers over battery life",
+    "Apple expands services revenue to an all-time high",
+    "Why Apple could be the best long-term tech stock",
+] * 5
+
+
+# --- STUB PROVIDERS ---
+def stub_price_fetcher(symbol, start=None, n_days=1500):
+    """Deterministic daily random walk per symbol, ending today so period-based lookups find bars."""
+    rng = np.random.default_rng(zlib.crc32(symbol.encode()))
+    dates = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=n_days, name="Date")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, n_days)))
+    df = pd.DataFrame({
+        "Open": close * (1 + rng.normal(0, 0.003, n_days)),
+        "High": close * 1.01,
+        "Low": close * 0.99,
+        "Close": close,
+        "Volume": rng.integers(1_000_000, 50_000_000, n_days).astype(float),
+    }, index=dates)
+    return df if start is None else df[df.index >= pd.Timestamp(start)]
+
+
+def stub_bulk_download(symbols):
+    """Same shape as yf.download(symbols, period='5d', group_by='ticker')."""
+    return pd.concat({symbol: stub_price_fetcher(symbol).tail(5) for symbol in symbols}, axis=1)
+
+
+class StubResponse:
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class StubSession:
+    """Answers the scraper's Google News and Reddit requests with canned payloads."""
+
+    def __init__(self, headlines):
+        items = "".join(f"<item><title>{title}</title><link>https://example.com/{i}</link></item>"
+                        for i, title in enumerate(headlines[:10]))
+        self.rss = f'<?xml version="1.0"?><rss version="2.0"><channel><title>News</title>{items}</channel></rss>'.encode()
+        self.reddit = json.dumps({"data": {"children": [{"data": {"title": title}} for title in headlines[:5]]}}).encode()
+
+    def get(self, url, timeout=None):
+        return StubResponse(self.rss if "news.google.com" in url else self.reddit)
+
+
+# --- SETUP ---
+def load_offline_app(bar_dir):
+    # Forced off: the warmup thread would start the real market snapshot before it is stubbed below
+    os.environ["WARMUP_ON_START"] = "0"
+    os.environ["BAR_STORE_DIR"] = bar_dir
+    # No precomputed table, so the prediction cases keep measuring on-demand inference
+    os.environ["FORECAST_TABLE_DIR"] = os.path.join(bar_dir, "no_forecasts")
+    sys.path.insert(0, FLASK_APP_DIR)
+    import app
+    from market_data.bar_store import BarStore
+    from market_data.snapshot import MarketSnapshot, build_market_rows
+    from sentiment_analysis import scraper
+
+    app.bar_store = BarStore(bar_dir, fetcher=stub_price_fetcher, refresh_interval=10**9)
+    bulk = stub_bulk_download(list(app.STOCKS_INFO))
+    app.market_snapshot = MarketSnapshot(lambda: build_market_rows(bulk, app.STOCKS_INFO), interval=10**9)
+    scraper.session = StubSession(CANNED_HEADLINES)
+    return app
+
+
+def build_cases(app):
+    from sentiment_analysis import analyzer, scraper
+    from market_data.forecast_table import ForecastTable
+    from stock_prediction.components.data_preprocessing import create_sequences
+
+    client = app.app.test_client()
+    series = np.random.default_rng(0).random((20_000, 1))
+
+    # A universe-sized table like the one the batch_forecast stage writes
+    table_dir = os.path.join(app.BAR_STORE_DIR, "forecasts")
+    symbols = [f"S{i:04d}" for i in range(3500)] + ["AAPL"]
+    rng = np.random.default_rng(0)
+    ForecastTable.write(table_dir, symbols, [pd.Timestamp.today().date()] * len(symbols),
+                        rng.random(len(symbols)), rng.random(len(symbols)), rng.random((len(symbols), 60)))
+    forecast_table = ForecastTable(table_dir)
+
+    def predict_future():
+        response = client.get("/api/predict-future/AAPL")
+        assert response.status_code == 200, response.get_json()
+
+    def sentiment_cold():
+        analyzer.clear_cache()
+        return app.get_sentiment(CANNED_HEADLINES)
+
+    def scrape_news():
+        scraper.clear_headline_cache()
+        headlines = scraper.scrape_financial_news("AAPL", "Apple Inc.")
+        assert len(headlines) == 10 + 5 * len(scraper.SUBREDDITS), headlines
+
+    def market_data():
+        app.market_snapshot.refresh()
+        response = client.get("/api/market-data")
+        assert response.status_code == 200, response.get_json()
+
+    def prediction(symbol):
+        def run():
+            result = app.get_stock_prediction(symbol)
+            assert "error" not in result, result
+        return run
+
+    return {
+        "get_stock_prediction[AAPL]": prediction("AAPL"),
+        "get_stock_prediction[general]": prediction("ZZZZ"),
+        "predict_future[AAPL]": predict_future,
+        "create_sequences[20k]": lambda: create_sequences(series),
+        "get_sentiment[cold]": sentiment_cold,
+        "get_sentiment[warm]": lambda: app.get_sentiment(CANNED_HEADLINES),
+        "scrape_financial_news[parse]": scrape_news,
+        "market_data[assembly]": market_data,
+        "symbol_search[micro]": lambda: app.get_symbol_index().search("micro"),
+        "forecast_table[lookup]": lambda: forecast_table.get("AAPL"),
+    }
+
+
+def time_case(fn, repeat):
+    fn()  # first call loads models, fills the bar store, compiles; not timed
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return {"median_ms": statistics.median(timings) * 1e3, "min_ms": min(timings) * 1e3}
+
+
+# --- HISTORY / BASELINE ---
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, tolerance):
+    """Returns {case: ratio} for cases whose median is more than `tolerance` slower than the baseline."""
+    regressions = {}
+    for name, stats in results.items():
+        reference = baseline.get(name)
+        if reference and stats["median_ms"] > reference["median_ms"] * (1 + tolerance):
+            regressions[name] = stats["median_ms"] / reference["median_ms"]
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs. baseline (0.25 = 25%%)")
+    parser.add_argument("--only", nargs="*", help="run only these cases")
+    parser.add_argument("--history", default=HISTORY_PATH)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the new baseline")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")  # e.g. sklearn feature-name warnings on every scaler call
+    with tempfile.TemporaryDirectory() as bar_dir:
+        with contextlib.redirect_stdout(io.StringIO()):  # the app and scraper log every call
+            app = load_offline_app(bar_dir)
+            cases = build_cases(app)
+            if args.only:
+                cases = {name: fn for name, fn in cases.items() if name in args.only}
+            results = {name: time_case(fn, args.repeat) for name, fn in cases.items()}
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+    regressions = compare(results, baseline, args.tolerance)
+
+    print(f"{'case':<32}{'median (ms)':>13}{'min (ms)':>11}{'baseline':>11}{'change':>9}")
+    for name, stats in results.items():
+        reference = baseline.get(name, {}).get("median_ms")
+        reference_text = f"{reference:.3f}" if reference else "-"
+        change = f"{stats['median_ms'] / reference - 1:+.0%}" if reference else "-"
+        flag = "  REGRESSION" if name in regressions else ""
+        print(f"{name:<32}{stats['median_ms']:>13.3f}{stats['min_ms']:>11.3f}{reference_text:>11}{change:>9}{flag}")
+
+    record = {
+        "benchmark": "hot_paths",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "repeat": args.repeat,
+        "results": results,
+        "regressions": sorted(regressions),
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.history)), exist_ok=True)
+    with open(args.history, "a") as file:
+        file.write(json.dumps(record) + "\n")
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(record, file, indent=2)
+        print(f"baseline updated: {args.baseline}")
+    elif not baseline:
+        print(f"no baseline at {args.baseline}; run with --update-baseline to store one")
+    elif regressions:
+        print(f"{len(regressions)} case(s) regressed by more than {args.tolerance:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Measures the cold-start cost of the Flask app: how long `import app` takes in a
+fresh interpreter, which heavy modules it pulls in, and (optionally) how long the
+background warmup needs until /ready turns green.
+
+Every repeat runs in a new subprocess so nothing is cached between runs. Results
+can be appended to a JSON-lines history file to track them across releases.
+
+Run from the repository root:
+    python -m benchmarks.import_time_benchmark [--repeat 5] [--warmup] [--history benchmarks/results/import_time.jsonl]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FLASK_APP_DIR = os.path.join(REPO_ROOT, "flask_app")
+HEAVY_MODULES = ["tensorflow", "yfinance", "nltk", "pandas", "sklearn"]
+
+# Runs inside the child interpreter. Background threads may print too, so the
+# result line is tagged with MARKER.
+MARKER = "IMPORT_TIME_RESULT "
+CHILD_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+import app
+import_seconds = time.perf_counter() - started
+result = {{"import_seconds": import_seconds,
+          "heavy_modules": [m for m in {heavy!r} if m in sys.modules]}}
+if {wait_for_warmup!r}:
+    app.warmup.wait()
+    result["ready_seconds"] = time.perf_counter() - started
+    result["warmup"] = app.warmup.status()
+print({marker!r} + json.dumps(result), flush=True)
+"""
+
+
+def run_once(wait_for_warmup):
+    env = dict(os.environ, WARMUP_ON_START="1" if wait_for_warmup else "0")
+    script = CHILD_SCRIPT.format(heavy=HEAVY_MODULES, wait_for_warmup=wait_for_warmup, marker=MARKER)
+    proc = subprocess.run([sys.executable, "-c", script], cwd=FLASK_APP_DIR, env=env,
+                          capture_output=True, text=True, check=True)
+    line = next(line for line in proc.stdout.splitlines() if MARKER in line)
+    return json.loads(line.split(MARKER, 1)[1])
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", action="store_true", help="also measure time until the warmup thread is done")
+    parser.add_argument("--history", help="JSON-lines file the summary is appended to")
+    args = parser.parse_args()
+
+    runs = [run_once(wait_for_warmup=False) for _ in range(args.repeat)]
+    import_times = [run["import_seconds"] for run in runs]
+    summary = {
+        "benchmark": "import_time",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "repeat": args.repeat,
+        "import_seconds_min": min(import_times),
+        "import_seconds_median": statistics.median(import_times),
+        "heavy_modules_at_import": runs[-1]["heavy_modules"],
+    }
+    print(f"import app: min {summary['import_seconds_min']:.3f}s, median {summary['import_seconds_median']:.3f}s "
+          f"over {args.repeat} run(s)")
+    print(f"heavy modules loaded by the import: {summary['heavy_modules_at_import'] or 'none'}")
+
+    if args.warmup:
+        warm = run_once(wait_for_warmup=True)
+        summary["ready_seconds"] = warm["ready_seconds"]
+        summary["warmup_tasks"] = {name: task.get("seconds") for name, task in warm["warmup"]["tasks"].items()}
+        print(f"ready after {warm['ready_seconds']:.3f}s; tasks: {summary['warmup_tasks']}")
+
+    if args.history:
+        os.makedirs(os.path.dirname(os.path.abspath(args.history)), exist_ok=True)
+        with open(args.history, "a") as file:
+            file.write(json.dumps(summary) + "\n")
+        print(f"appended to {args.history}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Checks the NumPy LSTM backend (flask_app.model_serving.numpy_lstm) against Keras
+on every trained model and compares their serving latency.
+
+For each best_model_*.h5 the same random windows go through both backends; the
+run fails if any output differs by more than --atol. Latency is measured for a
+single next-day prediction and for a full recursive forecast.
+
+Run from the repository root:
+    python -m benchmarks.numpy_lstm_benchmark [--models-dir flask_app/artifacts/models/best_models] [--batch 32]
+"""
+import argparse
+import glob
+import os
+import time
+import numpy as np
+
+from flask_app.model_serving.forecasting import ForecastEngine
+from flask_app.model_serving.numpy_lstm import load_numpy_lstm_model
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--models-dir", default=os.path.join("flask_app", "artifacts", "models", "best_models"))
+    parser.add_argument("--time-step", type=int, default=60)
+    parser.add_argument("--batch", type=int, default=32, help="windows used for the numerical check")
+    parser.add_argument("--steps", type=int, default=60, help="recursive forecast length")
+    parser.add_argument("--atol", type=float, default=1e-5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    import tensorflow as tf
+
+    paths = sorted(glob.glob(os.path.join(args.models_dir, "best_model_*.h5")))
+    if not paths:
+        raise SystemExit(f"No best_model_*.h5 files in {args.models_dir}")
+
+    rng = np.random.default_rng(0)
+    windows = rng.random((args.batch, args.time_step, 1), dtype=np.float32)
+    engine = ForecastEngine(time_step=args.time_step)
+
+    print(f"{'model':<26}{'max |err|':>12}{'keras 1x (ms)':>15}{'numpy 1x (ms)':>15}"
+          f"{'keras fc (ms)':>15}{'numpy fc (ms)':>15}")
+    for path in paths:
+        keras_model = tf.keras.models.load_model(path)
+        numpy_model = load_numpy_lstm_model(path)
+
+        error = float(np.abs(numpy_model.predict(windows) - keras_model.predict(windows, verbose=0)).max())
+        assert error <= args.atol, f"{os.path.basename(path)}: NumPy output differs from Keras by {error:.2e}"
+
+        one = windows[:1]
+        keras_one = best_of(lambda: keras_model.predict(one, verbose=0), args.repeat)
+        numpy_one = best_of(lambda: numpy_model.predict(one), args.repeat)
+        engine.rollout_scaled(keras_model, one[:, :, 0], args.steps)  # compile once, outside the timing
+        keras_fc = best_of(lambda: engine.rollout_scaled(keras_model, one[:, :, 0], args.steps), args.repeat)
+        numpy_fc = best_of(lambda: engine.rollout_scaled(numpy_model, one[:, :, 0], args.steps), args.repeat)
+        print(f"{os.path.basename(path):<26}{error:>12.2e}{keras_one * 1e3:>15.2f}{numpy_one * 1e3:>15.2f}"
+              f"{keras_fc * 1e3:>15.1f}{numpy_fc * 1e3:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
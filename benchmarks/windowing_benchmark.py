@@ -0,0 +1,74 @@
+"""
+Compares the strided windowing in stock_prediction.utils.windowing with the
+list-append loops it replaced in create_sequences / reshape_for_lstm.
+
+Run from the repository root:
+    python -m benchmarks.windowing_benchmark [--length 250000] [--seq-length 60] [--repeat 3]
+"""
+import argparse
+import time
+import numpy as np
+
+from stock_prediction.utils.windowing import make_sequences
+
+
+def loop_create_sequences(dataset, seq_length=60):
+    """Previous data_preprocessing.create_sequences implementation."""
+    X, y = [], []
+    for i in range(seq_length, len(dataset)):
+        X.append(dataset[i-seq_length:i, 0])
+        y.append(dataset[i, 0])
+    X = np.array(X)
+    y = np.array(y)
+    return X.reshape((X.shape[0], X.shape[1], 1)), y
+
+
+def loop_reshape_for_lstm(data, sequence_length):
+    """Previous model_evaluation.reshape_for_lstm implementation."""
+    X, y = [], []
+    for i in range(len(data) - sequence_length):
+        X.append(data[i:i + sequence_length, :-1])
+        y.append(data[i + sequence_length, -1])
+    return np.array(X), np.array(y)
+
+
+def best_of(fn, repeat):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--length", type=int, default=250_000, help="rows in the synthetic series")
+    parser.add_argument("--seq-length", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    series = rng.random((args.length, 1))
+    table = rng.random((args.length, 4))  # 3 features + target column
+
+    cases = [
+        ("create_sequences", lambda: loop_create_sequences(series, args.seq_length),
+         lambda: make_sequences(series[:, :1], series[:, 0], seq_length=args.seq_length)),
+        ("reshape_for_lstm", lambda: loop_reshape_for_lstm(table, args.seq_length),
+         lambda: make_sequences(table[:, :-1], table[:, -1], seq_length=args.seq_length)),
+    ]
+
+    print(f"{'case':<18}{'loop (s)':>12}{'strided (s)':>14}{'speedup':>10}{'loop MB':>10}{'view MB':>10}")
+    for name, loop_fn, strided_fn in cases:
+        loop_time, (X_loop, y_loop) = best_of(loop_fn, args.repeat)
+        strided_time, (X_view, y_view) = best_of(strided_fn, args.repeat)
+        assert np.array_equal(X_loop, X_view) and np.array_equal(y_loop, y_view), f"{name}: outputs differ"
+        # A view owns no memory of its own beyond what the source series already holds
+        view_mb = 0.0 if not X_view.flags.owndata else X_view.nbytes / 1e6
+        print(f"{name:<18}{loop_time:>12.4f}{strided_time:>14.6f}{loop_time / strided_time:>10.0f}x"
+              f"{X_loop.nbytes / 1e6:>10.1f}{view_mb:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
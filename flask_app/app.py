@@ -1,14 +1,28 @@
 import os
 import numpy as np
-import pandas as pd
-import yfinance as yf
-from flask import Flask, render_template, request, jsonify
-from sentiment_analysis.scraper import scrape_financial_news
-from sentiment_analysis.analyzer import get_sentiment
+from flask import Flask, render_template, request, jsonify, g
+from sentiment_analysis.scraper import scrape_financial_news, get_company_name
+from sentiment_analysis.analyzer import get_sentiment, cache_stats as sentiment_cache_stats
+from model_serving.registry import ModelRegistry
+from model_serving.forecasting import ForecastEngine
+from model_serving.batching import MicroBatcher
+from model_serving.warmup import Warmup
+from model_serving.numpy_lstm import load_numpy_lstm_model
+from market_data.bar_store import BarStore, yfinance_fetcher
+from market_data.snapshot import MarketSnapshot, download_market_rows
+from market_data.historical import ResponseCache, build_historical_payload
+from market_data.symbol_index import SymbolIndex
+from market_data.forecast_table import ForecastTable
+from monitoring.metrics import (registry as metrics_registry, timed, timed_function, submit_in_context,
+                                start_request_timings, STAGE_ERRORS, CACHE_LOOKUPS)
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import glob
+import time
+import json
 import requests
 import pickle
-import tensorflow as tf
 import urllib.parse
 
 app = Flask(__name__)
@@ -20,6 +34,42 @@ ARTIFACTS_DIR = os.path.join(BASE_DIR, 'artifacts')
 TOP_10_COMPANIES = ["AAPL", "MSFT", "GOOG", "AMZN", "TSLA", "META", "NFLX", "NVDA", "JPM", "V"]
 NEWSDATA_API_KEY = os.getenv('NEWSDATA_API_KEY')  # Ensure
 TIME_STEP = 60  # Must match training
+FORECAST_DAYS = 60
+MODEL_CACHE_SIZE = int(os.getenv('MODEL_CACHE_SIZE', '24'))  # (10 per-ticker + general) x (next-day + multi-horizon) + headroom
+BAR_STORE_DIR = os.getenv('BAR_STORE_DIR', os.path.join(BASE_DIR, 'cache', 'bars'))
+BAR_REFRESH_SECONDS = int(os.getenv('BAR_REFRESH_SECONDS', '900'))  # How often a symbol is checked for new bars
+BAR_STORE_MAX_OPEN = int(os.getenv('BAR_STORE_MAX_OPEN', '256'))  # Symbols kept memory-mapped (one file descriptor each)
+HISTORICAL_CACHE_SIZE = int(os.getenv('HISTORICAL_CACHE_SIZE', '256'))
+MAX_CHART_POINTS = 5000
+CHART_POINTS_BUCKET = 100  # Requested point counts are rounded up to this, so chart widths share cache entries
+SYMBOLS_FILE = os.path.join(BASE_DIR, 'market_data', 'symbols.csv')
+# Precomputed by the nightly batch_forecast stage; rows older than this are ignored and computed on demand
+FORECAST_TABLE_DIR = os.getenv('FORECAST_TABLE_DIR', os.path.join(ARTIFACTS_DIR, 'forecasts'))
+FORECAST_TABLE_MAX_AGE_HOURS = float(os.getenv('FORECAST_TABLE_MAX_AGE_HOURS', '30'))
+SYMBOL_SEARCH_MAX_LIMIT = 50
+MARKET_REFRESH_SECONDS = int(os.getenv('MARKET_REFRESH_SECONDS', '60'))
+PREDICT_WORKERS = int(os.getenv('PREDICT_WORKERS', '16'))
+# Seconds each /predict stage may take before the page is rendered without it
+STAGE_TIMEOUTS = {
+    "company_info": float(os.getenv('COMPANY_INFO_TIMEOUT', '4')),
+    "prediction": float(os.getenv('PREDICTION_TIMEOUT', '10')),
+    "news": float(os.getenv('NEWS_TIMEOUT', '8')),
+}
+INFERENCE_MAX_BATCH = int(os.getenv('INFERENCE_MAX_BATCH', '32'))
+INFERENCE_MAX_WAIT_MS = float(os.getenv('INFERENCE_MAX_WAIT_MS', '5'))
+INFERENCE_TIMEOUT = float(os.getenv('INFERENCE_TIMEOUT', '5'))  # Seconds a caller waits for its batched prediction
+# 'numpy' serves the LSTMs with a NumPy forward pass (TensorFlow is never imported),
+# 'keras' loads them with tf.keras
+INFERENCE_BACKEND = os.getenv('INFERENCE_BACKEND', 'numpy')
+# 'float16' / 'int8' serve the weight-quantized exports (numpy backend only), see
+# artifacts/model_eval/precision_report.json for their accuracy/latency/memory
+MODEL_PRECISION = os.getenv('MODEL_PRECISION', 'float32')
+# Load yfinance, the models (and TensorFlow for the keras backend) in a background
+# thread right after startup.
+# When disabled everything still loads lazily, on the first request that needs it.
+WARMUP_ON_START = os.getenv('WARMUP_ON_START', '1') == '1'
+# Print a per-request breakdown of the timed stages (model load, yfinance, RSS, Reddit, VADER, ...)
+LOG_REQUEST_TIMINGS = os.getenv('LOG_REQUEST_TIMINGS', '0') == '1'
 
 STOCKS_INFO = {
     "AAPL": {"name": "Apple Inc.", "logo": "https://logo.clearbit.com/apple.com", "website": "https://www.apple.com"},
@@ -46,40 +96,142 @@ class MainUtils:
             print(f"❌ Error loading object from {file_path}: {e}")
             return None
 
+    @staticmethod
+    def load_keras_model(file_path):
+        # TensorFlow is imported here, on the first model load, instead of at app import
+        import tensorflow as tf
+        return tf.keras.models.load_model(file_path)
+
+# --- PRICE DATA ---
+bar_store = BarStore(BAR_STORE_DIR, fetcher=timed_function("yfinance_bars")(yfinance_fetcher),
+                     refresh_interval=BAR_REFRESH_SECONDS, max_open=BAR_STORE_MAX_OPEN)
+# Serialized /api/historical-data responses, kept as long as the bars they came from
+historical_cache = ResponseCache(ttl=BAR_REFRESH_SECONDS, max_entries=HISTORICAL_CACHE_SIZE)
+
+# --- SYMBOL SEARCH ---
+@functools.lru_cache(maxsize=1)
+def get_symbol_index():
+    """Built on the first search (or by the warmup thread) and kept for the life of the process."""
+    return SymbolIndex.from_csv(SYMBOLS_FILE)
+
 # --- MODEL LOGIC ---
-def get_model_and_scaler(symbol):
+def get_model_path(model_name):
+    if MODEL_PRECISION == "float32":
+        return os.path.join(ARTIFACTS_DIR, "models", "best_models", f"best_model_{model_name}.h5")
+    return os.path.join(ARTIFACTS_DIR, "models", "quantized", f"best_model_{model_name}.{MODEL_PRECISION}.npz")
+
+GENERAL_ARTIFACT_PATHS = (
+    get_model_path("general"),
+    os.path.join(ARTIFACTS_DIR, "scalers", "general_stock_scalers", "general_stock_scaler.pkl"),
+)
+
+def get_artifact_paths(symbol):
     symbol = symbol.upper()
-    if symbol in TOP_10_COMPANIES:
-        model_path = os.path.join(ARTIFACTS_DIR, "models", "best_models", f"best_model_{symbol}.h5")
-        scaler_path = os.path.join(ARTIFACTS_DIR, "scalers", "stock_scalers", f"{symbol}_scaler.pkl")
-    else:
-        model_path = os.path.join(ARTIFACTS_DIR, "models", "best_models", "best_model_general.h5")
-        scaler_path = os.path.join(ARTIFACTS_DIR, "scalers", "general_stock_scalers", "general_stock_scaler.pkl")
+    if symbol not in TOP_10_COMPANIES:
+        return GENERAL_ARTIFACT_PATHS
+    model_path = get_model_path(symbol)
+    scaler_path = os.path.join(ARTIFACTS_DIR, "scalers", "stock_scalers", f"{symbol}_scaler.pkl")
+    return model_path, scaler_path
 
-    if not os.path.exists(model_path) or not os.path.exists(scaler_path):
-        print("File not found:", model_path, scaler_path)
-        return None, None
-    try:
-        model = tf.keras.models.load_model(model_path)
-        scaler = MainUtils.load_object(scaler_path)
-        return model, scaler
-    except Exception as e:
-        print(f"Error loading model/scaler: {e}")
-        return None, None
+MODEL_LOADERS = {
+    "numpy": load_numpy_lstm_model,
+    "keras": MainUtils.load_keras_model,
+}
+if INFERENCE_BACKEND not in MODEL_LOADERS:
+    raise ValueError(f"Unknown INFERENCE_BACKEND '{INFERENCE_BACKEND}', expected one of {sorted(MODEL_LOADERS)}")
+if MODEL_PRECISION != "float32" and INFERENCE_BACKEND != "numpy":
+    raise ValueError(f"MODEL_PRECISION={MODEL_PRECISION} requires INFERENCE_BACKEND=numpy")
+
+model_registry = ModelRegistry(
+    model_loader=timed_function("model_load")(MODEL_LOADERS[INFERENCE_BACKEND]),
+    scaler_loader=MainUtils.load_object,
+    max_size=MODEL_CACHE_SIZE,
+)
+
+def get_model_and_scaler(symbol):
+    model_path, scaler_path = get_artifact_paths(symbol)
+    return model_registry.get(model_path, scaler_path)
+
+def get_forecast_artifact_paths(symbol):
+    """
+    The multi-horizon model for `symbol` when the pipeline trained one (params.yaml
+    lstm_model.forecast_horizon > 1 writes best_model_<name>_h<horizon>), else its
+    next-day model. The horizon is read from the artifact name, so it has a single source.
+    Prefers the shortest horizon covering FORECAST_DAYS, which takes one forward pass.
+    """
+    model_path, scaler_path = get_artifact_paths(symbol)
+    model_name = os.path.basename(model_path)[len("best_model_"):].split(".", 1)[0]
+    prefix, suffix = get_model_path(f"{model_name}_h").rsplit("_h", 1)
+    horizons = {}
+    for path in glob.glob(glob.escape(prefix) + "_h*" + suffix):
+        horizon = path[len(prefix) + 2:len(path) - len(suffix)]
+        if horizon.isdigit():
+            horizons[int(horizon)] = path
+    if horizons:
+        covering = [h for h in horizons if h >= FORECAST_DAYS]
+        return horizons[min(covering) if covering else max(horizons)], scaler_path
+    return model_path, scaler_path
+
+def get_forecast_model_and_scaler(symbol):
+    return model_registry.get(*get_forecast_artifact_paths(symbol))
+
+forecast_engine = ForecastEngine(time_step=TIME_STEP)
+forecast_table = ForecastTable(FORECAST_TABLE_DIR, max_age=FORECAST_TABLE_MAX_AGE_HOURS * 3600)
+
+def _scored_with_current_models(symbol, row):
+    """True when `row` was scored with the model files this app loads for `symbol`, unchanged since."""
+    recorded = dict(row.models)
+    for path in {get_artifact_paths(symbol)[0], get_forecast_artifact_paths(symbol)[0]}:
+        try:
+            if os.path.basename(path) not in recorded or os.path.getmtime(path) > recorded[os.path.basename(path)]:
+                return False
+        except OSError:
+            return False
+    return True
+
+def get_precomputed_forecast(symbol):
+    row = forecast_table.get(symbol)
+    if row is not None and not _scored_with_current_models(symbol, row):
+        # Scored with another precision or horizon, or the model was retrained since
+        CACHE_LOOKUPS.inc(cache="forecast_table", result="stale")
+        return None
+    CACHE_LOOKUPS.inc(cache="forecast_table", result="miss" if row is None else "hit")
+    return row
+
+def _predict_general_batch(X):
+    model, _ = model_registry.get(*GENERAL_ARTIFACT_PATHS)
+    if model is None:
+        raise RuntimeError("General model not found.")
+    return model.predict_on_batch(X)
+
+# Requests for symbols served by the shared general model are batched across callers
+general_batcher = MicroBatcher(
+    _predict_general_batch,
+    max_batch_size=INFERENCE_MAX_BATCH,
+    max_wait_ms=INFERENCE_MAX_WAIT_MS,
+    name="general-model",
+)
 
 def get_stock_prediction(symbol):
+    row = get_precomputed_forecast(symbol)
+    if row is not None:
+        return {"prediction": f"${row.next_day:.2f}", "confidence": f"{row.confidence:.1f}%"}
+
     model, scaler = get_model_and_scaler(symbol)
     if model is None or scaler is None:
         return {"prediction": "N/A", "confidence": "N/A", "error": "Model or scaler not found."}
     try:
-        df = yf.download(symbol, period="100d", interval="1d")
-        if len(df) < TIME_STEP:
+        last_days = bar_store.last_closes(symbol, TIME_STEP).reshape(-1, 1)
+        if len(last_days) < TIME_STEP:
             return {"prediction": "N/A", "confidence": "N/A", "error": "Not enough historical data."}
 
-        last_days = df[['Close']].tail(TIME_STEP).values
         scaled = scaler.transform(last_days)
         X_test = np.reshape(scaled, (1, TIME_STEP, 1))
-        pred_scaled = model.predict(X_test)
+        with timed("model_inference"):
+            if symbol.upper() in TOP_10_COMPANIES:
+                pred_scaled = model.predict(X_test)
+            else:
+                pred_scaled = general_batcher.predict(X_test[0], timeout=INFERENCE_TIMEOUT).reshape(1, -1)
         pred = float(scaler.inverse_transform(pred_scaled)[0, 0])
 
         # Calculate simple confidence as inverse of standard deviation of last prices
@@ -104,82 +256,161 @@ def about():
 def how_it_works():
     return render_template('how-it-works.html')
 
+# --- /predict FAN-OUT ---
+predict_executor = ThreadPoolExecutor(max_workers=PREDICT_WORKERS, thread_name_prefix="predict")
+
+def _stage_result(future, stage, started, default):
+    """Waits for a stage until its deadline (measured from `started`) and falls back on timeout or error."""
+    remaining = max(0.0, STAGE_TIMEOUTS[stage] - (time.monotonic() - started))
+    try:
+        return future.result(timeout=remaining)
+    except Exception as e:
+        STAGE_ERRORS.inc(stage=stage)
+        print(f"⚠️ /predict stage '{stage}' failed or timed out: {e!r}")
+        return default
+
 @app.route('/predict', methods=['POST'])
 def predict():
     stock_symbol = request.form.get('stock_symbol', '').strip().upper()
     if not stock_symbol:
         return render_template('index.html', error="Please enter a stock symbol.")
-    try:
-        company_info = yf.Ticker(stock_symbol).info
-        company_name = company_info.get('longName', stock_symbol)
-    except: company_name = stock_symbol
 
-    prediction = get_stock_prediction(stock_symbol)
-    news = scrape_financial_news(stock_symbol)
+    # Independent stages run in parallel, so latency is bounded by the slowest one
+    started = time.monotonic()
+    company_future = submit_in_context(predict_executor, get_company_name, stock_symbol)
+    prediction_future = submit_in_context(predict_executor, get_stock_prediction, stock_symbol)
+
+    # News searches by company name, so it starts once the lookup is resolved and gets
+    # its full budget from there; the prediction keeps running meanwhile
+    company_name = _stage_result(company_future, "company_info", started, stock_symbol)
+    news_started = time.monotonic()
+    news_future = submit_in_context(predict_executor, scrape_financial_news, stock_symbol, company_name)
+
+    prediction = _stage_result(prediction_future, "prediction", started,
+                               {"prediction": "N/A", "confidence": "N/A", "error": "Prediction timed out."})
+    news = _stage_result(news_future, "news", news_started, [])
     sentiment = get_sentiment(news)
-    return render_template('result.html', symbol=stock_symbol, company_name=company_name, prediction=prediction, sentiment=sentiment)
+    with timed("render_template"):
+        return render_template('result.html', symbol=stock_symbol, company_name=company_name, prediction=prediction, sentiment=sentiment)
 
 # --- API ---
+# Refreshed in the background with one bulk download; requests only read the cached body
+market_snapshot = MarketSnapshot(lambda: download_market_rows(STOCKS_INFO), interval=MARKET_REFRESH_SECONDS)
+
 @app.route('/api/market-data')
 def market_data():
-    try:
-        tickers = yf.Tickers(list(STOCKS_INFO.keys()))
-        data = []
-        for symbol, info in STOCKS_INFO.items():
-            hist = tickers.tickers[symbol].history(period='2d')
-            if len(hist) > 1:
-                latest, prev = hist.iloc[-1], hist.iloc[-2]
-                data.append({
-                    "symbol": symbol,
-                    "name": info["name"],
-                    "logo": info["logo"],
-                    "website": info["website"],
-                    "price": float(latest['Close']),
-                    "change": float(latest['Close'] - prev['Close']),
-                    "changePercent": float((latest['Close'] - prev['Close']) / prev['Close'] * 100),
-                    "dayHigh": float(latest['High']),
-                    "dayLow": float(latest['Low']),
-                    "volume": int(latest['Volume'])
-                })
-        return jsonify(data)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    market_snapshot.start()  # no-op once running; only matters when warmup is disabled
+    body, etag, last_modified = market_snapshot.current()
+    if body is None:
+        return jsonify({"error": market_snapshot.last_error or "Market data unavailable."}), 500
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.cache_control.public = True
+    response.cache_control.max_age = MARKET_REFRESH_SECONDS
+    return response.make_conditional(request)
+
+@app.route('/api/symbols')
+def search_symbols():
+    query = request.args.get('q', '')
+    limit = max(1, min(request.args.get('limit', 8, type=int), SYMBOL_SEARCH_MAX_LIMIT))
+    with timed("symbol_search"):
+        results = get_symbol_index().search(query, limit)
+    response = jsonify(results)
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600  # The symbol list only changes with a deploy
+    return response
 
 @app.route('/api/historical-data/<symbol>')
 def get_historical_data(symbol):
     period = request.args.get('period', '1y')
-    df = yf.Ticker(symbol).history(period=period)
-    if len(df) < TIME_STEP:
-        return jsonify({"dates": [], "prices": [], "error": f"Not enough data. Need {TIME_STEP} points."})
-    df.index = df.index.strftime('%Y-%m-%d')
-    prices = [float(p) if not np.isnan(p) else None for p in df['Close'].tolist()]
-    return jsonify({"dates": list(df.index), "prices": prices})
+    points = request.args.get('points', type=int)  # optional LTTB downsampling target
+    fmt = 'compact' if request.args.get('format') == 'compact' else 'json'
+    if points is not None:
+        points = -(-max(points, 1) // CHART_POINTS_BUCKET) * CHART_POINTS_BUCKET
+        points = min(points, MAX_CHART_POINTS)
+
+    key = (symbol.upper(), period, points, fmt)
+    body = historical_cache.get(key)
+    CACHE_LOOKUPS.inc(cache="historical", result="miss" if body is None else "hit")
+    if body is None:
+        try:
+            df = bar_store.history(symbol, period)
+        except ValueError as e:
+            return jsonify({"dates": [], "prices": [], "error": str(e)}), 400
+        if len(df) < TIME_STEP:
+            return jsonify({"dates": [], "prices": [], "error": f"Not enough data. Need {TIME_STEP} points."})
+        body = json.dumps(build_historical_payload(df, points, fmt)).encode('utf-8')
+        historical_cache.put(key, body)
+    return app.response_class(body, mimetype='application/json')
 
 @app.route('/api/predict-future/<symbol>')
 def predict_future(symbol):
-    model, scaler = get_model_and_scaler(symbol)
-    if model is None or scaler is None:
-        return jsonify({"dates": [], "prices": [], "error": "Model or scaler not found."}), 500
-
-    df = yf.download(symbol, period="100d", interval="1d")
-    if len(df) < TIME_STEP:
-        return jsonify({"dates": [], "prices": [], "error": f"Not enough historical data. Need {TIME_STEP} points."}), 500
+    row = get_precomputed_forecast(symbol)
+    if row is not None and len(row.forecast) >= FORECAST_DAYS:
+        preds = row.forecast[:FORECAST_DAYS]
+    else:
+        model, scaler = get_forecast_model_and_scaler(symbol)
+        if model is None or scaler is None:
+            return jsonify({"dates": [], "prices": [], "error": "Model or scaler not found."}), 500
 
-    last_days = df[['Close']].tail(TIME_STEP).values
-    temp_input = list(scaler.transform(last_days))
+        last_days = bar_store.last_closes(symbol, TIME_STEP)
+        if len(last_days) < TIME_STEP:
+            return jsonify({"dates": [], "prices": [], "error": f"Not enough historical data. Need {TIME_STEP} points."}), 500
 
-    future_preds = []
-    for _ in range(60):
-        x_input = np.array(temp_input[-TIME_STEP:]).reshape((1, TIME_STEP, 1))
-        yhat_scaled = model.predict(x_input, verbose=0)
-        temp_input.append(yhat_scaled[0])
-        pred = scaler.inverse_transform(yhat_scaled)[0, 0]
-        future_preds.append(float(pred) if not np.isnan(pred) else None)
+        with timed("forecast"):
+            preds = forecast_engine.forecast(model, scaler, last_days, steps=FORECAST_DAYS)[0]
+    future_preds = [float(p) if not np.isnan(p) else None for p in preds]
 
     today = datetime.now()
-    dates = [(today + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(1, 61)]
+    dates = [(today + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(1, FORECAST_DAYS + 1)]
     return jsonify({"dates": dates, "prices": future_preds})
 
+@app.route('/api/inference-stats')
+def inference_stats():
+    return jsonify({
+        "model_registry": model_registry.stats(),
+        "general_batcher": general_batcher.stats(),
+        "sentiment_cache": dict(sentiment_cache_stats),
+        "forecast_table_symbols": len(forecast_table),
+    })
+
+# --- METRICS ---
+REQUEST_SECONDS = metrics_registry.histogram(
+    "dhanlaabh_request_duration_seconds", "End-to-end request latency.", ("endpoint", "status"))
+metrics_registry.callback(
+    "dhanlaabh_model_registry_events_total", "Model registry cache hits, loads and evictions.",
+    lambda: {(event,): value for event, value in model_registry.stats().items() if event in ("hits", "loads", "evictions")},
+    kind="counter", label_names=("event",))
+metrics_registry.callback("dhanlaabh_models_cached", "Models currently held in memory.", lambda: len(model_registry))
+metrics_registry.callback(
+    "dhanlaabh_batcher_events_total", "General-model micro-batcher requests, batches and errors.",
+    lambda: {(event,): general_batcher.stats()[event] for event in ("requests", "batches", "errors")},
+    kind="counter", label_names=("event",))
+
+@app.before_request
+def _start_request_timer():
+    g.request_started = time.perf_counter()
+    g.stage_timings = start_request_timings()
+
+@app.after_request
+def _record_request_time(response):
+    elapsed = time.perf_counter() - g.request_started
+    REQUEST_SECONDS.observe(elapsed, endpoint=request.endpoint or "unknown", status=response.status_code)
+    if LOG_REQUEST_TIMINGS:
+        totals = {}  # stage -> (total seconds, calls); parallel calls of a stage add up
+        for stage, seconds in g.stage_timings:
+            total, calls = totals.get(stage, (0.0, 0))
+            totals[stage] = (total + seconds, calls + 1)
+        breakdown = " ".join(f"{stage}={total:.3f}s" + (f"(x{calls})" if calls > 1 else "")
+                             for stage, (total, calls) in totals.items())
+        print(f"⏱️ {request.method} {request.path} {response.status_code} {elapsed:.3f}s | {breakdown or 'no timed stages'}")
+    return response
+
+@app.route('/metrics')
+def metrics():
+    return app.response_class(metrics_registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
 @app.route('/api/news/<symbol>')
 def get_news(symbol):
     company_name = STOCKS_INFO.get(symbol.upper(), {}).get('name', symbol)
@@ -193,5 +424,32 @@ def get_news(symbol):
     except Exception as e:
         return jsonify({"error": f"Failed to fetch news: {e}"}), 500
 
+# --- STARTUP ---
+def _import_heavy_modules():
+    if INFERENCE_BACKEND == "keras":
+        import tensorflow  # noqa: F401
+    import yfinance  # noqa: F401
+
+# Only the cheap modules above are imported with the app; the rest is warmed here
+warmup = Warmup([
+    ("market_snapshot", market_snapshot.start),
+    ("imports", _import_heavy_modules),
+    ("symbol_index", get_symbol_index),
+    ("forecast_table", lambda: len(forecast_table)),
+    ("models", lambda: model_registry.preload(
+        [get_artifact_paths(s) for s in TOP_10_COMPANIES] + [GENERAL_ARTIFACT_PATHS]
+        + [get_forecast_artifact_paths(s) for s in TOP_10_COMPANIES + ["general"]])),
+])
+if WARMUP_ON_START:
+    warmup.start()
+
+@app.route('/ready')
+def ready():
+    """Readiness probe: 503 until the warmup tasks have finished."""
+    if not WARMUP_ON_START:
+        return jsonify({"ready": True, "warmup": "disabled"})
+    status = warmup.status()
+    return jsonify(status), (200 if status["ready"] else 503)
+
 if __name__ == '__main__':
     app.run(debug=True,port=5000)
@@ -0,0 +1,186 @@
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+_EPOCH = np.datetime64("1970-01-01", "D")
+_PERIOD_RE = re.compile(r"^(\d+)(d|wk|mo|y)$")
+
+
+def _to_days(timestamp):
+    return float((np.datetime64(pd.Timestamp(timestamp).date(), "D") - _EPOCH).astype(np.int64))
+
+
+# --- DEFAULT FETCHER ---
+def yfinance_fetcher(symbol, start=None):
+    """
+    Downloads daily OHLCV bars for `symbol` from Yahoo Finance.
+    Fetches the full history when `start` is None, otherwise bars from `start` onwards.
+    """
+    import yfinance as yf  # deferred: only needed once a symbol is actually refreshed
+
+    if start is None:
+        df = yf.download(symbol, period="max", interval="1d", progress=False)
+    else:
+        df = yf.download(symbol, start=start, interval="1d", progress=False)
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+    return df
+
+
+def period_start(period, today=None):
+    """
+    Converts a yfinance-style period string ('5d', '1mo', '1y', 'ytd', 'max', ...)
+    into the first date it covers, or None for 'max'.
+    """
+    today = pd.Timestamp(today or pd.Timestamp.now()).normalize()
+    if period == "max":
+        return None
+    if period == "ytd":
+        return pd.Timestamp(year=today.year, month=1, day=1)
+    match = _PERIOD_RE.match(period)
+    if not match:
+        raise ValueError(f"Unsupported period: {period}")
+    n, unit = int(match.group(1)), match.group(2)
+    offsets = {
+        "d": pd.DateOffset(days=n),
+        "wk": pd.DateOffset(weeks=n),
+        "mo": pd.DateOffset(months=n),
+        "y": pd.DateOffset(years=n),
+    }
+    return today - offsets[unit]
+
+
+# --- LOCAL INCREMENTAL BAR STORE ---
+class BarStore:
+    """
+    Per-ticker daily OHLCV store kept on disk as one columnar .npy file per symbol
+    and opened memory-mapped.
+
+    Each file holds a (6, n) float64 array: row 0 is the bar date as days since the
+    epoch, rows 1-5 are Open/High/Low/Close/Volume, so every column is contiguous.
+    A refresh only asks the fetcher for bars from the last stored date onwards
+    (the last bar is re-fetched because it may still be forming), and checks are
+    throttled to one per `refresh_interval` seconds per symbol.
+
+    Every open mapping holds a file descriptor, so at most `max_open` symbols stay
+    mapped; the least recently used one is dropped (and its descriptor released once
+    no caller still holds a view of it) when another symbol is opened.
+
+    `fetcher(symbol, start)` must return a DataFrame indexed by date with the
+    OHLCV columns; pass a fake one to run without network access.
+    """
+
+    def __init__(self, root, fetcher=yfinance_fetcher, refresh_interval=900, max_open=256):
+        self.root = root
+        self.fetcher = fetcher
+        self.refresh_interval = refresh_interval
+        self.max_open = max_open
+        self._arrays = OrderedDict()  # symbol -> memory-mapped array, least recently used first
+        self._checked_at = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, symbol):
+        return os.path.join(self.root, f"{symbol.upper()}.npy")
+
+    def _symbol_lock(self, symbol):
+        with self._lock:
+            return self._locks.setdefault(symbol, threading.Lock())
+
+    def _cache(self, symbol, array):
+        with self._lock:
+            self._arrays[symbol] = array
+            self._arrays.move_to_end(symbol)
+            while len(self._arrays) > self.max_open:
+                self._arrays.popitem(last=False)
+
+    def _load(self, symbol):
+        with self._lock:
+            array = self._arrays.get(symbol)
+            if array is not None:
+                self._arrays.move_to_end(symbol)
+                return array
+        if not os.path.exists(self._path(symbol)):
+            return None
+        array = np.load(self._path(symbol), mmap_mode="r")
+        self._cache(symbol, array)
+        return array
+
+    def _write(self, symbol, array):
+        tmp_path = f"{self._path(symbol)}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as file:
+            np.save(file, np.ascontiguousarray(array))
+        os.replace(tmp_path, self._path(symbol))
+        self._cache(symbol, np.load(self._path(symbol), mmap_mode="r"))
+
+    @staticmethod
+    def _to_array(df):
+        df = df.dropna(subset=["Close"])
+        index = pd.DatetimeIndex(df.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        days = (index.values.astype("datetime64[D]") - _EPOCH).astype(np.int64).astype(np.float64)
+        values = df[COLUMNS].to_numpy(dtype=np.float64).T
+        return np.vstack([days[None, :], values])
+
+    def refresh(self, symbol, force=False):
+        """Fetches bars newer than the last stored one. Returns the number of bars stored."""
+        symbol = symbol.upper()
+        with self._symbol_lock(symbol):
+            now = time.monotonic()
+            if not force and now - self._checked_at.get(symbol, -np.inf) < self.refresh_interval:
+                return 0
+            stored = self._load(symbol)
+            start = None
+            if stored is not None and stored.shape[1]:
+                start = pd.Timestamp(_EPOCH + np.timedelta64(int(stored[0, -1]), "D"))
+            try:
+                new_bars = self.fetcher(symbol, start)
+            except Exception as e:
+                print(f"❌ Error fetching bars for {symbol}: {e}")
+                return 0
+            self._checked_at[symbol] = now
+            if new_bars is None or new_bars.empty:
+                return 0
+
+            new_array = self._to_array(new_bars)
+            kept = 0
+            if stored is not None and stored.shape[1]:
+                keep = stored[:, stored[0] < new_array[0, 0]]
+                kept = keep.shape[1]
+                new_array = np.hstack([keep, new_array])
+            self._write(symbol, new_array)
+            return new_array.shape[1] - kept
+
+    def _array(self, symbol):
+        symbol = symbol.upper()
+        self.refresh(symbol)
+        array = self._load(symbol)
+        if array is None:
+            return np.empty((len(COLUMNS) + 1, 0))
+        return array
+
+    def last_closes(self, symbol, n):
+        """Returns up to the last `n` closing prices as a 1-D array (a view of the mmap)."""
+        array = self._array(symbol)
+        return array[COLUMNS.index("Close") + 1, -n:]
+
+    def bars(self, symbol, start=None, end=None):
+        """Returns bars between `start` and `end` (inclusive) as a date-indexed DataFrame."""
+        array = self._array(symbol)
+        days = array[0]
+        lo = 0 if start is None else np.searchsorted(days, _to_days(start))
+        hi = days.shape[0] if end is None else np.searchsorted(days, _to_days(end), side="right")
+        window = array[:, lo:hi]
+        index = pd.DatetimeIndex(_EPOCH + window[0].astype(np.int64).astype("timedelta64[D]"), name="Date")
+        return pd.DataFrame(window[1:].T, index=index, columns=COLUMNS)
+
+    def history(self, symbol, period="1y"):
+        """Returns the bars covered by a yfinance-style `period` string."""
+        return self.bars(symbol, start=period_start(period))
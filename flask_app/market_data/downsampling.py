@@ -0,0 +1,41 @@
+import numpy as np
+
+
+# --- LARGEST-TRIANGLE-THREE-BUCKETS ---
+def lttb(x, y, n_out):
+    """
+    Downsamples the series (x, y) to `n_out` points with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept; every bucket in between contributes the
+    point forming the largest triangle with the previously kept point and the average of
+    the next bucket, which preserves the visual shape (peaks, troughs) of a line chart.
+
+    :return: integer indices of the kept points, in increasing order.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = x.shape[0]
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Bucket edges for the n - 2 interior points split into n_out - 2 buckets
+    edges = np.floor(np.linspace(1, n - 1, n_out - 1)).astype(np.int64)
+    # Average point of every bucket, computed up front with cumulative sums
+    cum_x = np.concatenate([[0.0], np.cumsum(x)])
+    cum_y = np.concatenate([[0.0], np.cumsum(y)])
+    next_edges = np.append(edges[1:], n)  # the extra last "bucket" is just the final point
+    counts = next_edges - edges
+    avg_x = (cum_x[next_edges] - cum_x[edges]) / counts
+    avg_y = (cum_y[next_edges] - cum_y[edges]) / counts
+
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    prev = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        nx, ny = avg_x[b + 1], avg_y[b + 1]
+        px, py = x[prev], y[prev]
+        area = np.abs((px - nx) * (y[lo:hi] - py) - (px - x[lo:hi]) * (ny - py))
+        prev = lo + int(np.argmax(area))
+        kept[b + 1] = prev
+    return kept
@@ -0,0 +1,125 @@
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+import numpy as np
+
+_EPOCH = np.datetime64("1970-01-01", "D")
+# Leading columns of every row; the forecast steps follow
+_META_COLUMNS = ("as_of", "next_day", "confidence")
+
+# `models`: ((model file name, mtime), ...) of the artifacts the row was scored with
+ForecastRow = namedtuple("ForecastRow", ["as_of", "next_day", "confidence", "forecast", "models"])
+
+
+# --- PRECOMPUTED FORECAST TABLE ---
+class ForecastTable:
+    """
+    On-disk table of precomputed forecasts written by the batch forecast job and read
+    by the app.
+
+    `forecasts.npy` holds one float64 row per symbol: the date of the last bar used
+    (days since the epoch), the next-day prediction, its confidence and `horizon`
+    forecast prices. `forecasts.json` holds the symbol order, when the table was
+    generated and which model files (name and mtime) scored each row, so a reader can
+    tell rows produced by a since-replaced model. The reader memory-maps the array and
+    keeps a symbol -> row dict, so a lookup is one dict access plus a row slice. Both files are replaced atomically
+    and a rewritten table is picked up on the next lookup.
+
+    Rows are only returned while the table is younger than `max_age` seconds.
+    """
+
+    def __init__(self, root, max_age=24 * 3600):
+        self.root = root
+        self.max_age = max_age
+        self._state = None  # (index mtime, generated_at, {symbol: row}, array)
+        self._lock = threading.Lock()
+
+    @property
+    def array_path(self):
+        return os.path.join(self.root, "forecasts.npy")
+
+    @property
+    def index_path(self):
+        return os.path.join(self.root, "forecasts.json")
+
+    @staticmethod
+    def write(root, symbols, as_of, next_day, confidence, forecasts, model_paths=None, **metadata):
+        """
+        Writes a table. `as_of` are the dates of each symbol's last bar, `forecasts`
+        has shape (len(symbols), horizon). `model_paths` holds, per symbol, the model
+        files it was scored with; their mtimes are recorded. Extra keyword arguments
+        are stored in the index.
+        """
+        forecasts = np.asarray(forecasts, dtype=np.float64).reshape(len(symbols), -1)
+        as_of_days = (np.asarray(as_of, dtype="datetime64[D]") - _EPOCH).astype(np.float64)
+        array = np.column_stack([as_of_days, next_day, confidence, forecasts])
+        index = {
+            "symbols": [symbol.upper() for symbol in symbols],
+            "columns": list(_META_COLUMNS),
+            "horizon": forecasts.shape[1],
+            "generated_at": time.time(),
+            **metadata,
+        }
+        if model_paths is not None:
+            models, row_models = {}, []
+            for paths in model_paths:
+                row_models.append([models.setdefault(path, len(models)) for path in dict.fromkeys(paths)])
+            index["models"] = [{"file": os.path.basename(path), "mtime": os.path.getmtime(path)} for path in models]
+            index["row_models"] = row_models
+        os.makedirs(root, exist_ok=True)
+        # The array goes first: a reader that sees the new index always finds a matching array
+        tmp_array = os.path.join(root, f"forecasts.{os.getpid()}.tmp.npy")
+        np.save(tmp_array, np.ascontiguousarray(array))
+        os.replace(tmp_array, os.path.join(root, "forecasts.npy"))
+        tmp_index = os.path.join(root, f"forecasts.{os.getpid()}.tmp.json")
+        with open(tmp_index, "w") as file:
+            json.dump(index, file)
+        os.replace(tmp_index, os.path.join(root, "forecasts.json"))
+
+    def _load(self):
+        try:
+            mtime = os.path.getmtime(self.index_path)
+        except OSError:
+            return None
+        state = self._state
+        if state is not None and state[0] == mtime:
+            return state
+        with self._lock:
+            if self._state is not None and self._state[0] == mtime:
+                return self._state
+            try:
+                with open(self.index_path) as file:
+                    index = json.load(file)
+                array = np.load(self.array_path, mmap_mode="r")
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Could not load forecast table from {self.root}: {e}")
+                return None
+            if array.shape[0] != len(index["symbols"]):
+                print(f"⚠️ Forecast table in {self.root} is being rewritten; skipping it for now.")
+                return None
+            models = [(model["file"], model["mtime"]) for model in index.get("models", [])]
+            row_models = index.get("row_models") or [[]] * len(index["symbols"])
+            rows = {symbol: (i, tuple(models[m] for m in row_models[i])) for i, symbol in enumerate(index["symbols"])}
+            self._state = (mtime, index["generated_at"], rows, array)
+            print(f"✅ Forecast table loaded: {len(rows)} symbol(s), horizon {index['horizon']}.")
+            return self._state
+
+    def get(self, symbol):
+        """The fresh ForecastRow for `symbol`, or None (no table, table too old, or symbol not scored)."""
+        state = self._load()
+        if state is None or time.time() - state[1] > self.max_age:
+            return None
+        entry = state[2].get(symbol.upper())
+        if entry is None:
+            return None
+        row, models = entry
+        values = state[3][row]
+        n_meta = len(_META_COLUMNS)
+        as_of = _EPOCH + np.timedelta64(int(values[0]), "D")
+        return ForecastRow(as_of, float(values[1]), float(values[2]), values[n_meta:], models)
+
+    def __len__(self):
+        state = self._load()
+        return 0 if state is None else len(state[2])
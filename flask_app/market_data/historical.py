@@ -0,0 +1,69 @@
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
+from .downsampling import lttb
+
+
+# --- TTL + LRU RESPONSE CACHE ---
+class ResponseCache:
+    """
+    Small thread-safe cache of serialized responses.
+    Entries expire after `ttl` seconds and the least recently used one is evicted
+    once more than `max_entries` are stored.
+    """
+
+    def __init__(self, ttl=900, max_entries=256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# --- HISTORICAL PAYLOAD ---
+def build_historical_payload(df, points=None, fmt="json"):
+    """
+    Builds the /api/historical-data body from a date-indexed frame with a Close column.
+
+    - `points`: downsample to about this many points with LTTB (None keeps every bar).
+    - `fmt="compact"`: columnar encoding with the first date, day deltas between bars
+      and prices rounded to cents instead of one date string per point.
+    """
+    closes = df['Close'].to_numpy(dtype=np.float64)
+    dates = df.index.values.astype("datetime64[D]")
+    valid = ~np.isnan(closes)
+    closes, dates = closes[valid], dates[valid]
+
+    if points:
+        keep = lttb(dates.astype(np.int64), closes, points)
+        closes, dates = closes[keep], dates[keep]
+
+    if fmt == "compact":
+        day_deltas = np.diff(dates.astype(np.int64), prepend=dates[:1].astype(np.int64))
+        return {
+            "format": "compact",
+            "start": str(dates[0]) if len(dates) else None,
+            "dayDeltas": day_deltas.tolist(),
+            "prices": np.round(closes, 2).tolist(),
+        }
+    return {"dates": [str(d) for d in dates], "prices": closes.tolist()}
@@ -0,0 +1,138 @@
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime, timezone
+import pandas as pd
+
+
+# --- BULK MARKET DOWNLOAD ---
+def download_market_rows(stocks_info):
+    """
+    Downloads the last few daily bars for every symbol in `stocks_info` with a single
+    multi-ticker request and builds the rows served by /api/market-data.
+    """
+    import yfinance as yf  # deferred: runs on the refresher thread, not at app import
+
+    symbols = list(stocks_info.keys())
+    df = yf.download(symbols, period="5d", interval="1d", group_by="ticker", progress=False)
+    return build_market_rows(df, stocks_info)
+
+
+def build_market_rows(df, stocks_info):
+    """
+    Builds the /api/market-data rows from a ticker-grouped bulk download
+    (columns: (symbol, field)), comparing each symbol's last two daily bars.
+    """
+    rows = []
+    for symbol, info in stocks_info.items():
+        if symbol not in df.columns.get_level_values(0):
+            continue
+        hist = df[symbol].dropna(subset=["Close"])
+        if len(hist) > 1:
+            latest, prev = hist.iloc[-1], hist.iloc[-2]
+            rows.append({
+                "symbol": symbol,
+                "name": info["name"],
+                "logo": info["logo"],
+                "website": info["website"],
+                "price": float(latest['Close']),
+                "change": float(latest['Close'] - prev['Close']),
+                "changePercent": float((latest['Close'] - prev['Close']) / prev['Close'] * 100),
+                "dayHigh": float(latest['High']),
+                "dayLow": float(latest['Low']),
+                "volume": int(latest['Volume']) if not pd.isna(latest['Volume']) else 0
+            })
+    return rows
+
+
+# --- BACKGROUND-REFRESHED SNAPSHOT ---
+class MarketSnapshot:
+    """
+    In-memory market snapshot rebuilt by a background thread every `interval` seconds.
+
+    Requests only read the pre-serialized JSON body, its ETag and its Last-Modified
+    time, so their cost does not depend on how many clients are polling. If a
+    refresh fails the previous snapshot keeps being served.
+
+    Refreshes are single-flight: callers arriving while one is in progress wait for
+    it and share its outcome. Until a first snapshot exists, requests retry a failed
+    refresh only after a backoff that doubles from `retry_backoff` up to `interval`.
+    """
+
+    def __init__(self, build_rows, interval=60, retry_backoff=5):
+        self.build_rows = build_rows
+        self.interval = interval
+        self.retry_backoff = retry_backoff
+        self.body = None
+        self.etag = None
+        self.last_modified = None
+        self.last_error = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._attempts = 0
+        self._failures = 0
+        self._retry_at = 0.0
+        self._thread = None
+
+    def refresh(self):
+        """Rebuilds the snapshot once, or waits for the rebuild in progress. Returns True on success."""
+        attempt = self._attempts
+        with self._refresh_lock:
+            if self._attempts != attempt:
+                # Another caller rebuilt it while this one waited
+                return self.last_error is None
+            try:
+                return self._rebuild()
+            finally:
+                self._attempts += 1
+
+    def _failed(self, error):
+        self.last_error = error
+        self._failures += 1
+        self._retry_at = time.monotonic() + min(self.interval, self.retry_backoff * 2 ** (self._failures - 1))
+        return False
+
+    def _rebuild(self):
+        try:
+            rows = self.build_rows()
+        except Exception as e:
+            print(f"❌ Error refreshing market snapshot: {e}")
+            return self._failed(str(e))
+        if not rows:
+            return self._failed("No market data returned.")
+
+        body = json.dumps(rows).encode("utf-8")
+        etag = hashlib.sha1(body).hexdigest()
+        with self._lock:
+            # Last-Modified only moves when the content actually changes
+            if etag != self.etag:
+                self.body, self.etag = body, etag
+                self.last_modified = datetime.now(timezone.utc).replace(microsecond=0)
+            self.last_error = None
+            self._failures = 0
+        return True
+
+    def _run(self):
+        while True:
+            started = time.monotonic()
+            self.refresh()
+            time.sleep(max(1.0, self.interval - (time.monotonic() - started)))
+
+    def start(self):
+        """Starts the background refresher (idempotent)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="market-snapshot", daemon=True)
+            self._thread.start()
+
+    def current(self):
+        """
+        Returns (body, etag, last_modified), refreshing synchronously if nothing is cached
+        yet and no failed refresh is still backing off.
+        """
+        if self.body is None and time.monotonic() >= self._retry_at:
+            self.refresh()
+        with self._lock:
+            return self.body, self.etag, self.last_modified
@@ -0,0 +1,100 @@
+import bisect
+import csv
+import heapq
+import re
+
+_TOKEN_RE = re.compile(r"[A-Z0-9]+")
+# Sorts after every character that can appear in a key, to close a prefix range
+_PREFIX_END = "￿"
+
+
+# --- SYMBOL SEARCH INDEX ---
+class SymbolIndex:
+    """
+    Prefix search over ticker symbols and company-name words, built once from
+    (symbol, name) pairs.
+
+    Symbols and name tokens are kept in two sorted arrays, so every prefix
+    lookup is two binary searches plus the matching slice. Nothing is scanned
+    per query, however large the universe gets.
+
+    Ranking: exact symbol, then symbols starting with the query (shorter first),
+    then companies whose name words start with every query word (earlier word
+    first, then shorter name).
+    """
+
+    def __init__(self, entries):
+        self.entries = []  # index -> (symbol, name)
+        seen = set()
+        for symbol, name in entries:
+            symbol = symbol.strip().upper()
+            if symbol and symbol not in seen:
+                seen.add(symbol)
+                self.entries.append((symbol, name.strip()))
+
+        self._symbols = sorted((symbol, i) for i, (symbol, _) in enumerate(self.entries))
+        self._symbol_keys = [symbol for symbol, _ in self._symbols]
+        tokens = sorted(
+            (token, position, i)
+            for i, (_, name) in enumerate(self.entries)
+            for position, token in enumerate(_TOKEN_RE.findall(name.upper()))
+        )
+        self._tokens = [(position, i) for _, position, i in tokens]
+        self._token_keys = [token for token, _, _ in tokens]
+
+    @classmethod
+    def from_csv(cls, path):
+        """Loads a CSV with `symbol` and `name` columns."""
+        with open(path, newline="", encoding="utf-8") as file:
+            return cls((row["symbol"], row["name"]) for row in csv.DictReader(file))
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, symbol):
+        symbol = symbol.strip().upper()
+        i = bisect.bisect_left(self._symbol_keys, symbol)
+        return i < len(self._symbol_keys) and self._symbol_keys[i] == symbol
+
+    @staticmethod
+    def _prefix_range(keys, prefix):
+        return bisect.bisect_left(keys, prefix), bisect.bisect_left(keys, prefix + _PREFIX_END)
+
+    def _name_matches(self, word):
+        """{entry index: position of the first name word starting with `word`}."""
+        lo, hi = self._prefix_range(self._token_keys, word)
+        matches = {}
+        for position, i in self._tokens[lo:hi]:
+            if position < matches.get(i, len(self.entries)):
+                matches[i] = position
+        return matches
+
+    def search(self, query, limit=8):
+        """Returns up to `limit` ranked {"symbol", "name"} dicts for `query`."""
+        query = query.strip().upper()
+        if not query or limit <= 0:
+            return []
+
+        lo, hi = self._prefix_range(self._symbol_keys, query)
+        by_symbol = heapq.nsmallest(
+            limit, self._symbols[lo:hi], key=lambda item: (item[0] != query, len(item[0]), item[0]))
+        results = [i for _, i in by_symbol]
+
+        words = _TOKEN_RE.findall(query)
+        if len(results) < limit and words:
+            # Every query word has to start some word of the name
+            matches = self._name_matches(words[0])
+            for word in words[1:]:
+                if not matches:
+                    break
+                other = self._name_matches(word)
+                matches = {i: position for i, position in matches.items() if i in other}
+            taken = set(results)
+            ranked = heapq.nsmallest(
+                limit - len(results),
+                (i for i in matches if i not in taken),
+                key=lambda i: (matches[i], len(self.entries[i][1]), self.entries[i][0]),
+            )
+            results.extend(ranked)
+
+        return [{"symbol": self.entries[i][0], "name": self.entries[i][1]} for i in results]
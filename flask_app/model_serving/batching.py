@@ -0,0 +1,107 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
+import numpy as np
+
+
+# --- CROSS-REQUEST MICRO-BATCHING ---
+class MicroBatcher:
+    """
+    Collects single-sample inference requests from concurrent callers and runs them
+    as one batched forward pass.
+
+    A background worker waits for the first request, then keeps collecting for up to
+    `max_wait_ms` or until `max_batch_size` samples are queued, calls
+    `predict_fn(batch)` once and hands each caller its own row of the output.
+    """
+
+    def __init__(self, predict_fn, max_batch_size=32, max_wait_ms=5.0, name="batcher"):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.name = name
+        self._queue = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.batches = 0
+        self.requests = 0
+        self.errors = 0
+
+    def _ensure_worker(self):
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._worker.start()
+
+    def submit(self, x):
+        """Queues one sample (without the batch axis) and returns a Future for its output."""
+        self._ensure_worker()
+        future = Future()
+        self._queue.put((np.asarray(x, dtype=np.float32), future))
+        return future
+
+    def predict(self, x, timeout=None):
+        """
+        Blocking helper: submits one sample and waits up to `timeout` seconds for its
+        output row. On timeout the request is cancelled, so it is not run later.
+        """
+        future = self.submit(x)
+        try:
+            return future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            future.cancel()
+            raise
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        # Nothing may escape this loop: the worker is the only consumer of the queue
+        while True:
+            batch = self._collect()
+            # Callers that gave up and cancelled their future are dropped from the batch
+            batch = [(x, future) for x, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            try:
+                outputs = np.asarray(self.predict_fn(np.stack([x for x, _ in batch])))
+                for i, (_, future) in enumerate(batch):
+                    future.set_result(outputs[i])
+            except Exception as e:
+                with self._stats_lock:
+                    self.errors += 1
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            with self._stats_lock:
+                self.batches += 1
+                self.requests += len(batch)
+
+    def stats(self):
+        with self._stats_lock:
+            avg_batch = self.requests / self.batches if self.batches else 0.0
+            return {
+                "name": self.name,
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait * 1000.0,
+                "batches": self.batches,
+                "requests": self.requests,
+                "errors": self.errors,
+                "avg_batch_size": avg_batch,
+                "fill_rate": avg_batch / self.max_batch_size,
+                "queued": self._queue.qsize(),
+            }
@@ -0,0 +1,125 @@
+import sys
+import weakref
+import numpy as np
+
+
+def _is_keras_model(model):
+    # A Keras model can only exist once TensorFlow has been imported, so this check
+    # never imports TensorFlow itself (it takes seconds and is deferred to first use).
+    tf = sys.modules.get("tensorflow")
+    return tf is not None and isinstance(model, tf.keras.Model)
+
+
+def output_size(model):
+    """Number of future steps `model` predicts per window (1 for one-step-ahead models)."""
+    if _is_keras_model(model):
+        return int(model.output_shape[-1])
+    return int(getattr(model, "output_size", 1))
+
+
+# --- FORECASTING ENGINE ---
+class ForecastEngine:
+    """
+    Rolls a one-step-ahead model forward `steps` times, feeding each prediction back
+    into the input window.
+
+    - Multi-horizon models (output size > 1) are not rolled out: one forward pass
+      yields `output_size` steps, so a 60-step forecast from a 60-step model is a
+      single inference. Longer forecasts feed whole predicted blocks back.
+    - Keras models run the whole rollout inside one compiled tf.function, so the
+      60 steps cost a single graph call instead of 60 `model.predict` calls.
+    - Any other callable model (X -> y) is rolled out on a NumPy ring buffer.
+    - Inputs are scaled and outputs inverse-scaled in one vectorized call each.
+    - Every call takes a batch of series, so N symbols sharing a model and scaler
+      (e.g. the general model) are forecast together for about the cost of one.
+    """
+
+    def __init__(self, time_step=60):
+        self.time_step = time_step
+        self._rollouts = weakref.WeakKeyDictionary()  # model -> compiled rollout
+
+    def _compiled_rollout(self, model):
+        import tensorflow as tf
+
+        rollout = self._rollouts.get(model)
+        if rollout is None:
+            # The cache is keyed weakly by the model, so the rollout must not hold it
+            # strongly either; otherwise evicted or reloaded models would never be freed.
+            model_ref = weakref.ref(model)
+
+            @tf.function(input_signature=[
+                tf.TensorSpec([None, self.time_step, 1], tf.float32),
+                tf.TensorSpec([], tf.int32),
+            ])
+            def rollout(window, steps):
+                # window: (batch, time_step, 1). It keeps a fixed shape: each step drops
+                # the oldest value and appends the newest prediction.
+                step_model = model_ref()
+                outputs = tf.TensorArray(tf.float32, size=steps)
+                for i in tf.range(steps):
+                    yhat = tf.cast(step_model(window, training=False), tf.float32)  # (batch, 1)
+                    outputs = outputs.write(i, yhat[:, 0])
+                    window = tf.concat([window[:, 1:, :], yhat[:, None, :]], axis=1)
+                return tf.transpose(outputs.stack())  # (batch, steps)
+
+            self._rollouts[model] = rollout
+        return rollout
+
+    def _ring_buffer_rollout(self, model, windows, steps):
+        n_series, time_step = windows.shape
+        ring = windows.astype(np.float32, copy=True)
+        order = np.arange(time_step)
+        outputs = np.empty((n_series, steps), dtype=np.float32)
+        for i in range(steps):
+            # Oldest value sits at index `i % time_step`; read the window in time order.
+            x = ring[:, (order + i) % time_step, None]
+            yhat = np.asarray(model(x), dtype=np.float32).reshape(n_series)
+            outputs[:, i] = yhat
+            ring[:, i % time_step] = yhat
+        return outputs
+
+    def _direct_rollout(self, model, windows, steps, width):
+        if _is_keras_model(model):
+            predict = lambda x: model(x, training=False).numpy()
+        else:
+            predict = model
+        n_series = windows.shape[0]
+        window = windows.astype(np.float32, copy=True)
+        blocks = []
+        for _ in range(-(-steps // width)):
+            yhat = np.asarray(predict(window[:, :, None]), dtype=np.float32).reshape(n_series, width)
+            blocks.append(yhat)
+            window = np.concatenate([window, yhat], axis=1)[:, -self.time_step:]
+        return np.concatenate(blocks, axis=1)[:, :steps]
+
+    def rollout_scaled(self, model, windows, steps):
+        """
+        Runs the rollout on already-scaled windows: one pass per `output_size(model)`
+        steps, i.e. a single pass when the model's horizon covers `steps`.
+
+        :param windows: array of shape (n_series, time_step).
+        :return: array of shape (n_series, steps) in scaled units.
+        """
+        windows = np.asarray(windows, dtype=np.float32)
+        width = output_size(model)
+        if width > 1:
+            return self._direct_rollout(model, windows, steps, width)
+        if _is_keras_model(model):
+            rollout = self._compiled_rollout(model)
+            result = rollout(windows[:, :, None], np.int32(steps))
+            return result.numpy()
+        return self._ring_buffer_rollout(model, windows, steps)
+
+    def forecast(self, model, scaler, closes, steps=60):
+        """
+        Forecasts `steps` future prices for one or more series sharing a model/scaler.
+
+        :param closes: raw prices, shape (time_step,) or (n_series, >= time_step).
+                       Only the last `time_step` values of each row are used.
+        :return: array of shape (n_series, steps) in price units.
+        """
+        closes = np.atleast_2d(np.asarray(closes, dtype=np.float64))[:, -self.time_step:]
+        n_series = closes.shape[0]
+        scaled = scaler.transform(closes.reshape(-1, 1)).reshape(n_series, self.time_step)
+        preds_scaled = self.rollout_scaled(model, scaled, steps)
+        return scaler.inverse_transform(preds_scaled.reshape(-1, 1)).reshape(n_series, steps)
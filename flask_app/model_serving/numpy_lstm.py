@@ -0,0 +1,243 @@
+import os
+import json
+import numpy as np
+
+ACTIVATIONS = {
+    "tanh": np.tanh,
+    "sigmoid": lambda x: 0.5 * (np.tanh(0.5 * x) + 1.0),  # same function, no exp overflow
+    "relu": lambda x: np.maximum(x, 0.0),
+    "linear": lambda x: x,
+    None: lambda x: x,
+}
+
+
+def _activation(name):
+    if name not in ACTIVATIONS:
+        raise ValueError(f"Unsupported activation: {name}")
+    return ACTIVATIONS[name]
+
+
+# --- WEIGHT PRECISION ---
+PRECISIONS = ("float32", "float16", "int8")
+
+
+def quantize(weights, precision):
+    """
+    Stores a weight matrix at reduced precision. Returns (stored, scale):
+    float16 is a plain cast, int8 is symmetric per output column with
+    weights ~= stored * scale. `scale` is None unless precision is int8.
+    """
+    weights = np.asarray(weights, dtype=np.float32)
+    if precision == "float32":
+        return weights, None
+    if precision == "float16":
+        return weights.astype(np.float16), None
+    if precision == "int8":
+        scale = np.abs(weights).max(axis=0) / 127.0
+        scale[scale == 0] = 1.0
+        stored = np.clip(np.round(weights / scale), -127, 127).astype(np.int8)
+        return stored, scale.astype(np.float32)
+    raise ValueError(f"Unsupported precision: {precision}, expected one of {PRECISIONS}")
+
+
+def dequantize(stored, scale=None):
+    weights = stored.astype(np.float32, copy=False)
+    return weights if scale is None else weights * scale
+
+
+# --- LAYERS ---
+class LSTMLayer:
+    """
+    Keras LSTM forward pass. Weights use the Keras layout: kernel (n_in, 4u),
+    recurrent_kernel (u, 4u) and bias (4u,), with gates ordered i, f, c, o.
+
+    Kernels may be stored at reduced precision (see `quantize`); they are expanded
+    to float32 once per call, so only the compact copy stays resident.
+    """
+    quantized_weights = ("kernel", "recurrent_kernel")
+
+    def __init__(self, kernel, recurrent_kernel, bias, return_sequences=False,
+                 activation="tanh", recurrent_activation="sigmoid",
+                 kernel_scale=None, recurrent_kernel_scale=None):
+        self.kernel = np.asarray(kernel)
+        self.recurrent_kernel = np.asarray(recurrent_kernel)
+        self.kernel_scale = kernel_scale
+        self.recurrent_kernel_scale = recurrent_kernel_scale
+        self.bias = np.asarray(bias, dtype=np.float32)
+        self.units = self.recurrent_kernel.shape[0]
+        self.return_sequences = return_sequences
+        self.config = {"type": "lstm", "return_sequences": return_sequences,
+                       "activation": activation, "recurrent_activation": recurrent_activation}
+        self.activation = _activation(activation)
+        self.recurrent_activation = _activation(recurrent_activation)
+
+    def __call__(self, x):
+        batch, time_steps, _ = x.shape
+        u = self.units
+        kernel = dequantize(self.kernel, self.kernel_scale)
+        recurrent_kernel = dequantize(self.recurrent_kernel, self.recurrent_kernel_scale)
+        # The input projection of every timestep is one matmul; only h @ U stays in the loop
+        x_proj = x @ kernel + self.bias  # (batch, time_steps, 4u)
+        h = np.zeros((batch, u), dtype=np.float32)
+        c = np.zeros((batch, u), dtype=np.float32)
+        outputs = np.empty((batch, time_steps, u), dtype=np.float32) if self.return_sequences else None
+        for t in range(time_steps):
+            z = x_proj[:, t] + h @ recurrent_kernel
+            i = self.recurrent_activation(z[:, :u])
+            f = self.recurrent_activation(z[:, u:2 * u])
+            g = self.activation(z[:, 2 * u:3 * u])
+            o = self.recurrent_activation(z[:, 3 * u:])
+            c = f * c + i * g
+            h = o * self.activation(c)
+            if outputs is not None:
+                outputs[:, t] = h
+        return outputs if outputs is not None else h
+
+
+class DenseLayer:
+    quantized_weights = ("kernel",)
+
+    def __init__(self, kernel, bias=None, activation=None, kernel_scale=None):
+        self.kernel = np.asarray(kernel)
+        self.kernel_scale = kernel_scale
+        self.bias = None if bias is None else np.asarray(bias, dtype=np.float32)
+        self.config = {"type": "dense", "activation": activation}
+        self.activation = _activation(activation)
+
+    def __call__(self, x):
+        y = x @ dequantize(self.kernel, self.kernel_scale)
+        if self.bias is not None:
+            y = y + self.bias
+        return self.activation(y)
+
+
+LAYER_TYPES = {"lstm": LSTMLayer, "dense": DenseLayer}
+
+
+# --- MODEL ---
+class NumpyLSTMModel:
+    """
+    Inference-only replacement for the Sequential LSTM/Dropout/Dense models built by
+    `build_lstm_model`. Dropout is the identity at inference and is skipped.
+
+    Exposes `__call__`, `predict` and `predict_on_batch` so it can stand in for the
+    Keras model in the serving code, without TensorFlow being imported.
+    """
+
+    def __init__(self, layers, name=None):
+        self.layers = layers
+        self.name = name
+
+    def __call__(self, X):
+        x = np.asarray(X, dtype=np.float32)
+        if x.ndim == 2:
+            x = x[..., None]
+        for layer in self.layers:
+            x = layer(x)
+        return x
+
+    def predict(self, X, verbose=0):
+        return self(X)
+
+    def predict_on_batch(self, X):
+        return self(X)
+
+    @property
+    def input_size(self):
+        """Features per time step the model expects."""
+        return int(self.layers[0].kernel.shape[0])
+
+    @property
+    def output_size(self):
+        """Values predicted per window: 1 for next-day models, the horizon for multi-horizon ones."""
+        return int(self.layers[-1].kernel.shape[-1])
+
+    @property
+    def nbytes(self):
+        """Resident size of all weights, scales and biases."""
+        return sum(value.nbytes for layer in self.layers for value in vars(layer).values()
+                   if isinstance(value, np.ndarray))
+
+    def save(self, file_path, precision="float32"):
+        """
+        Writes the model as a single .npz with its kernels stored at `precision`
+        ('float32', 'float16' or 'int8'); biases always stay float32.
+        """
+        arrays = {}
+        for index, layer in enumerate(self.layers):
+            for name in layer.quantized_weights:
+                weights = dequantize(getattr(layer, name), getattr(layer, f"{name}_scale"))
+                stored, scale = quantize(weights, precision)
+                arrays[f"layer{index}_{name}"] = stored
+                if scale is not None:
+                    arrays[f"layer{index}_{name}_scale"] = scale
+            if layer.bias is not None:
+                arrays[f"layer{index}_bias"] = layer.bias
+        config = {"name": self.name, "precision": precision, "layers": [layer.config for layer in self.layers]}
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        np.savez(file_path, config=np.array(json.dumps(config)), **arrays)
+
+
+def _layer_weights(weights_group, layer_name):
+    group = weights_group[layer_name]
+    return [np.asarray(group[name]) for name in group.attrs["weight_names"]]
+
+
+def _load_npz_model(file_path):
+    with np.load(file_path) as data:
+        config = json.loads(str(data["config"]))
+        layers = []
+        for index, layer_config in enumerate(config["layers"]):
+            kwargs = {key: value for key, value in layer_config.items() if key != "type"}
+            layer_type = LAYER_TYPES[layer_config["type"]]
+            for name in layer_type.quantized_weights + ("bias",):
+                key = f"layer{index}_{name}"
+                if key in data:
+                    kwargs[name] = data[key]
+                if f"{key}_scale" in data:
+                    kwargs[f"{name}_scale"] = data[f"{key}_scale"]
+            layers.append(layer_type(**kwargs))
+    return NumpyLSTMModel(layers, name=config.get("name"))
+
+
+def load_numpy_lstm_model(file_path):
+    """
+    Returns a NumpyLSTMModel for a Keras .h5 Sequential model (architecture and
+    weights read with h5py) or for a .npz written by `NumpyLSTMModel.save`.
+    Raises ValueError for unsupported layers.
+    """
+    if file_path.endswith(".npz"):
+        return _load_npz_model(file_path)
+
+    import h5py
+
+    with h5py.File(file_path, "r") as file:
+        config = file.attrs["model_config"]
+        config = json.loads(config.decode("utf-8") if isinstance(config, bytes) else config)
+        if config["class_name"] != "Sequential":
+            raise ValueError(f"Only Sequential models are supported, got {config['class_name']}")
+        weights_group = file["model_weights"] if "model_weights" in file else file
+
+        layers = []
+        for layer in config["config"]["layers"]:
+            kind, layer_config = layer["class_name"], layer["config"]
+            if kind in ("InputLayer", "Dropout"):
+                continue
+            if kind == "LSTM":
+                if layer_config.get("go_backwards") or layer_config.get("stateful"):
+                    raise ValueError(f"Unsupported LSTM options in layer {layer_config['name']}")
+                kernel, recurrent_kernel, *bias = _layer_weights(weights_group, layer_config["name"])
+                if not bias:
+                    bias = [np.zeros(recurrent_kernel.shape[1], dtype=np.float32)]
+                layers.append(LSTMLayer(
+                    kernel, recurrent_kernel, bias[0],
+                    return_sequences=layer_config["return_sequences"],
+                    activation=layer_config["activation"],
+                    recurrent_activation=layer_config["recurrent_activation"],
+                ))
+            elif kind == "Dense":
+                kernel, *bias = _layer_weights(weights_group, layer_config["name"])
+                layers.append(DenseLayer(kernel, bias[0] if bias else None, layer_config["activation"]))
+            else:
+                raise ValueError(f"Unsupported layer type: {kind}")
+    return NumpyLSTMModel(layers, name=config["config"].get("name"))
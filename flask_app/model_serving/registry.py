@@ -0,0 +1,113 @@
+import os
+import threading
+from collections import OrderedDict
+
+
+# --- MODEL REGISTRY ---
+class ModelRegistry:
+    """
+    Process-wide cache of (model, scaler) pairs keyed by their artifact paths.
+
+    - Keeps at most `max_size` pairs in memory and evicts the least recently used one.
+    - Stats the .h5/.pkl files on every lookup and reloads the pair when either
+      modification time changes (e.g. after a pipeline run rewrites the artifacts).
+    - Loading happens outside the lock, so a slow load never blocks cache hits
+      for other models.
+    """
+
+    def __init__(self, model_loader, scaler_loader, max_size=12):
+        self.model_loader = model_loader
+        self.scaler_loader = scaler_loader
+        self.max_size = max_size
+        self._entries = OrderedDict()  # (model_path, scaler_path) -> (mtimes, model, scaler)
+        self._lock = threading.Lock()
+        self._load_locks = {}
+        self.loads = 0
+        self.hits = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _mtimes(model_path, scaler_path):
+        try:
+            return os.path.getmtime(model_path), os.path.getmtime(scaler_path)
+        except OSError:
+            return None
+
+    def _load_lock(self, key):
+        with self._lock:
+            return self._load_locks.setdefault(key, threading.Lock())
+
+    def get(self, model_path, scaler_path):
+        """
+        Returns the cached (model, scaler) for the given artifact paths, loading or
+        reloading it if needed. Returns (None, None) if the files are missing.
+        """
+        key = (model_path, scaler_path)
+        mtimes = self._mtimes(model_path, scaler_path)
+        if mtimes is None:
+            print("File not found:", model_path, scaler_path)
+            return None, None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == mtimes:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1], entry[2]
+
+        # Only one thread loads a given pair; the others wait and then hit the cache.
+        load_lock = self._load_lock(key)
+        with load_lock:
+            try:
+                return self._load(key, mtimes)
+            finally:
+                # Waiters already hold the lock object; later callers find the cache entry
+                with self._lock:
+                    if self._load_locks.get(key) is load_lock:
+                        del self._load_locks[key]
+
+    def _load(self, key, mtimes):
+        model_path, scaler_path = key
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == mtimes:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1], entry[2]
+        try:
+            model = self.model_loader(model_path)
+            scaler = self.scaler_loader(scaler_path)
+        except Exception as e:
+            print(f"Error loading model/scaler: {e}")
+            return None, None
+        if model is None or scaler is None:
+            return None, None
+
+        with self._lock:
+            self._entries[key] = (mtimes, model, scaler)
+            self._entries.move_to_end(key)
+            self.loads += 1
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return model, scaler
+
+    def preload(self, path_pairs):
+        """Loads every (model_path, scaler_path) pair into the cache."""
+        for model_path, scaler_path in path_pairs:
+            self.get(model_path, scaler_path)
+        print(f"✅ Model registry warmed with {len(self)} model(s).")
+
+    def stats(self):
+        with self._lock:
+            return {
+                "cached": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "loads": self.loads,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,65 @@
+import threading
+import time
+
+
+# --- BACKGROUND STARTUP WARMUP ---
+class Warmup:
+    """
+    Runs named startup tasks (heavy imports, model preloading, ...) one after the
+    other in a daemon thread, so the app can serve requests while they load.
+
+    Nothing depends on warmup for correctness: everything it touches also loads
+    lazily on first use, warmup only moves that cost off the first request.
+    `status()` backs the readiness endpoint: the app is ready once every task
+    finished without raising.
+    """
+
+    def __init__(self, tasks):
+        self.tasks = list(tasks)  # [(name, fn)]
+        self._states = {name: {"state": "pending"} for name, _ in self.tasks}
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        started = time.perf_counter()
+        for name, fn in self.tasks:
+            with self._lock:
+                self._states[name] = {"state": "running"}
+            task_started = time.perf_counter()
+            try:
+                fn()
+                state = {"state": "done"}
+            except Exception as e:
+                print(f"❌ Warmup task '{name}' failed: {e}")
+                state = {"state": "failed", "error": str(e)}
+            state["seconds"] = round(time.perf_counter() - task_started, 3)
+            with self._lock:
+                self._states[name] = state
+        self._done.set()
+        print(f"✅ Warmup finished in {time.perf_counter() - started:.1f}s.")
+
+    def start(self):
+        """Starts the warmup thread (idempotent)."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="warmup", daemon=True)
+                self._thread.start()
+            return self._thread
+
+    def wait(self, timeout=None):
+        """Blocks until every task has finished. Returns False on timeout."""
+        return self._done.wait(timeout)
+
+    @property
+    def ready(self):
+        return self.status()["ready"]
+
+    def status(self):
+        with self._lock:
+            tasks = {name: dict(state) for name, state in self._states.items()}
+        return {
+            "ready": self._done.is_set() and all(t["state"] == "done" for t in tasks.values()),
+            "started": self._thread is not None,
+            "tasks": tasks,
+        }
@@ -0,0 +1,187 @@
+import bisect
+import contextvars
+import functools
+import threading
+import time
+from contextlib import contextmanager
+
+# Seconds; covers cache hits (sub-ms) up to slow upstream calls and model loads
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(pairs):
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# --- METRIC TYPES ---
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help, label_names=()):
+        self.name, self.help, self.label_names = name, help, tuple(label_names)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(name, "") for name in self.label_names)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, key, (), value) for key, value in self._values.items()]
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help, label_names=(), buckets=DEFAULT_BUCKETS):
+        self.name, self.help, self.label_names = name, help, tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}  # label values -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(labels.get(name, "") for name in self.label_names)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.setdefault(key, [0] * (len(self.buckets) + 2))
+            if index < len(self.buckets):
+                state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def samples(self):
+        samples = []
+        with self._lock:
+            for key, state in self._values.items():
+                cumulative = 0
+                for bound, count in zip(self.buckets, state):
+                    cumulative += count
+                    samples.append((f"{self.name}_bucket", key, (("le", _format_value(bound)),), cumulative))
+                samples.append((f"{self.name}_bucket", key, (("le", "+Inf"),), state[-1]))
+                samples.append((f"{self.name}_sum", key, (), state[-2]))
+                samples.append((f"{self.name}_count", key, (), state[-1]))
+        return samples
+
+
+class CallbackMetric:
+    """A counter or gauge whose value is read from `fn()` at scrape time: a number, or {label values: number}."""
+
+    def __init__(self, name, help, fn, kind="gauge", label_names=()):
+        self.name, self.help, self.fn, self.kind, self.label_names = name, help, fn, kind, tuple(label_names)
+
+    def samples(self):
+        values = self.fn()
+        if not isinstance(values, dict):
+            values = {(): values}
+        return [(self.name, key if isinstance(key, tuple) else (key,), (), value) for key, value in values.items()]
+
+
+# --- REGISTRY ---
+class MetricsRegistry:
+    """Holds the process's metrics and renders them in the Prometheus text format (0.0.4)."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            # Modules may be re-imported (e.g. by the Flask reloader); keep the first instance
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name, help, label_names=()):
+        return self._register(Counter(name, help, label_names))
+
+    def histogram(self, name, help, label_names=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, help, label_names, buckets))
+
+    def callback(self, name, help, fn, kind="gauge", label_names=()):
+        with self._lock:
+            self._metrics[name] = CallbackMetric(name, help, fn, kind, label_names)
+            return self._metrics[name]
+
+    def render(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            try:
+                samples = metric.samples()
+            except Exception as e:
+                print(f"⚠️ Could not collect metric {metric.name}: {e}")
+                continue
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for sample_name, label_values, extra, value in samples:
+                labels = list(zip(metric.label_names, label_values)) + list(extra)
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+STAGE_SECONDS = registry.histogram(
+    "dhanlaabh_stage_duration_seconds", "Time spent in each request stage.", ("stage",))
+STAGE_ERRORS = registry.counter(
+    "dhanlaabh_stage_errors_total", "Stages that raised, e.g. failed upstream calls.", ("stage",))
+CACHE_LOOKUPS = registry.counter(
+    "dhanlaabh_cache_lookups_total", "Cache lookups by cache and result (hit/miss).", ("cache", "result"))
+
+
+# --- PER-REQUEST TIMING BREAKDOWN ---
+# List of (stage, seconds) for the request being served. Worker threads only see it
+# when the task was submitted with `submit_in_context`.
+_request_timings = contextvars.ContextVar("request_timings", default=None)
+
+
+def start_request_timings():
+    timings = []
+    _request_timings.set(timings)
+    return timings
+
+
+def submit_in_context(executor, fn, *args, **kwargs):
+    """executor.submit that runs `fn` in a copy of the caller's context, so its stages count toward the request."""
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+@contextmanager
+def timed(stage):
+    """Records the duration of the block in the stage histogram and in the current request's breakdown."""
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        STAGE_ERRORS.inc(stage=stage)
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        STAGE_SECONDS.observe(elapsed, stage=stage)
+        timings = _request_timings.get()
+        if timings is not None:
+            timings.append((stage, elapsed))
+
+
+def timed_function(stage):
+    """Decorator form of `timed`."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timed(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -1,4 +1,9 @@
 # Import the VADER sentiment analysis tool
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from monitoring.metrics import timed, CACHE_LOOKUPS
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 # --- INITIALIZATION ---
@@ -6,26 +11,88 @@ from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 # This is fast and takes up very little memory
 analyzer = SentimentIntensityAnalyzer()
 
+# --- SCORE CACHE ---
+# Compound scores keyed by a hash of the headline text, bounded LRU
+SENTIMENT_CACHE_SIZE = int(os.getenv('SENTIMENT_CACHE_SIZE', '10000'))
+_score_cache = OrderedDict()
+_score_cache_lock = threading.Lock()
+cache_stats = {"hits": 0, "misses": 0}
+
+def clear_cache():
+    with _score_cache_lock:
+        _score_cache.clear()
+
+def _text_key(text):
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+def score_headlines(texts):
+    """
+    Returns the VADER compound score for every text, in order.
+    Duplicate texts are scored once, and scores are memoized across calls.
+    """
+    keys = [_text_key(text) for text in texts]
+    scores, missing = {}, {}
+    with _score_cache_lock:
+        for key, text in zip(keys, texts):
+            if key in scores or key in missing:
+                continue
+            if key in _score_cache:
+                _score_cache.move_to_end(key)
+                scores[key] = _score_cache[key]
+                cache_stats["hits"] += 1
+            else:
+                missing[key] = text
+                cache_stats["misses"] += 1
+
+    CACHE_LOOKUPS.inc(len(scores), cache="sentiment", result="hit")
+    CACHE_LOOKUPS.inc(len(missing), cache="sentiment", result="miss")
+
+    # Score outside the lock; VADER is pure Python and the analyzer is stateless
+    with timed("vader"):
+        fresh = {key: analyzer.polarity_scores(text)['compound'] for key, text in missing.items()}
+
+    if fresh:
+        with _score_cache_lock:
+            for key, score in fresh.items():
+                _score_cache[key] = score
+                _score_cache.move_to_end(key)
+            while len(_score_cache) > SENTIMENT_CACHE_SIZE:
+                _score_cache.popitem(last=False)
+        scores.update(fresh)
+    return [scores[key] for key in keys]
+
 # --- SENTIMENT ANALYSIS FUNCTION ---
 
+def get_sentiment_batch(headlines_by_symbol):
+    """
+    Analyzes the headlines of many symbols at once: every distinct headline across all
+    symbols is scored a single time. Returns {symbol: get_sentiment(...) result}.
+    """
+    all_headlines = [h for headlines in headlines_by_symbol.values() for h in (headlines or [])]
+    compound = dict(zip(all_headlines, score_headlines(all_headlines)))
+    return {
+        symbol: _summarize(headlines, [compound[h] for h in headlines] if headlines else [])
+        for symbol, headlines in headlines_by_symbol.items()
+    }
+
 def get_sentiment(headlines):
     """
     Analyzes the sentiment of a list of news headlines using the VADER model.
     """
+    if not headlines:
+        return _summarize([], [])
+    return _summarize(headlines, score_headlines(headlines))
+
+def _summarize(headlines, compound_scores):
     if not headlines:
         return {"overall_sentiment": "Neutral", "positive_headlines": 0, "negative_headlines": 0, "neutral_headlines": 0, "headlines": []}
 
     analyzed_headlines = []
     pos_count, neg_count, neu_count = 0, 0, 0
     
-    for headline in headlines:
-        # Get the sentiment scores from VADER. It returns a dictionary.
-        # e.g., {'neg': 0.0, 'neu': 0.588, 'pos': 0.412, 'compound': 0.4404}
-        scores = analyzer.polarity_scores(headline)
-        
-        # The 'compound' score is a single, normalized score from -1 (most negative) to +1 (most positive).
-        # We can use it to determine the overall sentiment.
-        compound_score = scores['compound']
+    for headline, compound_score in zip(headlines, compound_scores):
+        # The 'compound' score from VADER is a single, normalized score from -1 (most negative)
+        # to +1 (most positive). We can use it to determine the overall sentiment.
         
         if compound_score >= 0.05:
             sentiment = "Positive"
@@ -1,28 +1,50 @@
+import os
+import time
+import functools
+import threading
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 import urllib.parse
 import re
-import yfinance as yf
 import feedparser
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
+from monitoring.metrics import timed, submit_in_context, CACHE_LOOKUPS
 
 # --- NLTK DATA SETUP ---
-# This will download the necessary NLTK models if they are not already present.
-try:
-    stopwords.words('english')
-except LookupError:
-    print("Downloading NLTK stopwords...")
-    nltk.download('stopwords')
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    print("Downloading NLTK punkt tokenizer...")
-    nltk.download('punkt')
+# NLTK takes over a second to import, so it is loaded on first use instead of when
+# this module is imported. The necessary models are downloaded if not already present.
+_nltk_lock = threading.Lock()
+_nltk_ready = False
+
+def ensure_nltk_data():
+    """Imports NLTK and downloads the stopwords/punkt data once per process if missing."""
+    global _nltk_ready
+    with _nltk_lock:
+        if _nltk_ready:
+            return
+        import nltk
+        from nltk.corpus import stopwords
+        try:
+            stopwords.words('english')
+        except LookupError:
+            print("Downloading NLTK stopwords...")
+            nltk.download('stopwords')
+        try:
+            nltk.data.find('tokenizers/punkt')
+        except LookupError:
+            print("Downloading NLTK punkt tokenizer...")
+            nltk.download('punkt')
+        _nltk_ready = True
 
 
 # --- TEXT PREPROCESSING UTILITY (UPDATED) ---
+@functools.lru_cache(maxsize=1)
+def get_stop_words():
+    """The English stop word set, read from the NLTK corpus only once per process."""
+    ensure_nltk_data()
+    from nltk.corpus import stopwords
+    return frozenset(stopwords.words('english'))
+
 def preprocess_text(text):
     """
     Cleans and preprocesses a given text using the NLTK library.
@@ -41,10 +63,12 @@ def preprocess_text(text):
         return []
 
     # 1. Convert to lowercase and tokenize using NLTK's word tokenizer
+    ensure_nltk_data()
+    from nltk.tokenize import word_tokenize
     tokens = word_tokenize(text.lower())
     
-    # 2. Get the standard set of English stop words from NLTK
-    stop_words = set(stopwords.words('english'))
+    # 2. Get the standard set of English stop words from NLTK (built once, see get_stop_words)
+    stop_words = get_stop_words()
     
     # 3. Filter out stop words and any tokens that are not purely alphabetic (removes punctuation and numbers)
     cleaned_tokens = [
@@ -58,6 +82,46 @@ def preprocess_text(text):
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/5.0 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 }
+SUBREDDITS = ["investing", "stocks", "wallstreetbets"]
+REQUEST_TIMEOUT = float(os.getenv('SCRAPER_TIMEOUT', '6'))
+SCRAPER_MAX_WORKERS = int(os.getenv('SCRAPER_MAX_WORKERS', '8'))  # Upper bound on in-flight upstream requests
+NEWS_CACHE_TTL = float(os.getenv('NEWS_CACHE_TTL', '300'))  # Seconds a symbol's headlines are reused
+NEWS_CACHE_MAX_SYMBOLS = 512
+
+# One pooled session keeps TLS connections to Google/Reddit alive across requests
+session = requests.Session()
+session.headers.update(HEADERS)
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=SCRAPER_MAX_WORKERS)
+session.mount("https://", _adapter)
+session.mount("http://", _adapter)
+
+# Shared pool that bounds how many sources are fetched in parallel
+executor = ThreadPoolExecutor(max_workers=SCRAPER_MAX_WORKERS, thread_name_prefix="scraper")
+
+# --- HEADLINE CACHE ---
+_headline_cache = {}  # symbol -> (expires_at, headlines)
+_headline_cache_lock = threading.Lock()
+
+def get_cached_headlines(symbol):
+    with _headline_cache_lock:
+        entry = _headline_cache.get(symbol.upper())
+        if entry is not None and entry[0] < time.monotonic():
+            del _headline_cache[symbol.upper()]
+            entry = None
+        CACHE_LOOKUPS.inc(cache="headlines", result="miss" if entry is None else "hit")
+        return None if entry is None else list(entry[1])
+
+def cache_headlines(symbol, headlines):
+    with _headline_cache_lock:
+        if len(_headline_cache) >= NEWS_CACHE_MAX_SYMBOLS:
+            # Drop the entry closest to expiry to stay bounded
+            oldest = min(_headline_cache, key=lambda k: _headline_cache[k][0])
+            del _headline_cache[oldest]
+        _headline_cache[symbol.upper()] = (time.monotonic() + NEWS_CACHE_TTL, list(headlines))
+
+def clear_headline_cache():
+    with _headline_cache_lock:
+        _headline_cache.clear()
 
 # --- GOOGLE NEWS SCRAPER ---
 def scrape_google_news(symbol, company_name):
@@ -71,7 +135,11 @@ def scrape_google_news(symbol, company_name):
     headlines = []
     
     try:
-        feed = feedparser.parse(url)
+        # Download through the pooled session (with a timeout), then parse the bytes
+        with timed("google_news"):
+            response = session.get(url, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            feed = feedparser.parse(response.content)
         for entry in feed.entries[:10]:
             headlines.append(entry.title)
         return headlines
@@ -81,55 +149,78 @@ def scrape_google_news(symbol, company_name):
         return []
 
 # --- REDDIT SCRAPER ---
-def scrape_reddit(symbol, company_name):
+def scrape_subreddit(symbol, company_name, subreddit):
     """
-    Scrapes recent post titles mentioning the stock from relevant subreddits.
+    Fetches recent post titles mentioning the stock from a single subreddit.
     """
-    subreddits = ["investing", "stocks", "wallstreetbets"]
-    titles = []
     simple_name = company_name.split(' ')[0].replace(',', '')
-
-    for subreddit in subreddits:
-        try:
-            query = f'"{symbol}" OR "{simple_name}"'
-            url = f"https://www.reddit.com/r/{subreddit}/search.json?q={urllib.parse.quote(query)}&sort=new&limit=5&restrict_sr=on"
-            
-            response = requests.get(url, headers=HEADERS, timeout=10)
+    titles = []
+    try:
+        query = f'"{symbol}" OR "{simple_name}"'
+        url = f"https://www.reddit.com/r/{subreddit}/search.json?q={urllib.parse.quote(query)}&sort=new&limit=5&restrict_sr=on"
+        
+        with timed("reddit"):
+            response = session.get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             data = response.json()
-            
-            if 'data' in data and 'children' in data['data']:
-                for post in data['data']['children']:
-                    titles.append(post['data']['title'])
+        
+        if 'data' in data and 'children' in data['data']:
+            for post in data['data']['children']:
+                titles.append(post['data']['title'])
 
-        except requests.exceptions.RequestException as e:
-            print(f"❌ Error fetching Reddit data from r/{subreddit} for {symbol}: {e}")
-            continue
+    except requests.exceptions.RequestException as e:
+        print(f"❌ Error fetching Reddit data from r/{subreddit} for {symbol}: {e}")
 
     return titles
 
-# --- MAIN SCRAPER FUNCTION ---
-def scrape_financial_news(symbol):
+def scrape_reddit(symbol, company_name):
     """
-    Main function to orchestrate scraping from all sources and combine the results.
+    Scrapes recent post titles mentioning the stock from relevant subreddits, concurrently.
     """
-    print(f"\n--- Scraping news and social media for {symbol} ---")
-    
-    company_name = symbol
+    futures = [submit_in_context(executor, scrape_subreddit, symbol, company_name, sub) for sub in SUBREDDITS]
+    return [title for future in futures for title in future.result()]
+
+# --- COMPANY NAME LOOKUP ---
+def get_company_name(symbol):
+    """
+    Looks up the company's long name on Yahoo Finance, falling back to the symbol.
+    """
+    import yfinance as yf  # deferred: not needed until a lookup actually runs
+
     try:
-        company_info = yf.Ticker(symbol).info
-        company_name = company_info.get('longName', symbol)
+        with timed("yfinance_company_info"):
+            company_info = yf.Ticker(symbol).info
+        return company_info.get('longName', symbol)
     except Exception as e:
         print(f"Could not fetch company longName for {symbol}: {e}")
-        
-    google_headlines = scrape_google_news(symbol, company_name)
-    reddit_headlines = scrape_reddit(symbol, company_name)
-    
-    combined_headlines = google_headlines + reddit_headlines
+        return symbol
+
+# --- MAIN SCRAPER FUNCTION ---
+def scrape_financial_news(symbol, company_name=None):
+    """
+    Main function to orchestrate scraping from all sources and combine the results.
+    Pass `company_name` when the caller already looked it up to skip a second lookup.
+    """
+    print(f"\n--- Scraping news and social media for {symbol} ---")
+
+    cached = get_cached_headlines(symbol)
+    if cached is not None:
+        print(f"✅ Serving {len(cached)} cached headlines for {symbol}.")
+        return cached
+
+    if company_name is None:
+        company_name = get_company_name(symbol)
+
+    # Google News runs on the shared pool while scrape_reddit fans out the subreddits
+    google_future = submit_in_context(executor, scrape_google_news, symbol, company_name)
+    reddit_titles = scrape_reddit(symbol, company_name)
+
+    combined_headlines = google_future.result() + reddit_titles
     
     if not combined_headlines:
         print(f"⚠️ No headlines found for {symbol}. Using placeholder data.")
         return [f"Market is quiet for {symbol} today.", f"Investors watch {symbol} closely for new developments."]
         
     print(f"✅ Found {len(combined_headlines)} total headlines for {symbol}.")
+    cache_headlines(symbol, combined_headlines)
     return combined_headlines
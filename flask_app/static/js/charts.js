@@ -78,12 +78,27 @@ document.addEventListener('DOMContentLoaded', () => {
         });
     };
     
+    // Expands the compact columnar format (start date + day deltas) back into date labels
+    const decodeHistoricalData = (data) => {
+        if (data.format !== 'compact') return data;
+        const dates = [];
+        let time = Date.parse(`${data.start}T00:00:00Z`);
+        data.dayDeltas.forEach(delta => {
+            time += delta * 86400000;
+            dates.push(new Date(time).toISOString().slice(0, 10));
+        });
+        return { dates, prices: data.prices };
+    };
+
     const fetchHistoricalData = async (period = '1y') => {
         console.log(`Fetching historical data for period: ${period}...`); // 4. Check if the fetch function is called.
         try {
-            const response = await fetch(`/api/historical-data/${stockSymbol}?period=${period}`);
+            // No point sending more points than the canvas has pixels; rounded up to the
+            // server's 100-point buckets so similar widths share cached responses
+            const points = Math.max(200, Math.ceil((historicalChartCtx.clientWidth || 800) / 100) * 100);
+            const response = await fetch(`/api/historical-data/${stockSymbol}?period=${period}&points=${points}&format=compact`);
             if (!response.ok) throw new Error(`Network response was not ok: ${response.statusText}`);
-            const data = await response.json();
+            const data = decodeHistoricalData(await response.json());
             console.log("Historical API Data Received:", data); // 5. THIS IS THE MOST IMPORTANT STEP. See what the server sent.
             createHistoricalChart(data.dates, data.prices);
         } catch (error) {
@@ -1,5 +1,16 @@
-// Import stock symbols from the dedicated data file
-import { stockSymbols } from './stock-data.js';
+// Symbol search runs on the server (/api/symbols), so the symbol list is not shipped to the browser
+const SEARCH_DEBOUNCE_MS = 120;
+const searchCache = new Map();
+
+async function searchSymbols(query, limit = 8, signal = undefined) {
+    const key = `${query.toUpperCase()}|${limit}`;
+    if (searchCache.has(key)) return searchCache.get(key);
+    const response = await fetch(`/api/symbols?q=${encodeURIComponent(query)}&limit=${limit}`, { signal });
+    if (!response.ok) throw new Error(`Symbol search failed: ${response.status}`);
+    const results = await response.json();
+    searchCache.set(key, results);
+    return results;
+}
 
 document.addEventListener('DOMContentLoaded', function() {
 
@@ -38,13 +49,21 @@ document.addEventListener('DOMContentLoaded', function() {
         const resultsContainer = document.getElementById('autocomplete-results');
         const validationAlert = document.getElementById('validation-alert');
 
-        // Client-side validation before submitting
-        stockForm.addEventListener('submit', function(e) {
-            const inputValue = stockInput.value.toUpperCase();
-            const isValid = stockSymbols.some(stock => stock.symbol.toUpperCase() === inputValue);
-            
-            if (!isValid) {
-                e.preventDefault(); // Stop the form submission
+        // Client-side validation before submitting: an exact match is always ranked first
+        stockForm.addEventListener('submit', async function(e) {
+            e.preventDefault();
+            const inputValue = stockInput.value.trim().toUpperCase();
+            let isValid = false;
+            try {
+                const matches = await searchSymbols(inputValue, 1);
+                isValid = matches.length > 0 && matches[0].symbol === inputValue;
+            } catch (err) {
+                isValid = inputValue.length > 0; // Search unavailable: let the server decide
+            }
+
+            if (isValid) {
+                stockForm.submit();
+            } else {
                 validationAlert.classList.add('show');
                 setTimeout(() => {
                     validationAlert.classList.remove('show');
@@ -52,22 +71,36 @@ document.addEventListener('DOMContentLoaded', function() {
             }
         });
 
-        // Autocomplete functionality
+        // Autocomplete functionality: debounced, and a newer keystroke cancels the pending request
+        let debounceTimer = null;
+        let pendingSearch = null;
+
         stockInput.addEventListener('input', function() {
-            const value = this.value;
-            closeAllLists();
-            if (!value) return;
+            const value = this.value.trim();
+            clearTimeout(debounceTimer);
+            if (pendingSearch) pendingSearch.abort();
+            if (!value) {
+                closeAllLists();
+                return;
+            }
+            debounceTimer = setTimeout(async () => {
+                pendingSearch = new AbortController();
+                try {
+                    const matches = await searchSymbols(value, 8, pendingSearch.signal);
+                    renderSuggestions(value, matches);
+                } catch (err) {
+                    if (err.name !== 'AbortError') console.error(err);
+                }
+            }, SEARCH_DEBOUNCE_MS);
+        });
 
+        const renderSuggestions = (value, filteredStocks) => {
+            closeAllLists();
             const suggestions = document.createElement('div');
             suggestions.setAttribute('id', 'autocomplete-list');
             suggestions.setAttribute('class', 'autocomplete-items');
             resultsContainer.appendChild(suggestions);
 
-            const filteredStocks = stockSymbols.filter(stock => 
-                stock.symbol.toUpperCase().startsWith(value.toUpperCase()) || 
-                stock.name.toUpperCase().includes(value.toUpperCase())
-            ).slice(0, 8); // Limit to top 8
-
             filteredStocks.forEach(stock => {
                 const item = document.createElement('div');
                 item.classList.add('autocomplete-item');
@@ -86,7 +119,7 @@ document.addEventListener('DOMContentLoaded', function() {
                 });
                 suggestions.appendChild(item);
             });
-        });
+        };
 
         const closeAllLists = () => {
             const items = document.getElementById('autocomplete-list');
@@ -1,11748 +0,0 @@
-export const stockSymbols = [
-    { symbol: "AACB", name: "Artius II Acquisition Inc. - Class A Ordinary Shares" },
-    { symbol: "AACBR", name: "Artius II Acquisition Inc. - Rights" },
-    { symbol: "AACBU", name: "Artius II Acquisition Inc. - Units" },
-    { symbol: "AACG", name: "ATA Creativity Global - American Depositary Shares, each representing two common shares" },
-    { symbol: "AACI", name: "Armada Acquisition Corp. II - Class A Ordinary Shares" },
-    { symbol: "AACIU", name: "Armada Acquisition Corp. II - Units" },
-    { symbol: "AACIW", name: "Armada Acquisition Corp. II - Warrant" },
-    { symbol: "AADR", name: "AdvisorShares Dorsey Wright ADR ETF" },
-    { symbol: "AAL", name: "American Airlines Group, Inc. - Common Stock" },
-    { symbol: "AALG", name: "Leverage Shares 2X Long AAL Daily ETF" },
-    { symbol: "AAME", name: "Atlantic American Corporation - Common Stock" },
-    { symbol: "AAOI", name: "Applied Optoelectronics, Inc. - Common Stock" },
-    { symbol: "AAON", name: "AAON, Inc. - Common Stock" },
-    { symbol: "AAPB", name: "GraniteShares 2x Long AAPL Daily ETF" },
-    { symbol: "AAPD", name: "Direxion Daily AAPL Bear 1X Shares" },
-    { symbol: "AAPG", name: "Ascentage Pharma Group International - American Depository Shares" },
-    { symbol: "AAPL", name: "Apple Inc. - Common Stock" },
-    { symbol: "AAPU", name: "Direxion Daily AAPL Bull 2X Shares" },
-    { symbol: "AARD", name: "Aardvark Therapeutics, Inc. - Common Stock" },
-    { symbol: "AAUS", name: "Alpha Architect US Equity ETF" },
-    { symbol: "AAVM", name: "Alpha Architect Global Factor Equity ETF" },
-    { symbol: "AAXJ", name: "iShares MSCI All Country Asia ex Japan ETF" },
-    { symbol: "ABAT", name: "American Battery Technology Company - Common Stock" },
-    { symbol: "ABCL", name: "AbCellera Biologics Inc. - Common Shares" },
-    { symbol: "ABCS", name: "Alpha Blue Capital US Small-Mid Cap Dynamic ETF" },
-    { symbol: "ABEO", name: "Abeona Therapeutics Inc. - Common Stock" },
-    { symbol: "ABI", name: "VictoryShares Pioneer Asset-Based Income ETF" },
-    { symbol: "ABIG", name: "Argent Large Cap ETF" },
-    { symbol: "ABL", name: "Abacus Global Management, Inc. - Class A Common Stock" },
-    { symbol: "ABLLL", name: "Abacus Global Management, Inc. - 9.875% Fixed Rate Senior Notes due 2028" },
-    { symbol: "ABLV", name: "Able View Global Inc. - Class B Ordinary Shares" },
-    { symbol: "ABLVW", name: "Able View Global Inc. - Warrant" },
-    { symbol: "ABNB", name: "Airbnb, Inc. - Class A Common Stock" },
-    { symbol: "ABOS", name: "Acumen Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "ABP", name: "Abpro Holdings, Inc - Common Stock" },
-    { symbol: "ABPWW", name: "Abpro Holdings, Inc - Warrant" },
-    { symbol: "ABSI", name: "Absci Corporation - Common Stock" },
-    { symbol: "ABTC", name: "American Bitcoin Corp. - Class A Common Stock" },
-    { symbol: "ABTS", name: "Abits Group Inc - Ordinary Shares" },
-    { symbol: "ABUS", name: "Arbutus Biopharma Corporation - Common Stock" },
-    { symbol: "ABVC", name: "ABVC BioPharma, Inc. - Common Stock" },
-    { symbol: "ABVE", name: "Above Food Ingredients Inc. - Common Stock" },
-    { symbol: "ABVEW", name: "Above Food Ingredients Inc. - Warrant" },
-    { symbol: "ABVX", name: "Abivax SA - American Depositary Shares" },
-    { symbol: "ACAD", name: "ACADIA Pharmaceuticals Inc. - Common Stock" },
-    { symbol: "ACB", name: "Aurora Cannabis Inc. - Common Shares" },
-    { symbol: "ACDC", name: "ProFrac Holding Corp. - Class A Common Stock" },
-    { symbol: "ACET", name: "Adicet Bio, Inc. - Common Stock" },
-    { symbol: "ACFN", name: "Acorn Energy, Inc. - Common Stock" },
-    { symbol: "ACGL", name: "Arch Capital Group Ltd. - Common Stock" },
-    { symbol: "ACGLN", name: "Arch Capital Group Ltd. - Depositary Shares, each Representing a 1/1,000th Interest in a 4.550% Non-Cumulative Preferred Share, Series G" },
-    { symbol: "ACGLO", name: "Arch Capital Group Ltd. - Depositary Shares Each Representing 1/1,000th Interest in a Share of5.45% Non-Cumulative Preferred Shares, Series F" },
-    { symbol: "ACHC", name: "Acadia Healthcare Company, Inc. - Common Stock" },
-    { symbol: "ACHV", name: "Achieve Life Sciences, Inc.  - Common Shares" },
-    { symbol: "ACIC", name: "American Coastal Insurance Corporation - Common Stock" },
-    { symbol: "ACIU", name: "AC Immune SA - Common Stock" },
-    { symbol: "ACIW", name: "ACI Worldwide, Inc. - Common Stock" },
-    { symbol: "ACLS", name: "Axcelis Technologies, Inc. - Common Stock" },
-    { symbol: "ACLX", name: "Arcellx, Inc. - Common Stock" },
-    { symbol: "ACMR", name: "ACM Research, Inc. - Class A Common Stock" },
-    { symbol: "ACNB", name: "ACNB Corporation - Common Stock" },
-    { symbol: "ACNT", name: "Ascent Industries Co. - Common Stock" },
-    { symbol: "ACOG", name: "Alpha Cognition Inc. - Common Stock" },
-    { symbol: "ACON", name: "Aclarion, Inc. - Common Stock" },
-    { symbol: "ACONW", name: "Aclarion, Inc. - Warrant" },
-    { symbol: "ACRS", name: "Aclaris Therapeutics, Inc. - Common Stock" },
-    { symbol: "ACRV", name: "Acrivon Therapeutics, Inc. - Common Stock" },
-    { symbol: "ACT", name: "Enact Holdings, Inc. - Common Stock" },
-    { symbol: "ACTG", name: "Acacia Research Corporation - Common Stock" },
-    { symbol: "ACTU", name: "Actuate Therapeutics, Inc. - Common stock" },
-    { symbol: "ACWI", name: "iShares MSCI ACWI ETF" },
-    { symbol: "ACWX", name: "iShares MSCI ACWI ex U.S. ETF" },
-    { symbol: "ACXP", name: "Acurx Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "ADAG", name: "Adagene Inc. - ADS, each representing 1.25 ordinary shares" },
-    { symbol: "ADAM", name: "Adamas Trust, Inc. - Common Stock" },
-    { symbol: "ADAMG", name: "Adamas Trust, Inc. - 9.125% Senior Notes Due 2030" },
-    { symbol: "ADAMH", name: "Adamas Trust, Inc. - 9.875% Senior Notes Due 2030" },
-    { symbol: "ADAMI", name: "Adamas Trust, Inc. - 9.125% Senior Notes Due 2029" },
-    { symbol: "ADAML", name: "Adamas Trust, Inc. - 6.875% Series F Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock, $0.01 par value per share" },
-    { symbol: "ADAMM", name: "Adamas Trust, Inc. - 7.875% Series E Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "ADAMN", name: "Adamas Trust, Inc. - 8.00% Series D Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "ADAMZ", name: "Adamas Trust, Inc. - 7.000% Series G Cumulative Redeemable Preferred Stock, $0.01 par value per share" },
-    { symbol: "ADAP", name: "Adaptimmune Therapeutics plc - American Depositary Shares" },
-    { symbol: "ADBE", name: "Adobe Inc. - Common Stock" },
-    { symbol: "ADBG", name: "Leverage Shares 2X Long ADBE Daily ETF" },
-    { symbol: "ADEA", name: "Adeia Inc.  - Common Stock" },
-    { symbol: "ADGM", name: "Adagio Medical Holdings, Inc - Common Stock" },
-    { symbol: "ADI", name: "Analog Devices, Inc. - Common Stock" },
-    { symbol: "ADIL", name: "Adial Pharmaceuticals, Inc - Common Stock" },
-    { symbol: "ADMA", name: "ADMA Biologics Inc - Common Stock" },
-    { symbol: "ADN", name: "Advent Technologies Holdings, Inc. - Class A Common Stock" },
-    { symbol: "ADNWW", name: "Advent Technologies Holdings, Inc. - Warrant" },
-    { symbol: "ADP", name: "Automatic Data Processing, Inc. - Common Stock" },
-    { symbol: "ADPT", name: "Adaptive Biotechnologies Corporation - Common Stock" },
-    { symbol: "ADSE", name: "ADS-TEC ENERGY PLC - Ordinary Shares" },
-    { symbol: "ADSEW", name: "ADS-TEC ENERGY PLC - Warrant" },
-    { symbol: "ADSK", name: "Autodesk, Inc. - Common Stock" },
-    { symbol: "ADTN", name: "ADTRAN Holdings, Inc. - Common Stock" },
-    { symbol: "ADTX", name: "Aditxt, Inc. - Common Stock" },
-    { symbol: "ADUR", name: "Aduro Clean Technologies Inc. - Common Stock" },
-    { symbol: "ADUS", name: "Addus HomeCare Corporation - Common Stock" },
-    { symbol: "ADV", name: "Advantage Solutions Inc.  - Class A Common Stock" },
-    { symbol: "ADVB", name: "Advanced Biomed Inc. - Common Stock" },
-    { symbol: "ADVM", name: "Adverum Biotechnologies, Inc. - Common Stock" },
-    { symbol: "ADVWW", name: "Advantage Solutions Inc.  - Warrant" },
-    { symbol: "ADXN", name: "Addex Therapeutics Ltd - American Depositary Shares" },
-    { symbol: "AEBI", name: "Aebi Schmidt Holding AG - Common Stock" },
-    { symbol: "AEHL", name: "Antelope Enterprise Holdings Limited - Class A Ordinary Shares" },
-    { symbol: "AEHR", name: "Aehr Test Systems - Common Stock" },
-    { symbol: "AEI", name: "Alset Inc. - Common Stock" },
-    { symbol: "AEIS", name: "Advanced Energy Industries, Inc. - Common Stock" },
-    { symbol: "AEMD", name: "Aethlon Medical, Inc. - Common Stock" },
-    { symbol: "AENT", name: "Alliance Entertainment Holding Corporation - common stock" },
-    { symbol: "AENTW", name: "Alliance Entertainment Holding Corporation - Warrants" },
-    { symbol: "AEP", name: "American Electric Power Company, Inc. - Common Stock" },
-    { symbol: "AERT", name: "Aeries Technology, Inc. - Class A Ordinary Share" },
-    { symbol: "AERTW", name: "Aeries Technology, Inc. - Warrant" },
-    { symbol: "AEVA", name: "Aeva Technologies, Inc. - Common Stock" },
-    { symbol: "AEVAW", name: "Aeva Technologies, Inc. - Redeemable Warrants" },
-    { symbol: "AEYE", name: "AudioEye, Inc. - Common Stock" },
-    { symbol: "AFBI", name: "Affinity Bancshares, Inc. - Common Stock" },
-    { symbol: "AFCG", name: "Advanced Flower Capital Inc. - Common Stock" },
-    { symbol: "AFJK", name: "Aimei Health Technology Co., Ltd - Ordinary Share" },
-    { symbol: "AFJKR", name: "Aimei Health Technology Co., Ltd - Right" },
-    { symbol: "AFJKU", name: "Aimei Health Technology Co., Ltd - Unit" },
-    { symbol: "AFOS", name: "ARS Focused Opportunity Strategy ETF" },
-    { symbol: "AFRI", name: "Forafric Global PLC - Ordinary Shares" },
-    { symbol: "AFRIW", name: "Forafric Global PLC - Warrants" },
-    { symbol: "AFRM", name: "Affirm Holdings, Inc. - Class A Common Stock" },
-    { symbol: "AFSC", name: "abrdn Focused U.S. Small Cap Active ETF" },
-    { symbol: "AFYA", name: "Afya Limited - Class A Common Shares" },
-    { symbol: "AGAE", name: "Allied Gaming & Entertainment Inc. - Common Stock" },
-    { symbol: "AGEM", name: "abrdn Emerging Markets Dividend Active ETF" },
-    { symbol: "AGEN", name: "Agenus Inc. - Common Stock" },
-    { symbol: "AGGA", name: "EA Astoria Dynamic Core US Fixed Income ETF" },
-    { symbol: "AGH", name: "Aureus Greenway Holdings Inc. - Common Stock" },
-    { symbol: "AGIO", name: "Agios Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "AGIX", name: "KraneShares Artificial Intelligence & Technology ETF" },
-    { symbol: "AGMH", name: "AGM Group Holdings Inc. - Class A Ordinary Shares" },
-    { symbol: "AGMI", name: "Themes Silver Miners ETF" },
-    { symbol: "AGNC", name: "AGNC Investment Corp. - Common Stock" },
-    { symbol: "AGNCL", name: "AGNC Investment Corp. - Depositary Shares Each Representing a 1/1,000th Interest in a Share of 7.75% Series G Fixed-Rate Reset Cumulative Redeemable Preferred Stock" },
-    { symbol: "AGNCM", name: "AGNC Investment Corp. - Depositary Shares rep 6.875% Series D Fixed-to-Floating Cumulative Redeemable Preferred Stock" },
-    { symbol: "AGNCN", name: "AGNC Investment Corp. - Depositary Shares Each Representing a 1/1,000th Interest in a Share of 7.00% Series C Fixed-To-Floating Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "AGNCO", name: "AGNC Investment Corp. - Depositary Shares, each representing a 1/1,000th interest in a share of Series E Fixed-to-Floating Cumulative Redeemable Preferred Stock" },
-    { symbol: "AGNCP", name: "AGNC Investment Corp. - Depositary Shares Each Representing a 1/1,000th Interest in a Share of 6.125% Series F Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "AGNG", name: "Global X Aging Population ETF" },
-    { symbol: "AGRI", name: "AgriFORCE  Growing Systems Ltd. - Common Shares" },
-    { symbol: "AGYS", name: "Agilysys, Inc. - Common Stock" },
-    { symbol: "AGZD", name: "WisdomTree Interest Rate Hedged U.S. Aggregate Bond Fund" },
-    { symbol: "AHCO", name: "AdaptHealth Corp.  - Common Stock" },
-    { symbol: "AHG", name: "Akso Health Group - American Depositary Shares" },
-    { symbol: "AIA", name: "iShares Asia 50 ETF" },
-    { symbol: "AIFD", name: "TCW Artificial Intelligence ETF" },
-    { symbol: "AIFF", name: "Firefly Neuroscience, Inc.  - Common Stock" },
-    { symbol: "AIFU", name: "AIFU Inc. - Class A Ordinary Share" },
-    { symbol: "AIHS", name: "Senmiao Technology Limited - Common Stock" },
-    { symbol: "AIIO", name: "Robo.ai Inc. - Class B Ordinary Shares" },
-    { symbol: "AIIOW", name: "Robo.ai Inc. - Warrant" },
-    { symbol: "AIMD", name: "Ainos, Inc. - Common Stock" },
-    { symbol: "AIMDW", name: "Ainos, Inc. - warrants" },
-    { symbol: "AIOT", name: "PowerFleet, Inc. - Common Stock" },
-    { symbol: "AIP", name: "Arteris, Inc.  - Common Stock" },
-    { symbol: "AIPI", name: "REX AI Equity Premium Income ETF" },
-    { symbol: "AIPO", name: "Defiance AI & Power Infrastructure ETF" },
-    { symbol: "AIQ", name: "Global X Artificial Intelligence & Technology ETF" },
-    { symbol: "AIRE", name: "reAlpha Tech Corp. - Common Stock" },
-    { symbol: "AIRG", name: "Airgain, Inc. - Common Stock" },
-    { symbol: "AIRJ", name: "AirJoule Technologies Corporation - Class A Common Stock" },
-    { symbol: "AIRJW", name: "AirJoule Technologies Corporation - Warrant" },
-    { symbol: "AIRL", name: "Themes Airlines ETF" },
-    { symbol: "AIRO", name: "AIRO Group Holdings, Inc. - Common Stock" },
-    { symbol: "AIRR", name: "First Trust RBA American Industrial Renaissance ETF" },
-    { symbol: "AIRS", name: "AirSculpt Technologies, Inc. - Common Stock" },
-    { symbol: "AIRT", name: "Air T, Inc. - Common Stock" },
-    { symbol: "AIRTP", name: "Air T, Inc. - Trust Preferred Securities" },
-    { symbol: "AISP", name: "Airship AI Holdings, Inc - Class A Common Stock" },
-    { symbol: "AISPW", name: "Airship AI Holdings, Inc - Warrants" },
-    { symbol: "AIXI", name: "XIAO-I Corporation - American Depositary Shares" },
-    { symbol: "AKAM", name: "Akamai Technologies, Inc. - Common Stock" },
-    { symbol: "AKAN", name: "Akanda Corp. - Common Shares" },
-    { symbol: "AKBA", name: "Akebia Therapeutics, Inc. - Common Stock" },
-    { symbol: "AKRO", name: "Akero Therapeutics, Inc. - Common Stock" },
-    { symbol: "AKTX", name: "Akari Therapeutics Plc - American Depositary Shares" },
-    { symbol: "ALAB", name: "Astera Labs, Inc. - Common Stock" },
-    { symbol: "ALAR", name: "Alarum Technologies Ltd. - American Depositary Shares" },
-    { symbol: "ALBT", name: "Avalon GloboCare Corp. - Common Stock" },
-    { symbol: "ALCO", name: "Alico, Inc. - Common Stock" },
-    { symbol: "ALCY", name: "Alchemy Investments Acquisition Corp 1 - Class A Ordinary Shares" },
-    { symbol: "ALCYU", name: "Alchemy Investments Acquisition Corp 1 - Units" },
-    { symbol: "ALCYW", name: "Alchemy Investments Acquisition Corp 1 - Warrants" },
-    { symbol: "ALDF", name: "Aldel Financial II Inc. - Class A Ordinary Shares" },
-    { symbol: "ALDFU", name: "Aldel Financial II Inc. - Units" },
-    { symbol: "ALDFW", name: "Aldel Financial II Inc. - Warrants" },
-    { symbol: "ALDX", name: "Aldeyra Therapeutics, Inc. - Common Stock" },
-    { symbol: "ALEC", name: "Alector, Inc. - Common Stock" },
-    { symbol: "ALF", name: "Centurion Acquisition Corp. - Class A Ordinary Shares" },
-    { symbol: "ALFUU", name: "Centurion Acquisition Corp. - Unit" },
-    { symbol: "ALFUW", name: "Centurion Acquisition Corp. - Warrant" },
-    { symbol: "ALGM", name: "Allegro MicroSystems, Inc. - Common Stock" },
-    { symbol: "ALGN", name: "Align Technology, Inc. - Common Stock" },
-    { symbol: "ALGS", name: "Aligos Therapeutics, Inc. - Common stock" },
-    { symbol: "ALGT", name: "Allegiant Travel Company - Common Stock" },
-    { symbol: "ALHC", name: "Alignment Healthcare, Inc. - Common Stock" },
-    { symbol: "ALIL", name: "Argent Focused Small Cap ETF" },
-    { symbol: "ALKS", name: "Alkermes plc - Ordinary Shares" },
-    { symbol: "ALKT", name: "Alkami Technology, Inc. - Common Stock" },
-    { symbol: "ALLO", name: "Allogene Therapeutics, Inc. - Common Stock" },
-    { symbol: "ALLR", name: "Allarity Therapeutics, Inc. - Common stock" },
-    { symbol: "ALLT", name: "Allot Ltd. - Ordinary Shares" },
-    { symbol: "ALLW", name: "SPDR Bridgewater All Weather ETF" },
-    { symbol: "ALM", name: "Almonty Industries Inc. - Common Shares" },
-    { symbol: "ALMS", name: "Alumis Inc. - Common Stock" },
-    { symbol: "ALMU", name: "Aeluma, Inc. - Common Stock" },
-    { symbol: "ALNT", name: "Allient Inc. - Common Stock" },
-    { symbol: "ALNY", name: "Alnylam Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "ALOT", name: "AstroNova, Inc. - Common Stock" },
-    { symbol: "ALRM", name: "Alarm.com Holdings, Inc. - Common Stock" },
-    { symbol: "ALRS", name: "Alerus Financial Corporation - Common Stock" },
-    { symbol: "ALT", name: "Altimmune, Inc. - Common Stock" },
-    { symbol: "ALTI", name: "AlTi Global, Inc. - Class A Common Stock" },
-    { symbol: "ALTO", name: "Alto Ingredients, Inc. - Common Stock" },
-    { symbol: "ALTS", name: "ALT5 Sigma Corporation - Common Stock" },
-    { symbol: "ALTY", name: "Global X Alternative Income ETF" },
-    { symbol: "ALVO", name: "Alvotech - Ordinary Shares" },
-    { symbol: "ALVOW", name: "Alvotech - Warrant" },
-    { symbol: "ALXO", name: "ALX Oncology Holdings Inc. - Common Stock" },
-    { symbol: "ALZN", name: "Alzamend Neuro, Inc. - Common Stock" },
-    { symbol: "AMAL", name: "Amalgamated Financial Corp. - Common Stock" },
-    { symbol: "AMAT", name: "Applied Materials, Inc. - Common Stock" },
-    { symbol: "AMBA", name: "Ambarella, Inc. - Ordinary Shares" },
-    { symbol: "AMBR", name: "Amber International Holding Limited - American Depositary Shares" },
-    { symbol: "AMCX", name: "AMC Networks Inc. - Class A Common Stock" },
-    { symbol: "AMD", name: "Advanced Micro Devices, Inc. - Common Stock" },
-    { symbol: "AMDD", name: "Direxion Daily AMD Bear 1X Shares" },
-    { symbol: "AMDG", name: "Leverage Shares 2X Long AMD Daily ETF" },
-    { symbol: "AMDL", name: "GraniteShares 2x Long AMD Daily ETF" },
-    { symbol: "AMDU", name: "Defiance Leveraged Long + Income AMD ETF" },
-    { symbol: "AMGN", name: "Amgen Inc. - Common Stock" },
-    { symbol: "AMID", name: "Argent Mid Cap ETF" },
-    { symbol: "AMIX", name: "Autonomix Medical, Inc. - Common Stock" },
-    { symbol: "AMKR", name: "Amkor Technology, Inc. - Common Stock" },
-    { symbol: "AMLX", name: "Amylyx Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "AMOD", name: "Alpha Modus Holdings, Inc. - Class A Common Stock" },
-    { symbol: "AMODW", name: "Alpha Modus Holdings, Inc. - Warrant" },
-    { symbol: "AMPG", name: "Amplitech Group, Inc. - Common Stock" },
-    { symbol: "AMPGW", name: "Amplitech Group, Inc. - Warrants" },
-    { symbol: "AMPH", name: "Amphastar Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "AMPL", name: "Amplitude, Inc. - Class A Common Stock" },
-    { symbol: "AMRK", name: "A-Mark Precious Metals, Inc. - Common Stock" },
-    { symbol: "AMRN", name: "Amarin Corporation plc - American Depositary Shares" },
-    { symbol: "AMRX", name: "Amneal Pharmaceuticals, Inc. - Class A Common Stock" },
-    { symbol: "AMSC", name: "American Superconductor Corporation - Common Stock" },
-    { symbol: "AMSF", name: "AMERISAFE, Inc. - Common Stock" },
-    { symbol: "AMST", name: "Amesite Inc. - Common Stock" },
-    { symbol: "AMTX", name: "Aemetis, Inc - Common Stock" },
-    { symbol: "AMUU", name: "Direxion Daily AMD Bull 2X Shares" },
-    { symbol: "AMWD", name: "American Woodmark Corporation - Common Stock" },
-    { symbol: "AMZD", name: "Direxion Daily AMZN Bear 1X Shares" },
-    { symbol: "AMZN", name: "Amazon.com, Inc. - Common Stock" },
-    { symbol: "AMZU", name: "Direxion Daily AMZN Bull 2X Shares" },
-    { symbol: "AMZZ", name: "GraniteShares 2x Long AMZN Daily ETF" },
-    { symbol: "ANAB", name: "AnaptysBio, Inc. - Common Stock" },
-    { symbol: "ANDE", name: "The Andersons, Inc. - Common Stock" },
-    { symbol: "ANEB", name: "Anebulo Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "ANEL", name: "Defiance Daily Target 2x Long ANET ETF" },
-    { symbol: "ANGH", name: "Anghami Inc. - Ordinary Shares" },
-    { symbol: "ANGHW", name: "Anghami Inc. - Warrants" },
-    { symbol: "ANGI", name: "Angi Inc. - Class A Common Stock" },
-    { symbol: "ANGL", name: "VanEck Fallen Angel High Yield Bond ETF" },
-    { symbol: "ANGO", name: "AngioDynamics, Inc. - Common Stock" },
-    { symbol: "ANIK", name: "Anika Therapeutics Inc. - Common Stock" },
-    { symbol: "ANIP", name: "ANI Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "ANIX", name: "Anixa Biosciences, Inc. - Common Stock" },
-    { symbol: "ANL", name: "Adlai Nortye Ltd. - American Depositary Shares" },
-    { symbol: "ANNA", name: "AleAnna, Inc. - Class A Common Stock" },
-    { symbol: "ANNAW", name: "AleAnna, Inc. - Warrant" },
-    { symbol: "ANNX", name: "Annexon, Inc. - common stock" },
-    { symbol: "ANPA", name: "Rich Sparkle Holdings Limited - Ordinary Shares" },
-    { symbol: "ANSC", name: "Agriculture & Natural Solutions Acquisition Corporation - Class A Ordinary Shares" },
-    { symbol: "ANSCU", name: "Agriculture & Natural Solutions Acquisition Corporation - Unit" },
-    { symbol: "ANSCW", name: "Agriculture & Natural Solutions Acquisition Corporation - Warrant" },
-    { symbol: "ANTA", name: "Antalpha Platform Holding Company - Class A Ordinary Shares" },
-    { symbol: "ANTE", name: "AirNet Technology Inc. - Ordinary Share" },
-    { symbol: "ANTX", name: "AN2 Therapeutics, Inc. - Common Stock" },
-    { symbol: "ANY", name: "Sphere 3D Corp. - Common Shares" },
-    { symbol: "AOHY", name: "Angel Oak High Yield Opportunities ETF" },
-    { symbol: "AOSL", name: "Alpha and Omega Semiconductor Limited - Common Shares" },
-    { symbol: "AOTG", name: "AOT Growth and Innovation ETF" },
-    { symbol: "AOUT", name: "American Outdoor Brands, Inc. - Common Stock" },
-    { symbol: "APA", name: "APA Corporation - Common Stock" },
-    { symbol: "APAD", name: "A Paradise Acquisition Corp. - Class A Ordinary Shares" },
-    { symbol: "APADR", name: "A Paradise Acquisition Corp. - Rights" },
-    { symbol: "APADU", name: "A Paradise Acquisition Corp. - Unit" },
-    { symbol: "APDN", name: "Applied DNA Sciences, Inc. - Common Stock" },
-    { symbol: "APED", name: "STKd 100% MSTR & 100% COIN ETF" },
-    { symbol: "APEI", name: "American Public Education, Inc. - Common Stock" },
-    { symbol: "APGE", name: "Apogee Therapeutics, Inc. - Common Stock" },
-    { symbol: "API", name: "Agora, Inc. - ADS" },
-    { symbol: "APLD", name: "Applied Digital Corporation - Common Stock" },
-    { symbol: "APLM", name: "Apollomics Inc. - Class A Ordinary Shares" },
-    { symbol: "APLMW", name: "Apollomics Inc. - Warrant" },
-    { symbol: "APLS", name: "Apellis Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "APLT", name: "Applied Therapeutics, Inc. - Common Stock" },
-    { symbol: "APM", name: "Aptorum Group Limited - Class A Ordinary Shares" },
-    { symbol: "APOG", name: "Apogee Enterprises, Inc. - Common Stock" },
-    { symbol: "APP", name: "Applovin Corporation - Class A Common Stock" },
-    { symbol: "APPF", name: "AppFolio, Inc. - Class A Common Stock" },
-    { symbol: "APPN", name: "Appian Corporation - Class A Common Stock" },
-    { symbol: "APPS", name: "Digital Turbine, Inc. - Common Stock" },
-    { symbol: "APPX", name: "Tradr 2X Long APP Daily ETF" },
-    { symbol: "APRE", name: "Aprea Therapeutics, Inc. - Common Stock" },
-    { symbol: "APVO", name: "Aptevo Therapeutics Inc. - Common Stock" },
-    { symbol: "APWC", name: "Asia Pacific Wire & Cable Corporation Limited  - Common shares, Par value .01 per share" },
-    { symbol: "APYX", name: "Apyx Medical Corporation - Common Stock" },
-    { symbol: "AQB", name: "AquaBounty Technologies, Inc. - Common Stock" },
-    { symbol: "AQMS", name: "Aqua Metals, Inc. - Common Stock" },
-    { symbol: "AQST", name: "Aquestive Therapeutics, Inc. - Common Stock" },
-    { symbol: "AQWA", name: "Global X Clean Water ETF" },
-    { symbol: "ARAI", name: "Arrive AI Inc. - Common Stock" },
-    { symbol: "ARAY", name: "Accuray Incorporated - Common Stock" },
-    { symbol: "ARBB", name: "ARB IOT Group Limited - Ordinary Shares" },
-    { symbol: "ARBE", name: "Arbe Robotics Ltd. - Ordinary Shares" },
-    { symbol: "ARBEW", name: "Arbe Robotics Ltd. - Warrant" },
-    { symbol: "ARBK", name: "Argo Blockchain plc - American Depositary Shares" },
-    { symbol: "ARBKL", name: "Argo Blockchain plc - 8.75% Senior Notes due 2026" },
-    { symbol: "ARCB", name: "ArcBest Corporation - Common Stock" },
-    { symbol: "ARCC", name: "Ares Capital Corporation - Closed End Fund" },
-    { symbol: "ARCT", name: "Arcturus Therapeutics Holdings Inc. - Common Stock" },
-    { symbol: "ARDX", name: "Ardelyx, Inc. - Common Stock" },
-    { symbol: "AREB", name: "American Rebel Holdings, Inc. - Common Stock" },
-    { symbol: "AREBW", name: "American Rebel Holdings, Inc. - warrants" },
-    { symbol: "AREC", name: "American Resources Corporation - Class A Common Stock" },
-    { symbol: "ARGX", name: "argenx SE - American Depositary Shares" },
-    { symbol: "ARHS", name: "Arhaus, Inc. - Class A Common Stock" },
-    { symbol: "ARKO", name: "ARKO Corp. - Common Stock" },
-    { symbol: "ARKOW", name: "ARKO Corp. - Warrant" },
-    { symbol: "ARKR", name: "Ark Restaurants Corp. - Common Stock" },
-    { symbol: "ARLP", name: "Alliance Resource Partners, L.P. - Common Units Representing Limited Partnership Interests" },
-    { symbol: "ARM", name: "Arm Holdings plc - American Depositary Shares" },
-    { symbol: "ARMG", name: "Leverage Shares 2X Long ARM Daily ETF" },
-    { symbol: "AROW", name: "Arrow Financial Corporation - Common Stock" },
-    { symbol: "ARQ", name: "Arq, Inc. - Common Stock" },
-    { symbol: "ARQQ", name: "Arqit Quantum Inc. - Ordinary Shares" },
-    { symbol: "ARQQW", name: "Arqit Quantum Inc. - Warrants" },
-    { symbol: "ARQT", name: "Arcutis Biotherapeutics, Inc. - Common stock" },
-    { symbol: "ARRY", name: "Array Technologies, Inc. - Common Stock" },
-    { symbol: "ARTL", name: "Artelo Biosciences, Inc. - Common Stock" },
-    { symbol: "ARTNA", name: "Artesian Resources Corporation - Class A Non-Voting Common Stock" },
-    { symbol: "ARTV", name: "Artiva Biotherapeutics, Inc. - Common Stock" },
-    { symbol: "ARTW", name: "Art's-Way Manufacturing Co., Inc. - Common Stock" },
-    { symbol: "ARVN", name: "Arvinas, Inc. - Common Stock" },
-    { symbol: "ARVR", name: "First Trust Indxx Metaverse ETF" },
-    { symbol: "ARWR", name: "Arrowhead Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "ASBP", name: "Aspire Biopharma Holdings, Inc.  - Common Stock" },
-    { symbol: "ASBPW", name: "Aspire Biopharma Holdings, Inc.  - Warrant" },
-    { symbol: "ASET", name: "FlexShares Real Assets Allocation Index Fund" },
-    { symbol: "ASLE", name: "AerSale Corporation - Common Stock" },
-    { symbol: "ASMB", name: "Assembly Biosciences, Inc. - Common Stock" },
-    { symbol: "ASMG", name: "Leverage Shares 2X Long ASML Daily ETF" },
-    { symbol: "ASML", name: "ASML Holding N.V. - New York Registry Shares" },
-    { symbol: "ASND", name: "Ascendis Pharma A/S - American Depositary Shares" },
-    { symbol: "ASNS", name: "Actelis Networks, Inc. - Common Stock" },
-    { symbol: "ASO", name: "Academy Sports and Outdoors, Inc. - Common Stock" },
-    { symbol: "ASPC", name: "A SPAC III Acquisition Corp. - Class A Ordinary Shares" },
-    { symbol: "ASPCR", name: "A SPAC III Acquisition Corp. - Right" },
-    { symbol: "ASPCU", name: "A SPAC III Acquisition Corp. - Unit" },
-    { symbol: "ASPI", name: "ASP Isotopes Inc. - Common Stock" },
-    { symbol: "ASPS", name: "Altisource Portfolio Solutions S.A. - Common Stock" },
-    { symbol: "ASPSW", name: "Altisource Portfolio Solutions S.A. - Net Settle Stakeholder Warrants" },
-    { symbol: "ASPSZ", name: "Altisource Portfolio Solutions S.A. - Cash Exercise Stakeholder Warrants" },
-    { symbol: "ASRT", name: "Assertio Holdings, Inc. - Common Stock" },
-    { symbol: "ASRV", name: "AmeriServ Financial Inc. - Common Stock" },
-    { symbol: "ASST", name: "Asset Entities Inc. - Class B Common Stock" },
-    { symbol: "ASTC", name: "Astrotech Corporation - Common Stock" },
-    { symbol: "ASTE", name: "Astec Industries, Inc. - Common Stock" },
-    { symbol: "ASTH", name: "Astrana Health Inc. - Common Stock" },
-    { symbol: "ASTI", name: "Ascent Solar Technologies, Inc - Common Stock" },
-    { symbol: "ASTL", name: "Algoma Steel Group Inc. - Common Shares" },
-    { symbol: "ASTLW", name: "Algoma Steel Group Inc. - Warrant" },
-    { symbol: "ASTS", name: "AST SpaceMobile, Inc. - Class A Common Stock" },
-    { symbol: "ASUR", name: "Asure Software Inc - Common Stock" },
-    { symbol: "ASYS", name: "Amtech Systems, Inc. - Common Stock" },
-    { symbol: "ATAI", name: "ATAI Life Sciences N.V. - Common Shares" },
-    { symbol: "ATAT", name: "Atour Lifestyle Holdings Limited - American Depositary Shares" },
-    { symbol: "ATEC", name: "Alphatec Holdings, Inc. - Common Stock" },
-    { symbol: "ATER", name: "Aterian, Inc. - Common Stock" },
-    { symbol: "ATEX", name: "Anterix Inc. - Common Stock" },
-    { symbol: "ATGL", name: "Alpha Technology Group Limited - Class A Ordinary Shares" },
-    { symbol: "ATHA", name: "Athira Pharma, Inc. - Common Stock" },
-    { symbol: "ATHE", name: "Alterity Therapeutics Limited - American Depositary Shares" },
-    { symbol: "ATHR", name: "Aether Holdings, Inc. - Common Stock" },
-    { symbol: "ATII", name: "Archimedes Tech SPAC Partners II Co. - Ordinary Shares" },
-    { symbol: "ATIIU", name: "Archimedes Tech SPAC Partners II Co. - Unit" },
-    { symbol: "ATIIW", name: "Archimedes Tech SPAC Partners II Co. - Warrant" },
-    { symbol: "ATLC", name: "Atlanticus Holdings Corporation - Common Stock" },
-    { symbol: "ATLCL", name: "Atlanticus Holdings Corporation - 6.125% Senior Notes due 2026" },
-    { symbol: "ATLCP", name: "Atlanticus Holdings Corporation - 7.625% Series B Cumulative Perpetual Preferred Stock, no par value per share" },
-    { symbol: "ATLCZ", name: "Atlanticus Holdings Corporation - 9.25% Senior Notes due 2029" },
-    { symbol: "ATLN", name: "Atlantic International Corp. - Common Stock" },
-    { symbol: "ATLO", name: "Ames National Corporation - Common Stock" },
-    { symbol: "ATLX", name: "Atlas Lithium Corporation - Common Stock" },
-    { symbol: "ATMC", name: "AlphaTime Acquisition Corp - Ordinary Shares" },
-    { symbol: "ATMCR", name: "AlphaTime Acquisition Corp - Right" },
-    { symbol: "ATMCU", name: "AlphaTime Acquisition Corp - Unit" },
-    { symbol: "ATMCW", name: "AlphaTime Acquisition Corp - Warrant" },
-    { symbol: "ATMV", name: "AlphaVest Acquisition Corp - Ordinary Shares" },
-    { symbol: "ATMVR", name: "AlphaVest Acquisition Corp - Right" },
-    { symbol: "ATMVU", name: "AlphaVest Acquisition Corp - Unit" },
-    { symbol: "ATNI", name: "ATN International, Inc. - Common Stock" },
-    { symbol: "ATOM", name: "Atomera Incorporated - Common Stock" },
-    { symbol: "ATON", name: "AlphaTON Capital Corp. - Common Stock" },
-    { symbol: "ATOS", name: "Atossa Therapeutics, Inc. - Common Stock" },
-    { symbol: "ATPC", name: "Agape ATP Corporation - Common Stock" },
-    { symbol: "ATRA", name: "Atara Biotherapeutics, Inc. - Common Stock" },
-    { symbol: "ATRC", name: "AtriCure, Inc. - Common Stock" },
-    { symbol: "ATRO", name: "Astronics Corporation - Common Stock" },
-    { symbol: "ATXG", name: "Addentax Group Corp. - Common Stock" },
-    { symbol: "ATXS", name: "Astria Therapeutics, Inc. - Common Stock" },
-    { symbol: "ATYR", name: "aTyr Pharma, Inc. - Common Stock" },
-    { symbol: "AUBN", name: "Auburn National Bancorporation, Inc. - Common Stock" },
-    { symbol: "AUDC", name: "AudioCodes Ltd. - Ordinary Shares" },
-    { symbol: "AUGO", name: "Aura Minerals Inc. - Common Shares" },
-    { symbol: "AUID", name: "authID Inc. - Common Stock" },
-    { symbol: "AUMI", name: "Themes Gold Miners ETF" },
-    { symbol: "AUPH", name: "Aurinia Pharmaceuticals Inc - Common Shares" },
-    { symbol: "AUR", name: "Aurora Innovation, Inc.  - Class A Common Stock" },
-    { symbol: "AURA", name: "Aura Biosciences, Inc. - Common Stock" },
-    { symbol: "AUROW", name: "Aurora Innovation, Inc.  - Warrant" },
-    { symbol: "AUTL", name: "Autolus Therapeutics plc - American Depositary Shares" },
-    { symbol: "AUUD", name: "Auddia Inc. - Common Stock" },
-    { symbol: "AUUDW", name: "Auddia Inc. - Warrants" },
-    { symbol: "AVAH", name: "Aveanna Healthcare Holdings Inc. - Common Stock" },
-    { symbol: "AVAV", name: "AeroVironment, Inc. - Common Stock" },
-    { symbol: "AVBH", name: "Avidbank Holdings, Inc. - Common Stock" },
-    { symbol: "AVBP", name: "ArriVent BioPharma, Inc. - Common Stock" },
-    { symbol: "AVDL", name: "Avadel Pharmaceuticals plc - Ordinary Share" },
-    { symbol: "AVDX", name: "AvidXchange Holdings, Inc. - Common Stock" },
-    { symbol: "AVGB", name: "Avantis Credit ETF" },
-    { symbol: "AVGG", name: "Leverage Shares 2X Long AVGO Daily ETF" },
-    { symbol: "AVGO", name: "Broadcom Inc. - Common Stock" },
-    { symbol: "AVGU", name: "GraniteShares 2x Long AVGO Daily ETF" },
-    { symbol: "AVGX", name: "Defiance Daily Target 2X Long AVGO ETF" },
-    { symbol: "AVIR", name: "Atea Pharmaceuticals, Inc. - common stock" },
-    { symbol: "AVL", name: "Direxion Daily AVGO Bull 2X Shares" },
-    { symbol: "AVNW", name: "Aviat Networks, Inc. - Common Stock" },
-    { symbol: "AVO", name: "Mission Produce, Inc. - Common Stock" },
-    { symbol: "AVPT", name: "AvePoint, Inc. - Class A Common Stock" },
-    { symbol: "AVR", name: "Anteris Technologies Global Corp. - Common Stock" },
-    { symbol: "AVS", name: "Direxion Daily AVGO Bear 1X Shares" },
-    { symbol: "AVT", name: "Avnet, Inc. - Common Stock" },
-    { symbol: "AVTX", name: "Avalo Therapeutics, Inc. - Common Stock" },
-    { symbol: "AVUQ", name: "Avantis U.S. Quality ETF" },
-    { symbol: "AVXC", name: "Avantis Emerging Markets ex-China Equity ETF" },
-    { symbol: "AVXL", name: "Anavex Life Sciences Corp. - Common Stock" },
-    { symbol: "AWRE", name: "Aware, Inc. - Common Stock" },
-    { symbol: "AXGN", name: "Axogen, Inc. - Common Stock" },
-    { symbol: "AXIN", name: "Axiom Intelligence Acquisition Corp 1 - Class A Ordinary Shares" },
-    { symbol: "AXINR", name: "Axiom Intelligence Acquisition Corp 1 - Right" },
-    { symbol: "AXINU", name: "Axiom Intelligence Acquisition Corp 1 - Units" },
-    { symbol: "AXON", name: "Axon Enterprise, Inc. - Common Stock" },
-    { symbol: "AXSM", name: "Axsome Therapeutics, Inc. - Common Stock" },
-    { symbol: "AXTI", name: "AXT Inc - Common Stock" },
-    { symbol: "AYTU", name: "Aytu BioPharma, Inc.  - Common Stock" },
-    { symbol: "AZ", name: "A2Z Cust2Mate Solutions Corp. - Common Shares" },
-    { symbol: "AZI", name: "Autozi Internet Technology (Global) Ltd. - Class A Ordinary Shares" },
-    { symbol: "AZN", name: "AstraZeneca PLC - American Depositary Shares" },
-    { symbol: "AZTA", name: "Azenta, Inc. - Common Stock" },
-    { symbol: "BABX", name: "GraniteShares 2x Long BABA Daily ETF" },
-    { symbol: "BACC", name: "Blue Acquisition Corp. - Class A Ordinary Shares" },
-    { symbol: "BACCR", name: "Blue Acquisition Corp. - Right" },
-    { symbol: "BACCU", name: "Blue Acquisition Corp. - Unit" },
-    { symbol: "BACQ", name: "Bleichroeder Acquisition Corp. I - Class A Ordinary Shares" },
-    { symbol: "BACQR", name: "Bleichroeder Acquisition Corp. I - Right" },
-    { symbol: "BACQU", name: "Bleichroeder Acquisition Corp. I - Unit" },
-    { symbol: "BAER", name: "Bridger Aerospace Group Holdings, Inc. - Common Stock" },
-    { symbol: "BAERW", name: "Bridger Aerospace Group Holdings, Inc. - Warrant" },
-    { symbol: "BAFE", name: "Brown Advisory Flexible Equity ETF" },
-    { symbol: "BAFN", name: "BayFirst Financial Corp. - Common Stock" },
-    { symbol: "BAIG", name: "Leverage Shares 2X Long BBAI Daily ETF" },
-    { symbol: "BAND", name: "Bandwidth Inc. - Class A Common Stock" },
-    { symbol: "BANF", name: "BancFirst Corporation - Common Stock" },
-    { symbol: "BANFP", name: "BancFirst Corporation - 7.2% Cumulative Trust Preferred Securities" },
-    { symbol: "BANL", name: "CBL International Limited - Ordinary Shares" },
-    { symbol: "BANR", name: "Banner Corporation - Common Stock" },
-    { symbol: "BANX", name: "ArrowMark Financial Corp. - Closed End Fund" },
-    { symbol: "BAOS", name: "Baosheng Media Group Holdings Limited - Ordinary shares" },
-    { symbol: "BASE", name: "Couchbase, Inc. - Common Stock" },
-    { symbol: "BASG", name: "Brown Advisory Sustainable Growth ETF" },
-    { symbol: "BASV", name: "Brown Advisory Sustainable Value ETF" },
-    { symbol: "BATRA", name: "Atlanta Braves Holdings, Inc. - Series A Common Stock" },
-    { symbol: "BATRK", name: "Atlanta Braves Holdings, Inc. - Series C Common Stock" },
-    { symbol: "BAYA", name: "Bayview Acquisition Corp - Ordinary Share" },
-    { symbol: "BAYAR", name: "Bayview Acquisition Corp - Right" },
-    { symbol: "BAYAU", name: "Bayview Acquisition Corp - Unit" },
-    { symbol: "BBB", name: "CYBER HORNET S&P 500 and Bitcoin 75/25 Strategy ETF" },
-    { symbol: "BBCP", name: "Concrete Pumping Holdings, Inc.  - Common Stock" },
-    { symbol: "BBGI", name: "Beasley Broadcast Group, Inc. - Class A Common Stock" },
-    { symbol: "BBH", name: "VanEck Biotech ETF" },
-    { symbol: "BBIO", name: "BridgeBio Pharma, Inc. - Common Stock" },
-    { symbol: "BBLG", name: "Bone Biologics Corp - Common Stock" },
-    { symbol: "BBLGW", name: "Bone Biologics Corp - warrants" },
-    { symbol: "BBNX", name: "Beta Bionics, Inc. - Common Stock" },
-    { symbol: "BBOT", name: "BridgeBio Oncology Therapeutics, Inc. - Common Stock" },
-    { symbol: "BBSI", name: "Barrett Business Services, Inc. - Common Stock" },
-    { symbol: "BCAB", name: "BioAtla, Inc. - Common Stock" },
-    { symbol: "BCAL", name: "California BanCorp - Common Stock" },
-    { symbol: "BCAR", name: "D. Boral ARC Acquisition I Corp. - Class A Ordinary Shares" },
-    { symbol: "BCARU", name: "D. Boral ARC Acquisition I Corp. - Units" },
-    { symbol: "BCARW", name: "D. Boral ARC Acquisition I Corp. - Warrant" },
-    { symbol: "BCAX", name: "Bicara Therapeutics Inc. - Common Stock" },
-    { symbol: "BCBP", name: "BCB Bancorp, Inc. (NJ) - Common Stock" },
-    { symbol: "BCDA", name: "BioCardia, Inc. - Common Stock" },
-    { symbol: "BCG", name: "Binah Capital Group, Inc. - Common Stock" },
-    { symbol: "BCGWW", name: "Binah Capital Group, Inc. - Warrants" },
-    { symbol: "BCIC", name: "BCP Investment Corporation - Closed End Fund" },
-    { symbol: "BCLO", name: "iShares BBB-B CLO Active ETF" },
-    { symbol: "BCML", name: "BayCom Corp - Common Stock" },
-    { symbol: "BCPC", name: "Balchem Corporation - Common Stock" },
-    { symbol: "BCRX", name: "BioCryst Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "BCTX", name: "BriaCell Therapeutics Corp. - Common Shares" },
-    { symbol: "BCTXW", name: "BriaCell Therapeutics Corp. - Warrant" },
-    { symbol: "BCTXZ", name: "BriaCell Therapeutics Corp. - Warrant" },
-    { symbol: "BCYC", name: "Bicycle Therapeutics plc - American Depositary Shares" },
-    { symbol: "BDGS", name: "Bridges Capital Tactical ETF" },
-    { symbol: "BDMD", name: "Baird Medical Investment Holdings Ltd - Ordinary Share" },
-    { symbol: "BDMDW", name: "Baird Medical Investment Holdings Ltd - Warrant" },
-    { symbol: "BDRX", name: "Biodexa Pharmaceuticals plc - American Depositary Shares" },
-    { symbol: "BDSX", name: "Biodesix, Inc. - Common Stock" },
-    { symbol: "BDTX", name: "Black Diamond Therapeutics, Inc. - Common Stock" },
-    { symbol: "BEAG", name: "Bold Eagle Acquisition Corp. - Class A Ordinary Shares" },
-    { symbol: "BEAGR", name: "Bold Eagle Acquisition Corp. - Right" },
-    { symbol: "BEAGU", name: "Bold Eagle Acquisition Corp. - Units" },
-    { symbol: "BEAM", name: "Beam Therapeutics Inc. - Common Stock" },
-    { symbol: "BEAT", name: "Heartbeam, Inc. - Common Stock" },
-    { symbol: "BEATW", name: "Heartbeam, Inc. - Warrant" },
-    { symbol: "BEEM", name: "Beam Global - Common Stock" },
-    { symbol: "BEEP", name: "Mobile Infrastructure Corporation - Common Stock" },
-    { symbol: "BEEX", name: "The Beehive ETF" },
-    { symbol: "BEEZ", name: "Honeytree U.S. Equity ETF" },
-    { symbol: "BELFA", name: "Bel Fuse Inc. - Class A Common Stock" },
-    { symbol: "BELFB", name: "Bel Fuse Inc. - Class B Common Stock" },
-    { symbol: "BELT", name: "iShares U.S. Select Equity Active ETF" },
-    { symbol: "BENF", name: "Beneficient - Class A Common Stock" },
-    { symbol: "BENFW", name: "Beneficient - Warrant" },
-    { symbol: "BETR", name: "Better Home & Finance Holding Company - Class A Common Stock" },
-    { symbol: "BETRW", name: "Better Home & Finance Holding Company - Warrant" },
-    { symbol: "BFC", name: "Bank First Corporation - Common Stock" },
-    { symbol: "BFIN", name: "BankFinancial Corporation - Common Stock" },
-    { symbol: "BFRG", name: "Bullfrog AI Holdings, Inc. - Common Stock" },
-    { symbol: "BFRGW", name: "Bullfrog AI Holdings, Inc. - Warrants" },
-    { symbol: "BFRI", name: "Biofrontera Inc. - Common Stock" },
-    { symbol: "BFRIW", name: "Biofrontera Inc. - Warrants" },
-    { symbol: "BFST", name: "Business First Bancshares, Inc. - Common Stock" },
-    { symbol: "BGC", name: "BGC Group, Inc. - Class A Common Stock" },
-    { symbol: "BGFV", name: "Big 5 Sporting Goods Corporation - Common Stock" },
-    { symbol: "BGL", name: "Blue Gold Limited - Class A ordinary shares" },
-    { symbol: "BGLC", name: "BioNexus Gene Lab Corp - Common stock" },
-    { symbol: "BGLWW", name: "Blue Gold Limited - Warrant" },
-    { symbol: "BGM", name: "BGM Group Ltd. - Class A Ordinary Shares" },
-    { symbol: "BGRN", name: "iShares USD Green Bond ETF" },
-    { symbol: "BGRO", name: "iShares Large Cap Growth Active ETF" },
-    { symbol: "BHAT", name: "Blue Hat Interactive Entertainment Technology - Ordinary Shares" },
-    { symbol: "BHF", name: "Brighthouse Financial, Inc. - Common Stock" },
-    { symbol: "BHFAL", name: "Brighthouse Financial, Inc. - Junior Subordinated Debentures due 2058" },
-    { symbol: "BHFAM", name: "Brighthouse Financial, Inc. - Depositary shares each representing a 1/1,000th Interest in a Share of 4.625% Non-Cumulative Preferred Stock, Series D" },
-    { symbol: "BHFAN", name: "Brighthouse Financial, Inc. - depositary shares, each representing a 1/1,000th interest in a share of 5.375% Non-Cumulative Preferred Stock, Series C" },
-    { symbol: "BHFAO", name: "Brighthouse Financial, Inc. - Depositary Shares, each representing a 1/1,000th interest in a share of 6.750% Non-Cumulative Preferred Stock, Series B" },
-    { symbol: "BHFAP", name: "Brighthouse Financial, Inc. - Depositary Shares 6.6% Non-Cumulative Preferred Stock, Series A" },
-    { symbol: "BHRB", name: "Burke & Herbert Financial Services Corp. - Common Stock" },
-    { symbol: "BHST", name: "BioHarvest Sciences Inc. - Common Stock" },
-    { symbol: "BIAF", name: "bioAffinity Technologies, Inc. - Common Stock" },
-    { symbol: "BIAFW", name: "bioAffinity Technologies, Inc. - Warrant" },
-    { symbol: "BIB", name: "ProShares Ultra Nasdaq Biotechnology" },
-    { symbol: "BIDU", name: "Baidu, Inc. - American Depositary Shares, each representing 8 ordinary share" },
-    { symbol: "BIIB", name: "Biogen Inc. - Common Stock" },
-    { symbol: "BILI", name: "Bilibili Inc. - American Depositary Shares" },
-    { symbol: "BINI", name: "Bollinger Innovations, Inc. - Common Stock" },
-    { symbol: "BIOA", name: "BioAge Labs, Inc. - Common Stock" },
-    { symbol: "BIOX", name: "Bioceres Crop Solutions Corp. - Ordinary Shares" },
-    { symbol: "BIRD", name: "Allbirds, Inc. - Class A Common Stock" },
-    { symbol: "BIS", name: "ProShares UltraShort Nasdaq Biotechnology" },
-    { symbol: "BITF", name: "Bitfarms Ltd. - Common Stock" },
-    { symbol: "BITS", name: "Global X Blockchain & Bitcoin Strategy ETF" },
-    { symbol: "BIVI", name: "BioVie Inc. - Common stock" },
-    { symbol: "BIVIW", name: "BioVie Inc. - Warrant" },
-    { symbol: "BIYA", name: "Baiya International Group Inc.  - Ordinary Shares" },
-    { symbol: "BJDX", name: "Bluejay Diagnostics, Inc. - Common Stock" },
-    { symbol: "BJK", name: "VanEck Gaming ETF" },
-    { symbol: "BJRI", name: "BJ's Restaurants, Inc. - Common Stock" },
-    { symbol: "BKCH", name: "Global X Blockchain ETF" },
-    { symbol: "BKHA", name: "Black Hawk Acquisition Corporation - Class A Ordinary Shares" },
-    { symbol: "BKHAR", name: "Black Hawk Acquisition Corporation - Rights" },
-    { symbol: "BKHAU", name: "Black Hawk Acquisition Corporation - Units" },
-    { symbol: "BKIV", name: "BNY Mellon Innovators ETF" },
-    { symbol: "BKNG", name: "Booking Holdings Inc. - Common Stock" },
-    { symbol: "BKR", name: "Baker Hughes Company - Common Stock" },
-    { symbol: "BKWO", name: "BNY Mellon Women's Opportunities ETF" },
-    { symbol: "BKYI", name: "BIO-key International, Inc. - Common Stock" },
-    { symbol: "BL", name: "BlackLine, Inc. - Common Stock" },
-    { symbol: "BLBD", name: "Blue Bird Corporation - Common Stock" },
-    { symbol: "BLBX", name: "Blackboxstocks Inc. - Common Stock" },
-    { symbol: "BLCN", name: "Siren Nasdaq NexGen Economy ETF" },
-    { symbol: "BLCR", name: "iShares Large Cap Core Active ETF" },
-    { symbol: "BLDP", name: "Ballard Power Systems, Inc. - Common Shares" },
-    { symbol: "BLFS", name: "BioLife Solutions, Inc. - Common Stock" },
-    { symbol: "BLFY", name: "Blue Foundry Bancorp - Common Stock" },
-    { symbol: "BLIN", name: "Bridgeline Digital, Inc. - Common Stock" },
-    { symbol: "BLIV", name: "BeLive Holdings - ordinary shares" },
-    { symbol: "BLKB", name: "Blackbaud, Inc. - Common Stock" },
-    { symbol: "BLMN", name: "Bloomin' Brands, Inc. - Common Stock" },
-    { symbol: "BLMZ", name: "Harrison Global Holdings Inc. - Ordinary Shares" },
-    { symbol: "BLNE", name: "Beeline Holdings, Inc. - Common Stock" },
-    { symbol: "BLNK", name: "Blink Charging Co. - Common Stock" },
-    { symbol: "BLRX", name: "BioLineRx Ltd. - American Depositary Shares" },
-    { symbol: "BLTE", name: "Belite Bio, Inc - American Depositary Shares" },
-    { symbol: "BLUW", name: "Blue Water Acquisition Corp. III - Class A Ordinary Shares" },
-    { symbol: "BLUWU", name: "Blue Water Acquisition Corp. III - Unit." },
-    { symbol: "BLUWW", name: "Blue Water Acquisition Corp. III - Warrant." },
-    { symbol: "BLZE", name: "Backblaze, Inc. - Common Stock" },
-    { symbol: "BMAX", name: "REX Bitcoin Corporate Treasury Convertible Bond ETF" },
-    { symbol: "BMBL", name: "Bumble Inc. - common stock" },
-    { symbol: "BMDL", name: "VictoryShares WestEnd Economic Cycle Bond ETF" },
-    { symbol: "BMEA", name: "Biomea Fusion, Inc. - Common Stock" },
-    { symbol: "BMGL", name: "Basel Medical Group Ltd - ordinary shares" },
-    { symbol: "BMHL", name: "Bluemount Holdings Limited - Class B Ordinary Shares" },
-    { symbol: "BMR", name: "Beamr Imaging Ltd. - Ordinary Share" },
-    { symbol: "BMRA", name: "Biomerica, Inc. - Common Stock" },
-    { symbol: "BMRC", name: "Bank of Marin Bancorp - Common Stock" },
-    { symbol: "BMRN", name: "BioMarin Pharmaceutical Inc. - Common Stock" },
-    { symbol: "BNAI", name: "Brand Engagement Network Inc. - Common Stock" },
-    { symbol: "BNAIW", name: "Brand Engagement Network Inc. - Warrant" },
-    { symbol: "BNC", name: "CEA Industries Inc. - Common Stock" },
-    { symbol: "BNCWW", name: "CEA Industries Inc. - Warrant" },
-    { symbol: "BND", name: "Vanguard Total Bond Market ETF" },
-    { symbol: "BNDW", name: "Vanguard Total World Bond ETF" },
-    { symbol: "BNDX", name: "Vanguard Total International Bond ETF" },
-    { symbol: "BNGO", name: "Bionano Genomics, Inc. - Common Stock" },
-    { symbol: "BNR", name: "Burning Rock Biotech Limited - American Depositary Shares" },
-    { symbol: "BNRG", name: "Brenmiller Energy Ltd - Ordinary Shares" },
-    { symbol: "BNTC", name: "Benitec Biopharma Inc. - Common Stock" },
-    { symbol: "BNTX", name: "BioNTech SE - American Depositary Shares" },
-    { symbol: "BNZI", name: "Banzai International, Inc. - Class A Common Stock" },
-    { symbol: "BNZIW", name: "Banzai International, Inc. - Warrant" },
-    { symbol: "BODI", name: "The Beachbody Company, Inc. - Class A Common Stock" },
-    { symbol: "BOED", name: "Direxion Daily BA Bear 1X Shares" },
-    { symbol: "BOEG", name: "Leverage Shares 2X Long BA Daily ETF" },
-    { symbol: "BOEU", name: "Direxion Daily BA Bull 2X Shares" },
-    { symbol: "BOF", name: "BranchOut Food Inc. - Common Stock" },
-    { symbol: "BOKF", name: "BOK Financial Corporation - Common Stock" },
-    { symbol: "BOLD", name: "Boundless Bio, Inc. - Common Stock" },
-    { symbol: "BOLT", name: "Bolt Biotherapeutics, Inc. - Common Stock" },
-    { symbol: "BON", name: "Bon Natural Life Limited - Class A Ordinary Shares" },
-    { symbol: "BOOM", name: "DMC Global Inc. - Common Stock" },
-    { symbol: "BOSC", name: "B.O.S. Better Online Solutions - Ordinary Shares" },
-    { symbol: "BOTJ", name: "Bank of the James Financial Group, Inc. - Common Stock" },
-    { symbol: "BOTT", name: "Themes Humanoid Robotics ETF" },
-    { symbol: "BOTZ", name: "Global X Robotics & Artificial Intelligence ETF" },
-    { symbol: "BOWN", name: "Bowen Acquisition Corp - Ordinary Shares" },
-    { symbol: "BOWNR", name: "Bowen Acquisition Corp - Rights" },
-    { symbol: "BOWNU", name: "Bowen Acquisition Corp - Unit" },
-    { symbol: "BOXL", name: "Boxlight Corporation - Class A Common Stock" },
-    { symbol: "BPOP", name: "Popular, Inc. - Common Stock" },
-    { symbol: "BPOPM", name: "Popular, Inc. - Popular Capital Trust II - 6.125% Cumulative Monthly Income Trust Preferred Securities" },
-    { symbol: "BPRN", name: "Princeton Bancorp, Inc. - Common Stock" },
-    { symbol: "BPYPM", name: "Brookfield Property Partners L.P. - 6.25% Class A Cumulative Redeemable Preferred Units, Series 1" },
-    { symbol: "BPYPN", name: "Brookfield Property Partners L.P. - 5.750% Class A Cumulative Redeemable Perpetual Preferred Units, Series 3" },
-    { symbol: "BPYPO", name: "Brookfield Property Partners L.P. - 6.375% Class A Cumulative Redeemable Perpetual Preferred Units, Series 2" },
-    { symbol: "BPYPP", name: "Brookfield Property Partners L.P. - 6.50% Class A Cumulative Redeemable Perpetual Preferred Units" },
-    { symbol: "BRAG", name: "Bragg Gaming Group Inc. - Common Shares" },
-    { symbol: "BREA", name: "Brera Holdings PLC - Class B Ordinary Shares" },
-    { symbol: "BRFH", name: "Barfresh Food Group Inc. - Common Stock" },
-    { symbol: "BRHY", name: "iShares High Yield Active ETF" },
-    { symbol: "BRID", name: "Bridgford Foods Corporation - Common Stock" },
-    { symbol: "BRKD", name: "Direxion Daily BRKB Bear 1X Shares" },
-    { symbol: "BRKR", name: "Bruker Corporation - Common Stock" },
-    { symbol: "BRKRP", name: "Bruker Corporation - 6.375% Mandatory Convertible Preferred Stock, Series A" },
-    { symbol: "BRKU", name: "Direxion Daily BRKB Bull 2X Shares" },
-    { symbol: "BRLS", name: "Borealis Foods Inc. - Class A Common Shares" },
-    { symbol: "BRLSW", name: "Borealis Foods Inc. - Warrant" },
-    { symbol: "BRLT", name: "Brilliant Earth Group, Inc. - Class A Common Stock" },
-    { symbol: "BRNS", name: "Barinthus Biotherapeutics plc - American Depositary Shares" },
-    { symbol: "BRNY", name: "Burney U.S. Factor Rotation ETF" },
-    { symbol: "BRR", name: "Columbus Circle Capital Corp I - Class A Ordinary Shares" },
-    { symbol: "BRRR", name: "Coinshares Bitcoin ETF" },
-    { symbol: "BRRWU", name: "Columbus Circle Capital Corp I - Units" },
-    { symbol: "BRRWW", name: "Columbus Circle Capital Corp I - Warrant." },
-    { symbol: "BRTR", name: "iShares Total Return Active ETF" },
-    { symbol: "BRTX", name: "BioRestorative Therapies, Inc. - Common Stock" },
-    { symbol: "BRY", name: "Berry Corporation (bry) - Common Stock" },
-    { symbol: "BRZE", name: "Braze, Inc. - Class A Common Stock" },
-    { symbol: "BSAA", name: "BEST SPAC I Acquisition Corp. - Class A Ordinary Shares" },
-    { symbol: "BSAAR", name: "BEST SPAC I Acquisition Corp. - Rights" },
-    { symbol: "BSAAU", name: "BEST SPAC I Acquisition Corp. - Unit" },
-    { symbol: "BSBK", name: "Bogota Financial Corp. - Common Stock" },
-    { symbol: "BSCP", name: "Invesco BulletShares 2025 Corporate Bond ETF" },
-    { symbol: "BSCQ", name: "Invesco BulletShares 2026 Corporate Bond ETF" },
-    { symbol: "BSCR", name: "Invesco BulletShares 2027 Corporate Bond ETF" },
-    { symbol: "BSCS", name: "Invesco BulletShares 2028 Corporate Bond ETF" },
-    { symbol: "BSCT", name: "Invesco BulletShares 2029 Corporate Bond ETF" },
-    { symbol: "BSCU", name: "Invesco BulletShares 2030 Corporate Bond ETF" },
-    { symbol: "BSCV", name: "Invesco BulletShares 2031 Corporate Bond ETF" },
-    { symbol: "BSCW", name: "Invesco BulletShares 2032 Corporate Bond ETF" },
-    { symbol: "BSCX", name: "Invesco BulletShares 2033 Corporate Bond ETF" },
-    { symbol: "BSCY", name: "Invesco BulletShares 2034 Corporate Bond ETF" },
-    { symbol: "BSCZ", name: "Invesco BulletShares 2035 Corporate Bond ETF" },
-    { symbol: "BSET", name: "Bassett Furniture Industries, Incorporated - Common Stock" },
-    { symbol: "BSGM", name: "BioSig Technologies, Inc. - Common Stock" },
-    { symbol: "BSJP", name: "Invesco BulletShares 2025 High Yield Corporate Bond ETF" },
-    { symbol: "BSJQ", name: "Invesco BulletShares 2026 High Yield Corporate Bond ETF" },
-    { symbol: "BSJR", name: "Invesco BulletShares 2027 High Yield Corporate Bond ETF" },
-    { symbol: "BSJS", name: "Invesco BulletShares 2028 High Yield Corporate Bond ETF" },
-    { symbol: "BSJT", name: "Invesco BulletShares 2029 High Yield Corporate Bond ETF" },
-    { symbol: "BSJU", name: "Invesco BulletShares 2030 High Yield Corporate Bond ETF" },
-    { symbol: "BSJV", name: "Invesco BulletShares 2031 High Yield Corporate Bond ETF" },
-    { symbol: "BSJW", name: "Invesco BulletShares 2032 High Yield Corporate Bond ETF" },
-    { symbol: "BSJX", name: "Invesco BulletShares 2033 High Yield Corporate Bond ETF" },
-    { symbol: "BSLK", name: "Bolt Projects Holdings, Inc. - Common Stock" },
-    { symbol: "BSLKW", name: "Bolt Projects Holdings, Inc. - Warrant" },
-    { symbol: "BSMP", name: "Invesco BulletShares 2025 Municipal Bond ETF" },
-    { symbol: "BSMQ", name: "Invesco BulletShares 2026 Municipal Bond ETF" },
-    { symbol: "BSMR", name: "Invesco BulletShares 2027 Municipal Bond ETF" },
-    { symbol: "BSMS", name: "Invesco BulletShares 2028 Municipal Bond ETF" },
-    { symbol: "BSMT", name: "Invesco BulletShares 2029 Municipal Bond ETF" },
-    { symbol: "BSMU", name: "Invesco BulletShares 2030 Municipal Bond ETF" },
-    { symbol: "BSMV", name: "Invesco BulletShares 2031 Municipal Bond ETF" },
-    { symbol: "BSMW", name: "Invesco BulletShares 2032 Municipal Bond ETF" },
-    { symbol: "BSMY", name: "Invesco BulletShares 2034 Municipal Bond ETF" },
-    { symbol: "BSRR", name: "Sierra Bancorp - Common Stock" },
-    { symbol: "BSSX", name: "Invesco BulletShares 2033 Municipal Bond ETF" },
-    { symbol: "BSVN", name: "Bank7 Corp. - Common stock" },
-    { symbol: "BSVO", name: "EA Bridgeway Omni Small-Cap Value ETF" },
-    { symbol: "BSY", name: "Bentley Systems, Incorporated - Class B Common Stock" },
-    { symbol: "BTAI", name: "BioXcel Therapeutics, Inc. - Common Stock" },
-    { symbol: "BTBD", name: "BT Brands, Inc. - Common Stock" },
-    { symbol: "BTBDW", name: "BT Brands, Inc. - Warrant" },
-    { symbol: "BTBT", name: "Bit Digital, Inc. - Ordinary Share" },
-    { symbol: "BTCS", name: "BTCS Inc. - Common Stock" },
-    { symbol: "BTCT", name: "BTC Digital Ltd. - Ordinary Shares" },
-    { symbol: "BTDR", name: "Bitdeer Technologies Group - Ordinary Shares" },
-    { symbol: "BTF", name: "CoinShares Bitcoin and Ether ETF" },
-    { symbol: "BTFX", name: "CoinShares Bitcoin Leverage ETF" },
-    { symbol: "BTGD", name: "STKd 100% Bitcoin & 100% Gold ETF" },
-    { symbol: "BTM", name: "Bitcoin Depot Inc. - Class A Common Stock" },
-    { symbol: "BTMD", name: "Biote Corp. - Class A common stock" },
-    { symbol: "BTMWW", name: "Bitcoin Depot Inc. - Warrant" },
-    { symbol: "BTOC", name: "Armlogi Holding Corp. - common stock" },
-    { symbol: "BTOG", name: "Bit Origin Limited - Class A Ordinary Shares" },
-    { symbol: "BTSG", name: "BrightSpring Health Services, Inc. - Common Stock" },
-    { symbol: "BTSGU", name: "BrightSpring Health Services, Inc. - Tangible Equity Unit" },
-    { symbol: "BUFC", name: "AB Conservative Buffer ETF" },
-    { symbol: "BUFI", name: "AB International Buffer ETF" },
-    { symbol: "BUFM", name: "AB Moderate Buffer ETF" },
-    { symbol: "BUG", name: "Global X Cybersecurity ETF" },
-    { symbol: "BULD", name: "Pacer BlueStar Engineering the Future ETF" },
-    { symbol: "BULG", name: "Leverage Shares 2X Long BULL Daily ETF" },
-    { symbol: "BULL", name: "Webull Corporation - Class A Ordinary Shares" },
-    { symbol: "BULLW", name: "Webull Corporation - Warrants" },
-    { symbol: "BULX", name: "GraniteShares 2x Long BULL Daily ETF" },
-    { symbol: "BUSE", name: "First Busey Corporation - Common Stock" },
-    { symbol: "BUSEP", name: "First Busey Corporation - Depositary Shares, Each Representing a 1/40th Interest in a Share of 8.25% Fixed-Rate Series B Non-Cumulative Perpetual Preferred Stock, $0.001 par value" },
-    { symbol: "BUUU", name: "BUUU Group Limited - Class A Ordinary Share" },
-    { symbol: "BVFL", name: "BV Financial, Inc. - Common Stock" },
-    { symbol: "BVS", name: "Bioventus Inc. - Class A Common Stock" },
-    { symbol: "BWAY", name: "BrainsWay Ltd. - American Depositary Shares" },
-    { symbol: "BWB", name: "Bridgewater Bancshares, Inc. - Common Stock" },
-    { symbol: "BWBBP", name: "Bridgewater Bancshares, Inc. - Depositary Shares, Each Representing a 1/100th Interest in a Share of 5.875% Non-Cumulative Perpetual Preferred Stock, Series A" },
-    { symbol: "BWEN", name: "Broadwind, Inc. - Common Stock" },
-    { symbol: "BWFG", name: "Bankwell Financial Group, Inc. - Common Stock" },
-    { symbol: "BWIN", name: "The Baldwin Insurance Group, Inc. - Class A Common Stock" },
-    { symbol: "BWMN", name: "Bowman Consulting Group Ltd. - Common Stock" },
-    { symbol: "BYFC", name: "Broadway Financial Corporation - Class A Common Stock" },
-    { symbol: "BYND", name: "Beyond Meat, Inc. - Common stock" },
-    { symbol: "BYRN", name: "Byrna Technologies, Inc. - Common Stock" },
-    { symbol: "BYSI", name: "BeyondSpring, Inc. - Ordinary Shares" },
-    { symbol: "BZ", name: "KANZHUN LIMITED - American Depository Shares" },
-    { symbol: "BZAI", name: "Blaize Holdings, Inc. - Common Stock" },
-    { symbol: "BZAIW", name: "Blaize Holdings, Inc. - Warrant" },
-    { symbol: "BZFD", name: "BuzzFeed, Inc. - Class A Common Stock" },
-    { symbol: "BZFDW", name: "BuzzFeed, Inc. - Warrant" },
-    { symbol: "BZUN", name: "Baozun Inc. - American Depositary Shares" },
-    { symbol: "CA", name: "Xtrackers California Municipal Bonds ETF" },
-    { symbol: "CAAS", name: "China Automotive Systems, Inc. - Common Stock" },
-    { symbol: "CABA", name: "Cabaletta Bio, Inc. - Common Stock" },
-    { symbol: "CAC", name: "Camden National Corporation - Common Stock" },
-    { symbol: "CACC", name: "Credit Acceptance Corporation - Common Stock" },
-    { symbol: "CADL", name: "Candel Therapeutics, Inc. - Common Stock" },
-    { symbol: "CAEP", name: "Cantor Equity Partners III, Inc. - Class A Ordinary Shares" },
-    { symbol: "CAFG", name: "Pacer US Small Cap Cash Cows Growth Leaders ETF" },
-    { symbol: "CAI", name: "Caris Life Sciences, Inc. - Common Stock" },
-    { symbol: "CAKE", name: "The Cheesecake Factory Incorporated - Common Stock" },
-    { symbol: "CALC", name: "CalciMedica, Inc. - Common Stock" },
-    { symbol: "CALI", name: "iShares Short-Term California Muni Active ETF" },
-    { symbol: "CALM", name: "Cal-Maine Foods, Inc. - Common Stock" },
-    { symbol: "CAMP", name: "CAMP4 Therapeutics Corporation - Common Stock" },
-    { symbol: "CAMT", name: "Camtek Ltd. - Ordinary Shares" },
-    { symbol: "CAN", name: "Canaan Inc. - American Depositary Shares" },
-    { symbol: "CANC", name: "Tema Oncology ETF" },
-    { symbol: "CANQ", name: "Calamos Nasdaq Equity & Income ETF" },
-    { symbol: "CAPN", name: "Cayson Acquisition Corp - Ordinary Shares" },
-    { symbol: "CAPNR", name: "Cayson Acquisition Corp - Right" },
-    { symbol: "CAPNU", name: "Cayson Acquisition Corp - Units" },
-    { symbol: "CAPR", name: "Capricor Therapeutics, Inc. - Common Stock" },
-    { symbol: "CAPS", name: "Capstone Holding Corp. - Common Stock" },
-    { symbol: "CAPT", name: "Captivision Inc. - Ordinary Shares" },
-    { symbol: "CAPTW", name: "Captivision Inc. - Warrant" },
-    { symbol: "CAR", name: "Avis Budget Group, Inc. - Common Stock" },
-    { symbol: "CARE", name: "Carter Bankshares, Inc. - Common Stock" },
-    { symbol: "CARG", name: "CarGurus, Inc. - Class A Common Stock" },
-    { symbol: "CARL", name: "Carlsmed, Inc. - Common Stock" },
-    { symbol: "CARM", name: "Carisma Therapeutics, Inc. - Common Stock" },
-    { symbol: "CART", name: "Maplebear Inc. - Common Stock" },
-    { symbol: "CARV", name: "Carver Bancorp, Inc. - Common Stock" },
-    { symbol: "CARY", name: "Angel Oak Income ETF" },
-    { symbol: "CARZ", name: "First Trust S-Network Future Vehicles & Technology ETF" },
-    { symbol: "CASH", name: "Pathward Financial, Inc. - Common Stock" },
-    { symbol: "CASI", name: "CASI Pharmaceuticals, Inc. - Ordinary Shares" },
-    { symbol: "CASK", name: "Heritage Distilling Holding Company, Inc. - Common Stock" },
-    { symbol: "CASS", name: "Cass Information Systems, Inc - Common Stock" },
-    { symbol: "CASY", name: "Caseys General Stores, Inc. - Common Stock" },
-    { symbol: "CATH", name: "Global X S&P 500 Catholic Values ETF" },
-    { symbol: "CATY", name: "Cathay General Bancorp - Common Stock" },
-    { symbol: "CBAT", name: "CBAK Energy Technology, Inc. - Common Stock" },
-    { symbol: "CBFV", name: "CB Financial Services, Inc. - Common Stock" },
-    { symbol: "CBIO", name: "Crescent Biopharma, Inc. - Common Stock" },
-    { symbol: "CBLL", name: "CeriBell, Inc. - Common Stock" },
-    { symbol: "CBNK", name: "Capital Bancorp, Inc. - Common Stock" },
-    { symbol: "CBRL", name: "Cracker Barrel Old Country Store, Inc. - Common Stock" },
-    { symbol: "CBSH", name: "Commerce Bancshares, Inc. - Common Stock" },
-    { symbol: "CBUS", name: "Cibus, Inc. - Class A Common Stock" },
-    { symbol: "CCAP", name: "Crescent Capital BDC, Inc. - Common Stock" },
-    { symbol: "CCB", name: "Coastal Financial Corporation - Common Stock" },
-    { symbol: "CCBG", name: "Capital City Bank Group - Common Stock" },
-    { symbol: "CCCC", name: "C4 Therapeutics, Inc. - Common Stock" },
-    { symbol: "CCCS", name: "CCC Intelligent Solutions Holdings Inc. - Common Stock" },
-    { symbol: "CCCX", name: "Churchill Capital Corp X - Class A Ordinary Shares" },
-    { symbol: "CCCXU", name: "Churchill Capital Corp X - Unit" },
-    { symbol: "CCCXW", name: "Churchill Capital Corp X - Warrants" },
-    { symbol: "CCD", name: "Calamos Dynamic Convertible & Income Fund - Closed End Fund" },
-    { symbol: "CCEC", name: "Capital Clean Energy Carriers Corp. - Common Share" },
-    { symbol: "CCEP", name: "Coca-Cola Europacific Partners plc - Ordinary Shares" },
-    { symbol: "CCFE", name: "Concourse Capital Focused Equity ETF" },
-    { symbol: "CCG", name: "Cheche Group Inc. - Class A Ordinary Shares" },
-    { symbol: "CCGWW", name: "Cheche Group Inc. - Warrant" },
-    { symbol: "CCII", name: "Cohen Circle Acquisition Corp. II - Class A Ordinary Shares" },
-    { symbol: "CCIIU", name: "Cohen Circle Acquisition Corp. II - Unit" },
-    { symbol: "CCIIW", name: "Cohen Circle Acquisition Corp. II - Warrant" },
-    { symbol: "CCIX", name: "Churchill Capital Corp IX - Ordinary Shares" },
-    { symbol: "CCIXU", name: "Churchill Capital Corp IX - Unit" },
-    { symbol: "CCIXW", name: "Churchill Capital Corp IX - Warrant" },
-    { symbol: "CCLD", name: "CareCloud, Inc. - Common Stock" },
-    { symbol: "CCLDO", name: "CareCloud, Inc. - 8.75% Series B Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "CCNE", name: "CNB Financial Corporation - Common Stock" },
-    { symbol: "CCNEP", name: "CNB Financial Corporation - Depositary shares, each representing a 1/40th ownership interest in a share of 7.125% Series A Fixed- Rate Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "CCNR", name: "ALPS/CoreCommodity Natural Resources ETF" },
-    { symbol: "CCOI", name: "Cogent Communications Holdings, Inc. - Common Stock" },
-    { symbol: "CCRN", name: "Cross Country Healthcare, Inc. - Common Stock" },
-    { symbol: "CCSB", name: "Carbon Collective Short Duration Green Bond ETF" },
-    { symbol: "CCSI", name: "Consensus Cloud Solutions, Inc. - Common Stock" },
-    { symbol: "CCSO", name: "Carbon Collective Climate Solutions U.S. Equity ETF" },
-    { symbol: "CCTG", name: "CCSC Technology International Holdings Limited - Class A Ordinary Shares" },
-    { symbol: "CDC", name: "VictoryShares US EQ Income Enhanced Volatility Wtd ETF" },
-    { symbol: "CDIO", name: "Cardio Diagnostics Holdings Inc. - Common stock" },
-    { symbol: "CDIOW", name: "Cardio Diagnostics Holdings Inc. - Warrant" },
-    { symbol: "CDL", name: "VictoryShares US Large Cap High Div Volatility Wtd ETF" },
-    { symbol: "CDLX", name: "Cardlytics, Inc. - Common Stock" },
-    { symbol: "CDNA", name: "CareDx, Inc. - Common Stock" },
-    { symbol: "CDNS", name: "Cadence Design Systems, Inc. - Common Stock" },
-    { symbol: "CDRO", name: "Codere Online Luxembourg, S.A. - Ordinary Shares" },
-    { symbol: "CDROW", name: "Codere Online Luxembourg, S.A. - Warrants" },
-    { symbol: "CDT", name: "CDT Equity Inc. - Common Stock" },
-    { symbol: "CDTG", name: "CDT Environmental Technology Investment Holdings Limited - ordinary shares" },
-    { symbol: "CDTTW", name: "CDT Equity Inc. - Warrant" },
-    { symbol: "CDTX", name: "Cidara Therapeutics, Inc. - Common Stock" },
-    { symbol: "CDW", name: "CDW Corporation - Common Stock" },
-    { symbol: "CDXS", name: "Codexis, Inc. - Common Stock" },
-    { symbol: "CDZI", name: "Cadiz, Inc. - Common Stock" },
-    { symbol: "CDZIP", name: "Cadiz, Inc. - Depositary Shares" },
-    { symbol: "CECO", name: "CECO Environmental Corp. - Common Stock" },
-    { symbol: "CEFA", name: "Global X S&P Catholic Values Developed ex-U.S. ETF" },
-    { symbol: "CEG", name: "Constellation Energy Corporation - Common Stock" },
-    { symbol: "CELC", name: "Celcuity Inc. - Common Stock" },
-    { symbol: "CELH", name: "Celsius Holdings, Inc. - Common Stock" },
-    { symbol: "CELU", name: "Celularity Inc. - Class A Common Stock" },
-    { symbol: "CELUW", name: "Celularity Inc. - Warrant" },
-    { symbol: "CELZ", name: "Creative Medical Technology Holdings, Inc. - Common Stock" },
-    { symbol: "CENN", name: "Cenntro Inc. - Common Stock" },
-    { symbol: "CENT", name: "Central Garden & Pet Company - Common Stock" },
-    { symbol: "CENTA", name: "Central Garden & Pet Company - Class A Common Stock Nonvoting" },
-    { symbol: "CENX", name: "Century Aluminum Company - Common Stock" },
-    { symbol: "CEP", name: "Cantor Equity Partners, Inc. - Class A ordinary shares" },
-    { symbol: "CEPF", name: "Cantor Equity Partners IV, Inc. - Class A Ordinary Shares" },
-    { symbol: "CEPI", name: "REX Crypto Equity Premium Income ETF" },
-    { symbol: "CEPO", name: "Cantor Equity Partners I, Inc. - Class A Ordinary Shares" },
-    { symbol: "CEPT", name: "Cantor Equity Partners II, Inc. - Class A ordinary share" },
-    { symbol: "CERO", name: "CERo Therapeutics Holdings, Inc. - Common Stock" },
-    { symbol: "CEROW", name: "CERo Therapeutics Holdings, Inc. - Warrants" },
-    { symbol: "CERS", name: "Cerus Corporation - Common Stock" },
-    { symbol: "CERT", name: "Certara, Inc. - Common Stock" },
-    { symbol: "CETX", name: "Cemtrex Inc. - Common Stock" },
-    { symbol: "CETY", name: "Clean Energy Technologies, Inc. - Common Stock" },
-    { symbol: "CEVA", name: "CEVA, Inc. - Common Stock" },
-    { symbol: "CFA", name: "VictoryShares US 500 Volatility Wtd ETF" },
-    { symbol: "CFBK", name: "CF Bankshares Inc. - Common Stock" },
-    { symbol: "CFFI", name: "C&F Financial Corporation - Common Stock" },
-    { symbol: "CFFN", name: "Capitol Federal Financial, Inc. - Common Stock" },
-    { symbol: "CFLT", name: "Confluent, Inc. - Class A Common Stock" },
-    { symbol: "CFO", name: "VictoryShares US 500 Enhanced Volatility Wtd ETF" },
-    { symbol: "CFSB", name: "CFSB Bancorp, Inc. - Common Stock" },
-    { symbol: "CG", name: "The Carlyle Group Inc. - Common Stock" },
-    { symbol: "CGABL", name: "The Carlyle Group Inc. - 4.625% Subordinated Notes due 2061" },
-    { symbol: "CGBD", name: "Carlyle Secured Lending, Inc. - Closed End Fund" },
-    { symbol: "CGBDL", name: "Carlyle Secured Lending, Inc. - 8.20% Notes due 2028" },
-    { symbol: "CGC", name: "Canopy Growth Corporation - Common Shares" },
-    { symbol: "CGCT", name: "Cartesian Growth Corporation III - Class A Ordinary Shares" },
-    { symbol: "CGCTU", name: "Cartesian Growth Corporation III - unit" },
-    { symbol: "CGCTW", name: "Cartesian Growth Corporation III - Warrant" },
-    { symbol: "CGEM", name: "Cullinan Therapeutics, Inc. - Common Stock" },
-    { symbol: "CGEN", name: "Compugen Ltd. - Ordinary Shares" },
-    { symbol: "CGNT", name: "Cognyte Software Ltd. - Ordinary Shares" },
-    { symbol: "CGNX", name: "Cognex Corporation - Common Stock" },
-    { symbol: "CGO", name: "Calamos Global Total Return Fund - Closed End Fund" },
-    { symbol: "CGON", name: "CG Oncology, Inc. - Common stock" },
-    { symbol: "CGTL", name: "Creative Global Technology Holdings Limited - Class A Ordinary Shares" },
-    { symbol: "CGTX", name: "Cognition Therapeutics, Inc. - Common Stock" },
-    { symbol: "CHA", name: "Chagee Holdings Limited - American Depositary Shares, each representing 1 Class A ordinary share" },
-    { symbol: "CHAC", name: "Crane Harbor Acquisition Corp. - Class A Ordinary Shares" },
-    { symbol: "CHACR", name: "Crane Harbor Acquisition Corp. - Rights" },
-    { symbol: "CHACU", name: "Crane Harbor Acquisition Corp. - Units" },
-    { symbol: "CHAR", name: "Charlton Aria Acquisition Corporation - Class A Ordinary Shares" },
-    { symbol: "CHARR", name: "Charlton Aria Acquisition Corporation - Rights" },
-    { symbol: "CHARU", name: "Charlton Aria Acquisition Corporation - Units" },
-    { symbol: "CHCI", name: "Comstock Holding Companies, Inc. - Class A Common Stock" },
-    { symbol: "CHCO", name: "City Holding Company - Common Stock" },
-    { symbol: "CHDN", name: "Churchill Downs, Incorporated - Common Stock" },
-    { symbol: "CHEF", name: "The Chefs' Warehouse, Inc. - Common Stock" },
-    { symbol: "CHEK", name: "Check-Cap Ltd. - Ordinary Share" },
-    { symbol: "CHGX", name: "Stance Sustainable Beta ETF" },
-    { symbol: "CHI", name: "Calamos Convertible Opportunities and Income Fund - Closed End Fund" },
-    { symbol: "CHKP", name: "Check Point Software Technologies Ltd. - Ordinary Shares" },
-    { symbol: "CHMG", name: "Chemung Financial Corp  - Common Stock" },
-    { symbol: "CHNR", name: "China Natural Resources, Inc. - Common Shares" },
-    { symbol: "CHPG", name: "ChampionsGate Acquisition Corporation - Class A Ordinary Share" },
-    { symbol: "CHPGR", name: "ChampionsGate Acquisition Corporation - Rights" },
-    { symbol: "CHPGU", name: "ChampionsGate Acquisition Corporation - Unit" },
-    { symbol: "CHPS", name: "Xtrackers Semiconductor Select Equity ETF" },
-    { symbol: "CHR", name: "Cheer Holding, Inc.  - Class A Ordinary Share" },
-    { symbol: "CHRD", name: "Chord Energy Corporation - Common Stock" },
-    { symbol: "CHRS", name: "Coherus Oncology, Inc. - Common Stock" },
-    { symbol: "CHRW", name: "C.H. Robinson Worldwide, Inc. - Common Stock" },
-    { symbol: "CHSCL", name: "CHS Inc - Class B Cumulative Redeemable Preferred Stock, Series 4" },
-    { symbol: "CHSCM", name: "CHS Inc - Class B Reset Rate Cumulative Redeemable Preferred Stock, Series 3" },
-    { symbol: "CHSCN", name: "CHS Inc - Preferred Class B Series 2 Reset Rate" },
-    { symbol: "CHSCO", name: "CHS Inc - Class B Cumulative Redeemable Preferred Stock" },
-    { symbol: "CHSCP", name: "CHS Inc - 8%  Cumulative Redeemable Preferred Stock" },
-    { symbol: "CHSN", name: "Chanson International Holding - Class A Ordinary Shares" },
-    { symbol: "CHTR", name: "Charter Communications, Inc. - Class A Common Stock" },
-    { symbol: "CHW", name: "Calamos Global Dynamic Income Fund - Closed End Fund" },
-    { symbol: "CHY", name: "Calamos Convertible and High Income Fund - Closed End Fund" },
-    { symbol: "CHYM", name: "Chime Financial, Inc. - Class A Common Stock" },
-    { symbol: "CIBR", name: "First Trust NASDAQ Cybersecurity ETF" },
-    { symbol: "CIFR", name: "Cipher Mining Inc. - Common Stock" },
-    { symbol: "CIFRW", name: "Cipher Mining Inc. - Warrant" },
-    { symbol: "CIGI", name: "Colliers International Group Inc.  - Subordinate Voting Shares" },
-    { symbol: "CIGL", name: "Concorde International Group Ltd - Class A Ordinary Shares" },
-    { symbol: "CIIT", name: "Tianci International, Inc. - Common Stock" },
-    { symbol: "CIL", name: "VictoryShares International Volatility Wtd ETF" },
-    { symbol: "CINF", name: "Cincinnati Financial Corporation - Common Stock" },
-    { symbol: "CING", name: "Cingulate Inc. - Common Stock" },
-    { symbol: "CINGW", name: "Cingulate Inc. - Warrants" },
-    { symbol: "CISO", name: "CISO Global, Inc. - Common Stock" },
-    { symbol: "CISS", name: "C3is Inc. - Common Stock" },
-    { symbol: "CIVB", name: "Civista Bancshares, Inc.  - Common Stock" },
-    { symbol: "CJET", name: "Chijet Motor Company, Inc. - Ordinary Shares" },
-    { symbol: "CJMB", name: "Callan JMB Inc. - Common Stock" },
-    { symbol: "CLAR", name: "Clarus Corporation - Common Stock" },
-    { symbol: "CLBK", name: "Columbia Financial, Inc. - Common Stock" },
-    { symbol: "CLBT", name: "Cellebrite DI Ltd. - Ordinary Shares" },
-    { symbol: "CLDX", name: "Celldex Therapeutics, Inc. - Common Stock" },
-    { symbol: "CLFD", name: "Clearfield, Inc. - Common Stock" },
-    { symbol: "CLGN", name: "CollPlant Biotechnologies Ltd. - Ordinary Shares" },
-    { symbol: "CLIK", name: "Click Holdings Limited - Ordinary Share" },
-    { symbol: "CLIR", name: "ClearSign Technologies Corporation - Common Stock" },
-    { symbol: "CLLS", name: "Cellectis S.A. - American Depositary Shares" },
-    { symbol: "CLMB", name: "Climb Global Solutions, Inc. - Common Stock" },
-    { symbol: "CLMT", name: "Calumet, Inc - Common Stock" },
-    { symbol: "CLNE", name: "Clean Energy Fuels Corp. - Common Stock" },
-    { symbol: "CLNN", name: "Clene Inc. - Common Stock" },
-    { symbol: "CLNNW", name: "Clene Inc. - Warrant" },
-    { symbol: "CLOA", name: "iShares AAA CLO Active ETF" },
-    { symbol: "CLOD", name: "Themes Cloud Computing ETF" },
-    { symbol: "CLOU", name: "Global X Cloud Computing ETF" },
-    { symbol: "CLOV", name: "Clover Health Investments, Corp.  - Class A Common stock" },
-    { symbol: "CLPS", name: "CLPS Incorporation - Common Stock" },
-    { symbol: "CLPT", name: "ClearPoint Neuro Inc. - Common Stock" },
-    { symbol: "CLRB", name: "Cellectar Biosciences, Inc. - Common Stock" },
-    { symbol: "CLRO", name: "ClearOne, Inc. - Common Stock" },
-    { symbol: "CLSD", name: "Clearside Biomedical, Inc. - Common Stock" },
-    { symbol: "CLSK", name: "CleanSpark, Inc. - Common Stock" },
-    { symbol: "CLSKW", name: "CleanSpark, Inc. - Warrant" },
-    { symbol: "CLSM", name: "ETC Cabana Target Leading Sector Moderate ETF" },
-    { symbol: "CLST", name: "Catalyst Bancorp, Inc. - common stock" },
-    { symbol: "CLWT", name: "Euro Tech Holdings Company Limited - Ordinary Shares" },
-    { symbol: "CLYM", name: "Climb Bio, Inc. - Common Stock" },
-    { symbol: "CMBM", name: "Cambium Networks Corporation - Ordinary Shares" },
-    { symbol: "CMCO", name: "Columbus McKinnon Corporation - Common Stock" },
-    { symbol: "CMCSA", name: "Comcast Corporation - Class A Common Stock" },
-    { symbol: "CMCT", name: "Creative Media  - Common Stock" },
-    { symbol: "CME", name: "CME Group Inc. - Class A Common Stock" },
-    { symbol: "CMMB", name: "Chemomab Therapeutics Ltd.  - American Depositary Shares" },
-    { symbol: "CMND", name: "Clearmind Medicine Inc. - Common Shares" },
-    { symbol: "CMPO", name: "CompoSecure, Inc.  - Class A Common Stock" },
-    { symbol: "CMPOW", name: "CompoSecure, Inc.  - Warrant" },
-    { symbol: "CMPR", name: "Cimpress plc - Ordinary Shares" },
-    { symbol: "CMPS", name: "COMPASS Pathways Plc - American Depository Shares" },
-    { symbol: "CMPX", name: "Compass Therapeutics, Inc. - Common Stock" },
-    { symbol: "CMRC", name: "Commerce.com, Inc. - Series 1 Common Stock" },
-    { symbol: "CMTL", name: "Comtech Telecommunications Corp. - Common Stock" },
-    { symbol: "CNCK", name: "Coincheck Group N.V. - Ordinary Shares" },
-    { symbol: "CNCKW", name: "Coincheck Group N.V. - Warrants" },
-    { symbol: "CNDT", name: "Conduent Incorporated - Common Stock" },
-    { symbol: "CNET", name: "ZW Data Action Technologies Inc. - Common Stock" },
-    { symbol: "CNEY", name: "CN Energy Group Inc. - Class A Ordinary Shares" },
-    { symbol: "CNFR", name: "Conifer Holdings, Inc. - Common Stock" },
-    { symbol: "CNFRZ", name: "Conifer Holdings, Inc. - 9.75% Senior Unsecured Notes due 2028" },
-    { symbol: "CNOB", name: "ConnectOne Bancorp, Inc. - Common Stock" },
-    { symbol: "CNOBP", name: "ConnectOne Bancorp, Inc. - Depositary Shares (each representing a 1/40th interest in a share of 5.25% Fixed-Rate Reset Non-Cumulative Perpetual Preferred Stock, Series A, par value $0.00 per share)" },
-    { symbol: "CNSP", name: "CNS Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "CNTA", name: "Centessa Pharmaceuticals plc - American Depositary Shares" },
-    { symbol: "CNTB", name: "Connect Biopharma Holdings Limited - Ordinary Shares" },
-    { symbol: "CNTX", name: "Context Therapeutics Inc. - Common Stock" },
-    { symbol: "CNTY", name: "Century Casinos, Inc. - Common Stock" },
-    { symbol: "CNVS", name: "Cineverse Corp. - Class A Common Stock" },
-    { symbol: "CNXC", name: "Concentrix Corporation - Common Stock" },
-    { symbol: "CNXN", name: "PC Connection, Inc. - Common Stock" },
-    { symbol: "COCH", name: "Envoy Medical, Inc. - Class A Common Stock" },
-    { symbol: "COCHW", name: "Envoy Medical, Inc. - Warrant" },
-    { symbol: "COCO", name: "The Vita Coco Company, Inc. - Common Stock" },
-    { symbol: "COCP", name: "Cocrystal Pharma, Inc. - Common Stock" },
-    { symbol: "CODA", name: "Coda Octopus Group, Inc. - Common stock" },
-    { symbol: "CODX", name: "Co-Diagnostics, Inc. - Common Stock" },
-    { symbol: "COEP", name: "Coeptis Therapeutics Holdings, Inc. - Common Stock" },
-    { symbol: "COEPW", name: "Coeptis Therapeutics Holdings, Inc. - Warrants" },
-    { symbol: "COFS", name: "ChoiceOne Financial Services, Inc. - Common Stock" },
-    { symbol: "COGT", name: "Cogent Biosciences, Inc. - Common Stock" },
-    { symbol: "COHU", name: "Cohu, Inc. - Common Stock" },
-    { symbol: "COIG", name: "Leverage Shares 2X Long COIN Daily ETF" },
-    { symbol: "COIN", name: "Coinbase Global, Inc. - Class A Common Stock" },
-    { symbol: "COKE", name: "Coca-Cola Consolidated, Inc. - Common Stock" },
-    { symbol: "COLA", name: "Columbus Acquisition Corp - Ordinary Shares" },
-    { symbol: "COLAR", name: "Columbus Acquisition Corp - Rights" },
-    { symbol: "COLAU", name: "Columbus Acquisition Corp - Unit" },
-    { symbol: "COLB", name: "Columbia Banking System, Inc. - Common Stock" },
-    { symbol: "COLL", name: "Collegium Pharmaceutical, Inc. - Common Stock" },
-    { symbol: "COLM", name: "Columbia Sportswear Company - Common Stock" },
-    { symbol: "COMM", name: "CommScope Holding Company, Inc. - Common Stock" },
-    { symbol: "COMT", name: "iShares GSCI Commodity Dynamic Roll Strategy ETF" },
-    { symbol: "CONI", name: "GraniteShares 2x Short COIN Daily ETF" },
-    { symbol: "CONL", name: "GraniteShares 2x Long COIN Daily ETF" },
-    { symbol: "COO", name: "The Cooper Companies, Inc.  - Common Stock" },
-    { symbol: "COOP", name: "Mr. Cooper Group Inc. - Common Stock" },
-    { symbol: "COOT", name: "Australian Oilseeds Holdings Limited - Ordinary Shares" },
-    { symbol: "COOTW", name: "Australian Oilseeds Holdings Limited - Warrant" },
-    { symbol: "COPJ", name: "Sprott Junior Copper Miners ETF" },
-    { symbol: "COPP", name: "Sprott Copper Miners ETF" },
-    { symbol: "CORO", name: "iShares International Country Rotation Active ETF" },
-    { symbol: "CORT", name: "Corcept Therapeutics Incorporated - Common Stock" },
-    { symbol: "CORZ", name: "Core Scientific, Inc. - Common Stock" },
-    { symbol: "CORZW", name: "Core Scientific, Inc. - Tranche 1 Warrants" },
-    { symbol: "CORZZ", name: "Core Scientific, Inc. - Tranche 2 Warrants" },
-    { symbol: "COSM", name: "Cosmos Health Inc. - Common Stock" },
-    { symbol: "COST", name: "Costco Wholesale Corporation - Common Stock" },
-    { symbol: "COWG", name: "Pacer US Large Cap Cash Cows Growth Leaders ETF" },
-    { symbol: "COWS", name: "Amplify Cash Flow Dividend Leaders ETF" },
-    { symbol: "COYA", name: "Coya Therapeutics, Inc. - Common Stock" },
-    { symbol: "COYY", name: "GraniteShares YieldBOOST COIN ETF" },
-    { symbol: "CPAG", name: "F/m Compoundr U.S. Aggregate Bond ETF" },
-    { symbol: "CPB", name: "The Campbell's Company - Common Stock" },
-    { symbol: "CPBI", name: "Central Plains Bancshares, Inc. - Common Stock" },
-    { symbol: "CPHC", name: "Canterbury Park Holding Corporation - Common Stock" },
-    { symbol: "CPHY", name: "F/m Compoundr High Yield Bond ETF" },
-    { symbol: "CPIX", name: "Cumberland Pharmaceuticals Inc. - Common Stock" },
-    { symbol: "CPLS", name: "AB Core Plus Bond ETF" },
-    { symbol: "CPOP", name: "Pop Culture Group Co., Ltd - Class A Ordinary Shares" },
-    { symbol: "CPRT", name: "Copart, Inc. - Common Stock" },
-    { symbol: "CPRX", name: "Catalyst Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "CPSH", name: "CPS Technologies Corp. - Common Stock" },
-    { symbol: "CPSS", name: "Consumer Portfolio Services, Inc. - Common Stock" },
-    { symbol: "CPZ", name: "Calamos Long/Short Equity & Dynamic Income Trust - Closed End Fund" },
-    { symbol: "CRAI", name: "CRA International,Inc. - Common Stock" },
-    { symbol: "CRAQ", name: "Cal Redwood Acquisition Corp. - Class A Ordinary Shares" },
-    { symbol: "CRAQR", name: "Cal Redwood Acquisition Corp. - Right" },
-    { symbol: "CRAQU", name: "Cal Redwood Acquisition Corp. - Units" },
-    { symbol: "CRBP", name: "Corbus Pharmaceuticals Holdings, Inc. - Common Stock" },
-    { symbol: "CRBU", name: "Caribou Biosciences, Inc. - Common Stock" },
-    { symbol: "CRCG", name: "Leverage Shares 2X Long CRCL Daily ETF" },
-    { symbol: "CRCT", name: "Cricut, Inc. - Class A common stock" },
-    { symbol: "CRDF", name: "Cardiff Oncology, Inc. - Common Stock" },
-    { symbol: "CRDL", name: "Cardiol Therapeutics Inc. - Class A Common Shares" },
-    { symbol: "CRDO", name: "Credo Technology Group Holding Ltd - Ordinary Shares" },
-    { symbol: "CRE", name: "Cre8 Enterprise Limited - Class A Ordinary Shares" },
-    { symbol: "CREG", name: "Smart Powerr Corp. - Common Stock" },
-    { symbol: "CRESW", name: "Cresud S.A.C.I.F. y A. - Warrant" },
-    { symbol: "CRESY", name: "Cresud S.A.C.I.F. y A. - American Depositary Shares, each representing ten shares of Common Stock" },
-    { symbol: "CREV", name: "Carbon Revolution Public Limited Company - Ordinary Shares" },
-    { symbol: "CREVW", name: "Carbon Revolution Public Limited Company - Warrant" },
-    { symbol: "CREX", name: "Creative Realities, Inc. - Common Stock" },
-    { symbol: "CRGO", name: "Freightos Limited - Ordinary shares" },
-    { symbol: "CRGOW", name: "Freightos Limited - Warrants" },
-    { symbol: "CRIS", name: "Curis, Inc. - Common Stock" },
-    { symbol: "CRMD", name: "CorMedix Inc. - Common Stock" },
-    { symbol: "CRMG", name: "Leverage Shares 2X Long CRM Daily ETF" },
-    { symbol: "CRML", name: "Critical Metals Corp. - Ordinary Shares" },
-    { symbol: "CRMLW", name: "Critical Metals Corp. - Warrants" },
-    { symbol: "CRMT", name: "America's Car-Mart, Inc. - Common Stock" },
-    { symbol: "CRNC", name: "Cerence Inc. - Common Stock" },
-    { symbol: "CRNT", name: "Ceragon Networks Ltd. - Ordinary Shares" },
-    { symbol: "CRNX", name: "Crinetics Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "CRON", name: "Cronos Group Inc. - Common Share" },
-    { symbol: "CROX", name: "Crocs, Inc. - Common Stock" },
-    { symbol: "CRSP", name: "CRISPR Therapeutics AG - Common Shares" },
-    { symbol: "CRSR", name: "Corsair Gaming, Inc. - Common Stock" },
-    { symbol: "CRTO", name: "Criteo S.A. - American Depositary Shares" },
-    { symbol: "CRUS", name: "Cirrus Logic, Inc. - Common Stock" },
-    { symbol: "CRVL", name: "CorVel Corp. - Common Stock" },
-    { symbol: "CRVO", name: "CervoMed Inc. - Common Stock" },
-    { symbol: "CRVS", name: "Corvus Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "CRWD", name: "CrowdStrike Holdings, Inc. - Class A Common Stock" },
-    { symbol: "CRWG", name: "Leverage Shares 2X Long CRWV Daily ETF" },
-    { symbol: "CRWL", name: "GraniteShares 2x Long CRWD Daily ETF" },
-    { symbol: "CRWS", name: "Crown Crafts, Inc. - Common Stock" },
-    { symbol: "CRWV", name: "CoreWeave, Inc. - Class A Common Stock" },
-    { symbol: "CSAI", name: "Cloudastructure, Inc. - Class A Common Stock" },
-    { symbol: "CSB", name: "VictoryShares US Small Cap High Div Volatility Wtd ETF" },
-    { symbol: "CSBR", name: "Champions Oncology, Inc. - Common Stock" },
-    { symbol: "CSCL", name: "Direxion Daily CSCO Bull 2X ETF" },
-    { symbol: "CSCO", name: "Cisco Systems, Inc. - Common Stock" },
-    { symbol: "CSCS", name: "Direxion Daily CSCO Bear 1X ETF" },
-    { symbol: "CSGP", name: "CoStar Group, Inc. - Common Stock" },
-    { symbol: "CSGS", name: "CSG Systems International, Inc. - Common Stock" },
-    { symbol: "CSIQ", name: "Canadian Solar Inc. - Common Shares" },
-    { symbol: "CSPI", name: "CSP Inc. - Common Stock" },
-    { symbol: "CSQ", name: "Calamos Strategic Total Return Fund - Closed End Fund" },
-    { symbol: "CSTE", name: "Caesarstone Ltd. - Ordinary Shares" },
-    { symbol: "CSTL", name: "Castle Biosciences, Inc. - Common stock" },
-    { symbol: "CSWC", name: "Capital Southwest Corporation - Common Stock" },
-    { symbol: "CSWCZ", name: "Capital Southwest Corporation - 7.75% Notes due 2028" },
-    { symbol: "CSX", name: "CSX Corporation - Common Stock" },
-    { symbol: "CTAS", name: "Cintas Corporation - Common Stock" },
-    { symbol: "CTBI", name: "Community Trust Bancorp, Inc. - Common Stock" },
-    { symbol: "CTEC", name: "Global X CleanTech ETF" },
-    { symbol: "CTKB", name: "Cytek Biosciences, Inc. - Common Stock" },
-    { symbol: "CTLP", name: "Cantaloupe, Inc. - Common Stock" },
-    { symbol: "CTMX", name: "CytomX Therapeutics, Inc. - Common Stock" },
-    { symbol: "CTNM", name: "Contineum Therapeutics, Inc. - Common stock" },
-    { symbol: "CTNT", name: "Cheetah Net Supply Chain Service Inc. - Class A Common Stock" },
-    { symbol: "CTOR", name: "Citius Oncology, Inc.  - Common Stock" },
-    { symbol: "CTRM", name: "Castor Maritime Inc. - Common Shares" },
-    { symbol: "CTRN", name: "Citi Trends, Inc. - Common Stock" },
-    { symbol: "CTSH", name: "Cognizant Technology Solutions Corporation - Class A Common Stock" },
-    { symbol: "CTSO", name: "Cytosorbents Corporation - Common Stock" },
-    { symbol: "CTW", name: "CTW Cayman - Class A Ordinary Shares" },
-    { symbol: "CTXR", name: "Citius Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "CUB", name: "Lionheart Holdings - Class A Ordinary Shares" },
-    { symbol: "CUBWU", name: "Lionheart Holdings - Unit" },
-    { symbol: "CUBWW", name: "Lionheart Holdings - Warrant" },
-    { symbol: "CUE", name: "Cue Biopharma, Inc. - Common Stock" },
-    { symbol: "CUPR", name: "Cuprina Holdings (Cayman) Limited - Ordinary shares" },
-    { symbol: "CURI", name: "CuriosityStream Inc.  - Class A Common Stock" },
-    { symbol: "CURIW", name: "CuriosityStream Inc.  - Warrant" },
-    { symbol: "CURR", name: "Currenc Group Inc. - Ordinary Shares" },
-    { symbol: "CURX", name: "Curanex Pharmaceuticals Inc - Common Stock" },
-    { symbol: "CV", name: "CapsoVision, Inc. - Common Stock" },
-    { symbol: "CVAC", name: "CureVac N.V. - Ordinary Shares" },
-    { symbol: "CVBF", name: "CVB Financial Corporation - Common Stock" },
-    { symbol: "CVCO", name: "Cavco Industries, Inc. - Common Stock" },
-    { symbol: "CVGI", name: "Commercial Vehicle Group, Inc. - Common Stock" },
-    { symbol: "CVGW", name: "Calavo Growers, Inc. - Common Stock" },
-    { symbol: "CVKD", name: "Cadrenal Therapeutics, Inc. - Common Stock" },
-    { symbol: "CVLT", name: "Commvault Systems, Inc. - Common Stock" },
-    { symbol: "CVNX", name: "Defiance Daily Target 2X Long CVNA ETF" },
-    { symbol: "CVRX", name: "CVRx, Inc. - Common Stock" },
-    { symbol: "CVV", name: "CVD Equipment Corporation - Common Stock" },
-    { symbol: "CWBC", name: "Community West Bancshares - Common Stock" },
-    { symbol: "CWCO", name: "Consolidated Water Co. Ltd. - Ordinary Shares" },
-    { symbol: "CWD", name: "CaliberCos Inc. - Class A Common Stock" },
-    { symbol: "CWST", name: "Casella Waste Systems, Inc. - Class A Common Stock" },
-    { symbol: "CXAI", name: "CXApp Inc. - Class A Common Stock" },
-    { symbol: "CXAIW", name: "CXApp Inc. - Warrant" },
-    { symbol: "CXDO", name: "Crexendo, Inc. - Common Stock" },
-    { symbol: "CXSE", name: "WisdomTree China ex-State-Owned Enterprises Fund" },
-    { symbol: "CYBR", name: "CyberArk Software Ltd. - Ordinary Shares" },
-    { symbol: "CYCC", name: "Cyclacel Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "CYCCP", name: "Cyclacel Pharmaceuticals, Inc. - 6% Convertible Preferred Stock" },
-    { symbol: "CYCN", name: "Cyclerion Therapeutics, Inc. - Common Stock" },
-    { symbol: "CYCU", name: "Cycurion, Inc. - Common Stock" },
-    { symbol: "CYCUW", name: "Cycurion, Inc. - Warrants" },
-    { symbol: "CYN", name: "Cyngn Inc. - Common stock" },
-    { symbol: "CYRX", name: "CryoPort, Inc. - Common Stock" },
-    { symbol: "CYTK", name: "Cytokinetics, Incorporated - Common Stock" },
-    { symbol: "CZAR", name: "Themes Natural Monopoly ETF" },
-    { symbol: "CZFS", name: "Citizens Financial Services, Inc. - Common Stock" },
-    { symbol: "CZNC", name: "Citizens & Northern Corp - Common Stock" },
-    { symbol: "CZR", name: "Caesars Entertainment, Inc. - Common Stock" },
-    { symbol: "CZWI", name: "Citizens Community Bancorp, Inc. - Common Stock" },
-    { symbol: "DAAQ", name: "Digital Asset Acquisition Corp. - Class A Ordinary shares" },
-    { symbol: "DAAQU", name: "Digital Asset Acquisition Corp. - Units" },
-    { symbol: "DAAQW", name: "Digital Asset Acquisition Corp. - Warrant" },
-    { symbol: "DADS", name: "Digital Asset Debt Strategy ETF" },
-    { symbol: "DAIC", name: "CID HoldCo, Inc. - Common Stock" },
-    { symbol: "DAICW", name: "CID HoldCo, Inc. - Warrants" },
-    { symbol: "DAIO", name: "Data I/O Corporation - Common Stock" },
-    { symbol: "DAK", name: "Dakota Active Equity ETF" },
-    { symbol: "DAKT", name: "Daktronics, Inc. - Common Stock" },
-    { symbol: "DALI", name: "First Trust Dorsey Wright DALI Equity ETF" },
-    { symbol: "DALN", name: "DallasNews Corporation - Series A Common Stock" },
-    { symbol: "DAPP", name: "VanEck Digital Transformation ETF" },
-    { symbol: "DARE", name: "Dare Bioscience, Inc. - Common Stock" },
-    { symbol: "DASH", name: "DoorDash, Inc. - Common Stock" },
-    { symbol: "DAVE", name: "Dave Inc.  - Class A Common Stock" },
-    { symbol: "DAVEW", name: "Dave Inc.  - Warrants" },
-    { symbol: "DAWN", name: "Day One Biopharmaceuticals, Inc. - Common Stock" },
-    { symbol: "DAX", name: "Global X DAX Germany ETF" },
-    { symbol: "DBGI", name: "Digital Brands Group, Inc. - Common Stock" },
-    { symbol: "DBVT", name: "DBV Technologies S.A. - American Depositary Shares" },
-    { symbol: "DBX", name: "Dropbox, Inc. - Class A Common Stock" },
-    { symbol: "DCBO", name: "Docebo Inc. - Common Shares" },
-    { symbol: "DCGO", name: "DocGo Inc. - Common Stock" },
-    { symbol: "DCOM", name: "Dime Community Bancshares, Inc. - Common Stock" },
-    { symbol: "DCOMG", name: "Dime Community Bancshares, Inc. - 9.000% Fixed-to-Floating Rate Subordinated Notes due 2034" },
-    { symbol: "DCOMP", name: "Dime Community Bancshares, Inc. - Fixed-Rate Non-Cumulative Perpetual Preferred Stock, Series A" },
-    { symbol: "DCTH", name: "Delcath Systems, Inc. - Common Stock" },
-    { symbol: "DDI", name: "DoubleDown Interactive Co., Ltd. - American Depository Shares" },
-    { symbol: "DDIV", name: "First Trust Dorsey Wright Momentum & Dividend ETF" },
-    { symbol: "DDOG", name: "Datadog, Inc. - Class A Common Stock" },
-    { symbol: "DECO", name: "SPDR Galaxy Digital Asset Ecosystem ETF" },
-    { symbol: "DEFT", name: "Defi Technologies, Inc. - Common Stock" },
-    { symbol: "DEMZ", name: "Democratic Large Cap Core ETF" },
-    { symbol: "DENN", name: "Denny's Corporation - Common Stock" },
-    { symbol: "DERM", name: "Journey Medical Corporation - Common Stock" },
-    { symbol: "DEVS", name: "DevvStream Corp. - Common Stock" },
-    { symbol: "DFDV", name: "DeFi Development Corp. - Common Stock" },
-    { symbol: "DFGP", name: "Dimensional Global Core Plus Fixed Income ETF" },
-    { symbol: "DFGX", name: "Dimensional Global ex US Core Fixed Income ETF" },
-    { symbol: "DFLI", name: "Dragonfly Energy Holdings Corp - Common Stock" },
-    { symbol: "DFLIW", name: "Dragonfly Energy Holdings Corp - Warrant" },
-    { symbol: "DFSC", name: "DEFSEC Technologies Inc. - common stock, no R/S concurrent with offering" },
-    { symbol: "DFSCW", name: "DEFSEC Technologies Inc. - warrant" },
-    { symbol: "DGCB", name: "Dimensional Global Credit ETF" },
-    { symbol: "DGICA", name: "Donegal Group, Inc. - Class A Common Stock" },
-    { symbol: "DGICB", name: "Donegal Group, Inc. - Class B Common Stock" },
-    { symbol: "DGII", name: "Digi International Inc. - Common Stock" },
-    { symbol: "DGLO", name: "First Trust RBA Deglobalization ETF" },
-    { symbol: "DGLY", name: "Digital Ally, Inc. - Common Stock" },
-    { symbol: "DGNX", name: "Diginex Limited - Ordinary Shares" },
-    { symbol: "DGRE", name: "WisdomTree Emerging Markets Quality Dividend Growth Fund" },
-    { symbol: "DGRS", name: "WisdomTree U.S. SmallCap Quality Dividend Growth Fund" },
-    { symbol: "DGRW", name: "WisdomTree U.S. Quality Dividend Growth Fund" },
-    { symbol: "DGXX", name: "Digi Power X Inc. - Common Subordinate Voting Shares" },
-    { symbol: "DH", name: "Definitive Healthcare Corp. - Class A Common Stock" },
-    { symbol: "DHAI", name: "DIH Holding US, Inc. - Class A Common Stock" },
-    { symbol: "DHAIW", name: "DIH Holding US, Inc. - Warrant" },
-    { symbol: "DHC", name: "Diversified Healthcare Trust  - Common Shares of Beneficial Interest" },
-    { symbol: "DHCNI", name: "Diversified Healthcare Trust  - 5.625% Senior Notes due 2042" },
-    { symbol: "DHCNL", name: "Diversified Healthcare Trust  - 6.25% Senior Notes Due 2046" },
-    { symbol: "DHIL", name: "Diamond Hill Investment Group, Inc. - Class A Common Stock" },
-    { symbol: "DIBS", name: "1stdibs.com, Inc. - Common Stock" },
-    { symbol: "DIOD", name: "Diodes Incorporated - Common Stock" },
-    { symbol: "DIVD", name: "Altrius Global Dividend ETF" },
-    { symbol: "DJCO", name: "Daily Journal Corp. (S.C.) - Common Stock" },
-    { symbol: "DJT", name: "Trump Media & Technology Group Corp. - Common Stock" },
-    { symbol: "DJTWW", name: "Trump Media & Technology Group Corp. - Warrants" },
-    { symbol: "DKI", name: "DarkIris Inc. - Class A Ordinary Shares" },
-    { symbol: "DKNG", name: "DraftKings Inc. - Class A Common Stock" },
-    { symbol: "DKNX", name: "Defiance Daily Target 2X Long DKNG ETF" },
-    { symbol: "DLHC", name: "DLH Holdings Corp. - Common Stock" },
-    { symbol: "DLLL", name: "GraniteShares 2x Long DELL Daily ETF" },
-    { symbol: "DLO", name: "DLocal Limited - Class A Common Shares" },
-    { symbol: "DLPN", name: "Dolphin Entertainment, Inc. - Common Stock" },
-    { symbol: "DLTH", name: "Duluth Holdings Inc. - Class B Common Stock" },
-    { symbol: "DLTR", name: "Dollar Tree, Inc. - Common Stock" },
-    { symbol: "DLXY", name: "Delixy Holdings Limited - Ordinary Shares" },
-    { symbol: "DMAA", name: "Drugs Made In America Acquisition Corp. - Ordinary Shares" },
-    { symbol: "DMAAR", name: "Drugs Made In America Acquisition Corp. - Rights" },
-    { symbol: "DMAAU", name: "Drugs Made In America Acquisition Corp. - Units" },
-    { symbol: "DMAC", name: "DiaMedica Therapeutics Inc. - Common Stock" },
-    { symbol: "DMAT", name: "Global X Disruptive Materials ETF" },
-    { symbol: "DMLP", name: "Dorchester Minerals, L.P. - Common Units Representing Limited Partnership Interests" },
-    { symbol: "DMRC", name: "Digimarc Corporation - Common Stock" },
-    { symbol: "DMXF", name: "iShares ESG Advanced MSCI EAFE ETF" },
-    { symbol: "DNLI", name: "Denali Therapeutics Inc. - Common Stock" },
-    { symbol: "DNTH", name: "Dianthus Therapeutics, Inc. - Common Stock" },
-    { symbol: "DNUT", name: "Krispy Kreme, Inc. - Common Stock" },
-    { symbol: "DOCU", name: "DocuSign, Inc. - Common Stock" },
-    { symbol: "DOGZ", name: "Dogness (International) Corporation - Class A Common Stock" },
-    { symbol: "DOMH", name: "Dominari Holdings Inc. - Common Stock" },
-    { symbol: "DOMO", name: "Domo, Inc. - Class B Common Stock" },
-    { symbol: "DOOO", name: "BRP Inc. - Common Subordinate Voting Shares" },
-    { symbol: "DORM", name: "Dorman Products, Inc. - Common Stock" },
-    { symbol: "DOX", name: "Amdocs Limited - Ordinary Shares" },
-    { symbol: "DOYU", name: "DouYu International Holdings Limited - American Depositary Shares" },
-    { symbol: "DPRO", name: "Draganfly Inc. - Common Shares" },
-    { symbol: "DPZ", name: "Domino's Pizza Inc - Common Stock" },
-    { symbol: "DRCT", name: "Direct Digital Holdings, Inc. - Class A Common Stock" },
-    { symbol: "DRDB", name: "Roman DBDR Acquisition Corp. II - Ordinary shares" },
-    { symbol: "DRDBU", name: "Roman DBDR Acquisition Corp. II - Unit" },
-    { symbol: "DRDBW", name: "Roman DBDR Acquisition Corp. II - Warrants" },
-    { symbol: "DRIO", name: "DarioHealth Corp. - Common Stock" },
-    { symbol: "DRIV", name: "Global X Autonomous & Electric Vehicles ETF" },
-    { symbol: "DRMA", name: "Dermata Therapeutics, Inc. - Common Stock" },
-    { symbol: "DRMAW", name: "Dermata Therapeutics, Inc. - Warrant" },
-    { symbol: "DRRX", name: "DURECT Corporation - Common Stock" },
-    { symbol: "DRS", name: "Leonardo DRS, Inc. - Common Stock" },
-    { symbol: "DRTS", name: "Alpha Tau Medical Ltd. - Ordinary Shares" },
-    { symbol: "DRTSW", name: "Alpha Tau Medical Ltd. - Warrant" },
-    { symbol: "DRUG", name: "Bright Minds Biosciences Inc. - common stock" },
-    { symbol: "DRVN", name: "Driven Brands Holdings Inc. - Common Stock" },
-    { symbol: "DSGN", name: "Design Therapeutics, Inc. - Common Stock" },
-    { symbol: "DSGR", name: "Distribution Solutions Group, Inc. - Common Stock" },
-    { symbol: "DSGX", name: "The Descartes Systems Group Inc. - Common Stock" },
-    { symbol: "DSP", name: "Viant Technology Inc. - common stock" },
-    { symbol: "DSWL", name: "Deswell Industries, Inc. - Common Shares" },
-    { symbol: "DSY", name: "Big Tree Cloud Holdings Limited - Ordinary Shares" },
-    { symbol: "DSYWW", name: "Big Tree Cloud Holdings Limited - Warrants" },
-    { symbol: "DTCK", name: "Davis Commodities Limited - Class A Ordinary Shares" },
-    { symbol: "DTCR", name: "Global X Data Center & Digital Infrastructure ETF" },
-    { symbol: "DTI", name: "Drilling Tools International Corporation  - Common Stock" },
-    { symbol: "DTIL", name: "Precision BioSciences, Inc. - Common Stock" },
-    { symbol: "DTSQ", name: "DT Cloud Star Acquisition Corporation - Ordinary Shares" },
-    { symbol: "DTSQR", name: "DT Cloud Star Acquisition Corporation - Right" },
-    { symbol: "DTSQU", name: "DT Cloud Star Acquisition Corporation - Units" },
-    { symbol: "DTSS", name: "Datasea Inc. - Common Stock" },
-    { symbol: "DTST", name: "Data Storage Corporation - Common Stock" },
-    { symbol: "DTSTW", name: "Data Storage Corporation - Warrant" },
-    { symbol: "DUKH", name: "Ocean Park High Income ETF" },
-    { symbol: "DUKX", name: "Ocean Park International ETF" },
-    { symbol: "DUO", name: "Fangdd Network Group Ltd. - Class A Ordinary Shares" },
-    { symbol: "DUOL", name: "Duolingo, Inc. - Class A Common Stock" },
-    { symbol: "DUOT", name: "Duos Technologies Group, Inc. - Common Stock" },
-    { symbol: "DVAL", name: "BrandywineGLOBAL-Dynamic US Large Cap Value ETF" },
-    { symbol: "DVAX", name: "Dynavax Technologies Corporation - Common Stock" },
-    { symbol: "DVIN", name: "WEBs Defined Volatility XLI ETF" },
-    { symbol: "DVLT", name: "Datavault AI Inc. - Common Stock" },
-    { symbol: "DVLU", name: "First Trust Dorsey Wright Momentum & Value ETF" },
-    { symbol: "DVOL", name: "First Trust Dorsey Wright Momentum & Low Volatility ETF" },
-    { symbol: "DVQQ", name: "WEBs Defined Volatility QQQ ETF" },
-    { symbol: "DVRE", name: "WEBs Defined Volatility XLRE ETF" },
-    { symbol: "DVSP", name: "WEBs Defined Volatility SPY ETF" },
-    { symbol: "DVUT", name: "WEBS Defined Volatility XLU ETF" },
-    { symbol: "DVXB", name: "WEBs Defined Volatility XLB ETF" },
-    { symbol: "DVXC", name: "WEBs Defined Volatility XLC ETF" },
-    { symbol: "DVXE", name: "WEBs Defined Volatility XLE ETF" },
-    { symbol: "DVXF", name: "WEBs Defined Volatility XLF ETF" },
-    { symbol: "DVXK", name: "WEBs Defined Volatility XLK ETF" },
-    { symbol: "DVXP", name: "WEBs Defined Volatility XLP ETF" },
-    { symbol: "DVXV", name: "WEBs Defined Volatility XLV ETF" },
-    { symbol: "DVXY", name: "WEBs Defined Volatility XLY ETF" },
-    { symbol: "DVY", name: "iShares Select Dividend ETF" },
-    { symbol: "DWAS", name: "Invesco Dorsey Wright SmallCap Momentum ETF" },
-    { symbol: "DWAW", name: "AdvisorShares Dorsey Wright FSM All Cap World ETF" },
-    { symbol: "DWSH", name: "AdvisorShares Dorsey Wright Short ETF" },
-    { symbol: "DWSN", name: "Dawson Geophysical Company - Common Stock" },
-    { symbol: "DWTX", name: "Dogwood Therapeutics, Inc.  - Common Stock" },
-    { symbol: "DWUS", name: "AdvisorShares Dorsey Wright FSM US Core ETF" },
-    { symbol: "DXCM", name: "DexCom, Inc. - Common Stock" },
-    { symbol: "DXLG", name: "Destination XL Group, Inc. - Common Stock" },
-    { symbol: "DXPE", name: "DXP Enterprises, Inc. - Common Stock" },
-    { symbol: "DXR", name: "Daxor Corporation - Closed End Fund" },
-    { symbol: "DXST", name: "Decent Holding Inc. - Class A Ordinary Shares" },
-    { symbol: "DYAI", name: "Dyadic International, Inc. - Common Stock" },
-    { symbol: "DYCQ", name: "DT Cloud Acquisition Corporation - Ordinary shares" },
-    { symbol: "DYCQR", name: "DT Cloud Acquisition Corporation - Right" },
-    { symbol: "DYCQU", name: "DT Cloud Acquisition Corporation - Unit" },
-    { symbol: "DYFI", name: "IDX Dynamic Fixed Income ETF" },
-    { symbol: "DYN", name: "Dyne Therapeutics, Inc. - Common Stock" },
-    { symbol: "DYTA", name: "SGI Dynamic Tactical ETF" },
-    { symbol: "EA", name: "Electronic Arts Inc. - Common Stock" },
-    { symbol: "EBAY", name: "eBay Inc. - Common Stock" },
-    { symbol: "EBC", name: "Eastern Bankshares, Inc. - Common Stock" },
-    { symbol: "EBI", name: "Longview Advantage ETF" },
-    { symbol: "EBIZ", name: "Global X E-commerce ETF" },
-    { symbol: "EBMT", name: "Eagle Bancorp Montana, Inc. - Common Stock" },
-    { symbol: "EBON", name: "Ebang International Holdings Inc. - Class A Ordinary Shares" },
-    { symbol: "ECBK", name: "ECB Bancorp, Inc. - Common Stock" },
-    { symbol: "ECDA", name: "ECD Automotive Design, Inc. - Common Stock" },
-    { symbol: "ECDAW", name: "ECD Automotive Design, Inc. - Warrant" },
-    { symbol: "ECOR", name: "electroCore, Inc. - Common Stock" },
-    { symbol: "ECOW", name: "Pacer Emerging Markets Cash Cows 100 ETF" },
-    { symbol: "ECPG", name: "Encore Capital Group Inc - Common Stock" },
-    { symbol: "ECX", name: "ECARX Holdings Inc. - Class A Ordinary shares" },
-    { symbol: "ECXWW", name: "ECARX Holdings Inc. - Warrants" },
-    { symbol: "EDAP", name: "EDAP TMS S.A. - American Depositary Shares, each representing One Ordinary Share" },
-    { symbol: "EDBL", name: "Edible Garden AG Incorporated - Common Stock" },
-    { symbol: "EDBLW", name: "Edible Garden AG Incorporated - Warrant" },
-    { symbol: "EDHL", name: "Everbright Digital Holding Limited - Ordinary Shares" },
-    { symbol: "EDIT", name: "Editas Medicine, Inc. - Common Stock" },
-    { symbol: "EDRY", name: "EuroDry Ltd. - Common Shares" },
-    { symbol: "EDSA", name: "Edesa Biotech, Inc. - Common Shares" },
-    { symbol: "EDTK", name: "Skillful Craftsman Education Technology Limited - Ordinary Share" },
-    { symbol: "EDUC", name: "Educational Development Corporation - Common Stock" },
-    { symbol: "EEFT", name: "Euronet Worldwide, Inc. - Common Stock" },
-    { symbol: "EEIQ", name: "EpicQuest Education Group International Limited - Common Stock" },
-    { symbol: "EEMA", name: "iShares MSCI Emerging Markets Asia ETF" },
-    { symbol: "EFAS", name: "Global X MSCI SuperDividend EAFE ETF" },
-    { symbol: "EFOI", name: "Energy Focus, Inc. - Common Stock" },
-    { symbol: "EFRA", name: "iShares Environmental Infrastructure and Industrials ETF" },
-    { symbol: "EFSC", name: "Enterprise Financial Services Corporation - Common Stock" },
-    { symbol: "EFSCP", name: "Enterprise Financial Services Corporation - Depositary Shares Each Representing a 1/40th Interest in a Share of 5% Fixed Rate Non-Cumulative Perpetual Preferred Stock, Series A" },
-    { symbol: "EFSI", name: "Eagle Financial Services Inc - Common Stock" },
-    { symbol: "EFTY", name: "Etoiles Capital Group Co., Ltd. - Class A Ordinary Shares" },
-    { symbol: "EGAN", name: "eGain Corporation - Common Stock" },
-    { symbol: "EGBN", name: "Eagle Bancorp, Inc. - Common Stock" },
-    { symbol: "EGGQ", name: "NestYield Visionary ETF" },
-    { symbol: "EGHA", name: "EGH Acquisition Corp. - Class A ordinary shares" },
-    { symbol: "EGHAR", name: "EGH Acquisition Corp. - rights" },
-    { symbol: "EGHAU", name: "EGH Acquisition Corp. - Unit" },
-    { symbol: "EGHT", name: "8x8 Inc - Common stock" },
-    { symbol: "EH", name: "EHang Holdings Limited - ADS" },
-    { symbol: "EHGO", name: "Eshallgo Inc. - Class A Ordinary Shares" },
-    { symbol: "EHLD", name: "Euroholdings Ltd. - Common Stock" },
-    { symbol: "EHLS", name: "Even Herd Long Short ETF" },
-    { symbol: "EHTH", name: "eHealth, Inc. - Common Stock" },
-    { symbol: "EJH", name: "E-Home Household Service Holdings Limited - Ordinary shares" },
-    { symbol: "EKG", name: "First Trust Nasdaq Lux Digital Health Solutions ETF" },
-    { symbol: "EKSO", name: "Ekso Bionics Holdings, Inc. - Common Stock" },
-    { symbol: "ELAB", name: "PMGC Holdings Inc. - Common Stock" },
-    { symbol: "ELBM", name: "Electra Battery Materials Corporation - Common Stock" },
-    { symbol: "ELDN", name: "Eledon Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "ELFY", name: "ALPS Electrification Infrastructure ETF" },
-    { symbol: "ELIL", name: "Direxion Daily LLY Bull 2X Shares" },
-    { symbol: "ELIS", name: "Direxion Daily LLY Bear 1X Shares" },
-    { symbol: "ELOG", name: "Eastern International Ltd. - Ordinary Shares" },
-    { symbol: "ELPW", name: "Elong Power Holding Limited - Class A Ordinary Shares" },
-    { symbol: "ELSE", name: "Electro-Sensors, Inc. - Common Stock" },
-    { symbol: "ELTK", name: "Eltek Ltd. - Ordinary Shares" },
-    { symbol: "ELTX", name: "Elicio Therapeutics, Inc. - Common Stock" },
-    { symbol: "ELUT", name: "Elutia, Inc. - Class A Common Stock" },
-    { symbol: "ELVA", name: "Electrovaya Inc. - Common Shares" },
-    { symbol: "ELVN", name: "Enliven Therapeutics, Inc.  - Common Stock" },
-    { symbol: "ELVR", name: "Sayona Mining Limited - American Depository Shares" },
-    { symbol: "ELWS", name: "Earlyworks Co., Ltd. - American Depositary Shares" },
-    { symbol: "EM", name: "Smart Share Global Limited - American Depositary Shares" },
-    { symbol: "EMB", name: "iShares J.P. Morgan USD Emerging Markets Bond ETF" },
-    { symbol: "EMBC", name: "Embecta Corp. - Common Stock" },
-    { symbol: "EMCB", name: "WisdomTree Emerging Markets Corporate Bond Fund" },
-    { symbol: "EMEQ", name: "Macquarie Focused Emerging Markets Equity ETF" },
-    { symbol: "EMIF", name: "iShares Emerging Markets Infrastructure ETF" },
-    { symbol: "EML", name: "Eastern Company (The) - Common Stock" },
-    { symbol: "EMPD", name: "Empery Digital Inc. - Common stock" },
-    { symbol: "EMPG", name: "Empro Group Inc. - Ordinary shares" },
-    { symbol: "EMXC", name: "iShares MSCI Emerging Markets ex China ETF" },
-    { symbol: "EMXF", name: "iShares ESG Advanced MSCI EM ETF" },
-    { symbol: "ENDW", name: "Cambria Endowment Style ETF" },
-    { symbol: "ENGN", name: "enGene Holdings Inc. - Common Stock" },
-    { symbol: "ENGNW", name: "enGene Holdings Inc. - Warrants" },
-    { symbol: "ENGS", name: "Energys Group Limited - Ordinary Shares" },
-    { symbol: "ENLT", name: "Enlight Renewable Energy Ltd. - Ordinary Shares" },
-    { symbol: "ENLV", name: "Enlivex Therapeutics Ltd. - Ordinary Shares" },
-    { symbol: "ENPH", name: "Enphase Energy, Inc. - Common Stock" },
-    { symbol: "ENSC", name: "Ensysce Biosciences, Inc. - Common Stock" },
-    { symbol: "ENSG", name: "The Ensign Group, Inc. - Common Stock" },
-    { symbol: "ENTA", name: "Enanta Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "ENTG", name: "Entegris, Inc. - Common Stock" },
-    { symbol: "ENTO", name: "Entero Therapeutics Inc. - Common Stock" },
-    { symbol: "ENTX", name: "Entera Bio Ltd. - Ordinary Shares" },
-    { symbol: "ENVB", name: "Enveric Biosciences, Inc.  - Common Stock" },
-    { symbol: "ENVX", name: "Enovix Corporation - Common Stock" },
-    { symbol: "ENZL", name: "iShares MSCI New Zealand ETF" },
-    { symbol: "EOLS", name: "Evolus, Inc. - Common Stock" },
-    { symbol: "EOSE", name: "Eos Energy Enterprises, Inc. - Common Stock" },
-    { symbol: "EOSEW", name: "Eos Energy Enterprises, Inc. - Warrant" },
-    { symbol: "EPIX", name: "ESSA Pharma Inc. - Common Stock" },
-    { symbol: "EPOW", name: "Sunrise New Energy Co., Ltd - Class A Ordinary Shares" },
-    { symbol: "EPRX", name: "Eupraxia Pharmaceuticals Inc. - Common Stock" },
-    { symbol: "EPSM", name: "Epsium Enterprise Limited - Ordinary Shares" },
-    { symbol: "EPSN", name: "Epsilon Energy Ltd. - Common Shares" },
-    { symbol: "EPWK", name: "EPWK Holdings Ltd. - Class A Ordinary Shares" },
-    { symbol: "EQ", name: "Equillium, Inc. - Common Stock" },
-    { symbol: "EQIX", name: "Equinix, Inc. - Common Stock" },
-    { symbol: "EQRR", name: "ProShares Equities for Rising Rates ETF" },
-    { symbol: "ERAS", name: "Erasca, Inc. - Common Stock" },
-    { symbol: "ERET", name: "iShares Environmentally Aware Real Estate ETF" },
-    { symbol: "ERIC", name: "Ericsson - American Depositary Shares each representing 1 underlying Class B share" },
-    { symbol: "ERIE", name: "Erie Indemnity Company - Class A Common Stock" },
-    { symbol: "ERII", name: "Energy Recovery, Inc. - Common Stock" },
-    { symbol: "ERNA", name: "Ernexa Therapeutics Inc. - Common Stock" },
-    { symbol: "ERNZ", name: "TrueShares Active Yield ETF" },
-    { symbol: "ESCA", name: "Escalade, Incorporated - Common Stock" },
-    { symbol: "ESEA", name: "Euroseas Ltd. - Common Stock" },
-    { symbol: "ESGD", name: "iShares ESG Aware MSCI EAFE ETF" },
-    { symbol: "ESGE", name: "iShares ESG Aware MSCI EM ETF" },
-    { symbol: "ESGL", name: "ESGL Holdings Limited - Class A Ordinary Shares" },
-    { symbol: "ESGLW", name: "ESGL Holdings Limited - Warrants" },
-    { symbol: "ESGU", name: "iShares ESG Aware MSCI USA ETF" },
-    { symbol: "ESHA", name: "ESH Acquisition Corp. - Class A Common Stock" },
-    { symbol: "ESHAR", name: "ESH Acquisition Corp. - Right" },
-    { symbol: "ESLA", name: "Estrella Immunopharma, Inc. - Common Stock" },
-    { symbol: "ESLAW", name: "Estrella Immunopharma, Inc. - Warrant" },
-    { symbol: "ESLT", name: "Elbit Systems Ltd. - Ordinary Shares" },
-    { symbol: "ESMV", name: "iShares ESG Optimized MSCI USA Min Vol Factor ETF" },
-    { symbol: "ESN", name: "Essential 40 Stock ETF" },
-    { symbol: "ESOA", name: "Energy Services of America Corporation - Common Stock" },
-    { symbol: "ESPO", name: "VanEck Video Gaming and eSports ETF" },
-    { symbol: "ESPR", name: "Esperion Therapeutics, Inc. - Common Stock" },
-    { symbol: "ESQ", name: "Esquire Financial Holdings, Inc. - Common Stock" },
-    { symbol: "ESTA", name: "Establishment Labs Holdings Inc. - Common Shares" },
-    { symbol: "ETEC", name: "iShares Breakthrough Environmental Solutions ETF" },
-    { symbol: "ETHA", name: "iShares Ethereum Trust - iShares Ethereum Trust ETF" },
-    { symbol: "ETHM", name: "Dynamix Corporation - Class A Ordinary Share" },
-    { symbol: "ETHMU", name: "Dynamix Corporation - Unit" },
-    { symbol: "ETHMW", name: "Dynamix Corporation - Warrant" },
-    { symbol: "ETHZ", name: "ETHZilla Corporation - Common Stock" },
-    { symbol: "ETHZW", name: "ETHZilla Corporation - Warrant" },
-    { symbol: "ETNB", name: "89bio, Inc. - Common Stock" },
-    { symbol: "ETON", name: "Eton Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "ETOR", name: "eToro Group Ltd. - Class A Common Shares" },
-    { symbol: "ETRL", name: "GraniteShares 2x Long ETOR Daily ETF" },
-    { symbol: "ETS", name: "Elite Express Holding Inc. - Class A Common Stock" },
-    { symbol: "ETSY", name: "Etsy, Inc. - Common Stock" },
-    { symbol: "EU", name: "enCore Energy Corp. - Common Stock" },
-    { symbol: "EUDA", name: "Euda Health Holdings Limited - Ordinary Shares" },
-    { symbol: "EUDAW", name: "Euda Health Holdings Limited - Warrant" },
-    { symbol: "EUFN", name: "iShares MSCI Europe Financials ETF" },
-    { symbol: "EURK", name: "Eureka Acquisition Corp - Class A Ordinary Share" },
-    { symbol: "EURKR", name: "Eureka Acquisition Corp - Right" },
-    { symbol: "EURKU", name: "Eureka Acquisition Corp - Unit" },
-    { symbol: "EVAX", name: "Evaxion A/S - American Depositary Share" },
-    { symbol: "EVCM", name: "EverCommerce Inc. - Common Stock" },
-    { symbol: "EVER", name: "EverQuote, Inc. - Class A Common Stock" },
-    { symbol: "EVGN", name: "Evogene Ltd. - Ordinary Shares" },
-    { symbol: "EVGO", name: "EVgo Inc. - Common Stock" },
-    { symbol: "EVGOW", name: "EVgo Inc. - Warrants, each whole warrant exercisable for one share of Class A Common Stock at an exercise price of $11.50" },
-    { symbol: "EVLV", name: "Evolv Technologies Holdings, Inc. - Class A Common Stock" },
-    { symbol: "EVLVW", name: "Evolv Technologies Holdings, Inc. - Warrant" },
-    { symbol: "EVMT", name: "Invesco Electric Vehicle Metals Commodity Strategy No K-1 ETF" },
-    { symbol: "EVO", name: "Evotec SE - American Depositary Shares each representing 1/2 of one ordinary share" },
-    { symbol: "EVOK", name: "Evoke Pharma, Inc. - Common Stock" },
-    { symbol: "EVRG", name: "Evergy, Inc. - Common Stock" },
-    { symbol: "EVSD", name: "Eaton Vance Short Duration Income ETF" },
-    { symbol: "EVTV", name: "Envirotech Vehicles, Inc. - Common stock" },
-    { symbol: "EVYM", name: "Eaton Vance High Income Municipal ETF" },
-    { symbol: "EWBC", name: "East West Bancorp, Inc. - Common Stock" },
-    { symbol: "EWCZ", name: "European Wax Center, Inc. - Class A Common Stock" },
-    { symbol: "EWJV", name: "iShares MSCI Japan Value ETF" },
-    { symbol: "EWTX", name: "Edgewise Therapeutics, Inc. - Common Stock" },
-    { symbol: "EWZS", name: "iShares MSCI Brazil Small-Cap ETF" },
-    { symbol: "EXAS", name: "Exact Sciences Corporation - Common Stock" },
-    { symbol: "EXC", name: "Exelon Corporation - Common Stock" },
-    { symbol: "EXE", name: "Expand Energy Corporation - Common Stock" },
-    { symbol: "EXEEL", name: "Expand Energy Corporation - Class C Warrants" },
-    { symbol: "EXEEW", name: "Expand Energy Corporation - Class A Warrants" },
-    { symbol: "EXEEZ", name: "Expand Energy Corporation - Class B Warrants" },
-    { symbol: "EXEL", name: "Exelixis, Inc. - Common Stock" },
-    { symbol: "EXFY", name: "Expensify, Inc. - Class A Common Stock" },
-    { symbol: "EXLS", name: "ExlService Holdings, Inc. - Common Stock" },
-    { symbol: "EXOZ", name: "eXoZymes Inc. - Common Stock" },
-    { symbol: "EXPE", name: "Expedia Group, Inc. - Common Stock" },
-    { symbol: "EXPI", name: "eXp World Holdings, Inc. - Common Stock" },
-    { symbol: "EXPO", name: "Exponent, Inc. - Common Stock" },
-    { symbol: "EXTR", name: "Extreme Networks, Inc. - Common Stock" },
-    { symbol: "EXUS", name: "Macquarie Focused International Core ETF" },
-    { symbol: "EYE", name: "National Vision Holdings, Inc. - Common Stock" },
-    { symbol: "EYEG", name: "AB Corporate Bond ETF" },
-    { symbol: "EYPT", name: "EyePoint Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "EZGO", name: "EZGO Technologies Ltd. - Ordinary Shares" },
-    { symbol: "EZPW", name: "EZCORP, Inc. - Class A Non-Voting Common Stock" },
-    { symbol: "FA", name: "First Advantage Corporation - Common Stock" },
-    { symbol: "FAAR", name: "First Trust Alternative Absolute Return Strategy ETF" },
-    { symbol: "FAAS", name: "DigiAsia Corp. - Ordinary Shares" },
-    { symbol: "FAASW", name: "DigiAsia Corp. - Warrant" },
-    { symbol: "FAB", name: "First Trust Multi Cap Value AlphaDEX Fund" },
-    { symbol: "FACT", name: "FACT II Acquisition Corp. - Class A Ordinary Shares" },
-    { symbol: "FACTU", name: "FACT II Acquisition Corp. - Unit" },
-    { symbol: "FACTW", name: "FACT II Acquisition Corp. - Warrant" },
-    { symbol: "FAD", name: "First Trust Multi Cap Growth AlphaDEX Fund" },
-    { symbol: "FALN", name: "iShares Fallen Angels USD Bond ETF" },
-    { symbol: "FAMI", name: "Farmmi, INC. - Ordinary Shares" },
-    { symbol: "FANG", name: "Diamondback Energy, Inc. - Common Stock" },
-    { symbol: "FARM", name: "Farmer Brothers Company - Common Stock" },
-    { symbol: "FAST", name: "Fastenal Company - Common Stock" },
-    { symbol: "FAT", name: "FAT Brands Inc. - Common Stock" },
-    { symbol: "FATBB", name: "FAT Brands Inc. - Class B Common Stock" },
-    { symbol: "FATBP", name: "FAT Brands Inc. - 8.25% Series B Cumulative Preferred Stock" },
-    { symbol: "FATE", name: "Fate Therapeutics, Inc. - Common Stock" },
-    { symbol: "FATN", name: "FatPipe, Inc. - common stock" },
-    { symbol: "FBGL", name: "FBS Global Limited - Ordinary Shares" },
-    { symbol: "FBIO", name: "Fortress Biotech, Inc. - Common Stock" },
-    { symbol: "FBIOP", name: "Fortress Biotech, Inc. - 9.375% Series A Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "FBIZ", name: "First Business Financial Services, Inc. - Common Stock" },
-    { symbol: "FBL", name: "GraniteShares 2x Long META Daily ETF" },
-    { symbol: "FBLA", name: "FB Bancorp, Inc. - Common Stock" },
-    { symbol: "FBLG", name: "FibroBiologics, Inc. - Common Stock" },
-    { symbol: "FBNC", name: "First Bancorp - Common Stock" },
-    { symbol: "FBOT", name: "Fidelity Disruptive Automation ETF" },
-    { symbol: "FBRX", name: "Forte Biosciences, Inc.  - Common Stock" },
-    { symbol: "FBYD", name: "Falcon's Beyond Global, Inc. - Class A Common Stock" },
-    { symbol: "FBYDW", name: "Falcon's Beyond Global, Inc. - Warrants" },
-    { symbol: "FCA", name: "First Trust China AlphaDEX Fund" },
-    { symbol: "FCAL", name: "First Trust California Municipal High income ETF" },
-    { symbol: "FCAP", name: "First Capital, Inc. - Common Stock" },
-    { symbol: "FCBC", name: "First Community Bankshares, Inc. - Common Stock" },
-    { symbol: "FCCO", name: "First Community Corporation - Common Stock" },
-    { symbol: "FCEF", name: "First Trust Income Opportunities ETF" },
-    { symbol: "FCEL", name: "FuelCell Energy, Inc. - Common Stock" },
-    { symbol: "FCFS", name: "FirstCash Holdings, Inc. - Common Stock" },
-    { symbol: "FCHL", name: "Fitness Champs Holdings Limited - Common Stock" },
-    { symbol: "FCNCA", name: "First Citizens BancShares, Inc. - Class A Common Stock" },
-    { symbol: "FCNCO", name: "First Citizens BancShares, Inc. - 5.625% Non-Cumulative Perpetual Preferred Stock, Series C" },
-    { symbol: "FCNCP", name: "First Citizens BancShares, Inc. - Depositary Shares Each Representing a 1/40th Interest in a Share of 5.375% Non-Cumulative Perpetual Preferred Stock, Series A" },
-    { symbol: "FCTE", name: "SMI 3Fourteen Full-Cycle Trend ETF" },
-    { symbol: "FCUV", name: "Focus Universal Inc. - Common Stock" },
-    { symbol: "FCVT", name: "First Trust SSI Strategic Convertible Securities ETF" },
-    { symbol: "FDBC", name: "Fidelity D & D Bancorp, Inc. - Common Stock" },
-    { symbol: "FDCF", name: "Fidelity Disruptive Communications ETF" },
-    { symbol: "FDFF", name: "Fidelity Disruptive Finance ETF" },
-    { symbol: "FDIF", name: "Fidelity Disruptors ETF" },
-    { symbol: "FDIG", name: "Fidelity Crypto Industry and Digital Payments ETF" },
-    { symbol: "FDIV", name: "MarketDesk Focused U.S. Dividend ETF" },
-    { symbol: "FDMT", name: "4D Molecular Therapeutics, Inc. - Common Stock" },
-    { symbol: "FDNI", name: "First Trust Dow Jones International Internet ETF" },
-    { symbol: "FDSB", name: "Fifth District Bancorp, Inc. - Common Stock" },
-    { symbol: "FDT", name: "First Trust Developed Markets Ex-US AlphaDEX Fund" },
-    { symbol: "FDTS", name: "First Trust Developed Markets ex-US Small Cap AlphaDEX Fund" },
-    { symbol: "FDTX", name: "Fidelity Disruptive Technology ETF" },
-    { symbol: "FDUS", name: "Fidus Investment Corporation - Closed End Fund" },
-    { symbol: "FEAM", name: "5E Advanced Materials, Inc. - Common Stock" },
-    { symbol: "FEAT", name: "YieldMax Dorsey Wright Featured 5 Income ETF" },
-    { symbol: "FEBO", name: "Fenbo Holdings Limited - Ordinary Shares" },
-    { symbol: "FEIM", name: "Frequency Electronics, Inc. - Common Stock" },
-    { symbol: "FELE", name: "Franklin Electric Co., Inc. - Common Stock" },
-    { symbol: "FEM", name: "First Trust Emerging Markets AlphaDEX Fund" },
-    { symbol: "FEMB", name: "First Trust Emerging Markets Local Currency Bond ETF" },
-    { symbol: "FEMS", name: "First Trust Emerging Markets Small Cap AlphaDEX Fund" },
-    { symbol: "FEMY", name: "Femasys Inc. - Common Stock" },
-    { symbol: "FENC", name: "Fennec Pharmaceuticals Inc. - Common Stock" },
-    { symbol: "FEP", name: "First Trust Europe AlphaDEX Fund" },
-    { symbol: "FEPI", name: "REX FANG & Innovation Equity Premium Income ETF" },
-    { symbol: "FER", name: "Ferrovial SE - Ordinary Shares" },
-    { symbol: "FERA", name: "Fifth Era Acquisition Corp I - Class A Ordinary Shares" },
-    { symbol: "FERAR", name: "Fifth Era Acquisition Corp I - Rights" },
-    { symbol: "FERAU", name: "Fifth Era Acquisition Corp I - Units" },
-    { symbol: "FEUZ", name: "First Trust Eurozone AlphaDEX ETF" },
-    { symbol: "FEX", name: "First Trust Large Cap Core AlphaDEX Fund" },
-    { symbol: "FFAI", name: "Faraday Future Intelligent Electric Inc. - Class A Common Stock" },
-    { symbol: "FFAIW", name: "Faraday Future Intelligent Electric Inc. - Warrant" },
-    { symbol: "FFBC", name: "First Financial Bancorp. - Common Stock" },
-    { symbol: "FFIC", name: "Flushing Financial Corporation - Common Stock" },
-    { symbol: "FFIN", name: "First Financial Bankshares, Inc. - Common Stock" },
-    { symbol: "FFIV", name: "F5, Inc. - Common Stock" },
-    { symbol: "FFUT", name: "Fidelity Managed Futures ETF" },
-    { symbol: "FGBI", name: "First Guaranty Bancshares, Inc. - Common Stock" },
-    { symbol: "FGBIP", name: "First Guaranty Bancshares, Inc. - 6.75% Series A Fixed-Rate Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "FGEN", name: "FibroGen, Inc - Common Stock" },
-    { symbol: "FGI", name: "FGI Industries Ltd. - Ordinary Shares" },
-    { symbol: "FGIWW", name: "FGI Industries Ltd. - warrant" },
-    { symbol: "FGL", name: "Founder Group Limited - Class A Ordinary Shares" },
-    { symbol: "FGM", name: "First Trust Germany AlphaDEX Fund" },
-    { symbol: "FGMC", name: "FG Merger II Corp. - Common stock" },
-    { symbol: "FGMCR", name: "FG Merger II Corp. - Rights" },
-    { symbol: "FGMCU", name: "FG Merger II Corp. - Unit" },
-    { symbol: "FGNX", name: "FG Nexus Inc. - Common Stock" },
-    { symbol: "FGNXP", name: "FG Nexus Inc. - 8.00% Cumulative Series A Preferred Stock" },
-    { symbol: "FGSI", name: "FT Vest Growth Strength & Target Income ETF" },
-    { symbol: "FHB", name: "First Hawaiian, Inc. - Common Stock" },
-    { symbol: "FHTX", name: "Foghorn Therapeutics Inc. - Common Stock" },
-    { symbol: "FIBK", name: "First Interstate BancSystem, Inc. - Common Stock" },
-    { symbol: "FICS", name: "First Trust International Developed Capital Strength ETF" },
-    { symbol: "FID", name: "First Trust S&P International Dividend Aristocrats ETF" },
-    { symbol: "FIEE", name: "FiEE, Inc - Common Stock" },
-    { symbol: "FIGX", name: "FIGX Capital Acquisition Corp. - Class A ordinary share" },
-    { symbol: "FIGXU", name: "FIGX Capital Acquisition Corp. - Units" },
-    { symbol: "FIGXW", name: "FIGX Capital Acquisition Corp. - one-half of one redeemable warrant." },
-    { symbol: "FINE", name: "Themes European Luxury ETF" },
-    { symbol: "FINW", name: "FinWise Bancorp - Common Stock" },
-    { symbol: "FINX", name: "Global X FinTech ETF" },
-    { symbol: "FIP", name: "FTAI Infrastructure Inc. - Common Stock" },
-    { symbol: "FISI", name: "Financial Institutions, Inc. - Common Stock" },
-    { symbol: "FITB", name: "Fifth Third Bancorp - Common Stock" },
-    { symbol: "FITBI", name: "Fifth Third Bancorp - Depositary Share repstg 1/1000th Ownership Interest Perp Pfd Series I" },
-    { symbol: "FITBO", name: "Fifth Third Bancorp - Depositary Shares each representing a 1/1000th ownership interest in a share of Non-Cumulative Perpetual Preferred Stock, Series K" },
-    { symbol: "FITBP", name: "Fifth Third Bancorp - Depositary Shares each representing 1/40th share of Fifth Third 6.00% Non-Cumulative Perpetual Class B Preferred Stock, Series A" },
-    { symbol: "FIVE", name: "Five Below, Inc. - Common Stock" },
-    { symbol: "FIVN", name: "Five9, Inc. - Common Stock" },
-    { symbol: "FIVY", name: "YieldMax Dorsey Wright Hybrid 5 Income ETF" },
-    { symbol: "FIXD", name: "First Trust Smith Opportunistic Fixed Income ETF" },
-    { symbol: "FIZZ", name: "National Beverage Corp. - Common Stock" },
-    { symbol: "FJP", name: "First Trust Japan AlphaDEX Fund" },
-    { symbol: "FKU", name: "First Trust United Kingdom AlphaDEX Fund" },
-    { symbol: "FKWL", name: "Franklin Wireless Corp. - common stock" },
-    { symbol: "FLD", name: "Fold Holdings, Inc. - Class A Common Stock" },
-    { symbol: "FLDB", name: "Fidelity Low Duration Bond ETF" },
-    { symbol: "FLDDW", name: "Fold Holdings, Inc. - Warrant" },
-    { symbol: "FLEX", name: "Flex Ltd. - Ordinary Shares" },
-    { symbol: "FLGC", name: "Flora Growth Corp. - Common Stock" },
-    { symbol: "FLGT", name: "Fulgent Genetics, Inc. - Common Stock" },
-    { symbol: "FLL", name: "Full House Resorts, Inc. - Common Stock" },
-    { symbol: "FLN", name: "First Trust Latin America AlphaDEX Fund" },
-    { symbol: "FLNC", name: "Fluence Energy, Inc. - Class A Common Stock" },
-    { symbol: "FLNT", name: "Fluent, Inc. - Common Stock" },
-    { symbol: "FLUX", name: "Flux Power Holdings, Inc. - Common Stock" },
-    { symbol: "FLWS", name: "1-800-FLOWERS.COM, Inc. - Class A Common Stock" },
-    { symbol: "FLX", name: "BingEx Limited - American Depositary Shares" },
-    { symbol: "FLXS", name: "Flexsteel Industries, Inc. - Common Stock" },
-    { symbol: "FLY", name: "Firefly Aerospace Inc. - Common Stock" },
-    { symbol: "FLYE", name: "Fly-E Group, Inc. - Common Stock" },
-    { symbol: "FLYW", name: "Flywire Corporation - Voting Common Stock" },
-    { symbol: "FMAO", name: "Farmers & Merchants Bancorp, Inc. - Common Stock" },
-    { symbol: "FMB", name: "First Trust Managed Municipal ETF" },
-    { symbol: "FMBH", name: "First Mid Bancshares, Inc. - Common Stock" },
-    { symbol: "FMED", name: "Fidelity Disruptive Medicine ETF" },
-    { symbol: "FMET", name: "Fidelity Metaverse ETF" },
-    { symbol: "FMFC", name: "Kandal M Venture Limited - Class A ordinary Shares" },
-    { symbol: "FMHI", name: "First Trust Municipal High Income ETF" },
-    { symbol: "FMNB", name: "Farmers National Banc Corp. - Common Stock" },
-    { symbol: "FMST", name: "Foremost Clean Energy Ltd. - Common Shares" },
-    { symbol: "FMSTW", name: "Foremost Clean Energy Ltd. - Warrant" },
-    { symbol: "FMTM", name: "MarketDesk Focused U.S. Momentum ETF" },
-    { symbol: "FMUB", name: "Fidelity Municipal Bond Opportunities ETF" },
-    { symbol: "FMUN", name: "Fidelity Systematic Municipal Bond Index ETF" },
-    { symbol: "FNGR", name: "FingerMotion, Inc. - common stock" },
-    { symbol: "FNK", name: "First Trust Mid Cap Value AlphaDEX Fund" },
-    { symbol: "FNKO", name: "Funko, Inc. - Class A Common Stock" },
-    { symbol: "FNLC", name: "First Bancorp, Inc (ME) - Common Stock" },
-    { symbol: "FNWB", name: "First Northwest Bancorp - Common Stock" },
-    { symbol: "FNWD", name: "Finward Bancorp - common stock" },
-    { symbol: "FNX", name: "First Trust Mid Cap Core AlphaDEX Fund" },
-    { symbol: "FNY", name: "First Trust Mid Cap Growth AlphaDEX Fund" },
-    { symbol: "FOLD", name: "Amicus Therapeutics, Inc. - Common Stock" },
-    { symbol: "FONR", name: "Fonar Corporation - Common Stock" },
-    { symbol: "FORA", name: "Forian Inc. - Common Stock" },
-    { symbol: "FORD", name: "Forward Industries, Inc. - Common Stock" },
-    { symbol: "FORL", name: "Four Leaf Acquisition Corporation - Class A Common Stock" },
-    { symbol: "FORLU", name: "Four Leaf Acquisition Corporation - Unit" },
-    { symbol: "FORLW", name: "Four Leaf Acquisition Corporation - Warrants" },
-    { symbol: "FORM", name: "FormFactor, Inc. - Common Stock" },
-    { symbol: "FORR", name: "Forrester Research, Inc. - Common Stock" },
-    { symbol: "FORTY", name: "Formula Systems (1985) Ltd. - American Depositary Shares" },
-    { symbol: "FOSL", name: "Fossil Group, Inc. - Common Stock" },
-    { symbol: "FOSLL", name: "Fossil Group, Inc. - 7% Senior Notes due 2026" },
-    { symbol: "FOX", name: "Fox Corporation - Class B Common Stock" },
-    { symbol: "FOXA", name: "Fox Corporation - Class A Common Stock" },
-    { symbol: "FOXF", name: "Fox Factory Holding Corp. - Common Stock" },
-    { symbol: "FOXX", name: "Foxx Development Holdings Inc. - Common Stock" },
-    { symbol: "FOXXW", name: "Foxx Development Holdings Inc. - Warrant" },
-    { symbol: "FPA", name: "First Trust Asia Pacific Ex-Japan AlphaDEX Fund" },
-    { symbol: "FPAY", name: "FlexShopper, Inc. - Common Stock" },
-    { symbol: "FPXE", name: "First Trust IPOX Europe Equity Opportunities ETF" },
-    { symbol: "FPXI", name: "First Trust International Equity Opportunities ETF" },
-    { symbol: "FRAF", name: "Franklin Financial Services Corporation - Common Stock" },
-    { symbol: "FRBA", name: "First Bank  - Common Stock" },
-    { symbol: "FRD", name: "Friedman Industries Inc. - Common Stock" },
-    { symbol: "FRDD", name: "Direxion Daily F Bear 1X ETF" },
-    { symbol: "FRDU", name: "Direxion Daily F Bull 2X ETF" },
-    { symbol: "FRGT", name: "Freight Technologies, Inc. - Ordinary Shares" },
-    { symbol: "FRHC", name: "Freedom Holding Corp. - Common Stock" },
-    { symbol: "FRME", name: "First Merchants Corporation - Common Stock" },
-    { symbol: "FRMEP", name: "First Merchants Corporation - Depository Shares, each representing a 1/100th interest in a share of 7.50% Non-Cumulative Perpetual Preferred Stock, A" },
-    { symbol: "FROG", name: "JFrog Ltd. - Ordinary shares" },
-    { symbol: "FRPH", name: "FRP Holdings, Inc. - Common Stock" },
-    { symbol: "FRPT", name: "Freshpet, Inc. - Common Stock" },
-    { symbol: "FRSH", name: "Freshworks Inc. - Class A Common Stock" },
-    { symbol: "FRST", name: "Primis Financial Corp. - Common Stock" },
-    { symbol: "FRSX", name: "Foresight Autonomous Holdings Ltd. - American Depositary Shares" },
-    { symbol: "FSBC", name: "Five Star Bancorp - Common Stock" },
-    { symbol: "FSBW", name: "FS Bancorp, Inc. - Common Stock" },
-    { symbol: "FSCS", name: "First Trust SMID Capital Strength ETF" },
-    { symbol: "FSEA", name: "First Seacoast Bancorp, Inc. - Common Stock" },
-    { symbol: "FSFG", name: "First Savings Financial Group, Inc. - Common Stock" },
-    { symbol: "FSGS", name: "First Trust SMID Growth Strength ETF" },
-    { symbol: "FSHP", name: "Flag Ship Acquisition Corp. - Ordinary Shares" },
-    { symbol: "FSHPR", name: "Flag Ship Acquisition Corp. - Right" },
-    { symbol: "FSHPU", name: "Flag Ship Acquisition Corp. - Unit" },
-    { symbol: "FSLR", name: "First Solar, Inc. - Common Stock" },
-    { symbol: "FSTR", name: "L.B. Foster Company - Common Stock" },
-    { symbol: "FSUN", name: "FirstSun Capital Bancorp - Common Stock" },
-    { symbol: "FSV", name: "FirstService Corporation - Common Shares" },
-    { symbol: "FSZ", name: "First Trust Switzerland AlphaDEX Fund" },
-    { symbol: "FTA", name: "First Trust Large Cap Value AlphaDEX Fund" },
-    { symbol: "FTAG", name: "First Trust Indxx Global Agriculture ETF" },
-    { symbol: "FTAI", name: "FTAI Aviation Ltd. - Common Stock" },
-    { symbol: "FTAIM", name: "FTAI Aviation Ltd. - 9.500% Fixed-Rate Reset Series D Cumulative Perpetual Redeemable Preferred Shares" },
-    { symbol: "FTAIN", name: "FTAI Aviation Ltd. - 8.25% Fixed-Rate Reset Series C Cumulative Perpetual Redeemable Preferred Shares" },
-    { symbol: "FTC", name: "First Trust Large Cap Growth AlphaDEX Fund" },
-    { symbol: "FTCI", name: "FTC Solar, Inc. - Common Stock" },
-    { symbol: "FTCS", name: "First Trust Capital Strength ETF" },
-    { symbol: "FTDR", name: "Frontdoor, Inc. - Common Stock" },
-    { symbol: "FTDS", name: "First Trust Dividend Strength ETF" },
-    { symbol: "FTEK", name: "Fuel Tech, Inc. - Common Stock" },
-    { symbol: "FTEL", name: "Fitell Corporation - Class A Ordinary Shares" },
-    { symbol: "FTFT", name: "Future FinTech Group Inc. - Common Stock" },
-    { symbol: "FTGC", name: "First Trust Global Tactical Commodity Strategy Fund" },
-    { symbol: "FTGS", name: "First Trust Growth Strength ETF" },
-    { symbol: "FTHI", name: "First Trust BuyWrite Income ETF" },
-    { symbol: "FTHM", name: "Fathom Holdings Inc. - Common Stock" },
-    { symbol: "FTLF", name: "FitLife Brands, Inc. - Common Stock" },
-    { symbol: "FTNT", name: "Fortinet, Inc. - Common Stock" },
-    { symbol: "FTQI", name: "First Trust Nasdaq BuyWrite Income ETF" },
-    { symbol: "FTRE", name: "Fortrea Holdings Inc. - Common Stock" },
-    { symbol: "FTRI", name: "First Trust Indxx Global Natural Resources Income ETF" },
-    { symbol: "FTRK", name: "FAST TRACK GROUP - Ordinary shares" },
-    { symbol: "FTSL", name: "First Trust Senior Loan Fund" },
-    { symbol: "FTSM", name: "First Trust Enhanced Short Maturity ETF" },
-    { symbol: "FTXG", name: "First Trust Nasdaq Food & Beverage ETF" },
-    { symbol: "FTXH", name: "First Trust Nasdaq Pharmaceuticals ETF" },
-    { symbol: "FTXL", name: "First Trust Nasdaq Semiconductor ETF" },
-    { symbol: "FTXN", name: "First Trust Nasdaq Oil & Gas ETF" },
-    { symbol: "FTXO", name: "First Trust Nasdaq Bank ETF" },
-    { symbol: "FTXR", name: "First Trust Nasdaq Transportation ETF" },
-    { symbol: "FUFU", name: "BitFuFu Inc. - Class A Ordinary Shares" },
-    { symbol: "FUFUW", name: "BitFuFu Inc. - Warrant" },
-    { symbol: "FULC", name: "Fulcrum Therapeutics, Inc. - Common Stock" },
-    { symbol: "FULT", name: "Fulton Financial Corporation - Common Stock" },
-    { symbol: "FULTP", name: "Fulton Financial Corporation - Depositary Shares Each Representing a 1/40th Interest in a Share of Fixed Rate Non-Cumulative Perpetual Preferred Stock, Series A" },
-    { symbol: "FUNC", name: "First United Corporation - Common Stock" },
-    { symbol: "FUND", name: "Sprott Focus Trust, Inc. - Closed End Fund" },
-    { symbol: "FUSB", name: "First US Bancshares, Inc. - Common Stock" },
-    { symbol: "FUTU", name: "Futu Holdings Limited - American Depositary Shares" },
-    { symbol: "FV", name: "First Trust Dorsey Wright Focus 5 ETF" },
-    { symbol: "FVC", name: "First Trust Dorsey Wright Dynamic Focus 5 ETF" },
-    { symbol: "FVCB", name: "FVCBankcorp, Inc. - Common Stock" },
-    { symbol: "FVN", name: "Future Vision II Acquisition Corporation - Ordinary Shares" },
-    { symbol: "FVNNR", name: "Future Vision II Acquisition Corporation - Right" },
-    { symbol: "FVNNU", name: "Future Vision II Acquisition Corporation - Units" },
-    { symbol: "FWONA", name: "Liberty Media Corporation - Series A Liberty Formula One Common Stock" },
-    { symbol: "FWONK", name: "Liberty Media Corporation - Series C Liberty Formula One Common Stock" },
-    { symbol: "FWRD", name: "Forward Air Corporation - Common Stock" },
-    { symbol: "FWRG", name: "First Watch Restaurant Group, Inc. - Common Stock" },
-    { symbol: "FXNC", name: "First National Corporation - Common Stock" },
-    { symbol: "FYBR", name: "Frontier Communications Parent, Inc. - Common Stock" },
-    { symbol: "FYC", name: "First Trust Small Cap Growth AlphaDEX Fund" },
-    { symbol: "FYT", name: "First Trust Small Cap Value AlphaDEX Fund" },
-    { symbol: "FYX", name: "First Trust Small Cap Core AlphaDEX Fund" },
-    { symbol: "GABC", name: "German American Bancorp, Inc. - Common Stock" },
-    { symbol: "GAIA", name: "Gaia, Inc. - Class A Common Stock" },
-    { symbol: "GAIN", name: "Gladstone Investment Corporation - Business Development Company" },
-    { symbol: "GAINI", name: "Gladstone Investment Corporation - 7.875% Notes due 2030" },
-    { symbol: "GAINL", name: "Gladstone Investment Corporation - 8.00% Notes due 2028" },
-    { symbol: "GAINN", name: "Gladstone Investment Corporation - 5.00% Notes Due 2026" },
-    { symbol: "GAINZ", name: "Gladstone Investment Corporation - 4.875% Notes due 2028" },
-    { symbol: "GALT", name: "Galectin Therapeutics Inc. - Common Stock" },
-    { symbol: "GAMB", name: "Gambling.com Group Limited - Ordinary Shares" },
-    { symbol: "GAME", name: "GameSquare Holdings, Inc. - Common stock" },
-    { symbol: "GANX", name: "Gain Therapeutics, Inc. - Common Stock" },
-    { symbol: "GASS", name: "StealthGas, Inc. - common stock" },
-    { symbol: "GAUZ", name: "Gauzy Ltd. - Ordinary Shares" },
-    { symbol: "GBDC", name: "Golub Capital BDC, Inc. - Closed End Fund" },
-    { symbol: "GBFH", name: "GBank Financial Holdings Inc. - Common Stock" },
-    { symbol: "GBIO", name: "Generation Bio Co. - Common stock" },
-    { symbol: "GBUG", name: "Sprott Active Gold & Silver Miners ETF" },
-    { symbol: "GCBC", name: "Greene County Bancorp, Inc. - Common Stock" },
-    { symbol: "GCL", name: "GCL Global Holdings Ltd - Ordinary Shares" },
-    { symbol: "GCLWW", name: "GCL Global Holdings Ltd - Warrants" },
-    { symbol: "GCMG", name: "GCM Grosvenor Inc. - Class A Common Stock" },
-    { symbol: "GCMGW", name: "GCM Grosvenor Inc. - Warrant" },
-    { symbol: "GCT", name: "GigaCloud Technology Inc - Class A Ordinary Shares" },
-    { symbol: "GCTK", name: "GlucoTrack, Inc. - Common Stock" },
-    { symbol: "GDC", name: "GD Culture Group Limited - Common Stock" },
-    { symbol: "GDEN", name: "Golden Entertainment, Inc. - Common Stock" },
-    { symbol: "GDEV", name: "GDEV Inc. - Ordinary Shares" },
-    { symbol: "GDEVW", name: "GDEV Inc. - Warrant" },
-    { symbol: "GDHG", name: "Golden Heaven Group Holdings Ltd.  - Class A Ordinary Shares" },
-    { symbol: "GDRX", name: "GoodRx Holdings, Inc. - Class A Common Stock" },
-    { symbol: "GDS", name: "GDS Holdings Limited - American Depositary Shares" },
-    { symbol: "GDTC", name: "CytoMed Therapeutics Limited - Ordinary Shares" },
-    { symbol: "GDYN", name: "Grid Dynamics Holdings, Inc. - Class A Common Stock" },
-    { symbol: "GECC", name: "Great Elm Capital Corp. - Closed End Fund" },
-    { symbol: "GECCH", name: "Great Elm Capital Corp. - 8.125% Notes Due 2029" },
-    { symbol: "GECCI", name: "Great Elm Capital Corp. - 8.50% NOTES DUE 2029" },
-    { symbol: "GECCO", name: "Great Elm Capital Corp. - 5.875% Notes due 2026" },
-    { symbol: "GECCZ", name: "Great Elm Capital Corp. - 8.75% Notes due 2028" },
-    { symbol: "GEG", name: "Great Elm Group, Inc.  - Common Stock" },
-    { symbol: "GEGGL", name: "Great Elm Group, Inc.  - 7.25% Notes due 2027" },
-    { symbol: "GEHC", name: "GE HealthCare Technologies Inc. - Common Stock" },
-    { symbol: "GELS", name: "Gelteq Limited - Ordinary Shares" },
-    { symbol: "GEME", name: "Pacific North of South EM Equity Active ETF" },
-    { symbol: "GEN", name: "Gen Digital Inc. - Common Stock" },
-    { symbol: "GENK", name: "GEN Restaurant Group, Inc. - Class A Common Stock" },
-    { symbol: "GENVR", name: "Gen Digital Inc. - Contingent Value Rights" },
-    { symbol: "GEOS", name: "Geospace Technologies Corporation - Common Stock" },
-    { symbol: "GERN", name: "Geron Corporation - Common Stock" },
-    { symbol: "GEVO", name: "Gevo, Inc. - Common Stock" },
-    { symbol: "GFAI", name: "Guardforce AI Co., Limited - Ordinary Shares" },
-    { symbol: "GFAIW", name: "Guardforce AI Co., Limited - Warrant" },
-    { symbol: "GFGF", name: "Guru Favorite Stocks ETF" },
-    { symbol: "GFLW", name: "VictoryShares Free Cash Flow Growth ETF" },
-    { symbol: "GFS", name: "GlobalFoundries Inc. - Ordinary Share" },
-    { symbol: "GGAL", name: "Grupo Financiero Galicia S.A. - American Depositary Shares, Class B Shares underlying" },
-    { symbol: "GGLL", name: "Direxion Daily GOOGL Bull 2X Shares" },
-    { symbol: "GGLS", name: "Direxion Daily GOOGL Bear 1X Shares" },
-    { symbol: "GGR", name: "Gogoro Inc. - Ordinary Shares" },
-    { symbol: "GGROW", name: "Gogoro Inc. - Warrant" },
-    { symbol: "GH", name: "Guardant Health, Inc. - Common Stock" },
-    { symbol: "GHRS", name: "GH Research PLC - Ordinary Shares" },
-    { symbol: "GIBO", name: "GIBO Holdings Limited - Class A Ordinary Shares" },
-    { symbol: "GIBOW", name: "GIBO Holdings Limited - Warrants" },
-    { symbol: "GIFI", name: "Gulf Island Fabrication, Inc. - Common Stock" },
-    { symbol: "GIFT", name: "Giftify, Inc. - Common Stock" },
-    { symbol: "GIG", name: "GigCapital7 Corp. - Class A Ordinary Share" },
-    { symbol: "GIGGU", name: "GigCapital7 Corp. - Unit" },
-    { symbol: "GIGGW", name: "GigCapital7 Corp. - Warrant" },
-    { symbol: "GIGM", name: "GigaMedia Limited - Ordinary Shares" },
-    { symbol: "GIII", name: "G-III Apparel Group, LTD. - Common Stock" },
-    { symbol: "GILD", name: "Gilead Sciences, Inc. - Common Stock" },
-    { symbol: "GILT", name: "Gilat Satellite Networks Ltd. - Ordinary Shares" },
-    { symbol: "GIND", name: "Goldman Sachs India Equity ETF" },
-    { symbol: "GINX", name: "SGI Enhanced Global Income ETF" },
-    { symbol: "GIPR", name: "Generation Income Properties Inc. - Common stock" },
-    { symbol: "GIPRW", name: "Generation Income Properties Inc. - Warrant" },
-    { symbol: "GITS", name: "Global Interactive Technologies, Inc. Common Stock - Common Stock" },
-    { symbol: "GKAT", name: "Scharf Global Opportunity ETF" },
-    { symbol: "GLAD", name: "Gladstone Capital Corporation - Closed End Fund" },
-    { symbol: "GLADZ", name: "Gladstone Capital Corporation - 7.75% Notes due 2028" },
-    { symbol: "GLBE", name: "Global-E Online Ltd. - ordinary shares" },
-    { symbol: "GLBS", name: "Globus Maritime Limited - Common Stock" },
-    { symbol: "GLBZ", name: "Glen Burnie Bancorp - Common Stock" },
-    { symbol: "GLCR", name: "GlacierShares Nasdaq Iceland ETF" },
-    { symbol: "GLDD", name: "Great Lakes Dredge & Dock Corporation - Common Stock" },
-    { symbol: "GLDI", name: "ETRACS Gold Shares Covered Call ETNs due February 2, 2033" },
-    { symbol: "GLDY", name: "Defiance Gold Enhanced Options Income ETF" },
-    { symbol: "GLE", name: "Global Engine Group Holding Limited - Class A Ordinary Shares" },
-    { symbol: "GLGG", name: "Leverage Shares 2X Long GLXY Daily ETF" },
-    { symbol: "GLIBA", name: "GCI Liberty, Inc. - Series A GCI Group Common Stock" },
-    { symbol: "GLIBK", name: "GCI Liberty, Inc. - Series C GCI Group Common Stock" },
-    { symbol: "GLMD", name: "Galmed Pharmaceuticals Ltd. - Ordinary Shares" },
-    { symbol: "GLNG", name: "Golar LNG Limited - Common Shares" },
-    { symbol: "GLOW", name: "VictoryShares WestEnd Global Equity ETF" },
-    { symbol: "GLPG", name: "Galapagos NV - American Depositary Shares" },
-    { symbol: "GLPI", name: "Gaming and Leisure Properties, Inc. - Common Stock" },
-    { symbol: "GLRE", name: "Greenlight Reinsurance, Ltd. - Class A Ordinary Shares" },
-    { symbol: "GLSI", name: "Greenwich LifeSciences, Inc. - Common stock" },
-    { symbol: "GLTO", name: "Galecto, Inc. - Common Stock" },
-    { symbol: "GLUE", name: "Monte Rosa Therapeutics, Inc. - Common Stock" },
-    { symbol: "GLXG", name: "Galaxy Payroll Group Limited - Class A Ordinary Shares" },
-    { symbol: "GLXY", name: "Galaxy Digital Inc. - Class A common stock" },
-    { symbol: "GMAB", name: "Genmab A/S - American Depositary Shares" },
-    { symbol: "GMGI", name: "Golden Matrix Group, Inc. - Common Stock" },
-    { symbol: "GMHS", name: "Gamehaus Holdings Inc. - Class A Ordinary Shares" },
-    { symbol: "GMM", name: "Global Mofy AI Limited  - Class A Ordinary Shares" },
-    { symbol: "GNFT", name: "GENFIT S.A. - American Depositary Shares" },
-    { symbol: "GNLN", name: "Greenlane Holdings, Inc. - Class A Common Stock" },
-    { symbol: "GNLX", name: "Genelux Corporation - Common Stock" },
-    { symbol: "GNMA", name: "iShares GNMA Bond ETF" },
-    { symbol: "GNOM", name: "Global X Genomics & Biotechnology ETF" },
-    { symbol: "GNPX", name: "Genprex, Inc. - Common Stock" },
-    { symbol: "GNSS", name: "Genasys Inc. - Common Stock" },
-    { symbol: "GNTA", name: "Genenta Science S.p.A. - American Depositary Shares" },
-    { symbol: "GNTX", name: "Gentex Corporation - Common Stock" },
-    { symbol: "GO", name: "Grocery Outlet Holding Corp. - Common Stock" },
-    { symbol: "GOCO", name: "GoHealth, Inc. - Class A Common Stock" },
-    { symbol: "GOGO", name: "Gogo Inc. - Common Stock" },
-    { symbol: "GOOD", name: "Gladstone Commercial Corporation - Real Estate Investment Trust" },
-    { symbol: "GOODN", name: "Gladstone Commercial Corporation - 6.625% Series E Cumulative Redeemable Preferred Stock" },
-    { symbol: "GOODO", name: "Gladstone Commercial Corporation - 6.00% Series G Cumulative Redeemable Preferred Stock, par value $0.001 per share" },
-    { symbol: "GOOG", name: "Alphabet Inc. - Class C Capital Stock" },
-    { symbol: "GOOGL", name: "Alphabet Inc. - Class A Common Stock" },
-    { symbol: "GORV", name: "Lazydays Holdings, Inc. - Common Stock" },
-    { symbol: "GOSS", name: "Gossamer Bio, Inc. - Common Stock" },
-    { symbol: "GOVI", name: "Invesco Equal Weight 0-30 Year Treasury ETF" },
-    { symbol: "GOVX", name: "GeoVax Labs, Inc. - Common Stock" },
-    { symbol: "GOVXW", name: "GeoVax Labs, Inc. - Warrants" },
-    { symbol: "GP", name: "GreenPower Motor Company Inc. - Common Shares" },
-    { symbol: "GPAT", name: "GP-Act III Acquisition Corp. - Class A Ordinary Share" },
-    { symbol: "GPATU", name: "GP-Act III Acquisition Corp. - Units" },
-    { symbol: "GPATW", name: "GP-Act III Acquisition Corp. - Warrants" },
-    { symbol: "GPCR", name: "Structure Therapeutics Inc. - American Depositary Shares" },
-    { symbol: "GPIQ", name: "Goldman Sachs Nasdaq-100 Premium Income ETF" },
-    { symbol: "GPIX", name: "Goldman Sachs S&P 500 Premium Income ETF" },
-    { symbol: "GPRE", name: "Green Plains, Inc. - Common Stock" },
-    { symbol: "GPRF", name: "Goldman Sachs Access U.S. Preferred Stock and Hybrid Securities ETF" },
-    { symbol: "GPRO", name: "GoPro, Inc. - Class A Common Stock" },
-    { symbol: "GQQQ", name: "Astoria US Quality Growth Kings ETF" },
-    { symbol: "GRAB", name: "Grab Holdings Limited - Class A Ordinary Shares" },
-    { symbol: "GRABW", name: "Grab Holdings Limited - Warrant" },
-    { symbol: "GRAL", name: "GRAIL, Inc. - Common Stock" },
-    { symbol: "GRAN", name: "Grande Group Limited - Class A Ordinary Shares" },
-    { symbol: "GRCE", name: "Grace Therapeutics, Inc. - Common Stock" },
-    { symbol: "GREE", name: "Greenidge Generation Holdings Inc. - Class A Common Stock" },
-    { symbol: "GREEL", name: "Greenidge Generation Holdings Inc. - 8.50% Senior Notes due 2026" },
-    { symbol: "GRFS", name: "Grifols, S.A. - American Depositary Shares" },
-    { symbol: "GRI", name: "GRI Bio, Inc. - Common Stock" },
-    { symbol: "GRID", name: "First Trust NASDAQ Clean Edge Smart Grid Infrastructure Index Fund" },
-    { symbol: "GRIN", name: "VictoryShares International Free Cash Flow Growth ETF" },
-    { symbol: "GRNQ", name: "Greenpro Capital Corp. - Common Stock" },
-    { symbol: "GROW", name: "U.S. Global Investors, Inc. - Class A Common Stock" },
-    { symbol: "GRPN", name: "Groupon, Inc. - Common Stock" },
-    { symbol: "GRRR", name: "Gorilla Technology Group Inc. - Ordinary shares" },
-    { symbol: "GRRRW", name: "Gorilla Technology Group Inc. - Warrant" },
-    { symbol: "GRVY", name: "GRAVITY Co., Ltd. - American depositary shares, each representing one common share." },
-    { symbol: "GRW", name: "TCW Compounders ETF" },
-    { symbol: "GRWG", name: "GrowGeneration Corp. - Common Stock" },
-    { symbol: "GSAT", name: "Globalstar, Inc. - Common Stock" },
-    { symbol: "GSBC", name: "Great Southern Bancorp, Inc. - Common Stock" },
-    { symbol: "GSHD", name: "Goosehead Insurance, Inc. - Class A Common Stock" },
-    { symbol: "GSHR", name: "Gesher Acquisition Corp. II - Class A Ordinary Shares" },
-    { symbol: "GSHRU", name: "Gesher Acquisition Corp. II - Units" },
-    { symbol: "GSHRW", name: "Gesher Acquisition Corp. II - Warrants" },
-    { symbol: "GSIB", name: "Themes Global Systemically Important Banks ETF" },
-    { symbol: "GSIT", name: "GSI Technology, Inc. - Common Stock" },
-    { symbol: "GSIW", name: "Garden Stage Limited - Ordinary Shares" },
-    { symbol: "GSM", name: "Ferroglobe PLC - Ordinary Shares" },
-    { symbol: "GSRFU", name: "GSR IV Acquisition Corp. - Units" },
-    { symbol: "GSRT", name: "GSR III Acquisition Corp. - Ordinary Shares" },
-    { symbol: "GSRTR", name: "GSR III Acquisition Corp. - Right" },
-    { symbol: "GSRTU", name: "GSR III Acquisition Corp. - Unit" },
-    { symbol: "GSUN", name: "Golden Sun Health Technology Group Limited - Class A Ordinary Shares" },
-    { symbol: "GT", name: "The Goodyear Tire & Rubber Company - Common Stock" },
-    { symbol: "GTBP", name: "GT Biopharma, Inc. - Common Stock" },
-    { symbol: "GTEC", name: "Greenland Technologies Holding Corporation - Ordinary Shares" },
-    { symbol: "GTEN", name: "Gores Holdings X, Inc. - Class A ordinary shares" },
-    { symbol: "GTENU", name: "Gores Holdings X, Inc. - Units" },
-    { symbol: "GTENW", name: "Gores Holdings X, Inc. - Warrants" },
-    { symbol: "GTERA", name: "Globa Terra Acquisition Corporation - Class A Ordinary Shares" },
-    { symbol: "GTERR", name: "Globa Terra Acquisition Corporation - Rights" },
-    { symbol: "GTERU", name: "Globa Terra Acquisition Corporation - Units" },
-    { symbol: "GTERW", name: "Globa Terra Acquisition Corporation - Warrants" },
-    { symbol: "GTI", name: "Graphjet Technology - Class A Ordinary Shares" },
-    { symbol: "GTIM", name: "Good Times Restaurants Inc. - Common Stock" },
-    { symbol: "GTLB", name: "GitLab Inc. - Class A Common Stock" },
-    { symbol: "GTM", name: "ZoomInfo Technologies Inc. - Common Stock" },
-    { symbol: "GTR", name: "WisdomTree Target Range Fund" },
-    { symbol: "GTX", name: "Garrett Motion Inc. - Common Stock" },
-    { symbol: "GURE", name: "Gulf Resources, Inc. - Common Stock" },
-    { symbol: "GUTS", name: "Fractyl Health, Inc. - Common Stock" },
-    { symbol: "GV", name: "Visionary Holdings Inc. - Common Shares" },
-    { symbol: "GVH", name: "Globavend Holdings Limited - Ord Shares" },
-    { symbol: "GWAV", name: "Greenwave Technology Solutions, Inc. - Common Stock" },
-    { symbol: "GWRS", name: "Global Water Resources, Inc. - common stock" },
-    { symbol: "GXAI", name: "Gaxos.ai Inc. - Common Stock" },
-    { symbol: "GXDW", name: "Global X Dorsey Wright Thematic ETF" },
-    { symbol: "GYRE", name: "Gyre Therapeutics, Inc. - Common Stock" },
-    { symbol: "GYRO", name: "Gyrodyne , LLC - Common Stock" },
-    { symbol: "HAFC", name: "Hanmi Financial Corporation - Common Stock" },
-    { symbol: "HAIN", name: "The Hain Celestial Group, Inc. - Common Stock" },
-    { symbol: "HALO", name: "Halozyme Therapeutics, Inc. - Common Stock" },
-    { symbol: "HAO", name: "Haoxi Health Technology Limited - Class A Ord Share" },
-    { symbol: "HAS", name: "Hasbro, Inc. - Common Stock" },
-    { symbol: "HBAN", name: "Huntington Bancshares Incorporated - Common Stock" },
-    { symbol: "HBANL", name: "Huntington Bancshares Incorporated - Depositary Shares, Each Representing a 1/40th Interest in a Share of 6.875% Series J Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "HBANM", name: "Huntington Bancshares Incorporated - Depositary Shares each representing a 1/1000th interest in a share of Huntington Series I Preferred Stock" },
-    { symbol: "HBANP", name: "Huntington Bancshares Incorporated - Depositary Shares 4.500% Series H Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "HBCP", name: "Home Bancorp, Inc. - Common Stock" },
-    { symbol: "HBDC", name: "Hilton BDC Corporate Bond ETF" },
-    { symbol: "HBIO", name: "Harvard Bioscience, Inc. - Common Stock" },
-    { symbol: "HBNB", name: "Hotel101 Global Holdings Corp. - Class A Ordinary Shares" },
-    { symbol: "HBNC", name: "Horizon Bancorp, Inc. - Common Stock" },
-    { symbol: "HBT", name: "HBT Financial, Inc. - Common Stock" },
-    { symbol: "HCAI", name: "Huachen AI Parking Management Technology Holding Co., Ltd. - Class A Ordinary Shares" },
-    { symbol: "HCAT", name: "Health Catalyst, Inc - Common stock" },
-    { symbol: "HCHL", name: "Happy City Holdings Limited - Class A Ordinary shares" },
-    { symbol: "HCKT", name: "The Hackett Group, Inc. - Common Stock" },
-    { symbol: "HCM", name: "HUTCHMED (China) Limited - American Depositary Shares" },
-    { symbol: "HCMAU", name: "HCM III Acquisition Corp. - Units" },
-    { symbol: "HCOW", name: "Amplify COWS Covered Call ETF" },
-    { symbol: "HCSG", name: "Healthcare Services Group, Inc. - Common Stock" },
-    { symbol: "HCTI", name: "Healthcare Triangle, Inc. - Common Stock" },
-    { symbol: "HCWB", name: "HCW Biologics Inc. - Common Stock" },
-    { symbol: "HDL", name: "SUPER HI INTERNATIONAL HOLDING LTD. - American Depositary Shares" },
-    { symbol: "HDSN", name: "Hudson Technologies, Inc. - Common Stock" },
-    { symbol: "HEAL", name: "Global X HealthTech ETF" },
-    { symbol: "HECO", name: "SPDR Galaxy Hedged Digital Asset Ecosystem ETF" },
-    { symbol: "HEJD", name: "VictoryShares Hedged Equity Income ETF" },
-    { symbol: "HELE", name: "Helen of Troy Limited - Common Stock" },
-    { symbol: "HEPS", name: "D-Market Electronic Services & Trading - American Depositary Shares" },
-    { symbol: "HEQQ", name: "JPMorgan Nasdaq Hedged Equity Laddered Overlay ETF" },
-    { symbol: "HERD", name: "Pacer Cash Cows Fund of Funds ETF" },
-    { symbol: "HERO", name: "Global X Video Games & Esports ETF" },
-    { symbol: "HERZ", name: "Herzfeld Credit Income Fund, Inc.  - Closed End Fund" },
-    { symbol: "HFBL", name: "Home Federal Bancorp, Inc. of Louisiana - Common Stock" },
-    { symbol: "HFFG", name: "HF Foods Group Inc. - Common Stock" },
-    { symbol: "HFSP", name: "TradersAI Large Cap Equity & Cash ETF" },
-    { symbol: "HFWA", name: "Heritage Financial Corporation - Common Stock" },
-    { symbol: "HGBL", name: "Heritage Global Inc. - Common Stock" },
-    { symbol: "HHS", name: "Harte Hanks, Inc. - Common Stock" },
-    { symbol: "HIDE", name: "Alpha Architect High Inflation and Deflation ETF" },
-    { symbol: "HIFS", name: "Hingham Institution for Savings - Common Stock" },
-    { symbol: "HIHO", name: "Highway Holdings Limited - Common Stock" },
-    { symbol: "HIMX", name: "Himax Technologies, Inc. - American depositary shares, each of which represents two ordinary shares." },
-    { symbol: "HIMY", name: "Defiance Leveraged Long Income HIMS ETF" },
-    { symbol: "HIMZ", name: "Defiance Daily Target 2X Long HIMS ETF" },
-    { symbol: "HIND", name: "Vyome Holdings, Inc. - Common Stock" },
-    { symbol: "HISF", name: "First Trust High Income Strategic Focus ETF" },
-    { symbol: "HIT", name: "Health In Tech, Inc. - Class A Common Stock" },
-    { symbol: "HITI", name: "High Tide Inc. - Common Shares" },
-    { symbol: "HIVE", name: "HIVE Digital Technologies Ltd - Common Shares" },
-    { symbol: "HKIT", name: "Hitek Global Inc. - Class A Ordinary Share" },
-    { symbol: "HKPD", name: "Hong Kong Pharma Digital Technology Holdings Limited - Ordinary shares" },
-    { symbol: "HLAL", name: "Wahed FTSE USA Shariah ETF" },
-    { symbol: "HLIT", name: "Harmonic Inc. - Common Stock" },
-    { symbol: "HLMN", name: "Hillman Solutions Corp. - Common Stock" },
-    { symbol: "HLNE", name: "Hamilton Lane Incorporated - Class A Common Stock" },
-    { symbol: "HLP", name: "Hongli Group Inc. - Ordinary Shares" },
-    { symbol: "HLVX", name: "HilleVax, Inc. - Common Stock" },
-    { symbol: "HMR", name: "Heidmar Maritime Holdings Corp. - Common Stock" },
-    { symbol: "HNDL", name: "Strategy Shares Nasdaq 7HANDL Index ETF" },
-    { symbol: "HNNA", name: "Hennessy Advisors, Inc. - Common Stock" },
-    { symbol: "HNNAZ", name: "Hennessy Advisors, Inc. - 4.875% Notes due 2026" },
-    { symbol: "HNRG", name: "Hallador Energy Company - Common Stock" },
-    { symbol: "HNST", name: "The Honest Company, Inc. - Common Stock" },
-    { symbol: "HNVR", name: "Hanover Bancorp, Inc. - Common Stock" },
-    { symbol: "HOFT", name: "Hooker Furnishings Corporation - Common Stock" },
-    { symbol: "HOLO", name: "MicroCloud Hologram Inc. - Ordinary Shares" },
-    { symbol: "HOLOW", name: "MicroCloud Hologram Inc. - Warrant" },
-    { symbol: "HOLX", name: "Hologic, Inc. - Common Stock" },
-    { symbol: "HON", name: "Honeywell International Inc. - Common Stock" },
-    { symbol: "HOND", name: "HCM II Acquisition Corp. - Class A Ordinary Shares" },
-    { symbol: "HONDU", name: "HCM II Acquisition Corp. - Unit" },
-    { symbol: "HONDW", name: "HCM II Acquisition Corp. - Warrant" },
-    { symbol: "HONE", name: "HarborOne Bancorp, Inc. - Common Stock" },
-    { symbol: "HOOD", name: "Robinhood Markets, Inc. - Class A Common Stock" },
-    { symbol: "HOOG", name: "Leverage Shares 2X Long HOOD Daily ETF" },
-    { symbol: "HOOI", name: "Defiance Leveraged Long Income HOOD ETF" },
-    { symbol: "HOOX", name: "Defiance Daily Target 2X Long HOOD ETF" },
-    { symbol: "HOPE", name: "Hope Bancorp, Inc. - Common Stock" },
-    { symbol: "HOTH", name: "Hoth Therapeutics, Inc. - Common Stock" },
-    { symbol: "HOUR", name: "Hour Loop, Inc. - common stock" },
-    { symbol: "HOVNP", name: "Hovnanian Enterprises Inc - Depositary Share representing 1/1000th of 7.625% Series A Preferred Stock" },
-    { symbol: "HOVR", name: "New Horizon Aircraft Ltd. - Class A Ordinary Shares" },
-    { symbol: "HOVRW", name: "New Horizon Aircraft Ltd. - Warrant" },
-    { symbol: "HOWL", name: "Werewolf Therapeutics, Inc. - Common Stock" },
-    { symbol: "HPAI", name: "Helport AI Limited - Ordinary Shares" },
-    { symbol: "HPAIW", name: "Helport AI Limited - Warrants" },
-    { symbol: "HPK", name: "HighPeak Energy, Inc. - Common Stock" },
-    { symbol: "HQGO", name: "Hartford US Quality Growth ETF" },
-    { symbol: "HQI", name: "HireQuest, Inc. - Common Stock" },
-    { symbol: "HQY", name: "HealthEquity, Inc. - Common Stock" },
-    { symbol: "HRMY", name: "Harmony Biosciences Holdings, Inc. - Common Stock" },
-    { symbol: "HROW", name: "Harrow, Inc. - Common Stock" },
-    { symbol: "HROWL", name: "Harrow, Inc. - 8.625% senior notes due 2026" },
-    { symbol: "HROWM", name: "Harrow, Inc. - 11.875% Senior Notes due 2027" },
-    { symbol: "HRTS", name: "Tema Heart & Health ETF" },
-    { symbol: "HRTX", name: "Heron Therapeutics, Inc.   - Common Stock" },
-    { symbol: "HRZN", name: "Horizon Technology Finance Corporation - Common Stock" },
-    { symbol: "HSAI", name: "Hesai Group - American Depositary Share, each ADS represents one Class B ordinary share" },
-    { symbol: "HSCS", name: "HeartSciences Inc. - Common Stock" },
-    { symbol: "HSCSW", name: "HeartSciences Inc. - Warrant" },
-    { symbol: "HSDT", name: "Helius Medical Technologies, Inc. - Class A Common Stock" },
-    { symbol: "HSIC", name: "Henry Schein, Inc. - Common Stock" },
-    { symbol: "HSII", name: "Heidrick & Struggles International, Inc. - Common Stock" },
-    { symbol: "HSPO", name: "Horizon Space Acquisition I Corp. - Ordinary Shares" },
-    { symbol: "HSPOR", name: "Horizon Space Acquisition I Corp. - Right" },
-    { symbol: "HSPOU", name: "Horizon Space Acquisition I Corp. - Unit" },
-    { symbol: "HSPOW", name: "Horizon Space Acquisition I Corp. - Warrant" },
-    { symbol: "HSPT", name: "Horizon Space Acquisition II Corp. - Ordinary share" },
-    { symbol: "HSPTR", name: "Horizon Space Acquisition II Corp. - Right" },
-    { symbol: "HSPTU", name: "Horizon Space Acquisition II Corp. - Units" },
-    { symbol: "HST", name: "Host Hotels & Resorts, Inc. - Common Stock" },
-    { symbol: "HSTM", name: "HealthStream, Inc. - Common Stock" },
-    { symbol: "HTBK", name: "Heritage Commerce Corp - Common Stock" },
-    { symbol: "HTCO", name: "High-Trend International Group - Class A Ordinary Shares" },
-    { symbol: "HTCR", name: "Heartcore Enterprises, Inc. - Common Stock" },
-    { symbol: "HTFL", name: "Heartflow, Inc. - Common Stock" },
-    { symbol: "HTHT", name: "H World Group Limited - American Depositary Shares" },
-    { symbol: "HTLD", name: "Heartland Express, Inc. - Common Stock" },
-    { symbol: "HTLM", name: "HomesToLife Ltd - Ordinary Shares" },
-    { symbol: "HTO", name: "H2O America  - Common Stock" },
-    { symbol: "HTOO", name: "Fusion Fuel Green PLC - Ordinary Shares" },
-    { symbol: "HTOOW", name: "Fusion Fuel Green PLC - Warrant" },
-    { symbol: "HTZ", name: "Hertz Global Holdings, Inc - Common Stock" },
-    { symbol: "HTZWW", name: "Hertz Global Holdings, Inc - Warrant" },
-    { symbol: "HUBC", name: "Hub Cyber Security Ltd. - Ordinary Shares" },
-    { symbol: "HUBCW", name: "Hub Cyber Security Ltd. - Warrant expiring 2/27/28" },
-    { symbol: "HUBCZ", name: "Hub Cyber Security Ltd. - Warrant" },
-    { symbol: "HUBG", name: "Hub Group, Inc. - Class A Common Stock" },
-    { symbol: "HUDI", name: "Huadi International Group Co., Ltd. - Ordinary Shares" },
-    { symbol: "HUHU", name: "HUHUTECH International Group Inc. - Ordinary Shares" },
-    { symbol: "HUIZ", name: "Huize Holding Limited - American Depositary Shares" },
-    { symbol: "HUMA", name: "Humacyte, Inc. - Common Stock" },
-    { symbol: "HUMAW", name: "Humacyte, Inc. - Warrant" },
-    { symbol: "HURA", name: "TuHURA Biosciences, Inc. - Common Stock" },
-    { symbol: "HURC", name: "Hurco Companies, Inc. - Common Stock" },
-    { symbol: "HURN", name: "Huron Consulting Group Inc. - Common Stock" },
-    { symbol: "HUT", name: "Hut 8 Corp. - Common Stock" },
-    { symbol: "HVII", name: "Hennessy Capital Investment Corp. VII - Ordinary Shares" },
-    { symbol: "HVIIR", name: "Hennessy Capital Investment Corp. VII - Rights" },
-    { symbol: "HVIIU", name: "Hennessy Capital Investment Corp. VII - Unit" },
-    { symbol: "HVMCU", name: "Highview Merger Corp. - Units" },
-    { symbol: "HWAY", name: "Themes US Infrastructure ETF" },
-    { symbol: "HWBK", name: "Hawthorn Bancshares, Inc. - Common Stock" },
-    { symbol: "HWC", name: "Hancock Whitney Corporation - Common Stock" },
-    { symbol: "HWCPZ", name: "Hancock Whitney Corporation - 6.25% Subordinated Notes due 2060" },
-    { symbol: "HWH", name: "HWH International Inc. - Common Stock" },
-    { symbol: "HWKN", name: "Hawkins, Inc. - Common Stock" },
-    { symbol: "HWSM", name: "Hotchkis & Wiley SMID Cap Diversified Value Fund" },
-    { symbol: "HXHX", name: "Haoxin Holdings Limited - Class A Ordinary Shares" },
-    { symbol: "HYBI", name: "NEOS Enhanced Income Credit Select ETF" },
-    { symbol: "HYDR", name: "Global X Hydrogen ETF" },
-    { symbol: "HYFM", name: "Hydrofarm Holdings Group, Inc. - Common Stock" },
-    { symbol: "HYFT", name: "MindWalk Holdings Corp. - Common Stock" },
-    { symbol: "HYLS", name: "First Trust Tactical High Yield ETF" },
-    { symbol: "HYMC", name: "Hycroft Mining Holding Corporation - Class A Common Stock" },
-    { symbol: "HYMCL", name: "Hycroft Mining Holding Corporation - Warrants" },
-    { symbol: "HYPD", name: "Hyperion DeFi, Inc. - Common Stock" },
-    { symbol: "HYPR", name: "Hyperfine, Inc.  - Class A Common Stock" },
-    { symbol: "HYXF", name: "iShares ESG Advanced High Yield Corporate Bond ETF" },
-    { symbol: "HYZD", name: "WisdomTree Interest Rate Hedged High Yield Bond Fund" },
-    { symbol: "IAC", name: "IAC Inc. - Common Stock" },
-    { symbol: "IART", name: "Integra LifeSciences Holdings Corporation - Common Stock" },
-    { symbol: "IAS", name: "Integral Ad Science Holding Corp. - Common Stock" },
-    { symbol: "IBAC", name: "IB Acquisition Corp. - Common Stock" },
-    { symbol: "IBACR", name: "IB Acquisition Corp. - Right" },
-    { symbol: "IBAT", name: "iShares Energy Storage & Materials ETF" },
-    { symbol: "IBB", name: "iShares Biotechnology ETF" },
-    { symbol: "IBBQ", name: "Invesco Nasdaq Biotechnology ETF" },
-    { symbol: "IBCP", name: "Independent Bank Corporation - Common Stock" },
-    { symbol: "IBEX", name: "IBEX Limited - Common Share" },
-    { symbol: "IBG", name: "Innovation Beverage Group Limited - Ordinary Shares" },
-    { symbol: "IBGA", name: "iShares iBonds Dec 2044 Term Treasury ETF" },
-    { symbol: "IBGB", name: "iShares iBonds Dec 2045 Term Treasury ETF" },
-    { symbol: "IBGK", name: "iShares iBonds Dec 2054 Term Treasury ETF" },
-    { symbol: "IBGL", name: "iShares iBonds Dec 2055 Term Treasury ETF" },
-    { symbol: "IBIO", name: "iBio, Inc. - Common Stock" },
-    { symbol: "IBIT", name: "iShares Bitcoin Trust ETF - iShares Bitcoin Trust ETF" },
-    { symbol: "IBKR", name: "Interactive Brokers Group, Inc. - Class A Common Stock" },
-    { symbol: "IBOC", name: "International Bancshares Corporation - Common Stock" },
-    { symbol: "IBOT", name: "VanEck Robotics ETF" },
-    { symbol: "IBRX", name: "ImmunityBio, Inc. - Common Stock" },
-    { symbol: "IBTF", name: "iShares iBonds Dec 2025 Term Treasury ETF" },
-    { symbol: "IBTG", name: "iShares iBonds Dec 2026 Term Treasury ETF" },
-    { symbol: "IBTH", name: "iShares iBonds Dec 2027 Term Treasury ETF" },
-    { symbol: "IBTI", name: "iShares iBonds Dec 2028 Term Treasury ETF" },
-    { symbol: "IBTJ", name: "iShares iBonds Dec 2029 Term Treasury ETF" },
-    { symbol: "IBTK", name: "iShares iBonds Dec 2030 Term Treasury ETF" },
-    { symbol: "IBTL", name: "iShares iBonds Dec 2031 Term Treasury ETF" },
-    { symbol: "IBTM", name: "iShares iBonds Dec 2032 Term Treasury ETF" },
-    { symbol: "IBTO", name: "iShares iBonds Dec 2033 Term Treasury ETF" },
-    { symbol: "IBTP", name: "iShares iBonds Dec 2034 Term Treasury ETF" },
-    { symbol: "IBTQ", name: "iShares iBonds Dec 2035 Term Treasury ETF" },
-    { symbol: "ICCC", name: "ImmuCell Corporation - Common Stock" },
-    { symbol: "ICCM", name: "IceCure Medical Ltd. - Ordinary Shares" },
-    { symbol: "ICFI", name: "ICF International, Inc. - Common Stock" },
-    { symbol: "ICG", name: "Intchains Group Limited - American Depositary Shares" },
-    { symbol: "ICHR", name: "Ichor Holdings - Ordinary Shares" },
-    { symbol: "ICLN", name: "iShares Global Clean Energy ETF" },
-    { symbol: "ICLR", name: "ICON plc - Ordinary Shares" },
-    { symbol: "ICMB", name: "Investcorp Credit Management BDC, Inc. - Common Stock" },
-    { symbol: "ICON", name: "Icon Energy Corp. - Common stock" },
-    { symbol: "ICOP", name: "iShares Copper and Metals Mining ETF" },
-    { symbol: "ICU", name: "SeaStar Medical Holding Corporation - Common Stock" },
-    { symbol: "ICUCW", name: "SeaStar Medical Holding Corporation - Warrant" },
-    { symbol: "ICUI", name: "ICU Medical, Inc. - Common Stock" },
-    { symbol: "IDAI", name: "T Stamp Inc. - Class A Common Stock" },
-    { symbol: "IDCC", name: "InterDigital, Inc. - Common Stock" },
-    { symbol: "IDEF", name: "iShares Defense Industrials Active ETF" },
-    { symbol: "IDN", name: "Intellicheck, Inc. - Common Stock" },
-    { symbol: "IDXX", name: "IDEXX Laboratories, Inc. - Common Stock" },
-    { symbol: "IDYA", name: "IDEAYA Biosciences, Inc. - Common Stock" },
-    { symbol: "IEF", name: "iShares 7-10 Year Treasury Bond ETF" },
-    { symbol: "IEI", name: "iShares 3-7 Year Treasury Bond ETF" },
-    { symbol: "IEP", name: "Icahn Enterprises L.P. - Depositary Units representing Limited Partner Interests" },
-    { symbol: "IESC", name: "IES Holdings, Inc. - Common Stock" },
-    { symbol: "IEUS", name: "iShares MSCI Europe Small-Cap ETF" },
-    { symbol: "IFBD", name: "Infobird Co., Ltd - Ordinary Shares" },
-    { symbol: "IFGL", name: "iShares International Developed Real Estate ETF" },
-    { symbol: "IFLO", name: "VictoryShares International Free Cash Flow ETF" },
-    { symbol: "IFRX", name: "InflaRx N.V. - Common Stock" },
-    { symbol: "IFV", name: "First Trust Dorsey Wright International Focus 5 ETF" },
-    { symbol: "IGF", name: "iShares Global Infrastructure ETF" },
-    { symbol: "IGIB", name: "iShares 5-10 Year Investment Grade Corporate Bond ETF" },
-    { symbol: "IGIC", name: "International General Insurance Holdings Ltd. - Ordinary Shares" },
-    { symbol: "IGOV", name: "iShares International Treasury Bond ETF" },
-    { symbol: "IGSB", name: "iShares 1-5 Year Investment Grade Corporate Bond ETF" },
-    { symbol: "IHRT", name: "iHeartMedia, Inc. - Class A Common Stock" },
-    { symbol: "IHYF", name: "Invesco High Yield Bond Factor ETF" },
-    { symbol: "III", name: "Information Services Group, Inc. - Common Stock" },
-    { symbol: "IIIV", name: "i3 Verticals, Inc. - Common Stock" },
-    { symbol: "IINN", name: "Inspira Technologies Oxy B.H.N. Ltd. - Ordinary Shares" },
-    { symbol: "IINNW", name: "Inspira Technologies Oxy B.H.N. Ltd. - Warrant" },
-    { symbol: "IJT", name: "iShares S&P SmallCap 600 Growth ETF" },
-    { symbol: "IKT", name: "Inhibikase Therapeutics, Inc. - Common Stock" },
-    { symbol: "ILAG", name: "Intelligent Living Application Group Inc. - Ordinary Shares" },
-    { symbol: "ILIT", name: "iShares Lithium Miners and Producers ETF" },
-    { symbol: "ILLR", name: "Triller Group Inc. - Common Stock" },
-    { symbol: "ILLRW", name: "Triller Group Inc. - Warrant" },
-    { symbol: "ILMN", name: "Illumina, Inc. - Common Stock" },
-    { symbol: "ILPT", name: "Industrial Logistics Properties Trust - Common Shares of Beneficial Interest" },
-    { symbol: "IMA", name: "ImageneBio, Inc. - Common Stock" },
-    { symbol: "IMAB", name: "I-MAB - American Depositary Shares" },
-    { symbol: "IMCC", name: "IM Cannabis Corp. - Common Shares" },
-    { symbol: "IMCR", name: "Immunocore Holdings plc - American Depositary Shares" },
-    { symbol: "IMCV", name: "iShares Morningstar Mid-Cap Value ETF" },
-    { symbol: "IMDX", name: "Insight Molecular Diagnostics Inc. - Common Stock" },
-    { symbol: "IMG", name: "CIMG Inc. - Common Stock" },
-    { symbol: "IMKTA", name: "Ingles Markets, Incorporated - Class A Common Stock" },
-    { symbol: "IMMP", name: "Immutep Limited - American Depositary Shares" },
-    { symbol: "IMMR", name: "Immersion Corporation - Common Stock" },
-    { symbol: "IMMX", name: "Immix Biopharma, Inc. - Common Stock" },
-    { symbol: "IMNM", name: "Immunome, Inc. - Common Stock" },
-    { symbol: "IMNN", name: "Imunon, Inc. - Common Stock" },
-    { symbol: "IMOM", name: "Alpha Architect International Quantitative Momentum ETF" },
-    { symbol: "IMOS", name: "ChipMOS TECHNOLOGIES INC. - American Depositary Shares" },
-    { symbol: "IMPP", name: "Imperial Petroleum Inc. - Common Shares" },
-    { symbol: "IMPPP", name: "Imperial Petroleum Inc. - 8.75% Series A Cumulative Redeemable Perpetual Preferred Shares" },
-    { symbol: "IMRN", name: "Immuron Limited - American Depositary Shares" },
-    { symbol: "IMRX", name: "Immuneering Corporation - Class A Common Stock" },
-    { symbol: "IMTE", name: "Integrated Media Technology Limited - Ordinary Shares" },
-    { symbol: "IMTX", name: "Immatics N.V. - Ordinary Shares" },
-    { symbol: "IMUX", name: "Immunic, Inc.  - Common Stock" },
-    { symbol: "IMVT", name: "Immunovant, Inc.  - Common Stock" },
-    { symbol: "IMXI", name: "International Money Express, Inc. - Common Stock" },
-    { symbol: "INAB", name: "IN8bio, Inc. - Common Stock" },
-    { symbol: "INAC", name: "Indigo Acquisition Corp. - Ordinary Shares" },
-    { symbol: "INACR", name: "Indigo Acquisition Corp. - Right" },
-    { symbol: "INACU", name: "Indigo Acquisition Corp. - Unit" },
-    { symbol: "INBK", name: "First Internet Bancorp - Common Stock" },
-    { symbol: "INBKZ", name: "First Internet Bancorp - Fixed-to-Floating Rate Subordinated Notes Due 2029" },
-    { symbol: "INBS", name: "Intelligent Bio Solutions Inc.  - Common Stock" },
-    { symbol: "INBX", name: "Inhibrx Biosciences, Inc. - Common Stock" },
-    { symbol: "INCR", name: "Intercure Ltd. - ordinary shares" },
-    { symbol: "INCY", name: "Incyte Corporation - Common Stock" },
-    { symbol: "INDB", name: "Independent Bank Corp. - Common Stock" },
-    { symbol: "INDH", name: "WisdomTree India Hedged Equity Fund" },
-    { symbol: "INDI", name: "indie Semiconductor, Inc. - Class A Common Stock" },
-    { symbol: "INDP", name: "Indaptus Therapeutics, Inc. - Common Stock" },
-    { symbol: "INDV", name: "Indivior PLC - Ordinary Shares" },
-    { symbol: "INDY", name: "iShares India 50 ETF" },
-    { symbol: "INEO", name: "INNEOVA Holdings Limited - Ordinary Shares" },
-    { symbol: "INFR", name: "ClearBridge Sustainable Infrastructure ETF" },
-    { symbol: "INGN", name: "Inogen, Inc - Common Stock" },
-    { symbol: "INHD", name: "Inno Holdings Inc. - Common Stock" },
-    { symbol: "INKT", name: "MiNK Therapeutics, Inc. - Common Stock" },
-    { symbol: "INLF", name: "INLIF LIMITED - Class A Ordinary shares" },
-    { symbol: "INM", name: "InMed Pharmaceuticals Inc. - Common Shares" },
-    { symbol: "INMB", name: "INmune Bio Inc. - Common stock" },
-    { symbol: "INMD", name: "InMode Ltd.  - Ordinary Shares" },
-    { symbol: "INNV", name: "InnovAge Holding Corp. - Common Stock" },
-    { symbol: "INO", name: "Inovio Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "INOD", name: "Innodata Inc. - Common Stock" },
-    { symbol: "INRO", name: "iShares U.S. Industry Rotation Active ETF" },
-    { symbol: "INSE", name: "Inspired Entertainment, Inc. - Common Stock" },
-    { symbol: "INSG", name: "Inseego Corp. - Common Stock" },
-    { symbol: "INSM", name: "Insmed Incorporated - Common Stock" },
-    { symbol: "INTA", name: "Intapp, Inc. - Common Stock" },
-    { symbol: "INTC", name: "Intel Corporation - Common Stock" },
-    { symbol: "INTG", name: "The Intergroup Corporation - Common Stock" },
-    { symbol: "INTJ", name: "Intelligent Group Limited - Class A Ordinary Shares" },
-    { symbol: "INTR", name: "Inter & Co. Inc. - Class A Common Shares" },
-    { symbol: "INTS", name: "Intensity Therapeutics, Inc. - Common Stock" },
-    { symbol: "INTU", name: "Intuit Inc. - Common Stock" },
-    { symbol: "INTW", name: "GraniteShares 2x Long INTC Daily ETF" },
-    { symbol: "INTZ", name: "Intrusion Inc. - Common Stock" },
-    { symbol: "INV", name: "Innventure, Inc. - Common Stock" },
-    { symbol: "INVA", name: "Innoviva, Inc. - Common Stock" },
-    { symbol: "INVE", name: "Identiv, Inc. - Common Stock" },
-    { symbol: "INVZ", name: "Innoviz Technologies Ltd. - Ordinary shares" },
-    { symbol: "INVZW", name: "Innoviz Technologies Ltd. - Warrant" },
-    { symbol: "IOBT", name: "IO Biotech, Inc. - Common Stock" },
-    { symbol: "IONL", name: "GraniteShares 2x Long IONQ Daily ETF" },
-    { symbol: "IONR", name: "ioneer Ltd - American Depositary Shares" },
-    { symbol: "IONS", name: "Ionis Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "IONX", name: "Defiance Daily Target 2X Long IONQ ETF" },
-    { symbol: "IONZ", name: "Defiance Daily Target 2x Short IONQ ETF" },
-    { symbol: "IOSP", name: "Innospec Inc. - Common Stock" },
-    { symbol: "IOTR", name: "iOThree Limited - Ordinary Shares" },
-    { symbol: "IOVA", name: "Iovance Biotherapeutics, Inc. - Common Stock" },
-    { symbol: "IPAR", name: "Interparfums, Inc. - Common Stock" },
-    { symbol: "IPCX", name: "Inflection Point Acquisition Corp. III - Class A ordinary shares" },
-    { symbol: "IPCXR", name: "Inflection Point Acquisition Corp. III - Rights" },
-    { symbol: "IPCXU", name: "Inflection Point Acquisition Corp. III - Units" },
-    { symbol: "IPDN", name: "Professional Diversity Network, Inc. - Common Stock" },
-    { symbol: "IPGP", name: "IPG Photonics Corporation - Common Stock" },
-    { symbol: "IPHA", name: "Innate Pharma S.A. - American Depositary Shares" },
-    { symbol: "IPKW", name: "Invesco International BuyBack Achievers ETF" },
-    { symbol: "IPM", name: "Intelligent Protection Management Corp.  - Common Stock" },
-    { symbol: "IPOD", name: "Dune Acquisition Corporation II - Class A ordinary shares" },
-    { symbol: "IPODU", name: "Dune Acquisition Corporation II - Units" },
-    { symbol: "IPODW", name: "Dune Acquisition Corporation II - Warrants" },
-    { symbol: "IPSC", name: "Century Therapeutics, Inc. - Common Stock" },
-    { symbol: "IPW", name: "iPower Inc. - Common Stock" },
-    { symbol: "IPWR", name: "Ideal Power Inc. - Common Stock" },
-    { symbol: "IPX", name: "IperionX Limited - American Depositary Share" },
-    { symbol: "IQ", name: "iQIYI, Inc. - American Depositary Shares" },
-    { symbol: "IQQQ", name: "ProShares Nasdaq-100 High Income ETF" },
-    { symbol: "IQST", name: "iQSTEL Inc. - Common Stock" },
-    { symbol: "IRBT", name: "iRobot Corporation - Common Stock" },
-    { symbol: "IRD", name: "Opus Genetics, Inc. - Common Stock" },
-    { symbol: "IRDM", name: "Iridium Communications Inc - Common Stock" },
-    { symbol: "IREN", name: "IREN Limited - Ordinary Shares" },
-    { symbol: "IRIX", name: "IRIDEX Corporation - Common Stock" },
-    { symbol: "IRMD", name: "iRadimed Corporation - Common Stock" },
-    { symbol: "IROH", name: "Iron Horse Acquisitions Corp. - Common Stock" },
-    { symbol: "IROHR", name: "Iron Horse Acquisitions Corp. - one right to one-fifth (1/5) of one share of common stock" },
-    { symbol: "IROHU", name: "Iron Horse Acquisitions Corp. - Unit" },
-    { symbol: "IROHW", name: "Iron Horse Acquisitions Corp. - Warrant" },
-    { symbol: "IRON", name: "Disc Medicine, Inc. - Common Stock" },
-    { symbol: "IROQ", name: "IF Bancorp, Inc. - Common Stock" },
-    { symbol: "IRTC", name: "iRhythm Technologies, Inc. - Common Stock" },
-    { symbol: "IRWD", name: "Ironwood Pharmaceuticals, Inc. - Class A Common Stock" },
-    { symbol: "ISBA", name: "Isabella Bank Corporation - Common stock" },
-    { symbol: "ISHG", name: "iShares 1-3 Year International Treasury Bond ETF" },
-    { symbol: "ISHP", name: "First Trust S-Network E-Commerce ETF" },
-    { symbol: "ISPC", name: "iSpecimen Inc. - Common Stock" },
-    { symbol: "ISPO", name: "Inspirato Incorporated - Class A Common Stock" },
-    { symbol: "ISPOW", name: "Inspirato Incorporated - Warrant" },
-    { symbol: "ISPR", name: "Ispire Technology Inc. - Common Stock" },
-    { symbol: "ISRG", name: "Intuitive Surgical, Inc. - Common Stock" },
-    { symbol: "ISRL", name: "Israel Acquisitions Corp - Class A Ordinary Shares" },
-    { symbol: "ISRLU", name: "Israel Acquisitions Corp - Unit" },
-    { symbol: "ISRLW", name: "Israel Acquisitions Corp - Warrant" },
-    { symbol: "ISSC", name: "Innovative Solutions and Support, Inc. - Common Stock" },
-    { symbol: "ISTB", name: "iShares Core 1-5 Year USD Bond ETF" },
-    { symbol: "ISTR", name: "Investar Holding Corporation - Common Stock" },
-    { symbol: "ITIC", name: "Investors Title Company - Common Stock" },
-    { symbol: "ITRI", name: "Itron, Inc. - Common Stock" },
-    { symbol: "ITRM", name: "Iterum Therapeutics plc - Ordinary Share" },
-    { symbol: "ITRN", name: "Ituran Location and Control Ltd. - Ordinary Shares" },
-    { symbol: "IUS", name: "Invesco RAFI Strategic US ETF" },
-    { symbol: "IUSB", name: "iShares Core Total USD Bond Market ETF" },
-    { symbol: "IUSG", name: "iShares Core S&P U.S. Growth ETF" },
-    { symbol: "IUSV", name: "iShares Core S&P U.S. Value ETF" },
-    { symbol: "IVA", name: "Inventiva S.A. - American Depository Shares" },
-    { symbol: "IVAL", name: "Alpha Architect International Quantitative Value ETF" },
-    { symbol: "IVDA", name: "Iveda Solutions, Inc. - Common Stock" },
-    { symbol: "IVDAW", name: "Iveda Solutions, Inc. - Warrant" },
-    { symbol: "IVF", name: "INVO Fertility, Inc. - Common Stock" },
-    { symbol: "IVP", name: "Inspire Veterinary Partners, Inc. - Class A Common Stock" },
-    { symbol: "IVVD", name: "Invivyd, Inc. - Common Stock" },
-    { symbol: "IXHL", name: "Incannex Healthcare Inc. - Common Stock" },
-    { symbol: "IXUS", name: "iShares Core MSCI Total International Stock ETF" },
-    { symbol: "IZEA", name: "IZEA Worldwide, Inc. - Common Stock" },
-    { symbol: "IZM", name: "ICZOOM Group Inc. - Class A Ordinary Shares" },
-    { symbol: "JACK", name: "Jack In The Box Inc. - Common Stock" },
-    { symbol: "JAGX", name: "Jaguar Health, Inc. - Common Stock" },
-    { symbol: "JAKK", name: "JAKKS Pacific, Inc. - Common Stock" },
-    { symbol: "JAMF", name: "Jamf Holding Corp. - Common Stock" },
-    { symbol: "JANX", name: "Janux Therapeutics, Inc. - Common Stock" },
-    { symbol: "JAPN", name: "Horizon Kinetics Japan Owner Operator ETF" },
-    { symbol: "JAZZ", name: "Jazz Pharmaceuticals plc - Ordinary Shares" },
-    { symbol: "JBDI", name: "JBDI Holdings Limited - Ordinary Shares" },
-    { symbol: "JBHT", name: "J.B. Hunt Transport Services, Inc. - Common Stock" },
-    { symbol: "JBIO", name: "Jade Biosciences, Inc. - Common Stock" },
-    { symbol: "JBLU", name: "JetBlue Airways Corporation - Common Stock" },
-    { symbol: "JBSS", name: "John B. Sanfilippo & Son, Inc. - Common Stock" },
-    { symbol: "JCAP", name: "Jefferson Capital, Inc. - Common Stock" },
-    { symbol: "JCSE", name: "JE Cleantech Holdings Limited - Ordinary Shares" },
-    { symbol: "JCTC", name: "Jewett-Cameron Trading Company - Common Shares" },
-    { symbol: "JD", name: "JD.com, Inc. - American Depositary Shares" },
-    { symbol: "JDOC", name: "JPMorgan Healthcare Leaders ETF" },
-    { symbol: "JDZG", name: "JIADE LIMITED - Class A Ordinary Shares" },
-    { symbol: "JEM", name: "707 Cayman Holdings Limited - Ordinary Shares" },
-    { symbol: "JEPQ", name: "JPMorgan Nasdaq Equity Premium Income ETF" },
-    { symbol: "JFB", name: "JFB Construction Holdings - Class A Common Stock" },
-    { symbol: "JFBR", name: "Jeffs' Brands Ltd - Ordinary Shares" },
-    { symbol: "JFBRW", name: "Jeffs' Brands Ltd - Warrant" },
-    { symbol: "JFIN", name: "Jiayin Group Inc. - American Depositary Shares" },
-    { symbol: "JFU", name: "9F Inc. - American Depositary Shares" },
-    { symbol: "JG", name: "Aurora Mobile Limited - American Depositary Shares" },
-    { symbol: "JGLO", name: "JPMorgan Global Select Equity ETF" },
-    { symbol: "JHAI", name: "Janus Henderson Global Artificial Intelligence ETF" },
-    { symbol: "JIVE", name: "JPMorgan International Value ETF" },
-    { symbol: "JJSF", name: "J & J Snack Foods Corp. - Common Stock" },
-    { symbol: "JKHY", name: "Jack Henry & Associates, Inc. - Common Stock" },
-    { symbol: "JL", name: "J-Long Group Limited - Class A Ordinary Shares" },
-    { symbol: "JLHL", name: "Julong Holding Limited - Class A Ordinary Shares" },
-    { symbol: "JMID", name: "Janus Henderson Mid Cap Growth Alpha ETF" },
-    { symbol: "JMSB", name: "John Marshall Bancorp, Inc. - Common Stock" },
-    { symbol: "JOUT", name: "Johnson Outdoors Inc. - Class A Common Stock" },
-    { symbol: "JOYY", name: "JOYY Inc. - American Depositary Shares" },
-    { symbol: "JPEF", name: "JPMorgan Equity Focus ETF" },
-    { symbol: "JPX", name: "Defiance Daily Target 2X Long JPM ETF" },
-    { symbol: "JPY", name: "Lazard Japanese Equity ETF" },
-    { symbol: "JRSH", name: "Jerash Holdings (US), Inc. - Common Stock" },
-    { symbol: "JRVR", name: "James River Group Holdings, Ltd. - Common Shares" },
-    { symbol: "JSM", name: "Navient Corporation - 6% Senior Notes due December 15, 2043" },
-    { symbol: "JSMD", name: "Janus Henderson Small/Mid Cap Growth Alpha ETF" },
-    { symbol: "JSML", name: "Janus Henderson Small Cap Growth Alpha ETF" },
-    { symbol: "JSPR", name: "Jasper Therapeutics, Inc. - Class A Common Stock" },
-    { symbol: "JSPRW", name: "Jasper Therapeutics, Inc. - Warrant" },
-    { symbol: "JTAI", name: "Jet.AI Inc. - Common Stock" },
-    { symbol: "JTEK", name: "JPMorgan U.S. Tech Leaders ETF" },
-    { symbol: "JUNS", name: "Jupiter Neurosciences, Inc. - Common Stock" },
-    { symbol: "JVA", name: "Coffee Holding Co., Inc. - Common Stock" },
-    { symbol: "JWEL", name: "Jowell Global Ltd. - Ordinary Shares" },
-    { symbol: "JXG", name: "JX Luxventure Group Inc. - Common Stock" },
-    { symbol: "JYD", name: "Jayud Global Logistics Limited - Class A Ordinary Shares" },
-    { symbol: "JYNT", name: "The Joint Corp. - Common Stock" },
-    { symbol: "JZ", name: "Jianzhi Education Technology Group Company Limited - American Depositary Shares" },
-    { symbol: "JZXN", name: "Jiuzi Holdings, Inc. - Ordinary Shares" },
-    { symbol: "KALA", name: "KALA BIO, Inc. - Common Stock" },
-    { symbol: "KALU", name: "Kaiser Aluminum Corporation - Common Stock" },
-    { symbol: "KALV", name: "KalVista Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "KARO", name: "Karooooo Ltd. - Ordinary shares" },
-    { symbol: "KAT", name: "Scharf ETF" },
-    { symbol: "KAVL", name: "Kaival Brands Innovations Group, Inc. - Common Stock" },
-    { symbol: "KBAB", name: "KraneShares 2x Long BABA Daily ETF" },
-    { symbol: "KBSX", name: "FST Corp. - Ordinary Shares" },
-    { symbol: "KBWB", name: "Invesco KBW Bank ETF" },
-    { symbol: "KBWD", name: "Invesco KBW High Dividend Yield Financial ETF" },
-    { symbol: "KBWP", name: "Invesco KBW Property & Casualty Insurance ETF" },
-    { symbol: "KBWR", name: "Invesco KBW Regional Banking ETF" },
-    { symbol: "KBWY", name: "Invesco KBW Premium Yield Equity REIT ETF" },
-    { symbol: "KC", name: "Kingsoft Cloud Holdings Limited - American Depositary Shares" },
-    { symbol: "KCHV", name: "Kochav Defense Acquisition Corp. - Class A Ordinary Shares" },
-    { symbol: "KCHVR", name: "Kochav Defense Acquisition Corp. - Right" },
-    { symbol: "KCHVU", name: "Kochav Defense Acquisition Corp. - Units" },
-    { symbol: "KDP", name: "Keurig Dr Pepper Inc. - Common Stock" },
-    { symbol: "KE", name: "Kimball Electronics, Inc. - Common Stock" },
-    { symbol: "KEAT", name: "Keating Active ETF" },
-    { symbol: "KELYA", name: "Kelly Services, Inc. - Class A Common Stock" },
-    { symbol: "KELYB", name: "Kelly Services, Inc. - Class B Common Stock" },
-    { symbol: "KEQU", name: "Kewaunee Scientific Corporation - Common Stock" },
-    { symbol: "KFFB", name: "Kentucky First Federal Bancorp - Common Stock" },
-    { symbol: "KFII", name: "K&F Growth Acquisition Corp. II - Class A Ordinary shares" },
-    { symbol: "KFIIR", name: "K&F Growth Acquisition Corp. II - Rights" },
-    { symbol: "KFIIU", name: "K&F Growth Acquisition Corp. II - Unit" },
-    { symbol: "KG", name: "Kestrel Group, Ltd. - Common Stock" },
-    { symbol: "KGEI", name: "Kolibri Global Energy Inc. - Common stock" },
-    { symbol: "KHC", name: "The Kraft Heinz Company - Common Stock" },
-    { symbol: "KIDS", name: "OrthoPediatrics Corp. - Common Stock" },
-    { symbol: "KIDZ", name: "Classover Holdings, Inc. - Class B Common Stock" },
-    { symbol: "KIDZW", name: "Classover Holdings, Inc. - Warrants" },
-    { symbol: "KINS", name: "Kingstone Companies, Inc - Common Stock" },
-    { symbol: "KITT", name: "Nauticus Robotics, Inc. - Common stock" },
-    { symbol: "KITTW", name: "Nauticus Robotics, Inc. - Warrant" },
-    { symbol: "KLAC", name: "KLA Corporation  - Common Stock" },
-    { symbol: "KLIC", name: "Kulicke and Soffa Industries, Inc. - Common Stock" },
-    { symbol: "KLRS", name: "Kalaris Therapeutics, Inc.  - Common Stock" },
-    { symbol: "KLTO", name: "Klotho Neurosciences, Inc. - Common Stock" },
-    { symbol: "KLTOW", name: "Klotho Neurosciences, Inc. - Warrants" },
-    { symbol: "KLTR", name: "Kaltura, Inc. - Common Stock" },
-    { symbol: "KLXE", name: "KLX Energy Services Holdings, Inc.  - Common Stock" },
-    { symbol: "KMB", name: "Kimberly-Clark Corporation - Common Stock" },
-    { symbol: "KMDA", name: "Kamada Ltd. - Ordinary Shares" },
-    { symbol: "KMLI", name: "KraneShares 2x Long MELI Daily ETF" },
-    { symbol: "KMRK", name: "K-Tech Solutions Company Limited - Class A Ordinary Shares" },
-    { symbol: "KMTS", name: "Kestra Medical Technologies, Ltd. - Common Stock" },
-    { symbol: "KNDI", name: "Kandi Technologies Group, Inc. - Ordinary Shares" },
-    { symbol: "KNGZ", name: "First Trust S&P 500 Diversified Dividend Aristocrats ETF" },
-    { symbol: "KNSA", name: "Kiniksa Pharmaceuticals, Ltd. - Class A Ordinary Shares" },
-    { symbol: "KOD", name: "Kodiak Sciences Inc - Common Stock" },
-    { symbol: "KOID", name: "KraneShares Global Humanoid and Embodied Intelligence Index ETF" },
-    { symbol: "KOPN", name: "Kopin Corporation - Common Stock" },
-    { symbol: "KOSS", name: "Koss Corporation - Common Stock" },
-    { symbol: "KOYNU", name: "CSLM Digital Asset Acquisition Corp III - Units" },
-    { symbol: "KPDD", name: "KraneShares 2x Long PDD Daily ETF" },
-    { symbol: "KPLT", name: "Katapult Holdings, Inc. - Common Stock" },
-    { symbol: "KPLTW", name: "Katapult Holdings, Inc. - Warrant" },
-    { symbol: "KPRX", name: "Kiora Pharmaceuticals, Inc.  - Common Stock" },
-    { symbol: "KPTI", name: "Karyopharm Therapeutics Inc. - Common Stock" },
-    { symbol: "KQQQ", name: "Kurv Technology Titans Select ETF" },
-    { symbol: "KRKR", name: "36Kr Holdings Inc. - American Depositary Shares" },
-    { symbol: "KRMA", name: "Global X Conscious Companies ETF" },
-    { symbol: "KRMD", name: "KORU Medical Systems, Inc. - Common Stock" },
-    { symbol: "KRNT", name: "Kornit Digital Ltd. - Ordinary Shares" },
-    { symbol: "KRNY", name: "Kearny Financial - Common Stock" },
-    { symbol: "KROP", name: "Global X AgTech & Food Innovation ETF" },
-    { symbol: "KROS", name: "Keros Therapeutics, Inc. - common stock" },
-    { symbol: "KRRO", name: "Korro Bio, Inc. - Common Stock" },
-    { symbol: "KRT", name: "Karat Packaging Inc. - Common Stock" },
-    { symbol: "KRUS", name: "Kura Sushi USA, Inc. - Class A Common Stock" },
-    { symbol: "KRYS", name: "Krystal Biotech, Inc. - Common Stock" },
-    { symbol: "KSCP", name: "Knightscope, Inc. - Class A Common Stock" },
-    { symbol: "KSPI", name: "Joint Stock Company Kaspi.kz - American Depository Shares" },
-    { symbol: "KTCC", name: "Key Tronic Corporation - Common Stock" },
-    { symbol: "KTOS", name: "Kratos Defense & Security Solutions, Inc. - Common Stock" },
-    { symbol: "KTTA", name: "Pasithea Therapeutics Corp. - Common Stock" },
-    { symbol: "KTTAW", name: "Pasithea Therapeutics Corp. - Warrant" },
-    { symbol: "KURA", name: "Kura Oncology, Inc. - Common Stock" },
-    { symbol: "KVAC", name: "Keen Vision Acquisition Corporation - Ordinary Shares" },
-    { symbol: "KVACU", name: "Keen Vision Acquisition Corporation - Units" },
-    { symbol: "KVACW", name: "Keen Vision Acquisition Corporation - Warrant" },
-    { symbol: "KVHI", name: "KVH Industries, Inc. - Common Stock" },
-    { symbol: "KWM", name: "K Wave Media, Ltd. - Ordinary Shares" },
-    { symbol: "KWMWW", name: "K Wave Media, Ltd. - Warrant" },
-    { symbol: "KXIN", name: "Kaixin Holdings - Ordinary Shares" },
-    { symbol: "KYIV", name: "Kyivstar Group Ltd. - Common Shares" },
-    { symbol: "KYIVW", name: "Kyivstar Group Ltd. - Warrant" },
-    { symbol: "KYMR", name: "Kymera Therapeutics, Inc. - Common Stock" },
-    { symbol: "KYTX", name: "Kyverna Therapeutics, Inc. - Common Stock" },
-    { symbol: "KZIA", name: "Kazia Therapeutics Limited - American Depositary Shares" },
-    { symbol: "KZR", name: "Kezar Life Sciences, Inc. - Common Stock" },
-    { symbol: "LAB", name: "Standard BioTools Inc. - Common Stock" },
-    { symbol: "LAES", name: "SEALSQ Corp - Ordinary Shares" },
-    { symbol: "LAKE", name: "Lakeland Industries, Inc. - Common Stock" },
-    { symbol: "LAMR", name: "Lamar Advertising Company - Class A Common Stock" },
-    { symbol: "LAND", name: "Gladstone Land Corporation - Common Stock" },
-    { symbol: "LANDM", name: "Gladstone Land Corporation - 5.00% Series D Cumulative Term Preferred Stock" },
-    { symbol: "LANDO", name: "Gladstone Land Corporation - 6.00% Series B Cumulative Redeemable Preferred Stock" },
-    { symbol: "LANDP", name: "Gladstone Land Corporation - 6.00% Series C Cumulative Redeemable Preferred Stock" },
-    { symbol: "LARK", name: "Landmark Bancorp Inc. - Common Stock" },
-    { symbol: "LASE", name: "Laser Photonics Corporation - Common Stock" },
-    { symbol: "LASR", name: "nLIGHT, Inc. - Common Stock" },
-    { symbol: "LAUR", name: "Laureate Education, Inc. - Common Stock" },
-    { symbol: "LAWR", name: "Robot Consulting Co., Ltd. - ADS" },
-    { symbol: "LAYS", name: "STKd 100% NVDA & 100% AMD ETF" },
-    { symbol: "LAZR", name: "Luminar Technologies, Inc.  - Class A Common Stock" },
-    { symbol: "LBGJ", name: "Li Bang International Corporation Inc. - Ordinary Shares" },
-    { symbol: "LBRDA", name: "Liberty Broadband Corporation - Class A Common Stock" },
-    { symbol: "LBRDK", name: "Liberty Broadband Corporation - Class C Common Stock" },
-    { symbol: "LBRDP", name: "Liberty Broadband Corporation - Series A Cumulative Redeemable Preferred Stock" },
-    { symbol: "LBTYA", name: "Liberty Global Ltd. - Class A Common Shares" },
-    { symbol: "LBTYB", name: "Liberty Global Ltd. - Class B Common Shares" },
-    { symbol: "LBTYK", name: "Liberty Global Ltd. - Class C Common Shares" },
-    { symbol: "LCCC", name: "Lakeshore Acquisition III Corp. - Ordinary Shares" },
-    { symbol: "LCCCR", name: "Lakeshore Acquisition III Corp. - Rights" },
-    { symbol: "LCCCU", name: "Lakeshore Acquisition III Corp. - Unit" },
-    { symbol: "LCDL", name: "GraniteShares 2x Long LCID Daily ETF" },
-    { symbol: "LCDS", name: "JPMorgan Fundamental Data Science Large Core ETF" },
-    { symbol: "LCFY", name: "Locafy Limited - Ordinary Share" },
-    { symbol: "LCFYW", name: "Locafy Limited - Warrant" },
-    { symbol: "LCID", name: "Lucid Group, Inc. - Common Stock" },
-    { symbol: "LCNB", name: "LCNB Corporation - Common Stock" },
-    { symbol: "LCUT", name: "Lifetime Brands, Inc. - Common Stock" },
-    { symbol: "LDEM", name: "iShares ESG MSCI EM Leaders ETF" },
-    { symbol: "LDRX", name: "SGI Enhanced Market Leaders ETF" },
-    { symbol: "LDSF", name: "First Trust Low Duration Strategic Focus ETF" },
-    { symbol: "LDWY", name: "Lendway, Inc. - Common Stock" },
-    { symbol: "LE", name: "Lands' End, Inc. - Common Stock" },
-    { symbol: "LECO", name: "Lincoln Electric Holdings, Inc. - Common Shares" },
-    { symbol: "LEDS", name: "SemiLEDS Corporation - Common Stock" },
-    { symbol: "LEE", name: "Lee Enterprises, Incorporated - Common Stock" },
-    { symbol: "LEGH", name: "Legacy Housing Corporation - Common Stock" },
-    { symbol: "LEGN", name: "Legend Biotech Corporation - American Depositary Shares" },
-    { symbol: "LEGR", name: "First Trust Indxx Innovative Transaction & Process ETF" },
-    { symbol: "LENZ", name: "LENZ Therapeutics, Inc. - Common Stock" },
-    { symbol: "LESL", name: "Leslie's, Inc. - Common Stock" },
-    { symbol: "LEXI", name: "Alexis Practical Tactical ETF" },
-    { symbol: "LEXX", name: "Lexaria Bioscience Corp. - Common Stock" },
-    { symbol: "LEXXW", name: "Lexaria Bioscience Corp. - Warrant" },
-    { symbol: "LFCR", name: "Lifecore Biomedical, Inc. - Common Stock" },
-    { symbol: "LFMD", name: "LifeMD, Inc. - Common Stock" },
-    { symbol: "LFMDP", name: "LifeMD, Inc. - 8.875% Series A Cumulative Perpetual Preferred Stock" },
-    { symbol: "LFSC", name: "F/m Emerald Life Sciences Innovation ETF" },
-    { symbol: "LFST", name: "LifeStance Health Group, Inc. - Common Stock" },
-    { symbol: "LFUS", name: "Littelfuse, Inc. - Common Stock" },
-    { symbol: "LFVN", name: "Lifevantage Corporation - Common Stock" },
-    { symbol: "LFWD", name: "Lifeward Ltd. - Ordinary Shares" },
-    { symbol: "LGCB", name: "Linkage Global Inc - Class A Ordinary Shares" },
-    { symbol: "LGCF", name: "Themes US Cash Flow Champions ETF" },
-    { symbol: "LGCL", name: "Lucas GC Limited - Ordinary Shares" },
-    { symbol: "LGHL", name: "Lion Group Holding Ltd. - American Depositary Share" },
-    { symbol: "LGIH", name: "LGI Homes, Inc. - Common Stock" },
-    { symbol: "LGND", name: "Ligand Pharmaceuticals Incorporated - Common Stock" },
-    { symbol: "LGO", name: "Largo Inc. - Common Shares" },
-    { symbol: "LGRO", name: "Level Four Large Cap Growth Active ETF" },
-    { symbol: "LGVN", name: "Longeveron Inc. - Class A Common stock" },
-    { symbol: "LHAI", name: "Linkhome Holdings Inc. - Common stock" },
-    { symbol: "LHSW", name: "Lianhe Sowell International Group Ltd - Ordinary Shares" },
-    { symbol: "LI", name: "Li Auto Inc. - American Depositary Shares" },
-    { symbol: "LICN", name: "Lichen International Limited - Class A Ordinary Shares" },
-    { symbol: "LIDR", name: "AEye, Inc. - Class A Common Stock" },
-    { symbol: "LIDRW", name: "AEye, Inc. - Warrant" },
-    { symbol: "LIEN", name: "Chicago Atlantic BDC, Inc. - Common Stock" },
-    { symbol: "LIF", name: "Life360, Inc. - Common Stock" },
-    { symbol: "LILA", name: "Liberty Latin America Ltd. - Class A Common Stock" },
-    { symbol: "LILAK", name: "Liberty Latin America Ltd. - Class C Common Stock" },
-    { symbol: "LIMN", name: "Liminatus Pharma, Inc. - Class A Common Stock" },
-    { symbol: "LIMNW", name: "Liminatus Pharma, Inc. - Warrants" },
-    { symbol: "LIN", name: "Linde plc - Ordinary Shares" },
-    { symbol: "LINC", name: "Lincoln Educational Services Corporation - Common Stock" },
-    { symbol: "LIND", name: "Lindblad Expeditions Holdings Inc.  - Common Stock" },
-    { symbol: "LINE", name: "Lineage, Inc. - Common Stock" },
-    { symbol: "LINK", name: "Interlink Electronics, Inc. - Common Stock" },
-    { symbol: "LIQT", name: "LiqTech International, Inc. - Common Stock" },
-    { symbol: "LITE", name: "Lumentum Holdings Inc. - Common Stock" },
-    { symbol: "LITM", name: "Snow Lake Resources Ltd. - Common Shares" },
-    { symbol: "LITP", name: "Sprott Lithium Miners ETF" },
-    { symbol: "LIVE", name: "Live Ventures Incorporated - Common Stock" },
-    { symbol: "LIVN", name: "LivaNova PLC - Ordinary Shares" },
-    { symbol: "LIVR", name: "Intelligent Livermore ETF" },
-    { symbol: "LIXT", name: "Lixte Biotechnology Holdings, Inc. - Common Stock" },
-    { symbol: "LIXTW", name: "Lixte Biotechnology Holdings, Inc. - Warrants" },
-    { symbol: "LKFN", name: "Lakeland Financial Corporation - Common Stock" },
-    { symbol: "LKQ", name: "LKQ Corporation - Common Stock" },
-    { symbol: "LLYVA", name: "Liberty Media Corporation - Series A Liberty Live Common Stock" },
-    { symbol: "LLYVK", name: "Liberty Media Corporation - Series C Liberty Live Common Stock" },
-    { symbol: "LLYZ", name: "Defiance Daily Target 2X Short LLY ETF" },
-    { symbol: "LMAT", name: "LeMaitre Vascular, Inc. - Common Stock" },
-    { symbol: "LMB", name: "Limbach Holdings, Inc. - Common Stock" },
-    { symbol: "LMBS", name: "First Trust Low Duration Opportunities ETF" },
-    { symbol: "LMFA", name: "LM Funding America, Inc. - Common Stock" },
-    { symbol: "LMNR", name: "Limoneira Co - Common Stock" },
-    { symbol: "LMTL", name: "Direxion Daily LMT Bull 2X ETF" },
-    { symbol: "LMTS", name: "Direxion Daily LMT Bear 1X ETF" },
-    { symbol: "LNKB", name: "LINKBANCORP, Inc. - Common Stock" },
-    { symbol: "LNKS", name: "Linkers Industries Limited - Class A Ordinary Shares" },
-    { symbol: "LNSR", name: "LENSAR, Inc. - Common Stock" },
-    { symbol: "LNT", name: "Alliant Energy Corporation - Common Stock" },
-    { symbol: "LNTH", name: "Lantheus Holdings, Inc. - Common Stock" },
-    { symbol: "LNW", name: "Light & Wonder, Inc.  - Common Stock" },
-    { symbol: "LNZA", name: "LanzaTech Global, Inc. - Common Stock" },
-    { symbol: "LNZAW", name: "LanzaTech Global, Inc. - Warrant" },
-    { symbol: "LOAN", name: "Manhattan Bridge Capital, Inc - Common Stock" },
-    { symbol: "LOBO", name: "LOBO EV TECHNOLOGIES LTD. - Ordinary shares" },
-    { symbol: "LOCO", name: "El Pollo Loco Holdings, Inc. - Common Stock" },
-    { symbol: "LOGI", name: "Logitech International S.A. - Registered Shares" },
-    { symbol: "LOGO", name: "Alpha Brands Consumption Leaders ETF" },
-    { symbol: "LOKV", name: "Live Oak Acquisition Corp. V - Class A Ordinary Shares" },
-    { symbol: "LOKVU", name: "Live Oak Acquisition Corp. V - Units" },
-    { symbol: "LOKVW", name: "Live Oak Acquisition Corp. V - Warrants" },
-    { symbol: "LOOP", name: "Loop Industries, Inc. - Common Stock" },
-    { symbol: "LOPE", name: "Grand Canyon Education, Inc. - Common Stock" },
-    { symbol: "LOT", name: "Lotus Technology Inc. - American Depositary Shares" },
-    { symbol: "LOTWW", name: "Lotus Technology Inc. - Warrants" },
-    { symbol: "LOVE", name: "The Lovesac Company - Common Stock" },
-    { symbol: "LPAA", name: "Launch One Acquisition Corp. - Class A Ordinary Shares" },
-    { symbol: "LPAAU", name: "Launch One Acquisition Corp. - Unit" },
-    { symbol: "LPAAW", name: "Launch One Acquisition Corp. - Warrant" },
-    { symbol: "LPBB", name: "Launch Two Acquisition Corp. - Class A Ordinary Shares" },
-    { symbol: "LPBBU", name: "Launch Two Acquisition Corp. - Unit" },
-    { symbol: "LPBBW", name: "Launch Two Acquisition Corp. - Warrant" },
-    { symbol: "LPCN", name: "Lipocine Inc. - Common Stock" },
-    { symbol: "LPLA", name: "LPL Financial Holdings Inc. - Common Stock" },
-    { symbol: "LPRO", name: "Open Lending Corporation - Common Stock" },
-    { symbol: "LPSN", name: "LivePerson, Inc. - Common Stock" },
-    { symbol: "LPTH", name: "LightPath Technologies, Inc. - Class A Common Stock" },
-    { symbol: "LPTX", name: "Leap Therapeutics, Inc. - Common Stock" },
-    { symbol: "LQDA", name: "Liquidia Corporation - Common Stock" },
-    { symbol: "LQDT", name: "Liquidity Services, Inc. - Common Stock" },
-    { symbol: "LRCX", name: "Lam Research Corporation - Common Stock" },
-    { symbol: "LRE", name: "Lead Real Estate Co., Ltd - American Depositary Shares" },
-    { symbol: "LRGE", name: "ClearBridge Large Cap Growth Select ETF" },
-    { symbol: "LRHC", name: "La Rosa Holdings Corp. - Common Stock" },
-    { symbol: "LRMR", name: "Larimar Therapeutics, Inc. - Common Stock" },
-    { symbol: "LRND", name: "NYLI U.S. Large Cap R&D Leaders ETF" },
-    { symbol: "LSAK", name: "Lesaka Technologies, Inc. - Common Stock" },
-    { symbol: "LSB", name: "LakeShore Biopharma Co., Ltd - Ordinary Shares" },
-    { symbol: "LSBK", name: "Lake Shore Bancorp, Inc. - Common Stock" },
-    { symbol: "LSBPW", name: "LakeShore Biopharma Co., Ltd - Warrants" },
-    { symbol: "LSCC", name: "Lattice Semiconductor Corporation - Common Stock" },
-    { symbol: "LSE", name: "Leishen Energy Holding Co., Ltd. - Ordinary Shares" },
-    { symbol: "LSH", name: "Lakeside Holding Limited - Common Stock" },
-    { symbol: "LSTA", name: "Lisata Therapeutics, Inc. - Common Stock" },
-    { symbol: "LSTR", name: "Landstar System, Inc. - Common Stock" },
-    { symbol: "LTBR", name: "Lightbridge Corporation - Common Stock" },
-    { symbol: "LTRN", name: "Lantern Pharma Inc. - Common Stock" },
-    { symbol: "LTRX", name: "Lantronix, Inc. - Common Stock" },
-    { symbol: "LTRYW", name: "Lottery.com, Inc. - Warrant" },
-    { symbol: "LUCD", name: "Lucid Diagnostics Inc. - Common Stock" },
-    { symbol: "LUCY", name: "Innovative Eyewear, Inc. - Common Stock" },
-    { symbol: "LUCYW", name: "Innovative Eyewear, Inc. - Warrants" },
-    { symbol: "LULU", name: "lululemon athletica inc. - Common Stock" },
-    { symbol: "LUNG", name: "Pulmonx Corporation - Common Stock" },
-    { symbol: "LUNR", name: "Intuitive Machines, Inc. - Class A Common Stock" },
-    { symbol: "LVHD", name: "Franklin U.S. Low Volatility High Dividend Index ETF" },
-    { symbol: "LVLU", name: "Lulu's Fashion Lounge Holdings, Inc. - Common Stock" },
-    { symbol: "LVO", name: "LiveOne, Inc. - Common Stock" },
-    { symbol: "LVRO", name: "Lavoro Limited - Class A Ordinary Shares" },
-    { symbol: "LVROW", name: "Lavoro Limited - Warrant" },
-    { symbol: "LVTX", name: "LAVA Therapeutics N.V. - Ordinary Shares" },
-    { symbol: "LWAC", name: "LightWave Acquisition Corp. - Class A Ordinary Shares" },
-    { symbol: "LWACU", name: "LightWave Acquisition Corp. - Units" },
-    { symbol: "LWACW", name: "LightWave Acquisition Corp. - Warrants" },
-    { symbol: "LWAY", name: "Lifeway Foods, Inc. - Common Stock" },
-    { symbol: "LWLG", name: "Lightwave Logic, Inc. - Common Stock" },
-    { symbol: "LX", name: "LexinFintech Holdings Ltd. - American Depositary Shares" },
-    { symbol: "LXEH", name: "Lixiang Education Holding Co., Ltd. - American Depositary Shares" },
-    { symbol: "LXEO", name: "Lexeo Therapeutics, Inc. - Common Stock" },
-    { symbol: "LXRX", name: "Lexicon Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "LYEL", name: "Lyell Immunopharma, Inc. - Common Stock" },
-    { symbol: "LYFT", name: "Lyft, Inc. - Class A Common Stock" },
-    { symbol: "LYRA", name: "Lyra Therapeutics, Inc. - Common Stock" },
-    { symbol: "LYTS", name: "LSI Industries Inc. - Common Stock" },
-    { symbol: "LZ", name: "LegalZoom.com, Inc. - Common Stock" },
-    { symbol: "LZMH", name: "LZ Technology Holdings Limited - Class B Ordinary Shares" },
-    { symbol: "MAAS", name: "Maase Inc. - Class A Ordinary Shares" },
-    { symbol: "MACI", name: "Melar Acquisition Corp. I - Class A Ordinary Shares" },
-    { symbol: "MACIU", name: "Melar Acquisition Corp. I - Unit" },
-    { symbol: "MACIW", name: "Melar Acquisition Corp. I - Warrant" },
-    { symbol: "MAGH", name: "Magnitude International Ltd - Ordinary Shares" },
-    { symbol: "MAMA", name: "Mama's Creations, Inc. - Common Stock" },
-    { symbol: "MAMK", name: "MaxsMaking Inc. - Class A Ordinary Shares" },
-    { symbol: "MAMO", name: "Massimo Group - Common Stock" },
-    { symbol: "MANH", name: "Manhattan Associates, Inc. - Common Stock" },
-    { symbol: "MAPS", name: "WM Technology, Inc. - Class A Common Stock" },
-    { symbol: "MAPSW", name: "WM Technology, Inc. - Warrants" },
-    { symbol: "MAR", name: "Marriott International - Class A Common Stock" },
-    { symbol: "MARA", name: "MARA Holdings, Inc. - Common Stock" },
-    { symbol: "MARPS", name: "Marine Petroleum Trust - Units of Beneficial Interest" },
-    { symbol: "MASI", name: "Masimo Corporation - Common Stock" },
-    { symbol: "MASK", name: "3 E Network Technology Group Ltd - Class A Ordinary Shares" },
-    { symbol: "MASS", name: "908 Devices Inc. - Common Stock" },
-    { symbol: "MAT", name: "Mattel, Inc. - Common Stock" },
-    { symbol: "MATH", name: "Metalpha Technology Holding Limited - Ordinary Shares" },
-    { symbol: "MATW", name: "Matthews International Corporation - Class A Common Stock" },
-    { symbol: "MAXI", name: "Simplify Bitcoin Strategy PLUS Income ETF" },
-    { symbol: "MAXN", name: "Maxeon Solar Technologies, Ltd. - Ordinary Shares" },
-    { symbol: "MAYA", name: "Maywood Acquisition Corp. - Class A Ordinary Shares" },
-    { symbol: "MAYAR", name: "Maywood Acquisition Corp. - Right" },
-    { symbol: "MAYAU", name: "Maywood Acquisition Corp. - Unit" },
-    { symbol: "MAYS", name: "J. W. Mays, Inc. - Common Stock" },
-    { symbol: "MAZE", name: "Maze Therapeutics, Inc. - Common Stock" },
-    { symbol: "MB", name: "MasterBeef Group - Ordinary Shares" },
-    { symbol: "MBAV", name: "M3-Brigade Acquisition V Corp. - Class A Ordinary shares" },
-    { symbol: "MBAVU", name: "M3-Brigade Acquisition V Corp. - Units" },
-    { symbol: "MBAVW", name: "M3-Brigade Acquisition V Corp. - Warrant" },
-    { symbol: "MBB", name: "iShares MBS ETF" },
-    { symbol: "MBBC", name: "Marathon Bancorp, Inc. - Common Stock" },
-    { symbol: "MBCN", name: "Middlefield Banc Corp. - Common Stock" },
-    { symbol: "MBIN", name: "Merchants Bancorp - Common Stock" },
-    { symbol: "MBINL", name: "Merchants Bancorp - Depositary Shares, Each Representing a 1/40th Interest in a Share of 7.625% Fixed Rate Series E Non-Cumulative Perpetual Preferred Stock, without par value" },
-    { symbol: "MBINM", name: "Merchants Bancorp - Depositary Shares, Each Representing a 1/40th Interest in a Share of 8.25% Fixed-Rate Reset Series D Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "MBINN", name: "Merchants Bancorp - Depositary Shares 6.00% Fixed Rate Series C Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "MBIO", name: "Mustang Bio, Inc. - Common Stock" },
-    { symbol: "MBLY", name: "Mobileye Global Inc. - Class A Common Stock" },
-    { symbol: "MBNKO", name: "Medallion Bank - Fixed-Rate Reset Non-Cumulative Perpetual Preferred Stock, Series G, par value $1.00 per share" },
-    { symbol: "MBOT", name: "Microbot Medical Inc.  - Common Stock" },
-    { symbol: "MBRX", name: "Moleculin Biotech, Inc. - Common Stock" },
-    { symbol: "MBS", name: "Angel Oak Mortgage-Backed Securities ETF" },
-    { symbol: "MBUU", name: "Malibu Boats, Inc. - Common Stock" },
-    { symbol: "MBVIU", name: "M3-Brigade Acquisition VI Corp. - Units" },
-    { symbol: "MBWM", name: "Mercantile Bank Corporation - Common Stock" },
-    { symbol: "MBX", name: "MBX Biosciences, Inc. - Common Stock" },
-    { symbol: "MCBS", name: "MetroCity Bankshares, Inc. - Common Stock" },
-    { symbol: "MCDS", name: "JPMorgan Fundamental Data Science Mid Core ETF" },
-    { symbol: "MCFT", name: "MasterCraft Boat Holdings, Inc. - Common Stock" },
-    { symbol: "MCGA", name: "Yorkville Acquisition Corp. - Class A Ordinary Share" },
-    { symbol: "MCGAU", name: "Yorkville Acquisition Corp. - Unit" },
-    { symbol: "MCGAW", name: "Yorkville Acquisition Corp. - Warrant" },
-    { symbol: "MCHB", name: "Mechanics Bancorp - Class A Common Stock" },
-    { symbol: "MCHI", name: "iShares MSCI China ETF" },
-    { symbol: "MCHP", name: "Microchip Technology Incorporated - Common Stock" },
-    { symbol: "MCHPP", name: "Microchip Technology Incorporated - Depositary Shares Each Representing a 1/20th Interest in a Share of 7.50% Series A Mandatory Convertible Preferred Stock" },
-    { symbol: "MCHS", name: "Matthews China Discovery Active ETF" },
-    { symbol: "MCHX", name: "Marchex, Inc. - Class B Common Stock" },
-    { symbol: "MCRB", name: "Seres Therapeutics, Inc. - Common Stock" },
-    { symbol: "MCRI", name: "Monarch Casino & Resort, Inc. - Common Stock" },
-    { symbol: "MCSE", name: "Franklin Sustainable International Equity ETF" },
-    { symbol: "MCTR", name: "CTRL Group Limited - ordinary shares" },
-    { symbol: "MCW", name: "Mister Car Wash, Inc. - Common Stock" },
-    { symbol: "MDAI", name: "Spectral AI, Inc. - Class A Common Stock" },
-    { symbol: "MDAIW", name: "Spectral AI, Inc. - Warrants" },
-    { symbol: "MDB", name: "MongoDB, Inc. - Class A Common Stock" },
-    { symbol: "MDBH", name: "MDB Capital Holdings, LLC - Class A common " },
-    { symbol: "MDCX", name: "Medicus Pharma Ltd. - Common Stock" },
-    { symbol: "MDCXW", name: "Medicus Pharma Ltd. - Warrant" },
-    { symbol: "MDGL", name: "Madrigal Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "MDIA", name: "Mediaco Holding Inc. - Class A Common Stock" },
-    { symbol: "MDIV", name: "Multi-Asset Diversified Income Index Fund" },
-    { symbol: "MDLZ", name: "Mondelez International, Inc. - Class A Common Stock" },
-    { symbol: "MDRR", name: "Medalist Diversified REIT, Inc. - Common Stock" },
-    { symbol: "MDWD", name: "MediWound Ltd. - Ordinary Shares" },
-    { symbol: "MDXG", name: "MiMedx Group, Inc - Common Stock" },
-    { symbol: "MDXH", name: "MDxHealth SA - Ordinary Shares" },
-    { symbol: "MEDP", name: "Medpace Holdings, Inc. - Common Stock" },
-    { symbol: "MEDX", name: "Horizon Kinetics Medical ETF" },
-    { symbol: "MEGL", name: "Magic Empire Global Limited - Class A Ordinary Shares" },
-    { symbol: "MEIP", name: "MEI Pharma, Inc. - Common Stock" },
-    { symbol: "MELI", name: "MercadoLibre, Inc. - Common Stock" },
-    { symbol: "MEMS", name: "Matthews Emerging Markets Discovery Active ETF" },
-    { symbol: "MENS", name: "Jyong Biotech Ltd. - Ordinary shares" },
-    { symbol: "MEOH", name: "Methanex Corporation - Common Stock" },
-    { symbol: "MERC", name: "Mercer International Inc. - Common Stock" },
-    { symbol: "MESA", name: "Mesa Air Group, Inc. - Common Stock" },
-    { symbol: "MESO", name: "Mesoblast Limited - American Depositary Shares" },
-    { symbol: "META", name: "Meta Platforms, Inc. - Class A Common Stock" },
-    { symbol: "METC", name: "Ramaco Resources, Inc. - Class A Common Stock" },
-    { symbol: "METCB", name: "Ramaco Resources, Inc. - Class B Common Stock" },
-    { symbol: "METCI", name: "Ramaco Resources, Inc. - 8.250% Senior Notes due 2030" },
-    { symbol: "METCZ", name: "Ramaco Resources, Inc. - 8.375% Senior Notes due 2029" },
-    { symbol: "METD", name: "Direxion Daily META Bear 1X Shares" },
-    { symbol: "METU", name: "Direxion Daily META Bull 2X Shares" },
-    { symbol: "MFH", name: "Mercurity Fintech Holding Inc. - American Ordinary Shares" },
-    { symbol: "MFI", name: "mF International Limited - Class A Ordinary Shares" },
-    { symbol: "MFIC", name: "MidCap Financial Investment Corporation - Closed End Fund" },
-    { symbol: "MFICL", name: "MidCap Financial Investment Corporation - 8.00% Notes due 2028" },
-    { symbol: "MFIN", name: "Medallion Financial Corp. - Common Stock" },
-    { symbol: "MFLX", name: "First Trust Flexible Municipal High Income ETF" },
-    { symbol: "MGEE", name: "MGE Energy Inc. - Common Stock" },
-    { symbol: "MGIC", name: "Magic Software Enterprises Ltd. - Ordinary Shares" },
-    { symbol: "MGIH", name: "Millennium Group International Holdings Limited - Ordinary Shares" },
-    { symbol: "MGNI", name: "Magnite, Inc. - Common Stock" },
-    { symbol: "MGNX", name: "MacroGenics, Inc. - Common Stock" },
-    { symbol: "MGPI", name: "MGP Ingredients, Inc. - Common Stock" },
-    { symbol: "MGRC", name: "McGrath RentCorp - Common Stock" },
-    { symbol: "MGRM", name: "Monogram Technologies Inc. - Common Stock" },
-    { symbol: "MGRT", name: "Mega Fortune Company Limited - Ordinary Shares" },
-    { symbol: "MGRX", name: "Mangoceuticals, Inc. - Common Stock" },
-    { symbol: "MGTX", name: "MeiraGTx Holdings plc - Ordinary Shares" },
-    { symbol: "MGX", name: "Metagenomi, Inc. - Common Stock" },
-    { symbol: "MGYR", name: "Magyar Bancorp, Inc. - Common Stock" },
-    { symbol: "MHUA", name: "Meihua International Medical Technologies Co., Ltd. - Ordinary Shares" },
-    { symbol: "MIDD", name: "The Middleby Corporation - Common Stock" },
-    { symbol: "MIGI", name: "Mawson Infrastructure Group Inc. - Common Stock" },
-    { symbol: "MILN", name: "Global X Millennial Consumer ETF" },
-    { symbol: "MIMI", name: "Mint Incorporation Limited - Class A Ordinary Shares" },
-    { symbol: "MIND", name: "MIND Technology, Inc. - Common Stock" },
-    { symbol: "MIRA", name: "MIRA Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "MIRM", name: "Mirum Pharmaceuticals, Inc. - common stock" },
-    { symbol: "MIST", name: "Milestone Pharmaceuticals Inc. - Common Shares" },
-    { symbol: "MITK", name: "Mitek Systems, Inc. - Common Stock" },
-    { symbol: "MJID", name: "Majestic Ideal Holdings Ltd - Ordinary Shares" },
-    { symbol: "MKAM", name: "MKAM ETF" },
-    { symbol: "MKDW", name: "MKDWELL Tech Inc. - Ordinary Shares" },
-    { symbol: "MKDWW", name: "MKDWELL Tech Inc. - Warrants" },
-    { symbol: "MKLYU", name: "McKinley Acquisition Corporation - Units" },
-    { symbol: "MKSI", name: "MKS Inc. - Common Stock" },
-    { symbol: "MKTW", name: "MarketWise, Inc. - Class A Common Stock" },
-    { symbol: "MKTX", name: "MarketAxess Holdings, Inc. - Common Stock" },
-    { symbol: "MKZR", name: "MacKenzie Realty Capital, Inc. - Common Stock" },
-    { symbol: "MLAB", name: "Mesa Laboratories, Inc. - Common Stock" },
-    { symbol: "MLAC", name: "Mountain Lake Acquisition Corp. - Class A Ordinary Shares" },
-    { symbol: "MLACR", name: "Mountain Lake Acquisition Corp. - Right" },
-    { symbol: "MLACU", name: "Mountain Lake Acquisition Corp. - Units" },
-    { symbol: "MLCO", name: "Melco Resorts & Entertainment Limited - American Depositary Shares " },
-    { symbol: "MLEC", name: "Moolec Science SA - Ordinary shares" },
-    { symbol: "MLECW", name: "Moolec Science SA - Warrant" },
-    { symbol: "MLGO", name: "MicroAlgo, Inc. - Ordinary Shares" },
-    { symbol: "MLKN", name: "MillerKnoll, Inc. - Common Stock" },
-    { symbol: "MLTX", name: "MoonLake Immunotherapeutics - Class A Ordinary Shares" },
-    { symbol: "MLYS", name: "Mineralys Therapeutics, Inc. - Common Stock" },
-    { symbol: "MMLP", name: "Martin Midstream Partners L.P. - Common Units Representing Limited Partnership Interests" },
-    { symbol: "MMSI", name: "Merit Medical Systems, Inc. - Common Stock" },
-    { symbol: "MMYT", name: "MakeMyTrip Limited - Ordinary Shares" },
-    { symbol: "MNDO", name: "MIND C.T.I. Ltd. - Ordinary Shares" },
-    { symbol: "MNDR", name: "Mobile-health Network Solutions - Class A Ordinary Shares" },
-    { symbol: "MNDY", name: "monday.com Ltd. - Ordinary Shares" },
-    { symbol: "MNKD", name: "MannKind Corporation - Common Stock" },
-    { symbol: "MNMD", name: "Mind Medicine (MindMed) Inc. - Common Shares" },
-    { symbol: "MNOV", name: "MediciNova, Inc. - Common Stock" },
-    { symbol: "MNPR", name: "Monopar Therapeutics Inc. - Common Stock" },
-    { symbol: "MNRO", name: "Monro, Inc.  - Common Stock" },
-    { symbol: "MNSB", name: "MainStreet Bancshares, Inc. - Common Stock" },
-    { symbol: "MNSBP", name: "MainStreet Bancshares, Inc. - Depositary Shares" },
-    { symbol: "MNST", name: "Monster Beverage Corporation - Common Stock" },
-    { symbol: "MNTK", name: "Montauk Renewables, Inc. - Common Stock" },
-    { symbol: "MNTS", name: "Momentus Inc. - Class A Common Stock" },
-    { symbol: "MNTSW", name: "Momentus Inc. - Warrant" },
-    { symbol: "MNY", name: "MoneyHero Limited - Class A Ordinary Shares" },
-    { symbol: "MNYWW", name: "MoneyHero Limited - Warrants" },
-    { symbol: "MOB", name: "Mobilicom Limited - American Depositary Shares" },
-    { symbol: "MOBBW", name: "Mobilicom Limited - Warrants" },
-    { symbol: "MOBX", name: "Mobix Labs, Inc. - Class A Common Stock" },
-    { symbol: "MOBXW", name: "Mobix Labs, Inc. - Warrants" },
-    { symbol: "MODD", name: "Modular Medical, Inc. - common stock" },
-    { symbol: "MODL", name: "VictoryShares WestEnd U.S. Sector ETF" },
-    { symbol: "MOFG", name: "MidWestOne Financial Group, Inc. - Common Stock" },
-    { symbol: "MOGO", name: "Mogo Inc. - Common Shares" },
-    { symbol: "MOLN", name: "Molecular Partners AG - American Depositary Shares" },
-    { symbol: "MOMO", name: "Hello Group Inc.  - American Depositary Shares" },
-    { symbol: "MOOD", name: "Relative Sentiment Tactical Allocation ETF" },
-    { symbol: "MORN", name: "Morningstar, Inc. - Common Stock" },
-    { symbol: "MOVE", name: "Movano Inc. - Common Stock" },
-    { symbol: "MPAA", name: "Motorcar Parts of America, Inc. - Common Stock" },
-    { symbol: "MPB", name: "Mid Penn Bancorp - Common Stock" },
-    { symbol: "MPWR", name: "Monolithic Power Systems, Inc. - Common Stock" },
-    { symbol: "MQ", name: "Marqeta, Inc. - Class A Common Stock" },
-    { symbol: "MQQQ", name: "Tradr 2X Long Innovation 100 Monthly ETF" },
-    { symbol: "MRAL", name: "GraniteShares 2x Long MARA Daily ETF" },
-    { symbol: "MRAM", name: "Everspin Technologies, Inc. - Common Stock" },
-    { symbol: "MRBK", name: "Meridian Corporation - Common Stock" },
-    { symbol: "MRCC", name: "Monroe Capital Corporation - Closed End Fund" },
-    { symbol: "MRCY", name: "Mercury Systems Inc - Common Stock" },
-    { symbol: "MREO", name: "Mereo BioPharma Group plc - American Depositary Shares" },
-    { symbol: "MRKR", name: "Marker Therapeutics, Inc. - Common Stock" },
-    { symbol: "MRM", name: "MEDIROM Healthcare Technologies Inc. - American Depositary Share" },
-    { symbol: "MRNA", name: "Moderna, Inc. - Common Stock" },
-    { symbol: "MRNO", name: "Murano Global Investments PLC - Ordinary Shares" },
-    { symbol: "MRNOW", name: "Murano Global Investments PLC - Warrants" },
-    { symbol: "MRSN", name: "Mersana Therapeutics, Inc. - Common Stock" },
-    { symbol: "MRTN", name: "Marten Transport, Ltd. - Common Stock" },
-    { symbol: "MRUS", name: "Merus N.V. - Common Shares" },
-    { symbol: "MRVI", name: "Maravai LifeSciences Holdings, Inc. - Class A common stock" },
-    { symbol: "MRVL", name: "Marvell Technology, Inc. - Common Stock" },
-    { symbol: "MRX", name: "Marex Group plc - Ordinary Shares" },
-    { symbol: "MSAI", name: "MultiSensor AI Holdings, Inc. - Common Stock" },
-    { symbol: "MSAIW", name: "MultiSensor AI Holdings, Inc. - Warrants" },
-    { symbol: "MSBI", name: "Midland States Bancorp, Inc. - Common Stock" },
-    { symbol: "MSBIP", name: "Midland States Bancorp, Inc. - Depositary Shares Each Representing a 1/40th Interest in a Share of 7.750% Fixed-Rate Reset Non-Cumulative Perpetual Preferred Stock, Series A" },
-    { symbol: "MSDD", name: "GraniteShares 2x Short MSTR Daily ETF" },
-    { symbol: "MSEX", name: "Middlesex Water Company - Common Stock" },
-    { symbol: "MSFD", name: "Direxion Daily MSFT Bear 1X Shares" },
-    { symbol: "MSFL", name: "GraniteShares 2x Long MSFT Daily ETF" },
-    { symbol: "MSFT", name: "Microsoft Corporation - Common Stock" },
-    { symbol: "MSFU", name: "Direxion Daily MSFT Bull 2X Shares" },
-    { symbol: "MSGM", name: "Motorsport Games Inc. - Class A Common Stock" },
-    { symbol: "MSGY", name: "Masonglory Limited - Ordinary Shares" },
-    { symbol: "MSPR", name: "MSP Recovery, Inc. - Class A Common Stock" },
-    { symbol: "MSPRW", name: "MSP Recovery, Inc. - Warrant" },
-    { symbol: "MSPRZ", name: "MSP Recovery, Inc. - Warrant" },
-    { symbol: "MSS", name: "Maison Solutions Inc. - Class A Common Stock" },
-    { symbol: "MST", name: "Defiance Leveraged Long Income MSTR ETF" },
-    { symbol: "MSTP", name: "GraniteShares 2x Long MSTR Daily ETF" },
-    { symbol: "MSTR", name: "Strategy Inc - Class A Common Stock" },
-    { symbol: "MSTX", name: "Defiance Daily Target 2x Long MSTR ETF" },
-    { symbol: "MSW", name: "Ming Shing Group Holdings Limited - Ordinary Shares" },
-    { symbol: "MTC", name: "MMTec, Inc. - Common Shares" },
-    { symbol: "MTCH", name: "Match Group, Inc. - Common Stock" },
-    { symbol: "MTEK", name: "Maris-Tech Ltd. - ordinary shares" },
-    { symbol: "MTEKW", name: "Maris-Tech Ltd. - Warrants" },
-    { symbol: "MTEN", name: "Mingteng International Corporation Inc. - Ordinary Shares" },
-    { symbol: "MTEX", name: "Mannatech, Incorporated - Common Stock" },
-    { symbol: "MTLS", name: "Materialise NV - American Depositary Shares" },
-    { symbol: "MTRX", name: "Matrix Service Company - Common Stock" },
-    { symbol: "MTSI", name: "MACOM Technology Solutions Holdings, Inc. - Common Stock" },
-    { symbol: "MTSR", name: "Metsera, Inc. - Common Stock" },
-    { symbol: "MTVA", name: "MetaVia Inc.  - Common Stock" },
-    { symbol: "MU", name: "Micron Technology, Inc. - Common Stock" },
-    { symbol: "MUD", name: "Direxion Daily MU Bear 1X Shares" },
-    { symbol: "MULL", name: "GraniteShares 2x Long MU Daily ETF" },
-    { symbol: "MULT", name: "Franklin Multisector Income ETF" },
-    { symbol: "MURA", name: "Mural Oncology plc - Ordinary Shares" },
-    { symbol: "MUU", name: "Direxion Daily MU Bull 2X Shares" },
-    { symbol: "MVBF", name: "MVB Financial Corp. - Common Stock" },
-    { symbol: "MVIS", name: "MicroVision, Inc. - Common Stock" },
-    { symbol: "MVLL", name: "GraniteShares 2x Long MRVL Daily ETF" },
-    { symbol: "MVST", name: "Microvast Holdings, Inc. - Common Stock" },
-    { symbol: "MVSTW", name: "Microvast Holdings, Inc. - Warrant" },
-    { symbol: "MWYN", name: "Marwynn Holdings, Inc. - Common stock" },
-    { symbol: "MXCT", name: "MaxCyte, Inc. - Common Stock" },
-    { symbol: "MXL", name: "MaxLinear, Inc - Common Stock" },
-    { symbol: "MYCF", name: "SPDR SSGA My2026 Corporate Bond ETF" },
-    { symbol: "MYCG", name: "SPDR SSGA My2027 Corporate Bond ETF" },
-    { symbol: "MYCH", name: "SPDR SSGA My2028 Corporate Bond ETF" },
-    { symbol: "MYCI", name: "SPDR SSGA My2029 Corporate Bond ETF" },
-    { symbol: "MYCJ", name: "SPDR SSGA My2030 Corporate Bond ETF" },
-    { symbol: "MYCK", name: "SPDR SSGA My2031 Corporate Bond ETF" },
-    { symbol: "MYCL", name: "SPDR SSGA My2032 Corporate Bond ETF" },
-    { symbol: "MYCM", name: "SPDR SSGA My2033 Corporate Bond ETF" },
-    { symbol: "MYCN", name: "SPDR SSGA My2034 Corporate Bond ETF" },
-    { symbol: "MYFW", name: "First Western Financial, Inc. - Common Stock" },
-    { symbol: "MYGN", name: "Myriad Genetics, Inc. - Common Stock" },
-    { symbol: "MYMF", name: "SPDR SSGA My2026 Municipal Bond ETF" },
-    { symbol: "MYMG", name: "SPDR SSGA My2027 Municipal Bond ETF" },
-    { symbol: "MYMH", name: "SPDR SSGA My2028 Municipal Bond ETF" },
-    { symbol: "MYMI", name: "SPDR SSGA My2029 Municipal Bond ETF" },
-    { symbol: "MYMJ", name: "SPDR SSGA My2030 Municipal Bond ETF" },
-    { symbol: "MYNZ", name: "Mainz Biomed N.V. - Ordinary Shares" },
-    { symbol: "MYPS", name: "PLAYSTUDIOS, Inc.  - Class A Common Stock" },
-    { symbol: "MYPSW", name: "PLAYSTUDIOS, Inc.  - Warrant" },
-    { symbol: "MYRG", name: "MYR Group, Inc. - Common Stock" },
-    { symbol: "MYSE", name: "Myseum, Inc. - Common Stock" },
-    { symbol: "MYSEW", name: "Myseum, Inc. - Series A Warrant" },
-    { symbol: "MYSZ", name: "My Size, Inc. - Common Stock" },
-    { symbol: "MZTI", name: "The Marzetti Company - Common Stock" },
-    { symbol: "NAAS", name: "NaaS Technology Inc. - American Depositary Shares" },
-    { symbol: "NAGE", name: "Niagen Bioscience, Inc. - Common Stock" },
-    { symbol: "NAII", name: "Natural Alternatives International, Inc. - Common Stock" },
-    { symbol: "NAKA", name: "Kindly MD, Inc. - Common Stock" },
-    { symbol: "NAMI", name: "Jinxin Technology Holding Company - American Depositary Shares" },
-    { symbol: "NAMM", name: "Namib Minerals - Ordinary Shares" },
-    { symbol: "NAMMW", name: "Namib Minerals - Warrants" },
-    { symbol: "NAMS", name: "NewAmsterdam Pharma Company N.V. - Ordinary Shares" },
-    { symbol: "NAMSW", name: "NewAmsterdam Pharma Company N.V. - Warrant" },
-    { symbol: "NAOV", name: "NanoVibronix, Inc. - Common Stock" },
-    { symbol: "NATH", name: "Nathan's Famous, Inc. - Common Stock" },
-    { symbol: "NATO", name: "Themes Transatlantic Defense ETF" },
-    { symbol: "NATR", name: "Nature's Sunshine Products, Inc. - Common Stock" },
-    { symbol: "NAUT", name: "Nautilus Biotechnology, Inc. - Common Stock" },
-    { symbol: "NAVI", name: "Navient Corporation - Common Stock" },
-    { symbol: "NB", name: "NioCorp Developments Ltd. - Common Stock" },
-    { symbol: "NBBK", name: "NB Bancorp, Inc. - Common Stock" },
-    { symbol: "NBIS", name: "Nebius Group N.V. - Class A Ordinary Shares" },
-    { symbol: "NBIX", name: "Neurocrine Biosciences, Inc. - Common Stock" },
-    { symbol: "NBN", name: "Northeast Bank - Common Stock" },
-    { symbol: "NBTB", name: "NBT Bancorp Inc. - Common Stock" },
-    { symbol: "NBTX", name: "Nanobiotix S.A. - ADSs" },
-    { symbol: "NCEW", name: "New Century Logistics (BVI) Limited - Ordinary Shares" },
-    { symbol: "NCI", name: "Neo-Concept International Group Holdings Limited - Class A Ordinary Shares" },
-    { symbol: "NCIQ", name: "Hashdex Nasdaq Crypto Index US ETF - Hashdex Nasdaq Crypto Index US ETF" },
-    { symbol: "NCMI", name: "National CineMedia, Inc. - Common Stock" },
-    { symbol: "NCNA", name: "NuCana plc - American Depositary Shares" },
-    { symbol: "NCNO", name: "nCino, Inc. - Common Stock" },
-    { symbol: "NCPB", name: "Nuveen Core Plus Bond ETF" },
-    { symbol: "NCPL", name: "Netcapital Inc. - Common Stock" },
-    { symbol: "NCPLW", name: "Netcapital Inc. - warrants" },
-    { symbol: "NCRA", name: "Nocera, Inc. - common stock" },
-    { symbol: "NCSM", name: "NCS Multistage Holdings, Inc. - Common Stock" },
-    { symbol: "NCT", name: "Intercont (Cayman) Limited - Ordinary shares" },
-    { symbol: "NCTY", name: "The9 Limited - American Depository Shares" },
-    { symbol: "NDAA", name: "Ned Davis Research 360 Dynamic Allocation ETF" },
-    { symbol: "NDAQ", name: "Nasdaq, Inc. - Common Stock" },
-    { symbol: "NDLS", name: "Noodles & Company - Common Stock" },
-    { symbol: "NDRA", name: "ENDRA Life Sciences Inc. - Common Stock" },
-    { symbol: "NDSN", name: "Nordson Corporation - Common Stock" },
-    { symbol: "NECB", name: "NorthEast Community Bancorp, Inc. - Common Stock" },
-    { symbol: "NEGG", name: "Newegg Commerce, Inc. - Common Shares" },
-    { symbol: "NEO", name: "NeoGenomics, Inc. - Common Stock" },
-    { symbol: "NEOG", name: "Neogen Corporation - Common Stock" },
-    { symbol: "NEON", name: "Neonode Inc. - Common Stock" },
-    { symbol: "NEOV", name: "NeoVolta Inc. - Common Stock" },
-    { symbol: "NEOVW", name: "NeoVolta Inc. - Warrant" },
-    { symbol: "NEPH", name: "Nephros, Inc. - Common Stock" },
-    { symbol: "NERD", name: "Roundhill Video Games ETF" },
-    { symbol: "NERV", name: "Minerva Neurosciences, Inc - Common Stock" },
-    { symbol: "NESR", name: "National Energy Services Reunited Corp - Ordinary Shares" },
-    { symbol: "NETD", name: "Nabors Energy Transition Corp. II - Class A Ordinary Shares" },
-    { symbol: "NETDU", name: "Nabors Energy Transition Corp. II - Unit" },
-    { symbol: "NETDW", name: "Nabors Energy Transition Corp. II - Warrant" },
-    { symbol: "NEUP", name: "Neuphoria Therapeutics Inc. - Common Stock" },
-    { symbol: "NEWT", name: "NewtekOne, Inc. - Common Stock" },
-    { symbol: "NEWTG", name: "NewtekOne, Inc. - 8.50% Fixed Rate Senior Notes due 2029" },
-    { symbol: "NEWTH", name: "NewtekOne, Inc. - 8.625% Fixed Rate Senior Notes due 2029" },
-    { symbol: "NEWTI", name: "NewtekOne, Inc. - 8.00% Fixed Rate Senior Notes due 2028" },
-    { symbol: "NEWTP", name: "NewtekOne, Inc. - Depositary Shares, Each Representing a 1/40th Interest in a Share of 8.500% Fixed Rate Reset Non-Cumulative Perpetual Preferred Stock, Series B" },
-    { symbol: "NEWTZ", name: "NewtekOne, Inc. - 5.50% Notes Due 2026" },
-    { symbol: "NEWZ", name: "StockSnips AI-Powered Sentiment US All Cap ETF" },
-    { symbol: "NEXM", name: "NexMetals Mining Corp. - Common Stock" },
-    { symbol: "NEXN", name: "Nexxen International Ltd. - Ordinary Shares" },
-    { symbol: "NEXT", name: "NextDecade Corporation - Common Stock" },
-    { symbol: "NFBK", name: "Northfield Bancorp, Inc. - Common Stock" },
-    { symbol: "NFE", name: "New Fortress Energy Inc. - Class A Common Stock" },
-    { symbol: "NFLX", name: "Netflix, Inc. - Common Stock" },
-    { symbol: "NFTY", name: "First Trust India Nifty 50 Equal Weight ETF" },
-    { symbol: "NFXL", name: "Direxion Daily NFLX Bull 2X Shares" },
-    { symbol: "NFXS", name: "Direxion Daily NFLX Bear 1X Shares" },
-    { symbol: "NGNE", name: "Neurogene Inc. - Common Stock" },
-    { symbol: "NHIC", name: "NewHold Investment Corp III - Class A Ordinary shares" },
-    { symbol: "NHICU", name: "NewHold Investment Corp III - Units" },
-    { symbol: "NHICW", name: "NewHold Investment Corp III - Warrants" },
-    { symbol: "NHPAP", name: "National Healthcare Properties, Inc. - 7.375% Series A Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "NHPBP", name: "National Healthcare Properties, Inc. - 7.125% Series B Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "NHTC", name: "Natural Health Trends Corp. - Commn Stock" },
-    { symbol: "NICE", name: "NICE Ltd - American Depositary Shares each representing one Ordinary Share" },
-    { symbol: "NIKL", name: "Sprott Nickel Miners ETF" },
-    { symbol: "NIOBW", name: "NioCorp Developments Ltd. - Warrant" },
-    { symbol: "NIPG", name: "NIP Group Inc. - American Depositary Shares" },
-    { symbol: "NISN", name: "NiSun Intl Enterprise Development Group Co, Ltd - Class A Common Shares" },
-    { symbol: "NITO", name: "N2OFF, Inc. - Common Stock" },
-    { symbol: "NIU", name: "Niu Technologies - American Depositary Shares" },
-    { symbol: "NIVF", name: "NewGenIvf Group Limited - Class A Ordinary Shares" },
-    { symbol: "NIVFW", name: "NewGenIvf Group Limited - Warrants" },
-    { symbol: "NIXT", name: "Research Affiliates Deletions ETF" },
-    { symbol: "NIXX", name: "Nixxy, Inc. - Common Stock" },
-    { symbol: "NIXXW", name: "Nixxy, Inc. - Warrant" },
-    { symbol: "NKSH", name: "National Bankshares, Inc. - Common Stock" },
-    { symbol: "NKTR", name: "Nektar Therapeutics - Common Stock" },
-    { symbol: "NKTX", name: "Nkarta, Inc. - Common Stock" },
-    { symbol: "NLSP", name: "NLS Pharmaceutics Ltd. - Common Shares" },
-    { symbol: "NLSPW", name: "NLS Pharmaceutics Ltd. - Warrant" },
-    { symbol: "NMFC", name: "New Mountain Finance Corporation - Common Stock" },
-    { symbol: "NMFCZ", name: "New Mountain Finance Corporation - 8.250% Notes due 2028" },
-    { symbol: "NMIH", name: "NMI Holdings Inc - Common Stock" },
-    { symbol: "NMP", name: "NMP Acquisition Corp. - Class A Ordinary Shares" },
-    { symbol: "NMPAR", name: "NMP Acquisition Corp. - Right" },
-    { symbol: "NMPAU", name: "NMP Acquisition Corp. - Units" },
-    { symbol: "NMRA", name: "Neumora Therapeutics, Inc. - Common Stock" },
-    { symbol: "NMRK", name: "Newmark Group, Inc. - Class A Common Stock" },
-    { symbol: "NMTC", name: "NeuroOne Medical Technologies Corporation - Common Stock" },
-    { symbol: "NN", name: "NextNav Inc. - Common stock" },
-    { symbol: "NNAVW", name: "NextNav Inc. - Warrant" },
-    { symbol: "NNBR", name: "NN, Inc. - Common Stock" },
-    { symbol: "NNDM", name: "Nano Dimension Ltd. - American Depositary Shares" },
-    { symbol: "NNE", name: "Nano Nuclear Energy Inc. - common stock" },
-    { symbol: "NNNN", name: "Anbio Biotechnology - Class A Ordinary Shares" },
-    { symbol: "NNOX", name: "NANO-X IMAGING LTD - Ordinary Shares" },
-    { symbol: "NODK", name: "NI Holdings, Inc. - Common Stock" },
-    { symbol: "NOEM", name: "CO2 Energy Transition Corp. - Common Stock" },
-    { symbol: "NOEMR", name: "CO2 Energy Transition Corp. - Right" },
-    { symbol: "NOEMU", name: "CO2 Energy Transition Corp. - Unit" },
-    { symbol: "NOEMW", name: "CO2 Energy Transition Corp. - Warrant" },
-    { symbol: "NOTV", name: "Inotiv, Inc. - Common Stock" },
-    { symbol: "NOVT", name: "Novanta Inc. - Common Shares" },
-    { symbol: "NOWL", name: "GraniteShares 2x Long NOW Daily ETF" },
-    { symbol: "NPAC", name: "New Providence Acquisition Corp. III - Ordinary Shares" },
-    { symbol: "NPACU", name: "New Providence Acquisition Corp. III - Units" },
-    { symbol: "NPACW", name: "New Providence Acquisition Corp. III - Warrants" },
-    { symbol: "NPCE", name: "Neuropace, Inc. - Common Stock" },
-    { symbol: "NPFI", name: "Nuveen Preferred and Income ETF" },
-    { symbol: "NRC", name: "National Research Corporation - Common Stock" },
-    { symbol: "NRDS", name: "NerdWallet, Inc. - Class A Common Stock" },
-    { symbol: "NRES", name: "Xtrackers RREEF Global Natural Resources ETF" },
-    { symbol: "NRIM", name: "Northrim BanCorp Inc - Common Stock" },
-    { symbol: "NRIX", name: "Nurix Therapeutics, Inc. - Common stock" },
-    { symbol: "NRSN", name: "NeuroSense Therapeutics Ltd. - Ordinary Shares" },
-    { symbol: "NRSNW", name: "NeuroSense Therapeutics Ltd. - Warrant" },
-    { symbol: "NRXP", name: "NRX Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "NRXPW", name: "NRX Pharmaceuticals, Inc. - Warrant" },
-    { symbol: "NSCR", name: "Nuveen Sustainable Core ETF" },
-    { symbol: "NSI", name: "National Security Emerging Markets Index ETF" },
-    { symbol: "NSIT", name: "Insight Enterprises, Inc. - Common Stock" },
-    { symbol: "NSPR", name: "InspireMD Inc. - Common Stock" },
-    { symbol: "NSSC", name: "NAPCO Security Technologies, Inc. - Common Stock" },
-    { symbol: "NSTS", name: "NSTS Bancorp, Inc. - Common Stock" },
-    { symbol: "NSYS", name: "Nortech Systems Incorporated - Common Stock" },
-    { symbol: "NTAP", name: "NetApp, Inc. - Common Stock" },
-    { symbol: "NTCL", name: "NETCLASS TECHNOLOGY INC - Class A Ordinary Shares" },
-    { symbol: "NTCT", name: "NetScout Systems, Inc. - Common Stock" },
-    { symbol: "NTES", name: "NetEase, Inc. - American Depositary Shares, each representing 5 ordinary shares" },
-    { symbol: "NTGR", name: "NETGEAR, Inc. - Common Stock" },
-    { symbol: "NTHI", name: "NeOnc Technologies Holdings, Inc. - Common Stock" },
-    { symbol: "NTIC", name: "Northern Technologies International Corporation - Common Stock" },
-    { symbol: "NTLA", name: "Intellia Therapeutics, Inc. - Common Stock" },
-    { symbol: "NTNX", name: "Nutanix, Inc. - Class A Common Stock" },
-    { symbol: "NTRA", name: "Natera, Inc. - Common Stock" },
-    { symbol: "NTRB", name: "Nutriband Inc. - Common Stock" },
-    { symbol: "NTRBW", name: "Nutriband Inc. - Warrant" },
-    { symbol: "NTRP", name: "NextTrip, Inc. - Common Stock" },
-    { symbol: "NTRS", name: "Northern Trust Corporation - Common Stock" },
-    { symbol: "NTRSO", name: "Northern Trust Corporation - Depositary Shares Each Representing a 1/1,000th Interest in a Share of Series E Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "NTWK", name: "NETSOL Technologies Inc. - Common Stock" },
-    { symbol: "NTWO", name: "Newbury Street II Acquisition Corp - Class A Ordinary Shares" },
-    { symbol: "NTWOU", name: "Newbury Street II Acquisition Corp - Unit" },
-    { symbol: "NTWOW", name: "Newbury Street II Acquisition Corp - Warrant" },
-    { symbol: "NUAI", name: "New Era Energy & Digital, Inc. - Common Stock" },
-    { symbol: "NUAIW", name: "New Era Energy & Digital, Inc. - Warrants" },
-    { symbol: "NUKK", name: "Nukkleus Inc. - Ordinary Shares" },
-    { symbol: "NUKKW", name: "Nukkleus Inc. - Warrants" },
-    { symbol: "NUSB", name: "Nuveen Ultra Short Income ETF" },
-    { symbol: "NUTR", name: "Nusatrip Incorporated - Common Stock" },
-    { symbol: "NUTX", name: "Nutex Health Inc. - Common Stock" },
-    { symbol: "NUVL", name: "Nuvalent, Inc. - Class A Common Stock" },
-    { symbol: "NUWE", name: "Nuwellis, Inc. - Common Stock" },
-    { symbol: "NVA", name: "Nova Minerals Limited - American Depositary Shares" },
-    { symbol: "NVAWW", name: "Nova Minerals Limited - Warrant" },
-    { symbol: "NVAX", name: "Novavax, Inc. - Common Stock" },
-    { symbol: "NVCR", name: "NovoCure Limited - Ordinary Shares" },
-    { symbol: "NVCT", name: "Nuvectis Pharma, Inc. - Common Stock" },
-    { symbol: "NVD", name: "GraniteShares 2x Short NVDA Daily ETF" },
-    { symbol: "NVDA", name: "NVIDIA Corporation - Common Stock" },
-    { symbol: "NVDD", name: "Direxion Daily NVDA Bear 1X Shares" },
-    { symbol: "NVDG", name: "Leverage Shares 2X Long NVDA Daily ETF" },
-    { symbol: "NVDL", name: "GraniteShares 2x Long NVDA Daily ETF" },
-    { symbol: "NVDS", name: "Tradr 1.5X Short NVDA Daily ETF" },
-    { symbol: "NVDU", name: "Direxion Daily NVDA Bull 2X Shares" },
-    { symbol: "NVEC", name: "NVE Corporation - Common Stock" },
-    { symbol: "NVFY", name: "Nova Lifestyle, Inc - Common Stock" },
-    { symbol: "NVMI", name: "Nova Ltd. - Ordinary Shares" },
-    { symbol: "NVNI", name: "Nvni Group Limited - Ordinary Shares" },
-    { symbol: "NVNIW", name: "Nvni Group Limited - Warrants" },
-    { symbol: "NVNO", name: "enVVeno Medical Corporation - Common Stock" },
-    { symbol: "NVTS", name: "Navitas Semiconductor Corporation - Common Stock" },
-    { symbol: "NVVE", name: "Nuvve Holding Corp. - Common Stock" },
-    { symbol: "NVVEW", name: "Nuvve Holding Corp. - Warrant" },
-    { symbol: "NVX", name: "NOVONIX Limited - American Depository Shares" },
-    { symbol: "NVYY", name: "GraniteShares YieldBOOST NVDA ETF" },
-    { symbol: "NWBI", name: "Northwest Bancshares, Inc. - Common Stock" },
-    { symbol: "NWE", name: "NorthWestern Energy Group, Inc.  - Common Stock" },
-    { symbol: "NWFL", name: "Norwood Financial Corp. - Common Stock" },
-    { symbol: "NWGL", name: "Nature Wood Group Limited - American Depositary Shares" },
-    { symbol: "NWL", name: "Newell Brands Inc. - Common Stock" },
-    { symbol: "NWPX", name: "NWPX Infrastructure, Inc. - Common Stock" },
-    { symbol: "NWS", name: "News Corporation - Class B Common Stock" },
-    { symbol: "NWSA", name: "News Corporation - Class A Common Stock" },
-    { symbol: "NWTG", name: "Newton Golf Company, Inc. - Common Stock" },
-    { symbol: "NXGL", name: "NexGel, Inc - Common Stock" },
-    { symbol: "NXGLW", name: "NexGel, Inc - Warrant" },
-    { symbol: "NXL", name: "Nexalin Technology, Inc. - Common Stock" },
-    { symbol: "NXLIW", name: "Nexalin Technology, Inc. - Warrant" },
-    { symbol: "NXPI", name: "NXP Semiconductors N.V. - Common Stock" },
-    { symbol: "NXPL", name: "NextPlat Corp - Common Stock" },
-    { symbol: "NXPLW", name: "NextPlat Corp - Warrants" },
-    { symbol: "NXST", name: "Nexstar Media Group, Inc. - Common Stock" },
-    { symbol: "NXT", name: "Nextracker Inc. - Class A Common Stock" },
-    { symbol: "NXTC", name: "NextCure, Inc. - Common Stock" },
-    { symbol: "NXTG", name: "First Trust Indxx NextG ETF" },
-    { symbol: "NXTT", name: "Next Technology Holding Inc. - Ordinary Shares" },
-    { symbol: "NXXT", name: "NextNRG, Inc. - Common Stock" },
-    { symbol: "NYAX", name: "Nayax Ltd. - Ordinary Shares" },
-    { symbol: "NYXH", name: "Nyxoah SA - Ordinary Shares" },
-    { symbol: "NZAC", name: "SPDR MSCI ACWI Climate Paris Aligned ETF" },
-    { symbol: "NZUS", name: "SPDR MSCI USA Climate Paris Aligned ETF" },
-    { symbol: "OABI", name: "OmniAb, Inc. - Common Stock" },
-    { symbol: "OABIW", name: "OmniAb, Inc. - Warrant" },
-    { symbol: "OACC", name: "Oaktree Acquisition Corp. III Life Sciences - Class A Ordinary Share" },
-    { symbol: "OACCU", name: "Oaktree Acquisition Corp. III Life Sciences - Unit" },
-    { symbol: "OACCW", name: "Oaktree Acquisition Corp. III Life Sciences - Warrant" },
-    { symbol: "OAKU", name: "Oak Woods Acquisition Corporation - Class A Ordinary Shares" },
-    { symbol: "OAKUR", name: "Oak Woods Acquisition Corporation - Right" },
-    { symbol: "OAKUU", name: "Oak Woods Acquisition Corporation - Unit" },
-    { symbol: "OAKUW", name: "Oak Woods Acquisition Corporation - Warrant" },
-    { symbol: "OBA", name: "Oxley Bridge Acquisition Limited - Class A Ordinary Shares" },
-    { symbol: "OBAWU", name: "Oxley Bridge Acquisition Limited - Unit" },
-    { symbol: "OBAWW", name: "Oxley Bridge Acquisition Limited - Warrants" },
-    { symbol: "OBIL", name: "US Treasury 12 Month Bill ETF" },
-    { symbol: "OBIO", name: "Orchestra BioMed Holdings, Inc. - Ordinary Shares" },
-    { symbol: "OBLG", name: "Oblong Inc. - Common Stock" },
-    { symbol: "OBT", name: "Orange County Bancorp, Inc. - Common Stock" },
-    { symbol: "OCC", name: "Optical Cable Corporation - Common Stock" },
-    { symbol: "OCCI", name: "OFS Credit Company, Inc. - Closed End Fund" },
-    { symbol: "OCCIM", name: "OFS Credit Company, Inc. - 7.875% Series F Term Preferred Stock" },
-    { symbol: "OCCIN", name: "OFS Credit Company, Inc. - 5.25% Series E Term Preferred Stock Due 2026" },
-    { symbol: "OCCIO", name: "OFS Credit Company, Inc. - 6.125% Series C Term Preferred Stock" },
-    { symbol: "OCFC", name: "OceanFirst Financial Corp. - Common Stock" },
-    { symbol: "OCG", name: "Oriental Culture Holding LTD - Ordinary Shares" },
-    { symbol: "OCGN", name: "Ocugen, Inc. - Common Stock" },
-    { symbol: "OCS", name: "Oculis Holding AG - Ordinary shares" },
-    { symbol: "OCSAW", name: "Oculis Holding AG - Warrants" },
-    { symbol: "OCSL", name: "Oaktree Specialty Lending Corporation - Closed End Fund" },
-    { symbol: "OCTO", name: "Eightco Holdings Inc. - Common Stock" },
-    { symbol: "OCUL", name: "Ocular Therapeutix, Inc. - Common Stock" },
-    { symbol: "ODD", name: "ODDITY Tech Ltd. - Class A Ordinary Shares" },
-    { symbol: "ODDS", name: "Pacer BlueStar Digital Entertainment ETF" },
-    { symbol: "ODFL", name: "Old Dominion Freight Line, Inc. - Common Stock" },
-    { symbol: "ODP", name: "The ODP Corporation - Common Stock" },
-    { symbol: "ODVWZ", name: "Osisko Development Corp. - Warrant" },
-    { symbol: "ODYS", name: "Odysight.ai Inc. - Common Stock" },
-    { symbol: "OESX", name: "Orion Energy Systems, Inc. - Common Stock" },
-    { symbol: "OFAL", name: "OFA Group - Ordinary shares" },
-    { symbol: "OFIX", name: "Orthofix Medical Inc.  - Common Stock" },
-    { symbol: "OFLX", name: "Omega Flex, Inc. - Common Stock" },
-    { symbol: "OFS", name: "OFS Capital Corporation - Closed End Fund" },
-    { symbol: "OFSSH", name: "OFS Capital Corporation - 4.95% Notes due 2028" },
-    { symbol: "OFSSO", name: "OFS Capital Corporation - 7.50% Notes due 2028" },
-    { symbol: "OGI", name: "Organigram Global Inc. - Common Shares" },
-    { symbol: "OKLL", name: "Defiance Daily Target 2x Long OKLO ETF" },
-    { symbol: "OKTA", name: "Okta, Inc. - Class A Common Stock" },
-    { symbol: "OKUR", name: "OnKure Therapeutics, Inc. - Class A Common Stock" },
-    { symbol: "OKYO", name: "OKYO Pharma Limited - Ordinary Shares" },
-    { symbol: "OLB", name: "The OLB Group, Inc. - Common Stock" },
-    { symbol: "OLED", name: "Universal Display Corporation - Common Stock" },
-    { symbol: "OLLI", name: "Ollie's Bargain Outlet Holdings, Inc. - Common Stock" },
-    { symbol: "OLMA", name: "Olema Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "OLPX", name: "Olaplex Holdings, Inc. - Common Stock" },
-    { symbol: "OM", name: "Outset Medical, Inc. - Common Stock" },
-    { symbol: "OMAB", name: "Grupo Aeroportuario del Centro Norte S.A.B. de C.V. - American Depositary Shares each representing 8 Series B shares" },
-    { symbol: "OMCC", name: "Old Market Capital Corporation - Common Stock" },
-    { symbol: "OMCL", name: "Omnicell, Inc. - Common Stock" },
-    { symbol: "OMDA", name: "Omada Health, Inc. - Common Stock" },
-    { symbol: "OMER", name: "Omeros Corporation - Common Stock" },
-    { symbol: "OMEX", name: "Odyssey Marine Exploration, Inc. - Common Stock" },
-    { symbol: "OMH", name: "Ohmyhome Limited - Class A Ordinary Shares" },
-    { symbol: "OMSE", name: "OMS Energy Technologies Inc. - Ordinary Shares" },
-    { symbol: "ON", name: "ON Semiconductor Corporation - Common Stock" },
-    { symbol: "ONB", name: "Old National Bancorp - Common Stock" },
-    { symbol: "ONBPO", name: "Old National Bancorp - Depositary Shares, Each Representing a 1/40th Interest in a Share of Series C Preferred Stock" },
-    { symbol: "ONBPP", name: "Old National Bancorp - Depositary Shares, Each Representing a 1/40th Interest in a Share of Series A Preferred Stock" },
-    { symbol: "ONC", name: "BeOne Medicines Ltd. - American Depositary Shares" },
-    { symbol: "ONCHU", name: "1RT Acquisition Corp. - Units" },
-    { symbol: "ONCO", name: "Onconetix, Inc.  - Common Stock" },
-    { symbol: "ONCY", name: "Oncolytics Biotech Inc. - Common Shares" },
-    { symbol: "ONDS", name: "Ondas Holdings Inc. - Common Stock" },
-    { symbol: "ONEG", name: "OneConstruction Group Limited - Ordinary Shares" },
-    { symbol: "ONEQ", name: "Fidelity Nasdaq Composite Index ETF" },
-    { symbol: "ONEW", name: "OneWater Marine Inc. - Class A Common Stock" },
-    { symbol: "ONFO", name: "Onfolio Holdings Inc. - Common Stock" },
-    { symbol: "ONFOW", name: "Onfolio Holdings Inc. - Warrant" },
-    { symbol: "ONMD", name: "OneMedNet Corp - Class A Common Stock" },
-    { symbol: "ONMDW", name: "OneMedNet Corp - Warrant" },
-    { symbol: "OOQB", name: "One One Nasdaq-100 and Bitcoin ETF" },
-    { symbol: "OOSB", name: "One One S&P 500 and Bitcoin ETF" },
-    { symbol: "OP", name: "OceanPal Inc. - Common Stock" },
-    { symbol: "OPAL", name: "OPAL Fuels Inc. - Class A Common Stock" },
-    { symbol: "OPBK", name: "OP Bancorp - Common Stock" },
-    { symbol: "OPCH", name: "Option Care Health, Inc. - Common Stock" },
-    { symbol: "OPEN", name: "Opendoor Technologies Inc  - Common Stock" },
-    { symbol: "OPI", name: "Office Properties Income Trust - Common Shares of Beneficial Interest" },
-    { symbol: "OPINL", name: "Office Properties Income Trust - 6.375% Senior Notes due 2050" },
-    { symbol: "OPK", name: "Opko Health, Inc. - Common Stock" },
-    { symbol: "OPPJ", name: "WisdomTree Japan Opportunities Fund" },
-    { symbol: "OPRA", name: "Opera Limited - American Depositary Shares" },
-    { symbol: "OPRT", name: "Oportun Financial Corporation - common stock" },
-    { symbol: "OPRX", name: "OptimizeRx Corporation - Common Stock" },
-    { symbol: "OPT", name: "Opthea Limited - American Depositary Shares" },
-    { symbol: "OPTX", name: "Syntec Optics Holdings, Inc. - Class A Common Stock" },
-    { symbol: "OPTXW", name: "Syntec Optics Holdings, Inc. - Warrant" },
-    { symbol: "OPTZ", name: "Optimize Strategy Index ETF" },
-    { symbol: "OPXS", name: "Optex Systems Holdings, Inc. - Common Stock" },
-    { symbol: "ORCX", name: "Defiance Daily Target 2X Long ORCL ETF" },
-    { symbol: "ORGN", name: "Origin Materials, Inc. - Class A Common Stock" },
-    { symbol: "ORGNW", name: "Origin Materials, Inc. - Warrant" },
-    { symbol: "ORGO", name: "Organogenesis Holdings Inc.  - Class A " },
-    { symbol: "ORIC", name: "Oric Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "ORIQ", name: "Origin Investment Corp I - Ordinary Shares" },
-    { symbol: "ORIQU", name: "Origin Investment Corp I - Units" },
-    { symbol: "ORIQW", name: "Origin Investment Corp I - one-half of one redeemable warrant." },
-    { symbol: "ORIS", name: "Oriental Rise Holdings Limited - Ordinary Shares" },
-    { symbol: "ORKA", name: "Oruka Therapeutics, Inc. - Common Stock" },
-    { symbol: "ORKT", name: "Orangekloud Technology Inc. - Class A Ordinary Shares" },
-    { symbol: "ORLY", name: "O'Reilly Automotive, Inc. - Common Stock" },
-    { symbol: "ORMP", name: "Oramed Pharmaceuticals Inc. - Common Stock" },
-    { symbol: "ORR", name: "Militia Long/Short Equity ETF" },
-    { symbol: "ORRF", name: "Orrstown Financial Services, Inc. - Common Stock" },
-    { symbol: "OS", name: "OneStream, Inc. - Class A Common Stock" },
-    { symbol: "OSBC", name: "Old Second Bancorp, Inc. - Common Stock" },
-    { symbol: "OSIS", name: "OSI Systems, Inc. - Common Stock" },
-    { symbol: "OSPN", name: "OneSpan Inc. - Common Stock" },
-    { symbol: "OSRH", name: "OSR Holdings, Inc. - Common Stock" },
-    { symbol: "OSRHW", name: "OSR Holdings, Inc. - Warrant" },
-    { symbol: "OSS", name: "One Stop Systems, Inc. - Common Stock" },
-    { symbol: "OST", name: "Ostin Technology Group Co., Ltd. - Class A Ordinary Shares" },
-    { symbol: "OSUR", name: "OraSure Technologies, Inc. - Common Stock" },
-    { symbol: "OSW", name: "OneSpaWorld Holdings Limited - Common Shares" },
-    { symbol: "OTEX", name: "Open Text Corporation - Common Shares" },
-    { symbol: "OTGL", name: "OTG Latin America ETF" },
-    { symbol: "OTLK", name: "Outlook Therapeutics, Inc. - Common Stock" },
-    { symbol: "OTLY", name: "Oatly Group AB - American Depositary Shares" },
-    { symbol: "OTTR", name: "Otter Tail Corporation - Common Stock" },
-    { symbol: "OUST", name: "Ouster, Inc. - Common Stock" },
-    { symbol: "OUSTW", name: "Ouster, Inc. - Warrants" },
-    { symbol: "OUSTZ", name: "Ouster, Inc. - Warrants" },
-    { symbol: "OVBC", name: "Ohio Valley Banc Corp. - Common Stock" },
-    { symbol: "OVID", name: "Ovid Therapeutics Inc. - Common Stock" },
-    { symbol: "OVLY", name: "Oak Valley Bancorp (CA) - Common Stock" },
-    { symbol: "OXBR", name: "Oxbridge Re Holdings Limited - Ordinary Shares" },
-    { symbol: "OXBRW", name: "Oxbridge Re Holdings Limited - Warrant" },
-    { symbol: "OXLC", name: "Oxford Lane Capital Corp. - Closed End Fund" },
-    { symbol: "OXLCG", name: "Oxford Lane Capital Corp. - 7.95% Notes due 2032" },
-    { symbol: "OXLCI", name: "Oxford Lane Capital Corp. - 8.75% Notes due 2030" },
-    { symbol: "OXLCL", name: "Oxford Lane Capital Corp. - 6.75% Notes due 2031" },
-    { symbol: "OXLCN", name: "Oxford Lane Capital Corp. - 7.125% Series 2029 Term Preferred Stock" },
-    { symbol: "OXLCO", name: "Oxford Lane Capital Corp. - Preferred Stock Shares, 6.00% Series 2029" },
-    { symbol: "OXLCP", name: "Oxford Lane Capital Corp. - 6.25% Series 2027 Term Preferred Shares" },
-    { symbol: "OXLCZ", name: "Oxford Lane Capital Corp. - 5.00% Notes due 2027" },
-    { symbol: "OXSQ", name: "Oxford Square Capital Corp. - Closed End Fund" },
-    { symbol: "OXSQG", name: "Oxford Square Capital Corp. - 5.50% Notes due 2028" },
-    { symbol: "OXSQH", name: "Oxford Square Capital Corp. - 7.75% Notes due 2030" },
-    { symbol: "OXSQZ", name: "Oxford Square Capital Corp. - 6.25% Notes due 2026" },
-    { symbol: "OYSE", name: "Oyster Enterprises II Acquisition Corp - Class A Ordinary Shares" },
-    { symbol: "OYSER", name: "Oyster Enterprises II Acquisition Corp - Rights" },
-    { symbol: "OYSEU", name: "Oyster Enterprises II Acquisition Corp - Units" },
-    { symbol: "OZEM", name: "Roundhill GLP-1 & Weight Loss ETF" },
-    { symbol: "OZK", name: "Bank OZK - Common Stock" },
-    { symbol: "OZKAP", name: "Bank OZK - 4.625% Series A Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "PAA", name: "Plains All American Pipeline, L.P. - Common Units representing Limited Partner Interests" },
-    { symbol: "PABD", name: "iShares Paris-Aligned Climate Optimized MSCI World ex USA ETF" },
-    { symbol: "PABU", name: "iShares Paris-Aligned Climate Optimized MSCI USA ETF" },
-    { symbol: "PACB", name: "Pacific Biosciences of California, Inc. - Common Stock" },
-    { symbol: "PACH", name: "Pioneer Acquisition I Corp - Class A Ordinary Shares" },
-    { symbol: "PACHU", name: "Pioneer Acquisition I Corp - Units" },
-    { symbol: "PACHW", name: "Pioneer Acquisition I Corp - Warrants" },
-    { symbol: "PAGP", name: "Plains GP Holdings, L.P. - Class A Shares representing limited partner interests" },
-    { symbol: "PAHC", name: "Phibro Animal Health Corporation - Class A Common Stock" },
-    { symbol: "PAL", name: "Proficient Auto Logistics, Inc. - Common Stock" },
-    { symbol: "PALD", name: "Direxion Daily PANW Bear 1X Shares" },
-    { symbol: "PALI", name: "Palisade Bio, Inc. - Common Stock" },
-    { symbol: "PALU", name: "Direxion Daily PANW Bull 2X Shares" },
-    { symbol: "PAMT", name: "PAMT CORP - Common Stock" },
-    { symbol: "PANG", name: "Leverage Shares 2X Long PANW Daily ETF" },
-    { symbol: "PANL", name: "Pangaea Logistics Solutions Ltd. - Common Stock" },
-    { symbol: "PANW", name: "Palo Alto Networks, Inc. - Common Stock" },
-    { symbol: "PASG", name: "Passage Bio, Inc. - Common Stock" },
-    { symbol: "PATK", name: "Patrick Industries, Inc. - Common Stock" },
-    { symbol: "PATN", name: "Pacer Nasdaq International Patent Leaders ETF" },
-    { symbol: "PAVM", name: "PAVmed Inc. - Common Stock" },
-    { symbol: "PAVS", name: "Paranovus Entertainment Technology Ltd. - Class A Ordinary Shares" },
-    { symbol: "PAX", name: "Patria Investments Limited - Class A Common Shares" },
-    { symbol: "PAYO", name: "Payoneer Global Inc. - Common Stock" },
-    { symbol: "PAYS", name: "Paysign, Inc. - Common Stock" },
-    { symbol: "PAYX", name: "Paychex, Inc. - Common Stock" },
-    { symbol: "PBBK", name: "PB Bankshares, Inc. - Common Stock" },
-    { symbol: "PBFS", name: "Pioneer Bancorp, Inc. - Common Stock" },
-    { symbol: "PBHC", name: "Pathfinder Bancorp, Inc. - Common Stock" },
-    { symbol: "PBM", name: "Psyence Biomedical Ltd. - Ordinary Shares" },
-    { symbol: "PBMWW", name: "Psyence Biomedical Ltd. - Warrant" },
-    { symbol: "PBPB", name: "Potbelly Corporation - Common Stock" },
-    { symbol: "PBQQ", name: "PGIM Laddered Nasdaq-100 Buffer 12 ETF" },
-    { symbol: "PBYI", name: "Puma Biotechnology Inc - Common Stock" },
-    { symbol: "PC", name: "Premium Catering (Holdings) Limited - Ordinary Shares" },
-    { symbol: "PCAP", name: "ProCap Acquisition Corp - Class A Ordinary Shares" },
-    { symbol: "PCAPU", name: "ProCap Acquisition Corp - Unit" },
-    { symbol: "PCAPW", name: "ProCap Acquisition Corp - Warrant" },
-    { symbol: "PCAR", name: "PACCAR Inc. - Common Stock" },
-    { symbol: "PCB", name: "PCB Bancorp - Common Stock" },
-    { symbol: "PCH", name: "PotlatchDeltic Corporation - Common Stock" },
-    { symbol: "PCLA", name: "PicoCELA Inc. - American Depositary Shares" },
-    { symbol: "PCMM", name: "BondBloxx Private Credit CLO ETF" },
-    { symbol: "PCRX", name: "Pacira BioSciences, Inc. - Common Stock" },
-    { symbol: "PCSA", name: "Processa Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "PCSC", name: "Perceptive Capital Solutions Corp - Class A Ordinary Shares" },
-    { symbol: "PCT", name: "PureCycle Technologies, Inc. - Common stock" },
-    { symbol: "PCTTU", name: "PureCycle Technologies, Inc. - Unit" },
-    { symbol: "PCTTW", name: "PureCycle Technologies, Inc. - Warrant" },
-    { symbol: "PCTY", name: "Paylocity Holding Corporation - Common Stock" },
-    { symbol: "PCVX", name: "Vaxcyte, Inc. - Common Stock" },
-    { symbol: "PCYO", name: "Pure Cycle Corporation - Common Stock" },
-    { symbol: "PDBA", name: "Invesco Agriculture Commodity Strategy No K-1 ETF" },
-    { symbol: "PDBC", name: "Invesco Optimum Yield Diversified Commodity Strategy No K-1 ETF" },
-    { symbol: "PDD", name: "PDD Holdings Inc. - American Depositary Shares" },
-    { symbol: "PDDL", name: "GraniteShares 2x Long PDD Daily ETF" },
-    { symbol: "PDEX", name: "Pro-Dex, Inc. - Common Stock" },
-    { symbol: "PDFS", name: "PDF Solutions, Inc. - Common Stock" },
-    { symbol: "PDLB", name: "Ponce Financial Group, Inc. - Common Stock" },
-    { symbol: "PDP", name: "Invesco Dorsey Wright Momentum ETF" },
-    { symbol: "PDSB", name: "PDS Biotechnology Corporation - Common Stock" },
-    { symbol: "PDYN", name: "Palladyne AI Corp. - Common stock" },
-    { symbol: "PDYNW", name: "Palladyne AI Corp. - Warrant" },
-    { symbol: "PEBK", name: "Peoples Bancorp of North Carolina, Inc. - Common Stock" },
-    { symbol: "PEBO", name: "Peoples Bancorp Inc. - Common Stock" },
-    { symbol: "PECO", name: "Phillips Edison & Company, Inc. - Common Stock" },
-    { symbol: "PEGA", name: "Pegasystems Inc. - Common Stock" },
-    { symbol: "PELI", name: "Pelican Acquisition Corporation - Ordinary Shares" },
-    { symbol: "PELIR", name: "Pelican Acquisition Corporation - Right" },
-    { symbol: "PELIU", name: "Pelican Acquisition Corporation - Unit" },
-    { symbol: "PENG", name: "Penguin Solutions, Inc. - Common Stock" },
-    { symbol: "PENN", name: "PENN Entertainment, Inc. - Common Stock" },
-    { symbol: "PEP", name: "PepsiCo, Inc. - Common Stock" },
-    { symbol: "PEPG", name: "PepGen Inc. - Common Stock" },
-    { symbol: "PEPS", name: "Parametric Equity Plus ETF" },
-    { symbol: "PERI", name: "Perion Network Ltd - Ordinary Shares" },
-    { symbol: "PESI", name: "Perma-Fix Environmental Services, Inc. - Common Stock" },
-    { symbol: "PETS", name: "PetMed Express, Inc. - Common Stock" },
-    { symbol: "PETZ", name: "TDH Holdings, Inc. - Common Shares" },
-    { symbol: "PEY", name: "Invesco High Yield Equity Dividend Achievers ETF" },
-    { symbol: "PEZ", name: "Invesco Dorsey Wright Consumer Cyclicals Momentum ETF" },
-    { symbol: "PFAI", name: "Pinnacle Food Group Limited - Class A Common Shares" },
-    { symbol: "PFBC", name: "Preferred Bank - Common Stock" },
-    { symbol: "PFF", name: "iShares Preferred and Income Securities ETF" },
-    { symbol: "PFG", name: "Principal Financial Group Inc - Common Stock" },
-    { symbol: "PFI", name: "Invesco Dorsey Wright Financial Momentum ETF" },
-    { symbol: "PFIS", name: "Peoples Financial Services Corp.  - Common Stock" },
-    { symbol: "PFM", name: "Invesco Dividend Achievers ETF" },
-    { symbol: "PFSA", name: "Profusa, Inc. - Common Stock" },
-    { symbol: "PFX", name: "PhenixFIN Corporation  - Common Stock" },
-    { symbol: "PFXNZ", name: "PhenixFIN Corporation  - 5.25% Notes due 2028" },
-    { symbol: "PGAC", name: "Pantages Capital Acquisition Corporation - Class A Ordinary Shares" },
-    { symbol: "PGACR", name: "Pantages Capital Acquisition Corporation - Right" },
-    { symbol: "PGACU", name: "Pantages Capital Acquisition Corporation - Unit" },
-    { symbol: "PGC", name: "Peapack-Gladstone Financial Corporation - Common Stock" },
-    { symbol: "PGEN", name: "Precigen, Inc. - Common Stock" },
-    { symbol: "PGJ", name: "Invesco Golden Dragon China ETF" },
-    { symbol: "PGNY", name: "Progyny, Inc. - Common Stock" },
-    { symbol: "PGY", name: "Pagaya Technologies Ltd. - Class A Ordinary Shares" },
-    { symbol: "PGYWW", name: "Pagaya Technologies Ltd. - Warrants" },
-    { symbol: "PHAR", name: "Pharming Group N.V. - ADS, each representing 10 ordinary shares" },
-    { symbol: "PHAT", name: "Phathom Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "PHH", name: "Park Ha Biological Technology Co., Ltd. - ordinary shares" },
-    { symbol: "PHIO", name: "Phio Pharmaceuticals Corp. - Common Stock" },
-    { symbol: "PHLT", name: "Performant Healthcare, Inc. - Common Stock" },
-    { symbol: "PHO", name: "Invesco Water Resources ETF" },
-    { symbol: "PHOE", name: "Phoenix Asia Holdings Limited - Ordinary Shares" },
-    { symbol: "PHUN", name: "Phunware, Inc. - Common Stock" },
-    { symbol: "PHVS", name: "Pharvaris N.V. - Ordinary Shares" },
-    { symbol: "PI", name: "Impinj, Inc. - Common Stock" },
-    { symbol: "PID", name: "Invesco International Dividend Achievers ETF" },
-    { symbol: "PIE", name: "Invesco Dorsey Wright Emerging Markets Momentum ETF" },
-    { symbol: "PIII", name: "P3 Health Partners Inc. - Class A Common Stock" },
-    { symbol: "PIIIW", name: "P3 Health Partners Inc. - Warrant" },
-    { symbol: "PINC", name: "Premier, Inc. - Class A Common Stock" },
-    { symbol: "PIO", name: "Invesco Global Water ETF" },
-    { symbol: "PIZ", name: "Invesco Dorsey Wright Developed Markets Momentum ETF" },
-    { symbol: "PKBK", name: "Parke Bancorp, Inc. - Common Stock" },
-    { symbol: "PKOH", name: "Park-Ohio Holdings Corp. - Common Stock" },
-    { symbol: "PKW", name: "Invesco BuyBack Achievers ETF" },
-    { symbol: "PLAB", name: "Photronics, Inc. - Common Stock" },
-    { symbol: "PLAY", name: "Dave & Buster's Entertainment, Inc. - Common Stock" },
-    { symbol: "PLBC", name: "Plumas Bancorp - Common Stock" },
-    { symbol: "PLBL", name: "Polibeli Group Ltd - Class A Ordinary Shares" },
-    { symbol: "PLBY", name: "Playboy, Inc. - Common Stock" },
-    { symbol: "PLCE", name: "Children's Place, Inc. (The) - Common Stock" },
-    { symbol: "PLMK", name: "Plum Acquisition Corp. IV - Class A Ordinary Shares" },
-    { symbol: "PLMKU", name: "Plum Acquisition Corp. IV - Unit" },
-    { symbol: "PLMKW", name: "Plum Acquisition Corp. IV - Warrants" },
-    { symbol: "PLMR", name: "Palomar Holdings, Inc. - Common stock" },
-    { symbol: "PLPC", name: "Preformed Line Products Company - Common Stock" },
-    { symbol: "PLRX", name: "Pliant Therapeutics, Inc. - Common Stock" },
-    { symbol: "PLRZ", name: "Polyrizon Ltd. - Ordinary Shares" },
-    { symbol: "PLSE", name: "Pulse Biosciences, Inc - Common Stock" },
-    { symbol: "PLT", name: "Defiance Leveraged Long Income PLTR ETF" },
-    { symbol: "PLTD", name: "Direxion Daily PLTR Bear 1X Shares" },
-    { symbol: "PLTG", name: "Leverage Shares 2X Long PLTR Daily ETF" },
-    { symbol: "PLTK", name: "Playtika Holding Corp. - Common Stock" },
-    { symbol: "PLTR", name: "Palantir Technologies Inc. - Class A Common Stock" },
-    { symbol: "PLTU", name: "Direxion Daily PLTR Bull 2X Shares" },
-    { symbol: "PLTZ", name: "Defiance Daily Target 2x Short PLTR ETF" },
-    { symbol: "PLUG", name: "Plug Power, Inc. - Common Stock" },
-    { symbol: "PLUR", name: "Pluri Inc. - Common Stock" },
-    { symbol: "PLUS", name: "ePlus inc. - Common Stock" },
-    { symbol: "PLUT", name: "Plutus Financial Group Limited - Ordinary Shares" },
-    { symbol: "PLXS", name: "Plexus Corp. - Common Stock" },
-    { symbol: "PMAX", name: "Powell Max Limited - Class A Ordinary Shares" },
-    { symbol: "PMBS", name: "PIMCO Mortgage-Backed Securities Active Exchange-Traded Fund" },
-    { symbol: "PMCB", name: "PharmaCyte  Biotech, Inc. - Common Stock" },
-    { symbol: "PMEC", name: "Primech Holdings Ltd. - Ordinary Shares" },
-    { symbol: "PMN", name: "ProMIS Neurosciences Inc. - Common Shares" },
-    { symbol: "PMTR", name: "Perimeter Acquisition Corp. I - Class A Ordinary Shares" },
-    { symbol: "PMTRU", name: "Perimeter Acquisition Corp. I - Unit" },
-    { symbol: "PMTRW", name: "Perimeter Acquisition Corp. I - Warrant" },
-    { symbol: "PMTS", name: "CPI Card Group Inc. - Common Stock" },
-    { symbol: "PMVP", name: "PMV Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "PN", name: "Skycorp Solar Group Limited - Ordinary Shares" },
-    { symbol: "PNBK", name: "Patriot National Bancorp Inc. - Common Stock" },
-    { symbol: "PNFP", name: "Pinnacle Financial Partners, Inc. - Common Stock" },
-    { symbol: "PNFPP", name: "Pinnacle Financial Partners, Inc. - Depositary shares of Pinnacle Financial Partners, Inc., each representing a 1/40th Interest in a share of its 6.75% Fixed-Rate Non-Cumulative Perpetual Preferred Stock, Series B" },
-    { symbol: "PNQI", name: "Invesco Nasdaq Internet ETF" },
-    { symbol: "PNRG", name: "PrimeEnergy Resources Corporation - Common Stock" },
-    { symbol: "PNTG", name: "The Pennant Group, Inc. - Common Stock" },
-    { symbol: "POAI", name: "Predictive Oncology Inc. - Common Stock" },
-    { symbol: "POCI", name: "Precision Optics Corporation, Inc. - Common stock" },
-    { symbol: "PODC", name: "PodcastOne, Inc. - Common Stock" },
-    { symbol: "PODD", name: "Insulet Corporation - Common Stock" },
-    { symbol: "POET", name: "POET Technologies Inc. - Common Shares" },
-    { symbol: "POLA", name: "Polar Power, Inc. - Common Stock" },
-    { symbol: "POLE", name: "Andretti Acquisition Corp. II - Class A Ordinary Shares" },
-    { symbol: "POLEU", name: "Andretti Acquisition Corp. II - Unit" },
-    { symbol: "POLEW", name: "Andretti Acquisition Corp. II - Warrant" },
-    { symbol: "PONY", name: "Pony AI Inc. - American Depositary Shares" },
-    { symbol: "POOL", name: "Pool Corporation - Common Stock" },
-    { symbol: "POWI", name: "Power Integrations, Inc. - Common Stock" },
-    { symbol: "POWL", name: "Powell Industries, Inc. - Common Stock" },
-    { symbol: "POWW", name: "Outdoor Holding Company - Common Stock" },
-    { symbol: "POWWP", name: "Outdoor Holding Company - 8.75% Series A Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "PPBT", name: "Purple Biotech Ltd. - American Depositary Shares" },
-    { symbol: "PPC", name: "Pilgrim's Pride Corporation - Common Stock" },
-    { symbol: "PPCB", name: "Propanc Biopharma, Inc. - Common Stock" },
-    { symbol: "PPH", name: "VanEck Pharmaceutical ETF" },
-    { symbol: "PPI", name: "Astoria Real Assets ETF" },
-    { symbol: "PPIH", name: "Perma-Pipe International Holdings, Inc. - Common Stock" },
-    { symbol: "PPSI", name: "Pioneer Power Solutions, Inc. - Common Stock" },
-    { symbol: "PPTA", name: "Perpetua Resources Corp. - Common Shares" },
-    { symbol: "PQAP", name: "PGIM Nasdaq-100 Buffer 12 ETF - April" },
-    { symbol: "PQJA", name: "PGIM Nasdaq-100 Buffer 12 ETF - January" },
-    { symbol: "PQJL", name: "PGIM Nasdaq-100 Buffer 12 ETF - July" },
-    { symbol: "PQOC", name: "PGIM Nasdaq-100 Buffer 12 ETF - October" },
-    { symbol: "PRAA", name: "PRA Group, Inc. - Common Stock" },
-    { symbol: "PRAX", name: "Praxis Precision Medicines, Inc. - Common Stock" },
-    { symbol: "PRCH", name: "Porch Group, Inc. - Common Stock" },
-    { symbol: "PRCT", name: "PROCEPT BioRobotics Corporation - Common Stock" },
-    { symbol: "PRDO", name: "Perdoceo Education Corporation - Common Stock" },
-    { symbol: "PRE", name: "Prenetics Global Limited - Class A Ordinary Share" },
-    { symbol: "PRENW", name: "Prenetics Global Limited - Warrant" },
-    { symbol: "PRFX", name: "PainReform Ltd. - Ordinary Shares" },
-    { symbol: "PRFZ", name: "Invesco RAFI US 1500 Small-Mid ETF" },
-    { symbol: "PRGS", name: "Progress Software Corporation - Common Stock" },
-    { symbol: "PRLD", name: "Prelude Therapeutics Incorporated - Common Stock" },
-    { symbol: "PRME", name: "Prime Medicine, Inc. - Common Stock" },
-    { symbol: "PRN", name: "Invesco Dorsey Wright Industrials Momentum ETF" },
-    { symbol: "PROF", name: "Profound Medical Corp. - common stock" },
-    { symbol: "PROK", name: "ProKidney Corp. - Class A Ordinary Shares" },
-    { symbol: "PROP", name: "Prairie Operating Co. - Common Stock" },
-    { symbol: "PROV", name: "Provident Financial Holdings, Inc. - Common Stock" },
-    { symbol: "PRPH", name: "ProPhase Labs, Inc. - Common Stock" },
-    { symbol: "PRPL", name: "Purple Innovation, Inc. - Common Stock" },
-    { symbol: "PRPO", name: "Precipio, Inc. - Common Stock" },
-    { symbol: "PRQR", name: "ProQR Therapeutics N.V. - Ordinary Shares" },
-    { symbol: "PRSO", name: "Peraso Inc. - Common Stock" },
-    { symbol: "PRTA", name: "Prothena Corporation plc - Ordinary Shares" },
-    { symbol: "PRTC", name: "PureTech Health plc - American Depositary Shares" },
-    { symbol: "PRTH", name: "Priority Technology Holdings, Inc. - Common Stock" },
-    { symbol: "PRTS", name: "CarParts.com, Inc. - Common Stock" },
-    { symbol: "PRVA", name: "Privia Health Group, Inc. - Common Stock" },
-    { symbol: "PRZO", name: "ParaZero Technologies Ltd. - Ordinary Shares" },
-    { symbol: "PSC", name: "Principal U.S. Small-Cap ETF" },
-    { symbol: "PSCC", name: "Invesco S&P SmallCap Consumer Staples ETF" },
-    { symbol: "PSCD", name: "Invesco S&P SmallCap Consumer Discretionary ETF" },
-    { symbol: "PSCE", name: "Invesco S&P SmallCap Energy ETF" },
-    { symbol: "PSCF", name: "Invesco S&P SmallCap Financials ETF" },
-    { symbol: "PSCH", name: "Invesco S&P SmallCap Health Care ETF" },
-    { symbol: "PSCI", name: "Invesco S&P SmallCap Industrials ETF" },
-    { symbol: "PSCM", name: "Invesco S&P SmallCap Materials ETF" },
-    { symbol: "PSCT", name: "Invesco S&P SmallCap Information Technology ETF" },
-    { symbol: "PSCU", name: "Invesco S&P SmallCap Utilities & Communication Services ETF" },
-    { symbol: "PSEC", name: "Prospect Capital Corporation - Closed End Fund" },
-    { symbol: "PSET", name: "Principal Quality ETF" },
-    { symbol: "PSHG", name: "Performance Shipping Inc. - Common Shares" },
-    { symbol: "PSIG", name: "PS International Group Ltd. - Ordinary Shares" },
-    { symbol: "PSIX", name: "Power Solutions International, Inc. - Common Stock" },
-    { symbol: "PSKY", name: "Paramount Skydance Corporation - Class B Common Stock" },
-    { symbol: "PSL", name: "Invesco Dorsey Wright Consumer Staples Momentum ETF" },
-    { symbol: "PSMT", name: "PriceSmart, Inc. - Common Stock" },
-    { symbol: "PSNL", name: "Personalis, Inc. - Common Stock" },
-    { symbol: "PSNY", name: "Polestar Automotive Holding UK Limited - Class A ADS" },
-    { symbol: "PSNYW", name: "Polestar Automotive Holding UK Limited - Class C-1 ADS (ADW)" },
-    { symbol: "PSTR", name: "PeakShares Sector Rotation ETF" },
-    { symbol: "PSTV", name: "PLUS THERAPEUTICS, Inc. - Common Stock" },
-    { symbol: "PSWD", name: "Xtrackers Cybersecurity Select Equity ETF" },
-    { symbol: "PT", name: "Pintec Technology Holdings Limited - American Depositary Shares" },
-    { symbol: "PTC", name: "PTC Inc. - Common Stock" },
-    { symbol: "PTCT", name: "PTC Therapeutics, Inc. - Common Stock" },
-    { symbol: "PTEN", name: "Patterson-UTI Energy, Inc. - Common Stock" },
-    { symbol: "PTF", name: "Invesco Dorsey Wright Technology Momentum ETF" },
-    { symbol: "PTGX", name: "Protagonist Therapeutics, Inc. - Common Stock" },
-    { symbol: "PTH", name: "Invesco Dorsey Wright Healthcare Momentum ETF" },
-    { symbol: "PTHL", name: "Pheton Holdings Ltd - Class A Ordinary Shares" },
-    { symbol: "PTIR", name: "GraniteShares 2x Long PLTR Daily ETF" },
-    { symbol: "PTIX", name: "Protagenic Therapeutics, Inc. - Common Stock" },
-    { symbol: "PTIXW", name: "Protagenic Therapeutics, Inc. - Warrant" },
-    { symbol: "PTLE", name: "PTL LTD - Class A Ordinary Shares" },
-    { symbol: "PTLO", name: "Portillo's Inc. - Class A Common Stock" },
-    { symbol: "PTNM", name: "Pitanium Limited - Class A Ordinary Shares" },
-    { symbol: "PTNQ", name: "Pacer Trendpilot 100 ETF" },
-    { symbol: "PTON", name: "Peloton Interactive, Inc. - Common Stock" },
-    { symbol: "PUBM", name: "PubMatic, Inc. - Class A Common Stock" },
-    { symbol: "PUI", name: "Invesco Dorsey Wright Utilities Momentum ETF" },
-    { symbol: "PULM", name: "Pulmatrix, Inc. - Common Stock" },
-    { symbol: "PVBC", name: "Provident Bancorp, Inc. - Common Stock" },
-    { symbol: "PVLA", name: "Palvella Therapeutics, Inc. - Common Stock" },
-    { symbol: "PWM", name: "Prestige Wealth Inc. - Class A Ordinary Shares" },
-    { symbol: "PWP", name: "Perella Weinberg Partners - Class A Common Stock" },
-    { symbol: "PWRD", name: "TCW Transform Systems ETF" },
-    { symbol: "PXI", name: "Invesco Dorsey Wright Energy Momentum ETF" },
-    { symbol: "PXLW", name: "Pixelworks, Inc. - Common Stock" },
-    { symbol: "PXS", name: "Pyxis Tankers Inc. - Common Stock" },
-    { symbol: "PXSAW", name: "Pyxis Tankers Inc. - Warrant" },
-    { symbol: "PY", name: "Principal Value ETF" },
-    { symbol: "PYPD", name: "PolyPid Ltd. - Ordinary Shares" },
-    { symbol: "PYPG", name: "Leverage Shares 2X Long PYPL Daily ETF" },
-    { symbol: "PYPL", name: "PayPal Holdings, Inc. - Common Stock" },
-    { symbol: "PYXS", name: "Pyxis Oncology, Inc. - Common Stock" },
-    { symbol: "PYZ", name: "Invesco Dorsey Wright Basic Materials Momentum ETF" },
-    { symbol: "PZZA", name: "Papa John's International, Inc. - Common Stock" },
-    { symbol: "QABA", name: "First Trust NASDAQ ABA Community Bank Index Fund" },
-    { symbol: "QALT", name: "SEI DBi Multi-Strategy Alternative ETF" },
-    { symbol: "QAT", name: "iShares MSCI Qatar ETF" },
-    { symbol: "QB", name: "ProShares Nasdaq-100 Dynamic Buffer ETF" },
-    { symbol: "QBIG", name: "Invesco Top QQQ ETF" },
-    { symbol: "QBUF", name: "Innovator Nasdaq-100 10 Buffer ETF Quarterly" },
-    { symbol: "QCLN", name: "First Trust NASDAQ Clean Edge Green Energy Index Fund" },
-    { symbol: "QCLR", name: "Global X NASDAQ 100 Collar 95-110 ETF" },
-    { symbol: "QCMD", name: "Direxion Daily QCOM Bear 1X ETF" },
-    { symbol: "QCML", name: "GraniteShares 2x Long QCOM Daily ETF" },
-    { symbol: "QCMU", name: "Direxion Daily QCOM Bull 2X ETF" },
-    { symbol: "QCOM", name: "QUALCOMM Incorporated - Common Stock" },
-    { symbol: "QCRH", name: "QCR Holdings, Inc. - Common Stock" },
-    { symbol: "QDEL", name: "QuidelOrtho Corporation - Common Stock" },
-    { symbol: "QDTY", name: "YieldMax Nasdaq 100 0DTE Covered Call Strategy ETF" },
-    { symbol: "QETA", name: "Quetta Acquisition Corporation - Common Stock" },
-    { symbol: "QETAR", name: "Quetta Acquisition Corporation - Right" },
-    { symbol: "QETAU", name: "Quetta Acquisition Corporation - Unit" },
-    { symbol: "QFIN", name: "Qfin Holdings, Inc.  - American Depositary Shares" },
-    { symbol: "QGRD", name: "Horizon Nasdaq-100 Defined Risk ETF" },
-    { symbol: "QH", name: "Quhuo Limited - American Depository Shares" },
-    { symbol: "QHDG", name: "Innovator Hedged Nasdaq-100 ETF" },
-    { symbol: "QIPT", name: "Quipt Home Medical Corp. - Common Shares" },
-    { symbol: "QLGN", name: "Qualigen Therapeutics, Inc. - Common Stock" },
-    { symbol: "QLYS", name: "Qualys, Inc. - Common Stock" },
-    { symbol: "QMCO", name: "Quantum Corporation - Common Stock" },
-    { symbol: "QMID", name: "WisdomTree U.S. MidCap Quality Growth Fund" },
-    { symbol: "QMMM", name: "QMMM Holdings Limited - Class A Ordinary Shares" },
-    { symbol: "QMOM", name: "Alpha Architect U.S. Quantitative Momentum ETF" },
-    { symbol: "QNCX", name: "Quince Therapeutics, Inc. - Common Stock" },
-    { symbol: "QNRX", name: "Quoin Pharmaceuticals, Ltd. - American Depositary Shares" },
-    { symbol: "QNST", name: "QuinStreet, Inc. - Common Stock" },
-    { symbol: "QNTM", name: "Quantum Biopharma Ltd. - Class B Subordinate Voting Shares" },
-    { symbol: "QNXT", name: "iShares Nasdaq-100 ex Top 30 ETF" },
-    { symbol: "QOWZ", name: "Invesco Nasdaq Free Cash Flow Achievers ETF" },
-    { symbol: "QPUX", name: "Defiance 2X Daily Long Pure Quantum ETF" },
-    { symbol: "QQA", name: "Invesco QQQ Income Advantage ETF" },
-    { symbol: "QQDN", name: "ProShares UltraShort Top QQQ" },
-    { symbol: "QQEW", name: "First Trust NASDAQ-100 Equal Weighted Index Fund" },
-    { symbol: "QQHG", name: "Invesco QQQ Hedged Advantage ETF" },
-    { symbol: "QQJG", name: "Invesco ESG NASDAQ Next Gen 100 ETF" },
-    { symbol: "QQLV", name: "Invesco QQQ Low Volatility ETF" },
-    { symbol: "QQMG", name: "Invesco ESG NASDAQ 100 ETF" },
-    { symbol: "QQQ", name: "Invesco QQQ Trust, Series 1" },
-    { symbol: "QQQA", name: "ProShares Nasdaq-100 Dorsey Wright Momentum ETF" },
-    { symbol: "QQQE", name: "Direxion NASDAQ-100 Equal Weighted Index Shares" },
-    { symbol: "QQQG", name: "Pacer Nasdaq 100 Top 50 Cash Cows Growth Leaders ETF" },
-    { symbol: "QQQH", name: "NEOS Nasdaq-100 Hedged Equity Income ETF" },
-    { symbol: "QQQI", name: "NEOS Nasdaq 100 High Income ETF" },
-    { symbol: "QQQJ", name: "Invesco NASDAQ Next Gen 100 ETF" },
-    { symbol: "QQQM", name: "Invesco NASDAQ 100 ETF" },
-    { symbol: "QQQP", name: "Tradr 2X Long Innovation 100 Quarterly ETF" },
-    { symbol: "QQQS", name: "Invesco NASDAQ Future Gen 200 ETF" },
-    { symbol: "QQQT", name: "Defiance Nasdaq 100 Income Target ETF" },
-    { symbol: "QQQX", name: "Nuveen NASDAQ 100 Dynamic Overwrite Fund - Closed End Fund" },
-    { symbol: "QQQY", name: "Defiance Nasdaq 100 Target 30 Income ETF" },
-    { symbol: "QQUP", name: "ProShares Ultra Top QQQ" },
-    { symbol: "QQWZ", name: "Pacer Cash COWZ 100-Nasdaq 100 Rotator ETF" },
-    { symbol: "QQXL", name: "ProShares Ultra QQQ Top 30" },
-    { symbol: "QQXT", name: "First Trust NASDAQ-100 Ex-Technology Sector Index Fund" },
-    { symbol: "QRHC", name: "Quest Resource Holding Corporation - Common Stock" },
-    { symbol: "QRMI", name: "Global X NASDAQ 100 Risk Managed Income ETF" },
-    { symbol: "QRVO", name: "Qorvo, Inc. - Common Stock" },
-    { symbol: "QSEA", name: "Quartzsea Acquisition Corporation - Ordinary Shares" },
-    { symbol: "QSEAR", name: "Quartzsea Acquisition Corporation - Rights" },
-    { symbol: "QSEAU", name: "Quartzsea Acquisition Corporation - Units" },
-    { symbol: "QSG", name: "QuantaSing Group Limited - American Depositary Shares" },
-    { symbol: "QSI", name: "Quantum-Si Incorporated - Class A Common Stock" },
-    { symbol: "QSIAW", name: "Quantum-Si Incorporated - Warrant" },
-    { symbol: "QSIX", name: "Pacer Metaurus Nasdaq 100 Dividend Multiplier 600 ETF" },
-    { symbol: "QSML", name: "WisdomTree U.S. SmallCap Quality Growth Fund" },
-    { symbol: "QTEC", name: "First Trust NASDAQ-100-Technology Sector Index Fund" },
-    { symbol: "QTOP", name: "iShares Nasdaq Top 30 Stocks ETF" },
-    { symbol: "QTR", name: "Global X NASDAQ 100 Tail Risk ETF" },
-    { symbol: "QTRX", name: "Quanterix Corporation - Common Stock" },
-    { symbol: "QTTB", name: "Q32 Bio Inc. - Common Stock" },
-    { symbol: "QTUM", name: "Defiance Quantum ETF" },
-    { symbol: "QUBT", name: "Quantum Computing Inc. - Common Stock" },
-    { symbol: "QUIK", name: "QuickLogic Corporation - Common Stock" },
-    { symbol: "QUMSU", name: "Quantumsphere Acquisition Corp. - Units" },
-    { symbol: "QURE", name: "uniQure N.V. - Ordinary Shares" },
-    { symbol: "QVAL", name: "Alpha Architect U.S. Quantitative Value ETF" },
-    { symbol: "QVCGA", name: "QVC Group, Inc. - Series A Common Stock" },
-    { symbol: "QVCGP", name: "QVC Group, Inc. - 8.0% Fixed Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "QXQ", name: "SGI Enhanced Nasdaq-100 ETF" },
-    { symbol: "QYLD", name: "Global X NASDAQ 100 Covered Call ETF" },
-    { symbol: "QYLG", name: "Global X Nasdaq 100 Covered Call & Growth ETF" },
-    { symbol: "RAA", name: "SMI 3Fourteen REAL Asset Allocation ETF" },
-    { symbol: "RAAQ", name: "Real Asset Acquisition Corp. - Class A Ordinary Share" },
-    { symbol: "RAAQU", name: "Real Asset Acquisition Corp. - Unit" },
-    { symbol: "RAAQW", name: "Real Asset Acquisition Corp. - Warrants" },
-    { symbol: "RADX", name: "Radiopharm Theranostics Limited - American Depositary Shares" },
-    { symbol: "RAIL", name: "Freightcar America, Inc. - Common Stock" },
-    { symbol: "RAIN", name: "Rain Enhancement Technologies Holdco, Inc. - Class A Common Stock" },
-    { symbol: "RAINW", name: "Rain Enhancement Technologies Holdco, Inc. - Warrants" },
-    { symbol: "RAND", name: "Rand Capital Corporation - Closed End Fund" },
-    { symbol: "RANG", name: "Range Capital Acquisition Corp. - Ordinary Shares" },
-    { symbol: "RANGR", name: "Range Capital Acquisition Corp. - Rights" },
-    { symbol: "RANGU", name: "Range Capital Acquisition Corp. - Units" },
-    { symbol: "RANI", name: "Rani Therapeutics Holdings, Inc. - Class A Common Stock" },
-    { symbol: "RAPP", name: "Rapport Therapeutics, Inc. - Common Stock" },
-    { symbol: "RAPT", name: "RAPT Therapeutics, Inc. - Common Stock" },
-    { symbol: "RARE", name: "Ultragenyx Pharmaceutical Inc. - Common Stock" },
-    { symbol: "RAVE", name: "Rave Restaurant Group, Inc. - Common Stock" },
-    { symbol: "RAY", name: "Raytech Holding Limited - ordinary shares" },
-    { symbol: "RAYA", name: "Erayak Power Solution Group Inc. - Class A Ordinary Shares" },
-    { symbol: "RBB", name: "RBB Bancorp - Common Stock" },
-    { symbol: "RBBN", name: "Ribbon Communications Inc.  - Common Stock" },
-    { symbol: "RBCAA", name: "Republic Bancorp, Inc. - Class A Common Stock" },
-    { symbol: "RBIL", name: "F/m Ultrashort Treasury Inflation-Protected Security (TIPS) ETF" },
-    { symbol: "RBKB", name: "Rhinebeck Bancorp, Inc. - Common Stock" },
-    { symbol: "RBNE", name: "Robin Energy Ltd. - Common Stock" },
-    { symbol: "RCAT", name: "Red Cat Holdings, Inc. - Common Stock" },
-    { symbol: "RCEL", name: "Avita Medical, Inc. - Common Stock" },
-    { symbol: "RCGE", name: "RockCreek Global Equality ETF" },
-    { symbol: "RCKT", name: "Rocket Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "RCKTW", name: "Rocket Pharmaceuticals, Inc. - Warrant" },
-    { symbol: "RCKY", name: "Rocky Brands, Inc. - Common Stock" },
-    { symbol: "RCMT", name: "RCM Technologies, Inc. - Common Stock" },
-    { symbol: "RCON", name: "Recon Technology, Ltd. - Class A Ordinary Shares" },
-    { symbol: "RCT", name: "RedCloud Holdings plc - Ordinary Shares" },
-    { symbol: "RDAC", name: "Rising Dragon Acquisition Corp. - Ordinary Shares" },
-    { symbol: "RDACR", name: "Rising Dragon Acquisition Corp. - Rights" },
-    { symbol: "RDACU", name: "Rising Dragon Acquisition Corp. - Unit" },
-    { symbol: "RDAG", name: "Republic Digital Acquisition Company - Class A Ordinary Shares" },
-    { symbol: "RDAGU", name: "Republic Digital Acquisition Company - Unit" },
-    { symbol: "RDAGW", name: "Republic Digital Acquisition Company - Warrants" },
-    { symbol: "RDCM", name: "Radcom Ltd. - Ordinary Shares" },
-    { symbol: "RDGT", name: "Ridgetech, Inc. - Ordinary Shares" },
-    { symbol: "RDHL", name: "Redhill Biopharma Ltd. - American Depositary Shares" },
-    { symbol: "RDI", name: "Reading International Inc - Class A Non-voting Common Stock" },
-    { symbol: "RDIB", name: "Reading International Inc - Class B Voting Common Stock" },
-    { symbol: "RDNT", name: "RadNet, Inc. - Common Stock" },
-    { symbol: "RDNW", name: "RideNow Group, Inc. - Class B Common Stock" },
-    { symbol: "RDTL", name: "GraniteShares 2x Long RDDT Daily ETF" },
-    { symbol: "RDTY", name: "YieldMax R2000 0DTE Covered Strategy ETF" },
-    { symbol: "RDVT", name: "Red Violet, Inc. - Common Stock " },
-    { symbol: "RDVY", name: "First Trust Rising Dividend Achievers ETF" },
-    { symbol: "RDWR", name: "Radware Ltd. - Ordinary Shares" },
-    { symbol: "RDZN", name: "Roadzen, Inc. - Ordinary Shares" },
-    { symbol: "RDZNW", name: "Roadzen, Inc. - Warrants" },
-    { symbol: "REAI", name: "Intelligent Real Estate ETF" },
-    { symbol: "REAL", name: "The RealReal, Inc. - Common Stock" },
-    { symbol: "REAX", name: "The Real Brokerage, Inc. - Common Shares" },
-    { symbol: "REBN", name: "Reborn Coffee, Inc. - Common Stock" },
-    { symbol: "RECT", name: "Rectitude Holdings Ltd - Ordinary Shares" },
-    { symbol: "REE", name: "REE Automotive Ltd. - Class A Ordinary Shares" },
-    { symbol: "REFI", name: "Chicago Atlantic Real Estate Finance, Inc. - Common Stock" },
-    { symbol: "REFR", name: "Research Frontiers Incorporated - Common Stock" },
-    { symbol: "REG", name: "Regency Centers Corporation - Common Stock" },
-    { symbol: "REGCO", name: "Regency Centers Corporation - 5.875% Series B Cumulative Redeemable Preferred Stock" },
-    { symbol: "REGCP", name: "Regency Centers Corporation - 6.25% Series A Cumulative Redeemable Preferred Stock" },
-    { symbol: "REGN", name: "Regeneron Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "REIT", name: "ALPS Active REIT ETF" },
-    { symbol: "REKR", name: "Rekor Systems, Inc. - Common Stock" },
-    { symbol: "RELI", name: "Reliance Global Group, Inc. - Common Stock" },
-    { symbol: "RELIW", name: "Reliance Global Group, Inc. - Series A Warrants" },
-    { symbol: "RELL", name: "Richardson Electronics, Ltd. - Common Stock" },
-    { symbol: "RELY", name: "Remitly Global, Inc. - Common stock" },
-    { symbol: "REMG", name: "Emerging Markets Active ETF" },
-    { symbol: "RENB", name: "Lunai Bioworks Inc. - Common Stock" },
-    { symbol: "RENT", name: "Rent the Runway, Inc. - Class A Common Stock" },
-    { symbol: "REPL", name: "Replimune Group, Inc. - Common Stock" },
-    { symbol: "RETO", name: "ReTo Eco-Solutions, Inc. - Class A Shares" },
-    { symbol: "REVB", name: "Revelation Biosciences, Inc. - Common Stock" },
-    { symbol: "REVBW", name: "Revelation Biosciences, Inc. - Warrant" },
-    { symbol: "REYN", name: "Reynolds Consumer Products Inc. - Common Stock" },
-    { symbol: "RFAI", name: "RF Acquisition Corp II - Ordinary Shares" },
-    { symbol: "RFAIR", name: "RF Acquisition Corp II - Right" },
-    { symbol: "RFAIU", name: "RF Acquisition Corp II - Unit" },
-    { symbol: "RFDI", name: "First Trust RiverFront Dynamic Developed International ETF" },
-    { symbol: "RFEM", name: "First Trust RiverFront Dynamic Emerging Markets ETF" },
-    { symbol: "RFEU", name: "First Trust RiverFront Dynamic Europe ETF" },
-    { symbol: "RFIL", name: "RF Industries, Ltd. - Common Stock" },
-    { symbol: "RGC", name: "Regencell Bioscience Holdings Limited - Ordinary Shares" },
-    { symbol: "RGCO", name: "RGC Resources Inc. - Common Stock" },
-    { symbol: "RGEN", name: "Repligen Corporation - Common Stock" },
-    { symbol: "RGLD", name: "Royal Gold, Inc. - Common Stock" },
-    { symbol: "RGLO", name: "Global Equity Active ETF" },
-    { symbol: "RGNX", name: "REGENXBIO Inc. - Common Stock" },
-    { symbol: "RGP", name: "Resources Connection, Inc. - Common Stock" },
-    { symbol: "RGS", name: "Regis Corporation - Common Stock" },
-    { symbol: "RGTI", name: "Rigetti Computing, Inc.  - Common stock" },
-    { symbol: "RGTIW", name: "Rigetti Computing, Inc.  - Redeemable warrants, each whole warrant exercisable for one Class A ordinary share at an exercise price of $11.50" },
-    { symbol: "RGTX", name: "Defiance Daily Target 2X Long RGTI ETF" },
-    { symbol: "RHLD", name: "Resolute Holdings Management - Common Stock" },
-    { symbol: "RIBB", name: "Ribbon Acquisition Corp - Class A Ordinary Shares" },
-    { symbol: "RIBBR", name: "Ribbon Acquisition Corp - Rights" },
-    { symbol: "RIBBU", name: "Ribbon Acquisition Corp - Unit" },
-    { symbol: "RICK", name: "RCI Hospitality Holdings, Inc. - Common Stock" },
-    { symbol: "RIFR", name: "Global Infrastructure Active ETF" },
-    { symbol: "RIGL", name: "Rigel Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "RILY", name: "B. Riley Financial, Inc. - Common Stock" },
-    { symbol: "RILYG", name: "B. Riley Financial, Inc. - 5.00% Senior Notes due 2026" },
-    { symbol: "RILYK", name: "B. Riley Financial, Inc. - 5.50% Senior Notes Due 2026" },
-    { symbol: "RILYL", name: "B. Riley Financial, Inc. - Depositary Shares, each representing a 1/1000th fractional interest in a share of Series B Cumulative Perpetual Preferred Stock" },
-    { symbol: "RILYN", name: "B. Riley Financial, Inc. - 6.50% Senior Notes Due 2026" },
-    { symbol: "RILYP", name: "B. Riley Financial, Inc. - Depositary Shares, each representing a 1/1000th fractional interest in a share of Series A Cumulative Perpetual Preferred Stock" },
-    { symbol: "RILYT", name: "B. Riley Financial, Inc. - 6.00% Senior Notes Due 2028" },
-    { symbol: "RILYZ", name: "B. Riley Financial, Inc. - 5.25% Senior Notes due 2028" },
-    { symbol: "RIME", name: "Algorhythm Holdings, Inc. - Common Stock" },
-    { symbol: "RING", name: "iShares MSCI Global Gold Miners ETF" },
-    { symbol: "RINT", name: "International Developed Equity Active ETF" },
-    { symbol: "RIOT", name: "Riot Platforms, Inc. - Common Stock" },
-    { symbol: "RITR", name: "Reitar Logtech Holdings Limited - Ordinary shares" },
-    { symbol: "RIVN", name: "Rivian Automotive, Inc. - Class A Common Stock" },
-    { symbol: "RKDA", name: "Arcadia Biosciences, Inc. - Common Stock" },
-    { symbol: "RKLB", name: "Rocket Lab Corporation - Common Stock" },
-    { symbol: "RKLX", name: "Defiance Daily Target 2X Long RKLB ETF" },
-    { symbol: "RLAY", name: "Relay Therapeutics, Inc. - Common Stock" },
-    { symbol: "RLMD", name: "Relmada Therapeutics, Inc. - Common Stock" },
-    { symbol: "RLYB", name: "Rallybio Corporation - Common Stock" },
-    { symbol: "RMBI", name: "Richmond Mutual Bancorporation, Inc. - Common Stock" },
-    { symbol: "RMBS", name: "Rambus, Inc. - Common Stock" },
-    { symbol: "RMCF", name: "Rocky Mountain Chocolate Factory, Inc. - Common Stock" },
-    { symbol: "RMCO", name: "Royalty Management Holding Corporation - Class A Common Stock" },
-    { symbol: "RMCOW", name: "Royalty Management Holding Corporation - Warrant" },
-    { symbol: "RMNI", name: "Rimini Street, Inc. - Common Stock" },
-    { symbol: "RMR", name: "The RMR Group Inc. - Class A Common Stock" },
-    { symbol: "RMSG", name: "Real Messenger Corporation - Ordinary Shares" },
-    { symbol: "RMSGW", name: "Real Messenger Corporation - Warrants" },
-    { symbol: "RMTI", name: "Rockwell Medical, Inc. - Common Stock" },
-    { symbol: "RNA", name: "Avidity Biosciences, Inc. - Common Stock" },
-    { symbol: "RNAC", name: "Cartesian Therapeutics, Inc. - Common Stock" },
-    { symbol: "RNAZ", name: "TransCode Therapeutics, Inc. - Common Stock" },
-    { symbol: "RNEM", name: "Emerging Markets Equity Select ETF" },
-    { symbol: "RNIN", name: "Bushido Capital US SMID Cap Equity ETF" },
-    { symbol: "RNRG", name: "Global X Renewable Energy Producers ETF" },
-    { symbol: "RNTX", name: "Rein Therapeutics, Inc. - Common Stock" },
-    { symbol: "RNW", name: "ReNew Energy Global plc - Class A Shares" },
-    { symbol: "RNWWW", name: "ReNew Energy Global plc - Warrant" },
-    { symbol: "RNXT", name: "RenovoRx, Inc. - Common Stock" },
-    { symbol: "ROAD", name: "Construction Partners, Inc. - Common Stock" },
-    { symbol: "ROBT", name: "First Trust Nasdaq Artificial Intelligence and Robotics ETF" },
-    { symbol: "ROCK", name: "Gibraltar Industries, Inc. - Common Stock" },
-    { symbol: "ROE", name: "Astoria US Equal Weight Quality Kings ETF" },
-    { symbol: "ROIV", name: "Roivant Sciences Ltd. - Common Shares" },
-    { symbol: "ROKU", name: "Roku, Inc. - Class A Common Stock" },
-    { symbol: "ROMA", name: "Roma Green Finance Limited - Ordinary Shares" },
-    { symbol: "ROOT", name: "Root, Inc. - Common Stock" },
-    { symbol: "ROP", name: "Roper Technologies, Inc. - Common Stock" },
-    { symbol: "ROST", name: "Ross Stores, Inc. - Common Stock" },
-    { symbol: "RPAY", name: "Repay Holdings Corporation - Class A Common Stock" },
-    { symbol: "RPD", name: "Rapid7, Inc. - Common Stock" },
-    { symbol: "RPID", name: "Rapid Micro Biosystems, Inc. - Class A Common Stock" },
-    { symbol: "RPRX", name: "Royalty Pharma plc - Class A Ordinary Shares" },
-    { symbol: "RPTX", name: "Repare Therapeutics Inc. - Common Shares" },
-    { symbol: "RR", name: "Richtech Robotics Inc. - Class B Common Stock" },
-    { symbol: "RRBI", name: "Red River Bancshares, Inc. - Common Stock" },
-    { symbol: "RRGB", name: "Red Robin Gourmet Burgers, Inc. - Common Stock" },
-    { symbol: "RRR", name: "Red Rock Resorts, Inc. - Class A Common Stock" },
-    { symbol: "RSSS", name: "Research Solutions, Inc - Common Stock" },
-    { symbol: "RSVR", name: "Reservoir Media, Inc.. - Common Stock" },
-    { symbol: "RSVRW", name: "Reservoir Media, Inc.. - Warrant" },
-    { symbol: "RTAC", name: "Renatus Tactical Acquisition Corp I - Class A Ordinary Shares" },
-    { symbol: "RTACU", name: "Renatus Tactical Acquisition Corp I - Unit" },
-    { symbol: "RTACW", name: "Renatus Tactical Acquisition Corp I - Warrant" },
-    { symbol: "RTH", name: "VanEck Retail ETF" },
-    { symbol: "RTXG", name: "Leverage Shares 2X Long RTX Daily ETF" },
-    { symbol: "RUBI", name: "Rubico Inc. - Common Stock" },
-    { symbol: "RUM", name: "Rumble Inc. - Class A Common Stock" },
-    { symbol: "RUMBW", name: "Rumble Inc. - Warrant" },
-    { symbol: "RUN", name: "Sunrun Inc. - Common Stock" },
-    { symbol: "RUNN", name: "Running Oak Efficient Growth ETF" },
-    { symbol: "RUSC", name: "US Small Cap Equity Active ETF" },
-    { symbol: "RUSHA", name: "Rush Enterprises, Inc. - Class A Common Stock" },
-    { symbol: "RUSHB", name: "Rush Enterprises, Inc. - Class B Common Stock" },
-    { symbol: "RVMD", name: "Revolution Medicines, Inc. - Common Stock" },
-    { symbol: "RVMDW", name: "Revolution Medicines, Inc. - Warrant" },
-    { symbol: "RVNL", name: "GraniteShares 2x Long RIVN Daily ETF" },
-    { symbol: "RVPH", name: "Reviva Pharmaceuticals Holdings, Inc. - Common Stock" },
-    { symbol: "RVPHW", name: "Reviva Pharmaceuticals Holdings, Inc. - Warrants" },
-    { symbol: "RVSB", name: "Riverview Bancorp Inc - Common Stock" },
-    { symbol: "RVSN", name: "Rail Vision Ltd. - Ordinary Shares" },
-    { symbol: "RVSNW", name: "Rail Vision Ltd. - Warrant" },
-    { symbol: "RVYL", name: "Ryvyl Inc. - Common Stock" },
-    { symbol: "RWAY", name: "Runway Growth Finance Corp. - Common Stock" },
-    { symbol: "RWAYL", name: "Runway Growth Finance Corp. - 7.50% Notes due 2027" },
-    { symbol: "RWAYZ", name: "Runway Growth Finance Corp. - 8.00% Notes due 2027" },
-    { symbol: "RXRX", name: "Recursion Pharmaceuticals, Inc. - Class A Common Stock" },
-    { symbol: "RXST", name: "RxSight, Inc. - Common Stock" },
-    { symbol: "RXT", name: "Rackspace Technology, Inc. - Common Stock" },
-    { symbol: "RYAAY", name: "Ryanair Holdings plc - American Depositary Shares, each representing five Ordinary Shares" },
-    { symbol: "RYET", name: "Ruanyun Edai Technology Inc. - Ordinary shares" },
-    { symbol: "RYM", name: "RYTHM, Inc. - Common Stock" },
-    { symbol: "RYOJ", name: "rYojbaba Co., Ltd. - Common Shares" },
-    { symbol: "RYTM", name: "Rhythm Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "RZLT", name: "Rezolute, Inc. - Common Stock (NV)" },
-    { symbol: "RZLV", name: "Rezolve AI PLC - Ordinary Shares" },
-    { symbol: "RZLVW", name: "Rezolve AI PLC - Warrants" },
-    { symbol: "SABR", name: "Sabre Corporation - Common Stock" },
-    { symbol: "SABS", name: "SAB Biotherapeutics, Inc. - Common Stock" },
-    { symbol: "SABSW", name: "SAB Biotherapeutics, Inc. - Warrant" },
-    { symbol: "SAFT", name: "Safety Insurance Group, Inc. - Common Stock" },
-    { symbol: "SAFX", name: "XCF Global, Inc. - Class A Common Stock" },
-    { symbol: "SAGT", name: "SAGTEC GLOBAL LIMITED - Ordinary shares" },
-    { symbol: "SAIA", name: "Saia, Inc. - Common Stock" },
-    { symbol: "SAIC", name: "Science Applications International Corporation - Common Stock" },
-    { symbol: "SAIH", name: "SAIHEAT Limited - Class A Ordinary Shares" },
-    { symbol: "SAIHW", name: "SAIHEAT Limited - Warrant" },
-    { symbol: "SAIL", name: "SailPoint, Inc. - Common Stock" },
-    { symbol: "SAMG", name: "Silvercrest Asset Management Group Inc. - Common Stock" },
-    { symbol: "SANA", name: "Sana Biotechnology, Inc. - Common Stock" },
-    { symbol: "SANG", name: "Sangoma Technologies Corporation - Common Shares" },
-    { symbol: "SANM", name: "Sanmina Corporation - Common Stock" },
-    { symbol: "SARK", name: "Tradr 1X Short Innovation Daily ETF" },
-    { symbol: "SATL", name: "Satellogic Inc. - Class A Common Stock" },
-    { symbol: "SATLW", name: "Satellogic Inc. - Warrant" },
-    { symbol: "SATS", name: "EchoStar Corporation - Common stock" },
-    { symbol: "SAVA", name: "Cassava Sciences, Inc. - Common Stock" },
-    { symbol: "SBAC", name: "SBA Communications Corporation - Class A Common Stock" },
-    { symbol: "SBC", name: "SBC Medical Group Holdings Incorporated - Common Stock" },
-    { symbol: "SBCF", name: "Seacoast Banking Corporation of Florida - Common Stock" },
-    { symbol: "SBCWW", name: "SBC Medical Group Holdings Incorporated - Warrants" },
-    { symbol: "SBET", name: "SharpLink Gaming, Inc. - Common Stock" },
-    { symbol: "SBFG", name: "SB Financial Group, Inc. - Common Stock" },
-    { symbol: "SBFM", name: "Sunshine Biopharma Inc. - Common stock" },
-    { symbol: "SBFMW", name: "Sunshine Biopharma Inc. - Warrant" },
-    { symbol: "SBGI", name: "Sinclair, Inc. - Class A Common Stock" },
-    { symbol: "SBLK", name: "Star Bulk Carriers Corp. - Common Shares" },
-    { symbol: "SBLX", name: "StableX Technologies, Inc. - Common Stock" },
-    { symbol: "SBRA", name: "Sabra Health Care REIT, Inc. - Common Stock" },
-    { symbol: "SBUX", name: "Starbucks Corporation - Common Stock" },
-    { symbol: "SCAG", name: "Scage Future - American Depositary Shares" },
-    { symbol: "SCAGW", name: "Scage Future - Warrants" },
-    { symbol: "SCDS", name: "JPMorgan Fundamental Data Science Small Core ETF" },
-    { symbol: "SCHL", name: "Scholastic Corporation - Common Stock" },
-    { symbol: "SCKT", name: "Socket Mobile, Inc. - Common Stock" },
-    { symbol: "SCLX", name: "Scilex Holding Company - Common Stock" },
-    { symbol: "SCLXW", name: "Scilex Holding Company - Warrant" },
-    { symbol: "SCNI", name: "Scinai Immunotherapeutics Ltd. - American Depositary Shares" },
-    { symbol: "SCNX", name: "Scienture Holdings, Inc. - Common Stock" },
-    { symbol: "SCOR", name: "comScore, Inc. - Common Stock" },
-    { symbol: "SCPH", name: "scPharmaceuticals Inc. - Common Stock" },
-    { symbol: "SCSC", name: "ScanSource, Inc. - Common Stock" },
-    { symbol: "SCVL", name: "Shoe Carnival, Inc. - Common Stock" },
-    { symbol: "SCWO", name: "374Water Inc. - common stock" },
-    { symbol: "SCYX", name: "SCYNEXIS, Inc. - Common Stock" },
-    { symbol: "SCZ", name: "iShares MSCI EAFE Small-Cap ETF" },
-    { symbol: "SDA", name: "SunCar Technology Group Inc. - Ordinary Shares" },
-    { symbol: "SDAWW", name: "SunCar Technology Group Inc. - Warrant" },
-    { symbol: "SDG", name: "iShares MSCI Global Sustainable Development Goals ETF" },
-    { symbol: "SDGR", name: "Schrodinger, Inc. - Common Stock" },
-    { symbol: "SDHI", name: "Siddhi Acquisition Corp - Class A Common stock" },
-    { symbol: "SDHIR", name: "Siddhi Acquisition Corp - Right" },
-    { symbol: "SDHIU", name: "Siddhi Acquisition Corp - Unit" },
-    { symbol: "SDM", name: "Smart Digital Group Limited - Ordinary Shares" },
-    { symbol: "SDOT", name: "Sadot Group Inc. - Common Stock" },
-    { symbol: "SDSI", name: "American Century Short Duration Strategic Income ETF" },
-    { symbol: "SDST", name: "Stardust Power Inc. - Common Stock" },
-    { symbol: "SDSTW", name: "Stardust Power Inc. - Warrant" },
-    { symbol: "SDTY", name: "YieldMax S&P 500 0DTE Covered Call Strategy ETF" },
-    { symbol: "SDVY", name: "First Trust SMID Cap Rising Dividend Achievers ETF" },
-    { symbol: "SEAT", name: "Vivid Seats Inc. - Class A common stock" },
-    { symbol: "SEATW", name: "Vivid Seats Inc. - Warrant" },
-    { symbol: "SEDG", name: "SolarEdge Technologies, Inc. - Common Stock" },
-    { symbol: "SEED", name: "Origin Agritech Limited - Ordinary Shares" },
-    { symbol: "SEEM", name: "SEI Select Emerging Markets Equity ETF" },
-    { symbol: "SEER", name: "Seer, Inc. - Class A Common Stock" },
-    { symbol: "SEGG", name: "Lottery.com, Inc. - Common Stock" },
-    { symbol: "SEIC", name: "SEI Investments Company - Common Stock" },
-    { symbol: "SEIE", name: "SEI Select International Equity ETF" },
-    { symbol: "SEIS", name: "SEI Select Small Cap ETF" },
-    { symbol: "SELF", name: "Global Self Storage, Inc. - Common Stock" },
-    { symbol: "SELX", name: "Semilux International Ltd. - Ordinary Shares" },
-    { symbol: "SENEA", name: "Seneca Foods Corp. - Class A Common Stock" },
-    { symbol: "SENEB", name: "Seneca Foods Corp. - Class B Common Stock" },
-    { symbol: "SEPN", name: "Septerna, Inc. - Common Stock" },
-    { symbol: "SERA", name: "Sera Prognostics, Inc. - Class A Common Stock" },
-    { symbol: "SERV", name: "Serve Robotics Inc. - Common Stock" },
-    { symbol: "SETM", name: "Sprott Critical Materials ETF" },
-    { symbol: "SEVN", name: "Seven Hills Realty Trust  - Common Stock" },
-    { symbol: "SEZL", name: "Sezzle Inc. - Common Stock" },
-    { symbol: "SFBC", name: "Sound Financial Bancorp, Inc. - Common Stock" },
-    { symbol: "SFD", name: "Smithfield Foods, Inc. - Common Stock" },
-    { symbol: "SFHG", name: "Samfine Creation Holdings Group Limited - Class A Ordinary Share" },
-    { symbol: "SFIX", name: "Stitch Fix, Inc. - Class A Common Stock" },
-    { symbol: "SFLO", name: "VictoryShares Small Cap Free Cash Flow ETF" },
-    { symbol: "SFM", name: "Sprouts Farmers Market, Inc. - Common Stock" },
-    { symbol: "SFNC", name: "Simmons First National Corporation - Common Stock" },
-    { symbol: "SFST", name: "Southern First Bancshares, Inc. - Common Stock" },
-    { symbol: "SFWL", name: "Shengfeng Development Limited - Class A Ordinary Shares" },
-    { symbol: "SGA", name: "Saga Communications, Inc. - Class A Common Stock" },
-    { symbol: "SGBX", name: "Safe & Green Holdings Corp. - Common Stock" },
-    { symbol: "SGC", name: "Superior Group of Companies, Inc. - Common Stock" },
-    { symbol: "SGD", name: "Safe and Green Development Corporation - Common Stock" },
-    { symbol: "SGHT", name: "Sight Sciences, Inc. - Common Stock" },
-    { symbol: "SGLY", name: "Singularity Future Technology Ltd. - Common Stock" },
-    { symbol: "SGML", name: "Sigma Lithium Corporation - common shares" },
-    { symbol: "SGMO", name: "Sangamo Therapeutics, Inc. - Common Stock" },
-    { symbol: "SGMT", name: "Sagimet Biosciences Inc. - Series A Common Stock" },
-    { symbol: "SGRP", name: "SPAR Group, Inc. - Common Stock" },
-    { symbol: "SGRY", name: "Surgery Partners, Inc. - Common Stock" },
-    { symbol: "SHBI", name: "Shore Bancshares, Inc. - Common Stock" },
-    { symbol: "SHC", name: "Sotera Health Company - Common Stock" },
-    { symbol: "SHEN", name: "Shenandoah Telecommunications Co - Common Stock" },
-    { symbol: "SHFS", name: "SHF Holdings, Inc. - Class A Common Stock" },
-    { symbol: "SHFSW", name: "SHF Holdings, Inc. - Warrants" },
-    { symbol: "SHIM", name: "Shimmick Corporation - Common Stock" },
-    { symbol: "SHIP", name: "Seanergy Maritime Holdings Corp. - Common Stock" },
-    { symbol: "SHLS", name: "Shoals Technologies Group, Inc. - Class A Common Stock" },
-    { symbol: "SHMD", name: "SCHMID Group N.V. - Class A Ordinary Shares" },
-    { symbol: "SHMDW", name: "SCHMID Group N.V. - Warrants" },
-    { symbol: "SHOO", name: "Steven Madden, Ltd. - Common Stock" },
-    { symbol: "SHOP", name: "Shopify Inc. - Class A Subordinate Voting Shares" },
-    { symbol: "SHOT", name: "Safety Shot, Inc. - Common Stock" },
-    { symbol: "SHOTW", name: "Safety Shot, Inc. - Warrant" },
-    { symbol: "SHPD", name: "Direxion Daily SHOP Bear 1X ETF" },
-    { symbol: "SHPH", name: "Shuttle Pharmaceuticals Holdings, Inc. - common stock" },
-    { symbol: "SHPU", name: "Direxion Daily SHOP Bull 2X ETF" },
-    { symbol: "SHRY", name: "First Trust Bloomberg Shareholder Yield ETF" },
-    { symbol: "SHV", name: "iShares Short Treasury Bond ETF" },
-    { symbol: "SHY", name: "iShares 1-3 Year Treasury Bond ETF" },
-    { symbol: "SIBN", name: "SI-BONE, Inc. - Common Stock" },
-    { symbol: "SIDU", name: "Sidus Space, Inc. - Class A Common Stock" },
-    { symbol: "SIEB", name: "Siebert Financial Corp. - Common Stock" },
-    { symbol: "SIFY", name: "Sify Technologies Limited - American Depository Shares" },
-    { symbol: "SIGA", name: "SIGA Technologies Inc. - Common Stock" },
-    { symbol: "SIGI", name: "Selective Insurance Group, Inc. - Common Stock" },
-    { symbol: "SIGIP", name: "Selective Insurance Group, Inc. - Depositary Shares, each representing a 1/1,000th interest in a share of 4.60% Non-Cumulative Preferred Stock, Series B" },
-    { symbol: "SILC", name: "Silicom Ltd - Ordinary Shares" },
-    { symbol: "SILO", name: "Silo Pharma, Inc. - Common Stock" },
-    { symbol: "SIMA", name: "SIM Acquisition Corp. I - Class A Ordinary Shares" },
-    { symbol: "SIMAU", name: "SIM Acquisition Corp. I - Unit" },
-    { symbol: "SIMAW", name: "SIM Acquisition Corp. I - Warrant" },
-    { symbol: "SIMO", name: "Silicon Motion Technology Corporation - American Depositary Shares, each representing four ordinary shares" },
-    { symbol: "SINT", name: "SiNtx Technologies, Inc. - Common Stock" },
-    { symbol: "SION", name: "Sionna Therapeutics, Inc. - Common Stock" },
-    { symbol: "SIRI", name: "SiriusXM Holdings Inc. - Common Stock" },
-    { symbol: "SISI", name: "Shineco, Inc. - Common Stock" },
-    { symbol: "SITM", name: "SiTime Corporation - Common Stock" },
-    { symbol: "SIXG", name: "Defiance Connective Technologies ETF" },
-    { symbol: "SJ", name: "Scienjoy Holding Corporation - Class A Ordinary Shares" },
-    { symbol: "SJCP", name: "SanJac Alpha Core Plus Bond ETF" },
-    { symbol: "SJLD", name: "SanJac Alpha Low Duration ETF" },
-    { symbol: "SKBL", name: "Skyline Builders Group Holding Limited - Class A Ordinary Shares" },
-    { symbol: "SKIN", name: "The Beauty Health Company - Class A Common Stock" },
-    { symbol: "SKK", name: "SKK Holdings Limited - Ordinary Shares" },
-    { symbol: "SKOR", name: "FlexShares Credit-Scored US Corporate Bond Index Fund" },
-    { symbol: "SKRE", name: "Tuttle Capital Daily 2X Inverse Regional Banks ETF" },
-    { symbol: "SKWD", name: "Skyward Specialty Insurance Group, Inc. - Common Stock" },
-    { symbol: "SKYE", name: "Skye Bioscience, Inc. - Common Stock" },
-    { symbol: "SKYQ", name: "Sky Quarry Inc. - Common Stock" },
-    { symbol: "SKYT", name: "SkyWater Technology, Inc. - Common Stock" },
-    { symbol: "SKYU", name: "ProShares Ultra Cloud Computing" },
-    { symbol: "SKYW", name: "SkyWest, Inc. - Common Stock" },
-    { symbol: "SKYX", name: "SKYX Platforms Corp. - Common Stock" },
-    { symbol: "SKYY", name: "First Trust Cloud Computing ETF" },
-    { symbol: "SLAB", name: "Silicon Laboratories, Inc. - Common Stock" },
-    { symbol: "SLDB", name: "Solid Biosciences Inc. - Common Stock" },
-    { symbol: "SLDE", name: "Slide Insurance Holdings, Inc. - Common Stock" },
-    { symbol: "SLDP", name: "Solid Power, Inc. - Class A Common Stock" },
-    { symbol: "SLDPW", name: "Solid Power, Inc. - Warrant" },
-    { symbol: "SLE", name: "Super League Enterprise, Inc. - Common Stock" },
-    { symbol: "SLGL", name: "Sol-Gel Technologies Ltd. - Ordinary Shares" },
-    { symbol: "SLM", name: "SLM Corporation - Common Stock" },
-    { symbol: "SLMBP", name: "SLM Corporation - Floating Rate Non-Cumulative Preferred Stock, Series B" },
-    { symbol: "SLN", name: "Silence Therapeutics Plc - American Depository Share" },
-    { symbol: "SLNG", name: "Stabilis Solutions, Inc. - Common Stock" },
-    { symbol: "SLNH", name: "Soluna Holdings, Inc. - Common Stock" },
-    { symbol: "SLNHP", name: "Soluna Holdings, Inc. - 9.0% Series A Cumulative Perpetual Preferred Stock" },
-    { symbol: "SLNO", name: "Soleno Therapeutics, Inc. - Common Stock" },
-    { symbol: "SLP", name: "Simulations Plus, Inc. - Common Stock" },
-    { symbol: "SLQD", name: "iShares 0-5 Year Investment Grade Corporate Bond ETF" },
-    { symbol: "SLRC", name: "SLR Investment Corp. - Closed End Fund" },
-    { symbol: "SLRX", name: "Salarius Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "SLS", name: "SELLAS Life Sciences Group, Inc.  - Common Stock" },
-    { symbol: "SLSN", name: "Solesence, Inc. - Common stock" },
-    { symbol: "SLVO", name: "ETRACS Silver Shares Covered Call ETNs due April 21, 2033" },
-    { symbol: "SLVR", name: "Sprott Silver Miners & Physical Silver ETF" },
-    { symbol: "SLXN", name: "Silexion Therapeutics Corp - Ordinary Shares" },
-    { symbol: "SLXNW", name: "Silexion Therapeutics Corp - Warrant" },
-    { symbol: "SMBC", name: "Southern Missouri Bancorp, Inc. - Common Stock" },
-    { symbol: "SMCC", name: "Defiance Leveraged Long + Income SMCI ETF" },
-    { symbol: "SMCF", name: "Themes US Small Cap Cash Flow Champions ETF" },
-    { symbol: "SMCI", name: "Super Micro Computer, Inc. - Common Stock" },
-    { symbol: "SMCL", name: "GraniteShares 2x Long SMCI Daily ETF" },
-    { symbol: "SMCO", name: "Hilton Small-MidCap Opportunity ETF" },
-    { symbol: "SMCX", name: "Defiance Daily Target 2X Long SMCI ETF" },
-    { symbol: "SMCZ", name: "Defiance Daily Target 2X Short SMCI ETF" },
-    { symbol: "SMH", name: "VanEck Semiconductor ETF" },
-    { symbol: "SMHX", name: "VanEck Fabless Semiconductor ETF" },
-    { symbol: "SMID", name: "Smith-Midland Corporation - Common Stock" },
-    { symbol: "SMLR", name: "Semler Scientific, Inc. - Common Stock" },
-    { symbol: "SMMT", name: "Summit Therapeutics Inc.  - Common Stock" },
-    { symbol: "SMPL", name: "The Simply Good Foods Company - Common Stock" },
-    { symbol: "SMRI", name: "Bushido Capital US Equity ETF" },
-    { symbol: "SMSI", name: "Smith Micro Software, Inc. - Common Stock" },
-    { symbol: "SMST", name: "Defiance Daily Target 2x Short MSTR ETF" },
-    { symbol: "SMTC", name: "Semtech Corporation - Common Stock" },
-    { symbol: "SMTI", name: "Sanara MedTech Inc. - Common Stock" },
-    { symbol: "SMTK", name: "SmartKem, Inc. - Common Stock" },
-    { symbol: "SMX", name: "SMX (Security Matters) Public Limited Company - Class A Ordinary Shares" },
-    { symbol: "SMXT", name: "Solarmax Technology Inc. - Common Stock" },
-    { symbol: "SMXWW", name: "SMX (Security Matters) Public Limited Company - Warrant" },
-    { symbol: "SNAL", name: "Snail, Inc. - Class A Common Stock" },
-    { symbol: "SNBR", name: "Sleep Number Corporation - Common Stock" },
-    { symbol: "SNCR", name: "Synchronoss Technologies, Inc. - Common Stock" },
-    { symbol: "SNCY", name: "Sun Country Airlines Holdings, Inc. - Common Stock" },
-    { symbol: "SND", name: "Smart Sand, Inc. - Common Stock" },
-    { symbol: "SNDK", name: "Sandisk Corporation - Common Stock" },
-    { symbol: "SNDL", name: "SNDL Inc. - Common Shares" },
-    { symbol: "SNDX", name: "Syndax Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "SNES", name: "SenesTech, Inc. - Common Stock" },
-    { symbol: "SNEX", name: "StoneX Group Inc. - Common Stock" },
-    { symbol: "SNFCA", name: "Security National Financial Corporation - Class A Common Stock" },
-    { symbol: "SNGX", name: "Soligenix, Inc. - Common Stock" },
-    { symbol: "SNOA", name: "Sonoma Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "SNPS", name: "Synopsys, Inc. - Common Stock" },
-    { symbol: "SNSE", name: "Sensei Biotherapeutics, Inc. - Common Stock" },
-    { symbol: "SNSR", name: "Global X Internet of Things ETF" },
-    { symbol: "SNT", name: "Senstar Technologies Corporation - Common Shares" },
-    { symbol: "SNTG", name: "Sentage Holdings Inc. - Class A Ordinary Shares" },
-    { symbol: "SNTI", name: "Senti Biosciences, Inc.  - Common Stock" },
-    { symbol: "SNWV", name: "SANUWAVE Health, Inc. - Common Stock" },
-    { symbol: "SNY", name: "Sanofi - American Depositary Shares" },
-    { symbol: "SNYR", name: "Synergy CHC Corp. - Common Stock" },
-    { symbol: "SOBR", name: "SOBR Safe, Inc. - Common Stock" },
-    { symbol: "SOCA", name: "Solarius Capital Acquisition Corp. - Class A Ordinary Share" },
-    { symbol: "SOCAU", name: "Solarius Capital Acquisition Corp. - Units" },
-    { symbol: "SOCAW", name: "Solarius Capital Acquisition Corp. - Warrant" },
-    { symbol: "SOCL", name: "Global X Social Media ETF" },
-    { symbol: "SOFI", name: "SoFi Technologies, Inc.  - Common Stock" },
-    { symbol: "SOFX", name: "Defiance Daily Target 2X Long SOFI ETF" },
-    { symbol: "SOGP", name: "Sound Group Inc. - American Depositary Shares" },
-    { symbol: "SOHO", name: "Sotherly Hotels Inc. - Common Stock" },
-    { symbol: "SOHOB", name: "Sotherly Hotels Inc. - 8.0% Series B Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "SOHON", name: "Sotherly Hotels Inc. - 8.25% Series D Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "SOHOO", name: "Sotherly Hotels Inc. - 7.875% Series C Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "SOHU", name: "Sohu.com Limited  - American Depositary Shares" },
-    { symbol: "SOLT", name: "2x Solana ETF" },
-    { symbol: "SOLZ", name: "Solana ETF" },
-    { symbol: "SOND", name: "Sonder Holdings Inc. - Class A Common Stock" },
-    { symbol: "SONDW", name: "Sonder Holdings Inc. - Warrants" },
-    { symbol: "SONM", name: "Sonim Technologies, Inc. - Common Stock" },
-    { symbol: "SONN", name: "Sonnet BioTherapeutics Holdings, Inc. - Common Stock" },
-    { symbol: "SONO", name: "Sonos, Inc. - Common Stock" },
-    { symbol: "SOPA", name: "Society Pass Incorporated - Common Stock" },
-    { symbol: "SOPH", name: "SOPHiA GENETICS SA - Ordinary Shares" },
-    { symbol: "SORA", name: "AsiaStrategy - Ordinary Shares" },
-    { symbol: "SOTK", name: "Sono-Tek Corporation - Common Stock" },
-    { symbol: "SOUN", name: "SoundHound AI, Inc. - Class A Common Stock" },
-    { symbol: "SOUNW", name: "SoundHound AI, Inc. - Warrant" },
-    { symbol: "SOUX", name: "Defiance Daily Target 2X Long SOUN ETF" },
-    { symbol: "SOWG", name: "Sow Good Inc. - Common Stock" },
-    { symbol: "SOXQ", name: "Invesco PHLX Semiconductor ETF" },
-    { symbol: "SOXX", name: "iShares Semiconductor ETF" },
-    { symbol: "SPAI", name: "Safe Pro Group Inc. - Common Stock" },
-    { symbol: "SPAM", name: "Themes Cybersecurity ETF" },
-    { symbol: "SPAQ", name: "Horizon Kinetics SPAC Active ETF" },
-    { symbol: "SPBC", name: "Simplify US Equity PLUS Bitcoin Strategy ETF" },
-    { symbol: "SPC", name: "CrossingBridge Pre-Merger SPAC ETF" },
-    { symbol: "SPCB", name: "SuperCom, Ltd. - Ordinary Shares" },
-    { symbol: "SPCX", name: "SPAC and New Issue ETF" },
-    { symbol: "SPCY", name: "STKd 100% SMCI & 100% NVDA ETF" },
-    { symbol: "SPEG", name: "Silver Pegasus Acquisition Corp - Class A Ordinary Shares" },
-    { symbol: "SPEGR", name: "Silver Pegasus Acquisition Corp - Rights" },
-    { symbol: "SPEGU", name: "Silver Pegasus Acquisition Corp - Unit" },
-    { symbol: "SPFI", name: "South Plains Financial, Inc. - Common Stock" },
-    { symbol: "SPHL", name: "Springview Holdings Ltd - Ordinary shares" },
-    { symbol: "SPKL", name: "Spark I Acquisition Corp. - Class A Ordinary Share" },
-    { symbol: "SPKLU", name: "Spark I Acquisition Corp. - Unit" },
-    { symbol: "SPKLW", name: "Spark I Acquisition Corp. - Warrant" },
-    { symbol: "SPNS", name: "Sapiens International Corporation N.V. - Common Shares" },
-    { symbol: "SPOK", name: "Spok Holdings, Inc. - Common Stock" },
-    { symbol: "SPPL", name: "SIMPPLE LTD. - Ordinary Shares" },
-    { symbol: "SPRC", name: "SciSparc Ltd. - Ordinary Shares" },
-    { symbol: "SPRO", name: "Spero Therapeutics, Inc. - Common Stock" },
-    { symbol: "SPRX", name: "Spear Alpha ETF" },
-    { symbol: "SPRY", name: "ARS Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "SPSC", name: "SPS Commerce, Inc. - Common Stock" },
-    { symbol: "SPT", name: "Sprout Social, Inc - Class A Common Stock" },
-    { symbol: "SPTN", name: "SpartanNash Company - Common Stock" },
-    { symbol: "SPWH", name: "Sportsman's Warehouse Holdings, Inc. - Common Stock" },
-    { symbol: "SPWR", name: "Complete Solaria, Inc. - Common Stock" },
-    { symbol: "SPWRW", name: "Complete Solaria, Inc. - Warrant" },
-    { symbol: "SPXD", name: "Xtrackers S&P 500 Diversified Sector Weight ETF" },
-    { symbol: "SPYQ", name: "Tradr 2X Long SPY Quarterly ETF" },
-    { symbol: "SQFT", name: "Presidio Property Trust, Inc. - Class A Common Stock" },
-    { symbol: "SQFTP", name: "Presidio Property Trust, Inc. - 9.375% Series D Cumulative Redeemable Perpetual Preferred Stock, $0.01 par value per share" },
-    { symbol: "SQFTW", name: "Presidio Property Trust, Inc. - Series A Common Stock Purchase Warrants" },
-    { symbol: "SQLV", name: "Royce Quant Small-Cap Quality Value ETF" },
-    { symbol: "SQQQ", name: "ProShares UltraPro Short QQQ" },
-    { symbol: "SRAD", name: "Sportradar Group AG - Class A Ordinary Shares" },
-    { symbol: "SRBK", name: "SR Bancorp, Inc. - Common stock" },
-    { symbol: "SRCE", name: "1st Source Corporation - Common Stock" },
-    { symbol: "SRDX", name: "Surmodics, Inc. - Common Stock" },
-    { symbol: "SRET", name: "Global X SuperDividend REIT ETF" },
-    { symbol: "SRPT", name: "Sarepta Therapeutics, Inc. - Common Stock" },
-    { symbol: "SRRK", name: "Scholar Rock Holding Corporation - Common Stock" },
-    { symbol: "SRTA", name: "Strata Critical Medical, Inc. - Class A Common Stock" },
-    { symbol: "SRTAW", name: "Strata Critical Medical, Inc. - Warrants" },
-    { symbol: "SRTS", name: "Sensus Healthcare, Inc. - Common Stock" },
-    { symbol: "SRZN", name: "Surrozen, Inc. - Common Stock" },
-    { symbol: "SRZNW", name: "Surrozen, Inc. - Warrant" },
-    { symbol: "SSBI", name: "Summit State Bank - Common Stock" },
-    { symbol: "SSEAU", name: "Starry Sea Acquisition Corp - Unit" },
-    { symbol: "SSII", name: "SS Innovations International Inc. - Common Stock" },
-    { symbol: "SSKN", name: "Strata Skin Sciences, Inc. - Common Stock" },
-    { symbol: "SSM", name: "Sono Group N.V. - Ordinary Shares" },
-    { symbol: "SSNC", name: "SS&C Technologies Holdings, Inc. - Common Stock" },
-    { symbol: "SSP", name: "E.W. Scripps Company (The) - Class A Common Stock" },
-    { symbol: "SSRM", name: "SSR Mining Inc. - Common Stock" },
-    { symbol: "SSSS", name: "SuRo Capital Corp. - Closed End Fund" },
-    { symbol: "SSSSL", name: "SuRo Capital Corp. - 6.00% Notes due 2026" },
-    { symbol: "SSTI", name: "SoundThinking, Inc. - Common Stock" },
-    { symbol: "SSYS", name: "Stratasys, Ltd. - Common Stock" },
-    { symbol: "STAA", name: "STAAR Surgical Company - Common Stock" },
-    { symbol: "STAI", name: "ScanTech AI Systems Inc. - Common stock" },
-    { symbol: "STAK", name: "STAK Inc. - Class A Ordinary Shares" },
-    { symbol: "STBA", name: "S&T Bancorp, Inc. - Common Stock" },
-    { symbol: "STEC", name: "Santech Holdings Limited - American Depositary Shares" },
-    { symbol: "STEP", name: "StepStone Group Inc. - Class A Common Stock" },
-    { symbol: "STFS", name: "Star Fashion Culture Holdings Limited - Class A Ordinary Shares" },
-    { symbol: "STGW", name: "Stagwell Inc. - Class A Common Stock" },
-    { symbol: "STHO", name: "Star Holdings - Shares of Beneficial Interest" },
-    { symbol: "STI", name: "Solidion Technology, Inc. - Common Stock" },
-    { symbol: "STIM", name: "Neuronetics, Inc. - Common Stock" },
-    { symbol: "STKE", name: "Sol Strategies Inc. - Common Shares" },
-    { symbol: "STKH", name: "Steakholder Foods Ltd. - American Depositary Shares" },
-    { symbol: "STKL", name: "SunOpta, Inc. - Common Stock" },
-    { symbol: "STKS", name: "The ONE Group Hospitality, Inc. - Common Stock" },
-    { symbol: "STLD", name: "Steel Dynamics, Inc. - Common Stock" },
-    { symbol: "STNC", name: "Hennessy Sustainable ETF" },
-    { symbol: "STNE", name: "StoneCo Ltd. - Class A Common Share" },
-    { symbol: "STOK", name: "Stoke Therapeutics, Inc. - Common Stock" },
-    { symbol: "STRA", name: "Strategic Education, Inc. - Common Stock" },
-    { symbol: "STRC", name: "Strategy Inc - Variable Rate Series A Perpetual Stretch Preferred Stock" },
-    { symbol: "STRD", name: "Strategy Inc - 10.00% Series A Perpetual Stride Preferred Stock" },
-    { symbol: "STRF", name: "Strategy Inc - 10.00% Series A Perpetual Strife Preferred Stock" },
-    { symbol: "STRK", name: "Strategy Inc - 8.00% Series A Perpetual Strike Preferred Stock" },
-    { symbol: "STRL", name: "Sterling Infrastructure, Inc. - Common Stock" },
-    { symbol: "STRO", name: "Sutro Biopharma, Inc. - Common Stock" },
-    { symbol: "STRR", name: "Star Equity Holdings, Inc. - Common Stock" },
-    { symbol: "STRRP", name: "Star Equity Holdings, Inc. - 10% Series A Cumulative Perpetual Preferred Stock" },
-    { symbol: "STRS", name: "Stratus Properties Inc. - Common Stock" },
-    { symbol: "STRT", name: "STRATTEC SECURITY CORPORATION - Common Stock" },
-    { symbol: "STRZ", name: "Starz Entertainment Corp. - Common Shares" },
-    { symbol: "STSS", name: "Sharps Technology Inc. - Common Stock" },
-    { symbol: "STSSW", name: "Sharps Technology Inc. - Warrant" },
-    { symbol: "STTK", name: "Shattuck Labs, Inc. - Common Stock" },
-    { symbol: "STX", name: "Seagate Technology Holdings PLC - Ordinary Shares (Ireland)" },
-    { symbol: "SUGP", name: "SU Group Holdings Limited - Ordinary Shares" },
-    { symbol: "SUIG", name: "Sui Group Holdings Limited - Common Stock" },
-    { symbol: "SUNE", name: "SUNation Energy, Inc. - Common Stock" },
-    { symbol: "SUNS", name: "Sunrise Realty Trust, Inc. - Common Stock" },
-    { symbol: "SUPN", name: "Supernus Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "SUPP", name: "TCW Transform Supply Chain ETF" },
-    { symbol: "SUPX", name: "Super X AI Technology Limited - Ordinary Shares" },
-    { symbol: "SURG", name: "SurgePays, Inc. - Common Stock" },
-    { symbol: "SUSB", name: "iShares ESG Aware 1-5 Year USD Corporate Bond ETF" },
-    { symbol: "SUSC", name: "iShares ESG Aware USD Corporate Bond ETF" },
-    { symbol: "SUSL", name: "iShares ESG MSCI USA Leaders ETF" },
-    { symbol: "SUUN", name: "PowerBank Corporation - Common Stock" },
-    { symbol: "SVA", name: "Sinovac Biotech, Ltd. - Ordinary Shares (Antigua/Barbudo)" },
-    { symbol: "SVACU", name: "Spring Valley Acquisition Corp. III - Unit" },
-    { symbol: "SVC", name: "Service Properties Trust - Shares of Beneficial Interest" },
-    { symbol: "SVCC", name: "Stellar V Capital Corp. - Class A Ordinary Shares" },
-    { symbol: "SVCCU", name: "Stellar V Capital Corp. - Unit" },
-    { symbol: "SVCCW", name: "Stellar V Capital Corp. - Warrant" },
-    { symbol: "SVCO", name: "Silvaco Group, Inc. - Common Stock" },
-    { symbol: "SVII", name: "Spring Valley Acquisition Corp. II - Class A Ordinary Shares" },
-    { symbol: "SVIIR", name: "Spring Valley Acquisition Corp. II - Rights" },
-    { symbol: "SVIIU", name: "Spring Valley Acquisition Corp. II - Units" },
-    { symbol: "SVIIW", name: "Spring Valley Acquisition Corp. II - Warrant" },
-    { symbol: "SVRA", name: "Savara, Inc. - Common Stock" },
-    { symbol: "SVRE", name: "SaverOne 2014 Ltd. - American Depositary Shares" },
-    { symbol: "SVREW", name: "SaverOne 2014 Ltd. - Warrant" },
-    { symbol: "SWAG", name: "Stran & Company, Inc. - Common Stock" },
-    { symbol: "SWAGW", name: "Stran & Company, Inc. - Warrant" },
-    { symbol: "SWBI", name: "Smith & Wesson Brands, Inc. - Common Stock" },
-    { symbol: "SWIM", name: "Latham Group, Inc. - Common Stock" },
-    { symbol: "SWIN", name: "Solowin Holdings - Class A Ordinary Share" },
-    { symbol: "SWKH", name: "SWK Holdings Corporation - Common Stock" },
-    { symbol: "SWKHL", name: "SWK Holdings Corporation - 9.00% Senior Notes due 2027" },
-    { symbol: "SWKS", name: "Skyworks Solutions, Inc. - Common Stock" },
-    { symbol: "SWP", name: "SWP Growth & Income ETF" },
-    { symbol: "SWVL", name: "Swvl Holdings Corp - Ordinary Shares" },
-    { symbol: "SWVLW", name: "Swvl Holdings Corp - Warrant" },
-    { symbol: "SXTC", name: "China SXT Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "SXTP", name: "60 Degrees Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "SXTPW", name: "60 Degrees Pharmaceuticals, Inc. - Warrant" },
-    { symbol: "SY", name: "So-Young International Inc. - American Depository Shares" },
-    { symbol: "SYBT", name: "Stock Yards Bancorp, Inc. - Common Stock" },
-    { symbol: "SYBX", name: "Synlogic, Inc. - Common Stock" },
-    { symbol: "SYM", name: "Symbotic Inc. - Class A Common Stock" },
-    { symbol: "SYNA", name: "Synaptics Incorporated - Common Stock" },
-    { symbol: "SYPR", name: "Sypris Solutions, Inc. - Common Stock" },
-    { symbol: "SYRE", name: "Spyre Therapeutics, Inc. - Common Stock" },
-    { symbol: "SYTA", name: "Siyata Mobile, Inc. - Common Shares" },
-    { symbol: "SYTAW", name: "Siyata Mobile, Inc. - Warrant" },
-    { symbol: "SZZL", name: "Sizzle Acquisition Corp. II - Class A ordinary shares" },
-    { symbol: "SZZLR", name: "Sizzle Acquisition Corp. II - Right" },
-    { symbol: "SZZLU", name: "Sizzle Acquisition Corp. II - Unit" },
-    { symbol: "TACH", name: "Titan Acquisition Corp. - Class A Ordinary Shares" },
-    { symbol: "TACHU", name: "Titan Acquisition Corp. - Units" },
-    { symbol: "TACHW", name: "Titan Acquisition Corp. - Warrants" },
-    { symbol: "TACO", name: "Berto Acquisition Corp. - Ordinary Shares" },
-    { symbol: "TACOU", name: "Berto Acquisition Corp. - unit" },
-    { symbol: "TACOW", name: "Berto Acquisition Corp. - Warrant" },
-    { symbol: "TACT", name: "TransAct Technologies Incorporated - Common Stock" },
-    { symbol: "TAIT", name: "Taitron Components Incorporated - Class A Common Stock" },
-    { symbol: "TALK", name: "Talkspace, Inc. - Common Stock" },
-    { symbol: "TALKW", name: "Talkspace, Inc. - Warrant" },
-    { symbol: "TANH", name: "Tantech Holdings Ltd. - Common Shares" },
-    { symbol: "TAOP", name: "Taoping Inc. - Ordinary Shares" },
-    { symbol: "TAOX", name: "Tao Synergies Inc. - Common Stock" },
-    { symbol: "TARA", name: "Protara Therapeutics, Inc.  - Common Stock" },
-    { symbol: "TARK", name: "Tradr 2X Long Innovation ETF" },
-    { symbol: "TARS", name: "Tarsus Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "TASK", name: "TaskUs, Inc. - Class A Common Stock" },
-    { symbol: "TATT", name: "TAT Technologies Ltd. - Ordinary Shares" },
-    { symbol: "TAVI", name: "Tavia Acquisition Corp. - Ordinary Shares" },
-    { symbol: "TAVIR", name: "Tavia Acquisition Corp. - Right" },
-    { symbol: "TAVIU", name: "Tavia Acquisition Corp. - Unit" },
-    { symbol: "TAX", name: "Cambria Tax Aware ETF" },
-    { symbol: "TAXE", name: "Intermediate Municipal Income ETF" },
-    { symbol: "TAXI", name: "Northern Trust Intermediate Tax-Exempt Bond ETF" },
-    { symbol: "TAXS", name: "Northern Trust Short-Term Tax-Exempt Bond ETF" },
-    { symbol: "TAXT", name: "Northern Trust Tax-Exempt Bond ETF" },
-    { symbol: "TAYD", name: "Taylor Devices, Inc. - Common Stock" },
-    { symbol: "TBBK", name: "The Bancorp, Inc. - Common Stock" },
-    { symbol: "TBCH", name: "Turtle Beach Corporation - Common Stock" },
-    { symbol: "TBH", name: "Brag House Holdings, Inc. - Common Stock" },
-    { symbol: "TBHC", name: "The Brand House Collective, Inc - Common Stock" },
-    { symbol: "TBIL", name: "US Treasury 3 Month Bill ETF" },
-    { symbol: "TBLA", name: "Taboola.com Ltd. - Ordinary Shares" },
-    { symbol: "TBLAW", name: "Taboola.com Ltd. - Warrant" },
-    { symbol: "TBLD", name: "Thornburg Income Builder Opportunities Trust - Closed End Fund" },
-    { symbol: "TBMC", name: "Trailblazer Merger Corporation I - Class A Common Stock" },
-    { symbol: "TBMCR", name: "Trailblazer Merger Corporation I - Rights" },
-    { symbol: "TBPH", name: "Theravance Biopharma, Inc. - Ordinary Shares" },
-    { symbol: "TBRG", name: "TruBridge, Inc. - Common Stock" },
-    { symbol: "TC", name: "Token Cat Limited - American Depositary Shares" },
-    { symbol: "TCBI", name: "Texas Capital Bancshares, Inc. - Common Stock" },
-    { symbol: "TCBIO", name: "Texas Capital Bancshares, Inc. - Depositary Shares 5.75% Fixed Rate Non-Cumulative Perpetual Preferred Stock Series B" },
-    { symbol: "TCBK", name: "TriCo Bancshares - Common Stock" },
-    { symbol: "TCBS", name: "Texas Community Bancshares, Inc. - Common Stock" },
-    { symbol: "TCBX", name: "Third Coast Bancshares, Inc. - Common Stock" },
-    { symbol: "TCHI", name: "iShares MSCI China Multisector Tech ETF" },
-    { symbol: "TCMD", name: "Tactile Systems Technology, Inc. - Common Stock" },
-    { symbol: "TCOM", name: "Trip.com Group Limited - American Depositary Shares" },
-    { symbol: "TCPC", name: "BlackRock TCP Capital Corp. - Closed End Fund" },
-    { symbol: "TCRT", name: "Alaunos Therapeutics, Inc. - Common Stock" },
-    { symbol: "TCRX", name: "TScan Therapeutics, Inc. - Common Stock" },
-    { symbol: "TCX", name: "Tucows Inc. - Common Stock" },
-    { symbol: "TDAC", name: "Translational Development Acquisition Corp. - Ordinary Shares" },
-    { symbol: "TDACU", name: "Translational Development Acquisition Corp. - Units" },
-    { symbol: "TDACW", name: "Translational Development Acquisition Corp. - Warrants" },
-    { symbol: "TDI", name: "Touchstone Dynamic International ETF" },
-    { symbol: "TDIC", name: "Dreamland Limited - Class A Ordinary Shares" },
-    { symbol: "TDIV", name: "First Trust NASDAQ Technology Dividend Index Fund" },
-    { symbol: "TDSB", name: "ETC Cabana Target Beta ETF" },
-    { symbol: "TDSC", name: "ETC Cabana Target Drawdown 10 ETF" },
-    { symbol: "TDTH", name: "Trident Digital Tech Holdings Ltd - American Depository Shares" },
-    { symbol: "TDUP", name: "ThredUp Inc. - Class A Common Stock" },
-    { symbol: "TEAD", name: "Teads Holding Co. - Common Stock" },
-    { symbol: "TEAM", name: "Atlassian Corporation  - Class A Common Stock" },
-    { symbol: "TECH", name: "Bio-Techne Corp - Common Stock" },
-    { symbol: "TECTP", name: "Tectonic Financial, Inc. - 9.00% Fixed-to-Floating Rate Series B Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "TECX", name: "Tectonic Therapeutic, Inc. - Common Stock" },
-    { symbol: "TEKX", name: "SPDR Galaxy Transformative Tech Accelerators ETF" },
-    { symbol: "TEKY", name: "Lazard Next Gen Technologies ETF" },
-    { symbol: "TELA", name: "TELA Bio, Inc. - Common stock" },
-    { symbol: "TELO", name: "Telomir Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "TEM", name: "Tempus AI, Inc. - Class A Common Stock" },
-    { symbol: "TENB", name: "Tenable Holdings, Inc. - Common Stock" },
-    { symbol: "TENX", name: "Tenax Therapeutics, Inc. - Common Stock" },
-    { symbol: "TER", name: "Teradyne, Inc. - Common Stock" },
-    { symbol: "TERN", name: "Terns Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "TEXN", name: "iShares Texas Equity ETF" },
-    { symbol: "TFNS", name: "T. Rowe Price Financials ETF" },
-    { symbol: "TFSL", name: "TFS Financial Corporation - Common Stock" },
-    { symbol: "TGHL", name: "The GrowHub Limited - Class A Ordinary Shares" },
-    { symbol: "TGL", name: "Treasure Global Inc. - Common Stock" },
-    { symbol: "TGTX", name: "TG Therapeutics, Inc. - Common Stock" },
-    { symbol: "TH", name: "Target Hospitality Corp. - Common Stock" },
-    { symbol: "THAR", name: "Tharimmune, Inc. - Common Stock" },
-    { symbol: "THCH", name: "TH International Limited - Ordinary shares" },
-    { symbol: "THFF", name: "First Financial Corporation  - Common Stock" },
-    { symbol: "THH", name: "TryHard Holdings Limited - Ordinary Shares" },
-    { symbol: "THMZ", name: "Lazard Equity Megatrends ETF" },
-    { symbol: "THRM", name: "Gentherm Inc - Common Stock" },
-    { symbol: "THRY", name: "Thryv Holdings, Inc. - Common Stock" },
-    { symbol: "THTX", name: "Theratechnologies Inc. - Common Shares" },
-    { symbol: "TIGO", name: "Millicom International Cellular S.A. - Common Stock" },
-    { symbol: "TIGR", name: "UP Fintech Holding Limited - American Depositary Shares representing fifteen Class A Ordinary Shares" },
-    { symbol: "TIL", name: "Instil Bio, Inc. - Common Stock" },
-    { symbol: "TILE", name: "Interface, Inc. - Common Stock" },
-    { symbol: "TIPT", name: "Tiptree Inc. - Common Stock" },
-    { symbol: "TIRX", name: "TIAN RUIXIANG Holdings Ltd - Class A Ordinary Shares" },
-    { symbol: "TITN", name: "Titan Machinery Inc. - Common Stock" },
-    { symbol: "TIVC", name: "Tivic Health Systems, Inc. - Common stock" },
-    { symbol: "TKLF", name: "Tokyo Lifestyle Co., Ltd. - American Depositary Shares" },
-    { symbol: "TKNO", name: "Alpha Teknova, Inc. - Common Stock" },
-    { symbol: "TLF", name: "Tandy Leather Factory, Inc. - common stock" },
-    { symbol: "TLIH", name: "Ten-League International Holdings Limited - Ordinary Shares" },
-    { symbol: "TLN", name: "Talen Energy Corporation - Common Stock" },
-    { symbol: "TLNCU", name: "Talon Capital Corp. - Units" },
-    { symbol: "TLPH", name: "Talphera, Inc. - Common Stock" },
-    { symbol: "TLRY", name: "Tilray Brands, Inc. - Common Stock" },
-    { symbol: "TLS", name: "Telos Corporation - Common Stock" },
-    { symbol: "TLSA", name: "Tiziana Life Sciences Ltd - Common Shares" },
-    { symbol: "TLSI", name: "TriSalus Life Sciences, Inc. - Common Stock" },
-    { symbol: "TLSIW", name: "TriSalus Life Sciences, Inc. - Warrant" },
-    { symbol: "TLT", name: "iShares 20+ Year Treasury Bond ETF" },
-    { symbol: "TLX", name: "Telix Pharmaceuticals Limited - American Depositary Shares" },
-    { symbol: "TMB", name: "Thornburg Multi Sector Bond ETF" },
-    { symbol: "TMC", name: "TMC the metals company Inc. - Common Stock" },
-    { symbol: "TMCI", name: "Treace Medical Concepts, Inc. - Common Stock" },
-    { symbol: "TMCWW", name: "TMC the metals company Inc. - Warrant" },
-    { symbol: "TMDX", name: "TransMedics Group, Inc. - Common Stock" },
-    { symbol: "TMED", name: "T. Rowe Price Health Care ETF" },
-    { symbol: "TMET", name: "iShares Transition-Enabling Metals ETF" },
-    { symbol: "TMUS", name: "T-Mobile US, Inc. - Common Stock" },
-    { symbol: "TMUSI", name: "T-Mobile US, Inc. - 5.500% Senior Notes due June 2070" },
-    { symbol: "TMUSL", name: "T-Mobile US, Inc. - 6.250% Senior Notes due 2069" },
-    { symbol: "TMUSZ", name: "T-Mobile US, Inc. - 5.500% Senior Notes due March 2070" },
-    { symbol: "TNDM", name: "Tandem Diabetes Care, Inc. - Common Stock" },
-    { symbol: "TNFA", name: "TNF Pharmaceuticals, Inc.  - Common Stock" },
-    { symbol: "TNGX", name: "Tango Therapeutics, Inc. - Common Stock" },
-    { symbol: "TNMG", name: "TNL Mediagene - Ordinary Shares" },
-    { symbol: "TNON", name: "Tenon Medical, Inc. - Common Stock" },
-    { symbol: "TNONW", name: "Tenon Medical, Inc. - Warrant" },
-    { symbol: "TNXP", name: "Tonix Pharmaceuticals Holding Corp. - Common Stock" },
-    { symbol: "TNYA", name: "Tenaya Therapeutics, Inc. - Common Stock" },
-    { symbol: "TOI", name: "The Oncology Institute, Inc. - Common Stock" },
-    { symbol: "TOIIW", name: "The Oncology Institute, Inc. - Warrant" },
-    { symbol: "TOMZ", name: "TOMI Environmental Solutions, Inc. - Common Stock" },
-    { symbol: "TONX", name: "TON Strategy Company - Common Stock" },
-    { symbol: "TOP", name: "TOP Financial Group Limited - Class A Ordinary Shares" },
-    { symbol: "TORO", name: "Toro Corp. - Common stock" },
-    { symbol: "TOUR", name: "Tuniu Corporation - American Depositary Shares" },
-    { symbol: "TOWN", name: "Towne Bank - Common Stock" },
-    { symbol: "TOYO", name: "TOYO Co., Ltd - Ordinary Shares" },
-    { symbol: "TPCS", name: "TechPrecision Corporation - Common stock" },
-    { symbol: "TPG", name: "TPG Inc. - Class A Common Stock" },
-    { symbol: "TPGXL", name: "TPG Inc. - 6.950% Fixed-Rate Junior Subordinated Notes due 2064" },
-    { symbol: "TPLS", name: "Thornburg Core Plus Bond ETF" },
-    { symbol: "TPST", name: "Tempest Therapeutics, Inc. - Common Stock" },
-    { symbol: "TQQQ", name: "ProShares UltraPro QQQ" },
-    { symbol: "TQQY", name: "GraniteShares YieldBOOST QQQ ETF" },
-    { symbol: "TRAW", name: "Traws Pharma, Inc. - Common Stock" },
-    { symbol: "TRDA", name: "Entrada Therapeutics, Inc. - Common Stock" },
-    { symbol: "TREE", name: "LendingTree, Inc. - Common Stock" },
-    { symbol: "TRI", name: "Thomson Reuters Corp - Common Shares" },
-    { symbol: "TRIB", name: "Trinity Biotech plc - American Depositary Shares" },
-    { symbol: "TRIN", name: "Trinity Capital Inc. - Common Stock" },
-    { symbol: "TRINI", name: "Trinity Capital Inc. - 7.875% Notes Due 2029" },
-    { symbol: "TRINZ", name: "Trinity Capital Inc. - 7.875% Notes due 2029" },
-    { symbol: "TRIP", name: "TripAdvisor, Inc. - Common Stock" },
-    { symbol: "TRMB", name: "Trimble Inc. - Common Stock" },
-    { symbol: "TRMD", name: "TORM plc - Class A Common Stock" },
-    { symbol: "TRMK", name: "Trustmark Corporation - Common Stock" },
-    { symbol: "TRML", name: "Tourmaline Bio, Inc.  - Common Stock" },
-    { symbol: "TRNR", name: "Interactive Strength Inc. - Common Stock" },
-    { symbol: "TRNS", name: "Transcat, Inc. - Common Stock" },
-    { symbol: "TRON", name: "Tron Inc. - Common Stock" },
-    { symbol: "TROO", name: "TROOPS, Inc.  - Ordinary Shares" },
-    { symbol: "TROW", name: "T. Rowe Price Group, Inc. - Common Stock" },
-    { symbol: "TRS", name: "TriMas Corporation - Common Stock" },
-    { symbol: "TRSG", name: "Tungray Technologies Inc - Class A Ordinary Shares" },
-    { symbol: "TRST", name: "TrustCo Bank Corp NY - Common Stock" },
-    { symbol: "TRUD", name: "VanEck Consumer Discretionary TruSector ETF" },
-    { symbol: "TRUE", name: "TrueCar, Inc. - Common Stock" },
-    { symbol: "TRUG", name: "TruGolf Holdings, Inc. - Class A Common Stock" },
-    { symbol: "TRUP", name: "Trupanion, Inc. - Common Stock" },
-    { symbol: "TRUT", name: "VanEck Technology TruSector ETF" },
-    { symbol: "TRVG", name: "trivago N.V. - American Depositary Shares" },
-    { symbol: "TRVI", name: "Trevi Therapeutics, Inc. - Common Stock" },
-    { symbol: "TSAT", name: "Telesat Corporation - Class A Common Shares and Class B Variable Voting Shares" },
-    { symbol: "TSBK", name: "Timberland Bancorp, Inc. - Common Stock" },
-    { symbol: "TSCO", name: "Tractor Supply Company - Common Stock" },
-    { symbol: "TSDD", name: "GraniteShares 2x Short TSLA Daily ETF" },
-    { symbol: "TSEL", name: "Touchstone Sands Capital US Select Growth ETF" },
-    { symbol: "TSEM", name: "Tower Semiconductor Ltd. - Ordinary Shares" },
-    { symbol: "TSHA", name: "Taysha Gene Therapies, Inc. - Common Stock" },
-    { symbol: "TSL", name: "GraniteShares 1.25x Long TSLA Daily ETF" },
-    { symbol: "TSLA", name: "Tesla, Inc.  - Common Stock" },
-    { symbol: "TSLG", name: "Leverage Shares 2X Long TSLA Daily ETF" },
-    { symbol: "TSLL", name: "Direxion Daily TSLA Bull 2X Shares" },
-    { symbol: "TSLQ", name: "Tradr 2X Short TSLA Daily ETF" },
-    { symbol: "TSLR", name: "GraniteShares 2x Long TSLA Daily ETF" },
-    { symbol: "TSLS", name: "Direxion Daily TSLA Bear 1X Shares" },
-    { symbol: "TSMG", name: "Leverage Shares 2X Long TSM Daily ETF" },
-    { symbol: "TSMU", name: "GraniteShares 2x Long TSM Daily ETF" },
-    { symbol: "TSMX", name: "Direxion Daily TSM Bull 2X Shares" },
-    { symbol: "TSMZ", name: "Direxion Daily TSM Bear 1X Shares" },
-    { symbol: "TSPY", name: "TappAlpha SPY Growth & Daily Income ETF" },
-    { symbol: "TSSI", name: "TSS, Inc. - Common Stock" },
-    { symbol: "TSYY", name: "GraniteShares YieldBOOST TSLA ETF" },
-    { symbol: "TTAN", name: "ServiceTitan, Inc. - Class A Common Stock" },
-    { symbol: "TTD", name: "The Trade Desk, Inc. - Class A Common Stock" },
-    { symbol: "TTEC", name: "TTEC Holdings, Inc. - Common Stock" },
-    { symbol: "TTEK", name: "Tetra Tech, Inc. - Common Stock" },
-    { symbol: "TTEQ", name: "T. Rowe Price Technology ETF" },
-    { symbol: "TTGT", name: "TechTarget, Inc. - Common Stock" },
-    { symbol: "TTMI", name: "TTM Technologies, Inc. - Common Stock" },
-    { symbol: "TTNP", name: "Titan Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "TTSH", name: "Tile Shop Holdings, Inc. - Common Stock" },
-    { symbol: "TTWO", name: "Take-Two Interactive Software, Inc. - Common Stock" },
-    { symbol: "TUG", name: "STF Tactical Growth ETF" },
-    { symbol: "TUGN", name: "STF Tactical Growth & Income ETF" },
-    { symbol: "TUR", name: "iShares MSCI Turkey ETF" },
-    { symbol: "TURB", name: "Turbo Energy, S.A. - American Depositary Shares" },
-    { symbol: "TURF", name: "T. Rowe Price Natural Resources ETF" },
-    { symbol: "TURN", name: "180 Degree Capital Corp. - Closed End Fund" },
-    { symbol: "TUSK", name: "Mammoth Energy Services, Inc. - Common Stock" },
-    { symbol: "TVA", name: "Texas Ventures Acquisition III Corp - Class A Ordinary Share" },
-    { symbol: "TVACU", name: "Texas Ventures Acquisition III Corp - Unit" },
-    { symbol: "TVACW", name: "Texas Ventures Acquisition III Corp - Warrants" },
-    { symbol: "TVAI", name: "Thayer Ventures Acquisition Corporation II - Class A Ordinary Shares" },
-    { symbol: "TVAIR", name: "Thayer Ventures Acquisition Corporation II - Rights" },
-    { symbol: "TVAIU", name: "Thayer Ventures Acquisition Corporation II - Unit" },
-    { symbol: "TVGN", name: "Tevogen Bio Holdings Inc. - Common Stock" },
-    { symbol: "TVGNW", name: "Tevogen Bio Holdings Inc. - Warrant" },
-    { symbol: "TVRD", name: "Tvardi Therapeutics, Inc. - Common Stock" },
-    { symbol: "TVTX", name: "Travere Therapeutics, Inc. - Common Stock" },
-    { symbol: "TW", name: "Tradeweb Markets Inc. - Class A Common Stock" },
-    { symbol: "TWFG", name: "TWFG, Inc. - Common Stock" },
-    { symbol: "TWG", name: "Top Wealth Group Holding Limited - Class A Ordinary Shares" },
-    { symbol: "TWIN", name: "Twin Disc, Incorporated - Common Stock" },
-    { symbol: "TWNP", name: "Twin Hospitality Group Inc. - Class A Common Stock" },
-    { symbol: "TWST", name: "Twist Bioscience Corporation - Common Stock" },
-    { symbol: "TXG", name: "10x Genomics, Inc. - Common Stock" },
-    { symbol: "TXMD", name: "TherapeuticsMD, Inc. - Common Stock" },
-    { symbol: "TXN", name: "Texas Instruments Incorporated - Common Stock" },
-    { symbol: "TXRH", name: "Texas Roadhouse, Inc. - Common Stock" },
-    { symbol: "TXSS", name: "Texas Capital Texas Small Cap Equity Index ETF" },
-    { symbol: "TXUE", name: "Thornburg International Equity ETF" },
-    { symbol: "TXUG", name: "Thornburg International Growth Fund ETF" },
-    { symbol: "TYGO", name: "Tigo Energy, Inc. - Common Stock" },
-    { symbol: "TYRA", name: "Tyra Biosciences, Inc. - Common Stock" },
-    { symbol: "TZOO", name: "Travelzoo - Common Stock" },
-    { symbol: "TZUP", name: "Thumzup Media Corporation - Common Stock" },
-    { symbol: "UAE", name: "iShares MSCI UAE ETF" },
-    { symbol: "UAL", name: "United Airlines Holdings, Inc. - Common Stock" },
-    { symbol: "UBCP", name: "United Bancorp, Inc. - Common Stock" },
-    { symbol: "UBFO", name: "United Security Bancshares - Common Stock" },
-    { symbol: "UBND", name: "VictoryShares Core Plus Intermediate Bond ETF" },
-    { symbol: "UBRL", name: "GraniteShares 2x Long UBER Daily ETF" },
-    { symbol: "UBSI", name: "United Bankshares, Inc. - Common Stock" },
-    { symbol: "UBXG", name: "U-BX Technology Ltd. - Ordinary Shares" },
-    { symbol: "UCAR", name: "U Power Limited - Class A Ordinary Shares" },
-    { symbol: "UCL", name: "uCloudlink Group Inc. - American Depositary Shares" },
-    { symbol: "UCRD", name: "VictoryShares Corporate Bond ETF" },
-    { symbol: "UCTT", name: "Ultra Clean Holdings, Inc. - Common Stock" },
-    { symbol: "UCYB", name: "ProShares Ultra Nasdaq Cybersecurity" },
-    { symbol: "UDMY", name: "Udemy, Inc. - Common Stock" },
-    { symbol: "UEIC", name: "Universal Electronics Inc. - Common Stock" },
-    { symbol: "UEVM", name: "VictoryShares Emerging Markets Value Momentum ETF" },
-    { symbol: "UFCS", name: "United Fire Group, Inc - Common Stock" },
-    { symbol: "UFG", name: "Uni-Fuels Holdings Limited - Class A Ordinary Shares" },
-    { symbol: "UFIV", name: "US Treasury 5 Year Note ETF" },
-    { symbol: "UFO", name: "Procure Space ETF" },
-    { symbol: "UFPI", name: "UFP Industries, Inc. - Common Stock" },
-    { symbol: "UFPT", name: "UFP Technologies, Inc. - Common Stock" },
-    { symbol: "UG", name: "United-Guardian, Inc. - Common Stock" },
-    { symbol: "UGRO", name: "urban-gro, Inc. - Common Stock" },
-    { symbol: "UHG", name: "United Homes Group, Inc - Class A Common Stock" },
-    { symbol: "UHGWW", name: "United Homes Group, Inc - Warrant" },
-    { symbol: "UITB", name: "VictoryShares Core Intermediate Bond ETF" },
-    { symbol: "UIVM", name: "VictoryShares International Value Momentum ETF" },
-    { symbol: "UK", name: "Ucommune International Ltd  - Ordinary Shares" },
-    { symbol: "UKOMW", name: "Ucommune International Ltd  - Warrant expiring 11/17/2025" },
-    { symbol: "ULBI", name: "Ultralife Corporation - Common Stock" },
-    { symbol: "ULCC", name: "Frontier Group Holdings, Inc. - Common Stock" },
-    { symbol: "ULH", name: "Universal Logistics Holdings, Inc. - Common Stock" },
-    { symbol: "ULTA", name: "Ulta Beauty, Inc. - Common Stock" },
-    { symbol: "ULVM", name: "VictoryShares US Value Momentum ETF" },
-    { symbol: "ULY", name: "Urgent.ly Inc. - Common Stock" },
-    { symbol: "UMBF", name: "UMB Financial Corporation - Common Stock" },
-    { symbol: "UMBFO", name: "UMB Financial Corporation - Depositary Shares Each Representing a 1/400th Interest in a Share of 7.750% Fixed-Rate Reset Non-Cumulative Perpetual Preferred Stock, Series B" },
-    { symbol: "UMMA", name: "Wahed Dow Jones Islamic World ETF" },
-    { symbol: "UNB", name: "Union Bankshares, Inc. - Common Stock" },
-    { symbol: "UNCY", name: "Unicycive Therapeutics, Inc. - Common Stock" },
-    { symbol: "UNHG", name: "Leverage Shares 2X Long UNH Daily ETF" },
-    { symbol: "UNIT", name: "Uniti Group Inc. - Common Stock" },
-    { symbol: "UNIY", name: "WisdomTree Voya Yield Enhanced USD Universal Bond Fund" },
-    { symbol: "UNTY", name: "Unity Bancorp, Inc. - Common Stock" },
-    { symbol: "UOKA", name: "MDJM LTD - Ordinary Shares" },
-    { symbol: "UONE", name: "Urban One, Inc.  - Class A Common Stock" },
-    { symbol: "UONEK", name: "Urban One, Inc.  - Class D Common Stock" },
-    { symbol: "UPB", name: "Upstream Bio, Inc. - Common Stock" },
-    { symbol: "UPBD", name: "Upbound Group, Inc. - Common Stock" },
-    { symbol: "UPC", name: "Universe Pharmaceuticals Inc - Ordinary Shares" },
-    { symbol: "UPGR", name: "Xtrackers US Green Infrastructure Select Equity ETF" },
-    { symbol: "UPLD", name: "Upland Software, Inc. - Common Stock" },
-    { symbol: "UPST", name: "Upstart Holdings, Inc. - Common stock" },
-    { symbol: "UPWK", name: "Upwork Inc. - Common Stock" },
-    { symbol: "UPXI", name: "Upexi, Inc. - Common Stock" },
-    { symbol: "URBN", name: "Urban Outfitters, Inc. - Common Stock" },
-    { symbol: "URGN", name: "UroGen Pharma Ltd. - Ordinary Shares" },
-    { symbol: "URNJ", name: "Sprott Junior Uranium Miners ETF" },
-    { symbol: "UROY", name: "Uranium Royalty Corp. - Common Stock" },
-    { symbol: "USAF", name: "Atlas America Fund" },
-    { symbol: "USAR", name: "USA Rare Earth, Inc. - Common Stock" },
-    { symbol: "USARW", name: "USA Rare Earth, Inc. - Warrant" },
-    { symbol: "USAU", name: "U.S. Gold Corp. - Common Stock" },
-    { symbol: "USCB", name: "USCB Financial Holdings, Inc.  - Class A Common Stock" },
-    { symbol: "USCL", name: "iShares Climate Conscious & Transition MSCI USA ETF" },
-    { symbol: "USDX", name: "SGI Enhanced Core ETF" },
-    { symbol: "USEA", name: "United Maritime Corporation - Common Stock" },
-    { symbol: "USEG", name: "U.S. Energy Corp. - Common Stock" },
-    { symbol: "USFI", name: "BrandywineGLOBAL - U.S. Fixed Income ETF" },
-    { symbol: "USGO", name: "U.S. GoldMining Inc. - Common stock" },
-    { symbol: "USGOW", name: "U.S. GoldMining Inc. - Warrant" },
-    { symbol: "USIG", name: "iShares Broad USD Investment Grade Corporate Bond ETF" },
-    { symbol: "USIN", name: "WisdomTree 7-10 Year Laddered Treasury Fund" },
-    { symbol: "USIO", name: "Usio, Inc. - Common Stock" },
-    { symbol: "USLM", name: "United States Lime & Minerals, Inc. - Common Stock" },
-    { symbol: "USMC", name: "Principal U.S. Mega-Cap ETF" },
-    { symbol: "USOI", name: "ETRACS Crude Oil Shares Covered Call ETNs due April 24, 2037" },
-    { symbol: "USOY", name: "Defiance Oil Enhanced Options Income ETF" },
-    { symbol: "USRD", name: "Themes US R&D Champions ETF" },
-    { symbol: "USSH", name: "WisdomTree 1-3 Year Laddered Treasury Fund" },
-    { symbol: "USTB", name: "VictoryShares Short-Term Bond ETF" },
-    { symbol: "USVM", name: "VictoryShares US Small Mid Cap Value Momentum ETF" },
-    { symbol: "USVN", name: "US Treasury 7 Year Note ETF" },
-    { symbol: "USXF", name: "iShares ESG Advanced MSCI USA ETF" },
-    { symbol: "UTEN", name: "US Treasury 10 Year Note ETF" },
-    { symbol: "UTHR", name: "United Therapeutics Corporation - Common Stock" },
-    { symbol: "UTHY", name: "US Treasury 30 Year Bond ETF" },
-    { symbol: "UTMD", name: "Utah Medical Products, Inc. - Common Stock" },
-    { symbol: "UTRE", name: "US Treasury 3 Year Note ETF" },
-    { symbol: "UTSI", name: "UTStarcom Holdings Corp - Ordinary Shares" },
-    { symbol: "UTWO", name: "US Treasury 2 Year Note ETF" },
-    { symbol: "UTWY", name: "US Treasury 20 Year Bond ETF" },
-    { symbol: "UVSP", name: "Univest Financial Corporation - Common Stock" },
-    { symbol: "UXIN", name: "Uxin Limited - American Depositary Shares" },
-    { symbol: "UYLD", name: "Angel Oak UltraShort Income ETF" },
-    { symbol: "UYSC", name: "UY Scuti Acquisition Corp. - Ordinary Shares" },
-    { symbol: "UYSCR", name: "UY Scuti Acquisition Corp. - Rights" },
-    { symbol: "UYSCU", name: "UY Scuti Acquisition Corp. - Units" },
-    { symbol: "VABK", name: "Virginia National Bankshares Corporation - Common Stock" },
-    { symbol: "VACH", name: "Voyager Acquisition Corp - Class A Ordinary Shares" },
-    { symbol: "VACHU", name: "Voyager Acquisition Corp - Unit" },
-    { symbol: "VACHW", name: "Voyager Acquisition Corp - Warrants" },
-    { symbol: "VALN", name: "Valneva SE - American Depositary Shares" },
-    { symbol: "VALU", name: "Value Line, Inc. - Common Stock" },
-    { symbol: "VANI", name: "Vivani Medical, Inc.  - Common Stock" },
-    { symbol: "VBIL", name: "Vanguard 0-3 Month Treasury Bill ETF" },
-    { symbol: "VBIX", name: "Viewbix Inc. - Common Stock " },
-    { symbol: "VBNK", name: "VersaBank - Common Shares" },
-    { symbol: "VBTX", name: "Veritex Holdings, Inc. - Common Stock" },
-    { symbol: "VC", name: "Visteon Corporation - Common Stock" },
-    { symbol: "VCEL", name: "Vericel Corporation - Common Stock" },
-    { symbol: "VCIC", name: "Vine Hill Capital Investment Corp. - Class A Ordinary Shares" },
-    { symbol: "VCICU", name: "Vine Hill Capital Investment Corp. - Unit" },
-    { symbol: "VCICW", name: "Vine Hill Capital Investment Corp. - Warrant" },
-    { symbol: "VCIG", name: "VCI Global Limited - Ordinary Share" },
-    { symbol: "VCIT", name: "Vanguard Intermediate-Term Corporate Bond ETF" },
-    { symbol: "VCLT", name: "Vanguard Long-Term Corporate Bond ETF" },
-    { symbol: "VCRB", name: "Vanguard Core Bond ETF" },
-    { symbol: "VCSH", name: "Vanguard Short-Term Corporate Bond ETF" },
-    { symbol: "VCTR", name: "Victory Capital Holdings, Inc. - Common Stock" },
-    { symbol: "VCYT", name: "Veracyte, Inc. - Common Stock" },
-    { symbol: "VECO", name: "Veeco Instruments Inc. - Common Stock" },
-    { symbol: "VEEA", name: "Veea Inc. - Common Stock" },
-    { symbol: "VEEAW", name: "Veea Inc. - Warrant" },
-    { symbol: "VEEE", name: "Twin Vee PowerCats Co. - Common Stock" },
-    { symbol: "VELO", name: "Velo3D, Inc. - Common stock" },
-    { symbol: "VEON", name: "VEON Ltd. - American Depositary Shares" },
-    { symbol: "VERA", name: "Vera Therapeutics, Inc. - Class A Common Stock" },
-    { symbol: "VERI", name: "Veritone, Inc. - Common Stock" },
-    { symbol: "VERO", name: "Venus Concept Inc.  - Common Stock" },
-    { symbol: "VERU", name: "Veru Inc. - Common Stock" },
-    { symbol: "VERX", name: "Vertex, Inc. - Class A Common Stock" },
-    { symbol: "VFF", name: "Village Farms International, Inc. - Common Shares" },
-    { symbol: "VFLO", name: "VictoryShares Free Cash Flow ETF" },
-    { symbol: "VFS", name: "VinFast Auto Ltd. - Ordinary Shares" },
-    { symbol: "VFSWW", name: "VinFast Auto Ltd. - Warrant" },
-    { symbol: "VGAS", name: "Verde Clean Fuels, Inc. - Class A Common Stock" },
-    { symbol: "VGASW", name: "Verde Clean Fuels, Inc. - Warrant" },
-    { symbol: "VGIT", name: "Vanguard Intermediate-Term Treasury ETF" },
-    { symbol: "VGLT", name: "Vanguard Long-Term Treasury ETF" },
-    { symbol: "VGSH", name: "Vanguard Short-Term Treasury ETF" },
-    { symbol: "VGSR", name: "Vert Global Sustainable Real Estate ETF" },
-    { symbol: "VGUS", name: "Vanguard Ultra-Short Treasury ETF" },
-    { symbol: "VIASP", name: "Via Renewables, Inc. - 8.75% Series A Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "VIAV", name: "Viavi Solutions Inc. - Common Stock" },
-    { symbol: "VICR", name: "Vicor Corporation - Common Stock" },
-    { symbol: "VIGI", name: "Vanguard International Dividend Appreciation ETF" },
-    { symbol: "VINP", name: "Vinci Compass Investments Ltd. - Class A Common Shares" },
-    { symbol: "VIOT", name: "Viomi Technology Co., Ltd - American Depositary Shares" },
-    { symbol: "VIR", name: "Vir Biotechnology, Inc. - Common Stock" },
-    { symbol: "VIRC", name: "Virco Manufacturing Corporation - Common Stock" },
-    { symbol: "VITL", name: "Vital Farms, Inc. - Common Stock" },
-    { symbol: "VIVK", name: "Vivakor, Inc. - Common Stock" },
-    { symbol: "VIVS", name: "VivoSim Labs, Inc. - Common Stock" },
-    { symbol: "VIXI", name: "Defiance Enhanced Long Vol ETF" },
-    { symbol: "VKTX", name: "Viking Therapeutics, Inc. - Common Stock" },
-    { symbol: "VLGEA", name: "Village Super Market, Inc. - Class A Common Stock" },
-    { symbol: "VLY", name: "Valley National Bancorp - Common Stock" },
-    { symbol: "VLYPN", name: "Valley National Bancorp - 8.250% Fixed-Rate Reset Non-Cumulative Perpetual Preferred Stock, Series C" },
-    { symbol: "VLYPO", name: "Valley National Bancorp - 5.5% Fixed to Floating Rate Series B Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "VLYPP", name: "Valley National Bancorp - 6.25% Fixed-to-Floating Rate Series A Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "VMAR", name: "Vision Marine Technologies Inc. - Common Shares" },
-    { symbol: "VMBS", name: "Vanguard Mortgage-Backed Securities ETF" },
-    { symbol: "VMD", name: "Viemed Healthcare, Inc. - Common Shares" },
-    { symbol: "VMEO", name: "Vimeo, Inc. - Common Stock" },
-    { symbol: "VNDA", name: "Vanda Pharmaceuticals Inc. - Common Stock" },
-    { symbol: "VNET", name: "VNET Group, Inc. - American Depositary Shares" },
-    { symbol: "VNME", name: "Vendome Acquisition Corporation I - Class A Ordinary Shares" },
-    { symbol: "VNMEU", name: "Vendome Acquisition Corporation I - Unit" },
-    { symbol: "VNMEW", name: "Vendome Acquisition Corporation I - Warrant" },
-    { symbol: "VNOM", name: "Viper Energy, Inc.  - Class A Common Stock" },
-    { symbol: "VNQI", name: "Vanguard Global ex-U.S. Real Estate ETF" },
-    { symbol: "VOD", name: "Vodafone Group Plc - American Depositary Shares each representing ten Ordinary Shares" },
-    { symbol: "VOLT", name: "Tema Electrification ETF" },
-    { symbol: "VONE", name: "Vanguard Russell 1000 ETF" },
-    { symbol: "VONG", name: "Vanguard Russell 1000 Growth ETF" },
-    { symbol: "VONV", name: "Vanguard Russell 1000 Value ETF" },
-    { symbol: "VOR", name: "Vor Biopharma Inc. - Common Stock" },
-    { symbol: "VOTE", name: "TCW Transform 500 ETF" },
-    { symbol: "VOXR", name: "Vox Royalty Corp. - common stock" },
-    { symbol: "VPLS", name: "Vanguard Core Plus Bond ETF" },
-    { symbol: "VRA", name: "Vera Bradley, Inc. - Common Stock" },
-    { symbol: "VRAR", name: "The Glimpse Group, Inc. - Common Stock" },
-    { symbol: "VRAX", name: "Virax Biolabs Group Limited - Ordinary Shares" },
-    { symbol: "VRCA", name: "Verrica Pharmaceuticals Inc. - Common Stock" },
-    { symbol: "VRDN", name: "Viridian Therapeutics, Inc.  - Common Stock" },
-    { symbol: "VREX", name: "Varex Imaging Corporation - Common Stock" },
-    { symbol: "VRIG", name: "Invesco Variable Rate Investment Grade ETF" },
-    { symbol: "VRM", name: "Vroom, Inc. - Common Stock" },
-    { symbol: "VRME", name: "VerifyMe, Inc. - Common Stock" },
-    { symbol: "VRNA", name: "Verona Pharma plc - American Depositary Shares" },
-    { symbol: "VRNS", name: "Varonis Systems, Inc. - Common Stock" },
-    { symbol: "VRNT", name: "Verint Systems Inc. - Common Stock" },
-    { symbol: "VRRM", name: "Verra Mobility Corporation - Class A Common Stock" },
-    { symbol: "VRSK", name: "Verisk Analytics, Inc. - Common Stock" },
-    { symbol: "VRSN", name: "VeriSign, Inc. - Common Stock" },
-    { symbol: "VRTL", name: "GraniteShares 2x Long VRT Daily ETF" },
-    { symbol: "VRTX", name: "Vertex Pharmaceuticals Incorporated - Common Stock" },
-    { symbol: "VS", name: "Versus Systems Inc. - Common Stock" },
-    { symbol: "VSA", name: "TCTM Kids IT Education Inc. - American Depositary Shares" },
-    { symbol: "VSAT", name: "ViaSat, Inc. - Common Stock" },
-    { symbol: "VSDA", name: "VictoryShares Dividend Accelerator ETF" },
-    { symbol: "VSEC", name: "VSE Corporation - Common Stock" },
-    { symbol: "VSEE", name: "VSee Health, Inc. - Common Stock" },
-    { symbol: "VSEEW", name: "VSee Health, Inc. - Warrant" },
-    { symbol: "VSME", name: "VS Media Holdings Limited - Class A Ordinary Shares" },
-    { symbol: "VSMV", name: "VictoryShares US Multi-Factor Minimum Volatility ETF" },
-    { symbol: "VSSYW", name: "Versus Systems Inc. - Class A Warrants" },
-    { symbol: "VSTA", name: "Vasta Platform Limited - Class A Ordinary Shares" },
-    { symbol: "VSTD", name: "Vestand Inc.  - Class A Common Stock" },
-    { symbol: "VSTL", name: "Defiance Daily Target 2X Long VST ETF" },
-    { symbol: "VSTM", name: "Verastem, Inc. - Common Stock" },
-    { symbol: "VTC", name: "Vanguard Total Corporate Bond ETF" },
-    { symbol: "VTGN", name: "Vistagen Therapeutics, Inc. - Common Stock" },
-    { symbol: "VTHR", name: "Vanguard Russell 3000 ETF" },
-    { symbol: "VTIP", name: "Vanguard Short-Term Inflation-Protected Securities Index Fund ETF Shares" },
-    { symbol: "VTRS", name: "Viatris Inc. - Common Stock" },
-    { symbol: "VTSI", name: "VirTra, Inc. - Common Stock" },
-    { symbol: "VTVT", name: "vTv Therapeutics Inc. - Class A Common Stock" },
-    { symbol: "VTWG", name: "Vanguard Russell 2000 Growth ETF" },
-    { symbol: "VTWO", name: "Vanguard Russell 2000 ETF" },
-    { symbol: "VTWV", name: "Vanguard Russell 2000 Value ETF" },
-    { symbol: "VTYX", name: "Ventyx Biosciences, Inc. - Common Stock" },
-    { symbol: "VUZI", name: "Vuzix Corporation  - Common Stock" },
-    { symbol: "VVOS", name: "Vivos Therapeutics, Inc. - Common Stock" },
-    { symbol: "VVPR", name: "VivoPower International PLC - Ordinary Shares" },
-    { symbol: "VWAV", name: "VisionWave Holdings, Inc. - Common Stock" },
-    { symbol: "VWAVW", name: "VisionWave Holdings, Inc. - Warrant" },
-    { symbol: "VWOB", name: "Vanguard Emerging Markets Government Bond ETF" },
-    { symbol: "VXUS", name: "Vanguard Total International Stock ETF" },
-    { symbol: "VYGR", name: "Voyager Therapeutics, Inc. - Common Stock" },
-    { symbol: "VYMI", name: "Vanguard International High Dividend Yield ETF" },
-    { symbol: "VYNE", name: "VYNE Therapeutics Inc. - Common Stock" },
-    { symbol: "WABC", name: "Westamerica Bancorporation - Common Stock" },
-    { symbol: "WABF", name: "Western Asset Bond ETF" },
-    { symbol: "WAFD", name: "WaFd, Inc. - Common Stock" },
-    { symbol: "WAFDP", name: "WaFd, Inc. - Depositary Shares" },
-    { symbol: "WAFU", name: "Wah Fu Education Group Limited - Ordinary Shares" },
-    { symbol: "WAI", name: "Top KingWin Ltd - Class A Ordinary Shares" },
-    { symbol: "WALD", name: "Waldencast plc - Class A Ordinary Share" },
-    { symbol: "WALDW", name: "Waldencast plc - Warrant" },
-    { symbol: "WASH", name: "Washington Trust Bancorp, Inc. - Common Stock" },
-    { symbol: "WATT", name: "Energous Corporation - Common Stock" },
-    { symbol: "WAVE", name: "Eco Wave Power Global AB (publ) - American Depositary Shares" },
-    { symbol: "WAY", name: "Waystar Holding Corp. - Common Stock" },
-    { symbol: "WB", name: "Weibo Corporation - American Depositary Shares" },
-    { symbol: "WBD", name: "Warner Bros. Discovery, Inc. - Series A Common Stock" },
-    { symbol: "WBTN", name: "WEBTOON Entertainment Inc. - Common stock" },
-    { symbol: "WBUY", name: "WEBUY GLOBAL LTD. - Class A Ordinary Shares" },
-    { symbol: "WCBR", name: "WisdomTree Cybersecurity Fund" },
-    { symbol: "WCLD", name: "WisdomTree Cloud Computing Fund" },
-    { symbol: "WCT", name: "Wellchange Holdings Company Limited - Class A Ordinary shares" },
-    { symbol: "WDAY", name: "Workday, Inc. - Class A Common Stock" },
-    { symbol: "WDC", name: "Western Digital Corporation - Common Stock" },
-    { symbol: "WDFC", name: "WD-40 Company - Common Stock" },
-    { symbol: "WEEI", name: "Westwood Salient Enhanced Energy Income ETF" },
-    { symbol: "WEN", name: "Wendy's Company (The) - Common Stock" },
-    { symbol: "WENN", name: "Wen Acquisition Corp - Class A Ordinary Shares" },
-    { symbol: "WENNU", name: "Wen Acquisition Corp - Unit" },
-    { symbol: "WENNW", name: "Wen Acquisition Corp - Warrant" },
-    { symbol: "WERN", name: "Werner Enterprises, Inc. - Common Stock" },
-    { symbol: "WEST", name: "Westrock Coffee Company - Common Stock" },
-    { symbol: "WETH", name: "Wetouch Technology Inc. - Common Stock" },
-    { symbol: "WETO", name: "Webus International Limited - Ordinary Shares" },
-    { symbol: "WEYS", name: "Weyco Group, Inc. - Common Stock" },
-    { symbol: "WFCF", name: "Where Food Comes From, Inc. - Common Stock" },
-    { symbol: "WFF", name: "WF Holding Limited - Ordinary Shares" },
-    { symbol: "WFRD", name: "Weatherford International plc - Ordinary shares" },
-    { symbol: "WGMI", name: "CoinShares Bitcoin Mining ETF" },
-    { symbol: "WGRX", name: "Wellgistics Health, Inc. - Common Stock" },
-    { symbol: "WGS", name: "GeneDx Holdings Corp. - Class A Common Stock" },
-    { symbol: "WGSWW", name: "GeneDx Holdings Corp. - Warrant" },
-    { symbol: "WHF", name: "WhiteHorse Finance, Inc. - Closed End Fund" },
-    { symbol: "WHFCL", name: "WhiteHorse Finance, Inc. - 7.875% Notes due 2028" },
-    { symbol: "WHLR", name: "Wheeler Real Estate Investment Trust, Inc. - Common Stock" },
-    { symbol: "WHLRD", name: "Wheeler Real Estate Investment Trust, Inc. - Series D Cumulative Preferred Stock" },
-    { symbol: "WHLRL", name: "Wheeler Real Estate Investment Trust, Inc. - 7.00% Senior Subordinated Convertible Notes Due 2031" },
-    { symbol: "WHLRP", name: "Wheeler Real Estate Investment Trust, Inc. - Series B Preferred Stock" },
-    { symbol: "WHWK", name: "Whitehawk Therapeutics, Inc. - Common Stock" },
-    { symbol: "WILC", name: "G. Willi-Food International,  Ltd. - Ordinary Shares" },
-    { symbol: "WIMI", name: "WiMi Hologram Cloud Inc. - Class B Ordinary Shares" },
-    { symbol: "WINA", name: "Winmark Corporation - Common Stock" },
-    { symbol: "WING", name: "Wingstop Inc. - Common Stock" },
-    { symbol: "WISE", name: "Themes Generative Artificial Intelligence ETF" },
-    { symbol: "WIX", name: "Wix.com Ltd. - Ordinary Shares" },
-    { symbol: "WKEY", name: "WISeKey International Holding Ltd - American Depositary Shares" },
-    { symbol: "WKHS", name: "Workhorse Group, Inc. - Common Stock" },
-    { symbol: "WKSP", name: "Worksport, Ltd. - Common Stock" },
-    { symbol: "WLAC", name: "Willow Lane Acquisition Corp. - Class A Ordinary Shares" },
-    { symbol: "WLACU", name: "Willow Lane Acquisition Corp. - Unit" },
-    { symbol: "WLACW", name: "Willow Lane Acquisition Corp. - Warrants" },
-    { symbol: "WLDN", name: "Willdan Group, Inc. - Common Stock" },
-    { symbol: "WLDS", name: "Wearable Devices Ltd. - Ordinary Share" },
-    { symbol: "WLDSW", name: "Wearable Devices Ltd. - Warrant" },
-    { symbol: "WLFC", name: "Willis Lease Finance Corporation - Common Stock" },
-    { symbol: "WMG", name: "Warner Music Group Corp. - Class A Common Stock" },
-    { symbol: "WNEB", name: "Western New England Bancorp, Inc. - Common Stock" },
-    { symbol: "WNW", name: "Meiwu Technology Company Limited - Ordinary Shares" },
-    { symbol: "WOK", name: "WORK Medical Technology Group LTD - Class A Ordinary Shares" },
-    { symbol: "WOOD", name: "iShares Global Timber & Forestry ETF" },
-    { symbol: "WOOF", name: "Petco Health and Wellness Company, Inc. - Class A Common Stock" },
-    { symbol: "WORX", name: "SCWorx Corp. - Common Stock" },
-    { symbol: "WPRT", name: "Westport Fuel Systems Inc - Common Shares" },
-    { symbol: "WRAP", name: "Wrap Technologies, Inc. - Common Stock" },
-    { symbol: "WRD", name: "WeRide Inc. - American Depositary Shares" },
-    { symbol: "WRLD", name: "World Acceptance Corporation - Common Stock" },
-    { symbol: "WRND", name: "NYLI Global Equity R&D Leaders ETF" },
-    { symbol: "WSBC", name: "WesBanco, Inc. - Common Stock" },
-    { symbol: "WSBCP", name: "WesBanco, Inc. - Depositary Shares, Each Representing a 1/40th Interest in a Share of 6.75% Fixed-Rate Reset Non-Cumulative Perpetual Preferred Stock, Series A" },
-    { symbol: "WSBF", name: "Waterstone Financial, Inc. - Common Stock" },
-    { symbol: "WSBK", name: "Winchester Bancorp, Inc. - Common Stock" },
-    { symbol: "WSC", name: "WillScot Holdings Corporation - Class A Common Stock" },
-    { symbol: "WSFS", name: "WSFS Financial Corporation - Common Stock" },
-    { symbol: "WSML", name: "iShares MSCI World Small-Cap ETF" },
-    { symbol: "WTBA", name: "West Bancorporation - Common Stock" },
-    { symbol: "WTBN", name: "WisdomTree Bianco Total Return Fund" },
-    { symbol: "WTF", name: "Waton Financial Limited - Ordinary Shares" },
-    { symbol: "WTFC", name: "Wintrust Financial Corporation - Common Stock" },
-    { symbol: "WTFCN", name: "Wintrust Financial Corporation - Depositary Shares, Each Representing a 1/1,000th Interest in a Share of 7.875% Fixed-Rate Reset Non-Cumulative Perpetual Preferred Stock, Series F, no par value, with a liquidation preference of $25,000 per share" },
-    { symbol: "WTG", name: "Wintergreen Acquisition Corp. - Ordinary Shares" },
-    { symbol: "WTGUR", name: "Wintergreen Acquisition Corp. - Rights" },
-    { symbol: "WTGUU", name: "Wintergreen Acquisition Corp. - Unit" },
-    { symbol: "WTIP", name: "WisdomTree Inflation Plus Fund" },
-    { symbol: "WTMU", name: "WisdomTree Core Laddered Municipal Fund" },
-    { symbol: "WTMY", name: "WisdomTree High Income Laddered Municipal Fund" },
-    { symbol: "WTO", name: "UTime Limited - Ordinary Shares" },
-    { symbol: "WTW", name: "Willis Towers Watson Public Limited Company - Ordinary Shares" },
-    { symbol: "WULF", name: "TeraWulf Inc. - Common Stock" },
-    { symbol: "WVE", name: "Wave Life Sciences Ltd. - Ordinary Shares" },
-    { symbol: "WVVI", name: "Willamette Valley Vineyards, Inc. - Common Stock" },
-    { symbol: "WVVIP", name: "Willamette Valley Vineyards, Inc. - Series A Redeemable Preferred Stock" },
-    { symbol: "WW", name: "WW International, Inc.  - Common Stock" },
-    { symbol: "WWD", name: "Woodward, Inc. - Common Stock" },
-    { symbol: "WXM", name: "WF International Limited - Ordinary Shares" },
-    { symbol: "WYFI", name: "WhiteFiber, Inc. - Ordinary Shares" },
-    { symbol: "WYHG", name: "Wing Yip Food Holdings Group Limited - American Depositary Shares" },
-    { symbol: "WYNN", name: "Wynn Resorts, Limited - Common Stock" },
-    { symbol: "XAGE", name: "Longevity Health Holdings, Inc. - Common Stock" },
-    { symbol: "XAGEW", name: "Longevity Health Holdings, Inc. - Warrant" },
-    { symbol: "XAIR", name: "Beyond Air, Inc. - Common Stock" },
-    { symbol: "XAIX", name: "Xtrackers Artificial Intelligence and Big Data ETF" },
-    { symbol: "XBIL", name: "US Treasury 6 Month Bill ETF" },
-    { symbol: "XBIO", name: "Xenetic Biosciences, Inc. - Common Stock" },
-    { symbol: "XBIT", name: "XBiotech Inc. - Common Stock" },
-    { symbol: "XBP", name: "XBP Global Holdings, Inc. - Common Stock" },
-    { symbol: "XBPEW", name: "XBP Global Holdings, Inc. - Warrant" },
-    { symbol: "XBTY", name: "GraniteShares YieldBOOST Bitcoin ETF" },
-    { symbol: "XCH", name: "XCHG Limited - ADS" },
-    { symbol: "XCNY", name: "SPDR S&P Emerging Markets ex-China ETF" },
-    { symbol: "XCUR", name: "Exicure, Inc. - Common Stock" },
-    { symbol: "XEL", name: "Xcel Energy Inc. - Common Stock" },
-    { symbol: "XELB", name: "Xcel Brands, Inc - Common Stock" },
-    { symbol: "XENE", name: "Xenon Pharmaceuticals Inc. - Common Shares" },
-    { symbol: "XERS", name: "Xeris Biopharma Holdings, Inc. - Common Stock" },
-    { symbol: "XFIX", name: "F/m Opportunistic Income ETF" },
-    { symbol: "XFOR", name: "X4 Pharmaceuticals, Inc. - Common Stock" },
-    { symbol: "XGN", name: "Exagen Inc. - Common Stock" },
-    { symbol: "XHG", name: "XChange TEC.INC - American Depositary Shares" },
-    { symbol: "XHLD", name: "TEN Holdings, Inc. - Common Stock" },
-    { symbol: "XLO", name: "Xilio Therapeutics, Inc. - Common Stock" },
-    { symbol: "XMAG", name: "Defiance Large Cap ex-Mag 7 ETF" },
-    { symbol: "XMTR", name: "Xometry, Inc. - Class A Common Stock" },
-    { symbol: "XNCR", name: "Xencor, Inc. - Common Stock" },
-    { symbol: "XNET", name: "Xunlei Limited - American Depositary Shares" },
-    { symbol: "XOMA", name: "XOMA Royalty Corporation - Common Stock" },
-    { symbol: "XOMAO", name: "XOMA Royalty Corporation - Depositary Shares Rep Series B 8.375% Cumulative Preferred Stock" },
-    { symbol: "XOMAP", name: "XOMA Royalty Corporation - 8.625% Series A Cumulative Perpetual Preferred Stock" },
-    { symbol: "XOMX", name: "Direxion Daily XOM Bull 2X Shares" },
-    { symbol: "XOMZ", name: "Direxion Daily XOM Bear 1X Shares" },
-    { symbol: "XOS", name: "Xos, Inc. - Common Stock" },
-    { symbol: "XOSWW", name: "Xos, Inc. - Warrants" },
-    { symbol: "XOVR", name: "ERShares Private-Public Crossover ETF" },
-    { symbol: "XP", name: "XP Inc. - Class A Common Stock" },
-    { symbol: "XPEL", name: "XPEL, Inc. - Common Stock" },
-    { symbol: "XPON", name: "Expion360 Inc. - Common Stock" },
-    { symbol: "XRAY", name: "DENTSPLY SIRONA Inc. - Common Stock" },
-    { symbol: "XRPI", name: "Volatility Shares Trust XRP ETF" },
-    { symbol: "XRPT", name: "Volatility Shares Trust XRP 2X ETF" },
-    { symbol: "XRTX", name: "XORTX Therapeutics Inc. - Common Stock" },
-    { symbol: "XRX", name: "Xerox Holdings Corporation - Common Stock" },
-    { symbol: "XT", name: "iShares Exponential Technologies ETF" },
-    { symbol: "XTIA", name: "XTI Aerospace, Inc. Common Stock  - Common Stock" },
-    { symbol: "XTKG", name: "X3 Holdings Co., Ltd. - Ordinary Shares" },
-    { symbol: "XTLB", name: "XTL Biopharmaceuticals Ltd. - American Depositary Shares" },
-    { symbol: "XWEL", name: "XWELL, Inc. - Common Stock" },
-    { symbol: "XXII", name: "22nd Century Group, Inc - Common Stock" },
-    { symbol: "XYZG", name: "Leverage Shares 2X Long XYZ Daily ETF" },
-    { symbol: "YAAS", name: "Youxin Technology Ltd - Class A Ordinary shares" },
-    { symbol: "YB", name: "Yuanbao Inc. - American Depositary Shares" },
-    { symbol: "YDES", name: "YD Bio Limited - Ordinary Shares" },
-    { symbol: "YDESW", name: "YD Bio Limited - Warrants" },
-    { symbol: "YGMZ", name: "MingZhu Logistics Holdings Limited - Ordinary Shares" },
-    { symbol: "YHC", name: "LQR House Inc. - Common Stock" },
-    { symbol: "YHGJ", name: "Yunhong Green CTI Ltd. - Common Stock" },
-    { symbol: "YHNA", name: "YHN Acquisition I Limited - Ordinary Shares" },
-    { symbol: "YHNAR", name: "YHN Acquisition I Limited - Right" },
-    { symbol: "YHNAU", name: "YHN Acquisition I Limited - Unit" },
-    { symbol: "YI", name: "111, Inc. - American Depositary Shares" },
-    { symbol: "YIBO", name: "Planet Image International Limited - Class A Ordinary Shares" },
-    { symbol: "YJ", name: "Yunji Inc. - American Depository Shares" },
-    { symbol: "YLDE", name: "Franklin ClearBridge Enhanced Income ETF" },
-    { symbol: "YMAB", name: "Y-mAbs Therapeutics, Inc. - Common Stock" },
-    { symbol: "YMAT", name: "J-Star Holding Co., Ltd. - Ordinary Shares" },
-    { symbol: "YMT", name: "Yimutian Inc. - American Depositary Shares; each representing 25 Class A ordinary shares" },
-    { symbol: "YNOT", name: "Horizon Digital Frontier ETF" },
-    { symbol: "YOKE", name: "YOKE Core ETF" },
-    { symbol: "YORW", name: "The York Water Company - Common Stock" },
-    { symbol: "YOUL", name: "Youlife Group Inc. - American Depositary Shares" },
-    { symbol: "YQ", name: "17 Education & Technology Group Inc. - American Depositary Shares" },
-    { symbol: "YQQQ", name: "YieldMax Short N100 Option Income Strategy ETF" },
-    { symbol: "YSPY", name: "GraniteShares YieldBOOST SPY ETF" },
-    { symbol: "YSXT", name: "YSX Tech. Co., Ltd  - Class A Ordinary Shares" },
-    { symbol: "YTRA", name: "Yatra Online, Inc. - Ordinary Shares" },
-    { symbol: "YXT", name: "YXT.COM GROUP HOLDING LIMITED - American Depository Shares" },
-    { symbol: "YYAI", name: "Connexa Sports Technologies Inc. - Common Stock" },
-    { symbol: "YYGH", name: "YY Group Holding Limited - Class A Ordinary Shares" },
-    { symbol: "Z", name: "Zillow Group, Inc. - Class C Capital Stock" },
-    { symbol: "ZAP", name: "Global X U.S. Electrification ETF" },
-    { symbol: "ZAZZT", name: "Tick Pilot Test Stock Class A Common Stock" },
-    { symbol: "ZBAI", name: "ATIF Holdings Limited - Ordinary Shares" },
-    { symbol: "ZBAO", name: "Zhibao Technology Inc. - Class A Ordinary Shares" },
-    { symbol: "ZBIO", name: "Zenas BioPharma, Inc. - Common Stock" },
-    { symbol: "ZBRA", name: "Zebra Technologies Corporation - Class A Common Stock" },
-    { symbol: "ZBZZT", name: "Test Pilot Test Stock Class B Common Stock" },
-    { symbol: "ZCMD", name: "Zhongchao Inc. - Class A Ordinary Shares" },
-    { symbol: "ZCZZT", name: "Tick Pilot Test Stock Class C " },
-    { symbol: "ZD", name: "Ziff Davis, Inc. - Common Stock" },
-    { symbol: "ZDAI", name: "Primega Group Holdings Limited - Ordinary Shares" },
-    { symbol: "ZENA", name: "ZenaTech, Inc. - Common Stock" },
-    { symbol: "ZENV", name: "Zenvia Inc. - Class A Common Stock" },
-    { symbol: "ZEO", name: "Zeo Energy Corporation - Class A Common Stock" },
-    { symbol: "ZEOWW", name: "Zeo Energy Corporation - Warrants" },
-    { symbol: "ZEUS", name: "Olympic Steel, Inc. - Common Stock" },
-    { symbol: "ZFZZT", name: "Nasdaq ETF Test Stock Nasdaq ETF Test Stock" },
-    { symbol: "ZG", name: "Zillow Group, Inc. - Class A Common Stock" },
-    { symbol: "ZGM", name: "Zenta Group Company Limited - Ordinary Shares" },
-    { symbol: "ZIMV", name: "ZimVie Inc. - Common Stock" },
-    { symbol: "ZION", name: "Zions Bancorporation N.A. - Common Stock" },
-    { symbol: "ZIONP", name: "Zions Bancorporation N.A. - Depositary Shares each representing a 1/40th ownership interest in a share of Series A Floating-Rate Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "ZIPP", name: "STKd 100% UBER & 100% TSLA ETF" },
-    { symbol: "ZJK", name: "ZJK Industrial Co., Ltd. - Ordinary Shares" },
-    { symbol: "ZJYL", name: "JIN MEDICAL INTERNATIONAL LTD. - Ordinary Shares" },
-    { symbol: "ZJZZT", name: "NASDAQ TEST STOCK" },
-    { symbol: "ZKIN", name: "ZK International Group Co., Ltd - Ordinary Share" },
-    { symbol: "ZLAB", name: "Zai Lab Limited - American Depositary Shares" },
-    { symbol: "ZM", name: "Zoom Communications, Inc. - Class A Common Stock" },
-    { symbol: "ZNB", name: "Zeta Network Group - Class A Ordinary Shares" },
-    { symbol: "ZNTL", name: "Zentalis Pharmaceuticals, Inc. - common stock" },
-    { symbol: "ZOOZ", name: "ZOOZ Power Ltd. - Ordinary Shares" },
-    { symbol: "ZOOZW", name: "ZOOZ Power Ltd. - Warrant" },
-    { symbol: "ZS", name: "Zscaler, Inc. - Common Stock" },
-    { symbol: "ZSPC", name: "zSpace, Inc. - Common stock" },
-    { symbol: "ZTEK", name: "Zentek Ltd. - common stock" },
-    { symbol: "ZTEN", name: "F/m 10-Year Investment Grade Corporate Bond ETF" },
-    { symbol: "ZTOP", name: "F/m High Yield 100 ETF" },
-    { symbol: "ZTRE", name: "F/m 3-Year Investment Grade Corporate Bond ETF" },
-    { symbol: "ZTWO", name: "F/m 2-Year Investment Grade Corporate Bond ETF" },
-    { symbol: "ZUMZ", name: "Zumiez Inc. - Common Stock" },
-    { symbol: "ZURA", name: "Zura Bio Limited - Class A Ordinary shares" },
-    { symbol: "ZVRA", name: "Zevra Therapeutics, Inc.  - Common Stock" },
-    { symbol: "ZVZZT", name: "NASDAQ TEST STOCK" },
-    { symbol: "ZWZZT", name: "NASDAQ TEST STOCK" },
-    { symbol: "ZXYZ.A", name: "Nasdaq Symbology Test Common Stock" },
-    { symbol: "ZXZZT", name: "NASDAQ TEST STOCK" },
-    { symbol: "ZYBT", name: "Zhengye Biotechnology Holding Limited - Ordinary Shares" },
-    { symbol: "ZYME", name: "Zymeworks Inc. - Common Stock" },
-    { symbol: "ZYN", name: "Defiance Daily Target 2x Long PM ETF" },
-    { symbol: "ZYXI", name: "Zynex, Inc. - Common Stock" },
-    { symbol: "A", name: "Agilent Technologies, Inc. Common Stock" },
-    { symbol: "AA", name: "Alcoa Corporation Common Stock " },
-    { symbol: "AAA", name: "Alternative Access First Priority CLO Bond ETF" },
-    { symbol: "AAAA", name: "EA Series Trust Amplius Aggressive Asset Allocation ETF" },
-    { symbol: "AAAU", name: "Goldman Sachs Physical Gold ETF Shares" },
-    { symbol: "AACT", name: "Ares Acquisition Corporation II Class A Ordinary Shares" },
-    { symbol: "AACT.U", name: "Ares Acquisition Corporation II Units, each consisting of one Class A ordinary share and one-half of one redeemable warrant" },
-    { symbol: "AACT.W", name: "Ares Acquisition Corporation II Redeemable Warrants, each whole warrant exercisable for one Class A ordinary share at an exercise price of $11.50" },
-    { symbol: "AAM", name: "AA Mission Acquisition Corp. Class A Ordinary Shares" },
-    { symbol: "AAM.U", name: "AA Mission Acquisition Corp. Units, each consisting of one Class A Ordinary Share and one-half of one redeemable warrant" },
-    { symbol: "AAM.W", name: "AA Mission Acquisition Corp. Warrants, each whole warrant entitles the holder to purchase one Class A ordinary share at a price of $11.50 per share" },
-    { symbol: "AAMI", name: "Acadian Asset Management Inc. Common Stock" },
-    { symbol: "AAP", name: "Advance Auto Parts Inc." },
-    { symbol: "AAPR", name: "SHL Telemedicine Ltd Innovator Equity Defined Protection ETF - 2 Yr to April 2026" },
-    { symbol: "AAPW", name: "Roundhill ETF Trust Roundhill AAPL WeeklyPay ETF" },
-    { symbol: "AAPX", name: "ETF Opportunities Trust T-Rex 2X Long Apple Daily Target ETF" },
-    { symbol: "AAPY", name: "Kurv Yield Premium Strategy Apple (AAPL) ETF" },
-    { symbol: "AAT", name: "American Assets Trust, Inc. Common Stock" },
-    { symbol: "AAUC", name: "Allied Gold Corporation Common Shares" },
-    { symbol: "AB", name: "AllianceBernstein Holding L.P.  Units" },
-    { symbol: "ABBV", name: "AbbVie Inc. Common Stock" },
-    { symbol: "ABCB", name: "Ameris Bancorp Common Stock" },
-    { symbol: "ABEQ", name: "Absolute Select Value ETF" },
-    { symbol: "ABEV", name: "Ambev S.A. American Depositary Shares (Each representing 1 Common Share)" },
-    { symbol: "ABFL", name: "Abacus FCF Leaders ETF" },
-    { symbol: "ABG", name: "Asbury Automotive Group Inc Common Stock" },
-    { symbol: "ABLD", name: "Abacus FCF Real Assets Leaders ETF" },
-    { symbol: "ABLG", name: "Abacus FCF International Leaders ETF" },
-    { symbol: "ABLS", name: "Abacus FCF ETF Trust Abacus FCF Small Cap Leaders ETF" },
-    { symbol: "ABM", name: "ABM Industries Incorporated Common Stock" },
-    { symbol: "ABNY", name: "Tidal Trust II YieldMax ABNB Option Income Strategy ETF" },
-    { symbol: "ABOT", name: "Abacus FCF Innovation Leaders ETF" },
-    { symbol: "ABR", name: "Arbor Realty Trust Common Stock" },
-    { symbol: "ABR$D", name: "Arbor Realty Trust 6.375% Series D Cumulative Redeemable Preferred Stock, Liquidation Preference $25.00 per Share" },
-    { symbol: "ABR$E", name: "Arbor Realty Trust 6.25% Series E Cumulative Redeemable Preferred Stock" },
-    { symbol: "ABR$F", name: "Arbor Realty Trust 6.25% Series F Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock, Liquidation Preference $25.00 per share" },
-    { symbol: "ABT", name: "Abbott Laboratories Common Stock" },
-    { symbol: "ABXB", name: "Abacus Flexible Bond Leaders ETF" },
-    { symbol: "ACA", name: "Arcosa, Inc. Common Stock " },
-    { symbol: "ACCO", name: "Acco Brands Corporation Common Stock" },
-    { symbol: "ACCS", name: "ACCESS Newswire Inc. Common Stock" },
-    { symbol: "ACEL", name: "Accel Entertainment, Inc. " },
-    { symbol: "ACES", name: "ALPS Clean Energy ETF" },
-    { symbol: "ACGR", name: "American Century Large Cap Growth ETF" },
-    { symbol: "ACHR", name: "Archer Aviation Inc. Class A Common Stock" },
-    { symbol: "ACHR.W", name: "Archer Aviation Inc. Redeemable Warrants, each whole warrant exercisable for one Class A common stock at an exercise price of $11.50" },
-    { symbol: "ACI", name: "Albertsons Companies, Inc. Class A Common Stock" },
-    { symbol: "ACIO", name: "Aptus Collared Investment Opportunity ETF" },
-    { symbol: "ACKY", name: "Tidal Trust III VistaShares Target 15 ACKtivist Distribution ETF" },
-    { symbol: "ACLC", name: "American Century Large Cap Equity ETF" },
-    { symbol: "ACLO", name: "TCW AAA CLO ETF" },
-    { symbol: "ACM", name: "AECOM Common Stock" },
-    { symbol: "ACN", name: "Accenture plc Class A Ordinary Shares (Ireland)" },
-    { symbol: "ACP", name: "abrdn Income Credit Strategies Fund Common Shares" },
-    { symbol: "ACP$A", name: "abrdn Income Credit Strategies Fund 5.250% Series A Perpetual Preferred Stock" },
-    { symbol: "ACR", name: "ACRES Commercial Realty Corp. Common Stock" },
-    { symbol: "ACR$C", name: "ACRES Commercial Realty Corp. 8.625% Fixed-to-Floating Series C Cumulative Redeemable Preferred Stock " },
-    { symbol: "ACR$D", name: "ACRES Commercial Realty Corp. 7.875% Series D Cumulative Redeemable Preferred Stock" },
-    { symbol: "ACRE", name: "Ares Commercial Real Estate Corporation Common Stock" },
-    { symbol: "ACSI", name: "American Customer Satisfaction ETF" },
-    { symbol: "ACTV", name: "LeaderShares Activist Leaders ETF" },
-    { symbol: "ACU", name: "Acme United Corporation. Common Stock" },
-    { symbol: "ACV", name: "Virtus Diversified Income & Convertible Fund Common Shares of Beneficial Interest" },
-    { symbol: "ACVA", name: "ACV Auctions Inc. Class A Common Stock" },
-    { symbol: "ACVF", name: "American Conservative Values ETF" },
-    { symbol: "ACVT", name: "The RBB Fund Trust Advent Convertible Bond ETF" },
-    { symbol: "ACWV", name: "iShares MSCI Global Min Vol Factor ETF" },
-    { symbol: "AD", name: "Array Digital Infrastructure, Inc. Common Shares" },
-    { symbol: "ADC", name: "Agree Realty Corporation Common Stock" },
-    { symbol: "ADC$A", name: "Agree Realty Corporation Depositary Shares, each representing 1/1,000th of a 4.250% Series A Cumulative Redeemable Preferred Stock" },
-    { symbol: "ADCT", name: "ADC Therapeutics SA Common Shares" },
-    { symbol: "ADFI", name: "Anfield Dynamic Fixed Income ETF" },
-    { symbol: "ADIV", name: "SmartETFs Asia Pacific Dividend Builder ETF" },
-    { symbol: "ADM", name: "Archer-Daniels-Midland Company Common Stock" },
-    { symbol: "ADME", name: "Aptus Drawdown Managed Equity ETF" },
-    { symbol: "ADNT", name: "Adient plc Ordinary Shares " },
-    { symbol: "ADPV", name: "Series Portfolios Trust Adaptiv Select ETF" },
-    { symbol: "ADT", name: "ADT Inc. Common Stock" },
-    { symbol: "ADVE", name: "Matthews International Funds Matthews Asia Dividend Active ETF" },
-    { symbol: "ADX", name: "Adams Diversified Equity Fund Inc." },
-    { symbol: "AEE", name: "Ameren Corporation Common Stock" },
-    { symbol: "AEF", name: "abrdn Emerging Markets ex-China Fund, Inc. Common Stock" },
-    { symbol: "AEFC", name: "Aegon Funding Company LLC 5.10% Subordinated Notes due 2049" },
-    { symbol: "AEG", name: "Aegon Ltd. New York Registry Shares" },
-    { symbol: "AEM", name: "Agnico Eagle Mines Limited Common Stock" },
-    { symbol: "AEMS", name: "Two Roads Shared Trust Anfield Enhanced Market ETF" },
-    { symbol: "AEO", name: "American Eagle Outfitters, Inc. Common Stock" },
-    { symbol: "AEON", name: "AEON Biopharma, Inc. Class A Common Stock" },
-    { symbol: "AER", name: "AerCap Holdings N.V. Ordinary Shares" },
-    { symbol: "AES", name: "The AES Corporation Common Stock" },
-    { symbol: "AESI", name: "Atlas Energy Solutions Inc. Common Stock" },
-    { symbol: "AESR", name: "Anfield U.S. Equity Sector Rotation ETF" },
-    { symbol: "AETH", name: "Bitwise Trendwise Ether and Treasuries Rotation Strategy ETF" },
-    { symbol: "AFB", name: "AllianceBernstein National Municipal Income Fund Inc" },
-    { symbol: "AFG", name: "American Financial Group, Inc. Common Stock" },
-    { symbol: "AFGB", name: "American Financial Group, Inc. 5.875% Subordinated Debentures due 2059" },
-    { symbol: "AFGC", name: "American Financial Group, Inc. 5.125% Subordinated Debentures due 2059" },
-    { symbol: "AFGD", name: "American Financial Group, Inc. 5.625% Subordinated Debentures due 2060" },
-    { symbol: "AFGE", name: "American Financial Group, Inc. 4.500% Subordinated Debentures due 2060" },
-    { symbol: "AFIF", name: "Anfield Universal Fixed Income ETF" },
-    { symbol: "AFIX", name: "Allspring Exchange-Traded Funds Trust Allspring Broad Market Core Bond ETF" },
-    { symbol: "AFK", name: "VanEck Africa Index ETF" },
-    { symbol: "AFL", name: "AFLAC Incorporated Common Stock" },
-    { symbol: "AFLG", name: "First Trust Active Factor Large Cap ETF" },
-    { symbol: "AFMC", name: "First Trust Active Factor Mid Cap ETF" },
-    { symbol: "AFSM", name: "First Trust Active Factor Small Cap ETF" },
-    { symbol: "AG", name: "First Majestic Silver Corp. Ordinary Shares (Canada)" },
-    { symbol: "AGCO", name: "AGCO Corporation Common Stock" },
-    { symbol: "AGD", name: "abrdn Global Dynamic Dividend Fund Common Shares of Beneficial Interest" },
-    { symbol: "AGG", name: "iShares Core U.S. Aggregate Bond ETF" },
-    { symbol: "AGGH", name: "Simplify Aggregate Bond ETF" },
-    { symbol: "AGGS", name: "Harbor ETF Trust Harbor Disciplined Bond ETF" },
-    { symbol: "AGGY", name: "WisdomTree Yield Enhanced U.S. Aggregate Bond Fund" },
-    { symbol: "AGI", name: "Alamos Gold Inc. Class A Common Shares" },
-    { symbol: "AGIQ", name: "Tidal Trust I SoFi Agentic AI ETF" },
-    { symbol: "AGL", name: "agilon health, inc. Common Stock" },
-    { symbol: "AGM", name: "Federal Agricultural Mortgage Corporation Common Stock" },
-    { symbol: "AGM$D", name: "Federal Agricultural Mortgage Corporation 5.700% Non-Cumulative Preferred Stock, Series D" },
-    { symbol: "AGM$E", name: "Federal Agricultural Mortgage Corporation 5.750% Non-Cumulative Preferred Stock, Series E" },
-    { symbol: "AGM$F", name: "Federal Agricultural Mortgage Corporation 5.250% Non-Cumulative Preferred Stock, Series F" },
-    { symbol: "AGM$G", name: "Federal Agricultural Mortgage Corporation 4.875% Non-Cumulative Preferred Stock, Series G" },
-    { symbol: "AGM$H", name: "Federal Agricultural Mortgage Corporation 6.500% Non-Cumulative Preferred Stock, Series H" },
-    { symbol: "AGM.A", name: "Federal Agricultural Mortgage Corporation Common Stock" },
-    { symbol: "AGO", name: "Assured Guaranty Ltd. Common Stock" },
-    { symbol: "AGOX", name: "Adaptive Alpha Opportunities ETF" },
-    { symbol: "AGQ", name: "ProShares Ultra Silver" },
-    { symbol: "AGQI", name: "First Trust Exchange-Traded Fund VIII First Trust Active Global Quality Income ETF" },
-    { symbol: "AGRH", name: "iShares U.S. ETF Trust iShares Interest Rate Hedged U.S. Aggregate Bond ETF" },
-    { symbol: "AGRO", name: "Adecoagro S.A. Common Shares" },
-    { symbol: "AGRW", name: "Allspring Exchange-Traded Funds Trust Allspring LT Large Growth ETF" },
-    { symbol: "AGX", name: "Argan, Inc. Common Stock" },
-    { symbol: "AGZ", name: "iShares  Agency Bond ETF" },
-    { symbol: "AHH", name: "Armada Hoffler Properties, Inc. Common Stock" },
-    { symbol: "AHH$A", name: "Armada Hoffler Properties, Inc. 6.75% Series A Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "AHL", name: "Aspen Insurance Holdings Limited Class A Ordinary Shares" },
-    { symbol: "AHL$D", name: "Aspen Insurance Holdings Limited 5.625% Perpetual Non-Cumulative Preference Shares" },
-    { symbol: "AHL$E", name: "Aspen Insurance Holdings Limited Depositary Shares, each representing a 1/1000th interest in a share of 5.625% Perpetual Non-Cumulative Preference Shares" },
-    { symbol: "AHL$F", name: "Aspen Insurance Holdings Limited Depositary Shares, each representing a 1/1,000th Interest in a 7.00% Perpetual Non-Cumulative Preference Share" },
-    { symbol: "AHLT", name: "American Beacon Select Funds American Beacon AHL Trend ETF" },
-    { symbol: "AHR", name: "American Healthcare REIT, Inc. Common Stock" },
-    { symbol: "AHT", name: "Ashford Hospitality Trust Inc Common Stock" },
-    { symbol: "AHT$D", name: "Ashford Hospitality Trust Inc 8.45% Series D Cumulative Preferred Stock" },
-    { symbol: "AHT$F", name: "Ashford Hospitality Trust Inc 7.375% Series F Cumulative Preferred Stock" },
-    { symbol: "AHT$G", name: "Ashford Hospitality Trust Inc 7.375% Series G Cumulative Preferred Stock" },
-    { symbol: "AHT$H", name: "Ashford Hospitality Trust Inc 7.50% Series H Cumulative Preferred Stock" },
-    { symbol: "AHT$I", name: "Ashford Hospitality Trust Inc 7.50% Series I Cumulative Preferred Stock" },
-    { symbol: "AHYB", name: "American Century Select High Yield ETF" },
-    { symbol: "AI", name: "C3.ai, Inc. Class A Common Stock" },
-    { symbol: "AIBD", name: "Direxion Shares ETF Trust Direxion Daily AI and Big Data Bear 2X Shares" },
-    { symbol: "AIBU", name: "Direxion Shares ETF Trust Direxion Daily AI and Big Data Bull 2X Shares" },
-    { symbol: "AIEQ", name: "Amplify ETF Trust Amplify AI Powered Equity ETF" },
-    { symbol: "AIG", name: "American International Group, Inc. New Common Stock" },
-    { symbol: "AII", name: "American Integrity Insurance Group, Inc. Common Stock" },
-    { symbol: "AIM", name: "AIM ImmunoTech Inc. Common Stock" },
-    { symbol: "AIN", name: "Albany International Corporation Common Stock" },
-    { symbol: "AINP", name: "Allspring Exchange-Traded Funds Trust Allspring Income Plus ETF" },
-    { symbol: "AIO", name: "Virtus Artificial Intelligence & Technology Opportunities Fund Common Shares of Beneficial Interest" },
-    { symbol: "AIOO", name: "AIM ETF Products Trust AllianzIM U.S. Equity Buffer100 Protection ETF" },
-    { symbol: "AIR", name: "AAR Corp. Common Stock" },
-    { symbol: "AIRI", name: "Air Industries Group Common Stock" },
-    { symbol: "AIS", name: "Tidal Trust III VistaShares Artificial Intelligence Supercycle ETF" },
-    { symbol: "AIT", name: "Applied Industrial Technologies, Inc. Common Stock" },
-    { symbol: "AIV", name: "Apartment Investment and Management Company Common Stock" },
-    { symbol: "AIVC", name: "Amplify Bloomberg AI Value Chain ETF" },
-    { symbol: "AIVI", name: "WisdomTree International AI Enhanced Value Fund" },
-    { symbol: "AIVL", name: "WisdomTree U.S. AI Enhanced Value Fund" },
-    { symbol: "AIYY", name: "Tidal Trust II YieldMax AI Option Income Strategy ETF" },
-    { symbol: "AIZ", name: "Assurant, Inc. Common Stock" },
-    { symbol: "AIZN", name: "Assurant, Inc. 5.25% Subordinated Notes due 2061" },
-    { symbol: "AJAN", name: "Innovator ETFs Trust Innovator Equity Defined Protection ETF - 2 Yr to January 2026" },
-    { symbol: "AJG", name: "Arthur J. Gallagher & Co. Common Stock" },
-    { symbol: "AJUL", name: "SHL Telemedicine Ltd Innovator Equity Defined Protection ETF - 2 Yr to July 2026" },
-    { symbol: "AKA", name: "a.k.a. Brands Holding Corp. Common Stock" },
-    { symbol: "AKAF", name: "ETF Series Solutions The Frontier Economic Fund" },
-    { symbol: "AKO.A", name: "Embotelladora Andina S.A. Common Stock" },
-    { symbol: "AKO.B", name: "Embotelladora Andina S.A. Common Stock" },
-    { symbol: "AKR", name: "Acadia Realty Trust Common Stock" },
-    { symbol: "AL", name: "Air Lease Corporation Class A Common Stock" },
-    { symbol: "ALAI", name: "The Alger ETF Trust Alger AI Enablers & Adopters ETF" },
-    { symbol: "ALB", name: "Albemarle Corporation Common Stock" },
-    { symbol: "ALB$A", name: "Albemarle Corporation Depositary Shares each representing a 1/20th of 7.25% Series A Mandatory Convertible Preferred Stock" },
-    { symbol: "ALC", name: "Alcon Inc. Ordinary Shares" },
-    { symbol: "ALE", name: "Allete, Inc." },
-    { symbol: "ALEX", name: "Alexander & Baldwin, Inc. Common Stock REIT Holding Company" },
-    { symbol: "ALG", name: "Alamo Group, Inc. Common Stock" },
-    { symbol: "ALIT", name: "Alight, Inc. Class A Common Stock" },
-    { symbol: "ALK", name: "Alaska Air Group, Inc. Common Stock" },
-    { symbol: "ALL", name: "Allstate Corporation (The) Common Stock" },
-    { symbol: "ALL$B", name: "Allstate Corporation (The) 5.100% Fixed-to-Floating Rate Subordinated Debentures due 2053" },
-    { symbol: "ALL$H", name: "Allstate Corporation (The) Depositary Shares each representing a 1/1,000th interest in a share of Fixed Rate Noncumulative Perpetual Preferred Stock, Series H" },
-    { symbol: "ALL$I", name: "Allstate Corporation (The) Depositary Shares each representing a 1/1,000th interest in a share of Fixed Rate Noncumulative Perpetual Preferred Stock, Series I" },
-    { symbol: "ALL$J", name: "Allstate Corporation (The) Depositary Shares each representing a 1/1,000th interest in a share of Fixed Rate Noncumulative Perpetual Preferred Stock, Series J" },
-    { symbol: "ALLE", name: "Allegion plc Ordinary Shares" },
-    { symbol: "ALLY", name: "Ally Financial Inc. Common Stock" },
-    { symbol: "ALRG", name: "Allspring Exchange-Traded Funds Trust Allspring LT Large Core ETF" },
-    { symbol: "ALSN", name: "Allison Transmission Holdings, Inc. Common Stock" },
-    { symbol: "ALTG", name: "Alta Equipment Group Inc. Class A Common Stock" },
-    { symbol: "ALTG$A", name: "Alta Equipment Group Inc. Depositary Shares (each representing 1/1000th in a share of 10% Series A Cumulative Perpetual Preferred Stock)" },
-    { symbol: "ALTL", name: "Pacer Lunt Large Cap Alternator ETF" },
-    { symbol: "ALUR", name: "Allurion Technologies, Inc. Common Stock" },
-    { symbol: "ALUR.W", name: "Allurion Technologies, Inc. Warrants, each whole warrant exercisable to purchase 1.420455 shares of common stock at an exercise price of $8.10 per share of common stock" },
-    { symbol: "ALV", name: "Autoliv, Inc. Common Stock" },
-    { symbol: "ALX", name: "Alexander's, Inc. Common Stock" },
-    { symbol: "AM", name: "Antero Midstream Corporation Common Stock" },
-    { symbol: "AMAX", name: "Adaptive Hedged Multi-Asset Income ETF" },
-    { symbol: "AMBC", name: "Ambac Financial Group, Inc. Common Stock" },
-    { symbol: "AMBI", name: "Ambipar Emergency Response Class A Ordinary Shares" },
-    { symbol: "AMBI.W", name: "Ambipar Emergency Response Warrants to purchase Class A ordinary shares, each whole warrant exercisable for one Class A ordinary share at an exercise price of $11.50 per share" },
-    { symbol: "AMBO", name: "Ambow Education Holding Ltd. American Depository Shares (each representing twenty (20) Class A Ordinary Shares)" },
-    { symbol: "AMBP", name: "Ardagh Metal Packaging S.A. Ordinary Shares" },
-    { symbol: "AMBP.W", name: "Ardagh Metal Packaging S.A. Warrants, each exercisable for one Share at an exercise price of $11.50 per share" },
-    { symbol: "AMBQ", name: "Ambiq Micro, Inc. Common Stock" },
-    { symbol: "AMC", name: "AMC Entertainment Holdings, Inc. Class A Common Stock" },
-    { symbol: "AMCR", name: "Amcor plc Ordinary Shares" },
-    { symbol: "AMDW", name: "Roundhill ETF Trust Roundhill AMD WeeklyPay ETF" },
-    { symbol: "AMDY", name: "Tidal Trust II Yieldmax AMD Option Income Strategy ETF" },
-    { symbol: "AME", name: "AMETEK, Inc." },
-    { symbol: "AMG", name: "Affiliated Managers Group, Inc. Common Stock" },
-    { symbol: "AMH", name: "American Homes 4 Rent Common Shares of Beneficial Interest" },
-    { symbol: "AMH$G", name: "American Homes 4 Rent Series G cumulative redeemable perpetual preferred shares of beneficial interest" },
-    { symbol: "AMH$H", name: "American Homes 4 Rent Series H cumulative redeemable perpetual Preferred Shares of Beneficial Interest" },
-    { symbol: "AMJB", name: "JPMorgan Chase & Co. Alerian MLP Index ETNs due January 28, 2044" },
-    { symbol: "AMLP", name: "Alerian MLP ETF" },
-    { symbol: "AMN", name: "AMN Healthcare Services Inc" },
-    { symbol: "AMOM", name: "QRAFT AI-Enhanced U.S. Large Cap Momentum ETF" },
-    { symbol: "AMP", name: "Ameriprise Financial, Inc. Common Stock" },
-    { symbol: "AMPX", name: "Amprius Technologies, Inc. Common Stock" },
-    { symbol: "AMPX.W", name: "Amprius Technologies, Inc. Warrants to purchase one share of Common Stock at an exercise price of $11.50 per share" },
-    { symbol: "AMPY", name: "Amplify Energy Corp. Common Stock" },
-    { symbol: "AMR", name: "Alpha Metallurgical Resources, Inc. Common Stock" },
-    { symbol: "AMRC", name: "Ameresco, Inc. Class A Common Stock" },
-    { symbol: "AMRZ", name: "Amrize Ltd Ordinary Shares" },
-    { symbol: "AMS", name: "American Shared Hospital Services Common Stock" },
-    { symbol: "AMT", name: "American Tower Corporation (REIT) Common Stock" },
-    { symbol: "AMTB", name: "Amerant Bancorp Inc. Class A Common Stock" },
-    { symbol: "AMTD", name: "AMTD IDEA Group American Depositary Shares, each representing six (6) Class A Ordinary Shares" },
-    { symbol: "AMTM", name: "Amentum Holdings, Inc. Common Stock" },
-    { symbol: "AMUB", name: "ETRACS Alerian MLP Index ETN Series B due July 18, 2042" },
-    { symbol: "AMWL", name: "American Well Corporation Class A Common Stock" },
-    { symbol: "AMX", name: "America Movil, S.A.B. de C.V. American Depositary Shares (each representing the right to receive twenty (20) Series B Shares" },
-    { symbol: "AMZA", name: "InfraCap MLP ETF" },
-    { symbol: "AMZE", name: "Amaze Holdings, Inc. Common Stock" },
-    { symbol: "AMZP", name: "Kurv Yield Premium Strategy Amazon (AMZN) ETF" },
-    { symbol: "AMZW", name: "Roundhill ETF Trust Roundhill AMZN WeeklyPay ETF" },
-    { symbol: "AMZY", name: "Tidal ETF Trust II YieldMax AMZN Option Income Strategy ETF" },
-    { symbol: "AN", name: "AutoNation, Inc. Common Stock" },
-    { symbol: "ANET", name: "Arista Networks, Inc. Common Stock" },
-    { symbol: "ANEW", name: "ProShares MSCI Transformational Changes ETF" },
-    { symbol: "ANF", name: "Abercrombie & Fitch Company Common Stock" },
-    { symbol: "ANG$B", name: "American National Group Inc. Depositary Shares, each representing a 1/1,000th interest in a share of 6.625% Fixed-Rate Reset Non-Cumulative Preferred Stock, Series B" },
-    { symbol: "ANG$D", name: "American National Group Inc. Depositary Shares, each representing a 1/1000th interest in a share of 7.375% Fixed-Rate Non-Cumulative Preferred Stock, Series D" },
-    { symbol: "ANRO", name: "Alto Neuroscience, Inc. Common Stock" },
-    { symbol: "ANVS", name: "Annovis Bio, Inc. Common Stock" },
-    { symbol: "AOA", name: "iShares Core 80/20 Aggressive Allocation ETF" },
-    { symbol: "AOCT", name: "Innovator Equity Defined Protection ETF - 2 Yr to October 2026" },
-    { symbol: "AOD", name: "abrdn Total Dynamic Dividend Fund Common Shares of Beneficial Interest" },
-    { symbol: "AOK", name: "iShares Core 30/70 Conservative Allocation ETF" },
-    { symbol: "AOM", name: "iShares Core 40/60 Moderate Allocation ETF" },
-    { symbol: "AOMD", name: "Angel Oak Mortgage REIT, Inc. 9.750% Senior Notes due 2030" },
-    { symbol: "AOMN", name: "Angel Oak Mortgage REIT, Inc. 9.500% Senior Notes due 2029" },
-    { symbol: "AOMR", name: "Angel Oak Mortgage REIT, Inc. Common Stock" },
-    { symbol: "AON", name: "Aon plc Class A Ordinary Shares (Ireland)" },
-    { symbol: "AOR", name: "iShares Core 60/40 Balanced Allocation ETF" },
-    { symbol: "AORT", name: "Artivion, Inc. Common Stock" },
-    { symbol: "AOS", name: "A.O. Smith Corporation Common Stock" },
-    { symbol: "AP", name: "Ampco-Pittsburgh Corporation Common Stock" },
-    { symbol: "APAM", name: "Artisan Partners Asset Management Inc. Class A Common Stock" },
-    { symbol: "APCB", name: "Trust for Professional Managers ActivePassive Core Bond ETF" },
-    { symbol: "APD", name: "Air Products and Chemicals, Inc. Common Stock" },
-    { symbol: "APG", name: "APi Group Corporation Common Stock" },
-    { symbol: "APH", name: "Amphenol Corporation Common Stock" },
-    { symbol: "APIE", name: "Trust for Professional Managers ActivePassive International Equity ETF" },
-    { symbol: "APLE", name: "Apple Hospitality REIT, Inc. Common Shares" },
-    { symbol: "APLU", name: "Allspring Exchange-Traded Funds Trust Allspring Core Plus ETF" },
-    { symbol: "APLX", name: "Tradr 2X Long APLD Daily ETF" },
-    { symbol: "APLY", name: "Tidal ETF Trust II YieldMax AAPL Option Income Strategy ETF" },
-    { symbol: "APMU", name: "Trust for Professional Managers ActivePassive Intermediate Municipal Bond ETF" },
-    { symbol: "APO", name: "Apollo Global Management, Inc. (New) Common Stock" },
-    { symbol: "APO$A", name: "Apollo Global Management, Inc. 6.75% Series A Mandatory Convertible Preferred Stock" },
-    { symbol: "APOC", name: "Innovator Equity Defined Protection ETF - 6mo Apr/Oct" },
-    { symbol: "APOS", name: "Apollo Global Management, Inc. 7.625% Fixed-Rate Resettable Junior Subordinated Notes due 2053" },
-    { symbol: "APRH", name: "Innovator ETFs Trust Innovator Premium Income 20 Barrier ETF - April" },
-    { symbol: "APRJ", name: "Innovator ETFs Trust Innovator Premium Income 30 Barrier ETF - April" },
-    { symbol: "APRP", name: "PGIM S&P 500 Buffer 12 ETF - April" },
-    { symbol: "APRT", name: "AllianzIM U.S. Large Cap Buffer10 Apr ETF" },
-    { symbol: "APRW", name: "AllianzIM U.S. Large Cap Buffer20 Apr ETF" },
-    { symbol: "APRZ", name: "TrueShares Structured Outcome (April) ETF" },
-    { symbol: "APT", name: "Alpha Pro Tech, Ltd. Common Stock" },
-    { symbol: "APTV", name: "Aptiv PLC Ordinary Shares" },
-    { symbol: "APUE", name: "Trust for Professional Managers ActivePassive U.S. Equity ETF" },
-    { symbol: "APUS", name: "Apimeds Pharmaceuticals US, Inc. Common Stock" },
-    { symbol: "APXM", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Max Buffer ETF - April" },
-    { symbol: "AQLT", name: "iShares Trust iShares MSCI Global Quality Factor ETF" },
-    { symbol: "AQN", name: "Algonquin Power & Utilities Corp. Common Shares" },
-    { symbol: "AQNB", name: "Algonquin Power & Utilities Corp. 6.20% Fixed-to-Floating Subordinated Notes Series 2019-A due July 1, 2079" },
-    { symbol: "AR", name: "Antero Resources Corporation Common Stock" },
-    { symbol: "ARB", name: "AltShares Merger Arbitrage ETF" },
-    { symbol: "ARCM", name: "Arrow Reserve Capital Management ETF" },
-    { symbol: "ARCO", name: "Arcos Dorados Holdings Inc. Class A Shares" },
-    { symbol: "ARCX", name: "Tradr 2X Long ACHR Daily ETF" },
-    { symbol: "ARDC", name: "Ares Dynamic Credit Allocation Fund, Inc. Common Shares" },
-    { symbol: "ARDT", name: "Ardent Health, Inc. Common Stock" },
-    { symbol: "ARE", name: "Alexandria Real Estate Equities, Inc. Common Stock" },
-    { symbol: "AREA", name: "Harbor ETF Trust Harbor AlphaEdge Next Generation REITs ETF" },
-    { symbol: "AREN", name: "The Arena Group Holdings, Inc. Common Stock" },
-    { symbol: "ARES", name: "Ares Management Corporation Class A Common Stock" },
-    { symbol: "ARES$B", name: "Ares Management Corporation 6.75% Series B Mandatory Convertible Preferred Stock" },
-    { symbol: "ARGD", name: "Argo Group International Holdings, Ltd. 6.5% Senior Notes Due 2042" },
-    { symbol: "ARGO$A", name: "Argo Group International Holdings, Inc. Depositary Shares, Each Representing a 1/1,000th Interest in a 7.00% Resettable Fixed Rate Preference Share, Series A" },
-    { symbol: "ARGT", name: "Global X MSCI Argentina ETF" },
-    { symbol: "ARI", name: "Apollo Commercial Real Estate Finance, Inc" },
-    { symbol: "ARIS", name: "Aris Water Solutions, Inc. Class A Common Stock" },
-    { symbol: "ARKA", name: "EA Series Trust ARK 21Shares Active Bitcoin Futures Strategy ETF" },
-    { symbol: "ARKB", name: "ARK 21Shares Bitcoin ETF Common Shares of Beneficial Interests" },
-    { symbol: "ARKD", name: "EA Series Trust ARK 21Shares Blockchain and Digital Economy Innovation ETF" },
-    { symbol: "ARKF", name: "ARK Fintech Innovation ETF" },
-    { symbol: "ARKG", name: "ARK Genomic Revolution ETF" },
-    { symbol: "ARKK", name: "ARK Innovation ETF" },
-    { symbol: "ARKQ", name: "ARK Autonomous Technology & Robotics ETF" },
-    { symbol: "ARKW", name: "ARK Next Generation Internet ETF" },
-    { symbol: "ARKX", name: "ARK Space Exploration & Innovation ETF" },
-    { symbol: "ARKZ", name: "EA Series Trust ARK 21Shares Active Ethereum Futures Strategy ETF" },
-    { symbol: "ARL", name: "American Realty Investors, Inc. Common Stock" },
-    { symbol: "ARLO", name: "Arlo Technologies, Inc. Common Stock" },
-    { symbol: "ARLU", name: "SHL Telemedicine Ltd AllianzIM U.S. Equity Buffer15 Uncapped Apr ETF" },
-    { symbol: "ARMH", name: "Precidian ETFs Trust Arm Holdings PLC ADRhedged" },
-    { symbol: "ARMK", name: "Aramark Common Stock" },
-    { symbol: "ARMN", name: "Aris Mining Corporation Common Shares" },
-    { symbol: "ARMP", name: "Armata Pharmaceuticals, Inc. Common Stock" },
-    { symbol: "ARMU", name: "ETF Opportunities Trust T-REX 2X Long ARM Daily Target ETF" },
-    { symbol: "AROC", name: "Archrock, Inc. Common Stock" },
-    { symbol: "ARP", name: "The Advisors Inner Circle Fund II PMV Adaptive Risk Parity ETF" },
-    { symbol: "ARR", name: "ARMOUR Residential REIT, Inc." },
-    { symbol: "ARR$C", name: "ARMOUR Residential REIT, Inc. 7% Series C Cumulative Redeemable Preferred Stock (liquidation preference $25.00 per share)" },
-    { symbol: "ARTY", name: "iShares Future AI & Tech ETF" },
-    { symbol: "ARW", name: "Arrow Electronics, Inc. Common Stock" },
-    { symbol: "ARX", name: "Accelerant Holdings Class A Common Shares" },
-    { symbol: "AS", name: "Amer Sports, Inc. Ordinary Shares" },
-    { symbol: "ASA", name: "ASA  Gold and Precious Metals Limited" },
-    { symbol: "ASAN", name: "Asana, Inc. Class A Common Stock" },
-    { symbol: "ASB", name: "Associated Banc-Corp Common Stock" },
-    { symbol: "ASB$E", name: "Associated Banc-Corp Depositary Shares, each representing a 1/40th interest in a share of 5.875% Non-Cumulative Perpetual Preferred Stock, Series E" },
-    { symbol: "ASB$F", name: "Associated Banc-Corp Depositary Shares, each representing a 1/40th interest in a share of Associated Banc-Corp 5.625% Non-Cumulative Perpetual Preferred Stock, Series F" },
-    { symbol: "ASBA", name: "Associated Banc-Corp 6.625% Fixed-Rate Reset Subordinated Notes due 2033" },
-    { symbol: "ASC", name: "Ardmore Shipping Corporation Common Stock" },
-    { symbol: "ASCE", name: "Allspring Exchange-Traded Funds Trust Allspring SMID Core ETF" },
-    { symbol: "ASEA", name: "Global X FTSE Southeast Asia ETF" },
-    { symbol: "ASG", name: "Liberty All-Star Growth Fund, Inc." },
-    { symbol: "ASGI", name: "abrdn Global Infrastructure Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "ASGM", name: "Virtus ETF Trust II Virtus AlphaSimplex Global Macro ETF" },
-    { symbol: "ASGN", name: "ASGN Incorporated Common Stock" },
-    { symbol: "ASH", name: "Ashland Inc. Common Stock" },
-    { symbol: "ASHR", name: "Xtrackers Harvest CSI 300 China A-Shares ETF" },
-    { symbol: "ASHS", name: "Xtrackers Harvest CSI 500 China A-Shares Small Cap ETF" },
-    { symbol: "ASIA", name: "Matthews International Funds Matthews Pacific Tiger Active ETF" },
-    { symbol: "ASIC", name: "Ategrity Specialty Insurance Company Holdings Common Stock" },
-    { symbol: "ASIX", name: "AdvanSix Inc. Common Stock " },
-    { symbol: "ASLV", name: "Allspring Exchange-Traded Funds Trust Allspring Special Large Value ETF" },
-    { symbol: "ASM", name: "Avino Silver & Gold Mines Ltd. Common Shares (Canada)" },
-    { symbol: "ASMF", name: "Virtus ETF Trust II Virtus AlphaSimplex Managed Futures ETF" },
-    { symbol: "ASMH", name: "Precidian ETFs Trust ASML Holding NV ADRhedged" },
-    { symbol: "ASPN", name: "Aspen Aerogels, Inc. Common Stock" },
-    { symbol: "ASR", name: "Grupo Aeroportuario del Sureste, S.A. de C.V. Common Stock" },
-    { symbol: "ASTX", name: "Tradr 2X Long ASTS Daily ETF" },
-    { symbol: "ASX", name: "ASE Technology Holding Co., Ltd. American Depositary Shares (each representing Two Common Shares) " },
-    { symbol: "ATCH", name: "AtlasClear Holdings, Inc. Common Stock" },
-    { symbol: "ATCO$H", name: "Atlas Corp. 7.875% Series H" },
-    { symbol: "ATEN", name: "A10 Networks, Inc. Common Stock" },
-    { symbol: "ATEST", name: "Tick Pilot Test Control Common Stock" },
-    { symbol: "ATEST.A", name: "Tick Pilot Test Group 1 Common Stock" },
-    { symbol: "ATEST.B", name: "Tick pilot Test 2 Common Stock" },
-    { symbol: "ATEST.C", name: "Tick Pilot Test 3 Common Stock" },
-    { symbol: "ATFV", name: "Alger 35 ETF" },
-    { symbol: "ATGE", name: "Adtalem Global Education Inc. Common Stock" },
-    { symbol: "ATH$A", name: "Athene Holding Ltd. Depositary Shares, Each Representing a 1/1,000th Interest in a 6.35% Fixed-to-Floating Rate Perpetual Non-Cumulative Preference Share, Series A" },
-    { symbol: "ATH$B", name: "Athene Holding Ltd. Depositary Shares, Each Representing a 1/1,000th Interest in a 5.625% Fixed Rate Perpetual Non- Cumulative Preference Share, Series B, par value $1.00 per share" },
-    { symbol: "ATH$D", name: "Athene Holding Ltd. Depositary Shares, Each Representing a 1/1,000th Interest in a 4.875% Fixed-Rate Perpetual Non-Cumulative Preference Share, Series D" },
-    { symbol: "ATH$E", name: "Athene Holding Ltd. Depositary Shares, Each Representing a 1/1,000th Interest in a 7.750% Fixed-Rate Reset Perpetual Non-Cumulative Preference Share, Series E" },
-    { symbol: "ATHM", name: "Autohome Inc. American Depositary Shares, each representing four class A ordinary shares." },
-    { symbol: "ATHS", name: "Athene Holding Ltd. 7.250% Fixed-Rate Reset Junior Subordinated Debentures due 2064" },
-    { symbol: "ATI", name: "ATI Inc. Common Stock" },
-    { symbol: "ATKR", name: "Atkore Inc. Common Stock" },
-    { symbol: "ATMP", name: "iPath Select MLP ETN" },
-    { symbol: "ATMU", name: "Atmus Filtration Technologies Inc. Common Stock" },
-    { symbol: "ATNM", name: "Actinium Pharmaceuticals, Inc. (Delaware) Common Stock" },
-    { symbol: "ATO", name: "Atmos Energy Corporation Common Stock" },
-    { symbol: "ATR", name: "AptarGroup, Inc. Common Stock" },
-    { symbol: "ATS", name: "ATS Corporation Common Shares" },
-    { symbol: "ATUS", name: "Altice USA, Inc. Class A Common Stock" },
-    { symbol: "AU", name: "AngloGold Ashanti PLC Ordinary Shares" },
-    { symbol: "AUB", name: "Atlantic Union Bankshares Corporation Common Stock" },
-    { symbol: "AUB$A", name: "Atlantic Union Bankshares Corporation Depositary Shares each representing a 1/400th ownership interest in a share of 6.875% Perpetual Non-Cumulative Preferred Stock, Series A" },
-    { symbol: "AUGM", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Max Buffer ETF - August" },
-    { symbol: "AUGP", name: "PGIM S&P 500 Buffer 12 ETF - August" },
-    { symbol: "AUGT", name: "AIM ETF Products Trust AllianzIM U.S. Large Cap Buffer10 Aug ETF" },
-    { symbol: "AUGU", name: "AIM ETF Products Trust AllianzIM U.S. Equity Buffer15 Uncapped Aug ETF" },
-    { symbol: "AUGW", name: "AIM ETF Products Trust AllianzIM U.S. Large Cap Buffer20 Aug ETF" },
-    { symbol: "AUGZ", name: "TrueShares Structured Outcome (August) ETF" },
-    { symbol: "AUNA", name: "Auna SA Class A Ordinary Shares" },
-    { symbol: "AUSF", name: "Global X Funds Global X Adaptive U.S. Factor ETF" },
-    { symbol: "AUSM", name: "Allspring Exchange-Traded Funds Trust Allspring Ultra Short Municipal ETF" },
-    { symbol: "AUST", name: "Austin Gold Corp. Common Shares" },
-    { symbol: "AVA", name: "Avista Corporation Common Stock" },
-    { symbol: "AVAL", name: "Grupo Aval Acciones y Valores S.A. ADR (Each representing 20 preferred shares)" },
-    { symbol: "AVB", name: "AvalonBay Communities, Inc. Common Stock" },
-    { symbol: "AVBC", name: "Avidia Bancorp, Inc. Common Stock" },
-    { symbol: "AVD", name: "American Vanguard Corporation Common Stock ($0.10 Par Value)" },
-    { symbol: "AVDE", name: "Avantis International Equity ETF" },
-    { symbol: "AVDS", name: "American Century ETF Trust Avantis International Small Cap Equity ETF" },
-    { symbol: "AVDV", name: "Avantis International Small Cap Value ETF" },
-    { symbol: "AVEE", name: "American Century ETF Trust Avantis Emerging Markets Small Cap Equity ETF" },
-    { symbol: "AVEM", name: "Avantis Emerging Markets Equity ETF" },
-    { symbol: "AVES", name: "Avantis Emerging Markets Value ETF" },
-    { symbol: "AVGE", name: "American Century ETF Trust Avantis All Equity Markets ETF" },
-    { symbol: "AVGV", name: "American Century ETF Trust Avantis All Equity Markets Value ETF" },
-    { symbol: "AVGW", name: "Roundhill ETF Trust Roundhill AVGO WeeklyPay ETF" },
-    { symbol: "AVIE", name: "American Century ETF Trust Avantis Inflation Focused Equity ETF" },
-    { symbol: "AVIG", name: "Avantis Core Fixed Income ETF" },
-    { symbol: "AVIV", name: "Avantis International Large Cap Value ETF" },
-    { symbol: "AVK", name: "Advent Convertible and Income Fund" },
-    { symbol: "AVLC", name: "American Century ETF Trust Avantis U.S. Large Cap Equity ETF" },
-    { symbol: "AVLV", name: "Avantis U.S. Large Cap Value ETF" },
-    { symbol: "AVMA", name: "American Century ETF Trust Avantis Moderate Allocation ETF" },
-    { symbol: "AVMC", name: "American Century ETF Trust Avantis U.S. Mid Cap Equity ETF" },
-    { symbol: "AVMU", name: "Avantis Core Municipal Fixed Income ETF" },
-    { symbol: "AVMV", name: "American Century ETF Trust Avantis U.S. Mid Cap Value ETF" },
-    { symbol: "AVNM", name: "American Century ETF Trust Avantis All International Markets Equity ETF" },
-    { symbol: "AVNS", name: "Avanos Medical, Inc. Common Stock" },
-    { symbol: "AVNT", name: "Avient Corporation Common Stock" },
-    { symbol: "AVNV", name: "American Century ETF Trust Avantis All International Markets Value ETF" },
-    { symbol: "AVRE", name: "Avantis Real Estate ETF" },
-    { symbol: "AVSC", name: "American Century ETF Trust Avantis U.S Small Cap Equity ETF" },
-    { symbol: "AVSD", name: "American Century ETF Trust Avantis Responsible International Equity ETF" },
-    { symbol: "AVSE", name: "American Century ETF Trust Avantis Responsible Emerging Markets Equity ETF" },
-    { symbol: "AVSF", name: "Avantis Short-Term Fixed Income ETF" },
-    { symbol: "AVSU", name: "American Century ETF Trust Avantis Responsible U.S. Equity ETF" },
-    { symbol: "AVTR", name: "Avantor, Inc. Common Stock" },
-    { symbol: "AVUS", name: "Avantis U.S. Equity ETF" },
-    { symbol: "AVUV", name: "Avantis U.S. Small Cap Value ETF" },
-    { symbol: "AVY", name: "Avery Dennison Corporation Common Stock" },
-    { symbol: "AWAY", name: "Amplify ETF Trust Amplify Travel Tech ETF" },
-    { symbol: "AWEG", name: "The Alger ETF Trust Alger Weatherbie Enduring Growth ETF" },
-    { symbol: "AWF", name: "Alliancebernstein Global High Income Fund" },
-    { symbol: "AWI", name: "Armstrong World Industries Inc Common Stock" },
-    { symbol: "AWK", name: "American Water Works Company, Inc. Common Stock" },
-    { symbol: "AWP", name: "abrdn Global Premier Properties Fund Common Shares of Beneficial Interest" },
-    { symbol: "AWR", name: "American States Water Company Common Stock" },
-    { symbol: "AWX", name: "Avalon Holdings Corporation Common Stock" },
-    { symbol: "AX", name: "Axos Financial, Inc. Common Stock" },
-    { symbol: "AXIL", name: "AXIL Brands, Inc. Common Stock" },
-    { symbol: "AXL", name: "American Axle & Manufacturing Holdings, Inc. Common Stock" },
-    { symbol: "AXP", name: "American Express Company Common Stock" },
-    { symbol: "AXR", name: "AMREP Corporation Common Stock" },
-    { symbol: "AXS", name: "Axis Capital Holdings Limited Common Stock" },
-    { symbol: "AXS$E", name: "Axis Capital Holdings Limited Depositary Shares, each representing 1/100th interest in a share of a 5.50% Series E Preferred Shares" },
-    { symbol: "AXTA", name: "Axalta Coating Systems Ltd. Common Shares" },
-    { symbol: "AYI", name: "Acuity Inc. Common Stock" },
-    { symbol: "AZNH", name: "Precidian ETFs Trust AstraZeneca PLC ADRhedged" },
-    { symbol: "AZO", name: "AutoZone, Inc. Common Stock" },
-    { symbol: "AZTD", name: "Aztlan Global Stock Selection DM SMID ETF" },
-    { symbol: "AZTR", name: "Azitra Inc Common Stock" },
-    { symbol: "AZZ", name: "AZZ Inc." },
-    { symbol: "B", name: "Barrick Mining Corporation Common Shares" },
-    { symbol: "BA", name: "Boeing Company (The) Common Stock" },
-    { symbol: "BA$A", name: "Boeing Company (The) Depositary Shares, each representing a 1/20th interest in a share of 6.00% Series A Mandatory Convertible Preferred Stock, par value $1.00" },
-    { symbol: "BAB", name: "Invesco Taxable Municipal Bond ETF" },
-    { symbol: "BABA", name: "Alibaba Group Holding Limited American Depositary Shares each representing eight Ordinary share" },
-    { symbol: "BABO", name: "Tidal Trust II YieldMax BABA Option Income Strategy ETF" },
-    { symbol: "BAC", name: "Bank of America Corporation Common Stock" },
-    { symbol: "BAC$B", name: "Bank of America Corporation Depositary Shares, each representing a 1/1,000th interest in a share of 6.000% Non-Cumulative Preferred Stock, Series GG" },
-    { symbol: "BAC$E", name: "Bank of America Corporation Depositary Sh repstg 1/1000th Perp Pfd Ser E" },
-    { symbol: "BAC$K", name: "Bank of America Corporation Depositary Shares, each representing a 1/1,000th interest in a share of 5.875% Non- Cumulative Preferred Stock, Series HH" },
-    { symbol: "BAC$L", name: "Bank of America Corporation Non Cumulative Perpetual Conv Pfd Ser L" },
-    { symbol: "BAC$M", name: "Bank of America Corporation Depositary Shares, each representing a 1/1,000th interest in a share of 5.375% Non-Cumulative Preferred Stock, Series KK" },
-    { symbol: "BAC$N", name: "Bank of America Corporation Depositary shares, each representing 1/1,000th interest in a share of 5.000% Non-Cumulative Preferred Stock, Series LL" },
-    { symbol: "BAC$O", name: "Bank of America Corporation Depositary shares, each representing 1/1,000th interest in a share of 4.375% Non-Cumulative Preferred Stock, Series NN" },
-    { symbol: "BAC$P", name: "Bank of America Corporation Depositary Shares, each representing a 1/1,000th interest in a share of 4.125% Non-Cumulative Preferred Stock, Series PP" },
-    { symbol: "BAC$Q", name: "Bank of America Corporation Depositary shares, each representing 1/1,000th interest in a share of 4.250% Non-Cumulative Preferred Stock, Series QQ" },
-    { symbol: "BAC$S", name: "Bank of America Corporation Depositary shares, each representing 1/1,000th interest in a share of 4.750% Non-Cumulative Preferred Stock, Series SS" },
-    { symbol: "BAGY", name: "Amplify ETF Trust Amplify Bitcoin Max Income Covered Call ETF" },
-    { symbol: "BAH", name: "Booz Allen Hamilton Holding Corporation Common Stock" },
-    { symbol: "BAI", name: "BlackRock ETF Trust iShares A.I. Innovation and Tech Active ETF" },
-    { symbol: "BAK", name: "Braskem SA ADR" },
-    { symbol: "BALI", name: "iShares Advantage Large Cap Income ETF" },
-    { symbol: "BALL", name: "Ball Corporation Common Stock" },
-    { symbol: "BALT", name: "Innovator Defined Wealth Shield ETF" },
-    { symbol: "BALY", name: "Bally's Corporation Common Stock" },
-    { symbol: "BAM", name: "Brookfield Asset Management Inc Class A Limited Voting Shares" },
-    { symbol: "BAMA", name: "Brookstone Active ETF" },
-    { symbol: "BAMB", name: "Brookstone Intermediate Bond ETF" },
-    { symbol: "BAMD", name: "Brookstone Dividend Stock ETF" },
-    { symbol: "BAMG", name: "Brookstone Growth Stock ETF" },
-    { symbol: "BAMO", name: "Brookstone Opportunities ETF" },
-    { symbol: "BAMU", name: "Brookstone Ultra-Short Bond ETF" },
-    { symbol: "BAMV", name: "Brookstone Value Stock ETF" },
-    { symbol: "BAMY", name: "Brookstone Yield ETF" },
-    { symbol: "BANC", name: "Banc of California, Inc. Common Stock" },
-    { symbol: "BANC$F", name: "Banc of California, Inc. Depositary Shares, each representing a 1/40th interest in a share of 7.75% non-cumulative perpetual preferred stock, Series F" },
-    { symbol: "BAP", name: "Credicorp Ltd. Common Stock" },
-    { symbol: "BAPR", name: "Innovator U.S. Equity Buffer ETF - April " },
-    { symbol: "BAR", name: "GraniteShares Gold Trust Shares of Beneficial Interest" },
-    { symbol: "BARK", name: "BARK, Inc. Class A Common Stock" },
-    { symbol: "BARK.W", name: "BARK, Inc. Redeemable Warrants, each whole warrant exercisable for shares of Common Stock at an exercise price of $11.50 per share" },
-    { symbol: "BATL", name: "Battalion Oil Corporation Common Stock" },
-    { symbol: "BATT", name: "Amplify Lithium & Battery Technology ETF" },
-    { symbol: "BAUG", name: "Innovator U.S. Equity Buffer ETF - August" },
-    { symbol: "BAX", name: "Baxter International Inc. Common Stock" },
-    { symbol: "BB", name: "BlackBerry Limited Common Stock" },
-    { symbol: "BBAG", name: "JPMorgan BetaBuilders U.S. Aggregate Bond ETF" },
-    { symbol: "BBAI", name: "BigBear.ai, Inc. Common Stock" },
-    { symbol: "BBAI.W", name: "BigBear.ai, Inc. Redeemable Warrants, each exercisable for one share of Common Stock at an exercise price of $11.50 per share" },
-    { symbol: "BBAR", name: "Banco BBVA Argentina S.A. ADS" },
-    { symbol: "BBAX", name: "JPMorgan BetaBuilders Developed Asia Pacific-ex Japan ETF " },
-    { symbol: "BBBI", name: "BondBloxx ETF Trust BondBloxx BBB Rated 5-10 Year Corporate Bond ETF" },
-    { symbol: "BBBL", name: "BondBloxx ETF Trust BondBloxx BBB Rated 10+ Year Corporate Bond ETF" },
-    { symbol: "BBBS", name: "BondBloxx ETF Trust BondBloxx BBB Rated 1-5 Year Corporate Bond ETF" },
-    { symbol: "BBBY", name: "Bed Bath & Beyond, Inc. Common Stock" },
-    { symbol: "BBC", name: "Virtus LifeSci Biotech Clinical Trials ETF" },
-    { symbol: "BBCA", name: "JPMorgan BetaBuilders Canada ETF " },
-    { symbol: "BBCB", name: "JPMorgan BetaBuilders USD Investment Grade Corporate Bond ETF" },
-    { symbol: "BBD", name: "Banco Bradesco Sa American Depositary Shares" },
-    { symbol: "BBDC", name: "Barings BDC, Inc. Common Stock" },
-    { symbol: "BBDO", name: "Banco Bradesco Sa American Depositary Shares (each representing one Common Share)" },
-    { symbol: "BBEM", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan BetaBuilders Emerging Markets Equity ETF" },
-    { symbol: "BBEU", name: "JPMorgan BetaBuilders Europe ETF " },
-    { symbol: "BBHY", name: "JPMorgan BetaBuilders USD High Yield Corporate Bond ETF" },
-    { symbol: "BBIB", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan BetaBuilders U.S. Treasury Bond 3-10 Year ETF" },
-    { symbol: "BBIN", name: "JPMorgan BetaBuilders International Equity ETF" },
-    { symbol: "BBJP", name: "JPMorgan BetaBuilders Japan ETF " },
-    { symbol: "BBLB", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan BetaBuilders U.S. Treasury Bond 20+ Year ETF" },
-    { symbol: "BBLU", name: "EA Series Trust EA Bridgeway Blue Chip ETF" },
-    { symbol: "BBMC", name: "JPMorgan BetaBuilders U.S. Mid Cap Equity ETF" },
-    { symbol: "BBN", name: "BlackRock Taxable Municipal Bond Trust Common Shares of Beneficial Interest" },
-    { symbol: "BBP", name: "Virtus LifeSci Biotech Products ETF" },
-    { symbol: "BBRE", name: "JPMorgan BetaBuilders MSCI U.S. REIT ETF " },
-    { symbol: "BBSB", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan BetaBuilders U.S. Treasury Bond 1-3 Year ETF" },
-    { symbol: "BBSC", name: "JPMorgan BetaBuilders U.S. Small Cap Equity ETF" },
-    { symbol: "BBT", name: "Beacon Financial Corporation Common stock" },
-    { symbol: "BBU", name: "Brookfield Business Partners L.P. Limited Partnership Units " },
-    { symbol: "BBUC", name: "Brookfield Business Corporation Class A Exchangeable Subordinate Voting Shares" },
-    { symbol: "BBUS", name: "JPMorgan BetaBuilders U.S. Equity ETF" },
-    { symbol: "BBVA", name: "Banco Bilbao Vizcaya Argentaria S.A. Common Stock" },
-    { symbol: "BBW", name: "Build-A-Bear Workshop, Inc. Common Stock" },
-    { symbol: "BBWI", name: "Bath & Body Works, Inc." },
-    { symbol: "BBY", name: "Best Buy Co., Inc. Common Stock" },
-    { symbol: "BC", name: "Brunswick Corporation Common Stock" },
-    { symbol: "BC$A", name: "Brunswick Corporation 6.500% Senior Notes due 2048" },
-    { symbol: "BC$C", name: "Brunswick Corporation 6.375% Notes due 2049" },
-    { symbol: "BCAT", name: "BlackRock Capital Allocation Term Trust Common Shares of Beneficial Interest" },
-    { symbol: "BCC", name: "Boise Cascade, L.L.C. Common Stock" },
-    { symbol: "BCCC", name: "Global X Funds Global X Bitcoin Covered Call ETF" },
-    { symbol: "BCD", name: "abrdn Bloomberg All Commodity Longer Dated Strategy K-1 Free ETF" },
-    { symbol: "BCDF", name: "Listed Funds Trust Horizon Kinetics Blockchain Development ETF" },
-    { symbol: "BCE", name: "BCE, Inc. Common Stock" },
-    { symbol: "BCH", name: "Banco De Chile ADS" },
-    { symbol: "BCHI", name: "The 2023 ETF Series Trust II GMO Beyond China ETF" },
-    { symbol: "BCHP", name: "Principal Exchange-Traded Funds Principal Focused Blue Chip ETF" },
-    { symbol: "BCI", name: "abrdn Bloomberg All Commodity Strategy K-1 Free ETF" },
-    { symbol: "BCIL", name: "Exchange Listed Funds Trust Bancreek International Large Cap ETF" },
-    { symbol: "BCIM", name: "abrdn Bloomberg Industrial Metals Strategy K-1 Free ETF" },
-    { symbol: "BCO", name: "Brinks Company (The) Common Stock" },
-    { symbol: "BCOR", name: "Grayscale Funds Trust Grayscale Bitcoin Adopters ETF" },
-    { symbol: "BCS", name: "Barclays PLC Common Stock" },
-    { symbol: "BCSF", name: "Bain Capital Specialty Finance, Inc. Common Stock" },
-    { symbol: "BCUS", name: "Exchange Listed Funds Trust Bancreek U.S. Large Cap ETF" },
-    { symbol: "BCV", name: "Bancroft Fund, Ltd." },
-    { symbol: "BCV$A", name: "Bancroft Fund Limited 5.375% Series A Cumulative Preferred Shares" },
-    { symbol: "BCX", name: "BlackRock Resources Common Shares of Beneficial Interest" },
-    { symbol: "BDBT", name: "Exchange Traded Concepts Trust Bluemonte Core Bond ETF" },
-    { symbol: "BDC", name: "Belden Inc Common Stock" },
-    { symbol: "BDCX", name: "ETRACS Quarterly Pay 1.5x Leveraged MarketVector BDC Liquid Index ETN due June 10, 2050" },
-    { symbol: "BDCZ", name: "ETRACS MarketVector Business Development Companies Liquid Index ETN due April 26, 2041" },
-    { symbol: "BDEC", name: "Innovator U.S. Equity Buffer ETF - December" },
-    { symbol: "BDIV", name: "ETF Series Solutions AAM Brentview Dividend Growth ETF" },
-    { symbol: "BDJ", name: "Blackrock Enhanced Equity Dividend Trust" },
-    { symbol: "BDL", name: "Flanigan's Enterprises, Inc. Common Stock" },
-    { symbol: "BDN", name: "Brandywine Realty Trust Common Stock" },
-    { symbol: "BDRY", name: "Amplify Commodity Trust Breakwave Dry Bulk Shipping ETF" },
-    { symbol: "BDVG", name: "Litman Gregory Funds Trust IMGP Berkshire Dividend Growth ETF" },
-    { symbol: "BDX", name: "Becton, Dickinson and Company Common Stock" },
-    { symbol: "BE", name: "Bloom Energy Corporation Class A Common Stock" },
-    { symbol: "BEDU", name: "Bright Scholar Education Holdings Limited American Depositary Shares, each  representing four Class A Ordinary Share" },
-    { symbol: "BEDZ", name: "AdvisorShares Hotel ETF" },
-    { symbol: "BEGS", name: "Collaborative Investment Series Trust Rareview 2x Bull Cryptocurrency & Precious Metals ETF" },
-    { symbol: "BEKE", name: "KE Holdings Inc American Depositary Shares (each representing three Class A Ordinary Shares)" },
-    { symbol: "BEMB", name: "iShares Trust iShares J.P. Morgan Broad USD Emerging Markets Bond ETF" },
-    { symbol: "BEN", name: "Franklin Resources, Inc. Common Stock" },
-    { symbol: "BENJ", name: "Horizon Funds Horizon Landmark ETF" },
-    { symbol: "BEP", name: "Brookfield Renewable Partners L.P. Limited Partnership Units" },
-    { symbol: "BEP$A", name: "Brookfield Renewable Partners L.P. 5.25% Class A Preferred Limited Partnership Units, Series 17" },
-    { symbol: "BEPC", name: "Brookfield Renewable Corporation Brookfield Renewable Corporation Class A Subordinate Voting Shares" },
-    { symbol: "BEPH", name: "Brookfield BRP Holdings (Canada) Inc. 4.625% Perpetual Subordinated Notes" },
-    { symbol: "BEPI", name: "Brookfield BRP Holdings (Canada) Inc. 4.875% Perpetual Subordinated Notes" },
-    { symbol: "BEPJ", name: "Brookfield BRP Holdings (Canada) Inc. 7.250% Perpetual Subordinated Notes" },
-    { symbol: "BERZ", name: "MicroSectors FANG & Innovation -3x Inverse Leveraged ETN" },
-    { symbol: "BESF", name: "EA Series Trust Bastion Energy ETF" },
-    { symbol: "BETE", name: "ProShares Bitcoin & Ether Equal Weight ETF" },
-    { symbol: "BETH", name: "ProShares Bitcoin & Ether Market Cap Weight ETF" },
-    { symbol: "BETZ", name: "Roundhill Sports Betting & iGaming ETF" },
-    { symbol: "BF.A", name: "Brown Forman Inc Class A Common Stock" },
-    { symbol: "BF.B", name: "Brown Forman Inc Class B Common Stock" },
-    { symbol: "BFAM", name: "Bright Horizons Family Solutions Inc. Common Stock" },
-    { symbol: "BFAP", name: "First Trust Exchange-Traded Fund FT Vest Bitcoin Strategy Floor15 ETF   April" },
-    { symbol: "BFEB", name: "Innovator U.S. Equity Buffer ETF - February" },
-    { symbol: "BFH", name: "Bread Financial Holdings, Inc. Common Stock" },
-    { symbol: "BFIX", name: "Build Funds Trust Build Bond Innovation ETF" },
-    { symbol: "BFJL", name: "First Trust Exchange-Traded Fund FT Vest Bitcoin Strategy Floor15 ETF   July" },
-    { symbol: "BFK", name: "BlackRock Municipal Income Trust" },
-    { symbol: "BFLY", name: "Butterfly Network, Inc. Class A Common Stock" },
-    { symbol: "BFLY.W", name: "Butterfly Network, Inc. Warrants" },
-    { symbol: "BFOR", name: "Barron's 400 ETF" },
-    { symbol: "BFRE", name: "Ultimus Managers Trust Westwood LBRTY Global Equity ETF" },
-    { symbol: "BFRZ", name: "Innovator ETFs Trust Innovator Equity Managed 100 Buffer ETF" },
-    { symbol: "BFS", name: "Saul Centers, Inc. Common Stock" },
-    { symbol: "BFS$D", name: "Saul Centers, Inc. Depositary Shares, each representing 1/100th of a share of 6.125% Series D Cumulative Redeemable Preferred Stock" },
-    { symbol: "BFS$E", name: "Saul Centers, Inc. Depositary shares, each representing a 1/100th fractional interest in a share of 6.000% Series E Cumulative Redeemable Preferred Stock" },
-    { symbol: "BFZ", name: "BlackRock California Municipal Income Trust" },
-    { symbol: "BG", name: "Bunge Limited Common Shares" },
-    { symbol: "BGB", name: "Blackstone Strategic Credit 2027 Term Fund Common Shares of Beneficial Interest" },
-    { symbol: "BGDV", name: "ETF Series Solutions Bahl & Gaynor Dividend ETF" },
-    { symbol: "BGH", name: "Barings Global Short Duration High Yield Fund Common Shares of Beneficial Interests" },
-    { symbol: "BGI", name: "Birks Group Inc. Common Stock" },
-    { symbol: "BGIG", name: "ETF Series Solutions Bahl & Gaynor Income Growth ETF" },
-    { symbol: "BGLD", name: "FT Vest Gold Strategy Quarterly Buffer ETF" },
-    { symbol: "BGR", name: "BlackRock Energy and Resources Trust" },
-    { symbol: "BGS", name: "B&G Foods, Inc. Common Stock" },
-    { symbol: "BGSF", name: "BGSF, Inc. Common Stock" },
-    { symbol: "BGT", name: "BlackRock Floating Rate Income Trust" },
-    { symbol: "BGX", name: "Blackstone Long Short Credit Income Fund Common Shares" },
-    { symbol: "BGY", name: "Blackrock Enhanced International Dividend Trust" },
-    { symbol: "BH", name: "Biglari Holdings Inc. Class B Common Stock" },
-    { symbol: "BH.A", name: "Biglari Holdings Inc. Class A Common Stock" },
-    { symbol: "BHB", name: "Bar Harbor Bankshares, Inc. Common Stock" },
-    { symbol: "BHC", name: "Bausch Health Companies Inc. Common Stock" },
-    { symbol: "BHE", name: "Benchmark Electronics, Inc. Common Stock" },
-    { symbol: "BHK", name: "Blackrock Core Bond Trust" },
-    { symbol: "BHM", name: "Bluerock Homes Trust, Inc. Class A Common Stock" },
-    { symbol: "BHP", name: "BHP Group Limited American Depositary Shares (Each representing two Ordinary Shares)" },
-    { symbol: "BHR", name: "Braemar Hotels & Resorts Inc. Common Stock" },
-    { symbol: "BHR$B", name: "Braemar Hotels & Resorts Inc. 5.50% Series B Cumulative Convertible Preferred Stock, par value $0.01 per share" },
-    { symbol: "BHR$D", name: "Braemar Hotels & Resorts Inc. 8.25% Series D Cumulative Preferred Stock,  par value $0.01 per share" },
-    { symbol: "BHV", name: "BlackRock Virginia Municipal Bond Trust" },
-    { symbol: "BHVN", name: "Biohaven Ltd. Common Shares " },
-    { symbol: "BHYB", name: "DBX ETF Trust Xtrackers USD High Yield BB-B ex Financials ETF" },
-    { symbol: "BIBL", name: "Inspire 100 ETF" },
-    { symbol: "BIDD", name: "iShares International Dividend Active ETF" },
-    { symbol: "BIGY", name: "Tidal Trust II YieldMax Target 12 Big 50 Option Income ETF" },
-    { symbol: "BIL", name: "SPDR Bloomberg 1-3 Month T-Bill ETF" },
-    { symbol: "BILD", name: "Macquarie ETF Trust Macquarie Global Listed Infrastructure ETF" },
-    { symbol: "BILL", name: "BILL Holdings, Inc. Common Stock" },
-    { symbol: "BILS", name: "SPDR Bloomberg 3-12 Month T-Bill ETF" },
-    { symbol: "BILT", name: "BlackRock ETF Trust iShares Infrastructure Active ETF" },
-    { symbol: "BILZ", name: "PIMCO U.S. Treasury Index Fund PIMCO Ultra Short Government Active Exchange-Traded Fund" },
-    { symbol: "BINC", name: "iShares Flexible Income Active ETF" },
-    { symbol: "BINT", name: "Exchange Traded Concepts Trust Bluemonte Global Equity ETF" },
-    { symbol: "BINV", name: "Brandes International ETF" },
-    { symbol: "BIO", name: "Bio-Rad Laboratories, Inc. Class A Common Stock" },
-    { symbol: "BIO.B", name: "Bio-Rad Laboratories, Inc. Class B  Common Stock" },
-    { symbol: "BIP", name: "Brookfield Infrastructure Partners LP Limited Partnership Units" },
-    { symbol: "BIP$A", name: "Brookfield Infrastructure Partners LP 5.125% Class A Preferred Limited Partnership Units, Series 13" },
-    { symbol: "BIP$B", name: "Brookfield Infrastructure Partners LP 5.000% Class A Preferred Limited Partnership Units, Series 14" },
-    { symbol: "BIPC", name: "Brookfield Infrastructure Corporation Brookfield Infrastructure Corporation" },
-    { symbol: "BIPH", name: "Brookfield Infrastructure Corporation 5.000% Subordinated Notes due 2081" },
-    { symbol: "BIPI", name: "BIP Bermuda Holdings I Limited 5.125% Perpetual Subordinated Notes" },
-    { symbol: "BIPJ", name: "Brookfield Infrastructure Corporation 7.250% Subordinated Notes due 2084" },
-    { symbol: "BIRK", name: "Birkenstock Holding plc Ordinary Shares" },
-    { symbol: "BIT", name: "BlackRock Multi-Sector Income Trust Common Shares of Beneficial Interest" },
-    { symbol: "BITB", name: "Bitwise Bitcoin ETF Common Shares of Beneficial Interest" },
-    { symbol: "BITC", name: "Bitwise Trendwise Bitcoin and Treasuries Rotation Strategy ETF" },
-    { symbol: "BITI", name: "ProShares Short Bitcoin ETF" },
-    { symbol: "BITO", name: "ProShares Bitcoin ETF" },
-    { symbol: "BITQ", name: "Bitwise Crypto Industry Innovators ETF" },
-    { symbol: "BITU", name: "ProShares Trust ProShares Ultra Bitcoin ETF" },
-    { symbol: "BITX", name: "Volatility Shares Trust 2x Bitcoin Strategy ETF" },
-    { symbol: "BITY", name: "Amplify Bitcoin 2% Monthly Option Income ETF" },
-    { symbol: "BIV", name: "Vanguard Intermediate-Term Bond ETF" },
-    { symbol: "BIZD", name: "VanEck BDC Income ETF " },
-    { symbol: "BJ", name: "BJ's Wholesale Club Holdings, Inc. Common Stock" },
-    { symbol: "BJAN", name: "Innovator U.S. Equity Buffer ETF - January" },
-    { symbol: "BJUL", name: "Innovator U.S. Equity Buffer ETF - July" },
-    { symbol: "BJUN", name: "Innovator U.S. Equity Buffer ETF - June" },
-    { symbol: "BK", name: "The Bank of New York Mellon Corporation Common Stock" },
-    { symbol: "BK$K", name: "The Bank Of New York Mellon Corporation  Depositary Shares, each representing a 1/4,000th interest in a share of Series K Noncumulative Perpetual Preferred Stock" },
-    { symbol: "BKAG", name: "BNY Mellon Core Bond ETF" },
-    { symbol: "BKCG", name: "BNY Mellon ETF Trust II BNY Mellon Concentrated Growth ETF" },
-    { symbol: "BKCI", name: "BNY Mellon ETF Trust BNY Mellon Concentrated International ETF" },
-    { symbol: "BKD", name: "Brookdale Senior Living Inc. Common Stock" },
-    { symbol: "BKDV", name: "BNY Mellon ETF Trust II BNY Mellon Dynamic Value ETF" },
-    { symbol: "BKE", name: "Buckle, Inc. (The) Common Stock" },
-    { symbol: "BKEM", name: "BNY Mellon Emerging Markets Equity ETF" },
-    { symbol: "BKF", name: "iShares MSCI BIC ETF" },
-    { symbol: "BKGI", name: "BNY Mellon ETF Trust BNY Mellon Global Infrastructure Income ETF" },
-    { symbol: "BKH", name: "Black Hills Corporation Common Stock" },
-    { symbol: "BKHY", name: "BNY Mellon High Yield ETF" },
-    { symbol: "BKIE", name: "BNY Mellon International Equity ETF" },
-    { symbol: "BKKT", name: "Bakkt Holdings, Inc. Class A Common Stock" },
-    { symbol: "BKKT.W", name: "Bakkt Holdings, Inc. Warrant" },
-    { symbol: "BKLC", name: "BNY Mellon US Large Cap Core Equity ETF" },
-    { symbol: "BKLN", name: "Invesco Senior Loan ETF" },
-    { symbol: "BKMC", name: "BNY Mellon US Mid Cap Core Equity ETF" },
-    { symbol: "BKN", name: "BlackRock Investment Quality Municipal Trust Inc. (The)" },
-    { symbol: "BKSE", name: "BNY Mellon US Small Cap Core Equity ETF" },
-    { symbol: "BKSY", name: "BlackSky Technology Inc. Class A Common Stock" },
-    { symbol: "BKSY.W", name: "BlackSky Technology Inc. Redeemable Warrants, each whole Warrant exercisable for one share of Class A Common Stock" },
-    { symbol: "BKT", name: "BlackRock Income Trust Inc. (The)" },
-    { symbol: "BKTI", name: "BK Technologies Corporation Common Stock" },
-    { symbol: "BKU", name: "BankUnited, Inc. Common Stock" },
-    { symbol: "BKUI", name: "BNY Mellon Ultra Short Income ETF" },
-    { symbol: "BKV", name: "BKV Corporation Common Stock" },
-    { symbol: "BLCO", name: "Bausch + Lomb Corporation Common Shares" },
-    { symbol: "BLCV", name: "iShares Large Cap Value Active ETF" },
-    { symbol: "BLD", name: "TopBuild Corp. Common Stock" },
-    { symbol: "BLDG", name: "Cambria Global Real Estate ETF" },
-    { symbol: "BLDR", name: "Builders FirstSource, Inc. Common Stock" },
-    { symbol: "BLE", name: "BlackRock Municipal Income Trust II" },
-    { symbol: "BLES", name: "Inspire Global Hope ETF" },
-    { symbol: "BLGR", name: "Exchange Traded Concepts Trust Bluemonte Large Cap Growth ETF" },
-    { symbol: "BLK", name: "BlackRock, Inc. Common Stock" },
-    { symbol: "BLKC", name: "Invesco Alerian Galaxy Blockchain Users and Decentralized Commerce ETF" },
-    { symbol: "BLND", name: "Blend Labs, Inc. Class A Common Stock" },
-    { symbol: "BLOK", name: "Amplify Transformational Data Sharing ETF" },
-    { symbol: "BLOX", name: "Tidal Trust II Nicholas Crypto Income ETF" },
-    { symbol: "BLSH", name: "Bullish Ordinary Shares" },
-    { symbol: "BLST", name: "Exchange Traded Concepts Trust Bluemonte Short Term Bond ETF" },
-    { symbol: "BLTD", name: "Exchange Traded Concepts Trust Bluemonte Long Term Bond ETF" },
-    { symbol: "BLUC", name: "Exchange Traded Concepts Trust Bluemonte Large Cap Core ETF" },
-    { symbol: "BLUI", name: "Exchange Traded Concepts Trust Bluemonte Diversified Income ETF" },
-    { symbol: "BLUX", name: "Exchange Traded Concepts Trust Bluemonte Dynamic Total Market ETF" },
-    { symbol: "BLV", name: "Vanguard Long-Term Bond ETF" },
-    { symbol: "BLW", name: "Blackrock Limited Duration Income Trust" },
-    { symbol: "BLX", name: "Banco Latinoamericano de Comercio Exterior, S.A." },
-    { symbol: "BMA", name: "Banco Macro S.A.  ADR (representing Ten Class B Common Shares)" },
-    { symbol: "BMAR", name: "Innovator U.S. Equity Buffer ETF - March" },
-    { symbol: "BMAY", name: "Innovator U.S. Equity Buffer ETF - May" },
-    { symbol: "BME", name: "Blackrock Health Sciences Trust" },
-    { symbol: "BMED", name: "iShares Health Innovation Active ETF" },
-    { symbol: "BMEZ", name: "BlackRock Health Sciences Term Trust Common Shares of Beneficial Interest" },
-    { symbol: "BMI", name: "Badger Meter, Inc. Common Stock" },
-    { symbol: "BML$G", name: "Bank of America Corporation Depositary Shares (Each representing a 1/1200th interest in a share of Floating Rate Non-Cumulative Preferred Stock , Series 1)" },
-    { symbol: "BML$H", name: "Bank of America Corporation Depositary Shares (Each representing a 1/1200th interest in a Share of Floating Rate Non-Cumulative Preferred Stock, Series 2)" },
-    { symbol: "BML$J", name: "Bank of America Corporation Depositary Shares (Each representing a 1/1200th interest in a Share of Floating Rate Non-Cumulative Preferred Stock, Series 4)" },
-    { symbol: "BML$L", name: "Bank of America Corporation Depositary Shares (Each representing a 1/1200th Interest in a Share of Floating Rate Non-Cumulative Preferred Stock, Series 5)" },
-    { symbol: "BMN", name: "BlackRock 2037 Municipal Target Term Trust Common Shares of Beneficial Interest" },
-    { symbol: "BMNR", name: "BitMine Immersion Technologies, Inc. Common Stock" },
-    { symbol: "BMO", name: "Bank Of Montreal Common Stock" },
-    { symbol: "BMVP", name: "Invesco Bloomberg MVP Multi-factor ETF" },
-    { symbol: "BMY", name: "Bristol-Myers Squibb Company Common Stock" },
-    { symbol: "BN", name: "Brookfield Corporation Class A Limited Voting Shares" },
-    { symbol: "BNDC", name: "FlexShares Core Select Bond Fund" },
-    { symbol: "BNDD", name: "Quadratic Deflation ETF" },
-    { symbol: "BNDI", name: "NEOS ETF Trust NEOS Enhanced Income Aggregate Bond ETF" },
-    { symbol: "BNDS", name: "Series Portfolios Trust Infrastructure Capital Bond Income ETF" },
-    { symbol: "BNDY", name: "Horizon Funds Horizon Core Bond ETF" },
-    { symbol: "BNED", name: "Barnes & Noble Education, Inc Common Stock" },
-    { symbol: "BNGE", name: "First Trust S-Network Streaming and Gaming ETF" },
-    { symbol: "BNH", name: "Brookfield Finance Inc. 4.625% Subordinated Notes due October 16, 2080" },
-    { symbol: "BNJ", name: "Brookfield Finance Inc. 4.50% Perpetual Subordinated Notes" },
-    { symbol: "BNKD", name: "Bank Of Montreal MicroSectors  U.S. Big Banks -3  Inverse Leveraged ETNs due February 17, 2045" },
-    { symbol: "BNKU", name: "Bank Of Montreal MicroSectors  U.S. Big Banks 3  Leveraged ETNs due February 17, 2045" },
-    { symbol: "BNL", name: "Broadstone Net Lease, Inc. Common Stock" },
-    { symbol: "BNO", name: "United States Brent Oil Fund, LP ETV" },
-    { symbol: "BNOV", name: "Innovator U.S. Equity Buffer ETF - November" },
-    { symbol: "BNS", name: "Bank Nova Scotia Halifax Pfd 3 Ordinary Shares" },
-    { symbol: "BNT", name: "Brookfield Wealth Solutions Ltd. Class A Exchangeable Limited Voting Shares" },
-    { symbol: "BNY", name: "BlackRock New York Municipal Income Trust" },
-    { symbol: "BOAT", name: "SonicShares Global Shipping ETF" },
-    { symbol: "BOBP", name: "Exchange Traded Concepts Trust CORE16 Best of Breed Premier Index ETF" },
-    { symbol: "BOC", name: "Boston Omaha Corporation Class A Common Stock" },
-    { symbol: "BOCT", name: "Innovator U.S. Equity Buffer ETF - October" },
-    { symbol: "BOE", name: "Blackrock Enhanced Global Dividend Trust Common Shares of Beneficial Interest" },
-    { symbol: "BOH", name: "Bank of Hawaii Corporation Common Stock" },
-    { symbol: "BOH$A", name: "Bank of Hawaii Corporation Depositary Shares Each Representing a 1/40th Interest in a Share of 4.375% Fixed Rate Non-Cumulative Perpetual Preferred Stock, Series A" },
-    { symbol: "BOH$B", name: "Bank of Hawaii Corporation Depositary Shares, Each Representing a 1/40th Interest in a Share of 8.000% Fixed Rate Non-Cumulative Perpetual Preferred Stock, Series B" },
-    { symbol: "BOIL", name: "ProShares Ultra Bloomberg Natural Gas" },
-    { symbol: "BOND", name: "PIMCO Active Bond Exchange-Traded Fund Exchange-Traded Fund" },
-    { symbol: "BOOT", name: "Boot Barn Holdings, Inc. Common Stock" },
-    { symbol: "BORR", name: "Borr Drilling Limited Common Shares" },
-    { symbol: "BOUT", name: "Innovator IBD Breakout Opportunities ETF" },
-    { symbol: "BOW", name: "Bowhead Specialty Holdings Inc. Common Stock" },
-    { symbol: "BOX", name: "Box, Inc. Class A Common Stock" },
-    { symbol: "BOXA", name: "EA Series Trust Alpha Architect Aggregate Bond ETF" },
-    { symbol: "BOXX", name: "EA Series Trust Alpha Architect 1-3 Month Box ETF" },
-    { symbol: "BP", name: "BP p.l.c. Common Stock" },
-    { symbol: "BPAY", name: "iShares FinTech Active ETF" },
-    { symbol: "BPH", name: "Precidian ETFs Trust BP plc ADRhedged" },
-    { symbol: "BPI", name: "Grayscale Funds Trust Grayscale Bitcoin Premium Income ETF" },
-    { symbol: "BQ", name: "Boqii Holding Limited Class A Ordinary Shares" },
-    { symbol: "BR", name: "Broadridge Financial Solutions, Inc. Common Stock" },
-    { symbol: "BRAZ", name: "Global X Funds Global X Brazil Active ETF" },
-    { symbol: "BRBR", name: "BellRing Brands, Inc. Common Stock " },
-    { symbol: "BRBS", name: "Blue Ridge Bankshares, Inc. Common Stock" },
-    { symbol: "BRC", name: "Brady Corporation Common Stock" },
-    { symbol: "BRCC", name: "BRC Inc. Class A Common Stock" },
-    { symbol: "BRF", name: "VanEck Brazil Small-Cap ETF" },
-    { symbol: "BRFS", name: "BRF S.A." },
-    { symbol: "BRIA", name: "BrilliA Inc Class A Ordinary Shares" },
-    { symbol: "BRIF", name: "NEOS ETF Trust FIS Bright Portfolios Focused Equity ETF" },
-    { symbol: "BRK.A", name: "Berkshire Hathaway Inc. Common Stock" },
-    { symbol: "BRK.B", name: "Berkshire Hathaway Inc. New Common Stock" },
-    { symbol: "BRKC", name: "Tidal Trust II YieldMax BRK.B Option Income Strategy ETF" },
-    { symbol: "BRKW", name: "Roundhill ETF Trust Roundhill BRKB WeeklyPay ETF" },
-    { symbol: "BRLN", name: "iShares Floating Rate Loan Active ETF" },
-    { symbol: "BRN", name: "Barnwell Industries, Inc. Common Stock" },
-    { symbol: "BRO", name: "Brown & Brown, Inc. Common Stock" },
-    { symbol: "BROS", name: "Dutch Bros Inc. Class A Common Stock" },
-    { symbol: "BRSL", name: "Brightstar Lottery PLC Trading under the Legal Name to begin at the market open on July 21, 2025. Ordinary Shares" },
-    { symbol: "BRSP", name: "BrightSpire Capital, Inc. Class A Common Stock" },
-    { symbol: "BRT", name: "BRT Apartments Corp. (MD) Common Stock" },
-    { symbol: "BRW", name: "Saba Capital Income & Opportunities Fund SBI" },
-    { symbol: "BRX", name: "Brixmor Property Group Inc. Common Stock" },
-    { symbol: "BRZU", name: "Direxion Daily Brazil Bull 2X Shares" },
-    { symbol: "BSAC", name: "Banco Santander - Chile ADS" },
-    { symbol: "BSBR", name: "Banco Santander Brasil SA American Depositary Shares, each representing one unit" },
-    { symbol: "BSEP", name: "Innovator U.S. Equity Buffer ETF - September" },
-    { symbol: "BSL", name: "Blackstone Senior Floating Rate 2027 Term Fund Common Shares of Beneficial Interest" },
-    { symbol: "BSM", name: "Black Stone Minerals, L.P. Common units representing limited partner interests" },
-    { symbol: "BSMC", name: "Brandes U.S. Small-Mid Cap Value ETF" },
-    { symbol: "BSR", name: "Northern Lights Fund Trust II Beacon Selective Risk ETF" },
-    { symbol: "BST", name: "BlackRock Science and Technology Trust Common Shares of Beneficial Interest" },
-    { symbol: "BSTP", name: "Innovator ETFs Trust Innovator Buffer Step-Up Strategy ETF" },
-    { symbol: "BSTZ", name: "BlackRock Science and Technology Term Trust Common Shares of Beneficial Interest" },
-    { symbol: "BSV", name: "Vanguard Short-Term Bond ETF" },
-    { symbol: "BSX", name: "Boston Scientific Corporation Common Stock" },
-    { symbol: "BTA", name: "BlackRock Long-Term Municipal Advantage Trust Common Shares of Beneficial Interest" },
-    { symbol: "BTAL", name: "AGF U.S. Market Neutral Anti-Beta Fund" },
-    { symbol: "BTC", name: "Grayscale Bitcoin Mini Trust (BTC) Common units of fractional undivided beneficial interest" },
-    { symbol: "BTCC", name: "Grayscale Funds Trust Grayscale Bitcoin Covered Call ETF" },
-    { symbol: "BTCI", name: "NEOS ETF Trust NEOS Bitcoin High Income ETF" },
-    { symbol: "BTCL", name: "T-Rex 2X Long Bitcoin Daily Target ETF" },
-    { symbol: "BTCM", name: "BIT Mining Limited ADS" },
-    { symbol: "BTCO", name: "Invesco Galaxy Bitcoin ETF Common Shares of Beneficial Interest" },
-    { symbol: "BTCW", name: "WisdomTree Bitcoin Fund Common Shares of Beneficial Interest" },
-    { symbol: "BTCZ", name: "T-Rex 2X Inverse Bitcoin Daily Target ETF" },
-    { symbol: "BTE", name: "Baytex Energy Corp Common Shares" },
-    { symbol: "BTG", name: "B2Gold Corp Common shares (Canada)" },
-    { symbol: "BTI", name: "British American Tobacco  Industries, p.l.c. Common Stock ADR" },
-    { symbol: "BTO", name: "John Hancock Financial Opportunities Fund Common Stock" },
-    { symbol: "BTOP", name: "Bitwise Trendwise BTC/ETH and Treasuries Rotation Strategy ETF" },
-    { symbol: "BTR", name: "Northern Lights Fund Trust II Beacon Tactical Risk ETF" },
-    { symbol: "BTRN", name: "Global X Funds Global X Bitcoin Trend Strategy ETF" },
-    { symbol: "BTT", name: "BlackRock Municipal 2030 Target Term Trust" },
-    { symbol: "BTU", name: "Peabody Energy Corporation Common Stock " },
-    { symbol: "BTX", name: "BlackRock Technology and Private Equity Term Trust Common Shares of Beneficial Interest" },
-    { symbol: "BTZ", name: "BlackRock Credit Allocation Income Trust" },
-    { symbol: "BUCK", name: "Simplify Treasury Option Income ETF" },
-    { symbol: "BUD", name: "Anheuser-Busch Inbev SA Sponsored ADR (Belgium)" },
-    { symbol: "BUFB", name: "Innovator ETFs Trust Innovator Laddered Allocation Buffer ETF" },
-    { symbol: "BUFD", name: "FT Vest Laddered Deep Buffer ETF" },
-    { symbol: "BUFF", name: "Innovator Laddered Allocation Power Buffer ETF" },
-    { symbol: "BUFG", name: "FT Vest Buffered Allocation Growth ETF" },
-    { symbol: "BUFH", name: "FT Vest Laddered Max Buffer ETF" },
-    { symbol: "BUFP", name: "PGIM Laddered S&P 500 Buffer 12 ETF" },
-    { symbol: "BUFQ", name: "FT Vest Laddered Nasdaq Buffer ETF" },
-    { symbol: "BUFR", name: "FT Vest Laddered Buffer ETF" },
-    { symbol: "BUFS", name: "First Trust Exchange-Traded Fund VIII FT Vest Laddered Small Cap Moderate Buffer ETF" },
-    { symbol: "BUFT", name: "FT Vest Buffered Allocation Defensive ETF" },
-    { symbol: "BUFX", name: "FT Vest Laddered Enhance & Moderate Buffer ETF" },
-    { symbol: "BUFY", name: "First Trust Exchange-Traded Fund VIII FT Vest Laddered International Moderate Buffer ETF" },
-    { symbol: "BUFZ", name: "FT Vest Laddered Moderate Buffer ETF" },
-    { symbol: "BUI", name: "BlackRock Utility, Infrastructure & Power Opportunities Trust" },
-    { symbol: "BUL", name: "Pacer US Cash Cows Growth ETF" },
-    { symbol: "BULU", name: "ETF Opportunities Trust T-REX 2X Long BULL Daily Target ETF" },
-    { symbol: "BULZ", name: "MicroSectors FANG & Innovation 3x Leveraged ETN" },
-    { symbol: "BUR", name: "Burford Capital Limited Ordinary Shares" },
-    { symbol: "BURL", name: "Burlington Stores, Inc. Common Stock" },
-    { symbol: "BURU", name: "Nuburu, Inc. Common Stock" },
-    { symbol: "BUSA", name: "Brandes U.S. Value ETF" },
-    { symbol: "BUXX", name: "EA Series Trust Strive Enhanced Income Short Maturity ETF" },
-    { symbol: "BUYO", name: "KraneShares Trust KraneShares Man Buyout Beta Index ETF" },
-    { symbol: "BUYW", name: "Northern Lights Fund Trust IV Main BuyWrite ETF" },
-    { symbol: "BUYZ", name: "Franklin Disruptive Commerce ETF" },
-    { symbol: "BUZZ", name: "VanEck Social Sentiment ETF" },
-    { symbol: "BV", name: "BrightView Holdings, Inc. Common Stock" },
-    { symbol: "BVAL", name: "Exchange Traded Concepts Trust Bluemonte Large Cap Value ETF" },
-    { symbol: "BVN", name: "Buenaventura Mining Company Inc." },
-    { symbol: "BW", name: "Babcock & Wilcox Enterprises, Inc. Common Stock" },
-    { symbol: "BW$A", name: "Babcock & Wilcox Enterprises, Inc. 7.75% Series A Cumulative Perpetual Preferred Stock" },
-    { symbol: "BWA", name: "BorgWarner Inc. Common Stock" },
-    { symbol: "BWEB", name: "Bitwise Funds Trust Bitwise Web3 ETF" },
-    { symbol: "BWET", name: "Amplify Commodity Trust Breakwave Tanker Shipping ETF" },
-    { symbol: "BWG", name: "BrandywineGLOBAL Global Income Opportunities Fund Inc." },
-    { symbol: "BWLP", name: "BW LPG Limited Common Shares" },
-    { symbol: "BWMX", name: "Betterware de Mexico, S.A.P.I. de C.V. Ordinary Shares" },
-    { symbol: "BWNB", name: "Babcock & Wilcox Enterprises, Inc. 6.50% Senior Notes due 2026" },
-    { symbol: "BWSN", name: "Babcock & Wilcox Enterprises, Inc. 8.125% Senior Notes due 2026" },
-    { symbol: "BWTG", name: "ETF Opportunities Trust Brendan Wood TopGun Index ETF" },
-    { symbol: "BWX", name: "SPDR Bloomberg International Treasury Bond ETF" },
-    { symbol: "BWXT", name: "BWX Technologies, Inc. Common Stock" },
-    { symbol: "BWZ", name: "SPDR Bloomberg Short Term International Treasury Bond ETF" },
-    { symbol: "BX", name: "Blackstone Inc. Common Stock" },
-    { symbol: "BXC", name: "Bluelinx Holdings Inc. Common Stock" },
-    { symbol: "BXMT", name: "Blackstone Mortgage Trust, Inc. Common Stock" },
-    { symbol: "BXMX", name: "Nuveen S&P 500 Buy-Write Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "BXP", name: "BXP, Inc. Common Stock" },
-    { symbol: "BXSL", name: "Blackstone Secured Lending Fund Common Shares of Beneficial Interest" },
-    { symbol: "BY", name: "Byline Bancorp, Inc. Common Stock" },
-    { symbol: "BYD", name: "Boyd Gaming Corporation Common Stock" },
-    { symbol: "BYLD", name: "iShares Yield Optimized Bond ETF" },
-    { symbol: "BYM", name: "Blackrock Municipal Income Quality Trust Common Shares of Beneficial Interest" },
-    { symbol: "BYRE", name: "Principal Exchange-Traded Funds Principal Real Estate Active Opportunities ETF" },
-    { symbol: "BZH", name: "Beazer Homes USA, Inc. Common Stock" },
-    { symbol: "BZQ", name: "ProShares UltraShort MSCI Brazil Capped" },
-    { symbol: "C", name: "Citigroup, Inc. Common Stock" },
-    { symbol: "C$N", name: "Citigroup Capital XIII 7.875% Fixed rate Floating Rate trust Preferred Securities (TruPS)" },
-    { symbol: "CAAA", name: "First Trust AAA CMBS ETF" },
-    { symbol: "CAAP", name: "Corporacion America Airports SA Common Shares" },
-    { symbol: "CABO", name: "Cable One, Inc. Common Stock" },
-    { symbol: "CACI", name: "CACI International, Inc. Class A Common Stock" },
-    { symbol: "CADE", name: "Cadence Bank Common Stock" },
-    { symbol: "CADE$A", name: "Cadence Bank 5.50% Series A " },
-    { symbol: "CAE", name: "CAE Inc. Ordinary Shares" },
-    { symbol: "CAF", name: "Morgan Stanley China A Share Fund Inc. Common Stock" },
-    { symbol: "CAFX", name: "Professionally Managed Portfolios Congress Intermediate Bond ETF" },
-    { symbol: "CAG", name: "ConAgra Brands, Inc. Common Stock" },
-    { symbol: "CAH", name: "Cardinal Health, Inc. Common Stock" },
-    { symbol: "CAIE", name: "Calamos ETF Trust Calamos Autocallable Income ETF" },
-    { symbol: "CAL", name: "Caleres, Inc. Common Stock" },
-    { symbol: "CALF", name: "Pacer US Small Cap Cash Cows ETF" },
-    { symbol: "CALX", name: "Calix, Inc Common Stock" },
-    { symbol: "CAML", name: "Professionally Managed Portfolios Congress Large Cap Growth ETF" },
-    { symbol: "CAMX", name: "The Advisors Inner Circle Fund Cambiar Aggressive Value ETF" },
-    { symbol: "CANE", name: "Teucrium Sugar Fund ETV" },
-    { symbol: "CANF", name: "Can-Fite Biopharma Ltd Sponsored ADR (Israel)" },
-    { symbol: "CANG", name: "Cango Inc. American Depositary Shares,  each representing two (2) Class A Ordinary Shares" },
-    { symbol: "CAOS", name: "EA Series Trust Alpha Architect Tail Risk ETF" },
-    { symbol: "CAPE", name: "DoubleLine ETF Trust DoubleLine Shiller CAPE U.S. Equities ETF" },
-    { symbol: "CAPL", name: "CrossAmerica Partners LP Common Units representing limited partner interests" },
-    { symbol: "CARD", name: "Bank Of Montreal MAX Auto Industry -3x Inverse Leveraged ETN" },
-    { symbol: "CARK", name: "The Advisors Inner Circle Fund II CastleArk Large Growth ETF" },
-    { symbol: "CARR", name: "Carrier Global Corporation Common Stock " },
-    { symbol: "CARS", name: "Cars.com Inc. Common Stock " },
-    { symbol: "CARU", name: "Bank Of Montreal MAX Auto Industry 3x Leveraged ETN" },
-    { symbol: "CAS", name: "Simplify Exchange Traded Funds Simplify China A Shares PLUS Income ETF" },
-    { symbol: "CAT", name: "Caterpillar, Inc. Common Stock" },
-    { symbol: "CATF", name: "American Century ETF Trust American Century California Municipal Bond ETF" },
-    { symbol: "CATO", name: "Cato Corporation (The) Class A Common Stock" },
-    { symbol: "CATX", name: "Perspective Therapeutics, Inc. Common Stock" },
-    { symbol: "CAVA", name: "CAVA Group, Inc. Common Stock" },
-    { symbol: "CB", name: "Chubb Limited  Common Stock" },
-    { symbol: "CBAN", name: "Colony Bankcorp, Inc. Common Stock" },
-    { symbol: "CBL", name: "CBL & Associates Properties, Inc. Common Stock" },
-    { symbol: "CBLS", name: "Elevation Series Trust Clough Hedged Equity ETF" },
-    { symbol: "CBNA", name: "Chain Bridge Bancorp, Inc. Class A Common Stock" },
-    { symbol: "CBO", name: "CBO (Listing Market - NYSE - Networks A/E) Common Stock" },
-    { symbol: "CBOA", name: "Calamos ETF Trust Calamos Bitcoin Structured Alt Protection ETF - April" },
-    { symbol: "CBOE", name: "Cboe Global Markets, Inc. Common Stock" },
-    { symbol: "CBOJ", name: "Calamos ETF Trust Calamos Bitcoin Structured Alt Protection ETF - January" },
-    { symbol: "CBON", name: "VanEck China Bond ETF" },
-    { symbol: "CBOY", name: "Calamos ETF Trust Calamos Bitcoin Structured Alt Protection ETF - July" },
-    { symbol: "CBRE", name: "CBRE Group Inc Common Stock Class A" },
-    { symbol: "CBSE", name: "Elevation Series Trust Clough Select Equity ETF" },
-    { symbol: "CBT", name: "Cabot Corporation Common Stock" },
-    { symbol: "CBTA", name: "Calamos ETF Trust Calamos Bitcoin 80 Series Structured Alt Protection ETF - April" },
-    { symbol: "CBTJ", name: "Calamos ETF Trust Calamos Bitcoin 80 Series Structured Alt Protection ETF - January" },
-    { symbol: "CBTY", name: "Calamos ETF Trust Calamos Bitcoin 80 Series Structured Alt Protection ETF - July" },
-    { symbol: "CBU", name: "Community Financial System, Inc. Common Stock" },
-    { symbol: "CBX", name: "CBX (Listing Market NYSE Networks AE) Common Stock" },
-    { symbol: "CBXA", name: "Calamos ETF Trust Calamos Bitcoin 90 Series Structured Alt Protection ETF - April" },
-    { symbol: "CBXJ", name: "Calamos ETF Trust Calamos Bitcoin 90 Series Structured Alt Protection ETF - January" },
-    { symbol: "CBXY", name: "Calamos ETF Trust Calamos Bitcoin 90 Series Structured Alt Protection ETF - July" },
-    { symbol: "CBZ", name: "CBIZ, Inc. Common Stock" },
-    { symbol: "CC", name: "Chemours Company (The) Common Stock" },
-    { symbol: "CCEF", name: "Calamos ETF Trust Calamos CEF Income & Arbitrage ETF" },
-    { symbol: "CCEL", name: "Cryo-Cell International, Inc. Common Stock" },
-    { symbol: "CCI", name: "Crown Castle Inc. Common Stock" },
-    { symbol: "CCIA", name: "Carlyle Credit Income Fund 8.75% Series A Preferred Shares due 2028" },
-    { symbol: "CCIF", name: "Carlyle Credit Income Fund Shares of Beneficial Interest" },
-    { symbol: "CCJ", name: "Cameco Corporation Common Stock" },
-    { symbol: "CCK", name: "Crown Holdings, Inc." },
-    { symbol: "CCL", name: "Carnival Corporation Common Stock" },
-    { symbol: "CCM", name: "Concord Medical Services Holdings Limited American Depositary Shares (Each represents thirty (30) Class A ordinary shares)" },
-    { symbol: "CCMG", name: "EA Series Trust CCM Global Equity ETF" },
-    { symbol: "CCO", name: "Clear Channel Outdoor Holdings, Inc. Common Stock" },
-    { symbol: "CCOR", name: "Core Alternative ETF" },
-    { symbol: "CCRD", name: "CoreCard Corporation Common Stock" },
-    { symbol: "CCS", name: "Century Communities, Inc. Common Stock" },
-    { symbol: "CCU", name: "Compania Cervecerias Unidas, S.A. Common Stock" },
-    { symbol: "CCUP", name: "ETF Opportunities Trust T-REX 2X Long CRCL Daily Target ETF" },
-    { symbol: "CCZ", name: "Comcast Holdings ZONES" },
-    { symbol: "CDE", name: "Coeur Mining, Inc. Common Stock" },
-    { symbol: "CDEI", name: "Morgan Stanley ETF Trust Calvert US Large-Cap Diversity, Equity and Inclusion Index ETF" },
-    { symbol: "CDLR", name: "Cadeler A/S American Depositary Share (each representing four (4) Ordinary Shares)" },
-    { symbol: "CDP", name: "COPT Defense Properties Common Shares of Beneficial Interest" },
-    { symbol: "CDR$B", name: "Cedar Realty Trust, Inc. 7.25% Series B Cumulative Redeemable Preferred Stock" },
-    { symbol: "CDR$C", name: "Cedar Realty Trust, Inc. 6.50% Series C Cumulative Redeemable Preferred Stock" },
-    { symbol: "CDRE", name: "Cadre Holdings, Inc. Common Stock" },
-    { symbol: "CDX", name: "Simplify High Yield ETF" },
-    { symbol: "CE", name: "Celanese Corporation Common Stock" },
-    { symbol: "CEE", name: "The Central and Eastern Europe Fund, Inc. (The) Common Stock" },
-    { symbol: "CEF", name: "Sprott Physical Gold and Silver Trust Units" },
-    { symbol: "CEFD", name: "ETRACS Monthly Pay 1.5X Leveraged Closed-End Fund Index ETN" },
-    { symbol: "CEFS", name: "Saba Closed-End Funds ETF" },
-    { symbol: "CEFZ", name: "Elevation Series Trust RiverNorth Active Income ETF" },
-    { symbol: "CEGX", name: "Tradr 2X Long CEG Daily ETF" },
-    { symbol: "CELG.R", name: "Bristol-Myers Squibb Company Celegne Contingent Value Rights" },
-    { symbol: "CEMB", name: "iShares J.P. Morgan EM Corporate Bond ETF" },
-    { symbol: "CEPU", name: "Central Puerto S.A. American Depositary Shares (each represents ten Common Shares)" },
-    { symbol: "CERY", name: "SPDR Series Trust SPDR Bloomberg Enhanced Roll Yield Commodity Strategy No K-1 ETF" },
-    { symbol: "CET", name: "Central Securities Corporation Common Stock" },
-    { symbol: "CEV", name: "Eaton Vance California Municipal Income Trust Shares of Beneficial Interest" },
-    { symbol: "CEW", name: "WisdomTree Emerging Currency Strategy Fund" },
-    { symbol: "CF", name: "CF Industries Holdings, Inc. Common Stock" },
-    { symbol: "CFG", name: "Citizens Financial Group, Inc. Common Stock" },
-    { symbol: "CFG$E", name: "Citizens Financial Group, Inc. Depositary Shares Each Representing 1/40th Interest in a Share of 5.000% Fixed-Rate Non-Cumulative Perpetual Preferred Stock, Series E" },
-    { symbol: "CFG$H", name: "Citizens Financial Group, Inc. Depositary Shares Each Representing a 1/40th Interest in a Share of 7.375% Fixed-Rate Non-Cumulative Perpetual Preferred Stock, Series H" },
-    { symbol: "CFG$I", name: "Citizens Financial Group, Inc. Depositary Shares, Each Representing a 1/40th Interest in a Share of 6.500% Fixed-Rate Reset Non-Cumulative Perpetual Preferred Stock, Series I" },
-    { symbol: "CFIT", name: "Cambria ETF Trust Cambria Fixed Income Trend ETF" },
-    { symbol: "CFND", name: "C1 Fund Inc. Common Stock" },
-    { symbol: "CFR", name: "Cullen/Frost Bankers, Inc. Common Stock" },
-    { symbol: "CFR$B", name: "Cullen/Frost Bankers, Inc. Depositary Shares, each representing a 1/40th ownership interest in a share of 4.450% non-cumulative perpetual preferred stock, Series B" },
-    { symbol: "CGAU", name: "Centerra Gold Inc. Common Shares" },
-    { symbol: "CGBL", name: "Capital Group Core Balanced ETF" },
-    { symbol: "CGCB", name: "Capital Group Core Bond ETF" },
-    { symbol: "CGCP", name: "Capital Group Core Plus Income ETF" },
-    { symbol: "CGCV", name: "Capital Group Conservative Equity ETF" },
-    { symbol: "CGDG", name: "Capital Group Dividend Growers ETF" },
-    { symbol: "CGDV", name: "Capital Group Dividend Value ETF" },
-    { symbol: "CGGE", name: "Capital Group Global Equity ETF" },
-    { symbol: "CGGG", name: "Capital Group Equity ETF Trust I Capital Group U.S. Large Growth ETF" },
-    { symbol: "CGGO", name: "Capital Group Global Growth Equity ETF" },
-    { symbol: "CGGR", name: "Capital Group Growth ETF" },
-    { symbol: "CGHM", name: "Capital Group Municipal High-Income ETF" },
-    { symbol: "CGHY", name: "Capital Group Fixed Income ETF Trust Capital Group High Yield Bond ETF" },
-    { symbol: "CGIB", name: "Capital Group International Bond ETF (USD-Hedged)" },
-    { symbol: "CGIC", name: "Capital Group International Core Equity ETF" },
-    { symbol: "CGIE", name: "Capital Group International Equity ETF" },
-    { symbol: "CGMM", name: "Capital Group Equity ETF Trust I Capital Group U.S. Small and Mid Cap ETF" },
-    { symbol: "CGMS", name: "Capital Group U.S. Multi-Sector Income ETF" },
-    { symbol: "CGMU", name: "Capital Group Municipal Income ETF" },
-    { symbol: "CGNG", name: "Capital Group New Geography Equity ETF" },
-    { symbol: "CGRO", name: "Tidal Trust II CoreValues Alpha Greater China Growth ETF" },
-    { symbol: "CGSD", name: "Capital Group Short Duration Income ETF" },
-    { symbol: "CGSM", name: "Capital Group Short Duration Municipal Income ETF" },
-    { symbol: "CGUI", name: "Capital Group Ultra Short Income ETF" },
-    { symbol: "CGUS", name: "Capital Group Core Equity ETF" },
-    { symbol: "CGV", name: "Two Roads Shared Trust Conductor Global Equity Value ETF" },
-    { symbol: "CGVV", name: "Capital Group Equity ETF Trust I Capital Group U.S. Large Value ETF" },
-    { symbol: "CGW", name: "Invesco S&P Global Water Index ETF" },
-    { symbol: "CGXU", name: "Capital Group International Focus Equity ETF" },
-    { symbol: "CHAT", name: "Roundhill Generative AI & Technology ETF" },
-    { symbol: "CHAU", name: "Direxion Daily CSI 300 China A Share Bull 2X Shares" },
-    { symbol: "CHCT", name: "Community Healthcare Trust Incorporated Common Stock" },
-    { symbol: "CHD", name: "Church & Dwight Company, Inc. Common Stock" },
-    { symbol: "CHE", name: "Chemed Corp" },
-    { symbol: "CHGG", name: "Chegg, Inc. Common Stock" },
-    { symbol: "CHH", name: "Choice Hotels International, Inc. Common Stock" },
-    { symbol: "CHIQ", name: "Global X MSCI China Consumer Discretionary ETF" },
-    { symbol: "CHMI", name: "Cherry Hill Mortgage Investment Corporation Common Stock" },
-    { symbol: "CHMI$A", name: "Cherry Hill Mortgage Investment Corporation 8.20% Series A Cumulative Redeemable Preferred Stock" },
-    { symbol: "CHMI$B", name: "Cherry Hill Mortgage Investment Corporation 8.250% Series B Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "CHN", name: "China Fund, Inc. (The) Common Stock" },
-    { symbol: "CHPT", name: "ChargePoint Holdings, Inc. Common Stock" },
-    { symbol: "CHPY", name: "Tidal Trust II YieldMax Semiconductor Portfolio Option Income ETF" },
-    { symbol: "CHT", name: "Chunghwa Telecom Co., Ltd." },
-    { symbol: "CHWY", name: "Chewy, Inc. Class A Common Stock" },
-    { symbol: "CI", name: "The Cigna Group Common Stock" },
-    { symbol: "CIA", name: "Citizens, Inc. Class A Common Stock ($1.00 Par)" },
-    { symbol: "CIB", name: "Grupo Cibest S.A. American Depositary Shares each representing four Preferred Shares" },
-    { symbol: "CICB", name: "CION Investment Corporation 7.50% Notes due 2029" },
-    { symbol: "CIEN", name: "Ciena Corporation Common Stock" },
-    { symbol: "CIF", name: "MFS Intermediate High Income Fund Common Stock" },
-    { symbol: "CIG", name: "Comp En De Mn Cemig ADS American Depositary Shares" },
-    { symbol: "CIG.C", name: "Comp En De Mn Cemig ADS American Depositary Receipts" },
-    { symbol: "CII", name: "BlackRock Enhanced Large Cap Core Fund, Inc. Common Stock" },
-    { symbol: "CIK", name: "Credit Suisse Asset Management Income Fund, Inc. Common Stock" },
-    { symbol: "CIM", name: "Chimera Investment Corporation Common Stock" },
-    { symbol: "CIM$A", name: "Chimera Investment Corporation 8.00% Series A Cumulative Redeemable Preferred Stock" },
-    { symbol: "CIM$B", name: "Chimera Investment Corporation 8.00% Series B Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "CIM$C", name: "Chimera Investment Corporation 7.75% Series C Fixed-to-Floating Rate  Cumulative Redeemable  Preferred Stock" },
-    { symbol: "CIM$D", name: "Chimera Investment Corporation 8.00% Series D Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "CIMN", name: "Chimera Investment Corporation 9.000% Senior Notes due 2029" },
-    { symbol: "CIMO", name: "Chimera Investment Corporation 9.250% Senior Notes due 2029" },
-    { symbol: "CINT", name: "CI&T Inc Class A Common Shares" },
-    { symbol: "CIO", name: "City Office REIT, Inc. Common Stock" },
-    { symbol: "CIO$A", name: "City Office REIT, Inc. 6.625% Series A Cumulative Redeemable Preferred Stock" },
-    { symbol: "CION", name: "CION Investment Corporation Common Stock" },
-    { symbol: "CIVI", name: "Civitas Resources, Inc. Common Stock" },
-    { symbol: "CIX", name: "CompX International Inc. Common Stock" },
-    { symbol: "CKX", name: "CKX Lands, Inc. Common Stock" },
-    { symbol: "CL", name: "Colgate-Palmolive Company Common Stock" },
-    { symbol: "CLB", name: "Core Laboratories Inc. Common Stock" },
-    { symbol: "CLCG", name: "Crossmark ETF Trust Crossmark Large Cap Growth ETF" },
-    { symbol: "CLCO", name: "Cool Company Ltd. Common Shares" },
-    { symbol: "CLCV", name: "Crossmark ETF Trust Crossmark Large Cap Value ETF" },
-    { symbol: "CLDI", name: "Calidi Biotherapeutics, Inc. Common Stock" },
-    { symbol: "CLDT", name: "Chatham Lodging Trust (REIT) Common Shares of Beneficial Interest" },
-    { symbol: "CLDT$A", name: "Chatham Lodging Trust (REIT) 6.625% Series A Cumulative Redeemable Preferred Shares of Beneficial Interest" },
-    { symbol: "CLF", name: "Cleveland-Cliffs Inc. Common Stock" },
-    { symbol: "CLH", name: "Clean Harbors, Inc. Common Stock" },
-    { symbol: "CLIP", name: "Global X Funds Global X 1-3 Month T-Bill ETF" },
-    { symbol: "CLIX", name: "ProShares Long Online/Short Stores ETF" },
-    { symbol: "CLM", name: "Cornerstone Strategic Investment Fund, Inc. Common Shares" },
-    { symbol: "CLOB", name: "VanEck ETF Trust VanEck AA-BB CLO ETF" },
-    { symbol: "CLOI", name: "VanEck ETF Trust VanEck CLO ETF" },
-    { symbol: "CLOX", name: "Eldridge AAA CLO ETF" },
-    { symbol: "CLOZ", name: "Eldridge BBB-B CLO ETF" },
-    { symbol: "CLPR", name: "Clipper Realty Inc. Common Stock" },
-    { symbol: "CLS", name: "Celestica, Inc. Common Stock" },
-    { symbol: "CLSE", name: "Trust for Professional Managers Convergence Long/Short Equity ETF" },
-    { symbol: "CLVT", name: "Clarivate Plc Ordinary Shares" },
-    { symbol: "CLW", name: "Clearwater Paper Corporation Common Stock" },
-    { symbol: "CLX", name: "Clorox Company (The) Common Stock" },
-    { symbol: "CM", name: "Canadian Imperial Bank of Commerce Common Stock" },
-    { symbol: "CMA", name: "Comerica Incorporated Common Stock" },
-    { symbol: "CMA$B", name: "Comerica Incorporated Depositary Shares, each representing a 1/40th interest in a share of 6.875% Fixed-Rate Reset Non-Cumulative Perpetual Preferred Stock, Series B" },
-    { symbol: "CMBS", name: "iShares CMBS Bond ETF" },
-    { symbol: "CMBT", name: "CMB.TECH NV Ordinary Shares" },
-    { symbol: "CMC", name: "Commercial Metals Company Common Stock" },
-    { symbol: "CMCI", name: "VanEck ETF Trust VanEck CMCI Commodity Strategy ETF" },
-    { symbol: "CMCL", name: "Caledonia Mining Corporation Plc Common Shares" },
-    { symbol: "CMCM", name: "Cheetah Mobile Inc. American Depositary Shares, each representing fifty (50) Class A Ordinary Shares" },
-    { symbol: "CMDB", name: "Costamare Bulkers Holdings Limited Common Stock" },
-    { symbol: "CMDT", name: "PIMCO U.S. Treasury Index Fund PIMCO Commodity Strategy Active Exchange-Traded Fund" },
-    { symbol: "CMDY", name: "iShares Bloomberg Roll Select Commodity Strategy ETF" },
-    { symbol: "CMF", name: "iShares California Muni Bond ETF" },
-    { symbol: "CMG", name: "Chipotle Mexican Grill, Inc. Common Stock" },
-    { symbol: "CMI", name: "Cummins Inc. Common Stock" },
-    { symbol: "CMP", name: "Compass Minerals Intl Inc Common Stock" },
-    { symbol: "CMRE", name: "Costamare Inc. Common Stock $0.0001 par value" },
-    { symbol: "CMRE$B", name: "Costamare Inc. Perpetual Preferred Stock Series B (Marshall Islands)" },
-    { symbol: "CMRE$C", name: "Costamare Inc. Perpetual Preferred Series C (Marshall Islands)" },
-    { symbol: "CMRE$D", name: "Costamare Inc. 8.75% Series D Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "CMS", name: "CMS Energy Corporation Common Stock" },
-    { symbol: "CMS$B", name: "CMS Energy Corporation Preferred Stock" },
-    { symbol: "CMS$C", name: "CMS Energy Corporation Depositary Shares, each representing a 1/1,000th interest in a share of 4.200% Cumulative Redeemable Perpetual Preferred Stock, Series C" },
-    { symbol: "CMSA", name: "CMS Energy Corporation 5.625% Junior Subordinated Notes due 2078" },
-    { symbol: "CMSC", name: "CMS Energy Corporation 5.875% Junior Subordinated Notes due 2078" },
-    { symbol: "CMSD", name: "CMS Energy Corporation 5.875% Junior Subordinated Notes due 2079" },
-    { symbol: "CMT", name: "Core Molding Technologies Inc Common Stock" },
-    { symbol: "CMTG", name: "Claros Mortgage Trust, Inc. Common Stock" },
-    { symbol: "CMU", name: "MFS Municipal Income Trust Common Stock" },
-    { symbol: "CNA", name: "CNA Financial Corporation Common Stock" },
-    { symbol: "CNAV", name: "Collaborative Investment Series Trust Mohr Company Nav ETF" },
-    { symbol: "CNBS", name: "Amplify Seymour Cannabis ETF" },
-    { symbol: "CNC", name: "Centene Corporation Common Stock" },
-    { symbol: "CNEQ", name: "The Alger ETF Trust Alger Concentrated Equity ETF" },
-    { symbol: "CNF", name: "CNFinance Holdings Limited American Depositary Shares, each representing two hundred (200) Ordinary Shares" },
-    { symbol: "CNH", name: "CNH Industrial N.V. Common Shares" },
-    { symbol: "CNI", name: "Canadian National Railway Company Common Stock" },
-    { symbol: "CNK", name: "Cinemark Holdings Inc Cinemark Holdings, Inc. Common Stock" },
-    { symbol: "CNL", name: "Collective Mining Ltd. Common Shares" },
-    { symbol: "CNM", name: "Core & Main, Inc. Class A Common Stock" },
-    { symbol: "CNMD", name: "CONMED Corporation Common Stock" },
-    { symbol: "CNNE", name: "Cannae Holdings, Inc. Common Stock" },
-    { symbol: "CNO", name: "CNO Financial Group, Inc. Common Stock" },
-    { symbol: "CNO$A", name: "CNO Financial Group, Inc. 5.125% Subordinated Debentures due 2060" },
-    { symbol: "CNP", name: "CenterPoint Energy, Inc (Holding Co) Common Stock" },
-    { symbol: "CNQ", name: "Canadian Natural Resources Limited Common Stock" },
-    { symbol: "CNR", name: "Core Natural Resources, Inc. Common Stock" },
-    { symbol: "CNRG", name: "SPDR S&P Kensho Clean Power ETF" },
-    { symbol: "CNS", name: "Cohen & Steers Inc Common Stock" },
-    { symbol: "CNX", name: "CNX Resources Corporation Common Stock" },
-    { symbol: "CNXT", name: "VanEck ChiNext ETF" },
-    { symbol: "CNYA", name: "iShares MSCI China A ETF" },
-    { symbol: "COAL", name: "Exchange Traded Concepts Trust Range Global Coal Index ETF" },
-    { symbol: "CODI", name: "D/B/A Compass Diversified Holdings Shares of Beneficial Interest" },
-    { symbol: "CODI$A", name: "Compass Diversified Holdings 7.250% Series A Preferred Shares representing beneficial interest in Compass Diversified Holdings" },
-    { symbol: "CODI$B", name: "Compass Diversified Holdings 7.875% Series B Fixed-to-Floating Rate Cumulative Preferred Shares representing beneficial interests in Compass Diversified Holdings" },
-    { symbol: "CODI$C", name: "Compass Diversified Holdings 7.875% Series C Cumulative Preferred Shares" },
-    { symbol: "COE", name: "51Talk Online Education Group American depositary shares, each representing 60 Class A ordinary shares" },
-    { symbol: "COF", name: "Capital One Financial Corporation Common Stock" },
-    { symbol: "COF$I", name: "Capital One Financial Corporation Depositary shares each representing a 1/40th interest in a share of Fixed Rate Non-Cumulative Perpetual Preferred Stock, Series I of the Issuer" },
-    { symbol: "COF$J", name: "Capital One Financial Corporation Depositary Shares, Each Representing a 1/40th Interest in a Share of Fixed Rate Non- Cumulative Perpetual Preferred Stock, Series J" },
-    { symbol: "COF$K", name: "Capital One Financial Corporation Depositary Shares, Each Representing a 1/40th Ownership Interest in a Share of Fixed Rate Non-Cumulative Perpetual Preferred Stock, Series K" },
-    { symbol: "COF$L", name: "Capital One Financial Corporation Depositary Shares, Each Representing a 1/40th Interest in a Share of Fixed Rate Non-Cumulative Perpetual Preferred Stock, Series L" },
-    { symbol: "COF$N", name: "Capital One Financial Corporation Depositary Shares, Each Representing a 1/40th Ownership Interest in a Share of Fixed Rate Non-Cumulative Perpetual Preferred Stock, Series N" },
-    { symbol: "COHN", name: "Cohen & Company Inc." },
-    { symbol: "COHR", name: "Coherent Corp. Common Stock" },
-    { symbol: "COII", name: "REX COIN Growth & Income ETF" },
-    { symbol: "COIO", name: "Themes ETF Trust Leverage Shares 2x Capped Accelerated COIN Monthly ETF" },
-    { symbol: "COIW", name: "Roundhill ETF Trust Roundhill COIN WeeklyPay ETF" },
-    { symbol: "COLD", name: "Americold Realty Trust, Inc. Common Stock" },
-    { symbol: "COLO", name: "Global X MSCI Colombia ETF" },
-    { symbol: "COM", name: "Direxion Auspice Broad Commodity Strategy ETF" },
-    { symbol: "COMB", name: "GraniteShares Bloomberg Commodity Broad Strategy No K-1 ETF" },
-    { symbol: "COMP", name: "Compass, Inc. Class A Common Stock" },
-    { symbol: "CON", name: "Concentra Group Holdings Parent, Inc. Common Stock" },
-    { symbol: "CONY", name: "Tidal ETF Trust II YieldMax COIN Option Income Strategy ETF" },
-    { symbol: "COOK", name: "Traeger, Inc. Common Stock" },
-    { symbol: "COP", name: "ConocoPhillips Common Stock" },
-    { symbol: "COPA", name: "Themes ETF Trust Themes Copper Miners ETF" },
-    { symbol: "COPL", name: "Copley Acquisition Corp Ordinary Shares" },
-    { symbol: "COPL.U", name: "Copley Acquisition Corp Units, each consisting of one ordinary share and one-half warrant" },
-    { symbol: "COPL.W", name: "Copley Acquisition Corp Redeemable warrants, each whole warrant exercisable for one Class A ordinary share at an exercise price of $11.50" },
-    { symbol: "COPX", name: "Global X Copper Miners ETF" },
-    { symbol: "COPY", name: "The RBB Fund Trust Tweedy, Browne Insider + Value ETF" },
-    { symbol: "COR", name: "Cencora, Inc. Common Stock" },
-    { symbol: "CORN", name: "Teucrium Corn Fund ETV" },
-    { symbol: "CORP", name: "Pimco Investment Grade Corporate Bond Index Exchange-Traded Fund" },
-    { symbol: "CORX", name: "Volatility Shares Trust 2x Corn ETF" },
-    { symbol: "COSO", name: "CoastalSouth Bancshares, Inc. Common Stock" },
-    { symbol: "COTY", name: "Coty Inc. Class A Common Stock" },
-    { symbol: "COUR", name: "Coursera, Inc. Common Stock" },
-    { symbol: "COWZ", name: "Pacer US Cash Cows 100 ETF" },
-    { symbol: "CP", name: "Canadian Pacific Kansas City Limited Common Shares" },
-    { symbol: "CPA", name: "Copa Holdings, S.A. Class A Common Stock" },
-    { symbol: "CPAC", name: "Cementos Pacasmayo S.A.A. American Depositary Shares (Each representing five Common Shares)" },
-    { symbol: "CPAI", name: "Northern Lights Fund Trust III Counterpoint Quantitative Equity ETF" },
-    { symbol: "CPAY", name: "Corpay, Inc. Common Stock" },
-    { symbol: "CPER", name: "United States Copper Index Fund ETV" },
-    { symbol: "CPF", name: "Central Pacific Financial Corp New" },
-    { symbol: "CPHI", name: "China Pharma Holdings, Inc. Common Stock" },
-    { symbol: "CPII", name: "American Beacon Select Funds American Beacon Ionic Inflation Protection ETF" },
-    { symbol: "CPK", name: "Chesapeake Utilities Corporation Common Stock" },
-    { symbol: "CPLB", name: "NYLI MacKay Core Plus Bond ETF" },
-    { symbol: "CPNG", name: "Coupang, Inc. Class A Common Stock" },
-    { symbol: "CPNJ", name: "Calamos ETF Trust Calamos Nasdaq - 100 Structured Alt Protection ETF -June" },
-    { symbol: "CPNM", name: "Calamos ETF Trust Calamos Nasdaq-100 Structured Alt Protection ETF - March" },
-    { symbol: "CPNQ", name: "Calamos ETF Trust Calamos Nasdaq-100 Structured Alt Protection ETF  December" },
-    { symbol: "CPNS", name: "Calamos ETF Trust Calamos Nasdaq-100 Structured Alt Protection ETF  September" },
-    { symbol: "CPRA", name: "Calamos ETF Trust Calamos Russell 2000 Structured Alt Protection ETF - April" },
-    { symbol: "CPRI", name: "Capri Holdings Limited Ordinary Shares" },
-    { symbol: "CPRJ", name: "Calamos ETF Trust Calamos Russell 2000 Structured Alt Protection ETF  July" },
-    { symbol: "CPRO", name: "Calamos ETF Trust Calamos Russell 2000 Structured Alt Protection ETF - October" },
-    { symbol: "CPRY", name: "Calamos ETF Trust Calamos Russell 2000 Structured Alt Protection ETF  January" },
-    { symbol: "CPS", name: "Cooper-Standard Holdings Inc. Common Stock" },
-    { symbol: "CPSA", name: "Calamos ETF Trust Calamos S&P 500 Structured Alt Protection ETF  August" },
-    { symbol: "CPSD", name: "Calamos ETF Trust Calamos S&P 500 Structured Alt Protection ETF  December" },
-    { symbol: "CPSF", name: "Calamos ETF Trust Calamos S&P 500 Structured Alt Protection ETF  February" },
-    { symbol: "CPSJ", name: "Calamos ETF Trust Calamos S&P 500 Structured Alt Protection ETF  July" },
-    { symbol: "CPSL", name: "Calamos ETF Trust Calamos Laddered S&P 500 Structured Alt Protection ETF" },
-    { symbol: "CPSM", name: "Calamos ETF Trust Calamos S&P 500 Structured Alt Protection ETF  May" },
-    { symbol: "CPSN", name: "Calamos ETF Trust Calamos S&P 500 Structured Alt Protection ETF  November" },
-    { symbol: "CPSO", name: "Calamos ETF Trust Calamos S&P 500 Structured Alt Protection ETF - October" },
-    { symbol: "CPSP", name: "Calamos ETF Trust Calamos S&P 500 Structured Alt Protection ETF - April" },
-    { symbol: "CPSR", name: "Calamos ETF Trust Calamos S&P 500 Structured Alt Protection ETF - March" },
-    { symbol: "CPST", name: "Calamos ETF Trust Calamos S&P 500 Structured Alt Protection ETF  September" },
-    { symbol: "CPSU", name: "Calamos ETF Trust Calamos S&P 500 Structured Alt Protection ETF   June" },
-    { symbol: "CPSY", name: "Calamos ETF Trust Calamos S&P 500 Structured Alt Protection ETF  January" },
-    { symbol: "CPT", name: "Camden Property Trust Common Stock" },
-    { symbol: "CPXR", name: "Tidal Trust III USCF Daily Target 2X Copper Index ETF" },
-    { symbol: "CQP", name: "Cheniere Energy Partners, LP Common Units" },
-    { symbol: "CQQQ", name: "Invesco China Technology ETF" },
-    { symbol: "CR", name: "Crane Company Common Stock" },
-    { symbol: "CRAK", name: "VanEck Oil Refiners ETF" },
-    { symbol: "CRBD", name: "Corebridge Financial Inc. 6.375% Junior Subordinated Notes due 2064" },
-    { symbol: "CRBG", name: "Corebridge Financial Inc. Common Stock" },
-    { symbol: "CRBN", name: "iShares MSCI ACWI Low Carbon Target ETF" },
-    { symbol: "CRC", name: "California Resources Corporation Common Stock" },
-    { symbol: "CRCA", name: "ProShares Trust ProShares Ultra CRCL" },
-    { symbol: "CRCL", name: "Circle Internet Group, Inc. Class A Common Stock" },
-    { symbol: "CRD.A", name: "Crawford & Company Common Stock" },
-    { symbol: "CRD.B", name: "Crawford & Company Common Stock" },
-    { symbol: "CRDT", name: "Simplify Exchange Traded Funds Simplify Opportunistic Income ETF" },
-    { symbol: "CRED", name: "Columbia ETF Trust I Columbia Research Enhanced Real Estate ETF" },
-    { symbol: "CRF", name: "Cornerstone Total Return Fund, Inc. (The) Common Stock" },
-    { symbol: "CRGY", name: "Crescent Energy Company Class A Common Stock" },
-    { symbol: "CRH", name: "CRH PLC Ordinary Shares" },
-    { symbol: "CRI", name: "Carter's, Inc. Common Stock" },
-    { symbol: "CRK", name: "Comstock Resources, Inc. Common Stock" },
-    { symbol: "CRL", name: "Charles River Laboratories International, Inc. Common Stock" },
-    { symbol: "CRM", name: "Salesforce, Inc. Common Stock" },
-    { symbol: "CRPT", name: "First Trust SkyBridge Crypto Industry and Digital Economy ETF" },
-    { symbol: "CRS", name: "Carpenter Technology Corporation Common Stock" },
-    { symbol: "CRSH", name: "Tidal Trust II YieldMax Short TSLA Option Income Strategy ETF" },
-    { symbol: "CRT", name: "Cross Timbers Royalty Trust Common Stock" },
-    { symbol: "CRTC", name: "DBX ETF Trust Xtrackers US National Critical Technologies ETF" },
-    { symbol: "CRWU", name: "ETF Opportunities Trust T-REX 2X Long CRWV Daily Target ETF" },
-    { symbol: "CSAN", name: "Cosan S.A. ADS" },
-    { symbol: "CSD", name: "Invesco S&P Spin-Off ETF" },
-    { symbol: "CSHI", name: "NEOS Enhanced Income 1-3 Month T-Bill ETF" },
-    { symbol: "CSHP", name: "iShares Enhanced Short-Term Bond Active ETF" },
-    { symbol: "CSL", name: "Carlisle Companies Incorporated Common Stock" },
-    { symbol: "CSM", name: "ProShares Large Cap Core Plus" },
-    { symbol: "CSMD", name: "Professionally Managed Portfolios Congress SMid Growth ETF" },
-    { symbol: "CSNR", name: "Cohen & Steers ETF Trust Cohen & Steers Natural Resources Active ETF" },
-    { symbol: "CSPF", name: "Cohen & Steers ETF Trust Cohen & Steers Preferred and Income Opportunities Active ETF" },
-    { symbol: "CSR", name: "D/B/A Centerspace Common Stock" },
-    { symbol: "CSRE", name: "Cohen & Steers ETF Trust Cohen & Steers Real Estate Active ETF" },
-    { symbol: "CSTK", name: "Invesco Comstock Contrarian Equity ETF" },
-    { symbol: "CSTM", name: "Constellium SE Ordinary Shares (France)" },
-    { symbol: "CSV", name: "Carriage Services, Inc. Common Stock" },
-    { symbol: "CSW", name: "CSW Industrials, Inc. Common Stock" },
-    { symbol: "CTA", name: "Simplify Exchange Traded Funds Simplify Managed Futures Strategy ETF" },
-    { symbol: "CTA$A", name: "EIDP, Inc. Preferred Stock $3.50 Series" },
-    { symbol: "CTA$B", name: "EIDP, Inc. Preferred Stock $4.50 Series" },
-    { symbol: "CTBB", name: "Qwest Corporation 6.5% Notes due 2056" },
-    { symbol: "CTDD", name: "Qwest Corporation 6.75% Notes due 2057" },
-    { symbol: "CTEF", name: "EA Series Trust Castellan Targeted Equity ETF" },
-    { symbol: "CTEST", name: "NYSE Test One Common Stock" },
-    { symbol: "CTEST.E", name: "NYSE Test One Common Stock" },
-    { symbol: "CTEST.G", name: "NYSE Test One Common Stock" },
-    { symbol: "CTEST.L", name: "NYSE Test One Common Stock" },
-    { symbol: "CTEST.O", name: "NYSE Test One Common Stock" },
-    { symbol: "CTEST.S", name: "NYSE Test Six Common Stock" },
-    { symbol: "CTEST.V", name: "NYSE Test One Common Stock" },
-    { symbol: "CTEV", name: "Claritev Corporation Class A Common Stock" },
-    { symbol: "CTEX", name: "ProShares S&P Kensho Cleantech ETF" },
-    { symbol: "CTGO", name: "Contango ORE, Inc. Common Stock" },
-    { symbol: "CTIF", name: "EA Series Trust Castellan Targeted Income ETF" },
-    { symbol: "CTM", name: "Castellum, Inc. Common Stock" },
-    { symbol: "CTO", name: "CTO Realty Growth, Inc. Common Stock" },
-    { symbol: "CTO$A", name: "CTO Realty Growth, Inc. 6.375% Series A Cumulative Redeemable Preferred Stock" },
-    { symbol: "CTOS", name: "Custom Truck One Source, Inc. Common Stock" },
-    { symbol: "CTRA", name: "Coterra Energy Inc. Common Stock" },
-    { symbol: "CTRE", name: "CareTrust REIT, Inc. Common Stock" },
-    { symbol: "CTRI", name: "Centuri Holdings, Inc. Common Stock" },
-    { symbol: "CTS", name: "CTS Corporation Common Stock" },
-    { symbol: "CTVA", name: "Corteva, Inc. Common Stock " },
-    { symbol: "CTWO", name: "COtwo Advisors Physical European Carbon Allowance Trust Common units" },
-    { symbol: "CUBB", name: "Customers Bancorp, Inc 5.375% Subordinated Notes Due 2034" },
-    { symbol: "CUBE", name: "CubeSmart Common Shares" },
-    { symbol: "CUBI", name: "Customers Bancorp, Inc Common Stock" },
-    { symbol: "CUBI$F", name: "Customers Bancorp, Inc Fixed-to-Floating Rate Non-Cumulative Perpetual Preferred Stock, Series F" },
-    { symbol: "CUK", name: "Carnival Plc ADS ADS" },
-    { symbol: "CULP", name: "Culp, Inc. Common Stock" },
-    { symbol: "CURB", name: "Curbline Properties Corp. Common Stock" },
-    { symbol: "CURE", name: "Direxion Daily Healthcare Bull 3X Shares" },
-    { symbol: "CURV", name: "Torrid Holdings Inc. Common Stock" },
-    { symbol: "CUT", name: "Invesco MSCI Global Timber ETF" },
-    { symbol: "CUZ", name: "Cousins Properties Incorporated Common Stock" },
-    { symbol: "CVAR", name: "ETF Opportunities Trust Cultivar ETF" },
-    { symbol: "CVE", name: "Cenovus Energy Inc Common Stock" },
-    { symbol: "CVE.W", name: "Cenovus Energy Inc Warrants (each warrant entitles the holder to purchase one common share at an exercise price of C$6.54 per share)" },
-    { symbol: "CVEO", name: "Civeo Corporation (Canada) Common Shares" },
-    { symbol: "CVI", name: "CVR Energy Inc. Common Stock" },
-    { symbol: "CVIE", name: "Morgan Stanley ETF Trust Calvert International Responsible Index ETF" },
-    { symbol: "CVLC", name: "Morgan Stanley ETF Trust Calvert US Large-Cap Core Responsible Index ETF" },
-    { symbol: "CVLG", name: "Covenant Logistics Group, Inc. Class A Common Stock" },
-    { symbol: "CVM", name: "Cel-Sci Corporation Common Stock" },
-    { symbol: "CVMC", name: "Morgan Stanley ETF Trust Calvert US Mid-Cap Core Responsible Index ETF" },
-    { symbol: "CVNA", name: "Carvana Co. Class A Common Stock" },
-    { symbol: "CVNY", name: "Tidal Trust II YieldMax CVNA Option Income Strategy ETF" },
-    { symbol: "CVR", name: "Chicago Rivet & Machine Co. Common Stock" },
-    { symbol: "CVRD", name: "Madison ETFs Trust Madison Covered Call ETF" },
-    { symbol: "CVRT", name: "Calamos ETF Trust Calamos Convertible Equity Alternative ETF" },
-    { symbol: "CVS", name: "CVS Health Corporation Common Stock" },
-    { symbol: "CVSB", name: "Morgan Stanley ETF Trust Calvert Ultra-Short Investment Grade ETF" },
-    { symbol: "CVSE", name: "Morgan Stanley ETF Trust Calvert US Select Equity ETF" },
-    { symbol: "CVU", name: "CPI Aerostructures, Inc. Common Stock" },
-    { symbol: "CVX", name: "Chevron Corporation Common Stock" },
-    { symbol: "CVY", name: "Invesco Zacks Multi-Asset Income ETF" },
-    { symbol: "CW", name: "Curtiss-Wright Corporation Common Stock" },
-    { symbol: "CWAN", name: "Clearwater Analytics Holdings, Inc. Class A Common Stock" },
-    { symbol: "CWB", name: "SPDR Bloomberg Convertible Securities ETF" },
-    { symbol: "CWEB", name: "Direxion Daily CSI China Internet Index Bull 2X Shares" },
-    { symbol: "CWEN", name: "Clearway Energy, Inc. Class C Common Stock" },
-    { symbol: "CWEN.A", name: "Clearway Energy, Inc. Class A Common Stock" },
-    { symbol: "CWH", name: "Camping World Holdings, Inc. Class A Common Stock" },
-    { symbol: "CWI", name: "SPDR MSCI ACWI ex-US ETF" },
-    { symbol: "CWK", name: "Cushman & Wakefield plc Ordinary Shares" },
-    { symbol: "CWS", name: "AdvisorShares Focused Equity ETF" },
-    { symbol: "CWT", name: "California Water Service Group Common Stock" },
-    { symbol: "CWVX", name: "Tradr 2X Long CRWV Daily ETF" },
-    { symbol: "CX", name: "Cemex, S.A.B. de C.V. Sponsored ADR" },
-    { symbol: "CXE", name: "MFS High Income Municipal Trust Common Stock" },
-    { symbol: "CXH", name: "MFS Investment Grade Municipal Trust Common Stock" },
-    { symbol: "CXM", name: "Sprinklr, Inc. Class A Common Stock" },
-    { symbol: "CXRN", name: "Listed Funds Trust Teucrium 2x Daily Corn ETF" },
-    { symbol: "CXT", name: "Crane NXT, Co. Common Stock" },
-    { symbol: "CXW", name: "CoreCivic, Inc. Common Stock" },
-    { symbol: "CYBN", name: "Cybin Inc. Common Shares" },
-    { symbol: "CYD", name: "China Yuchai International Limited Common Stock" },
-    { symbol: "CYH", name: "Community Health Systems, Inc. Common Stock" },
-    { symbol: "CZA", name: "Invesco Zacks Mid-Cap ETF" },
-    { symbol: "D", name: "Dominion Energy, Inc. Common Stock" },
-    { symbol: "DABS", name: "DoubleLine ETF Trust DoubleLine Asset-Backed Securities ETF" },
-    { symbol: "DAC", name: "Danaos Corporation Common Stock" },
-    { symbol: "DAL", name: "Delta Air Lines, Inc. Common Stock" },
-    { symbol: "DAN", name: "Dana Incorporated Common Stock " },
-    { symbol: "DAO", name: "Youdao, Inc. American Depositary Shares, each representing one Class A Ordinary Share" },
-    { symbol: "DAPR", name: "FT Vest U.S. Equity Deep Buffer ETF - April" },
-    { symbol: "DAR", name: "Darling Ingredients Inc. Common Stock" },
-    { symbol: "DARP", name: "Grizzle Growth ETF" },
-    { symbol: "DAT", name: "ProShares Big Data Refiners ETF" },
-    { symbol: "DAUG", name: "FT Vest U.S. Equity Deep Buffer ETF - August" },
-    { symbol: "DAVA", name: "Endava plc American Depositary Shares (each representing one Class A Ordinary Share)" },
-    { symbol: "DAY", name: "Dayforce, Inc. Common Stock" },
-    { symbol: "DB", name: "Deutsche Bank AG Common Stock" },
-    { symbol: "DBA", name: "Invesco DB Agriculture Fund" },
-    { symbol: "DBAW", name: "Xtrackers MSCI All World ex US Hedged Equity ETF" },
-    { symbol: "DBB", name: "Invesco DB Base Metals Fund" },
-    { symbol: "DBC", name: "Invesco DB Commodity Index Tracking Fund" },
-    { symbol: "DBD", name: "Diebold Nixdorf Incorporated Common stock" },
-    { symbol: "DBE", name: "Invesco DB Energy Fund" },
-    { symbol: "DBEF", name: "Xtrackers MSCI EAFE Hedged Equity ETF" },
-    { symbol: "DBEM", name: "Xtrackers MSCI Emerging Markets Hedged Equity ETF" },
-    { symbol: "DBEU", name: "Xtrackers MSCI Europe Hedged Equity ETF" },
-    { symbol: "DBEZ", name: "Xtrackers MSCI Eurozone Hedged Equity ETF" },
-    { symbol: "DBI", name: "Designer Brands Inc. Class A Common Stock" },
-    { symbol: "DBJP", name: "Xtrackers MSCI Japan Hedged Equity ETF" },
-    { symbol: "DBL", name: "DoubleLine Opportunistic Credit Fund Common Shares of Beneficial Interest" },
-    { symbol: "DBMF", name: "iMGP DBi Managed Futures Strategy ETF" },
-    { symbol: "DBND", name: "DoubleLine Opportunistic Core Bond ETF" },
-    { symbol: "DBO", name: "Invesco DB Oil Fund" },
-    { symbol: "DBP", name: "Invesco DB Precious Metals Fund" },
-    { symbol: "DBRG", name: "DigitalBridge Group, Inc." },
-    { symbol: "DBRG$H", name: "DigitalBridge Group, Inc. 7.125% Series H " },
-    { symbol: "DBRG$I", name: "DigitalBridge Group, Inc. 7.15% Series I " },
-    { symbol: "DBRG$J", name: "DigitalBridge Group, Inc. 7.125% Series J " },
-    { symbol: "DC", name: "Dakota Gold Corp. Common Stock" },
-    { symbol: "DC.W", name: "Dakota Gold Corp. Warrants, each warrant exercisable for one Common Share at an exercise price of $2.08" },
-    { symbol: "DCI", name: "Donaldson Company, Inc. Common Stock" },
-    { symbol: "DCMT", name: "DoubleLine ETF Trust DoubleLine Commodity Strategy ETF" },
-    { symbol: "DCO", name: "Ducommun Incorporated Common Stock" },
-    { symbol: "DCOR", name: "Dimensional ETF Trust Dimensional US Core Equity 1 ETF" },
-    { symbol: "DCRE", name: "DoubleLine ETF Trust DoubleLine Commercial Real Estate ETF" },
-    { symbol: "DD", name: "DuPont de Nemours, Inc. Common Stock" },
-    { symbol: "DDC", name: "DDC Enterprise Limited Class A Ordinary Shares" },
-    { symbol: "DDD", name: "3D Systems Corporation Common Stock" },
-    { symbol: "DDEC", name: "FT Vest U.S. Equity Deep Buffer ETF - December" },
-    { symbol: "DDFL", name: "Innovator ETFs Trust Innovator Equity Dual Directional 15 Buffer ETF - July" },
-    { symbol: "DDFS", name: "Innovator ETFs Trust Innovator Equity Dual Directional 15 Buffer ETF - September" },
-    { symbol: "DDL", name: "Dingdong (Cayman) Limited American Depositary Shares (each two representing three Ordinary Shares)" },
-    { symbol: "DDLS", name: "WisdomTree Dynamic International SmallCap Equity Fund" },
-    { symbol: "DDM", name: "ProShares Ultra Dow30" },
-    { symbol: "DDS", name: "Dillard's, Inc. Common Stock" },
-    { symbol: "DDT", name: "Dillard's Capital Trust I" },
-    { symbol: "DDTL", name: "Innovator ETFs Trust Innovator Equity Dual Directional 10 Buffer ETF - July" },
-    { symbol: "DDTS", name: "Innovator ETFs Trust Innovator Equity Dual Directional 10 Buffer ETF - September" },
-    { symbol: "DDWM", name: "WisdomTree Dynamic International Equity Fund" },
-    { symbol: "DE", name: "Deere & Company Common Stock" },
-    { symbol: "DEA", name: "Easterly Government Properties, Inc. Common Stock" },
-    { symbol: "DEC", name: "Diversified Energy Company plc Ordinary Shares" },
-    { symbol: "DECK", name: "Deckers Outdoor Corporation Common Stock" },
-    { symbol: "DECM", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Max Buffer ETF - December" },
-    { symbol: "DECP", name: "PGIM S&P 500 Buffer 12 ETF - December" },
-    { symbol: "DECT", name: "AIM ETF Products Trust AllianzIM U.S. Large Cap Buffer10 Dec ETF" },
-    { symbol: "DECU", name: "AIM ETF Products Trust AllianzIM U.S. Equity Buffer15 Uncapped Dec ETF" },
-    { symbol: "DECW", name: "AIM ETF Products Trust AllianzIM U.S. Large Cap Buffer20 Dec ETF" },
-    { symbol: "DECZ", name: "TrueShares Structured Outcome (December) ETF" },
-    { symbol: "DEED", name: "First Trust Securitized Plus ETF" },
-    { symbol: "DEEF", name: "Xtrackers FTSE Developed ex US Multifactor ETF" },
-    { symbol: "DEEP", name: "Acquirers Small and Micro Deep Value ETF" },
-    { symbol: "DEFI", name: "Tidal Commodities Trust I Hashdex Bitcoin ETF" },
-    { symbol: "DEFR", name: "ETF Series Solutions Aptus Deferred Income ETF" },
-    { symbol: "DEHP", name: "Dimensional ETF Trust Dimensional Emerging Markets High Profitability ETF" },
-    { symbol: "DEI", name: "Douglas Emmett, Inc. Common Stock" },
-    { symbol: "DELL", name: "Dell Technologies Inc. Class C Common Stock " },
-    { symbol: "DEM", name: "WisdomTree Emerging Markets High Dividend Fund" },
-    { symbol: "DEO", name: "Diageo plc Common Stock" },
-    { symbol: "DES", name: "WisdomTree U.S. SmallCap Dividend Fund" },
-    { symbol: "DESK", name: "VanEck ETF Trust VanEck Office and Commercial REIT ETF" },
-    { symbol: "DEUS", name: "Xtrackers Russell US Multifactor ETF" },
-    { symbol: "DEW", name: "WisdomTree Global High Dividend Fund" },
-    { symbol: "DEXC", name: "Dimensional ETF Trust Dimensional Emerging Markets ex China Core Equity ETF" },
-    { symbol: "DFAC", name: "Dimensional ETF Trust Dimensional U.S. Core Equity 2 ETF" },
-    { symbol: "DFAE", name: "Dimensional Emerging Core Equity Market ETF" },
-    { symbol: "DFAI", name: "Dimensional International Core Equity Market ETF" },
-    { symbol: "DFAR", name: "Dimensional ETF Trust Dimensional US Real Estate ETF" },
-    { symbol: "DFAS", name: "Dimensional U.S. Small Cap ETF" },
-    { symbol: "DFAT", name: "Dimensional U.S. Targeted Value ETF" },
-    { symbol: "DFAU", name: "Dimensional US Core Equity Market ETF" },
-    { symbol: "DFAW", name: "Dimensional ETF Trust Dimensional World Equity ETF" },
-    { symbol: "DFAX", name: "Dimensional World ex U.S. Core Equity 2 ETF" },
-    { symbol: "DFCA", name: "Dimensional ETF Trust Dimensional California Municipal Bond ETF" },
-    { symbol: "DFCF", name: "Dimensional ETF Trust Dimensional Core Fixed Income ETF" },
-    { symbol: "DFE", name: "WisdomTree Europe SmallCap Dividend Fund" },
-    { symbol: "DFEB", name: "FT Vest U.S. Equity Deep Buffer ETF - February" },
-    { symbol: "DFEM", name: "Dimensional ETF Trust Dimensional Emerging Markets Core Equity 2 ETF" },
-    { symbol: "DFEN", name: "Direxion Daily Aerospace & Defense Bull 3X Shares" },
-    { symbol: "DFEV", name: "Dimensional ETF Trust Dimensional Emerging Markets Value ETF" },
-    { symbol: "DFGR", name: "Dimensional ETF Trust Dimensional Global Real Estate ETF" },
-    { symbol: "DFH", name: "Dream Finders Homes, Inc. Class A Common Stock" },
-    { symbol: "DFIC", name: "Dimensional ETF Trust Dimensional International Core Equity 2 ETF" },
-    { symbol: "DFII", name: "First Trust Exchange-Traded Fund FT Vest Bitcoin Strategy & Target Income ETF" },
-    { symbol: "DFIN", name: "Donnelley Financial Solutions, Inc. Common Stock " },
-    { symbol: "DFIP", name: "Dimensional ETF Trust Dimensional Inflation-Protected Securities ETF" },
-    { symbol: "DFIS", name: "Dimensional ETF Trust Dimensional International Small Cap ETF" },
-    { symbol: "DFIV", name: "Dimensional International Value ETF" },
-    { symbol: "DFJ", name: "WisdomTree Japan SmallCap Fund" },
-    { symbol: "DFLV", name: "Dimensional ETF Trust Dimensional US Large Cap Value ETF" },
-    { symbol: "DFND", name: "Siren DIVCON Dividend Defender ETF" },
-    { symbol: "DFNL", name: "Davis Fundamental ETF Trust Davis Select Financial ETF" },
-    { symbol: "DFNM", name: "Dimensional ETF Trust Dimensional National Municipal Bond ETF" },
-    { symbol: "DFP", name: "Flaherty & Crumrine Dynamic Preferred and Income Fund Inc. Common Stock" },
-    { symbol: "DFSB", name: "Dimensional ETF Trust Dimensional Global Sustainability Fixed Income ETF" },
-    { symbol: "DFSD", name: "Dimensional ETF Trust Dimensional Short-Duration Fixed Income ETF" },
-    { symbol: "DFSE", name: "Dimensional ETF Trust Dimensional Emerging Markets Sustainability Core 1 ETF" },
-    { symbol: "DFSI", name: "Dimensional ETF Trust Dimensional International Sustainability Core 1 ETF" },
-    { symbol: "DFSU", name: "Dimensional ETF Trust Dimensional US Sustainability Core 1 ETF" },
-    { symbol: "DFSV", name: "Dimensional ETF Trust Dimensional US Small Cap Value ETF" },
-    { symbol: "DFUS", name: "Dimensional U.S. Equity Market ETF" },
-    { symbol: "DFUV", name: "Dimensional ETF Trust Dimensional US Marketwide Value ETF" },
-    { symbol: "DFVE", name: "DoubleLine ETF Trust DoubleLine Fortune 500 Equal Weight ETF" },
-    { symbol: "DFVX", name: "Dimensional ETF Trust Dimensional US Large Cap Vector ETF" },
-    { symbol: "DG", name: "Dollar General Corporation Common Stock" },
-    { symbol: "DGIN", name: "VanEck ETF Trust VanEck Digital India ETF" },
-    { symbol: "DGP", name: "DB Gold Double Long ETN due February 15, 2038" },
-    { symbol: "DGRO", name: "iShares Core Dividend Growth ETF" },
-    { symbol: "DGS", name: "WisdomTree Emerging Market SmallCap Fund" },
-    { symbol: "DGT", name: "SPDR Global Dow ETF (based on The Global Dow)" },
-    { symbol: "DGX", name: "Quest Diagnostics Incorporated Common Stock" },
-    { symbol: "DGZ", name: "DB Gold Short ETN due February 15, 2038" },
-    { symbol: "DHDG", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Quarterly 2.5 to 15 Buffer ETF" },
-    { symbol: "DHF", name: "BNY Mellon High Yield Strategies Fund Common Stock" },
-    { symbol: "DHI", name: "D.R. Horton, Inc. Common Stock" },
-    { symbol: "DHR", name: "Danaher Corporation Common Stock" },
-    { symbol: "DHS", name: "WisdomTree U.S. High Dividend Fund" },
-    { symbol: "DHSB", name: "Strategy Shares Day Hagan Smart Buffer ETF" },
-    { symbol: "DHT", name: "DHT Holdings, Inc." },
-    { symbol: "DHX", name: "DHI Group, Inc. Common Stock" },
-    { symbol: "DHY", name: "Credit Suisse High Yield Bond Fund Common Stock" },
-    { symbol: "DIA", name: "SPDR Dow Jones Industrial Average ETF" },
-    { symbol: "DIAL", name: "Columbia Diversified Fixed Income Allocation ETF" },
-    { symbol: "DIAX", name: "Nuveen Dow 30SM Dynamic Overwrite Fund Common Shares of Beneficial Interest" },
-    { symbol: "DIEM", name: "Franklin Emerging Market Core Dividend Tilt Index ETF" },
-    { symbol: "DIG", name: "ProShares Ultra Energy" },
-    { symbol: "DIHP", name: "Dimensional ETF Trust Dimensional International High Profitability ETF" },
-    { symbol: "DIM", name: "WisdomTree International MidCap Dividend Fund" },
-    { symbol: "DIN", name: "Dine Brands Global, Inc. Common Stock" },
-    { symbol: "DINO", name: "HF Sinclair Corporation Common Stock" },
-    { symbol: "DINT", name: "Davis Fundamental ETF Trust Davis Select International ETF" },
-    { symbol: "DIPS", name: "Tidal Trust II YieldMax Short NVDA Option Income Strategy ETF" },
-    { symbol: "DIS", name: "Walt Disney Company (The) Common Stock" },
-    { symbol: "DISO", name: "Tidal ETF Trust II YieldMax DIS Option Income Strategy ETF" },
-    { symbol: "DISV", name: "Dimensional ETF Trust Dimensional International Small Cap Value ETF" },
-    { symbol: "DIT", name: "AMCON Distributing Company Common Stock" },
-    { symbol: "DIV", name: "Global X Super Dividend ETF" },
-    { symbol: "DIVB", name: "iShares Core Dividend ETF" },
-    { symbol: "DIVG", name: "Invesco Exchange-Traded Fund Trust II Invesco S&P 500 High Dividend Growers ETF" },
-    { symbol: "DIVI", name: "Franklin International Core Dividend Tilt Index ETF" },
-    { symbol: "DIVL", name: "Madison ETFs Trust Madison Dividend Value ETF" },
-    { symbol: "DIVN", name: "Horizon Funds Horizon Dividend Income ETF" },
-    { symbol: "DIVO", name: "Amplify CWP Enhanced Dividend Income ETF" },
-    { symbol: "DIVP", name: "The Advisors Inner Circle Fund II Cullen Enhanced Equity Income ETF" },
-    { symbol: "DIVS", name: "SmartETFs Dividend Builder ETF" },
-    { symbol: "DIVY", name: "Sound Equity Dividend Income ETF" },
-    { symbol: "DIVZ", name: "Listed Funds Trust Opal Dividend Income ETF" },
-    { symbol: "DJAN", name: "FT Vest U.S. Equity Deep Buffer ETF - January" },
-    { symbol: "DJD", name: "Invesco Dow Jones Industrial Average Dividend ETF" },
-    { symbol: "DJIA", name: "Global X Funds Global X Dow 30 Covered Call ETF" },
-    { symbol: "DJP", name: "iPath Bloomberg Commodity Index Total Return ETN" },
-    { symbol: "DJTU", name: "ETF Opportunities Trust T-REX 2X Long DJT Daily Target ETF" },
-    { symbol: "DJUL", name: "FT Vest U.S. Equity Deep Buffer ETF - July" },
-    { symbol: "DJUN", name: "FT Vest U.S. Equity Deep Buffer ETF - June" },
-    { symbol: "DK", name: "Delek US Holdings, Inc. Common Stock" },
-    { symbol: "DKL", name: "Delek Logistics Partners, L.P. Common Units representing Limited Partner Interests" },
-    { symbol: "DKS", name: "Dick's Sporting Goods Inc Common Stock" },
-    { symbol: "DKUP", name: "ETF Opportunities Trust T-REX 2X Long DKNG Daily Target ETF" },
-    { symbol: "DLB", name: "Dolby Laboratories Common Stock" },
-    { symbol: "DLN", name: "WisdomTree U.S. LargeCap Dividend Fund" },
-    { symbol: "DLNG", name: "Dynagas LNG Partners LP Common Units" },
-    { symbol: "DLNG$A", name: "Dynagas LNG Partners LP 9.00% Series A Cumulative Redeemable Preferred Units" },
-    { symbol: "DLR", name: "Digital Realty Trust, Inc. Common Stock" },
-    { symbol: "DLR$J", name: "Digital Realty Trust, Inc. 5.250% Series J Cumulative Redeemable Preferred Stock" },
-    { symbol: "DLR$K", name: "Digital Realty Trust, Inc. 5.850% Series K Cumulative Redeemable Preferred Stock, par value $0.01 per share" },
-    { symbol: "DLR$L", name: "Digital Realty Trust, Inc. 5.200% Series L Cumulative Redeemable Preferred Stock" },
-    { symbol: "DLS", name: "WisdomTree International SmallCap Fund" },
-    { symbol: "DLX", name: "Deluxe Corporation Common Stock" },
-    { symbol: "DLY", name: "DoubleLine Yield Opportunities Fund Common Shares of Beneficial Interest" },
-    { symbol: "DMA", name: "Destra Multi-Alternative Fund Common Stock" },
-    { symbol: "DMAR", name: "FT Vest U.S. Equity Deep Buffer ETF - March" },
-    { symbol: "DMAX", name: "iShares Trust iShares Large Cap Max Buffer Dec ETF" },
-    { symbol: "DMAY", name: "FT Vest U.S. Equity Deep Buffer ETF - May" },
-    { symbol: "DMB", name: "BNY Mellon Municipal Bond Infrastructure Fund, Inc. Common Stock" },
-    { symbol: "DMBS", name: "DoubleLine ETF Trust DoubleLine Mortgage ETF" },
-    { symbol: "DMCY", name: "Democracy International Fund" },
-    { symbol: "DMO", name: "Western Asset Mortgage Opportunity Fund Inc. Common Stock" },
-    { symbol: "DMX", name: "DoubleLine ETF Trust DoubleLine Multi-Sector Income ETF" },
-    { symbol: "DMYY", name: "dMY Squared Technology Group, Inc. Class A Common Stock" },
-    { symbol: "DMYY.U", name: "dMY Squared Technology Group, Inc. Units, each consisting of one share of Class A common stock and one-half of one redeemable warrant" },
-    { symbol: "DMYY.W", name: "dMY Squared Technology Group, Inc. Redeemable Warrants, each whole warrant exercisable for one share of Class A common stock at an exercise price of $11.50 per share" },
-    { symbol: "DNA", name: "Ginkgo Bioworks Holdings, Inc. Class A Common Stock" },
-    { symbol: "DNL", name: "WisdomTree Global ex-US Quality Dividend Growth Fund" },
-    { symbol: "DNN", name: "Denison Mines Corp Ordinary Shares (Canada)" },
-    { symbol: "DNOV", name: "FT Vest U.S. Equity Deep Buffer ETF - November" },
-    { symbol: "DNOW", name: "DNOW Inc. Common Stock" },
-    { symbol: "DNP", name: "DNP Select Income Fund, Inc. Common Stock" },
-    { symbol: "DOC", name: "Healthpeak Properties, Inc. Common Stock" },
-    { symbol: "DOCN", name: "DigitalOcean Holdings, Inc. Common Stock" },
-    { symbol: "DOCS", name: "Doximity, Inc. Class A Common Stock" },
-    { symbol: "DOCT", name: "FT Vest U.S. Equity Deep Buffer ETF - October" },
-    { symbol: "DOG", name: "ProShares Short Dow30" },
-    { symbol: "DOGD", name: "Tradr 2X Long DDOG Daily ETF" },
-    { symbol: "DOGG", name: "FT Vest DJIA Dogs 10 Target Income ETF" },
-    { symbol: "DOL", name: "WisdomTree International LargeCap Dividend Fund" },
-    { symbol: "DOLE", name: "Dole plc Ordinary Shares" },
-    { symbol: "DON", name: "WisdomTree U.S. MidCap Dividend Fund" },
-    { symbol: "DOUG", name: "Douglas Elliman Inc. Common Stock" },
-    { symbol: "DOV", name: "Dover Corporation Common Stock" },
-    { symbol: "DOW", name: "Dow Inc. Common Stock " },
-    { symbol: "DPG", name: "Duff & Phelps Utility and Infrastructure Fund Inc." },
-    { symbol: "DPST", name: "Direxion Daily Regional Banks Bull 3X Shares" },
-    { symbol: "DQ", name: "DAQO New Energy Corp. American Depositary Shares, each representing five ordinary shares" },
-    { symbol: "DRAG", name: "Roundhill ETF Trust Roundhill China Dragons ETF" },
-    { symbol: "DRAI", name: "EA Series Trust Draco Evolution AI ETF" },
-    { symbol: "DRAY", name: "Tidal Trust II YieldMax DKNG Option Income Strategy ETF" },
-    { symbol: "DRD", name: "DRDGOLD Limited American Depositary Shares" },
-    { symbol: "DRGN", name: "Themes ETF Trust Themes China Generative Artificial Intelligence ETF" },
-    { symbol: "DRH", name: "Diamondrock Hospitality Company Common Stock" },
-    { symbol: "DRH$A", name: "Diamondrock Hospitality Company 8.250% Series A Cumulative Redeemable Preferred Stock" },
-    { symbol: "DRI", name: "Darden Restaurants, Inc. Common Stock" },
-    { symbol: "DRIP", name: "Direxion Daily S&P Oil & Gas Exp. & Prod. Bear 2X Shares" },
-    { symbol: "DRLL", name: "EA Series Trust Strive U.S. Energy ETF" },
-    { symbol: "DRN", name: "Direxion Daily Real Estate Bull 3X Shares" },
-    { symbol: "DRSK", name: "Aptus Defined Risk ETF " },
-    { symbol: "DRUP", name: "GraniteShares Nasdaq Select Disruptors ETF" },
-    { symbol: "DRV", name: "Direxion Daily Real Estate Bear 3X Shares" },
-    { symbol: "DSCF", name: "Discipline Fund ETF" },
-    { symbol: "DSEP", name: "FT Vest U.S. Equity Deep Buffer ETF - September" },
-    { symbol: "DSI", name: "iShares ESG MSCI KLD 400 ETF" },
-    { symbol: "DSL", name: "DoubleLine Income Solutions Fund Common Shares of Beneficial Interests" },
-    { symbol: "DSM", name: "BNY Mellon Strategic Municipal Bond Fund, Inc. Common Stock" },
-    { symbol: "DSMC", name: "ETF Series Solutions Distillate Small/Mid Cash Flow ETF" },
-    { symbol: "DSPY", name: "Tema ETF Trust Tema S&P 500  Historical Weight ETF Strategy" },
-    { symbol: "DSS", name: "DSS, Inc. Common Stock" },
-    { symbol: "DSTL", name: "Distillate U.S. Fundamental Stability & Value ETF" },
-    { symbol: "DSTX", name: "Distillate International Fundamental Stability & Value ETF" },
-    { symbol: "DSU", name: "Blackrock Debt Strategies Fund, Inc. Common Stock" },
-    { symbol: "DSX", name: "Diana Shipping inc. common stock" },
-    { symbol: "DSX$B", name: "Diana Shipping Inc. Perpetual Preferred Shares Series B (Marshall Islands)" },
-    { symbol: "DSX.W", name: "Diana Shipping inc. Warrants" },
-    { symbol: "DT", name: "Dynatrace, Inc. Common Stock" },
-    { symbol: "DTAN", name: "EA Series Trust Sparkline International Intangible Value ETF" },
-    { symbol: "DTB", name: "DTE Energy Company 2020 Series G 4.375% Junior Subordinated Debentures due 2080" },
-    { symbol: "DTD", name: "WisdomTree U.S. Total Dividend Fund" },
-    { symbol: "DTE", name: "DTE Energy Company Common Stock" },
-    { symbol: "DTEC", name: "ALPS ETF Trust ALPS Disruptive Technologies ETF" },
-    { symbol: "DTF", name: "DTF Tax-Free Income 2028 Term Fund Inc. Common Stock" },
-    { symbol: "DTG", name: "DTE Energy Company 2021 Series E 4.375% Junior Subordinated Debentures" },
-    { symbol: "DTH", name: "WisdomTree International High Dividend Fund" },
-    { symbol: "DTM", name: "DT Midstream, Inc. Common Stock " },
-    { symbol: "DTRE", name: "First Trust Alerian Disruptive Technology Real Estate ETF" },
-    { symbol: "DTW", name: "DTE Energy Company 2017 Series E 5.25% Junior Subordinated Debentures due 2077" },
-    { symbol: "DUBS", name: "ETF Series Solutions Aptus Large Cap Enhanced Yield ETF" },
-    { symbol: "DUG", name: "ProShares UltraShort Energy" },
-    { symbol: "DUHP", name: "Dimensional ETF Trust Dimensional US High Profitability ETF" },
-    { symbol: "DUK", name: "Duke Energy Corporation (Holding Company) Common Stock" },
-    { symbol: "DUK$A", name: "Duke Energy Corporation Depositary Shares, each representing a 1/1,000th interest in a share of 5.75% Series A Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "DUKB", name: "Duke Energy Corporation 5.625% Junior Subordinated Debentures due 2078" },
-    { symbol: "DUKQ", name: "Northern Lights Fund Trust Ocean Park Domestic ETF" },
-    { symbol: "DUKZ", name: "Northern Lights Fund Trust Ocean Park Diversified Income ETF" },
-    { symbol: "DULL", name: "Bank Of Montreal MicroSectors Gold -3X Inverse Leveraged ETNs due January 29, 2043" },
-    { symbol: "DURA", name: "VanEck Durable High Dividend ETF" },
-    { symbol: "DUSA", name: "Davis Fundamental ETF Trust Davis Select U.S. Equity ETF" },
-    { symbol: "DUSB", name: "Dimensional ETF Trust Dimensional Ultrashort Fixed Income ETF" },
-    { symbol: "DUSL", name: "Direxion Daily Industrials Bull 3X Shares" },
-    { symbol: "DUST", name: "Direxion Daily Gold Miners Index Bear 2X Shares" },
-    { symbol: "DV", name: "DoubleVerify Holdings, Inc. Common Stock" },
-    { symbol: "DVA", name: "DaVita Inc. Common Stock" },
-    { symbol: "DVDN", name: "ETF Opportunities Trust Kingsbarn Dividend Opportunity ETF" },
-    { symbol: "DVN", name: "Devon Energy Corporation Common Stock" },
-    { symbol: "DVND", name: "Touchstone ETF Trust Touchstone Dividend Select ETF" },
-    { symbol: "DVS", name: "Dolly Varden Silver Corporation Common Shares" },
-    { symbol: "DVYA", name: "iShares Asia / Pacific Dividend 30 Index Fund Exchange Traded Fund" },
-    { symbol: "DVYE", name: "iShares Emerging Markets Dividend Index Fund Exchange Traded Fund" },
-    { symbol: "DWLD", name: "Davis Fundamental ETF Trust Davis Select Worldwide ETF" },
-    { symbol: "DWM", name: "WisdomTree International Equity Fund" },
-    { symbol: "DWMF", name: "WisdomTree International Multifactor Fund" },
-    { symbol: "DWX", name: "SPDR S&P International Dividend ETF" },
-    { symbol: "DX", name: "Dynex Capital, Inc. Common Stock" },
-    { symbol: "DX$C", name: "Dynex Capital, Inc. 6.900% Series C Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "DXC", name: "DXC Technology Company Common Stock " },
-    { symbol: "DXD", name: "ProShares UltraShort Dow30" },
-    { symbol: "DXF", name: "Eason Technology Limited American Depositary Shares (each representing sixty-thousand (60,000) Ordinary Shares)" },
-    { symbol: "DXIV", name: "Dimensional ETF Trust Dimensional International Vector Equity ETF" },
-    { symbol: "DXJ", name: "WisdomTree Japan Hedged Equity Fund" },
-    { symbol: "DXUV", name: "Dimensional ETF Trust Dimensional US Vector Equity ETF" },
-    { symbol: "DXYZ", name: "Destiny Tech100 Inc. Common Stock" },
-    { symbol: "DY", name: "Dycom Industries, Inc. Common Stock" },
-    { symbol: "DYLD", name: "LeaderShares Dynamic Yield ETF" },
-    { symbol: "DYLG", name: "Global X Funds Global X Dow 30 Covered Call & Growth ETF" },
-    { symbol: "DYNF", name: "iShares U.S. Equity Factor Rotation Active ETF" },
-    { symbol: "DZZ", name: "DB Gold Double Short ETN due February 15, 2038" },
-    { symbol: "E", name: "ENI S.p.A. Common Stock" },
-    { symbol: "EAD", name: "Allspring Income Opportunities Fund Common Shares" },
-    { symbol: "EAF", name: "GrafTech International Ltd. Common Stock" },
-    { symbol: "EAFG", name: "Pacer Funds Trust Pacer Developed Markets Cash Cows Growth Leaders ETF" },
-    { symbol: "EAGG", name: "iShares ESG Aware U.S. Aggregate Bond ETF" },
-    { symbol: "EAGL", name: "The 2023 ETF Series Trust Eagle Capital Select Equity ETF" },
-    { symbol: "EAI", name: "Entergy Arkansas, LLC First Mortgage Bonds, 4.875% Series Due September 1, 2066" },
-    { symbol: "EALT", name: "Innovator ETFs Trust Innovator U.S. Equity 5 to 15 Buffer ETF - Quarterly" },
-    { symbol: "EAOA", name: "iShares ESG Aware 80/20 Aggressive Allocation ETF" },
-    { symbol: "EAOK", name: "iShares ESG Aware 30/70 Conservative Allocation ETF" },
-    { symbol: "EAOM", name: "iShares ESG Aware 40/60 Moderate Allocation ETF" },
-    { symbol: "EAOR", name: "iShares ESG Aware 60/40 Balanced Allocation ETF" },
-    { symbol: "EAPR", name: "Innovator Emerging Markets Power Buffer ETF April" },
-    { symbol: "EARN", name: "Ellington Credit Company Common Shares of Beneficial Interest" },
-    { symbol: "EASG", name: "Xtrackers MSCI EAFE Selection Equity ETF" },
-    { symbol: "EAT", name: "Brinker International, Inc. Common Stock" },
-    { symbol: "EATZ", name: "AdvisorShares Restaurant ETF" },
-    { symbol: "EB", name: "Eventbrite, Inc. Class A Common Stock" },
-    { symbol: "EBF", name: "Ennis, Inc. Common Stock" },
-    { symbol: "EBIT", name: "Harbor ETF Trust Harbor AlphaEdge Small Cap Earners ETF" },
-    { symbol: "EBND", name: "SPDR Bloomberg Emerging Markets Local Bond ETF" },
-    { symbol: "EBR", name: "Centrais Electricas Brasileiras S A American Depositary Shares (Each representing one Common Share)" },
-    { symbol: "EBR.B", name: "Centrais Electricas Brasileiras S.A. Sponsored ADS representing Pfd Shares" },
-    { symbol: "EBS", name: "Emergent BioSolutions Inc. Common Stock" },
-    { symbol: "EBUF", name: "SHL Telemedicine Ltd Innovator Emerging Markets 10 Buffer ETF - Quarterly" },
-    { symbol: "EC", name: "Ecopetrol S.A. American Depositary Shares" },
-    { symbol: "ECAT", name: "BlackRock ESG Capital Allocation Term Trust Common Shares of Beneficial Interest" },
-    { symbol: "ECC", name: "Eagle Point Credit Company Inc. Common Stock" },
-    { symbol: "ECC$D", name: "Eagle Point Credit Company Inc. 6.75% Series D Preferred Stock" },
-    { symbol: "ECCC", name: "Eagle Point Credit Company Inc. 6.50% Series C Term Preferred Stock due 2031" },
-    { symbol: "ECCF", name: "Eagle Point Credit Company Inc. 8.00% Series F Term Preferred Stock due 2029" },
-    { symbol: "ECCU", name: "Eagle Point Credit Company Inc. 7.75% Notes due 2030" },
-    { symbol: "ECCV", name: "Eagle Point Credit Company Inc. 5.375% Notes due 2029" },
-    { symbol: "ECCW", name: "Eagle Point Credit Company Inc. 6.75% Notes due 2031" },
-    { symbol: "ECCX", name: "Eagle Point Credit Company Inc. 6.6875% Notes due 2028" },
-    { symbol: "ECF", name: "Ellsworth Growth and Income Fund Ltd." },
-    { symbol: "ECF$A", name: "Ellsworth Growth and Income Fund Ltd. 5.25% Series A Cumulative Preferred Shares (Liquidation Preference $25.00 per share)" },
-    { symbol: "ECG", name: "Everus Construction Group, Inc. Common Stock" },
-    { symbol: "ECH", name: "iShares Inc. iShares MSCI Chile ETF" },
-    { symbol: "ECL", name: "Ecolab Inc. Common Stock" },
-    { symbol: "ECML", name: "EA Series Trust Euclidean Fundamental Value ETF" },
-    { symbol: "ECNS", name: "iShares MSCI China Small-Cap ETF" },
-    { symbol: "ECO", name: "Okeanis Eco Tankers Corp. Common Stock" },
-    { symbol: "ECON", name: "Columbia Research Enhanced Emerging Economies ETF" },
-    { symbol: "ECVT", name: "Ecovyst Inc. Common Stock" },
-    { symbol: "ED", name: "Consolidated Edison, Inc. Common Stock" },
-    { symbol: "EDC", name: "Direxion Emerging Markets Bull 3X Shares" },
-    { symbol: "EDD", name: "Morgan Stanley Emerging Markets Domestic Debt Fund, Inc. Common Stock" },
-    { symbol: "EDEN", name: "iShares Inc iShares MSCI Denmark ETF" },
-    { symbol: "EDF", name: "Virtus Stone Harbor Emerging Markets Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "EDGE", name: "EA Series Trust MRBL Enhanced Equity ETF" },
-    { symbol: "EDGF", name: "The Advisors Inner Circle Fund II 3EDGE Dynamic Fixed Income ETF" },
-    { symbol: "EDGH", name: "The Advisors Inner Circle Fund II 3EDGE Dynamic Hard Assets ETF" },
-    { symbol: "EDGI", name: "The Advisors Inner Circle Fund II 3EDGE Dynamic International Equity ETF" },
-    { symbol: "EDGU", name: "The Advisors Inner Circle Fund II 3EDGE Dynamic US Equity ETF" },
-    { symbol: "EDIV", name: "SPDR S&P Emerging Markets Dividend ETF" },
-    { symbol: "EDN", name: "Empresa Distribuidora Y Comercializadora Norte S.A. (Edenor) American Depositary Shares" },
-    { symbol: "EDOG", name: "ALPS Emerging Sector Dividend Dogs ETF" },
-    { symbol: "EDOW", name: "First Trust Dow 30 Equal Weight ETF" },
-    { symbol: "EDU", name: "New Oriental Education & Technology Group, Inc. Sponsored ADR representing 10 Ordinary Share (Cayman Islands)" },
-    { symbol: "EDV", name: "Vanguard Extended Duration Treasury ETF" },
-    { symbol: "EDZ", name: "Direxion Emerging Markets Bear 3X Shares" },
-    { symbol: "EE", name: "Excelerate Energy, Inc. Class A Common Stock" },
-    { symbol: "EEA", name: "The European Equity Fund, Inc. Common Stock" },
-    { symbol: "EELV", name: "Invesco S&P Emerging Markets Low Volatility ETF" },
-    { symbol: "EEM", name: "iShares MSCI Emerging Index Fund" },
-    { symbol: "EEMO", name: "Invesco S&P Emerging Markets Momentum ETF" },
-    { symbol: "EEMS", name: "iShares MSCI Emerging Markets Small Cap ETF" },
-    { symbol: "EEMV", name: "iShares MSCI Emerging Markets Min Vol Factor ETF" },
-    { symbol: "EEMX", name: "SPDR MSCI Emerging Markets Fuel Reserves Free ETF" },
-    { symbol: "EES", name: "WisdomTree U.S. SmallCap Fund" },
-    { symbol: "EET", name: "ProShares Ultra MSCI Emerging Markets" },
-    { symbol: "EETH", name: "ProShares Ether ETF" },
-    { symbol: "EEV", name: "ProShares UltraShort MSCI Emerging Markets" },
-    { symbol: "EEX", name: "Emerald Holding, Inc. Common Stock" },
-    { symbol: "EFA", name: "iShares MSCI EAFE ETF" },
-    { symbol: "EFAA", name: "Invesco Actively Managed Exchange-Traded Fund Trus Invesco MSCI EAFE Income Advantage ETF" },
-    { symbol: "EFAD", name: "ProShares Trust ProShares MSCI EAFE Dividend Growers ETF" },
-    { symbol: "EFAV", name: "iShares MSCI EAFE Min Vol Factor ETF" },
-    { symbol: "EFAX", name: "SPDR MSCI EAFE Fossil Fuel Reserves Free ETF" },
-    { symbol: "EFC", name: "Ellington Financial Inc. Common Stock " },
-    { symbol: "EFC$A", name: "Ellington Financial Inc. 6.750% Series A Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "EFC$B", name: "Ellington Financial Inc. 6.250% Series B Fixed-Rate Reset Cumulative Redeemable Preferred Stock" },
-    { symbol: "EFC$C", name: "Ellington Financial Inc. 8.625% Series C Fixed-Rate Reset Cumulative Redeemable Preferred Stock" },
-    { symbol: "EFC$D", name: "Ellington Financial Inc. 7.00% Series D Cumulative Perpetual Redeemable Preferred Stock" },
-    { symbol: "EFFE", name: "Harbor ETF Trust Harbor Osmosis Emerging Markets Resource Efficient ETF" },
-    { symbol: "EFFI", name: "Harbor ETF Trust Harbor Osmosis International Resource Efficient ETF" },
-    { symbol: "EFG", name: "iShares MSCI EAFE Growth ETF" },
-    { symbol: "EFIV", name: "SPDR S&P 500 ESG ETF" },
-    { symbol: "EFNL", name: "iShares Inc iShares MSCI Finland ETF" },
-    { symbol: "EFO", name: "ProShares Ultra MSCI EAFE" },
-    { symbol: "EFR", name: "Eaton Vance Senior Floating-Rate Fund Common Shares of Beneficial Interest" },
-    { symbol: "EFT", name: "Eaton Vance Floating Rate Income Trust Common Shares of Beneficial Interest" },
-    { symbol: "EFU", name: "ProShares UltraShort MSCI EAFE" },
-    { symbol: "EFV", name: "iShares MSCI EAFE Value ETF" },
-    { symbol: "EFX", name: "Equifax, Inc. Common Stock" },
-    { symbol: "EFXT", name: "Enerflex Ltd Common Shares" },
-    { symbol: "EFZ", name: "ProShares Short MSCI EAFE" },
-    { symbol: "EG", name: "Everest Group, Ltd. Common Stock" },
-    { symbol: "EGG", name: "Enigmatig Limited Class A Ordinary Shares" },
-    { symbol: "EGGS", name: "Tidal Trust III NestYield Total Return Guard ETF" },
-    { symbol: "EGGY", name: "NestYield Dynamic Income ETF" },
-    { symbol: "EGLE", name: "Global X Funds Global X S&P 500 U.S. Revenue Leaders ETF" },
-    { symbol: "EGO", name: "Eldorado Gold Corporation Ordinary Shares" },
-    { symbol: "EGP", name: "EastGroup Properties, Inc. Common Stock" },
-    { symbol: "EGUS", name: "iShares Trust iShares ESG Aware MSCI USA Growth ETF" },
-    { symbol: "EGY", name: "VAALCO Energy, Inc.  Common Stock" },
-    { symbol: "EHAB", name: "Enhabit, Inc. Common Stock" },
-    { symbol: "EHC", name: "Encompass Health Corporation Common Stock" },
-    { symbol: "EHI", name: "Western Asset Global High Income Fund Inc Common Stock" },
-    { symbol: "EIC", name: "Eagle Point Income Company Inc. Common Stock" },
-    { symbol: "EICA", name: "Eagle Point Income Company Inc. 5.00% Series A Term Preferred Stock due 2026" },
-    { symbol: "EICB", name: "Eagle Point Income Company Inc. 7.75% Series B Term Preferred Stock Due 2028" },
-    { symbol: "EICC", name: "Eagle Point Income Company Inc. 8.00% Series C Term Preferred Stock due 2029" },
-    { symbol: "EIDO", name: "iShares MSCI Indonesia ETF" },
-    { symbol: "EIG", name: "Employers Holdings Inc Common Stock" },
-    { symbol: "EIIA", name: "Eagle Point Institutional Income Fund 8.125% Series A Term Preferred Shares Due 2029" },
-    { symbol: "EIM", name: "Eaton Vance Municipal Bond Fund Common Shares of Beneficial Interest, $.01 par value" },
-    { symbol: "EINC", name: "VanEck Energy Income ETF" },
-    { symbol: "EIPI", name: "First Trust Exchange-Traded Fund VIII FT Energy Income Partners Enhanced Income ETF" },
-    { symbol: "EIPX", name: "First Trust Exchange-Traded Fund IV FT Energy Income Partners Strategy ETF" },
-    { symbol: "EIRL", name: "iShares Trust iShares MSCI Ireland ETF" },
-    { symbol: "EIS", name: "iShares Inc iShares MSCI Israel ETF" },
-    { symbol: "EIX", name: "Edison International Common Stock" },
-    { symbol: "EJAN", name: "Innovator Emerging Markets Power Buffer ETF January" },
-    { symbol: "EJUL", name: "Innovator Emerging Markets Power Buffer ETF July" },
-    { symbol: "EL", name: "Estee Lauder Companies, Inc. (The) Common Stock" },
-    { symbol: "ELA", name: "Envela Corporation Common Stock" },
-    { symbol: "ELAN", name: "Elanco Animal Health Incorporated Common Stock" },
-    { symbol: "ELC", name: "Entergy Louisiana, Inc. Collateral Trust Mortgage Bonds, 4.875 % Series due September 1, 2066" },
-    { symbol: "ELCV", name: "Strategy Shares Eventide High Dividend ETF" },
-    { symbol: "ELD", name: "WisdomTree Emerging Markets Local Debt Fund" },
-    { symbol: "ELF", name: "e.l.f. Beauty, Inc. Common Stock" },
-    { symbol: "ELLO", name: "Ellomay Capital Ltd Ordinary Shares (Israel)" },
-    { symbol: "ELM", name: "Series Portfolios Trust Elm Market Navigator ETF" },
-    { symbol: "ELMD", name: "Electromed, Inc. Common Stock" },
-    { symbol: "ELME", name: "Elme Communities Common Stock" },
-    { symbol: "ELON", name: "Tidal Trust III Battleshares TSLA vs F ETF" },
-    { symbol: "ELP", name: "Companhia Paranaense de Energia (COPEL) American Depositary Shares (each representing one Unit consisting one Common Share and four non-voting Class B Preferred Shares)" },
-    { symbol: "ELPC", name: "Companhia Paranaense de Energia (COPEL) American Depositary Shares (each representing four (4) Common Shares)" },
-    { symbol: "ELS", name: "Equity Lifestyle Properties, Inc. Common Stock" },
-    { symbol: "ELV", name: "Elevance Health, Inc. Common Stock" },
-    { symbol: "EMA", name: "Emera Incorporated Common Shares" },
-    { symbol: "EMBD", name: "Global X Emerging Markets Bond ETF" },
-    { symbol: "EMC", name: "Global X Funds Global X Emerging Markets Great Consumer ETF" },
-    { symbol: "EMCR", name: "Xtrackers Emerging Markets Carbon Reduction and Climate Improvers ETF" },
-    { symbol: "EMCS", name: "Xtrackers MSCI Emerging Markets Climate Selection ETF" },
-    { symbol: "EMD", name: "Western Asset Emerging Markets Debt Fund Inc Common Stock" },
-    { symbol: "EMDM", name: "First Trust Exchange-Traded Fund II First Trust Bloomberg Emerging Market Democracies ETF" },
-    { symbol: "EMDV", name: "ProShares MSCI Emerging Markets Dividend Growers ETF" },
-    { symbol: "EME", name: "EMCOR Group, Inc. Common Stock" },
-    { symbol: "EMES", name: "Harbor ETF Trust Harbor Emerging Markets Select ETF" },
-    { symbol: "EMF", name: "Templeton Emerging Markets Fund Common Stock" },
-    { symbol: "EMGF", name: "iShares Emerging Markets Equity Factor ETF" },
-    { symbol: "EMHC", name: "SPDR Bloomberg Emerging Markets USD Bond ETF" },
-    { symbol: "EMHY", name: "iShares J.P. Morgan EM High Yield Bond ETF" },
-    { symbol: "EMLC", name: "VanEck J. P. Morgan EM Local Currency Bond ET" },
-    { symbol: "EMLP", name: "First Trust North American Energy Infrastructure Fund" },
-    { symbol: "EMM", name: "Global X Funds Global X Emerging Markets ex-China ETF" },
-    { symbol: "EMMF", name: "WisdomTree Emerging Markets Multifactor Fund" },
-    { symbol: "EMN", name: "Eastman Chemical Company Common Stock" },
-    { symbol: "EMNT", name: "PIMCO Enhanced Short Maturity Active ESG Exchange-Traded Fund" },
-    { symbol: "EMO", name: "ClearBridge Energy Midstream Opportunity Fund Inc. Common Stock" },
-    { symbol: "EMOP", name: "AB Active ETFs, Inc. AB Emerging Markets Opportunities ETF" },
-    { symbol: "EMOT", name: "First Trust Exchange-Traded Fund VI First Trust S&P 500 Economic Moat ETF" },
-    { symbol: "EMP", name: "Entergy Mississippi, LLC First Mortgage Bonds, 4.90% Series Due October 1, 2066" },
-    { symbol: "EMPB", name: "EA Series Trust Efficient Market Portfolio Plus ETF" },
-    { symbol: "EMQQ", name: "EMQQ The Emerging Markets Internet ETF" },
-    { symbol: "EMR", name: "Emerson Electric Company Common Stock" },
-    { symbol: "EMSF", name: "Matthews International Funds Matthews Emerging Markets Sustainable Future Active ETF" },
-    { symbol: "EMTL", name: "SPDR DoubleLine Emerging Markets Fixed Income ETF" },
-    { symbol: "EMTY", name: "ProShares Decline of the Retail Store ETF" },
-    { symbol: "EMX", name: "EMX Royalty Corporation Common Shares (Canada)" },
-    { symbol: "ENB", name: "Enbridge Inc Common Stock" },
-    { symbol: "ENFR", name: "Alerian Energy Infrastructure ETF" },
-    { symbol: "ENFY", name: "Enlightify Inc. Common Stock" },
-    { symbol: "ENIC", name: "Enel Chile S.A. American Depositary Shares (Each representing 50 shares of Common Stock)" },
-    { symbol: "ENJ", name: "Entergy New Orleans, LLC First Mortgage Bonds, 5.0% Series due December 1, 2052" },
-    { symbol: "ENO", name: "Entergy New Orleans, LLC First Mortgage Bonds, 5.50% Series due April 1, 2066" },
-    { symbol: "ENOR", name: "iShares Inc iShares MSCI Norway ETF" },
-    { symbol: "ENOV", name: "Enovis Corporation Common Stock" },
-    { symbol: "ENR", name: "Energizer Holdings, Inc. Common Stock" },
-    { symbol: "ENS", name: "EnerSys Common Stock" },
-    { symbol: "ENVA", name: "Enova International, Inc. Common Stock" },
-    { symbol: "ENX", name: "Eaton Vance New York Municipal Bond Fund Common Shares of Beneficial Interest, $.01 par value" },
-    { symbol: "EOCT", name: "Innovator Emerging Markets Power Buffer ETF - October" },
-    { symbol: "EOD", name: "Allspring Global Dividend Opportunity Fund Common Shares of Beneficial Interest" },
-    { symbol: "EOG", name: "EOG Resources, Inc. Common Stock" },
-    { symbol: "EOI", name: "Eaton Vance Enhance Equity Income Fund Eaton Vance Enhanced Equity Income Fund Shares of Beneficial Interest" },
-    { symbol: "EONR", name: "EON Resources Inc. Class A Common Stock" },
-    { symbol: "EONR.W", name: "EON Resources Inc. Warrants, each whole warrant exercisable for three quarters of one share of Class A Common Stock at an exercise price of $11.50 per whole share" },
-    { symbol: "EOS", name: "Eaton Vance Enhance Equity Income Fund II Common Stock" },
-    { symbol: "EOT", name: "Eaton Vance Municipal Income Trust EATON VANCE NATIONAL MUNICIPAL OPPORTUNITIES TRUST" },
-    { symbol: "EP", name: "Empire Petroleum Corporation Common Stock" },
-    { symbol: "EP$C", name: "El Paso Corporation Preferred Stock" },
-    { symbol: "EPAC", name: "Enerpac Tool Group Corp. Common Stock" },
-    { symbol: "EPAM", name: "EPAM Systems, Inc. Common Stock" },
-    { symbol: "EPC", name: "Edgewell Personal Care Company Common Stock" },
-    { symbol: "EPD", name: "Enterprise Products Partners L.P. Common Stock" },
-    { symbol: "EPEM", name: "Harbor ETF Trust Harbor Emerging Markets Equity ETF" },
-    { symbol: "EPHE", name: "iShares MSCI Philippines ETF" },
-    { symbol: "EPI", name: "WisdomTree India Earnings Fund" },
-    { symbol: "EPIN", name: "Harbor ETF Trust Harbor International Equity ETF" },
-    { symbol: "EPM", name: "Evolution Petroleum Corporation, Inc. Common Stock" },
-    { symbol: "EPMB", name: "Harbor ETF Trust Harbor Mid Cap Core ETF" },
-    { symbol: "EPMV", name: "Harbor ETF Trust Harbor Mid Cap Value ETF" },
-    { symbol: "EPOL", name: "iShares Trust iShares MSCI Poland ETF" },
-    { symbol: "EPP", name: "iShares MSCI Pacific Ex-Japan Index Fund" },
-    { symbol: "EPR", name: "EPR Properties Common Stock" },
-    { symbol: "EPR$C", name: "EPR Properties 5.75% Series C Cumulative Convertible Preferred Shares" },
-    { symbol: "EPR$E", name: "EPR Properties Series E Cumulative Conv Pfd Shs Ser E" },
-    { symbol: "EPR$G", name: "EPR Properties 5.750% Series G Cumulative Redeemable Preferred Shares" },
-    { symbol: "EPRF", name: "Innovator S&P Investment Grade Preferred ETF" },
-    { symbol: "EPRT", name: "Essential Properties Realty Trust, Inc. Common Stock" },
-    { symbol: "EPS", name: "WisdomTree U.S. LargeCap Fund" },
-    { symbol: "EPSB", name: "Harbor ETF Trust Harbor SMID Cap Core ETF" },
-    { symbol: "EPSV", name: "Harbor ETF Trust Harbor SMID Cap Value ETF" },
-    { symbol: "EPU", name: "iShares MSCI Peru and Global Exposure ETF" },
-    { symbol: "EPV", name: "ProShares UltraShort FTSE Europe ETF" },
-    { symbol: "EQAL", name: "Invesco Russell 1000 Equal Weight ETF" },
-    { symbol: "EQBK", name: "Equity Bancshares, Inc. Class A Common Stock" },
-    { symbol: "EQH", name: "Equitable Holdings, Inc. Common Stock" },
-    { symbol: "EQH$A", name: "Equitable Holdings, Inc. Depositary Shares" },
-    { symbol: "EQH$C", name: "Equitable Holdings, Inc. Depositary Shares, each representing a 1/1,000th interest in a share of Fixed Rate Noncumulative Perpetual Preferred Stock, Series C" },
-    { symbol: "EQIN", name: "Columbia U.S. Equity Income ETF" },
-    { symbol: "EQL", name: "ALPS Equal Sector Weight ETF" },
-    { symbol: "EQLT", name: "iShares Trust iShares MSCI Emerging Markets Quality Factor ETF" },
-    { symbol: "EQNR", name: "Equinor ASA" },
-    { symbol: "EQR", name: "Equity Residential Common Shares of Beneficial Interest" },
-    { symbol: "EQS", name: "Equus Total Return, Inc. Common Stock" },
-    { symbol: "EQT", name: "EQT Corporation Common Stock" },
-    { symbol: "EQTY", name: "Valued Advisers Trust Kovitz Core Equity ETF" },
-    { symbol: "EQV", name: "EQV Ventures Acquisition Corp. Class A Ordinary Shares" },
-    { symbol: "EQV.U", name: "EQV Ventures Acquisition Corp. Units, each consisting of one Class A ordinary share and one-third of one redeemable warrant" },
-    { symbol: "EQV.W", name: "EQV Ventures Acquisition Corp. Redeemable warrants, each whole warrant exercisable for one Class A ordinary share at an exercise price of $11.50 per share" },
-    { symbol: "EQWL", name: "Invesco S&P 100 Equal Weight ETF" },
-    { symbol: "EQX", name: "Equinox Gold Corp. Common Shares" },
-    { symbol: "ERC", name: "Allspring Multi-Sector Income Fund Common Stock" },
-    { symbol: "ERH", name: "Allspring Utilities and High Income Fund Common Shares" },
-    { symbol: "ERJ", name: "Embraer S.A. Common Stock" },
-    { symbol: "ERO", name: "Ero Copper Corp. Common Shares" },
-    { symbol: "ERTH", name: "Invesco MSCI Sustainable Future ETF" },
-    { symbol: "ERX", name: "Direxion Energy Bull 2X Shares" },
-    { symbol: "ERY", name: "Direxion Daily Energy Bear 2X Shares" },
-    { symbol: "ES", name: "Eversource Energy (D/B/A) Common Stock" },
-    { symbol: "ESAB", name: "ESAB Corporation Common Stock" },
-    { symbol: "ESBA", name: "Empire State Realty OP, L.P. Series ES Operating Partnership Units Representing Limited Partnership Interests" },
-    { symbol: "ESE", name: "ESCO Technologies Inc. Common Stock" },
-    { symbol: "ESG", name: "FlexShares STOXX US ESG Select Index Fund" },
-    { symbol: "ESGG", name: "FlexShares STOXX Global ESG Select Index Fund" },
-    { symbol: "ESGV", name: "Vanguard ESG U.S. Stock ETF" },
-    { symbol: "ESI", name: "Element Solutions Inc. Common Stock" },
-    { symbol: "ESIX", name: "SSGA Active Trust SPDR S&P SmallCap 600 ESG ETF" },
-    { symbol: "ESML", name: "iShares ESG Aware MSCI USA Small-Cap ETF" },
-    { symbol: "ESNT", name: "Essent Group Ltd. Common Shares" },
-    { symbol: "ESP", name: "Espey Mfg. & Electronics Corp. Common Stock" },
-    { symbol: "ESRT", name: "Empire State Realty Trust, Inc. Class A Common Stock" },
-    { symbol: "ESS", name: "Essex Property Trust, Inc. Common Stock" },
-    { symbol: "ESTC", name: "Elastic N.V. Ordinary Shares" },
-    { symbol: "ESUM", name: "Strategy Shares Eventide US Market ETF" },
-    { symbol: "ET", name: "Energy Transfer LP Common Units " },
-    { symbol: "ET$I", name: "Energy Transfer L.P. Series I Fixed Rate Perpetual Preferred Units" },
-    { symbol: "ETB", name: "Eaton Vance Tax-Managed Buy-Write Income Fund Eaton Vance Tax-Managed Buy-Write Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "ETCO", name: "Grayscale Funds Trust Grayscale Ethereum Covered Call ETF" },
-    { symbol: "ETD", name: "Ethan Allen Interiors Inc. Common Stock" },
-    { symbol: "ETG", name: "Eaton Vance Tax-Advantaged Global Dividend Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "ETH", name: "Grayscale Ethereum Mini Trust (ETH) Common units of fractional undivided beneficial interest" },
-    { symbol: "ETHD", name: "ProShares Trust ProShares UltraShort Ether ETF" },
-    { symbol: "ETHE", name: "Grayscale Ethereum Trust (ETH) Common units of fractional undivided beneficial interest" },
-    { symbol: "ETHO", name: "Amplify ETF Trust Amplify Etho Climate Leadership U.S. ETF" },
-    { symbol: "ETHT", name: "ProShares Trust ProShares Ultra Ether ETF" },
-    { symbol: "ETHU", name: "Volatility Shares Trust 2x Ether ETF" },
-    { symbol: "ETHV", name: "VanEck Ethereum ETF VanEck Ethereum ETF" },
-    { symbol: "ETHW", name: "Bitwise Ethereum ETF Common shares of beneficial interest" },
-    { symbol: "ETI$", name: "Entergy Texas Inc 5.375% Series A Preferred Stock, Cumulative, No Par Value" },
-    { symbol: "ETJ", name: "Eaton Vance Risk-Managed Diversified Equity Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "ETN", name: "Eaton Corporation, PLC Ordinary Shares" },
-    { symbol: "ETO", name: "Eaton Vance Tax-Advantage Global Dividend Opp Common Stock" },
-    { symbol: "ETQ", name: "T-Rex 2X Inverse Ether Daily Target ETF" },
-    { symbol: "ETR", name: "Entergy Corporation Common Stock" },
-    { symbol: "ETU", name: "T-Rex 2X Long Ether Daily Target ETF" },
-    { symbol: "ETV", name: "Eaton Vance Corporation Eaton Vance Tax-Managed Buy-Write Opportunities Fund Common Shares of Beneficial Interest" },
-    { symbol: "ETW", name: "Eaton Vance Corporation Eaton Vance Tax-Managed Global Buy-Write Opportunites Fund Common Shares of Beneficial Interest" },
-    { symbol: "ETX", name: "Eaton Vance Municipal Income 2028 Term Trust Common Shares of Beneficial Interest" },
-    { symbol: "ETY", name: "Eaton Vance Tax-Managed Diversified Equity Income Fund Common Shares of Beneficial Interest," },
-    { symbol: "EUAD", name: "Spinnaker ETF Series Select STOXX Europe Aerospace & Defense ETF" },
-    { symbol: "EUDG", name: "WisdomTree Europe Quality Dividend Growth Fund" },
-    { symbol: "EUDV", name: "ProShares MSCI Europe Dividend Growers ETF" },
-    { symbol: "EUM", name: "ProShares Short MSCI Emerging Markets" },
-    { symbol: "EUO", name: "ProShares UltraShort Euro" },
-    { symbol: "EURL", name: "Direxion Daily FTSE Europe Bull 3x Shares" },
-    { symbol: "EUSA", name: "iShares MSCI USA Equal Weighted ETF" },
-    { symbol: "EUSB", name: "iShares ESG Advanced Total USD Bond Market ETF" },
-    { symbol: "EVAC", name: "EQV Ventures Acquisition Corp. II Class A Ordinary Shares" },
-    { symbol: "EVAC.U", name: "EQV Ventures Acquisition Corp. II Units, each unit consists of one Class A ordinary share and one-third of one redeemable warrant" },
-    { symbol: "EVAC.W", name: "EQV Ventures Acquisition Corp. II Redeemable Warrants, each whole warrant exercisable for one Class A ordinary share at an exercise price of $11.50 per share" },
-    { symbol: "EVAV", name: "Direxion Shares ETF Trust Direxion Daily Electric and Autonomous Vehicles Bull 2X Shares" },
-    { symbol: "EVC", name: "Entravision Communications Corporation Common Stock" },
-    { symbol: "EVEX", name: "Eve Holding, Inc. Common Stock" },
-    { symbol: "EVEX.W", name: "Eve Holding, Inc. Warrants, each exercisable for one share of Common Stock at an exercise price of $11.50 per share" },
-    { symbol: "EVF", name: "Eaton Vance Senior Income Trust Common Stock" },
-    { symbol: "EVG", name: "Eaton Vance Short Diversified Income Fund Eaton Vance Short Duration Diversified Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "EVH", name: "Evolent Health, Inc Class A Common Stock" },
-    { symbol: "EVHY", name: "Morgan Stanley ETF Trust Eaton Vance High Yield ETF" },
-    { symbol: "EVI", name: "EVI Industries, Inc.  Common Stock" },
-    { symbol: "EVIM", name: "Morgan Stanley ETF Trust Eaton Vance Intermediate Municipal Income ETF" },
-    { symbol: "EVLN", name: "Morgan Stanley ETF Trust Eaton Vance Floating-Rate ETF" },
-    { symbol: "EVLU", name: "iShares Trust iShares MSCI Emerging Markets Value Factor ETF" },
-    { symbol: "EVM", name: "Eaton Vance California Municipal Bond Fund Common Shares of Beneficial Interest, $.01 par value" },
-    { symbol: "EVMO", name: "Morgan Stanley ETF Trust Eaton Vance Mortgage Opportunities ETF" },
-    { symbol: "EVN", name: "Eaton Vance Municipal Income Trust Common Stock" },
-    { symbol: "EVNT", name: "AltShares Event-Driven ETF" },
-    { symbol: "EVR", name: "Evercore Inc. Class A Common Stock" },
-    { symbol: "EVSB", name: "Morgan Stanley ETF Trust Eaton Vance Ultra-Short Income ETF" },
-    { symbol: "EVSM", name: "Morgan Stanley ETF Trust Eaton Vance Short Duration Municipal Income ETF" },
-    { symbol: "EVT", name: "Eaton Vance Tax Advantaged Dividend Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "EVTC", name: "Evertec, Inc. Common Stock" },
-    { symbol: "EVTL", name: "Vertical Aerospace Ltd. Ordinary Shares" },
-    { symbol: "EVTR", name: "Morgan Stanley ETF Trust Eaton Vance Total Return Bond ETF" },
-    { symbol: "EVUS", name: "iShares Trust iShares ESG Aware MSCI USA Value ETF" },
-    { symbol: "EVV", name: "Eaton Vance Limited Duration Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "EVX", name: "VanEck Environmental Services ETF" },
-    { symbol: "EW", name: "Edwards Lifesciences Corporation Common Stock" },
-    { symbol: "EWA", name: "iShares MSCI Australia Index Fund" },
-    { symbol: "EWC", name: "iShares MSCI Canada Index Fund" },
-    { symbol: "EWD", name: "iShares Inc iShares MSCI Sweden ETF" },
-    { symbol: "EWG", name: "iShares MSCI Germany Index Fund" },
-    { symbol: "EWH", name: "iShares MSCI Hong Kong Index Fund" },
-    { symbol: "EWI", name: "iShares Inc iShares MSCI Italy ETF" },
-    { symbol: "EWJ", name: "iShares MSCI Japan Index Fund" },
-    { symbol: "EWK", name: "iShares Inc iShares MSCI Belgium ETF" },
-    { symbol: "EWL", name: "iShares Inc iShares MSCI Switzerland ETF" },
-    { symbol: "EWM", name: "iShares MSCI Malaysia Index Fund" },
-    { symbol: "EWN", name: "iShares MSCI Netherlands Index Fund" },
-    { symbol: "EWO", name: "iShares Inc iShares MSCI Austria ETF" },
-    { symbol: "EWP", name: "iShares Inc iShares MSCI Spain ETF" },
-    { symbol: "EWQ", name: "iShares MSCI France Index Fund" },
-    { symbol: "EWS", name: "iShares Inc iShares MSCI Singapore ETF" },
-    { symbol: "EWT", name: "iShares Inc iShares MSCI Taiwan ETF" },
-    { symbol: "EWU", name: "iShares MSCI United Kingdom ETF" },
-    { symbol: "EWUS", name: "iShares MSCI United Kingdom Small Cap ETF" },
-    { symbol: "EWV", name: "ProShares UltraShort MSCI Japan" },
-    { symbol: "EWW", name: "iShares Inc iShares MSCI Mexico ETF" },
-    { symbol: "EWX", name: "SPDR S&P Emerging Markets Small Cap ETF" },
-    { symbol: "EWY", name: "iShares Inc iShares MSCI South Korea ETF" },
-    { symbol: "EWZ", name: "iShares Inc iShares MSCI Brazil ETF" },
-    { symbol: "EXG", name: "Eaton Vance Tax-Managed Global Diversified Equity Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "EXI", name: "iShares Global Industrials ETF" },
-    { symbol: "EXK", name: "Endeavour Silver Corporation Ordinary Shares (Canada)" },
-    { symbol: "EXOD", name: "Exodus Movement, Inc. Class A Common Stock" },
-    { symbol: "EXP", name: "Eagle Materials Inc Common Stock" },
-    { symbol: "EXPD", name: "Expeditors International of Washington, Inc. Common Stock" },
-    { symbol: "EXR", name: "Extra Space Storage Inc Common Stock" },
-    { symbol: "EYLD", name: "Cambria ETF Trust Cambria Emerging Shareholder Yield ETF" },
-    { symbol: "EZA", name: "iShares MSCI South Africa Index Fund" },
-    { symbol: "EZBC", name: "Franklin Templeton Digital Holdings Trust Shares of Franklin Bitcoin ETF" },
-    { symbol: "EZET", name: "Franklin Ethereum ETF Franklin Ethereum ETF" },
-    { symbol: "EZJ", name: "ProShares Ultra MSCI Japan" },
-    { symbol: "EZM", name: "WisdomTree U.S. MidCap Fund" },
-    { symbol: "EZPZ", name: "Franklin Crypto Index ETF Franklin Crypto Index ETF" },
-    { symbol: "EZU", name: "iShares MSCI Eurozone ETF" },
-    { symbol: "F", name: "Ford Motor Company Common Stock" },
-    { symbol: "F$B", name: "Ford Motor Company 6.20% Notes due June 1, 2059" },
-    { symbol: "F$C", name: "Ford Motor Company 6% Notes due December 1, 2059" },
-    { symbol: "F$D", name: "Ford Motor Company 6.500% Notes due August 15, 2062" },
-    { symbol: "FAF", name: "First American Corporation (New) Common Stock" },
-    { symbol: "FAI", name: "First Trust Exchange-Traded Fund II First Trust Bloomberg Artificial Intelligence ETF" },
-    { symbol: "FAN", name: "First Trust Global Wind Energy ETF" },
-    { symbol: "FAPR", name: "FT Vest U.S. Equity Buffer ETF - April" },
-    { symbol: "FARX", name: "The Advisors' Inner Circle Fund II Frontier Asset Absolute Return ETF" },
-    { symbol: "FAS", name: "Direxion Financial Bull 3X Shares" },
-    { symbol: "FAUG", name: "FT Vest U.S. Equity Buffer ETF - August" },
-    { symbol: "FAX", name: "abrdn Asia-Pacific Income Fund, Inc. Common Stock" },
-    { symbol: "FAZ", name: "Direxion Financial Bear 3X Shares" },
-    { symbol: "FB", name: "ProShares Trust ProShares S&P 500 Dynamic Buffer ETF" },
-    { symbol: "FBCG", name: "Fidelity Blue Chip Growth ETF" },
-    { symbol: "FBCV", name: "Fidelity Blue Chip Value ETF" },
-    { symbol: "FBDC", name: "First Trust Exchange-Traded Fund VIII FT Confluence BDC & Specialty Finance Income ETF" },
-    { symbol: "FBIN", name: "Fortune Brands Innovations, Inc. Common Stock" },
-    { symbol: "FBK", name: "FB Financial Corporation Common Stock" },
-    { symbol: "FBND", name: "Fidelity Total Bond ETF" },
-    { symbol: "FBP", name: "First BanCorp. New Common Stock" },
-    { symbol: "FBRT", name: "Franklin BSP Realty Trust, Inc. Common Stock" },
-    { symbol: "FBRT$E", name: "Franklin BSP Realty Trust, Inc. 7.50% Series E Cumulative Redeemable Preferred Stock" },
-    { symbol: "FBT", name: "First Trust Amex Biotech Index Fund" },
-    { symbol: "FBTC", name: "Fidelity Wise Origin Bitcoin Fund Common Shares of Beneficial Interest" },
-    { symbol: "FBUF", name: "Fidelity Dynamic Buffered Equity ETF" },
-    { symbol: "FBY", name: "Tidal ETF Trust II YieldMax META Option Income Strategy ETF" },
-    { symbol: "FC", name: "Franklin Covey Company Common Stock" },
-    { symbol: "FCBD", name: "The Advisors' Inner Circle Fund II Frontier Asset Core Bond ETF" },
-    { symbol: "FCF", name: "First Commonwealth Financial Corporation Common Stock" },
-    { symbol: "FCFY", name: "First Trust Exchange-Traded Fund First Trust S&P 500 Diversified Free Cash Flow ETF" },
-    { symbol: "FCG", name: "First Trust Natural Gas ETF" },
-    { symbol: "FCLD", name: "Fidelity Cloud Computing ETF" },
-    { symbol: "FCN", name: "FTI Consulting, Inc. Common Stock" },
-    { symbol: "FCO", name: "abrdn Global Income Fund, Inc. Common Stock" },
-    { symbol: "FCOM", name: "Fidelity MSCI Communication Services Index ETF" },
-    { symbol: "FCOR", name: "Fidelity Corporate Bond ETF" },
-    { symbol: "FCPI", name: "Fidelity Stocks for Inflation ETF " },
-    { symbol: "FCPT", name: "Four Corners Property Trust, Inc. Common Stock" },
-    { symbol: "FCRX", name: "Crescent Capital BDC, Inc. 5.00% Notes due 2026" },
-    { symbol: "FCSH", name: "Federated Hermes ETF Trust Federated Hermes Short Duration Corporate ETF" },
-    { symbol: "FCT", name: "First Trust Senior Floating Rate Income Fund II Common Shares of Beneficial Interest" },
-    { symbol: "FCTR", name: "First Trust Lunt U.S. Factor Rotation ETF" },
-    { symbol: "FCUS", name: "Tidal ETF Trust II Pinnacle Focused Opportunities ETF" },
-    { symbol: "FCX", name: "Freeport-McMoRan, Inc. Common Stock" },
-    { symbol: "FDAT", name: "Tactical Advantage ETF" },
-    { symbol: "FDD", name: "First Trust STOXX European Select Dividend Index Fund" },
-    { symbol: "FDEC", name: "FT Vest U.S. Equity Buffer ETF - December" },
-    { symbol: "FDEM", name: "Fidelity Emerging Markets Multifactor ETF" },
-    { symbol: "FDEV", name: "Fidelity Emerging Markets Multifactor ETF" },
-    { symbol: "FDG", name: "American Century Focused Dynamic Growth ETF" },
-    { symbol: "FDHT", name: "Fidelity Digital Health ETF" },
-    { symbol: "FDHY", name: "Fidelity Enhanced High Yield ETF" },
-    { symbol: "FDIS", name: "Fidelity MSCI Consumer Discretionary Index ETF" },
-    { symbol: "FDL", name: "First Trust Morningstar ETF" },
-    { symbol: "FDLO", name: "Fidelity Low Volatility Factor ETF" },
-    { symbol: "FDLS", name: "Northern Lights Fund Trust IV Inspire Fidelis Multi Factor ETF" },
-    { symbol: "FDM", name: "First Trust DJ Select MicroCap ETF" },
-    { symbol: "FDMO", name: "Fidelity Momentum Factor ETF" },
-    { symbol: "FDN", name: "First Trust DJ Internet Index Fund" },
-    { symbol: "FDND", name: "First Trust Exchange-Traded Fund IV FT Vest Dow Jones Internet & Target Income ETF" },
-    { symbol: "FDP", name: "Fresh Del Monte Produce, Inc. Common Stock" },
-    { symbol: "FDRR", name: "Fidelity Dividend ETF for Rising Rates" },
-    { symbol: "FDRV", name: "Fidelity Electric Vehicles and Future Transportation ETF" },
-    { symbol: "FDS", name: "FactSet Research Systems Inc. Common Stock" },
-    { symbol: "FDV", name: "Federated Hermes ETF Trust Federated Hermes U.S. Strategic Dividend ETF" },
-    { symbol: "FDVV", name: "Fidelity High Dividend ETF" },
-    { symbol: "FDWM", name: "Fidelity Women's Leadership ETF" },
-    { symbol: "FDX", name: "FedEx Corporation Common Stock" },
-    { symbol: "FE", name: "FirstEnergy Corp. Common Stock" },
-    { symbol: "FEAC", name: "Fidelity Covington Trust Fidelity Enhanced U.S. All-Cap Equity ETF" },
-    { symbol: "FEBM", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Max Buffer ETF - February" },
-    { symbol: "FEBP", name: "PGIM S&P 500 Buffer 12 ETF - February" },
-    { symbol: "FEBT", name: "AIM ETF Products Trust AllianzIM U.S. Large Cap Buffer10 Feb ETF" },
-    { symbol: "FEBU", name: "AIM ETF Products Trust AllianzIM U.S. Equity Buffer15 Uncapped Feb ETF" },
-    { symbol: "FEBW", name: "AIM ETF Products Trust AllianzIM U.S. Large Cap Buffer20 Feb ETF" },
-    { symbol: "FEBZ", name: "TrueShares Structured Outcome (February) ETF" },
-    { symbol: "FEDM", name: "FlexShares ESG & Climate Developed Markets ex-US Core Index Fund" },
-    { symbol: "FEDU", name: "Four Seasons Education (Cayman) Inc. American Depositary Shares, each ADS representing 10 ordinary shares" },
-    { symbol: "FEGE", name: "The RBB Fund Trust First Eagle Global Equity ETF" },
-    { symbol: "FEIG", name: "FlexShares ESG & Climate Investment Grade Corporate Core Index Fund" },
-    { symbol: "FELC", name: "Fidelity Covington Trust Fidelity Enhanced Large Cap Core ETF" },
-    { symbol: "FELG", name: "Fidelity Covington Trust Fidelity Enhanced Large Cap Growth ETF" },
-    { symbol: "FELV", name: "Fidelity Covington Trust Fidelity Enhanced Large Cap Value ETF" },
-    { symbol: "FEMR", name: "Fidelity Covington Trust Fidelity Enhanced Emerging Markets ETF" },
-    { symbol: "FENG", name: "Phoenix New Media Limited American Depositary Shares, each representing 48 Class A ordinary shares." },
-    { symbol: "FENI", name: "Fidelity Covington Trust Fidelity Enhanced International ETF" },
-    { symbol: "FENY", name: "Fidelity MSCI Energy Index ETF" },
-    { symbol: "FEOE", name: "The RBB Fund Trust First Eagle Overseas Equity ETF" },
-    { symbol: "FERG", name: "Ferguson Enterprises Inc. Common Stock" },
-    { symbol: "FESM", name: "Fidelity Covington Trust Fidelity Enhanced Small Cap ETF" },
-    { symbol: "FET", name: "Forum Energy Technologies, Inc. Common Stock" },
-    { symbol: "FETH", name: "Fidelity Ethereum Fund Fidelity Ethereum Fund" },
-    { symbol: "FEUS", name: "FlexShares ESG & Climate US Large Cap Core Index Fund" },
-    { symbol: "FEZ", name: "SPDR DJ Euro STOXX 50 Etf" },
-    { symbol: "FF", name: "FutureFuel Corp.  Common shares" },
-    { symbol: "FFA", name: "First Trust Enhanced Equity Income Fund" },
-    { symbol: "FFC", name: "Flaherty & Crumrine Preferred and Income Securities Fund Incorporated" },
-    { symbol: "FFDI", name: "Fidelity Covington Trust Fidelity Fundamental Developed International ETF" },
-    { symbol: "FFEB", name: "FT Vest U.S. Equity Buffer ETF - February" },
-    { symbol: "FFEM", name: "Fidelity Covington Trust Fidelity Fundamental Emerging Markets ETF" },
-    { symbol: "FFGX", name: "Fidelity Covington Trust Fidelity Fundamental Global ex-U.S. ETF" },
-    { symbol: "FFIU", name: "UVA Unconstrained Medium-Term Fixed Income ETF" },
-    { symbol: "FFLC", name: "Fidelity Fundamental Large Cap Core ETF" },
-    { symbol: "FFLG", name: "Fidelity Fundamental Large Cap Growth ETF" },
-    { symbol: "FFLS", name: "Northern Lights Fund Trust II The Future Fund Long/Short ETF" },
-    { symbol: "FFLV", name: "Fidelity Covington Trust Fidelity Fundamental Large Cap Value ETF" },
-    { symbol: "FFND", name: "One Global ETF" },
-    { symbol: "FFOG", name: "Franklin Templeton ETF Trust Franklin Focused Growth ETF" },
-    { symbol: "FFOX", name: "FundX Investment Trust FundX Future Fund Opportunities ETF" },
-    { symbol: "FFSM", name: "Fidelity Fundamental Small-Mid Cap ETF" },
-    { symbol: "FFTY", name: "Innovator IBD 50 ETF" },
-    { symbol: "FFWM", name: "First Foundation Inc. Common Stock" },
-    { symbol: "FG", name: "F&G Annuities & Life, Inc. Common Stock" },
-    { symbol: "FGD", name: "First Trust DJ Global Select Dividend" },
-    { symbol: "FGDL", name: "Franklin Templeton Holdings Trust Franklin Responsibly Sourced Gold ETF" },
-    { symbol: "FGN", name: "F&G Annuities & Life, Inc. 7.950% Senior Notes due 2053" },
-    { symbol: "FGSM", name: "The Advisors' Inner Circle Fund II Frontier Asset Global Small Cap Equity ETF" },
-    { symbol: "FGSN", name: "F&G Annuities & Life, Inc. 7.300% Junior Subordinated Notes due 2065" },
-    { symbol: "FHDG", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Quarterly Dynamic Buffer ETF" },
-    { symbol: "FHEQ", name: "Fidelity Hedged Equity ETF" },
-    { symbol: "FHI", name: "Federated Hermes, Inc. Common Stock" },
-    { symbol: "FHLC", name: "Fidelity MSCI Health Care Index ETF" },
-    { symbol: "FHN", name: "First Horizon Corporation Common Stock" },
-    { symbol: "FHN$C", name: "First Horizon Corporation Depositary Shares, each representing a 1/400th interest in a share of Non-Cumulative Perpetual Preferred Stock, Series C" },
-    { symbol: "FHN$E", name: "First Horizon Corporation Depositary Shares, each representing a 1/4,000th interest in a share of Non-Cumulative Perpetual Preferred Stock, Series E" },
-    { symbol: "FHN$F", name: "First Horizon Corporation Depositary Shares, each representing 1/4000th Interest in a Share of Non-Cumulative Perpetual Preferred Stock, Series F" },
-    { symbol: "FHYS", name: "Federated Hermes ETF Trust Federated Hermes Short Duration High Yield ETF" },
-    { symbol: "FI", name: "Fiserv, Inc. Common Stock" },
-    { symbol: "FIAT", name: "Tidal Trust II YieldMax Short COIN Option Income Strategy ETF" },
-    { symbol: "FIAX", name: "Tidal ETF Trust II Nicholas Fixed Income Alternative ETF" },
-    { symbol: "FICO", name: "Fair Isaac Corporation Common Stock" },
-    { symbol: "FIDI", name: "Fidelity International High Dividend ETF" },
-    { symbol: "FIDU", name: "Fidelity MSCI Industrials Index ETF" },
-    { symbol: "FIG", name: "Figma, Inc. Class A Common Stock" },
-    { symbol: "FIGB", name: "Fidelity Investment Grade Bond ETF" },
-    { symbol: "FIGS", name: "FIGS, Inc. Class A Common Stock" },
-    { symbol: "FIHL", name: "Fidelis Insurance Holdings Limited Common Shares" },
-    { symbol: "FIIG", name: "First Trust Exchange-Traded Fund IV First Trust Intermediate Duration Investment Grade Corporate ETF" },
-    { symbol: "FILL", name: "iShares MSCI Global Energy Producers Fund" },
-    { symbol: "FINS", name: "Angel Oak Financial Strategies Income Term Trust Common Shares of Beneficial Interest" },
-    { symbol: "FINT", name: "The Advisors' Inner Circle Fund II Frontier Asset Total International Equity ETF" },
-    { symbol: "FINV", name: "FinVolution Group American Depositary Shares" },
-    { symbol: "FIRI", name: "FIRE Funds Income Target ETF" },
-    { symbol: "FIRS", name: "FIRE Funds Wealth Builder ETF" },
-    { symbol: "FIS", name: "Fidelity National Information Services, Inc. Common Stock" },
-    { symbol: "FISK", name: "Empire State Realty OP, L.P. Series 250 Operating Partnership Units Representing Limited Partnership Interests" },
-    { symbol: "FISR", name: "SPDR SSGA Fixed Income Sector Rotation ETF" },
-    { symbol: "FITE", name: "SPDR S&P Kensho Future Security ETF " },
-    { symbol: "FIVA", name: "Fidelity International Value Factor ETF" },
-    { symbol: "FIW", name: "First Trust Water ETF" },
-    { symbol: "FIX", name: "Comfort Systems USA, Inc. Common Stock" },
-    { symbol: "FIXP", name: "FolioBeyond Enhanced Fixed Income Premium ETF" },
-    { symbol: "FIXT", name: "TCW ETF Trust TCW Core Plus Bond ETF" },
-    { symbol: "FJAN", name: "FT Vest U.S. Equity Buffer ETF - January" },
-    { symbol: "FJUL", name: "FT Vest U.S. Equity Buffer ETF - July" },
-    { symbol: "FJUN", name: "FT Vest U.S. Equity Buffer ETF - June" },
-    { symbol: "FLAG", name: "Global X Funds Global X S&P 500 U.S. Market Leaders Top 50 ETF" },
-    { symbol: "FLAO", name: "AIM ETF Products Trust AllianzIM U.S. Equity 6 Month Floor5 Apr/Oct ETF" },
-    { symbol: "FLAU", name: "Franklin FTSE Australia ETF" },
-    { symbol: "FLAX", name: "Franklin FTSE Asia ex Japan ETF" },
-    { symbol: "FLBL", name: "Franklin Senior Loan ETF" },
-    { symbol: "FLBR", name: "Franklin FTSE Brazil ETF" },
-    { symbol: "FLC", name: "Flaherty & Crumrine Total Return Fund Inc Common Stock" },
-    { symbol: "FLCA", name: "Franklin FTSE Canada ETF" },
-    { symbol: "FLCB", name: "Franklin U.S. Core Bond ETF" },
-    { symbol: "FLCC", name: "Federated Hermes ETF Trust Federated Hermes MDT Large Cap Core ETF" },
-    { symbol: "FLCE", name: "The Advisors' Inner Circle Fund II Frontier Asset U.S. Large Cap Equity ETF" },
-    { symbol: "FLCG", name: "Federated Hermes ETF Trust Federated Hermes MDT Large Cap Growth ETF" },
-    { symbol: "FLCH", name: "Franklin FTSE China ETF" },
-    { symbol: "FLCO", name: "Franklin Investment Grade Corporate ETF" },
-    { symbol: "FLCV", name: "Federated Hermes ETF Trust Federated Hermes MDT Large Cap Value ETF" },
-    { symbol: "FLDR", name: "Fidelity Low Duration Bond Factor ETF" },
-    { symbol: "FLDZ", name: "RiverNorth Patriot ETF" },
-    { symbol: "FLEE", name: "Franklin FTSE Europe ETF" },
-    { symbol: "FLEU", name: "Franklin FTSE Eurozone ETF" },
-    { symbol: "FLG", name: "Flagstar Financial, Inc. Common Stock" },
-    { symbol: "FLG$A", name: "Flagstar Financial, Inc. Depositary shares, each representing a 1/40th interest in a share of Fixed-to-Floating Rate Series A Noncumulative Perpetual Preferred Stock" },
-    { symbol: "FLG$U", name: "Flagstar Financial, Inc. Bifurcated Option Note Unit SecuritiES" },
-    { symbol: "FLGB", name: "Franklin FTSE United Kingdom ETF" },
-    { symbol: "FLGR", name: "Franklin FTSE Germany ETF" },
-    { symbol: "FLGV", name: "Franklin U.S. Treasury Bond ETF" },
-    { symbol: "FLHY", name: "Franklin High Yield Corporate ETF" },
-    { symbol: "FLIA", name: "Franklin International Aggregate Bond ETF" },
-    { symbol: "FLIN", name: "Franklin FTSE India ETF" },
-    { symbol: "FLJH", name: "Franklin FTSE Japan Hedged ETF" },
-    { symbol: "FLJJ", name: "AIM ETF Products Trust AllianzIM U.S. Equity 6 Month Floor5 Jan/Jul ETF" },
-    { symbol: "FLJP", name: "Franklin FTSE Japan ETF" },
-    { symbol: "FLKR", name: "Franklin FTSE South Korea ETF" },
-    { symbol: "FLLA", name: "Franklin FTSE Latin America ETF" },
-    { symbol: "FLMB", name: "Franklin Municipal Green Bond ETF" },
-    { symbol: "FLMI", name: "Franklin Dynamic Municipal Bond ETF" },
-    { symbol: "FLMX", name: "Franklin FTSE Mexico ETF" },
-    { symbol: "FLNG", name: "FLEX LNG Ltd. Ordinary Shares" },
-    { symbol: "FLO", name: "Flowers Foods, Inc. Common Stock" },
-    { symbol: "FLOC", name: "Flowco Holdings Inc. Class A Common Stock" },
-    { symbol: "FLOT", name: "iShares Floating Rate Bond ETF" },
-    { symbol: "FLOW", name: "Global X Funds Global X U.S. Cash Flow Kings 100 ETF" },
-    { symbol: "FLQL", name: "Franklin U.S. Large Cap Multifactor Index ETF" },
-    { symbol: "FLQM", name: "Franklin U.S. Mid Cap Multifactor Index ETF" },
-    { symbol: "FLQS", name: "Franklin U.S. Small Cap Multifactor Index ETF" },
-    { symbol: "FLR", name: "Fluor Corporation Common Stock" },
-    { symbol: "FLRG", name: "Fidelity U.S. Multifactor ETF" },
-    { symbol: "FLRN", name: "SPDR Bloomberg Investment Grade Floating Rate ETF" },
-    { symbol: "FLRT", name: "Pacer Aristotle Pacific Floating Rate High Income ETF" },
-    { symbol: "FLS", name: "Flowserve Corporation Common Stock" },
-    { symbol: "FLSA", name: "Franklin FTSE Saudi Arabia ETF" },
-    { symbol: "FLSP", name: "Franklin Systematic Style Premia ETF" },
-    { symbol: "FLSW", name: "Franklin FTSE Switzerland ETF" },
-    { symbol: "FLTB", name: "Fidelity Limited Term Bond ETF" },
-    { symbol: "FLTR", name: "VanEck ETF Trust VanEck IG Floating Rate ETF" },
-    { symbol: "FLTW", name: "Franklin FTSE Taiwan ETF" },
-    { symbol: "FLUD", name: "Franklin Ultra Short Bond ETF" },
-    { symbol: "FLUT", name: "Flutter Entertainment plc Ordinary Shares" },
-    { symbol: "FLV", name: "American Century Focused Large Cap Value ETF" },
-    { symbol: "FLXN", name: "Horizon Funds Horizon Flexible Income ETF" },
-    { symbol: "FLXR", name: "TCW Flexible Income ETF" },
-    { symbol: "FLYD", name: "Bank of Montreal MicroSectors Travel -3x Inverse Leveraged ETN" },
-    { symbol: "FLYU", name: "Bank of Montreal MicroSectors Travel 3x Leveraged ETN" },
-    { symbol: "FLYX", name: "flyExclusive, Inc. Class A Common Stock" },
-    { symbol: "FLYX.W", name: "flyExclusive, Inc. Redeemable warrants, each whole warrant exercisable for one Class A common stock at an exercise price of $11.50 per share" },
-    { symbol: "FMAG", name: "Fidelity Magellan ETF" },
-    { symbol: "FMAR", name: "FT Vest U.S. Equity Buffer ETF - March" },
-    { symbol: "FMAT", name: "Fidelity MSCI Materials Index ETF" },
-    { symbol: "FMAY", name: "FT Vest U.S. Equity Buffer ETF - May" },
-    { symbol: "FMC", name: "FMC Corporation Common Stock" },
-    { symbol: "FMCE", name: "Northern Lights Fund Trust IV FM Compounders Equity ETF" },
-    { symbol: "FMCX", name: "FM Focus Equity ETF" },
-    { symbol: "FMDE", name: "Fidelity Covington Trust Fidelity Enhanced Mid Cap ETF" },
-    { symbol: "FMF", name: "First Trust Managed Futures Strategy Fund" },
-    { symbol: "FMKT", name: "The Free Markets ETF" },
-    { symbol: "FMN", name: "Federated Hermes Premier Municipal Income Fund" },
-    { symbol: "FMNY", name: "First Trust New York Municipal High Income ETF" },
-    { symbol: "FMQQ", name: "FMQQ The Next Frontier Internet ETF" },
-    { symbol: "FMS", name: "Fresenius Medical Care AG American Depositary Shares (Each representing 1/2 of an Ordinary Share)" },
-    { symbol: "FMX", name: "Fomento Economico Mexicano S.A.B. de C.V. Common Stock" },
-    { symbol: "FMY", name: "First Trust Motgage Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "FN", name: "Fabrinet Ordinary Shares" },
-    { symbol: "FNB", name: "F.N.B. Corporation Common Stock" },
-    { symbol: "FNCL", name: "Fidelity MSCI Financials Index ETF" },
-    { symbol: "FND", name: "Floor & Decor Holdings, Inc. Common Stock" },
-    { symbol: "FNDA", name: "Schwab Fundamental U.S. Small Company ETF" },
-    { symbol: "FNDB", name: "Schwab Fundamental U.S. Broad Market ETF" },
-    { symbol: "FNDC", name: "Schwab Fundamental International Small Equity ETF" },
-    { symbol: "FNDE", name: "Schwab Fundamental Emerging Markets Equity ETF" },
-    { symbol: "FNDF", name: "Schwab Fundamental International Equity ETF" },
-    { symbol: "FNDX", name: "Schwab Fundamental U.S. Large Company ETF" },
-    { symbol: "FNF", name: "Fidelity National Financial, Inc. Common Stock" },
-    { symbol: "FNGD", name: "MicroSectors FANG  Index -3X Inverse Leveraged ETNs due January 8, 2038" },
-    { symbol: "FNGG", name: "Direxion Daily NYSE FANG+ Bull 2X Shares" },
-    { symbol: "FNGO", name: "MicroSectors FANG  Index 2X Leveraged ETNs due January 8, 2038" },
-    { symbol: "FNGS", name: "MicroSectors FANG  ETNs due January 8, 2038" },
-    { symbol: "FNGU", name: "Bank Of Montreal MicroSectors FANG+ 3X Leveraged ETNs" },
-    { symbol: "FNOV", name: "FT Vest U.S. Equity Buffer ETF - November" },
-    { symbol: "FNV", name: "Franco-Nevada Corporation" },
-    { symbol: "FOA", name: "Finance of America Companies Inc. Class A Common Stock" },
-    { symbol: "FOCT", name: "FT Vest U.S. Equity Buffer ETF - October" },
-    { symbol: "FOF", name: "Cohen & Steers Closed-End Opportunity Fund, Inc. Common Stock" },
-    { symbol: "FOPC", name: "The Advisors' Inner Circle Fund II Frontier Asset Opportunistic Credit ETF" },
-    { symbol: "FOR", name: "Forestar Group Inc Common Stock " },
-    { symbol: "FORH", name: "Formidable ETF" },
-    { symbol: "FOUR", name: "Shift4 Payments, Inc. Class A Common Stock" },
-    { symbol: "FOUR$A", name: "Shift4 Payments, Inc. 6.00% Series A Mandatory Convertible Preferred Stock" },
-    { symbol: "FOWF", name: "Pacer Funds Trust Pacer Solactive Whitney Future of Warfare ETF" },
-    { symbol: "FOXY", name: "Simplify Exchange Traded Funds Simplify Currency Strategy ETF" },
-    { symbol: "FPAG", name: "Investment Managers Series Trust III FPA Global Equity ETF" },
-    { symbol: "FPAS", name: "Investment Managers Series Trust III FPA Short Duration Government ETF" },
-    { symbol: "FPE", name: "First Trust Preferred Securities and Income ETF ETF" },
-    { symbol: "FPEI", name: "First Trust Institutional Preferred Securities and Income ETF" },
-    { symbol: "FPF", name: "First Trust Intermediate Duration Preferred & Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "FPFD", name: "Fidelity Preferred Securities & Income ETF" },
-    { symbol: "FPH", name: "Five Point Holdings, LLC Class A Common Shares" },
-    { symbol: "FPI", name: "Farmland Partners Inc. Common Stock" },
-    { symbol: "FPRO", name: "Fidelity Real Estate Investment ETF" },
-    { symbol: "FPWR", name: "First Trust EIP Power Solutions ETF" },
-    { symbol: "FPX", name: "First Trust US Equity Opportunities ETF" },
-    { symbol: "FQAL", name: "Fidelity Quality Factor ETF" },
-    { symbol: "FR", name: "First Industrial Realty Trust, Inc. Common Stock" },
-    { symbol: "FRA", name: "Blackrock Floating Rate Income Strategies Fund Inc  Common Stock" },
-    { symbol: "FRDM", name: "Freedom 100 Emerging Markets ETF" },
-    { symbol: "FREL", name: "Fidelity MSCI Real Estate Index ETF" },
-    { symbol: "FRGE", name: "Forge Global Holdings, Inc. Common Stock" },
-    { symbol: "FRI", name: "First Trust S&P REIT Index Fund" },
-    { symbol: "FRIZ", name: "Franklin Templeton ETF Trust Franklin Dividend Growth ETF" },
-    { symbol: "FRNW", name: "Fidelity Clean Energy ETF" },
-    { symbol: "FRO", name: "Frontline Plc Ordinary Shares" },
-    { symbol: "FRT", name: "Federal Realty Investment Trust Common Stock" },
-    { symbol: "FRT$C", name: "Federal Realty Investment Trust Depositary Shares, each representing a 1/1000th interest in a 5.000% Series C Cumulative Redeemable Preferred Share" },
-    { symbol: "FRTY", name: "Alger Mid Cap 40 ETF" },
-    { symbol: "FSBD", name: "Fidelity Merrimack Street Trust Fidelity Sustainable Core Plus Bond ETF" },
-    { symbol: "FSCC", name: "Federated Hermes ETF Trust Federated Hermes MDT Small Cap Core ETF" },
-    { symbol: "FSCO", name: "FS Credit Opportunities Corp. Common Stock" },
-    { symbol: "FSEC", name: "Fidelity Investment Grade Securitized ETF" },
-    { symbol: "FSEP", name: "FT Vest U.S. Equity Buffer ETF - September" },
-    { symbol: "FSI", name: "Flexible Solutions International Inc. Common Stock (CDA)" },
-    { symbol: "FSIG", name: "First Trust Limited Duration Investment Grade Corporate ETF" },
-    { symbol: "FSK", name: "FS KKR Capital Corp. Common Stock" },
-    { symbol: "FSLD", name: "Fidelity Merrimack Street Trust Fidelity Sustainable Low Duration Bond ETF" },
-    { symbol: "FSLY", name: "Fastly, Inc. Class A Common Stock" },
-    { symbol: "FSM", name: "Fortuna Mining Corp. Common Shares" },
-    { symbol: "FSMB", name: "First Trust Short Duration Managed Municipal ETF" },
-    { symbol: "FSMD", name: "Fidelity Small-Mid Multifactor ETF" },
-    { symbol: "FSP", name: "Franklin Street Properties Corp. Common Stock" },
-    { symbol: "FSS", name: "Federal Signal Corporation Common Stock" },
-    { symbol: "FSST", name: "Fidelity Sustainable U.S. Equity ETF" },
-    { symbol: "FSTA", name: "Fidelity MSCI COnsumer Staples Index ETF" },
-    { symbol: "FSYD", name: "Fidelity Covington Trust Fidelity Sustainable High Yield ETF" },
-    { symbol: "FT", name: "Franklin Universal Trust Common Stock" },
-    { symbol: "FTBD", name: "Fidelity Merrimack Street Trust Fidelity Tactical Bond ETF" },
-    { symbol: "FTBI", name: "First Trust Exchange-Traded Fund VI First Trust Balanced Income ETF" },
-    { symbol: "FTCB", name: "First Trust Exchange-Traded Fund IV First Trust Core Investment Grade ETF" },
-    { symbol: "FTCE", name: "First Trust Exchange-Traded Fund VI First Trust New Constructs Core Earnings Leaders ETF" },
-    { symbol: "FTEC", name: "Fidelity MSCI Information Technology Index ETF" },
-    { symbol: "FTF", name: "Franklin Limited Duration Income Trust Common Shares of Beneficial Interest" },
-    { symbol: "FTHF", name: "First Trust Exchange-Traded Fund II First Trust Emerging Markets Human Flourishing ETF" },
-    { symbol: "FTHY", name: "First Trust High Yield Opportunities 2027 Term Fund Common Stock" },
-    { symbol: "FTI", name: "TechnipFMC plc Ordinary Share" },
-    { symbol: "FTIF", name: "First Trust Exchange-Traded Fund First Trust Bloomberg Inflation Sensitive Equity ETF" },
-    { symbol: "FTK", name: "Flotek Industries, Inc. Common Stock" },
-    { symbol: "FTKI", name: "First Trust Exchange-Traded Fund VI First Trust Small Cap BuyWrite Income ETF" },
-    { symbol: "FTLS", name: "First Trust Long/Short Equity" },
-    { symbol: "FTRB", name: "Federated Hermes ETF Trust Federated Hermes Total Return Bond ETF" },
-    { symbol: "FTS", name: "Fortis Inc. Common Shares" },
-    { symbol: "FTSD", name: "Franklin Short Duration U.S. Government ETF" },
-    { symbol: "FTV", name: "Fortive Corporation Common Stock " },
-    { symbol: "FTWO", name: "Strive Natural Resources and Security ETF" },
-    { symbol: "FUBO", name: "fuboTV Inc. Common Stock" },
-    { symbol: "FUL", name: "H. B. Fuller Company Common Stock" },
-    { symbol: "FUMB", name: "First Trust Ultra Short Duration Municipal ETF" },
-    { symbol: "FUN", name: "Six Flags Entertainment Corporation Common Stock New" },
-    { symbol: "FUNL", name: "CornerCap Fundametrics Large-Cap ETF" },
-    { symbol: "FURY", name: "Fury Gold Mines Limited Common Shares" },
-    { symbol: "FUSI", name: "American Century ETF Trust American Century Multisector Floating Income ETF" },
-    { symbol: "FUTY", name: "Fidelity MSCI Utilities Index ETF" },
-    { symbol: "FVAL", name: "Fidelity Value Factor ETF" },
-    { symbol: "FVD", name: "First Trust VL Dividend" },
-    { symbol: "FVR", name: "FrontView REIT, Inc. Common Stock" },
-    { symbol: "FVRR", name: "Fiverr International Ltd. Ordinary Shares, no par value" },
-    { symbol: "FWD", name: "AB Active ETFs, Inc. AB Disruptors ETF" },
-    { symbol: "FXA", name: "Invesco CurrencyShares Australian Dollar Trust" },
-    { symbol: "FXB", name: "Invesco CurrencyShares British Pound Sterling Trust" },
-    { symbol: "FXC", name: "Invesco CurrencyShares Canadian Dollar Trust" },
-    { symbol: "FXD", name: "First Trust Cons. Discret. AlphaDEX" },
-    { symbol: "FXE", name: "Invesco CurrencyShares Euro Currency Trust" },
-    { symbol: "FXED", name: "Sound Enhanced Fixed Income ETF" },
-    { symbol: "FXF", name: "Invesco CurrencyShares Swiss Franc Trust" },
-    { symbol: "FXG", name: "First Trust Cons. Staples AlphaDEX" },
-    { symbol: "FXH", name: "First Trust Health Care AlphaDEX" },
-    { symbol: "FXI", name: "iShares China Large-Cap ETF" },
-    { symbol: "FXL", name: "First Trust Technology AlphaDEX" },
-    { symbol: "FXN", name: "First Trust Energy AlphaDEX Fund" },
-    { symbol: "FXO", name: "First Trust Financials AlphaDEX" },
-    { symbol: "FXP", name: "ProShares Ultrashort FTSE China 50" },
-    { symbol: "FXR", name: "First Trust Industrials AlphaDEX" },
-    { symbol: "FXU", name: "First Trust Utilities AlphaDEX Fund" },
-    { symbol: "FXY", name: "Invesco CurrencyShares Japanese Yen Trust" },
-    { symbol: "FXZ", name: "First Trust Materials AlphaDEX Fund" },
-    { symbol: "FYEE", name: "Fidelity Yield Enhanced Equity ETF" },
-    { symbol: "FYLD", name: "Cambria Foreign Shareholder Yield ETF" },
-    { symbol: "G", name: "Genpact Limited Common Stock" },
-    { symbol: "GAA", name: "Cambria Global Asset Allocation ETF" },
-    { symbol: "GAB", name: "Gabelli Equity Trust, Inc. (The) Common Stock" },
-    { symbol: "GAB$G", name: "Gabelli Equity Trust, Inc. (The) Series G Cumulative Preferred Stock" },
-    { symbol: "GAB$H", name: "Gabelli Equity Trust, Inc. (The) Pfd Ser H" },
-    { symbol: "GAB$K", name: "Gabelli Equity Trust, Inc. (The) 5.00% Series K Cumulative Preferred Stock" },
-    { symbol: "GABF", name: "Gabelli ETFs Trust Gabelli Financial Services Opportunities ETF" },
-    { symbol: "GAEM", name: "Simplify Exchange Traded Funds Simplify Gamma Emerging Market Bond ETF" },
-    { symbol: "GAL", name: "SPDR SSgA Global Allocation ETF" },
-    { symbol: "GAM", name: "General American Investors, Inc. Common Stock" },
-    { symbol: "GAM$B", name: "General American Investors Company, Inc. Cumulative Preferred Stock" },
-    { symbol: "GAMR", name: "Amplify Video Game Leaders ETF" },
-    { symbol: "GAP", name: "Gap, Inc. (The) Common Stock" },
-    { symbol: "GAPR", name: "FT Vest U.S. Equity Moderate Buffer ETF - April" },
-    { symbol: "GARP", name: "iShares MSCI USA Quality GARP ETF" },
-    { symbol: "GAST", name: "Gabelli Automation ETF" },
-    { symbol: "GATX", name: "GATX Corporation Common Stock" },
-    { symbol: "GAU", name: "Galiano Gold Inc." },
-    { symbol: "GAUG", name: "FT Vest U.S. Equity Moderate Buffer ETF - August" },
-    { symbol: "GBAB", name: "Guggenheim Taxable Municipal Bond & Investment Grade Debt Trust Common Shares of Beneficial Interest" },
-    { symbol: "GBCI", name: "Glacier Bancorp, Inc. Common Stock" },
-    { symbol: "GBF", name: "iShares Government/Credit Bond ETF" },
-    { symbol: "GBIL", name: "Goldman Sachs Access Treasury 0-1 Year ETF" },
-    { symbol: "GBLD", name: "Invesco MSCI Green Building ETF" },
-    { symbol: "GBLI", name: "Global Indemnity Group, LLC Class A Common Stock (DE)" },
-    { symbol: "GBND", name: "Goldman Sachs ETF Trust Goldman Sachs Core Bond ETF" },
-    { symbol: "GBR", name: "New Concept Energy, Inc Common Stock" },
-    { symbol: "GBTC", name: "Grayscale Bitcoin Trust (BTC) Common Units of fractional undivided beneficial interest" },
-    { symbol: "GBTG", name: "Global Business Travel Group, Inc. Class A Common Stock" },
-    { symbol: "GBX", name: "Greenbrier Companies, Inc. (The) Common Stock" },
-    { symbol: "GBXA", name: "Goldman Sachs ETF Trust Goldman Sachs U.S. Large Cap Buffer 1 ETF" },
-    { symbol: "GBXB", name: "Goldman Sachs ETF Trust Goldman Sachs U.S. Large Cap Buffer 2 ETF" },
-    { symbol: "GBXC", name: "Goldman Sachs ETF Trust Goldman Sachs U.S. Large Cap Buffer 3 ETF" },
-    { symbol: "GCAD", name: "Gabelli Commercial Aerospace and Defense ETF" },
-    { symbol: "GCAL", name: "Goldman Sachs ETF Trust Goldman Sachs Dynamic California Municipal Income ETF" },
-    { symbol: "GCC", name: "WisdomTree EnhancedContinuous Commodity Index Fund" },
-    { symbol: "GCI", name: "Gannett Co., Inc. Common Stock" },
-    { symbol: "GCO", name: "Genesco Inc. Common Stock" },
-    { symbol: "GCOR", name: "Goldman Sachs ETF Trust Goldman Sachs Access U.S. Aggregate Bond ETF" },
-    { symbol: "GCOW", name: "Pacer Global Cash Cows Dividend ETF" },
-    { symbol: "GCTS", name: "GCT Semiconductor Holding, Inc. Common Stock" },
-    { symbol: "GCTS.W", name: "GCT Semiconductor Holding, Inc. Warrants, each whole warrant exercisable for one share of Common Stock at an exercise price of $11.50" },
-    { symbol: "GCV", name: "Gabelli Convertible and Income Securities Fund, Inc. (The) Common Stock" },
-    { symbol: "GD", name: "General Dynamics Corporation Common Stock" },
-    { symbol: "GDDY", name: "GoDaddy Inc. Class A Common Stock" },
-    { symbol: "GDE", name: "WisdomTree Trust WisdomTree Efficient Gold Plus Equity Strategy Fund" },
-    { symbol: "GDEC", name: "FT Vest U.S. Equity Moderate Buffer ETF - December" },
-    { symbol: "GDIV", name: "Harbor ETF Trust Harbor Dividend Growth Leaders ETF" },
-    { symbol: "GDL", name: "GDL Fund, The Common Shares of Beneficial Interest" },
-    { symbol: "GDMA", name: "GadsdenA DynamicA Multi-AssetA ETF" },
-    { symbol: "GDMN", name: "WisdomTree Trust WisdomTree Efficient Gold Plus Gold Miners Strategy Fund" },
-    { symbol: "GDO", name: "Western Asset Global Corporate Opportunity Fund Inc. Common Stock" },
-    { symbol: "GDOC", name: "Goldman Sachs Future Health Care Equity ETF" },
-    { symbol: "GDOT", name: "Green Dot Corporation Class A Common Stock, $0.001 par value" },
-    { symbol: "GDV", name: "Gabelli Dividend & Income Trust Common Shares of Beneficial Interest" },
-    { symbol: "GDV$H", name: "The Gabelli Dividend & Income Trust 5.375% Series H Cumulative Preferred Shares" },
-    { symbol: "GDV$K", name: "The Gabelli Dividend & Income Trust 4.250% Series K Cumulative Preferred Shares" },
-    { symbol: "GDX", name: "VanEck Gold Miners ETF " },
-    { symbol: "GDXD", name: "MicroSectors Gold Miners -3X Inverse Leveraged ETNs" },
-    { symbol: "GDXJ", name: "VanEck Junior Gold Miners ETF" },
-    { symbol: "GDXU", name: "MicroSectors Gold Miners 3X Leveraged ETN" },
-    { symbol: "GDXY", name: "Tidal Trust II YieldMax Gold Miners Option Income Strategy ETF" },
-    { symbol: "GE", name: "GE Aerospace Common Stock" },
-    { symbol: "GEF", name: "Greif Inc. Class A Common Stock" },
-    { symbol: "GEF.B", name: "Greif, Inc. Corporation Class B Common Stock" },
-    { symbol: "GEL", name: "Genesis Energy, L.P. Common Units" },
-    { symbol: "GEM", name: "Goldman Sachs ActiveBeta Emerging Markets Equity ETF" },
-    { symbol: "GEMD", name: "Goldman Sachs ETF Trust Goldman Sachs Access Emerging Markets USD Bond ETF" },
-    { symbol: "GENC", name: "Gencor Industries, Inc. Common Stock" },
-    { symbol: "GEND", name: "Spinnaker ETF Series Genter Capital Dividend Income ETF" },
-    { symbol: "GENI", name: "Genius Sports Limited Ordinary Shares" },
-    { symbol: "GENM", name: "Spinnaker ETF Series Genter Capital Municipal Quality Intermediate ETF" },
-    { symbol: "GENT", name: "Spinnaker ETF Series Genter Capital Taxable Quality Intermediate ETF" },
-    { symbol: "GENW", name: "Spinnaker ETF Series Genter Capital International Dividend ETF" },
-    { symbol: "GEO", name: "Geo Group Inc (The) REIT" },
-    { symbol: "GEOA", name: "WisdomTree Trust WisdomTree GeoAlpha Opportunities Fund" },
-    { symbol: "GES", name: "Guess?, Inc. Common Stock" },
-    { symbol: "GETY", name: "Getty Images Holdings, Inc. Class A Common Stock" },
-    { symbol: "GEV", name: "GE Vernova Inc. Common Stock" },
-    { symbol: "GEVX", name: "Tradr 2X Long GEV Daily ETF" },
-    { symbol: "GF", name: "New Germany Fund, Inc. (The) Common Stock" },
-    { symbol: "GFEB", name: "FT Vest U.S. Equity Moderate Buffer ETF - February" },
-    { symbol: "GFF", name: "Griffon Corporation Common Stock" },
-    { symbol: "GFI", name: "Gold Fields Limited American Depositary Shares" },
-    { symbol: "GFL", name: "GFL Environmental Inc. Subordinate voting shares, no par value" },
-    { symbol: "GFR", name: "Greenfire Resources Ltd. Common Shares" },
-    { symbol: "GGB", name: "Gerdau S.A. Common Stock" },
-    { symbol: "GGG", name: "Graco Inc. Common Stock" },
-    { symbol: "GGM", name: "Northern Lights Fund Trust II GGM Macro Alignment ETF" },
-    { symbol: "GGME", name: "Invesco Next Gen Media and Gaming ETF" },
-    { symbol: "GGN", name: "GAMCO Global Gold, Natural Resources & Income Trust" },
-    { symbol: "GGN$B", name: "GAMCO Global Gold, Natural Reources & Income Trust 5.00% Series B Cumulative 25.00 Liquidation Preference" },
-    { symbol: "GGOV", name: "BlackRock ETF Trust II iShares Global Government Bond USD Hedged Active ETF" },
-    { symbol: "GGRW", name: "Gabelli Growth Innovators ETF" },
-    { symbol: "GGT", name: "Gabelli Multi-Media Trust, Inc. (The) Common Stock" },
-    { symbol: "GGT$E", name: "Gabelli Multi-Media Trust Inc. (The) 5.125% Series E Cumulative Preferred Stock" },
-    { symbol: "GGT$G", name: "Gabelli Multi-Media Trust Inc. (The) 5.125% Series G Cumulative Preferred Shares" },
-    { symbol: "GGUS", name: "Goldman Sachs ETF Trust Goldman Sachs MarketBeta Russell 1000 Growth Equity ETF" },
-    { symbol: "GGZ", name: "Gabelli Global Small and Mid Cap Value Trust (The) Common Shares of Beneficial Interest" },
-    { symbol: "GHC", name: "Graham Holdings Company Common Stock" },
-    { symbol: "GHG", name: "GreenTree Hospitality Group Ltd. American depositary shares, each representing one Class A ordinary share" },
-    { symbol: "GHI", name: "Greystone Housing Impact Investors LP Beneficial Unit Certificates representing assignments of limited partnership interests" },
-    { symbol: "GHLD", name: "Guild Holdings Company Class A Common Stock" },
-    { symbol: "GHM", name: "Graham Corporation Common Stock" },
-    { symbol: "GHMS", name: "Collaborative Investment Series Trust Goose Hollow Multi-Strategy Income ETF" },
-    { symbol: "GHTA", name: "Goose Hollow Tactical Allocation ETF" },
-    { symbol: "GHY", name: "PGIM Global High Yield Fund, Inc." },
-    { symbol: "GHYB", name: "Goldman Sachs Access High Yield Corporate Bond ETF" },
-    { symbol: "GHYG", name: "iShares US & Intl High Yield Corp Bond ETF" },
-    { symbol: "GIAX", name: "Tidal Trust II Nicholas Global Equity and Income ETF" },
-    { symbol: "GIB", name: "CGI Inc. Common Stock" },
-    { symbol: "GIC", name: "Global Industrial Company Common Stock" },
-    { symbol: "GIGB", name: "Goldman Sachs Access Investment Grade Corporate Bond ETF" },
-    { symbol: "GIGL", name: "Goldman Sachs ETF Trust Goldman Sachs Corporate Bond ETF" },
-    { symbol: "GII", name: "SPDR S&P Global Infrastructure ETF" },
-    { symbol: "GIL", name: "Gildan Activewear, Inc. Class A Sub. Vot. Common Stock" },
-    { symbol: "GINN", name: "Goldman Sachs Innovate Equity ETF" },
-    { symbol: "GIS", name: "General Mills, Inc. Common Stock" },
-    { symbol: "GJAN", name: "FT Vest U.S. Equity Moderate Buffer ETF - January" },
-    { symbol: "GJH", name: "Synthetic Fixed-Income Securities Inc 6.375% (STRATS) Cl A-1" },
-    { symbol: "GJO", name: "Synthetic Fixed-Income Securities, Inc. on behalf of STRATS(SM) Trust for Wal-Mart Stores, Inc. Securities, Series 2004-5" },
-    { symbol: "GJP", name: "Synthetic Fixed-Income Securities, Inc. on behalf of STRATS (SM) Trust for Dominion Resources, Inc. Securities, Series 2005-6, Floating Rate Structured Repackaged Asset-Backed Trust Securities (STRATS) Certificates" },
-    { symbol: "GJR", name: "Synthetic Fixed-Income Securities, Inc. STRATS Trust for Procter&Gamble Securities, Series 2006-1" },
-    { symbol: "GJS", name: "Goldman Sachs Group Securities STRATS Trust for Goldman Sachs Group Securities, Series 2006-2" },
-    { symbol: "GJT", name: "Synthetic Fixed-Income Securities, Inc. Floating Rate Structured Repackaged Asset-Backed Trust Securities Certificates, Series 2006-3" },
-    { symbol: "GJUL", name: "FT Vest U.S. Equity Moderate Buffer ETF - July" },
-    { symbol: "GJUN", name: "FT Vest U.S. Equity Moderate Buffer ETF - June" },
-    { symbol: "GK", name: "AdvisorShares Gerber Kawasaki ETF" },
-    { symbol: "GKOS", name: "Glaukos Corporation Common Stock" },
-    { symbol: "GL", name: "Globe Life Inc. Common Stock" },
-    { symbol: "GL$D", name: "Globe Life Inc. 4.25% Junior Subordinated Debentures due 2061" },
-    { symbol: "GLBL", name: "Pacer Funds Trust Pacer MSCI World Industry Advantage ETF" },
-    { symbol: "GLD", name: "SPDR Gold Trust" },
-    { symbol: "GLDG", name: "GoldMining Inc. Common Shares" },
-    { symbol: "GLDM", name: "SPDR Gold MiniShares Trust" },
-    { symbol: "GLIN", name: "VanEck India Growth Leaders ETF" },
-    { symbol: "GLL", name: "ProShares UltraShort Gold" },
-    { symbol: "GLO", name: "Clough Global Opportunities Fund Common Stock" },
-    { symbol: "GLOB", name: "Globant S.A. Common Shares" },
-    { symbol: "GLOF", name: "iShares Global Equity Factor ETF" },
-    { symbol: "GLOP$A", name: "GasLog Partners LP 8.625% Series A Cumulative Redeemable Perpetual Fixed to Floating Rate Preference Units" },
-    { symbol: "GLOP$B", name: "GasLog Partners LP 8.200% Series B Cumulative Redeemable Perpetual Fixed to Floating Rate Preference Units" },
-    { symbol: "GLOP$C", name: "GasLog Partners LP 8.500% Series C Cumulative Redeemable Perpetual Fixed to Floating Rate Preference Units" },
-    { symbol: "GLOV", name: "Goldman Sachs ETF Trust Goldman Sachs ActiveBeta World Low Vol Plus Equity ETF" },
-    { symbol: "GLP", name: "Global Partners LP Common Units representing Limited Partner Interests" },
-    { symbol: "GLP$B", name: "Global Partners LP 9.50% Series B Fixed Rate Cumulative Redeemable Perpetual Preferred Units representing limited partner interests" },
-    { symbol: "GLQ", name: "Clough Global Equity Fund Clough Global Equity Fund Common Shares of Beneficial Interest" },
-    { symbol: "GLRY", name: "Northern Lights Fund Trust IV Inspire Momentum ETF" },
-    { symbol: "GLTR", name: "abrdn Physical Precious Metals Basket Shares ETF" },
-    { symbol: "GLU", name: "Gabelli Global Utility Common Shares of Beneficial Ownership" },
-    { symbol: "GLU$A", name: "The Gabelli Global Utility and Income Trust Series A Cumulative Puttable and Callable Preferred Shares" },
-    { symbol: "GLU$B", name: "The Gabelli Global Utility and Income Trust Series B Cumulative Puttable and Callable Preferred Shares" },
-    { symbol: "GLV", name: "Clough Global Dividend and Income Fund Common Shares of beneficial interest" },
-    { symbol: "GLW", name: "Corning Incorporated Common Stock" },
-    { symbol: "GLXU", name: "ETF Opportunities Trust T-REX 2X Long GLXY Daily Target ETF" },
-    { symbol: "GM", name: "General Motors Company Common Stock" },
-    { symbol: "GMAR", name: "FT Vest U.S. Equity Moderate Buffer ETF - March" },
-    { symbol: "GMAY", name: "FT Vest U.S. Equity Moderate Buffer ETF - May" },
-    { symbol: "GME", name: "GameStop Corporation Common Stock" },
-    { symbol: "GMED", name: "Globus Medical, Inc. Class A Common Stock" },
-    { symbol: "GMET", name: "VanEck Green Metals ETF" },
-    { symbol: "GMEU", name: "ETF Opp Tr T-REX 2X Long GME Daily Target ETF" },
-    { symbol: "GMEY", name: "Tidal Trust II YieldMax GME Option Income Strategy ETF" },
-    { symbol: "GMF", name: "SPDR S&P Emerging Asia Pacific ETF" },
-    { symbol: "GMMA", name: "Tidal Trust III GammaRoad Market Navigation ETF" },
-    { symbol: "GMMF", name: "BlackRock ETF Trust iShares Government Money Market ETF" },
-    { symbol: "GMNY", name: "Goldman Sachs ETF Trust Goldman Sachs Dynamic New York Municipal Income ETF" },
-    { symbol: "GMOI", name: "The 2023 ETF Series Trust II GMO International Value ETF" },
-    { symbol: "GMOM", name: "Cambria Global Momentum ETF" },
-    { symbol: "GMOV", name: "The 2023 ETF Series Trust II GMO US Value ETF" },
-    { symbol: "GMRE", name: "Global Medical REIT Inc. Common Stock" },
-    { symbol: "GMRE$A", name: "Global Medical REIT Inc. Series A Cumulative Redeemable Preferred Stock" },
-    { symbol: "GMUB", name: "Goldman Sachs ETF Trust Goldman Sachs Municipal Income ETF" },
-    { symbol: "GMUN", name: "Goldman Sachs Access Municipal Bond ETF" },
-    { symbol: "GNE", name: "Genie Energy Ltd. Class B Common Stock Stock" },
-    { symbol: "GNK", name: "Genco Shipping & Trading Limited Ordinary Shares New (Marshall Islands)" },
-    { symbol: "GNL", name: "Global Net Lease, Inc. Common Stock" },
-    { symbol: "GNL$A", name: "Global Net Lease, Inc. 7.25% Series A Cumulative Redeemable Preferred Stock, $0.01 par value per share" },
-    { symbol: "GNL$B", name: "Global Net Lease, Inc. 6.875% Series B Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "GNL$D", name: "Global Net Lease, Inc. 7.50% Series D Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "GNL$E", name: "Global Net Lease, Inc. 7.375% Series E Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "GNOV", name: "FT Vest U.S. Equity Moderate Buffer ETF - November" },
-    { symbol: "GNR", name: "SPDR S&P Global Natural Resources ETF" },
-    { symbol: "GNRC", name: "Generac Holdlings Inc. Common Stock" },
-    { symbol: "GNS", name: "Genius Group Limited Ordinary Shares" },
-    { symbol: "GNT", name: "GAMCO Natural Resources, Gold & Income Trust" },
-    { symbol: "GNT$A", name: "GAMCO Natural Resources, Gold & Income Tust  5.20% Series A Cumulative Preferred Shares (Liquidation Preference $25.00 per share)" },
-    { symbol: "GNTY", name: "Guaranty Bancshares, Inc. Common Stock" },
-    { symbol: "GNW", name: "Genworth Financial Inc Common Stock" },
-    { symbol: "GOAU", name: "US Global GO Gold and Precious Metal Miners ETF" },
-    { symbol: "GOCT", name: "FT Vest U.S. Equity Moderate Buffer ETF - October" },
-    { symbol: "GOEX", name: "Global X Gold Explorers ETF" },
-    { symbol: "GOF", name: "Guggenheim Strategic Opportunities Fund Common Shares of Beneficial Interest" },
-    { symbol: "GOLF", name: "Acushnet Holdings Corp. Common Stock" },
-    { symbol: "GOLY", name: "Strategy Shares Gold Enhanced Yield ETF" },
-    { symbol: "GOOP", name: "Kurv Yield Premium Strategy Google (GOOGL) ETF" },
-    { symbol: "GOOS", name: "Canada Goose Holdings Inc. Subordinate Voting Shares" },
-    { symbol: "GOOW", name: "Roundhill ETF Trust Roundhill GOOGL WeeklyPay ETF" },
-    { symbol: "GOOX", name: "ETF Opportunities Trust T-Rex 2X Long Alphabet Daily Target ETF" },
-    { symbol: "GOOY", name: "Tidal ETF Trust II YieldMax GOOGL Option Income Strategy ETF" },
-    { symbol: "GOP", name: "Unusual Whales Subversive Republican Trading ETF" },
-    { symbol: "GORO", name: "Gold Resource Corporation Common Stock" },
-    { symbol: "GOTU", name: "Gaotu Techedu Inc. American Depositary Shares" },
-    { symbol: "GOVT", name: "iShares U.S. Treasury Bond ETF" },
-    { symbol: "GOVZ", name: "iShares 25  Year Treasury STRIPS Bond ETF" },
-    { symbol: "GPC", name: "Genuine Parts Company Common Stock" },
-    { symbol: "GPI", name: "Group 1 Automotive, Inc. Common Stock" },
-    { symbol: "GPJA", name: "Georgia Power Company Series 2017A 5.00% Junior Subordinated Notes due October 1, 2077" },
-    { symbol: "GPK", name: "Graphic Packaging Holding Company" },
-    { symbol: "GPMT", name: "Granite Point Mortgage Trust Inc. Common Stock" },
-    { symbol: "GPMT$A", name: "Granite Point Mortgage Trust Inc. 7.00% Series A Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "GPN", name: "Global Payments Inc. Common Stock" },
-    { symbol: "GPOR", name: "Gulfport Energy Corporation Common Shares" },
-    { symbol: "GPRK", name: "Geopark Ltd Common Shares" },
-    { symbol: "GPTY", name: "Tidal Trust II YieldMax AI & Tech Portfolio Option Income ETF" },
-    { symbol: "GPUS", name: "Hyperscale Data, Inc. Common Stock" },
-    { symbol: "GPUS$D", name: "Hyperscale Data, Inc. 13.00% Series D Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "GPZ", name: "VanEck ETF Trust VanEck Alternative Asset Manager ETF" },
-    { symbol: "GQGU", name: "The Advisors' Inner Circle Fund III GQG US Equity ETF" },
-    { symbol: "GQI", name: "Natixis ETF Trust Natixis Gateway Quality Income ETF" },
-    { symbol: "GQRE", name: "FlexShares Global Quality Real Estate Index Fund" },
-    { symbol: "GRAF", name: "Graf Global Corp. Class A ordinary shares" },
-    { symbol: "GRAF.U", name: "Graf Global Corp. Units, each consisting of one Class A ordinary share and one-half of one redeemable warrant" },
-    { symbol: "GRAF.W", name: "Graf Global Corp. Warrants, each whole warrant exercisable for one Class A ordinary share at an exercise price of $11.50 per share" },
-    { symbol: "GRBK", name: "Green Brick Partners, Inc. Common Stock" },
-    { symbol: "GRBK$A", name: "Green Brick Partners, Inc. Depositary Shares (each representing a 1/1000th fractional interest in a share of 5.75% Series A Cumulative Perpetual Preferred Stock)" },
-    { symbol: "GRC", name: "Gorman-Rupp Company (The) Common Stock" },
-    { symbol: "GRDN", name: "Guardian Pharmacy Services, Inc. Class A Common Stock" },
-    { symbol: "GREK", name: "Global X MSCI Greece ETF" },
-    { symbol: "GRF", name: "Eagle Capital Growth Fund, Inc. Common Stock" },
-    { symbol: "GRMN", name: "Garmin Ltd. Common Stock (Switzerland)" },
-    { symbol: "GRN", name: "iPath Series B Carbon Exchange-Traded Notes" },
-    { symbol: "GRNB", name: "VanEck Green Bond ETF" },
-    { symbol: "GRND", name: "Grindr Inc. Common Stock" },
-    { symbol: "GRNT", name: "Granite Ridge Resources, Inc. Common Stock" },
-    { symbol: "GRNY", name: "Fundstrat Granny Shots US Large Cap ETF" },
-    { symbol: "GRO", name: "Brazil Potash Corp. Common Shares" },
-    { symbol: "GROV", name: "Grove Collaborative Holdings, Inc. Class A Common Stock" },
-    { symbol: "GROY", name: "Gold Royalty Corp. Common Shares" },
-    { symbol: "GROY.W", name: "Gold Royalty Corp. Warrants" },
-    { symbol: "GROZ", name: "Zacks Trust Zacks Focus Growth ETF" },
-    { symbol: "GRP.U", name: "Granite Real Estate Inc. Units" },
-    { symbol: "GRPM", name: "Invesco S&P MidCap 400 GARP ETF" },
-    { symbol: "GRPZ", name: "Invesco Exchange-Traded Fund Trust II Invesco S&P SmallCap 600 GARP ETF" },
-    { symbol: "GRX", name: "The Gabelli Healthcare & Wellness Trust Common Shares of Beneficial Interest" },
-    { symbol: "GS", name: "Goldman Sachs Group, Inc. (The) Common Stock" },
-    { symbol: "GS$A", name: "Goldman Sachs Group, Inc. (The) Depositary Shares each representing 1/1000th Interest in a Share of Floating Rate Non-Cumulative Preferred Stock Series A" },
-    { symbol: "GS$C", name: "Goldman Sachs Group, Inc. (The) Depositary Share repstg 1/1000th Preferred Series C" },
-    { symbol: "GS$D", name: "Goldman Sachs Group, Inc. (The) Dep Shs repstg 1/1000 Pfd Ser D Fltg" },
-    { symbol: "GSBD", name: "Goldman Sachs BDC, Inc. Common Stock" },
-    { symbol: "GSC", name: "Goldman Sachs Small Cap Equity ETF" },
-    { symbol: "GSEE", name: "Goldman Sachs MarketBeta Emerging Markets Equity ETF" },
-    { symbol: "GSEP", name: "FT Vest U.S. Equity Moderate Buffer ETF - September" },
-    { symbol: "GSEU", name: "Goldman Sachs ActiveBeta Europe Equity ETF" },
-    { symbol: "GSEW", name: "Goldman Sachs Equal Weight U.S. Large Cap Equity ETF" },
-    { symbol: "GSG", name: "iShares GSCI Commodity-Indexed Trust Fund" },
-    { symbol: "GSID", name: "Goldman Sachs MarketBeta International Equity ETF" },
-    { symbol: "GSIE", name: "Goldman Sachs ActiveBeta International Equity ETF" },
-    { symbol: "GSIG", name: "Golden Sachs ETF Trust Goldman Sachs Access Investment Grade Corporate 1-5 Year Bond ETF" },
-    { symbol: "GSJY", name: "Goldman Sachs ActiveBeta Japan Equity ETF" },
-    { symbol: "GSK", name: "GSK plc American Depositary Shares (Each representing two Ordinary Shares)" },
-    { symbol: "GSKH", name: "Precidian ETFs Trust GSK plc ADRhedged" },
-    { symbol: "GSL", name: "Global Ship Lease Inc New Class A Common Shares" },
-    { symbol: "GSL$B", name: "Global Ship Lease, Inc. Depository Shares Representing 1/100th Perpetual Preferred Series B% (Marshall Island)" },
-    { symbol: "GSLC", name: "Goldman Sachs ActiveBeta U.S. Large Cap Equity ETF" },
-    { symbol: "GSPY", name: "Gotham Enhanced 500 ETF" },
-    { symbol: "GSSC", name: "GS ActiveBeta U.S. Small Cap Equity ETF" },
-    { symbol: "GSST", name: "Goldman Sachs Ultra Short Bond ETF" },
-    { symbol: "GSUS", name: "Goldman Sachs MarketBeta U.S. Equity ETF" },
-    { symbol: "GSY", name: "Invesco Ultra Short Duration ETF" },
-    { symbol: "GTE", name: "Gran Tierra Energy Inc. Common Stock" },
-    { symbol: "GTEK", name: "Goldman Sachs Future Tech Leaders Equity ETF" },
-    { symbol: "GTES", name: "Gates Industrial Corporation plc Ordinary Shares" },
-    { symbol: "GTIP", name: "Goldman Sachs Access Inflation Protected USD Bond ETF" },
-    { symbol: "GTLS", name: "Chart Industries, Inc. Common Stock" },
-    { symbol: "GTLS$B", name: "Chart Industries, Inc. Depositary Shares, each Representing a 1/20th Interest in a Share of 6.75% Series B Mandatory Convertible Preferred Stock" },
-    { symbol: "GTN", name: "Gray Media, Inc. Common Stock" },
-    { symbol: "GTN.A", name: "Gray Media, Inc. Class A Common Stock" },
-    { symbol: "GTO", name: "Invesco Total Return Bond ETF" },
-    { symbol: "GTOC", name: "Invesco Core Fixed Income ETF" },
-    { symbol: "GTOS", name: "Invesco Short Duration Total Return Bond ETF" },
-    { symbol: "GTY", name: "Getty Realty Corporation Common Stock" },
-    { symbol: "GUG", name: "Guggenheim Active Allocation Fund Common Shares of Beneficial Interest" },
-    { symbol: "GUMI", name: "Goldman Sachs ETF Trust Goldman Sachs Ultra Short Municipal Income ETF" },
-    { symbol: "GUNR", name: "FlexShares Global Upstream Natural Resources Index Fund ETF" },
-    { symbol: "GURU", name: "Global X Guru Index ETF" },
-    { symbol: "GUSA", name: "Goldman Sachs ETF Trust II Goldman Sachs MarketBeta U.S. 1000 Equity ETF" },
-    { symbol: "GUSH", name: "Direxion Daily S&P Oil & Gas Exp. & Prod. Bull 2X Shares" },
-    { symbol: "GUT", name: "Gabelli Utility Trust (The) Common Stock" },
-    { symbol: "GUT$C", name: "Gabelli Utility Trust (The) 5.375% Series C Cumulative Preferred Shares" },
-    { symbol: "GVA", name: "Granite Construction Incorporated Common Stock" },
-    { symbol: "GVAL", name: "Cambria Global Value ETF" },
-    { symbol: "GVI", name: "iShares Intermediate Government/Credit Bond ETF" },
-    { symbol: "GVIP", name: "Goldman Sachs Hedge Industry VIP ETF" },
-    { symbol: "GVLU", name: "Gotham 1000 Value ETF" },
-    { symbol: "GVUS", name: "Goldman Sachs ETF Trust Goldman Sachs MarketBeta Russell 1000 Value Equity ETF" },
-    { symbol: "GWH", name: "ESS Tech, Inc. Common Stock" },
-    { symbol: "GWH.W", name: "ESS Tech, Inc. Warrant" },
-    { symbol: "GWRE", name: "Guidewire Software, Inc. Common Stock" },
-    { symbol: "GWW", name: "W.W. Grainger, Inc. Common Stock" },
-    { symbol: "GWX", name: "SPDR S&P International SmallCap ETF" },
-    { symbol: "GXC", name: "SPDR S&P China ETF" },
-    { symbol: "GXIG", name: "Global X Funds Global X Investment Grade Corporate Bond ETF" },
-    { symbol: "GXO", name: "GXO Logistics, Inc. Common Stock " },
-    { symbol: "GXPC", name: "Global X Funds Global X PureCap MSCI Communication Services ETF" },
-    { symbol: "GXPD", name: "Global X Funds Global X PureCap MSCI Consumer Discretionary ETF" },
-    { symbol: "GXPE", name: "Global X Funds Global X PureCap MSCI Energy ETF" },
-    { symbol: "GXPS", name: "Global X Funds Global X PureCap MSCI Consumer Staples ETF" },
-    { symbol: "GXPT", name: "Global X Funds Global X PureCap MSCI Information Technology ETF" },
-    { symbol: "GXUS", name: "Goldman Sachs ETF Trust II Goldman Sachs MarketBeta Total International Equity ETF" },
-    { symbol: "GYLD", name: "Arrow Dow Jones Global Yield ETF ETF" },
-    { symbol: "H", name: "Hyatt Hotels Corporation Class A Common Stock" },
-    { symbol: "HACK", name: "Amplify ETF Trust Amplify Cybersecurity ETF" },
-    { symbol: "HAE", name: "Haemonetics Corporation Common Stock" },
-    { symbol: "HAFN", name: "Hafnia Limited Common Shares" },
-    { symbol: "HAIL", name: "SPDR S&P Kensho Smart Mobility ETF" },
-    { symbol: "HAL", name: "Halliburton Company Common Stock" },
-    { symbol: "HAP", name: "VanEck Natural Resources ETF" },
-    { symbol: "HAPI", name: "Harbor Human Capital Factor US Large Cap ETF" },
-    { symbol: "HAPS", name: "Harbor Human Capital Factor US Small Cap ETF" },
-    { symbol: "HAPY", name: "Harbor Human Capital Factor Unconstrained ETF" },
-    { symbol: "HARD", name: "Simplify Exchange Traded Funds Simplify Commodities Strategy No K-1 ETF" },
-    { symbol: "HASI", name: "HA Sustainable Infrastructure Capital, Inc. Common Stock" },
-    { symbol: "HAUS", name: "Residential REIT ETF" },
-    { symbol: "HAUZ", name: "Xtrackers International Real Estate ETF" },
-    { symbol: "HAWX", name: "iShares Currency Hedged MSCI ACWI ex U.S. ETF" },
-    { symbol: "HAYW", name: "Hayward Holdings, Inc. Common Stock" },
-    { symbol: "HBB", name: "Hamilton Beach Brands Holding Company Class A Common Stock " },
-    { symbol: "HBI", name: "Hanesbrands Inc. Common Stock" },
-    { symbol: "HBM", name: "Hudbay Minerals Inc. Ordinary Shares (Canada)" },
-    { symbol: "HBTA", name: "Horizon Funds Horizon Expedition Plus ETF" },
-    { symbol: "HBTC", name: "Listed Funds Trust Fortuna Hedged Bitcoin Fund" },
-    { symbol: "HCA", name: "HCA Healthcare, Inc. Common Stock" },
-    { symbol: "HCC", name: "Warrior Met Coal, Inc. Common Stock" },
-    { symbol: "HCI", name: "HCI Group, Inc. Common Stock" },
-    { symbol: "HCMT", name: "Direxion Shares ETF Trust Direxion HCM Tactical Enhanced US ETF" },
-    { symbol: "HCRB", name: "Hartford Core Bond ETF" },
-    { symbol: "HCWC", name: "Healthy Choice Wellness Corp. Class A Common Stock" },
-    { symbol: "HCXY", name: "Hercules Capital, Inc. 6.25% Notes due 2033" },
-    { symbol: "HD", name: "Home Depot, Inc. (The) Common Stock" },
-    { symbol: "HDB", name: "HDFC Bank Limited Common Stock" },
-    { symbol: "HDEF", name: "Xtrackers MSCI EAFE High Dividend Yield Equity ETF" },
-    { symbol: "HDG", name: "ProShares Hedge Replication ETF" },
-    { symbol: "HDGE", name: "Ranger Equity Bear Bear ETF" },
-    { symbol: "HDLB", name: "ETRACS Monthly Pay 2xLeveraged US High Dividend Low Volatility ETN Series B due September 30, 2044" },
-    { symbol: "HDMV", name: "First Trust Exchange-Traded Fund III First Trust Horizon Managed Volatility Developed International ETF" },
-    { symbol: "HDUS", name: "Lattice Strategies Trust Hartford Disciplined US Equity ETF" },
-    { symbol: "HDV", name: "iShares Core High Dividend ETF" },
-    { symbol: "HE", name: "Hawaiian Electric Industries, Inc. Common Stock" },
-    { symbol: "HEAT", name: "Touchstone ETF Trust Touchstone Climate Transition ETF" },
-    { symbol: "HECA", name: "ETF Opportunities Trust Hedgeye Capital Allocation ETF" },
-    { symbol: "HEDJ", name: "WisdomTree Europe Hedged Equity Fund" },
-    { symbol: "HEEM", name: "iShares Currency Hedged MSCI Emerging Markets ETF" },
-    { symbol: "HEFA", name: "iShares Currency Hedged MSCI EAFE ETF" },
-    { symbol: "HEGD", name: "Swan Hedged Equity US Large Cap ETF" },
-    { symbol: "HEI", name: "Heico Corporation Common Stock" },
-    { symbol: "HEI.A", name: "Heico Corporation Common Stock" },
-    { symbol: "HELO", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan Hedged Equity Laddered Overlay ETF" },
-    { symbol: "HELX", name: "Franklin Genomic Advancements ETF" },
-    { symbol: "HEQ", name: "John Hancock Diversified Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "HEQT", name: "Simplify Hedged Equity ETF" },
-    { symbol: "HESM", name: "Hess Midstream LP Class A Representing Limited Partner Interests" },
-    { symbol: "HEWJ", name: "iShares Currency Hedged MSCI Japan ETF" },
-    { symbol: "HEZU", name: "iShares Currency Hedged MSCI Eurozone ETF" },
-    { symbol: "HF", name: "DGA Core Plus Absolute Return ETF" },
-    { symbol: "HFEQ", name: "Tidal Trust I Unlimited HFEQ Equity Long/Short ETF" },
-    { symbol: "HFGM", name: "Unlimited HFGM Global Macro ETF" },
-    { symbol: "HFGO", name: "Hartford Large Cap Growth ETF" },
-    { symbol: "HFMF", name: "Tidal Trust I Unlimited HFMF Managed Futures ETF" },
-    { symbol: "HFND", name: "Unlimited HFND Multi-Strategy Return Tracker ETF" },
-    { symbol: "HFRO", name: "Highland Opportunities and Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "HFRO$A", name: "Highland Opportunities and Income Fund 5.375% Series A Cumulative Preferred Shares" },
-    { symbol: "HFRO$B", name: "Highland Opportunities and Income Fund 5.375% Series B Cumulative Preferred Shares" },
-    { symbol: "HFSI", name: "Hartford Strategic Income ETF" },
-    { symbol: "HFXI", name: "NYLI FTSE International Equity Currency Neutral ETF" },
-    { symbol: "HG", name: "Hamilton Insurance Group, Ltd. Class B Common Shares" },
-    { symbol: "HGER", name: "Harbor Commodity All-Weather Strategy ETF" },
-    { symbol: "HGLB", name: "Highland Global Allocation Fund Common Stock" },
-    { symbol: "HGRO", name: "ETF Opp Tr Hedgeye Quality Growth ETF" },
-    { symbol: "HGTY", name: "Hagerty, Inc. Class A Common Stock" },
-    { symbol: "HGV", name: "Hilton Grand Vacations Inc. Common Stock " },
-    { symbol: "HHH", name: "Howard Hughes Holdings Inc. Common Stock" },
-    { symbol: "HI", name: "Hillenbrand Inc Common Stock" },
-    { symbol: "HIBL", name: "Direxion Daily S&P 500 High Beta Bull 3X Shares" },
-    { symbol: "HIBS", name: "Direxion Daily S&P 500 High Beta Bear 3X Shares" },
-    { symbol: "HIDV", name: "AB Active ETFs, Inc. AB US High Dividend ETF" },
-    { symbol: "HIG", name: "The Hartford Insurance Group, Inc. Common Stock" },
-    { symbol: "HIG$G", name: "The Hartford Insurance Group, Inc. Depositary Shares each representing a 1/1000th interest in a share of 6.000% Non-Cumulative Preferred Stock, Series G" },
-    { symbol: "HIGH", name: "Simplify Exchange Traded Funds Simplify Enhanced Income ETF" },
-    { symbol: "HII", name: "Huntington Ingalls Industries, Inc. Common Stock" },
-    { symbol: "HIMS", name: "Hims & Hers Health, Inc. Class A Common Stock" },
-    { symbol: "HIMU", name: "BlackRock ETF Trust II iShares High Yield Muni Active ETF" },
-    { symbol: "HIO", name: "Western Asset High Income Opportunity Fund, Inc. Common Stock" },
-    { symbol: "HIPO", name: "Hippo Holdings Inc. Common Stock" },
-    { symbol: "HIPS", name: "GraniteShares HIPS US High Income ETF" },
-    { symbol: "HIW", name: "Highwoods Properties, Inc. Common Stock" },
-    { symbol: "HIX", name: "Western Asset High Income Fund II Inc. Common Stock" },
-    { symbol: "HIYS", name: "Invesco Actively Managed Exchange-Traded Fund Trus Invesco High Yield Select ETF" },
-    { symbol: "HKD", name: "AMTD Digital Inc. American Depositary Shares (every five of which represent two Class A Ordinary Shares)" },
-    { symbol: "HKND", name: "Humankind US Stock ETF" },
-    { symbol: "HL", name: "Hecla Mining Company Common Stock" },
-    { symbol: "HL$B", name: "Hecla Mining Company Preferred Stock" },
-    { symbol: "HLF", name: "Herbalife Ltd. Common Shares" },
-    { symbol: "HLI", name: "Houlihan Lokey, Inc. Class A Common Stock" },
-    { symbol: "HLIO", name: "Helios Technologies, Inc. Common Stock" },
-    { symbol: "HLLY", name: "Holley Inc. Common Stock" },
-    { symbol: "HLLY.W", name: "Holley Inc. Warrants" },
-    { symbol: "HLN", name: "Haleon plc American Depositary Shares (Each representing two Ordinary Shares)" },
-    { symbol: "HLT", name: "Hilton Worldwide Holdings Inc. Common Stock " },
-    { symbol: "HLX", name: "Helix Energy Solutions Group, Inc. Common Stock" },
-    { symbol: "HMC", name: "Honda Motor Company, Ltd. Common Stock" },
-    { symbol: "HMN", name: "Horace Mann Educators Corporation Common Stock" },
-    { symbol: "HMOP", name: "Hartford Municipal Opportunities ETF" },
-    { symbol: "HMY", name: "Harmony Gold Mining Company Limited" },
-    { symbol: "HNGE", name: "Hinge Health, Inc. Class A Common Stock" },
-    { symbol: "HNI", name: "HNI Corporation Common Stock" },
-    { symbol: "HNW", name: "Pioneer Diversified High Income Fund, Inc." },
-    { symbol: "HOCT", name: "Innovator ETFs Trust Innovator Premium Income 9 Buffer ETF - October" },
-    { symbol: "HODL", name: "VanEck Bitcoin Trust Common Shares of Beneficial Interest" },
-    { symbol: "HOG", name: "Harley-Davidson, Inc. Common Stock" },
-    { symbol: "HOLA", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan International Hedged Equity Laddered Overlay ETF" },
-    { symbol: "HOLD", name: "Harbor ETF Trust Harbor Alpha Layering ETF" },
-    { symbol: "HOMB", name: "Home BancShares, Inc. Common Stock" },
-    { symbol: "HOMZ", name: "Hoya Capital Housing ETF" },
-    { symbol: "HOOW", name: "Roundhill ETF Trust Roundhill HOOD WeeklyPay ETF" },
-    { symbol: "HOOY", name: "Tidal Trust II YieldMax HOOD Option Income Strategy ETF" },
-    { symbol: "HOUS", name: "Anywhere Real Estate Inc. Common Stock," },
-    { symbol: "HOV", name: "Hovnanian Enterprises, Inc. Class A Common Stock" },
-    { symbol: "HP", name: "Helmerich & Payne, Inc. Common Stock" },
-    { symbol: "HPE", name: "Hewlett Packard Enterprise Company Common Stock" },
-    { symbol: "HPE$C", name: "Hewlett Packard Enterprise Company 7.625% Series C Mandatory Convertible Preferred Stock" },
-    { symbol: "HPF", name: "John Hancock Pfd Income Fund II Pfd Income Fund II" },
-    { symbol: "HPI", name: "John Hancock Preferred Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "HPP", name: "Hudson Pacific Properties, Inc. Common Stock" },
-    { symbol: "HPP$C", name: "Hudson Pacific Properties, Inc. 4.750% Series C Cumulative Redeemable Preferred Stock" },
-    { symbol: "HPQ", name: "HP Inc. Common Stock" },
-    { symbol: "HPS", name: "John Hancock Preferred Income Fund III Preferred Income Fund III" },
-    { symbol: "HQH", name: "abrdn Healthcare Investors Shares of Beneficial Interest" },
-    { symbol: "HQL", name: "abrdn Life Sciences Investors Shares of Beneficial Interest" },
-    { symbol: "HR", name: "Healthcare Realty Trust Incorporated Common Stock" },
-    { symbol: "HRB", name: "H&R Block, Inc. Common Stock" },
-    { symbol: "HRI", name: "Herc Holdings Inc. Common Stock " },
-    { symbol: "HRL", name: "Hormel Foods Corporation Common Stock" },
-    { symbol: "HRTG", name: "Heritage Insurance Holdings, Inc. Common Stock" },
-    { symbol: "HSBC", name: "HSBC Holdings, plc. Common Stock" },
-    { symbol: "HSBH", name: "Precidian ETFs Trust HSBC Holdings plc ADRhedged" },
-    { symbol: "HSCZ", name: "iShares Currency Hedged MSCI EAFE Small-Cap ETF" },
-    { symbol: "HSHP", name: "Himalaya Shipping Ltd. Common Shares" },
-    { symbol: "HSMV", name: "First Trust Horizon Managed Volatility Small/Mid ETF" },
-    { symbol: "HSY", name: "The Hershey Company Common Stock" },
-    { symbol: "HTAB", name: "Hartford Schroders Tax-Aware Bond ETF" },
-    { symbol: "HTAX", name: "Macquarie ETF Trust Macquarie National High-Yield Municipal Bond ETF" },
-    { symbol: "HTB", name: "HomeTrust Bancshares, Inc. Common Stock" },
-    { symbol: "HTD", name: "John Hancock Tax Advantaged Dividend Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "HTEC", name: "Robo Global Healthcare Technology and Innovation ETF" },
-    { symbol: "HTFB", name: "Horizon Technology Finance Corporation 4.875% Notes due 2026" },
-    { symbol: "HTFC", name: "Horizon Technology Finance Corporation 6.25% Notes due 2027" },
-    { symbol: "HTGC", name: "Hercules Capital, Inc. Common Stock" },
-    { symbol: "HTH", name: "Hilltop Holdings Inc." },
-    { symbol: "HTRB", name: "Hartford Total Return Bond ETF" },
-    { symbol: "HTUS", name: "Capitol Series Trust Hull Tactical US ETF" },
-    { symbol: "HUBB", name: "Hubbell Inc Common Stock" },
-    { symbol: "HUBS", name: "HubSpot, Inc. Common Stock" },
-    { symbol: "HUM", name: "Humana Inc. Common Stock" },
-    { symbol: "HUMN", name: "Roundhill ETF Trust Roundhill Humanoid Robotics ETF" },
-    { symbol: "HUN", name: "Huntsman Corporation Common Stock" },
-    { symbol: "HUSA", name: "Houston American Energy Corporation Common Stock" },
-    { symbol: "HUSV", name: "First Trust Exchange-Traded Fund III First Trust Horizon Managed Volatility Domestic ETF" },
-    { symbol: "HUYA", name: "HUYA Inc. American depositary shares, each  representing one Class A ordinary share" },
-    { symbol: "HVAC", name: "AdvisorShares Trust AdvisorShares HVAC and Industrials ETF" },
-    { symbol: "HVT", name: "Haverty Furniture Companies, Inc. Common Stock" },
-    { symbol: "HVT.A", name: "Haverty Furniture Companies, Inc. Common Stock" },
-    { symbol: "HWM", name: "Howmet Aerospace Inc. Common Stock" },
-    { symbol: "HWM$", name: "Howmet Aerospace Inc. $3.75 Preferred Stock" },
-    { symbol: "HXL", name: "Hexcel Corporation Common Stock" },
-    { symbol: "HY", name: "Hyster-Yale, Inc. Class A common stock" },
-    { symbol: "HYAC", name: "Haymaker Acquisition Corp. 4 Class A Ordinary Shares" },
-    { symbol: "HYAC.U", name: "Haymaker Acquisition Corp. 4 Units, each consisting one Class A Ordinary Share and one-half of one redeemable Warrant" },
-    { symbol: "HYAC.W", name: "Haymaker Acquisition Corp. 4 Warrants, each whole warrant exercisable for one Class A ordinary share at an exercise price of $11.50 per share" },
-    { symbol: "HYBB", name: "iShares BB Rated Corporate Bond ETF" },
-    { symbol: "HYBL", name: "SPDR Series Trust SPDR Blackstone High Income ETF" },
-    { symbol: "HYBX", name: "TCW High Yield Bond ETF" },
-    { symbol: "HYD", name: "VanEck ETF Trust VanEck High Yield Muni ETF" },
-    { symbol: "HYDB", name: "iShares High Yield Systematic Bond ETF" },
-    { symbol: "HYDW", name: "Xtrackers Low Beta High Yield Bond ETF" },
-    { symbol: "HYEM", name: "VanEck Emerging Markets High Yield Bond ETF" },
-    { symbol: "HYFI", name: "AB Active ETFs, Inc. AB High Yield ETF" },
-    { symbol: "HYG", name: "iShares iBoxx $ High Yield Corporate Bond ETF" },
-    { symbol: "HYGH", name: "iShares Interest Rate Hedged High Yield Bond ETF" },
-    { symbol: "HYGV", name: "FlexShares High Yield Value-Scored Bond Index Fund" },
-    { symbol: "HYGW", name: "iShares Trust iShares High Yield Corporate Bond BuyWrite Strategy ETF" },
-    { symbol: "HYHG", name: "ProShares High Yield Interest Rate Hedged" },
-    { symbol: "HYI", name: "Western Asset High Yield Opportunity Fund Inc. Common Stock" },
-    { symbol: "HYIN", name: "WisdomTree Private Credit and Alternative Income Fund" },
-    { symbol: "HYKE", name: "ETF Series Solutions Vest 2 Year Interest Rate Hedge ETF" },
-    { symbol: "HYLB", name: "Xtrackers USD High Yield Corporate Bond ETF" },
-    { symbol: "HYLN", name: "Hyliion Holdings Corp. Class A Common Stock" },
-    { symbol: "HYMB", name: "SPDR Nuveen ICE High Yield Municipal Bond ETF" },
-    { symbol: "HYRM", name: "DBX ETF Trust Xtrackers Risk Managed USD High Yield Strategy ETF" },
-    { symbol: "HYS", name: "PIMCO 0-5 Year High Yield Corporat Bond Index Exchange-Traded Fund" },
-    { symbol: "HYSA", name: "BondBloxx ETF Trust BondBloxx USD High Yield Bond Sector Rotation ETF" },
-    { symbol: "HYSD", name: "Columbia ETF Trust I Columbia Short Duration High Yield ETF" },
-    { symbol: "HYT", name: "Blackrock Corporate High Yield Fund, Inc. Common Stock" },
-    { symbol: "HYTI", name: "First Trust Exchange-Traded Fund IV FT Vest High Yield & Target Income ETF" },
-    { symbol: "HYTR", name: "Counterpoint High Yield Trend ETF" },
-    { symbol: "HYUP", name: "Xtrackers High Beta High Yield Bond ETF" },
-    { symbol: "HYXU", name: "iShares International High Yield Bond ETF" },
-    { symbol: "HZO", name: "MarineMax, Inc.  (FL) Common Stock" },
-    { symbol: "IAE", name: "Voya Asia Pacific High Dividend Equity Income Fund ING Asia Pacific High Dividend Equity Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "IAF", name: "abrdn Australia Equity Fund, Inc. Common Stock" },
-    { symbol: "IAG", name: "Iamgold Corporation Ordinary Shares" },
-    { symbol: "IAGG", name: "iShares International Aggregate Bond Fund" },
-    { symbol: "IAI", name: "iShares U.S. Broker-Dealers & Securities Exchanges ETF" },
-    { symbol: "IAK", name: "iShares U.S. Insurance ETF" },
-    { symbol: "IAPR", name: "Innovator International Developed Power Buffer ETF  April" },
-    { symbol: "IAT", name: "iShares U.S. Regional Banks ETF" },
-    { symbol: "IAU", name: "iShares Gold Trust Shares of the iShares Gold Trust" },
-    { symbol: "IAUG", name: "Innovator ETFs Trust Innovator International Developed Power Buffer ETF  August" },
-    { symbol: "IAUI", name: "NEOS ETF Trust NEOS Gold High Income ETF" },
-    { symbol: "IAUM", name: "iShares Gold Trust Micro Shares" },
-    { symbol: "IAUX", name: "i-80 Gold Corp. Common Shares" },
-    { symbol: "IAUX.W", name: "i-80 Gold Corp. Warrants, each warrant exercisable for one Common Share at an exercise price of $0.70" },
-    { symbol: "IBCA", name: "iShares Trust iShares iBonds Dec 2035 Term Corporate ETF" },
-    { symbol: "IBD", name: "Inspire Corporate Bond ETF" },
-    { symbol: "IBDQ", name: "iShares iBonds Dec 2025 Term Corporate ETF" },
-    { symbol: "IBDR", name: "iShares iBonds Dec 2026 Term Corporate ETF" },
-    { symbol: "IBDS", name: "iShares iBonds Dec 2027 Term Corporate ETF" },
-    { symbol: "IBDT", name: "iShares iBonds Dec 2028 Term Corporate ETF" },
-    { symbol: "IBDU", name: "iShares iBonds Dec 2029 Term Corporate ETF" },
-    { symbol: "IBDV", name: "iShares iBonds Dec 2030 Term Corporate ETF" },
-    { symbol: "IBDW", name: "iShares iBonds Dec 2031 Term Corporate ETF" },
-    { symbol: "IBDX", name: "iShares Trust iShares iBonds Dec 2032 Term Corporate ETF" },
-    { symbol: "IBDY", name: "iShares Trust iShares iBonds Dec 2033 Term Corporate ETF" },
-    { symbol: "IBDZ", name: "iShares Trust iShares iBonds Dec 2034 Term Corporate ETF" },
-    { symbol: "IBHE", name: "iShares iBonds 2025 Term High Yield and Income ETF" },
-    { symbol: "IBHF", name: "iShares iBonds 2026 Term High Yield and Income ETF" },
-    { symbol: "IBHG", name: "iShares iBonds 2027 Term High Yield and Income ETF" },
-    { symbol: "IBHH", name: "iShares Trust iShares iBonds 2028 Term High Yield and Income ETF" },
-    { symbol: "IBHI", name: "iShares Trust iShares iBonds 2029 Term High Yield and Income ETF" },
-    { symbol: "IBHJ", name: "iShares Trust iShares iBonds 2030 Term High Yield and Income ETF" },
-    { symbol: "IBHK", name: "iShares Trust iShares iBonds 2031 Term High Yield and Income ETF" },
-    { symbol: "IBHL", name: "iShares Trust iShares iBonds 2032 Term High Yield and Income ETF" },
-    { symbol: "IBIB", name: "iShares Trust iShares iBonds Oct 2025 Term TIPS ETF" },
-    { symbol: "IBIC", name: "iShares Trust iShares iBonds Oct 2026 Term TIPS ETF" },
-    { symbol: "IBID", name: "iShares Trust iShares iBonds Oct 2027 Term TIPS ETF" },
-    { symbol: "IBIE", name: "iShares Trust iShares iBonds Oct 2028 Term TIPS ETF" },
-    { symbol: "IBIF", name: "iShares Trust iShares iBonds Oct 2029 Term TIPS ETF" },
-    { symbol: "IBIG", name: "iShares Trust iShares iBonds Oct 2030 Term TIPS ETF" },
-    { symbol: "IBIH", name: "iShares Trust iShares iBonds Oct 2031 Term TIPS ETF" },
-    { symbol: "IBII", name: "iShares Trust iShares iBonds Oct 2032 Term TIPS ETF" },
-    { symbol: "IBIJ", name: "iShares Trust iShares iBonds Oct 2033 Term TIPS ETF" },
-    { symbol: "IBIK", name: "iShares Trust iShares iBonds Oct 2034 Term TIPS ETF" },
-    { symbol: "IBIL", name: "iShares Trust iShares iBonds Oct 2035 Term TIPS ETF" },
-    { symbol: "IBLC", name: "iShares Trust iShares Blockchain and Tech ETF" },
-    { symbol: "IBM", name: "International Business Machines Corporation Common Stock" },
-    { symbol: "IBMN", name: "iShares iBonds Dec 2025 Term Muni Bond ETF" },
-    { symbol: "IBMO", name: "iShares iBonds Dec 2026 Term Muni Bond ETF" },
-    { symbol: "IBMP", name: "iShares iBonds Dec 2027 Term Muni Bond ETF" },
-    { symbol: "IBMQ", name: "iShares iBonds Dec 2028 Term Muni Bond ETF" },
-    { symbol: "IBMR", name: "iShares Trust iShares iBonds Dec 2029 Term Muni Bond ETF" },
-    { symbol: "IBMS", name: "iShares Trust iShares iBonds Dec 2030 Term Muni Bond ETF" },
-    { symbol: "IBMT", name: "iShares Trust iShares iBonds Dec 2031 Term Muni Bond ETF" },
-    { symbol: "IBN", name: "ICICI Bank Limited Common Stock" },
-    { symbol: "IBND", name: "SPDR Bloomberg International Corporate Bond ETF" },
-    { symbol: "IBO", name: "Impact BioMedical, Inc. Common Stock" },
-    { symbol: "IBP", name: "Installed Building Products, Inc. Common Stock" },
-    { symbol: "IBRN", name: "iShares Trust iShares Neuroscience and Healthcare ETF" },
-    { symbol: "IBTA", name: "Ibotta, Inc. Class A Common Stock" },
-    { symbol: "IBUF", name: "SHL Telemedicine Ltd Innovator International Developed 10 Buffer ETF - Quarterly" },
-    { symbol: "IBUY", name: "Amplify ETF Trust Amplify Online Retail ETF" },
-    { symbol: "ICAP", name: "Infrastructure Capital Equity Income ETF" },
-    { symbol: "ICE", name: "Intercontinental Exchange Inc. Common Stock" },
-    { symbol: "ICF", name: "iShares Select U.S. REIT ETF" },
-    { symbol: "ICL", name: "ICL Group Ltd. Ordinary Shares" },
-    { symbol: "ICLO", name: "Invesco Actively Managed Exchange-Traded Fund Trus Invesco AAA CLO Floating Rate Note ETF" },
-    { symbol: "ICOI", name: "Bitwise Funds Trust Bitwise COIN Option Income Strategy ETF" },
-    { symbol: "ICOW", name: "Pacer Developed Markets International Cash Cows 100 ETF" },
-    { symbol: "ICR$A", name: "InPoint Commercial Real Estate Income, Inc. 6.75% Series A Cumulative Redeemable Preferred Stock" },
-    { symbol: "ICSH", name: "iShares Ultra Short Duration Bond Active ETF" },
-    { symbol: "ICVT", name: "iShares Convertible Bond ETF" },
-    { symbol: "IDA", name: "IDACORP, Inc. Common Stock" },
-    { symbol: "IDE", name: "Voya Infrastructure, Industrials and Materials Fund Common Shares of Beneficial Interest" },
-    { symbol: "IDEC", name: "Innovator ETFs Trust Innovator International Developed Power Buffer ETF  December" },
-    { symbol: "IDEQ", name: "Lazard Active ETF Trust Lazard International Dynamic Equity ETF" },
-    { symbol: "IDEV", name: "iShares Core MSCI International Developed Markets ETF" },
-    { symbol: "IDGT", name: "iShares U.S. Digital Infrastructure and Real Estate ETF" },
-    { symbol: "IDHQ", name: "Invesco S&P International Developed Quality ETF" },
-    { symbol: "IDLV", name: "Invesco S&P International Developed Low Volatility ETF" },
-    { symbol: "IDMO", name: "Invesco S&P International Developed Momentum ETF" },
-    { symbol: "IDNA", name: "iShares Genomics Immunology and Healthcare ETF" },
-    { symbol: "IDOG", name: "ALPS International Sector Dividend Dogs ETF" },
-    { symbol: "IDR", name: "Idaho Strategic Resources, Inc. Common Stock" },
-    { symbol: "IDRV", name: "iShares Self-Driving EV and Tech ETF" },
-    { symbol: "IDT", name: "IDT Corporation Class B Common Stock" },
-    { symbol: "IDU", name: "iShares U.S. Utilities ETF" },
-    { symbol: "IDUB", name: "Aptus International Enhanced Yield ETF" },
-    { symbol: "IDV", name: "iShares International Select Dividend ETF" },
-    { symbol: "IDVO", name: "Amplify CWP International Enhanced Dividend Income ETF" },
-    { symbol: "IDVZ", name: "Elevation Series Trust The Opal International Dividend Income ETF" },
-    { symbol: "IDX", name: "VanEck Indonesia Index ETF" },
-    { symbol: "IDYN", name: "BlackRock ETF Trust iShares International Equity Factor Rotation Active ETF" },
-    { symbol: "IE", name: "Ivanhoe Electric Inc. Common Stock" },
-    { symbol: "IEDI", name: "iShares U.S. Consumer Focused ETF" },
-    { symbol: "IEFA", name: "iShares Core MSCI EAFE ETF" },
-    { symbol: "IEMG", name: "iShares Core MSCI Emerging Markets ETF" },
-    { symbol: "IEO", name: "iShares U.S. Oil & Gas Exploration & Production ETF" },
-    { symbol: "IETC", name: "iShares U.S. Tech Independence Focused ETF" },
-    { symbol: "IEUR", name: "iShares Core MSCI Europe ETF" },
-    { symbol: "IEV", name: "iShares Europe ETF" },
-    { symbol: "IEX", name: "IDEX Corporation Common Stock" },
-    { symbol: "IEZ", name: "iShares U.S. Oil Equipment & Services ETF" },
-    { symbol: "IFEB", name: "Innovator ETFs Trust Innovator International Developed Power Buffer ETF  February" },
-    { symbol: "IFED", name: "ETRACS IFED Invest with the Fed TR Index ETN" },
-    { symbol: "IFF", name: "International Flavors & Fragrances, Inc. Common Stock" },
-    { symbol: "IFN", name: "India Fund, Inc. (The) Common Stock" },
-    { symbol: "IFRA", name: "iShares U.S. Infrastructure ETF" },
-    { symbol: "IFS", name: "Intercorp Financial Services Inc. Common Shares" },
-    { symbol: "IG", name: "Principal Investment Grade Corporate Active ETF" },
-    { symbol: "IGA", name: "Voya Global Advantage and Premium Opportunity Fund Common Shares of Beneficial Interest" },
-    { symbol: "IGBH", name: "iShares Interest Rate Hedged Long-Term Corporate Bond ETF" },
-    { symbol: "IGC", name: "IGC Pharma, Inc. Common Stock" },
-    { symbol: "IGCB", name: "TCW Corporate Bond ETF" },
-    { symbol: "IGD", name: "Voya Global Equity Dividend and Premium Opportunity Fund" },
-    { symbol: "IGE", name: "iShares North American Natural Resources ETF" },
-    { symbol: "IGEB", name: "iShares Investment Grade Systematic Bond ETF" },
-    { symbol: "IGHG", name: "ProShares Investment Grade-Interest Rate Hedged" },
-    { symbol: "IGI", name: "Western Asset Investment Grade Opportunity Trust Inc. Common Stock" },
-    { symbol: "IGLB", name: "iShares 10  Year Investment Grade Corporate Bond ETF" },
-    { symbol: "IGLD", name: "FT Vest Gold Strategy Target Income ETF" },
-    { symbol: "IGM", name: "iShares Expanded Tech Sector ETF" },
-    { symbol: "IGME", name: "Bitwise Funds Trust Bitwise GME Option Income Strategy ETF" },
-    { symbol: "IGPT", name: "Invesco AI and Next Gen Software ETF" },
-    { symbol: "IGR", name: "CBRE Global Real Estate Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "IGRO", name: "iShares International Dividend Growth ETF" },
-    { symbol: "IGTR", name: "Innovator ETFs Trust Innovator Gradient Tactical Rotation Strategy ETF" },
-    { symbol: "IGV", name: "iShares Expanded Tech-Software Sector ETF" },
-    { symbol: "IGZ", name: "IGZ (Listing Market NYSE Arca Network B F) Common Stock" },
-    { symbol: "IH", name: "iHuman Inc. American depositary shares, each representing five Class A ordinary shares" },
-    { symbol: "IHAK", name: "iShares Cybersecurity and Tech ETF" },
-    { symbol: "IHD", name: "Voya Emerging Markets High Income Dividend Equity Fund Common Shares" },
-    { symbol: "IHDG", name: "WisdomTree International Hedged Quality Dividend Growth Fund" },
-    { symbol: "IHE", name: "iShares U.S. Pharmaceutical ETF" },
-    { symbol: "IHF", name: "iShares U.S. Health Care Providers ETF" },
-    { symbol: "IHG", name: "Intercontinental Hotels Group American Depositary Shares (Each representing one Ordinary Share)" },
-    { symbol: "IHI", name: "iShares U.S. Medical Devices ETF" },
-    { symbol: "IHS", name: "IHS Holding Limited Ordinary Shares" },
-    { symbol: "IHT", name: "InnSuites Hospitality Trust Shares of Beneficial Interest" },
-    { symbol: "IHY", name: "VanEck International High Yield Bond ETF" },
-    { symbol: "IIF", name: "Morgan Stanley India Investment Fund, Inc. Common Stock" },
-    { symbol: "IIGD", name: "Invesco Investment Grade Defensive ETF" },
-    { symbol: "IIIN", name: "Insteel Industries, Inc. Common Stock" },
-    { symbol: "IIM", name: "Invesco Value Municipal Income Trust Common Stock" },
-    { symbol: "IIPR", name: "Innovative Industrial Properties, Inc. Common Stock" },
-    { symbol: "IIPR$A", name: "Innovative Industrial Properties, Inc. 9.00% Series A Cumulative Redeemable Preferred Stock" },
-    { symbol: "IJAN", name: "Innovator International Developed Power Buffer ETF January" },
-    { symbol: "IJH", name: "iShares Core S&P Mid-Cap ETF" },
-    { symbol: "IJJ", name: "iShares S&P Mid-Cap 400 Value ETF" },
-    { symbol: "IJK", name: "iShares S&P Mid-Cap 400 Growth ETF" },
-    { symbol: "IJR", name: "iShares Core S&P Small-Cap ETF" },
-    { symbol: "IJS", name: "iShares S&P SmallCap 600 Value ETF" },
-    { symbol: "IJUL", name: "Innovator International Developed Power Buffer ETF  July" },
-    { symbol: "IJUN", name: "SHL Telemedicine Ltd Innovator International Developed Power Buffer ETF  June" },
-    { symbol: "ILCB", name: "iShares Morningstar Large-Cap ETF" },
-    { symbol: "ILCG", name: "iShares Morningstar Large-Cap Growth ETF" },
-    { symbol: "ILCV", name: "iShares Morningstar Large-Cap  Value ETF" },
-    { symbol: "ILDR", name: "First Trust Innovation Leaders ETF" },
-    { symbol: "ILF", name: "iShares Latin America 40 ETF" },
-    { symbol: "ILOW", name: "AB Active ETFs, Inc. AB International Low Volatility Equity ETF" },
-    { symbol: "ILS", name: "ETF Opportunities Trust Brookmont Catastrophic Bond ETF" },
-    { symbol: "ILTB", name: "iShares Core 10  Year USD Bond ETF" },
-    { symbol: "IMAR", name: "Innovator ETFs Trust Innovator International Developed Power Buffer ETF  March" },
-    { symbol: "IMAX", name: "Imax Corporation Common Stock" },
-    { symbol: "IMAY", name: "SHL Telemedicine Ltd Innovator International Developed Power Buffer ETF - May" },
-    { symbol: "IMCB", name: "iShares Morningstar Mid-Cap ETF" },
-    { symbol: "IMCG", name: "iShares Morningstar Mid-Cap Growth ETF" },
-    { symbol: "IMF", name: "Invesco Managed Futures Strategy ETF" },
-    { symbol: "IMFL", name: "Invesco International Developed Dynamic Multifactor ETF" },
-    { symbol: "IMO", name: "Imperial Oil Limited Common Stock" },
-    { symbol: "IMRA", name: "Bitwise Funds Trust Bitwise MARA Option Income Strategy ETF" },
-    { symbol: "IMST", name: "Bitwise Funds Trust Bitwise MSTR Option Income Strategy ETF" },
-    { symbol: "IMTB", name: "iShares Core 5-10 Year USD Bond ETF" },
-    { symbol: "IMTM", name: "iShares MSCI Intl Momentum Factor ETF" },
-    { symbol: "INCE", name: "Franklin Income Equity Focus ETF" },
-    { symbol: "INCM", name: "Franklin Templeton ETF Trust Franklin Income Focus ETF" },
-    { symbol: "INCO", name: "Columbia India Consumer ETF" },
-    { symbol: "INDA", name: "Ishares MSCI India ETF" },
-    { symbol: "INDE", name: "Matthews International Funds Matthews India Active ETF" },
-    { symbol: "INDL", name: "Direxion Daily MSCI India Bull 2X Shares" },
-    { symbol: "INDO", name: "Indonesia Energy Corporation Limited Ordinary Shares" },
-    { symbol: "INDS", name: "Pacer Industrial Real Estate ETF" },
-    { symbol: "INEQ", name: "Columbia International Equity Income ETF" },
-    { symbol: "INFA", name: "Informatica Inc. Class A Common Stock" },
-    { symbol: "INFL", name: "Horizon Kinetics Inflation Beneficiaries ETF" },
-    { symbol: "INFO", name: "Harbor ETF Trust Harbor PanAgora Dynamic Large Cap Core ETF" },
-    { symbol: "INFU", name: "InfuSystems Holdings, Inc. Common Stock" },
-    { symbol: "INFY", name: "Infosys Limited American Depositary Shares" },
-    { symbol: "ING", name: "ING Group, N.V. Common Stock" },
-    { symbol: "INGM", name: "Ingram Micro Holding Corporation Common Stock" },
-    { symbol: "INGR", name: "Ingredion Incorporated Common Stock" },
-    { symbol: "INKM", name: "SPDR SSgA Income Allocation ETF" },
-    { symbol: "INLX", name: "Intellinetics, Inc. Common Stock" },
-    { symbol: "INMU", name: "iShares Intermediate Muni Income Active ETF" },
-    { symbol: "INN", name: "Summit Hotel Properties, Inc. Common Stock" },
-    { symbol: "INN$E", name: "Summit Hotel Properties, Inc. 6.250% Series E Cumulative Redeemable Preferred Stock" },
-    { symbol: "INN$F", name: "Summit Hotel Properties, Inc. 5.875% Series F Cumulative Redeemable Preferred Stock, $0.01 par value per share" },
-    { symbol: "INOV", name: "Innovator ETFs Trust Innovator International Developed Power Buffer ETF  November" },
-    { symbol: "INQQ", name: "INQQ The India Internet ETF" },
-    { symbol: "INR", name: "Infinity Natural Resources, Inc. Class A Common Stock" },
-    { symbol: "INSP", name: "Inspire Medical Systems, Inc. Common Stock" },
-    { symbol: "INSW", name: "International Seaways, Inc. Common Stock " },
-    { symbol: "INTF", name: "iShares International Equity Factor ETF" },
-    { symbol: "INTL", name: "Northern Lights Fund Trust IV Main International ETF" },
-    { symbol: "INTM", name: "Invesco Intermediate Municipal ETF" },
-    { symbol: "INTT", name: "inTest Corporation Common Stock" },
-    { symbol: "INUV", name: "Inuvo, Inc." },
-    { symbol: "INVG", name: "The 2023 ETF Series Trust II GMO Systematic Investment Grade Credit ETF" },
-    { symbol: "INVH", name: "Invitation Homes Inc. Common Stock" },
-    { symbol: "INVN", name: "The Alger ETF Trust Alger Russell Innovation ETF" },
-    { symbol: "INVX", name: "Innovex International, Inc. Common Stock" },
-    { symbol: "IOCT", name: "Innovator International Developed Power Buffer ETF - October" },
-    { symbol: "ION", name: "ProShares Trust ProShares S&P Global Core Battery Metals ETF" },
-    { symbol: "IONQ", name: "IonQ, Inc. Common Stock" },
-    { symbol: "IONQ.W", name: "IonQ, Inc. Redeemable warrants, each whole warrant exercisable for one share of Common Stock, each at an exercise price of $11.50 per share" },
-    { symbol: "IOO", name: "iShares Global 100 ETF" },
-    { symbol: "IOPP", name: "Simplify Exchange Traded Funds Simplify Tara India Opportunities ETF" },
-    { symbol: "IOR", name: "Income Opportunity Realty Investors, Inc. Common Stock" },
-    { symbol: "IOT", name: "Samsara Inc. Class A Common Stock" },
-    { symbol: "IP", name: "International Paper Company Common Stock" },
-    { symbol: "IPAC", name: "iShares Core MSCI Pacific ETF" },
-    { symbol: "IPAV", name: "Global X Funds Global X Infrastructure Development ex-U.S. ETF" },
-    { symbol: "IPAY", name: "Amplify Digital Payments ETF" },
-    { symbol: "IPB", name: "Merrill Lynch & Co., Inc. 6.0518% Index Plus Trust Certificates Series 2003-1" },
-    { symbol: "IPG", name: "Interpublic Group of Companies, Inc. (The) Common Stock" },
-    { symbol: "IPI", name: "Intrepid Potash, Inc Common Stock" },
-    { symbol: "IPO", name: "Renaissance IPO ETF" },
-    { symbol: "IPOS", name: "Renaissance Capital Greenwich Fund" },
-    { symbol: "IQDF", name: "FlexShares International Quality Dividend Index Fund" },
-    { symbol: "IQDG", name: "WisdomTree International Quality Dividend Growth Fund" },
-    { symbol: "IQDY", name: "FlexShares International Quality Dividend Dynamic Index Fund" },
-    { symbol: "IQHI", name: "NYLI MacKay High Income ETF" },
-    { symbol: "IQI", name: "Invesco Quality Municipal Income Trust Common Stock" },
-    { symbol: "IQLT", name: "iShares MSCI Intl Quality Factor ETF" },
-    { symbol: "IQM", name: "Franklin Intelligent Machines ETF" },
-    { symbol: "IQRA", name: "NYLI CBRE Real Assets ETF" },
-    { symbol: "IQSI", name: "NYLI Candriam International Equity ETF" },
-    { symbol: "IQSM", name: "NYLI Candriam U.S. Mid Cap Equity ETF" },
-    { symbol: "IQSU", name: "NYLI Candriam U.S. Large Cap Equity ETF" },
-    { symbol: "IQSZ", name: "Invesco Global Equity Net Zero ETF" },
-    { symbol: "IQV", name: "IQVIA Holdings, Inc. Common Stock" },
-    { symbol: "IR", name: "Ingersoll Rand Inc. Common Stock" },
-    { symbol: "IRET", name: "Tidal Trust II iREIT - MarketVector Quality REIT Index ETF" },
-    { symbol: "IRM", name: "Iron Mountain Incorporated (Delaware)Common Stock REIT" },
-    { symbol: "IROC", name: "Invesco Rochester High Yield Municipal ETF" },
-    { symbol: "IRS", name: "IRSA Inversiones Y Representaciones S.A. Global Depositary Shares (Each representing ten shares of Common Stock)" },
-    { symbol: "IRS.W", name: "IRSA Inversiones Y Representaciones S.A. Warrants to purchase Common Shares" },
-    { symbol: "IRT", name: "Independence Realty Trust, Inc. Common Stock" },
-    { symbol: "IRTR", name: "iShares Trust iShares LifePath Retirement ETF" },
-    { symbol: "IRVH", name: "Global X Funds Global X Interest Rate Volatility & Inflation Hedge ETF" },
-    { symbol: "ISCB", name: "iShares Morningstar Small-Cap ETF" },
-    { symbol: "ISCF", name: "iShares International Small-Cap Equity Factor ETF" },
-    { symbol: "ISCG", name: "iShares Morningstar Small-Cap Growth ETF" },
-    { symbol: "ISCV", name: "iShares Morningstar Small-Cap Value ETF" },
-    { symbol: "ISD", name: "PGIM High Yield Bond Fund, Inc." },
-    { symbol: "ISEP", name: "Innovator ETFs Trust Innovator International Developed Power Buffer ETF  September" },
-    { symbol: "ISMD", name: "Inspire Small/Mid Cap ETF" },
-    { symbol: "ISMF", name: "BlackRock ETF Trust iShares Managed Futures Active ETF" },
-    { symbol: "ISOU", name: "IsoEnergy Ltd. Common Shares" },
-    { symbol: "ISPY", name: "ProShares Trust ProShares S&P 500 High Income ETF" },
-    { symbol: "ISRA", name: "VanEck Israel ETF" },
-    { symbol: "ISVL", name: "iShares Trust iShares International Developed Small Cap Value Factor ETF" },
-    { symbol: "ISWN", name: "Amplify BlackSwan ISWN ETF" },
-    { symbol: "IT", name: "Gartner, Inc. Common Stock" },
-    { symbol: "ITA", name: "iShares U.S. Aerospace & Defense ETF" },
-    { symbol: "ITAN", name: "Sparkline Intangible Value ETF" },
-    { symbol: "ITB", name: "iShares U.S. Home Construction ETF" },
-    { symbol: "ITDB", name: "iShares Trust iShares LifePath Target Date 2030 ETF" },
-    { symbol: "ITDC", name: "iShares Trust iShares LifePath Target Date 2035 ETF" },
-    { symbol: "ITDD", name: "iShares Trust iShares LifePath Target Date 2040 ETF" },
-    { symbol: "ITDE", name: "iShares Trust iShares LifePath Target Date 2045 ETF" },
-    { symbol: "ITDF", name: "iShares Trust iShares LifePath Target Date 2050 ETF" },
-    { symbol: "ITDG", name: "iShares Trust iShares LifePath Target Date 2055 ETF" },
-    { symbol: "ITDH", name: "iShares Trust iShares LifePath Target Date 2060 ETF" },
-    { symbol: "ITDI", name: "iShares Trust iShares LifePath Target Date 2065 ETF" },
-    { symbol: "ITDJ", name: "iShares Trust iShares LifePath Target Date 2070 ETF" },
-    { symbol: "ITEQ", name: "Amplify ETF Trust Amplify BlueStar Israel Technology ETF" },
-    { symbol: "ITGR", name: "Integer Holdings Corporation Common Stock" },
-    { symbol: "ITM", name: "VanEck ETF Trust VanEck Intermediate Muni ETF" },
-    { symbol: "ITOT", name: "iShares Core S&P Total U.S. Stock Market ETF" },
-    { symbol: "ITP", name: "IT Tech Packaging, Inc. Common Stock" },
-    { symbol: "ITRG", name: "Integra Resources Corp. Common Shares" },
-    { symbol: "ITT", name: "ITT Inc. Common Stock " },
-    { symbol: "ITUB", name: "Itau Unibanco Banco Holding SA American Depositary Shares (Each repstg 500 Preferred shares)" },
-    { symbol: "ITW", name: "Illinois Tool Works Inc. Common Stock" },
-    { symbol: "ITWO", name: "ProShares Trust ProShares Russell 2000 High Income ETF" },
-    { symbol: "IVE", name: "iShares S&P 500 Value ETF" },
-    { symbol: "IVES", name: "Wedbush Series Trust Dan IVES Wedbush AI Revolution ETF" },
-    { symbol: "IVLU", name: "iShares MSCI Intl Value Factor ETF" },
-    { symbol: "IVOG", name: "Vanguard S&P Mid-Cap 400 Growth ETF" },
-    { symbol: "IVOL", name: "Quadratic Interest Rate Volatility and Inflation Hedge ETF" },
-    { symbol: "IVOO", name: "Vanguard S&P Mid-Cap 400 ETF" },
-    { symbol: "IVOV", name: "Vanguard S&P Mid-Cap 400 Value ETF" },
-    { symbol: "IVR", name: "INVESCO MORTGAGE CAPITAL INC Common Stock" },
-    { symbol: "IVR$C", name: "INVESCO MORTGAGE CAPITAL INC 7.5% Fixed-to-Floating Series C Cumulative Redeemable Preferred Stock, Liquation Preference $25.00 per Share" },
-    { symbol: "IVRA", name: "Invesco Real Assets ESG ETF" },
-    { symbol: "IVRS", name: "iShares Trust iShares Future Metaverse Tech and Communications ETF" },
-    { symbol: "IVT", name: "InvenTrust Properties Corp. Common Stock" },
-    { symbol: "IVV", name: "iShares Core S&P 500 ETF" },
-    { symbol: "IVVB", name: "BlackRock ETF Trust II iShares Large Cap Deep Buffer ETF" },
-    { symbol: "IVVM", name: "BlackRock ETF Trust II iShares Large Cap Moderate Buffer ETF" },
-    { symbol: "IVVW", name: "iShares Trust iShares S&P 500 BuyWrite ETF" },
-    { symbol: "IVW", name: "iShares S&P 500 Growth ETF" },
-    { symbol: "IVZ", name: "Invesco Ltd Common Stock" },
-    { symbol: "IWB", name: "iShares Russell 1000 ETF" },
-    { symbol: "IWC", name: "iShares Microcap ETF" },
-    { symbol: "IWD", name: "iShares Russell 1000 Value ETF" },
-    { symbol: "IWDL", name: "ETRACS 2x Leveraged US Value Factor TR ETN" },
-    { symbol: "IWF", name: "iShares Russell 1000 Growth ETF" },
-    { symbol: "IWFG", name: "NYLI Winslow Focused Large Cap Growth ETF" },
-    { symbol: "IWFL", name: "ETRACS 2x Leveraged US Growth Factor TR ETN" },
-    { symbol: "IWL", name: "iShares Russell Top 200 ETF" },
-    { symbol: "IWLG", name: "NYLI Winslow Large Cap Growth ETF" },
-    { symbol: "IWM", name: "iShares Russell 2000 ETF" },
-    { symbol: "IWMI", name: "NEOS ETF Trust NEOS Russell 2000 High Income ETF" },
-    { symbol: "IWML", name: "ETRACS 2x Leveraged US Size Factor TR ETN" },
-    { symbol: "IWMW", name: "iShares Trust iShares Russell 2000 BuyWrite ETF" },
-    { symbol: "IWMY", name: "Defiance R2000 Enhanced Options & 0DTE Income ETF" },
-    { symbol: "IWN", name: "iShares Russell 2000 Value ETF" },
-    { symbol: "IWO", name: "iShares Russell 2000 Growth ETF" },
-    { symbol: "IWP", name: "iShares Russell Midcap Growth ETF" },
-    { symbol: "IWR", name: "iShares Russell Mid-Cap ETF" },
-    { symbol: "IWS", name: "iShares Russell Mid-cap Value ETF" },
-    { symbol: "IWV", name: "iShares Russell 3000 ETF" },
-    { symbol: "IWX", name: "iShares Russell Top 200 Value ETF" },
-    { symbol: "IWY", name: "iShares Russell Top 200 Growth ETF" },
-    { symbol: "IX", name: "ORIX Corporation American Depositary Shares" },
-    { symbol: "IXC", name: "iShares Global Energy ETF" },
-    { symbol: "IXG", name: "iShares Global Financial ETF" },
-    { symbol: "IXJ", name: "iShares Global Healthcare ETF" },
-    { symbol: "IXN", name: "iShares Global Tech ETF" },
-    { symbol: "IXP", name: "iShares Global Comm Services ETF" },
-    { symbol: "IYC", name: "iShares U.S. Consumer Discretionary ETF" },
-    { symbol: "IYE", name: "iShares U.S. Energy ETF" },
-    { symbol: "IYF", name: "iShares U.S. Financial ETF" },
-    { symbol: "IYG", name: "iShares U.S. Financial Services ETF" },
-    { symbol: "IYH", name: "iShares U.S. Healthcare ETF" },
-    { symbol: "IYJ", name: "iShares U.S. Industrials ETF" },
-    { symbol: "IYK", name: "iShares U.S. Consumer Staples ETF" },
-    { symbol: "IYLD", name: "iShares Morningstar Multi-Asset Income ETF" },
-    { symbol: "IYM", name: "iShares U.S. Basic Materials ETF" },
-    { symbol: "IYR", name: "iShares U.S. Real Estate ETF" },
-    { symbol: "IYRI", name: "NEOS ETF Trust NEOS Real Estate High Income ETF" },
-    { symbol: "IYT", name: "iShares Trust iShares U.S. Transportation ETF" },
-    { symbol: "IYW", name: "iShares U.S. Technology ETF" },
-    { symbol: "IYY", name: "iShares Dow Jones U.S. ETF" },
-    { symbol: "IYZ", name: "iShares U.S. Telecommunications ETF" },
-    { symbol: "IZRL", name: "ARK Israel Innovative Technology ETF" },
-    { symbol: "J", name: "Jacobs Solutions Inc. Common Stock" },
-    { symbol: "JAAA", name: "Janus Henderson AAA CLO ETF" },
-    { symbol: "JABS", name: "Janus Detroit Street Trust Janus Henderson Asset-Backed Securities ETF" },
-    { symbol: "JACS", name: "Jackson Acquisition Company II Class A Ordinary Shares" },
-    { symbol: "JACS.R", name: "Jackson Acquisition Company II Rights, each right to acquire one-tenth (1/10) of one Class A ordinary share" },
-    { symbol: "JACS.U", name: "Jackson Acquisition Company II Units, each consisting of one Class A ordinary share and one right to acquire one-tenth (1/10) of one Class A ordinary share" },
-    { symbol: "JADE", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan Active Developing Markets Equity ETF" },
-    { symbol: "JAJL", name: "SHL Telemedicine Ltd Innovator Equity Defined Protection ETF - 6mo Jan/Jul" },
-    { symbol: "JANH", name: "Innovator ETFs Trust Innovator Premium Income 20 Barrier ETF - January" },
-    { symbol: "JANJ", name: "Innovator ETFs Trust Innovator Premium Income 30 Barrier ETF - January" },
-    { symbol: "JANM", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Max Buffer ETF - January" },
-    { symbol: "JANP", name: "PGIM S&P 500 Buffer 12 ETF - January" },
-    { symbol: "JANT", name: "AllianzIM U.S. Large Cap Buffer10 Jan ETF" },
-    { symbol: "JANU", name: "AIM ETF Products Trust AllianzIM U.S. Equity Buffer15 Uncapped Jan ETF" },
-    { symbol: "JANW", name: "AllianzIM U.S. Large Cap Buffer20 Jan ETF" },
-    { symbol: "JANZ", name: "TrueShares Structured Outcome (January) ETF" },
-    { symbol: "JAVA", name: "JPMorgan Active Value ETF" },
-    { symbol: "JBBB", name: "Janus Detroit Street Trust Janus Henderson B-BBB CLO ETF" },
-    { symbol: "JBGS", name: "JBG SMITH Properties Common Shares " },
-    { symbol: "JBI", name: "Janus International Group, Inc. Common Stock" },
-    { symbol: "JBK", name: "Lehman ABS 3.50 3.50% Adjustable Corp Backed Tr Certs GS Cap I" },
-    { symbol: "JBL", name: "Jabil Inc. Common Stock" },
-    { symbol: "JBND", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan Active Bond ETF" },
-    { symbol: "JBS", name: "JBS N.V. Class A Common Shares" },
-    { symbol: "JBTM", name: "JBT Marel Corporation Common Stock" },
-    { symbol: "JCE", name: "Nuveen Core Equity Alpha Fund Common Shares of Beneficial Interest" },
-    { symbol: "JCHI", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan Active China ETF" },
-    { symbol: "JCI", name: "Johnson Controls International plc Ordinary Share" },
-    { symbol: "JCPB", name: "JPMorgan Core Plus Bond ETF" },
-    { symbol: "JCPI", name: "J P MORGAN EXCHANGE-TRADED FD TR JPMorgan Inflation Managed Bond ETF" },
-    { symbol: "JCTR", name: "JPMorgan Carbon Transition U.S. Equity ETF" },
-    { symbol: "JDIV", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan Dividend Leaders ETF" },
-    { symbol: "JDST", name: "Direxion Daily Junior Gold Miners Index Bear 2X Shares" },
-    { symbol: "JDVI", name: "John Hancock Exchange-Traded Fund Trust John Hancock Disciplined Value International Select ETF" },
-    { symbol: "JDVL", name: "John Hancock Exchange-Traded Fund Trust John Hancock Disciplined Value Select ETF" },
-    { symbol: "JEF", name: "Jefferies Financial Group Inc. Common Stock" },
-    { symbol: "JELD", name: "JELD-WEN Holding, Inc. Common Stock" },
-    { symbol: "JEMA", name: "JPMorgan ActiveBuilders Emerging Markets Equity ETF" },
-    { symbol: "JEMB", name: "Janus Detroit Street Trust Janus Henderson Emerging Markets Debt Hard Currency ETF" },
-    { symbol: "JENA", name: "Jena Acquisition Corporation II Class A Ordinary Shares" },
-    { symbol: "JENA.R", name: "Jena Acquisition Corporation II Rights, each right to acquire one-twentieth (1/20) of one Class A ordinary share" },
-    { symbol: "JENA.U", name: "Jena Acquisition Corporation II Units, each consisting of one Class A ordinary share and one right" },
-    { symbol: "JEPI", name: "JPMorgan Equity Premium Income ETF" },
-    { symbol: "JEQ", name: "abrdn Japan Equity Fund, Inc. Common Stock" },
-    { symbol: "JETD", name: "Bank Of Montreal MAX Airlines -3X Inverse Leveraged ETNs" },
-    { symbol: "JETS", name: "U.S. Global Jets ETF" },
-    { symbol: "JETU", name: "Bank Of Montreal MAX Airlines 3X Leveraged ETNs" },
-    { symbol: "JFLI", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan Flexible Income ETF" },
-    { symbol: "JFR", name: "Nuveen Floating Rate Income Fund Common Stock" },
-    { symbol: "JGH", name: "Nuveen Global High Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "JGRO", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan Active Growth ETF" },
-    { symbol: "JGRW", name: "Trust for Professional Managers Jensen Quality Growth ETF" },
-    { symbol: "JHAC", name: "John Hancock Exchange-Traded Fund Trust John Hancock Fundamental All Cap Core ETF" },
-    { symbol: "JHCB", name: "John Hancock Corporate Bond ETF" },
-    { symbol: "JHCP", name: "John Hancock Exchange-Traded Fund Trust John Hancock Core Plus Bond ETF" },
-    { symbol: "JHCR", name: "John Hancock Exchange-Traded Fund Trust John Hancock Core Bond ETF" },
-    { symbol: "JHDV", name: "John Hancock Exchange-Traded Fund Trust John Hancock U.S. High Dividend ETF" },
-    { symbol: "JHEM", name: "John Hancock Multifactor Emerging Markets ETF" },
-    { symbol: "JHG", name: "Janus Henderson Group plc Ordinary Shares" },
-    { symbol: "JHHY", name: "John Hancock Exchange-Traded Fund Trust John Hancock High Yield ETF" },
-    { symbol: "JHI", name: "John Hancock Investors Trust Common Stock" },
-    { symbol: "JHID", name: "John Hancock Exchange-Traded Fund Trust John Hancock International High Dividend ETF" },
-    { symbol: "JHLN", name: "John Hancock Exchange-Traded Fund Trust John Hancock Global Senior Loan ETF" },
-    { symbol: "JHMB", name: "John Hancock Mortgage-Backed Securities ETF" },
-    { symbol: "JHMD", name: "John Hancock Exchange-Traded Fund Trust John Hancock Multifactor Developed International ETF" },
-    { symbol: "JHML", name: "John Hancock Multifactor Large Cap ETF" },
-    { symbol: "JHMM", name: "John Hancock Multifactor Mid Cap ETF" },
-    { symbol: "JHMU", name: "John Hancock Exchange-Traded Fund Trust John Hancock Dynamic Municipal Bond ETF" },
-    { symbol: "JHPI", name: "John Hancock Exchange-Traded Fund Trust John Hancock Preferred Income ETF" },
-    { symbol: "JHS", name: "John Hancock Income Securities Trust Common Stock" },
-    { symbol: "JHSC", name: "John Hancock Multifactor Small Cap ETF" },
-    { symbol: "JHX", name: "James Hardie Industries plc. Ordinary Shares" },
-    { symbol: "JIG", name: "JPMorgan International Growth ETF" },
-    { symbol: "JIII", name: "Janus Detroit Street Trust Janus Henderson Income ETF" },
-    { symbol: "JILL", name: "J. Jill, Inc. Common Stock" },
-    { symbol: "JIRE", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan International Research Enhanced Equity ETF" },
-    { symbol: "JKS", name: "JinkoSolar Holding Company Limited American Depositary Shares (each representing 4 Common Shares)" },
-    { symbol: "JLL", name: "Jones Lang LaSalle Incorporated Common Stock" },
-    { symbol: "JLQD", name: "Janus Henderson Corporate Bond ETF" },
-    { symbol: "JLS", name: "Nuveen Mortgage and Income Fund" },
-    { symbol: "JMBS", name: "Janus Henderson Mortgage-Backed Securities ETF" },
-    { symbol: "JMEE", name: "JPMorgan Small & Mid Cap Enhanced Equity ETF" },
-    { symbol: "JMHI", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan High Yield Municipal ETF" },
-    { symbol: "JMIA", name: "Jumia Technologies AG American Depositary Shares, each representing two Ordinary Shares" },
-    { symbol: "JMM", name: "Nuveen Multi-Market Income Fund (MA)" },
-    { symbol: "JMOM", name: "JPMorgan U.S. Momentum Factor ETF" },
-    { symbol: "JMSI", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan Sustainable Municipal Income ETF" },
-    { symbol: "JMST", name: "JPMorgan Ultra-Short Municipal Income ETF" },
-    { symbol: "JMTG", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan Mortgage-Backed Securities ETF" },
-    { symbol: "JMUB", name: "JPMorgan Municipal ETF" },
-    { symbol: "JNEU", name: "SHL Telemedicine Ltd AllianzIM U.S. Equity Buffer15 Uncapped June ETF" },
-    { symbol: "JNJ", name: "Johnson & Johnson Common Stock" },
-    { symbol: "JNK", name: "SPDR Bloomberg High Yield Bond ETF" },
-    { symbol: "JNUG", name: "Direxion Daily Junior Gold Miners Index Bull 2X Shares" },
-    { symbol: "JOB", name: "GEE Group Inc. Common Stock" },
-    { symbol: "JOBX", name: "Tradr 2X Long JOBY Daily ETF" },
-    { symbol: "JOBY", name: "Joby Aviation, Inc. Common Stock" },
-    { symbol: "JOBY.W", name: "Joby Aviation, Inc. Warrants" },
-    { symbol: "JOE", name: "St. Joe Company (The) Common Stock" },
-    { symbol: "JOET", name: "Virtus ETF Trust II Virtus Terranova U.S. Quality Momentum ETF" },
-    { symbol: "JOF", name: "Japan Smaller Capitalization Fund Inc Common Stock" },
-    { symbol: "JOJO", name: "ATAC Credit Rotation ETF" },
-    { symbol: "JOYT", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan Equity and Options Total Return ETF" },
-    { symbol: "JPAN", name: "Matthews International Funds Matthews Japan Active ETF" },
-    { symbol: "JPC", name: "Nuveen Preferred & Income Opportunities Fund" },
-    { symbol: "JPEM", name: "JPMorgan Diversified Return Emerging Markets Equity ETF" },
-    { symbol: "JPHY", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan Active High Yield ETF" },
-    { symbol: "JPI", name: "Nuveen Preferred Securities & Income Opportunities Fund Common Shares" },
-    { symbol: "JPIB", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan International Bond Opportunities ETF" },
-    { symbol: "JPIE", name: "JPMorgan Income ETF" },
-    { symbol: "JPIN", name: "JPMorgan Diversified Return International Equity ETF" },
-    { symbol: "JPLD", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan Limited Duration Bond ETF" },
-    { symbol: "JPM", name: "JP Morgan Chase & Co. Common Stock" },
-    { symbol: "JPM$C", name: "J P Morgan Chase & Co Depositary Shares, each representing a 1/400th interest in a share of 6.00% Non-Cumulative  Preferred Stock, Series EE" },
-    { symbol: "JPM$D", name: "J P Morgan Chase & Co Depositary Shares, each representing a 1/400th  interest in a share of 5.75% Non-Cumulative  Preferred Stock, Series DD" },
-    { symbol: "JPM$J", name: "J P Morgan Chase & Co Depositary Shares, each representing a 1/400th interest in a share of JPMorgan Chase & Co. 4.75% Non-Cumulative Preferred Stock, Series GG" },
-    { symbol: "JPM$K", name: "J P Morgan Chase & Co Depositary Shares, each representing a 1/400th interest in a share of 4.55% Non-Cumulative Preferred Stock, Series JJ" },
-    { symbol: "JPM$L", name: "J P Morgan Chase & Co Depositary Shares, each representing a 1/400th interest in a share of 4.625% Non-Cumulative Preferred Stock, Series LL" },
-    { symbol: "JPM$M", name: "J P Morgan Chase & Co Depositary Shares, each representing a 1/400th interest in a share of 4.20% Non-Cumulative Preferred Stock, Series MM" },
-    { symbol: "JPMB", name: "JPMorgan USD Emerging Markets Sovereign Bond ETF" },
-    { symbol: "JPME", name: "JPMorgan Diversified Return U.S. Mid Cap Equity ETF" },
-    { symbol: "JPMO", name: "Tidal Trust II YieldMax JPM Option Income Strategy ETF" },
-    { symbol: "JPRE", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan Realty Income ETF" },
-    { symbol: "JPSE", name: "JPMorgan Diversified Return U.S. Small Cap Equity ETF" },
-    { symbol: "JPST", name: "JPMorgan Ultra-Short Income ETF" },
-    { symbol: "JPSV", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan Active Small Cap Value ETF" },
-    { symbol: "JPUS", name: "JPMorgan Diversified Return U.S. Equity ETF" },
-    { symbol: "JPXN", name: "iShares JPX-Nikkei 400 ETF" },
-    { symbol: "JQC", name: "Nuveen Credit Strategies Income Fund Shares of Beneficial Interest" },
-    { symbol: "JQUA", name: "JPMorgan U.S. Quality Factor ETF" },
-    { symbol: "JRE", name: "Janus Henderson U.S. Real Estate ETF" },
-    { symbol: "JRI", name: "Nuveen Real Asset Income and Growth Fund Common Shares of Beneficial Interest" },
-    { symbol: "JRS", name: "Nuveen Real Estate Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "JSCP", name: "JPMorgan Short Duration Core Plus ETF" },
-    { symbol: "JSI", name: "Janus Detroit Street Trust Janus Henderson Securitized Income ETF" },
-    { symbol: "JSTC", name: "Adasina Social Justice All Cap Global ETF" },
-    { symbol: "JUCY", name: "ETF Series Solutions Aptus Enhanced Yield ETF" },
-    { symbol: "JULH", name: "Innovator ETFs Trust Innovator Premium Income 20 Barrier ETF - July" },
-    { symbol: "JULJ", name: "Innovator ETFs Trust Innovator Premium Income 30 Barrier ETF - July" },
-    { symbol: "JULM", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Max Buffer ETF - July" },
-    { symbol: "JULP", name: "PGIM S&P 500 Buffer 12 ETF - July" },
-    { symbol: "JULT", name: "AllianzIM U.S. Large Cap Buffer10 Jul ETF" },
-    { symbol: "JULU", name: "SHL Telemedicine Ltd AllianzIM U.S. Equity Buffer15 Uncapped Jul ETF" },
-    { symbol: "JULW", name: "AllianzIM U.S. Large Cap Buffer20 Jul ETF" },
-    { symbol: "JULZ", name: "TrueShares Structured Outcome (July) ETF" },
-    { symbol: "JUNM", name: "SHL Telemedicine Ltd FT Vest U.S. Equity Max Buffer ETF - June" },
-    { symbol: "JUNP", name: "PGIM S&P 500 Buffer 12 ETF - June" },
-    { symbol: "JUNT", name: "AIM ETF Products Trust AllianzIM U.S. Large Cap Buffer10 Jun ETF" },
-    { symbol: "JUNW", name: "AIM ETF Products Trust AllianzIM U.S. Large Cap Buffer20 Jun ETF" },
-    { symbol: "JUNZ", name: "TrueShares Structured Outcome (June) ETF" },
-    { symbol: "JUSA", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan U.S. Research Enhanced Large Cap ETF" },
-    { symbol: "JUST", name: "Goldman Sachs JUST U.S. Large Cap Equity ETF" },
-    { symbol: "JVAL", name: "JPMorgan U.S. Value Factor ETF" },
-    { symbol: "JXI", name: "iShares Global Utilities ETF" },
-    { symbol: "JXN", name: "Jackson Financial Inc. Class A Common Stock " },
-    { symbol: "JXN$A", name: "Jackson Financial Inc. Depositary Shares, each representing a 1/1,000th interest in a share of Fixed-Rate Reset Noncumulative Perpetual Preferred Stock, Series A" },
-    { symbol: "JXX", name: "Janus Detroit Street Trust Janus Henderson Transformational Growth ETF" },
-    { symbol: "K", name: "Kellanova Common Stock" },
-    { symbol: "KAI", name: "Kadant Inc Common Stock" },
-    { symbol: "KAPA", name: "Kairos Pharma, Ltd. Common Stock" },
-    { symbol: "KAPR", name: "Innovator U.S. Small Cap Power Buffer ETF - April" },
-    { symbol: "KAR", name: "OPENLANE, Inc. Common Stock" },
-    { symbol: "KARS", name: "KraneShares Electric Vehicles and Future Mobility Index ETF" },
-    { symbol: "KAUG", name: "Innovator ETFs Trust Innovator US Small Cap Power Buffer ETF - August" },
-    { symbol: "KB", name: "KB Financial Group Inc" },
-    { symbol: "KBA", name: "KraneShares Bosera MSCI China A 50 Connect Index ETF" },
-    { symbol: "KBDC", name: "Kayne Anderson BDC, Inc. Common Stock" },
-    { symbol: "KBE", name: "SPDR S&P Bank ETF" },
-    { symbol: "KBH", name: "KB Home Common Stock" },
-    { symbol: "KBR", name: "KBR, Inc. Common Stock" },
-    { symbol: "KBUF", name: "KraneShares 90% KWEB Defined Outcome January 2027 ETF" },
-    { symbol: "KCAI", name: "KraneShares Trust KraneShares China Alpha Index ETF" },
-    { symbol: "KCCA", name: "KraneShares California Carbon Allowance Strategy ETF" },
-    { symbol: "KCE", name: "SPDR S&P Capital Markets ETF" },
-    { symbol: "KCSH", name: "KraneShares Trust KraneShares Sustainable Ultra Short Duration Index ETF" },
-    { symbol: "KD", name: "Kyndryl Holdings, Inc. Common Stock" },
-    { symbol: "KDEC", name: "Innovator ETFs Trust Innovator U.S. Small Cap Power Buffer ETF - December" },
-    { symbol: "KDEF", name: "Exchange Listed Funds Trust PLUS Korea Defense Industry Index ETF" },
-    { symbol: "KDRN", name: "ETF Opportunities Trust Kingsbarn Tactical Bond ETF" },
-    { symbol: "KEMQ", name: "KraneShares Emerging Markets Consumer Technology Index ETF" },
-    { symbol: "KEMX", name: "KraneShares MSCI Emerging Markets ex China Index ETF" },
-    { symbol: "KEN", name: "Kenon Holdings Ltd. Ordinary Shares" },
-    { symbol: "KEP", name: "Korea Electric Power Corporation Common Stock" },
-    { symbol: "KEUA", name: "KraneShares European Carbon Allowance Strategy ETF" },
-    { symbol: "KEX", name: "Kirby Corporation Common Stock" },
-    { symbol: "KEY", name: "KeyCorp Common Stock" },
-    { symbol: "KEY$I", name: "KeyCorp Depositary Shares Each Representing a 1/40th Ownership Interest in a Share of Fixed-to-Floating Rate Perpetual Non-Cumulative Preferred Stock, Series E" },
-    { symbol: "KEY$J", name: "KeyCorp Depositary Shares each representing a 1/40th ownership interest in a share of Fixed Rate Perpetual Non-Cumulative Preferred Stock, Series F" },
-    { symbol: "KEY$K", name: "KeyCorp Depositary Shares, each representing a 1/40th ownership interest in a share of Fixed Rate Perpetual Non-Cumulative Preferred Stock, Series G" },
-    { symbol: "KEY$L", name: "KeyCorp Depositary Shares each representing a 1/40th ownership interest in a share of Fixed Rate Perpetual Non-Cumulative Preferred Stock, Series H" },
-    { symbol: "KEYS", name: "Keysight Technologies Inc. Common Stock" },
-    { symbol: "KF", name: "Korea Fund, Inc. (The) New Common Stock" },
-    { symbol: "KFEB", name: "Innovator ETFs Trust Innovator U.S. Small Cap Power Buffer ETF - February" },
-    { symbol: "KFRC", name: "Kforce, Inc. Common Stock" },
-    { symbol: "KFS", name: "Kingsway Financial Services, Inc. Common Stock (DE)" },
-    { symbol: "KFY", name: "Korn Ferry Common Stock" },
-    { symbol: "KGC", name: "Kinross Gold Corporation Common Stock" },
-    { symbol: "KGLD", name: "Kurv ETF Trust Kurv Gold Enhanced Income ETF" },
-    { symbol: "KGRN", name: "KraneShares MSCI China Clean Technology Index ETF" },
-    { symbol: "KGS", name: "Kodiak Gas Services, Inc. Common Stock" },
-    { symbol: "KHPI", name: "Managed Portfolio Series Kensington Hedged Premium Income ETF" },
-    { symbol: "KHYB", name: "KraneShares Asia Pacific High Income USD Bond ETF" },
-    { symbol: "KIE", name: "SPDR S&P Insurance ETF" },
-    { symbol: "KIM", name: "Kimco Realty Corporation (HC) Common Stock" },
-    { symbol: "KIM$L", name: "Kimco Realty Corporation Class L Depositary Shares, each of which represents a one-one thousandth fractional interest in a share of 5.125% Class L Cumulative Redeemable Preferred Stock, liquidation preference $25,000.00 per share" },
-    { symbol: "KIM$M", name: "Kimco Realty Corporation Class M Depositary Shares, each of which represents a one-one thousandth fractional interest in a share of 5.25% Class M Cumulative Redeemable Preferred Stock, liquidation preference $25,000.00 per share" },
-    { symbol: "KIM$N", name: "Kimco Realty Corporation Depositary Shares, each representing 1/1,000th interest in a share of 7.25% Class N Cumulative Convertible Perpetual Preferred Stock" },
-    { symbol: "KIO", name: "KKR Income Opportunities Fund Common Shares" },
-    { symbol: "KJAN", name: "Innovator U.S. Small Cap Power Buffer ETF - January" },
-    { symbol: "KJUL", name: "Innovator U.S. Small Cap Power Buffer ETF - July" },
-    { symbol: "KJUN", name: "SHL Telemedicine Ltd Innovator U.S. Small Cap Power Buffer ETF - June" },
-    { symbol: "KKR", name: "KKR & Co. Inc. Common Stock" },
-    { symbol: "KKR$D", name: "KKR & Co. Inc. 6.25% Series D Mandatory Convertible Preferred Stock" },
-    { symbol: "KKRS", name: "KKR Group Finance Co. IX LLC 4.625% Subordinated Notes due 2061" },
-    { symbol: "KKRT", name: "KKR & Co. Inc. 6.875% Subordinated Notes due 2065" },
-    { symbol: "KLC", name: "KinderCare Learning Companies, Inc. Common Stock" },
-    { symbol: "KLG", name: "WK Kellogg Co Common Stock" },
-    { symbol: "KLIP", name: "KraneShares KWEB Covered Call Strategy ETF" },
-    { symbol: "KLMN", name: "Invesco Exchange-Traded Fund Trust II Invesco MSCI North America Climate ETF" },
-    { symbol: "KLMT", name: "Invesco Exchange-Traded Fund Trust II Invesco MSCI Global Climate 500 ETF" },
-    { symbol: "KLXY", name: "KraneShares Trust KraneShares Global Luxury Index ETF" },
-    { symbol: "KMAR", name: "Innovator ETFs Trust Innovator U.S. Small Cap Power Buffer ETF - March" },
-    { symbol: "KMAY", name: "Innovator ETFs Trust Innovator U.S. Small Cap Power Buffer ETF - May" },
-    { symbol: "KMI", name: "Kinder Morgan, Inc. Common Stock" },
-    { symbol: "KMID", name: "Virtus ETF Trust II Virtus KAR Mid-Cap ETF" },
-    { symbol: "KMLM", name: "KraneShares Mount Lucas Managed Futures Index Strategy ETF" },
-    { symbol: "KMPB", name: "Kemper Corporation 5.875% Fixed-Rate Reset Junior Subordinated Debentures due 2062" },
-    { symbol: "KMPR", name: "Kemper Corporation" },
-    { symbol: "KMT", name: "Kennametal Inc. Common Stock" },
-    { symbol: "KMX", name: "CarMax Inc" },
-    { symbol: "KN", name: "Knowles Corporation Common Stock" },
-    { symbol: "KNCT", name: "Invesco Next Gen Connectivity ETF" },
-    { symbol: "KNF", name: "Knife Riv Holding Co. Common Stock" },
-    { symbol: "KNG", name: "FT Vest S&P 500 Dividend Aristocrats Target Income ETF" },
-    { symbol: "KNO", name: "Investment Managers Series Trust II AXS Knowledge Leaders ETF" },
-    { symbol: "KNOP", name: "KNOT Offshore Partners LP Common Units representing Limited Partner Interests" },
-    { symbol: "KNOV", name: "Innovator ETFs Trust Innovator U.S. Small Cap Power Buffer ETF - November" },
-    { symbol: "KNOW", name: "Fundamentals First ETF Fundamentals First ETF" },
-    { symbol: "KNRG", name: "Simplify Exchange Traded Funds Simplify Kayne Anderson Energy and Infrastructure Credit ETF" },
-    { symbol: "KNSL", name: "Kinsale Capital Group, Inc. Common Stock" },
-    { symbol: "KNTK", name: "Kinetik Holdings Inc. Class A Common Stock" },
-    { symbol: "KNX", name: "Knight-Swift Transportation Holdings Inc." },
-    { symbol: "KO", name: "Coca-Cola Company (The) Common Stock" },
-    { symbol: "KOCT", name: "Innovator U.S. Small Cap Power Buffer ETF - October" },
-    { symbol: "KODK", name: "Eastman Kodak Company Common New" },
-    { symbol: "KOF", name: "Coca Cola Femsa S.A.B. de C.V.  American Depositary Shares, each representing 10 Units (each Unit consists of 3 Series B Shares and 5 Series L Shares)" },
-    { symbol: "KOKU", name: "Xtrackers MSCI Kokusai Equity ETF" },
-    { symbol: "KOLD", name: "ProShares UltraShort Bloomberg Natural Gas" },
-    { symbol: "KOMP", name: "SPDR S&P Kensho New Economies Composite ETF" },
-    { symbol: "KONG", name: "ETF Opportunities Trust Formidable Fortress ETF" },
-    { symbol: "KOOL", name: "Spinnaker ETF Series North Shore Equity Rotation ETF" },
-    { symbol: "KOP", name: "Koppers Holdings Inc. Common Stock" },
-    { symbol: "KORE", name: "KORE Group Holdings, Inc. Common Stock" },
-    { symbol: "KORP", name: "American Century Diversified Corporate Bond ETF" },
-    { symbol: "KORU", name: "Direxion Daily South Korea Bull 3X Shares" },
-    { symbol: "KOS", name: "Kosmos Energy Ltd. Common Shares (DE)" },
-    { symbol: "KPRO", name: "KraneShares 100% KWEB Defined Outcome January 2027 ETF" },
-    { symbol: "KR", name: "Kroger Company (The) Common Stock" },
-    { symbol: "KRBN", name: "KraneShares Global Carbon Strategy ETF" },
-    { symbol: "KRC", name: "Kilroy Realty Corporation Common Stock" },
-    { symbol: "KRE", name: "SPDR S&P Regional Banking ETF" },
-    { symbol: "KREF", name: "KKR Real Estate Finance Trust Inc. Common Stock" },
-    { symbol: "KREF$A", name: "KKR Real Estate Finance Trust Inc. 6.50% Series A Cumulative Redeemable Preferred Stock" },
-    { symbol: "KRG", name: "Kite Realty Group Trust Common Stock" },
-    { symbol: "KRMN", name: "Karman Holdings Inc. Common Stock" },
-    { symbol: "KRO", name: "Kronos Worldwide Inc Common Stock" },
-    { symbol: "KRP", name: "Kimbell Royalty Partners Common Units Representing Limited Partner Interests" },
-    { symbol: "KSA", name: "iShares Trust iShares MSCI Saudi Arabia ETF" },
-    { symbol: "KSEP", name: "Innovator U.S. Small Cap Power Buffer ETF - September" },
-    { symbol: "KSPY", name: "KraneShares Trust KraneShares Hedgeye Hedged Equity Index ETF" },
-    { symbol: "KSS", name: "Kohl's Corporation Common Stock" },
-    { symbol: "KSTR", name: "KraneShares SSE STAR Market 50 Index ETF" },
-    { symbol: "KT", name: "KT Corporation Common Stock" },
-    { symbol: "KTB", name: "Kontoor Brands, Inc. Common Stock " },
-    { symbol: "KTEC", name: "KraneShares Hang Seng TECH Index ETF" },
-    { symbol: "KTF", name: "DWS Municipal Income Trust" },
-    { symbol: "KTH", name: "Structures Products Cp 8% CorTS Issued by Peco Energy Cap Tr II Preferred Stock" },
-    { symbol: "KTN", name: "Structured Products Corp 8.205% CorTS 8.205% Corporate Backed Trust Securities (CorTS)" },
-    { symbol: "KUKE", name: "Kuke Music Holding Limited American Depositary Shares (each representing ten (10) Class A Ordinary Shares)" },
-    { symbol: "KULR", name: "KULR Technology Group, Inc. Common Stock" },
-    { symbol: "KURE", name: "KraneShares MSCI All China Health Care Index ETF" },
-    { symbol: "KVLE", name: "KraneShares Value Line Dynamic Dividend Equity Index ETF" },
-    { symbol: "KVUE", name: "Kenvue Inc. Common Stock" },
-    { symbol: "KVYO", name: "Klaviyo, Inc. Series A Common Stock" },
-    { symbol: "KW", name: "Kennedy-Wilson Holdings Inc. Common Stock" },
-    { symbol: "KWEB", name: "KraneShares Trust KraneShares CSI China Internet ETF" },
-    { symbol: "KWR", name: "Quaker Houghton Common Stock" },
-    { symbol: "KWT", name: "iShares Trust iShares MSCI Kuwait ETF" },
-    { symbol: "KXI", name: "iShares Global Consumer Staples ETF" },
-    { symbol: "KYN", name: "Kayne Anderson Energy Infrastructure Fund, Inc." },
-    { symbol: "L", name: "Loews Corporation Common Stock" },
-    { symbol: "LABD", name: "Direxion Daily S&P Biotech Bear 3X Shares" },
-    { symbol: "LABU", name: "Direxion Daily S&P Biotech Bull 3X Shares" },
-    { symbol: "LABX", name: "Tradr 2X Long ALAB Daily ETF" },
-    { symbol: "LAC", name: "Lithium Americas Corp. Common Shares" },
-    { symbol: "LAD", name: "Lithia Motors, Inc. Common Stock" },
-    { symbol: "LADR", name: "Ladder Capital Corp Class A Common Stock" },
-    { symbol: "LALT", name: "First Trust Exchange-Traded Fund VIII First Trust Multi-Strategy Alternative ETF" },
-    { symbol: "LANV", name: "Lanvin Group Holdings Limited Ordinary Shares" },
-    { symbol: "LANV.W", name: "Lanvin Group Holdings Limited Redeemable Warrants, each whole warrant exercisable for one Ordinary Share at an exercise price of $11.50" },
-    { symbol: "LAPR", name: "Innovator ETFs Trust Innovator Premium Income 15 Buffer ETF - April" },
-    { symbol: "LAR", name: "Lithium Argentina AG Common Shares" },
-    { symbol: "LAW", name: "CS Disco, Inc. Common Stock" },
-    { symbol: "LAZ", name: "Lazard, Inc. Common Stock" },
-    { symbol: "LB", name: "LandBridge Company LLC Class A Shares Representing Limited Liability Company Interests" },
-    { symbol: "LBAY", name: "Leatherback Long/Short Alternative Yield ETF" },
-    { symbol: "LBO", name: "EA Series Trust WHITEWOLF Publicly Listed Private Equity ETF" },
-    { symbol: "LBRT", name: "Liberty Energy Inc. Class A common stock" },
-    { symbol: "LC", name: "LendingClub Corporation Common Stock" },
-    { symbol: "LCAP", name: "Principal Exchange-Traded Funds Principal Capital Appreciation Select ETF" },
-    { symbol: "LCF", name: "Touchstone ETF Trust Touchstone US Large Cap Focused ETF" },
-    { symbol: "LCG", name: "Sterling Capital Focus Equity ETF" },
-    { symbol: "LCII", name: "LCI Industries" },
-    { symbol: "LCLG", name: "Advisors Series Trust Logan Capital Broad Innovative Growth ETF" },
-    { symbol: "LCOW", name: "Pacer Funds Trust Pacer S&P 500 Quality FCF Aristocrats ETF" },
-    { symbol: "LCR", name: "Managed Portfolio Series Leuthold Core ETF" },
-    { symbol: "LCTD", name: "BlackRock World ex U.S. Carbon Transition Readiness ETF" },
-    { symbol: "LCTU", name: "BlackRock U.S. Carbon Transition Readiness ETF" },
-    { symbol: "LCTX", name: "Lineage Cell Therapeutics, Inc. Common Stock" },
-    { symbol: "LDDR", name: "LifeX 2035 Term Income ETF" },
-    { symbol: "LDI", name: "loanDepot, Inc. Class A Common Stock" },
-    { symbol: "LDOS", name: "Leidos Holdings, Inc. Common Stock" },
-    { symbol: "LDP", name: "Cohen & Steers Limited Duration Preferred and Income Fund, Inc." },
-    { symbol: "LDRC", name: "iShares Trust iShares iBonds 1-5 Year Corporate Ladder ETF" },
-    { symbol: "LDRH", name: "iShares Trust iShares iBonds 1-5 Year High Yield  and Income Ladder ETF" },
-    { symbol: "LDRI", name: "iShares Trust iShares iBonds 1-5 Year TIPS Ladder ETF" },
-    { symbol: "LDRT", name: "iShares Trust iShares iBonds 1-5 Year Treasury Ladder ETF" },
-    { symbol: "LDUR", name: "PIMCO Enhanced Low Duration Active Exchange-Traded Fund" },
-    { symbol: "LEA", name: "Lear Corporation Common Stock" },
-    { symbol: "LEAD", name: "Siren DIVCON Leaders Dividend ETF" },
-    { symbol: "LEG", name: "Leggett & Platt, Incorporated Common Stock" },
-    { symbol: "LEGT", name: "Legato Merger Corp. III Ordinary Shares" },
-    { symbol: "LEGT.U", name: "Legato Merger Corp. III Units, each consisting of one Ordinary Share and one-half of one warrant" },
-    { symbol: "LEGT.W", name: "Legato Merger Corp. III Redeemable Warrants, each whole warrant exercisable for one ordinary share at an exercise price of $11.50 per share" },
-    { symbol: "LEMB", name: "iShares J.P. Morgan EM Local Currency Bond" },
-    { symbol: "LEN", name: "Lennar Corporation Class A Common Stock" },
-    { symbol: "LEN.B", name: "Lennar Corporation Class B" },
-    { symbol: "LENS", name: "EA Series Trust Sarmaya Thematic ETF" },
-    { symbol: "LEO", name: "BNY Mellon Strategic Municipals, Inc. Common Stock" },
-    { symbol: "LEU", name: "Centrus Energy Corp. Class A Common Stock" },
-    { symbol: "LEVI", name: "Levi Strauss & Co Class A Common Stock" },
-    { symbol: "LFAE", name: "LifeX 2048 Longevity Income ETF" },
-    { symbol: "LFAF", name: "LifeX 2049 Longevity Income ETF" },
-    { symbol: "LFAI", name: "LifeX 2050 Longevity Income ETF" },
-    { symbol: "LFAJ", name: "LifeX 2051 Longevity Income ETF" },
-    { symbol: "LFAK", name: "LifeX 2052 Longevity Income ETF" },
-    { symbol: "LFAL", name: "LifeX 2053 Longevity Income ETF" },
-    { symbol: "LFAN", name: "LifeX 2054 Longevity Income ETF" },
-    { symbol: "LFAO", name: "LifeX 2055 Longevity Income ETF" },
-    { symbol: "LFAQ", name: "LifeX 2056 Longevity Income ETF" },
-    { symbol: "LFAR", name: "LifeX 2057 Longevity Income ETF" },
-    { symbol: "LFAU", name: "LifeX 2058 Longevity Income ETF" },
-    { symbol: "LFAV", name: "LifeX 2059 Longevity Income ETF" },
-    { symbol: "LFAW", name: "LifeX 2060 Longevity Income ETF" },
-    { symbol: "LFAX", name: "LifeX 2061 Longevity Income ETF" },
-    { symbol: "LFAZ", name: "LifeX 2062 Longevity Income ETF" },
-    { symbol: "LFBB", name: "LifeX 2063 Longevity Income ETF" },
-    { symbol: "LFBD", name: "LifeX 2064 Longevity Income ETF" },
-    { symbol: "LFBE", name: "LifeX 2065 Longevity Income ETF" },
-    { symbol: "LFDR", name: "LifeX Durable Income ETF" },
-    { symbol: "LFEQ", name: "VanEck Long/Flat Trend ETF" },
-    { symbol: "LFGY", name: "Tidal Trust II YieldMax Crypto Industry & Tech Portfolio Option Income ETF" },
-    { symbol: "LFT", name: "Lument Finance Trust, Inc. Common Stock" },
-    { symbol: "LFT$A", name: "Lument Finance Trust, Inc. 7.875% Series A Cumulative Redeemable Preferred Stock" },
-    { symbol: "LGCY", name: "Legacy Education Inc. Common Stock" },
-    { symbol: "LGDX", name: "Tidal Trust III Intech S&P Large Cap Diversified Alpha ETF" },
-    { symbol: "LGH", name: "HCM Defender 500 Index ETF" },
-    { symbol: "LGHT", name: "Spinnaker ETF Series Langar Global HealthTech ETF" },
-    { symbol: "LGI", name: "Lazard Global Total Return and Income Fund Common Stock" },
-    { symbol: "LGL", name: "LGL Group, Inc. (The) Common Stock" },
-    { symbol: "LGL.W", name: "LGL Group, Inc. (The) Warrants" },
-    { symbol: "LGLV", name: "SPDR SSGA US Large Cap Low Volatility Index ETF" },
-    { symbol: "LGOV", name: "First Trust Long Duration Opportunities ETF" },
-    { symbol: "LGPS", name: "LogProstyle Inc. Common Shares" },
-    { symbol: "LH", name: "Labcorp Holdings Inc. Common Stock" },
-    { symbol: "LHX", name: "L3Harris Technologies, Inc. Common Stock" },
-    { symbol: "LIAB", name: "LifeX 2048 Inflation-Protected Longevity Income ETF" },
-    { symbol: "LIAC", name: "LifeX 2049 Inflation-Protected Longevity Income ETF" },
-    { symbol: "LIAE", name: "LifeX 2050 Inflation-Protected Longevity Income ETF" },
-    { symbol: "LIAF", name: "LifeX 2051 Inflation-Protected Longevity Income ETF" },
-    { symbol: "LIAG", name: "LifeX 2052 Inflation-Protected Longevity Income ETF" },
-    { symbol: "LIAJ", name: "LifeX 2053 Inflation-Protected Longevity Income ETF" },
-    { symbol: "LIAK", name: "LifeX 2054 Inflation-Protected Longevity Income ETF" },
-    { symbol: "LIAM", name: "LifeX 2055 Inflation-Protected Longevity Income ETF" },
-    { symbol: "LIAO", name: "LifeX 2056 Inflation-Protected Longevity Income ETF" },
-    { symbol: "LIAP", name: "LifeX 2057 Inflation-Protected Longevity Income ETF" },
-    { symbol: "LIAQ", name: "LifeX 2058 Inflation-Protected Longevity Income ETF" },
-    { symbol: "LIAT", name: "LifeX 2059 Inflation-Protected Longevity Income ETF" },
-    { symbol: "LIAU", name: "LifeX 2060 Inflation-Protected Longevity Income ETF" },
-    { symbol: "LIAV", name: "LifeX 2061 Inflation-Protected Longevity Income ETF" },
-    { symbol: "LIAW", name: "LifeX 2062 Inflation-Protected Longevity Income ETF" },
-    { symbol: "LIAX", name: "LifeX 2063 Inflation-Protected Longevity Income ETF" },
-    { symbol: "LIAY", name: "LifeX 2064 Inflation-Protected Longevity Income ETF" },
-    { symbol: "LIBD", name: "LifeX 2065 Inflation-Protected Longevity Income ETF" },
-    { symbol: "LII", name: "Lennox International, Inc. Common Stock" },
-    { symbol: "LIMI", name: "Themes ETF Trust Themes Lithium & Battery Metal Miners ETF" },
-    { symbol: "LION", name: "Lionsgate Studios Corp Common Shares" },
-    { symbol: "LIT", name: "Global X Lithium & Battery Tech ETF" },
-    { symbol: "LITB", name: "LightInTheBox Holding Co., Ltd. American Depositary Shares, each representing twelve ordinary shares" },
-    { symbol: "LITL", name: "Simplify Exchange Traded Funds Simplify Piper Sandler US Small-Cap PLUS Income ETF" },
-    { symbol: "LJAN", name: "Innovator ETFs Trust Innovator Premium Income 15 Buffer ETF - January" },
-    { symbol: "LJUL", name: "SHL Telemedicine Ltd Innovator Premium Income 15 Buffer ETF - July" },
-    { symbol: "LKOR", name: "FlexShares Trust FlexShares Credit-Scored US Long Corporate Bond Index Fund" },
-    { symbol: "LLDR", name: "Global X Funds Global X Long-Term Treasury Ladder ETF" },
-    { symbol: "LLY", name: "Eli Lilly and Company Common Stock" },
-    { symbol: "LLYX", name: "Tidal Trust II Defiance Daily Target 2X Long LLY ETF" },
-    { symbol: "LMBO", name: "Direxion Shares ETF Trust Direxion Daily Crypto Industry Bull 2X Shares" },
-    { symbol: "LMND", name: "Lemonade, Inc. Common Stock" },
-    { symbol: "LMND.W", name: "Lemonade, Inc. Warrants" },
-    { symbol: "LMT", name: "Lockheed Martin Corporation Common Stock" },
-    { symbol: "LMUB", name: "iShares Trust iShares Long-Term National Muni Bond ETF" },
-    { symbol: "LNC", name: "Lincoln National Corporation Common Stock" },
-    { symbol: "LNC$D", name: "Lincoln National Corporation Depositary Shares Each Representing a 1/1,000th Interest in a Share of 9.000% Non-Cumulative Preferred Stock, Series D" },
-    { symbol: "LND", name: "Brasilagro Brazilian Agric Real Estate Co Sponsored ADR (Brazil)" },
-    { symbol: "LNG", name: "Cheniere Energy, Inc. Common Stock" },
-    { symbol: "LNN", name: "Lindsay Corporation Common Stock" },
-    { symbol: "LOAR", name: "Loar Holdings Inc. Common Stock" },
-    { symbol: "LOB", name: "Live Oak Bancshares, Inc. Common Stock" },
-    { symbol: "LOB$A", name: "Live Oak Bancshares, Inc. Depositary Shares, Each Representing a 1/40th Interest in a Share of 8.375% Fixed Rate Series A Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "LOCL", name: "Local Bounti Corporation Common Stock" },
-    { symbol: "LOCT", name: "Innovator ETFs Trust Innovator Premium Income 15 Buffer ETF - October" },
-    { symbol: "LODE", name: "Comstock Inc. Common Stock" },
-    { symbol: "LODI", name: "ETF Series Solutions AAM SLC Low Duration Income ETF" },
-    { symbol: "LOMA", name: "Loma Negra Compania Industrial Argentina Sociedad Anonima ADS" },
-    { symbol: "LONZ", name: "PIMCO U.S. Treasury Index Fund PIMCO Senior Loan Active Exchange-Traded Fund" },
-    { symbol: "LOPP", name: "Gabelli Love Our Planet & People ETF Gabelli Love Our Planet & People ETF" },
-    { symbol: "LOUP", name: "Innovator Deepwater Frontier Tech ETF" },
-    { symbol: "LOW", name: "Lowe's Companies, Inc. Common Stock" },
-    { symbol: "LOWV", name: "AB Active ETFs, Inc. AB US Low Volatility Equity ETF" },
-    { symbol: "LPA", name: "Logistic Properties of the Americas Ordinary Shares" },
-    { symbol: "LPG", name: "Dorian LPG Ltd. Common Stock" },
-    { symbol: "LPL", name: "LG Display Co, Ltd AMERICAN DEPOSITORY SHARES" },
-    { symbol: "LPRE", name: "Exchange Listed Funds Trust Long Pond Real Estate Select ETF" },
-    { symbol: "LPX", name: "Louisiana-Pacific Corporation Common Stock" },
-    { symbol: "LQAI", name: "Exchange Listed Funds Trust LG QRAFT AI-Powered U.S. Large Cap Core ETF" },
-    { symbol: "LQD", name: "iShares iBoxx $ Investment Grade Corporate Bond ETF" },
-    { symbol: "LQDB", name: "iShares Trust iShares BBB Rated Corporate Bond ETF" },
-    { symbol: "LQDH", name: "iShares Interest Rate Hedged Corporate Bond ETF" },
-    { symbol: "LQDI", name: "iShares Inflation Hedged Corporate Bond ETF" },
-    { symbol: "LQDW", name: "iShares Trust iShares Investment Grade Corporate Bond BuyWrite Strategy ETF" },
-    { symbol: "LQIG", name: "SPDR Series Trust SPDR MarketAxess Investment Grade 400 Corporate Bond ETF" },
-    { symbol: "LQPE", name: "Tidal Trust III PEO AlphaQuest Thematic PE ETF" },
-    { symbol: "LQTI", name: "First Trust Exchange-Traded Fund IV FT Vest Investment Grade & Target Income ETF" },
-    { symbol: "LRCU", name: "Tradr 2X Long LRCX Daily ETF" },
-    { symbol: "LRGC", name: "AB Active ETFs, Inc. AB US Large Cap Strategic Equities ETF" },
-    { symbol: "LRGF", name: "iShares U.S. Equity Factor ETF" },
-    { symbol: "LRGG", name: "Macquarie ETF Trust Macquarie Focused Large Growth ETF" },
-    { symbol: "LRN", name: "Stride, Inc. Common Stock" },
-    { symbol: "LRNZ", name: "Listed Funds Trust TrueShares Technology, AI & Deep Learning ETF" },
-    { symbol: "LSAF", name: "LeaderShares AlphaFactor US Core Equity ETF" },
-    { symbol: "LSAT", name: "LeaderShares AlphaFactor Tactical Focused ETF" },
-    { symbol: "LSEQ", name: "Harbor ETF Trust Harbor Long-Short Equity ETF" },
-    { symbol: "LSF", name: "Laird Superfood, Inc. Common Stock" },
-    { symbol: "LSGR", name: "Natixis ETF Trust II Natixis Loomis Sayles Focused Growth ETF" },
-    { symbol: "LSPD", name: "Lightspeed Commerce Inc. Subordinate Voting Shares" },
-    { symbol: "LST", name: "Managed Portfolio Series Leuthold Select Industries ETF" },
-    { symbol: "LSVD", name: "The Advisors Inner Circle Fund LSV Disciplined Value ETF" },
-    { symbol: "LTC", name: "LTC Properties, Inc. Common Stock" },
-    { symbol: "LTH", name: "Life Time Group Holdings, Inc. Common Stock" },
-    { symbol: "LTL", name: "ProShares Ultra Communication Services" },
-    { symbol: "LTM", name: "LATAM Airlines Group S.A. American Depositary Shares (each representing two thousand (2,000) shares of Common Stock)" },
-    { symbol: "LTPZ", name: "Pimco 15  Year U.S. TIPS Index Exchange-Traded Fund" },
-    { symbol: "LTTI", name: "First Trust Exchange-Traded Fund IV FT Vest 20+ Year Treasury & Target Income ETF" },
-    { symbol: "LU", name: "Lufax Holding Ltd American Depositary Shares, each representing two (2) Ordinary Shares" },
-    { symbol: "LUCK", name: "Lucky Strike Entertainment Corporation Class A Common Stock" },
-    { symbol: "LUD", name: "Luda Technology Group Limited Ordinary Shares" },
-    { symbol: "LUMN", name: "Lumen Technologies, Inc. Common Stock" },
-    { symbol: "LUV", name: "Southwest Airlines Company Common Stock" },
-    { symbol: "LUXE", name: "LuxExperience B.V. American Depositary Shares, each representing one Ordinary Share" },
-    { symbol: "LVDS", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan Fundamental Data Science Large Value ETF" },
-    { symbol: "LVHI", name: "Franklin International Low Volatility High Dividend Index ETF " },
-    { symbol: "LVS", name: "Las Vegas Sands Corp. Common Stock" },
-    { symbol: "LVWR", name: "LiveWire Group, Inc. Common Stock" },
-    { symbol: "LVWR.W", name: "LiveWire Group, Inc. Warrants, each exercisable for one share of Common Stock at an exercise price of $11.50 per share" },
-    { symbol: "LW", name: "Lamb Weston Holdings, Inc. Common Stock " },
-    { symbol: "LXFR", name: "Luxfer Holdings PLC Ordinary Shares" },
-    { symbol: "LXP", name: "LXP Industrial Trust Common Stock (Maryland REIT)" },
-    { symbol: "LXP$C", name: "LXP Industrial Trust 6.5% Series C Cumulative Convertible Preferred Stock" },
-    { symbol: "LXU", name: "LSB Industries, Inc. Common Stock" },
-    { symbol: "LYB", name: "LyondellBasell Industries NV Ordinary Shares Class A (Netherlands)" },
-    { symbol: "LYG", name: "Lloyds Banking Group Plc American Depositary Shares" },
-    { symbol: "LYLD", name: "Cambria ETF Trust Cambria Large Cap Shareholder Yield ETF" },
-    { symbol: "LYV", name: "Live Nation Entertainment, Inc. Common Stock" },
-    { symbol: "LZB", name: "La-Z-Boy Incorporated Common Stock" },
-    { symbol: "LZM", name: "Lifezone Metals Limited Ordinary Shares" },
-    { symbol: "LZM.W", name: "Lifezone Metals Limited Warrants" },
-    { symbol: "M", name: "Macy's Inc Common Stock" },
-    { symbol: "MA", name: "Mastercard Incorporated Common Stock" },
-    { symbol: "MAA", name: "Mid-America Apartment Communities, Inc. Common Stock" },
-    { symbol: "MAA$I", name: "Mid-America Apartment Communities, Inc. 8.50% Series I Cumulative Redeemable Preferred Stock" },
-    { symbol: "MAC", name: "Macerich Company (The) Common Stock" },
-    { symbol: "MADE", name: "iShares Trust iShares U.S. Manufacturing ETF" },
-    { symbol: "MAGA", name: "Point Bridge America First ETF" },
-    { symbol: "MAGG", name: "Madison ETFs Trust Madison Aggregate Bond ETF" },
-    { symbol: "MAGN", name: "Magnera Corporation Common Stock" },
-    { symbol: "MAGS", name: "Roundhill Magnificent Seven ETF" },
-    { symbol: "MAGX", name: "Roundhill Daily 2X Long Magnificent Seven ETF" },
-    { symbol: "MAGY", name: "Roundhill ETF Trust Roundhill Magnificent Seven Covered Call ETF" },
-    { symbol: "MAIA", name: "MAIA Biotechnology, Inc. Common Stock" },
-    { symbol: "MAIN", name: "Main Street Capital Corporation Common Stock" },
-    { symbol: "MAKX", name: "ProShares S&P Kensho Smart Factories ETF" },
-    { symbol: "MAMB", name: "Monarch Ambassador Income Index ETF" },
-    { symbol: "MAN", name: "ManpowerGroup Common Stock" },
-    { symbol: "MANU", name: "Manchester United Ltd. Class A Ordinary Shares" },
-    { symbol: "MAPP", name: "Harbor ETF Trust Harbor Multi-Asset Explorer ETF" },
-    { symbol: "MARB", name: "First Trust Merger Arbitrage ETF" },
-    { symbol: "MARM", name: "SHL Telemedicine Ltd FT Vest U.S. Equity Max Buffer ETF - March" },
-    { symbol: "MARO", name: "Tidal Trust II YieldMax MARA Option Income Strategy ETF" },
-    { symbol: "MART", name: "AIM ETF Products Trust AllianzIM U.S. Large Cap Buffer10 Mar ETF" },
-    { symbol: "MARU", name: "AIM ETF Products Trust AllianzIM U.S. Equity Buffer15 Uncapped Mar ETF" },
-    { symbol: "MARW", name: "AIM ETF Products Trust AllianzIM U.S. Large Cap Buffer20 Mar ETF" },
-    { symbol: "MARZ", name: "TrueShares Structured Outcome (March) ETF" },
-    { symbol: "MAS", name: "Masco Corporation Common Stock" },
-    { symbol: "MATV", name: "Mativ Holdings, Inc. Common Stock" },
-    { symbol: "MATX", name: "Matson, Inc. Common Stock" },
-    { symbol: "MAVF", name: "EA Series Trust Matrix Advisors Value ETF" },
-    { symbol: "MAX", name: "MediaAlpha, Inc. Class A Common Stock" },
-    { symbol: "MAXJ", name: "iShares Trust iShares Large Cap Max Buffer Jun ETF" },
-    { symbol: "MAYM", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Max Buffer ETF - May" },
-    { symbol: "MAYP", name: "PGIM S&P 500 Buffer 12 ETF - May" },
-    { symbol: "MAYT", name: "AIM ETF Products Trust AllianzIM U.S. Large Cap Buffer10 May ETF" },
-    { symbol: "MAYU", name: "SHL Telemedicine Ltd AllianzIM U.S. Equity Buffer15 Uncapped May ETF" },
-    { symbol: "MAYW", name: "AIM ETF Products Trust AllianzIM U.S. Large Cap Buffer20 May ETF" },
-    { symbol: "MAYZ", name: "TrueShares Structured Outcome (May) ETF" },
-    { symbol: "MBBB", name: "VanEck Moody's Analytics BBB Corporate Bond ETF" },
-    { symbol: "MBC", name: "MasterBrand, Inc. Common Stock" },
-    { symbol: "MBCC", name: "Monarch Blue Chips Core Index ETF" },
-    { symbol: "MBI", name: "MBIA Inc. Common Stock" },
-    { symbol: "MBND", name: "SPDR Nuveen Municipal Bond ETF" },
-    { symbol: "MBNE", name: "SPDR Series Trust SPDR Nuveen Municipal Bond ESG ETF" },
-    { symbol: "MBOX", name: "Freedom Day Dividend ETF" },
-    { symbol: "MBSD", name: "FlexShares Trust FlexShares Disciplined Duration MBS Index Fund" },
-    { symbol: "MBSF", name: "Valued Advisers Trust Regan Floating Rate MBS ETF" },
-    { symbol: "MBSX", name: "Advisor Managed Portfolios Regan Fixed Rate MBS ETF" },
-    { symbol: "MC", name: "Moelis & Company Class A Common Stock" },
-    { symbol: "MCB", name: "Metropolitan Bank Holding Corp. Common Stock" },
-    { symbol: "MCD", name: "McDonald's Corporation Common Stock" },
-    { symbol: "MCH", name: "Matthews International Funds Matthews China Active ETF" },
-    { symbol: "MCI", name: "Barings Corporate Investors Common Stock" },
-    { symbol: "MCK", name: "McKesson Corporation Common Stock" },
-    { symbol: "MCN", name: "XAI Madison Equity Premium Income Fund Common Shares" },
-    { symbol: "MCO", name: "Moody's Corporation Common Stock" },
-    { symbol: "MCOW", name: "Pacer Funds Trust Pacer S&P MidCap 400 Quality FCF Aristocrats ETF" },
-    { symbol: "MCR", name: "MFS Charter Income Trust Common Stock" },
-    { symbol: "MCRP", name: "Micropolis Holding Company Ordinary Shares" },
-    { symbol: "MCS", name: "Marcus Corporation (The) Common Stock" },
-    { symbol: "MCY", name: "Mercury General Corporation Common Stock" },
-    { symbol: "MD", name: "Pediatrix Medical Group, Inc. Common Stock" },
-    { symbol: "MDBX", name: "Tradr 2X Long MDB Daily ETF" },
-    { symbol: "MDEV", name: "First Trust Indxx Medical Devices ETF" },
-    { symbol: "MDLV", name: "EA Series Trust Morgan Dempsey Large Cap Value ETF" },
-    { symbol: "MDPL", name: "Northern Lights Fund Trust IV Monarch Dividend Plus Index ETF" },
-    { symbol: "MDST", name: "Ultimus Managers Trust Westwood Salient Enhanced Midstream Income ETF" },
-    { symbol: "MDT", name: "Medtronic plc. Ordinary Shares" },
-    { symbol: "MDU", name: "MDU Resources Group, Inc. Common Stock (Holding Company)" },
-    { symbol: "MDV", name: "Modiv Industrial, Inc. Class C Common Stock" },
-    { symbol: "MDV$A", name: "Modiv Industrial, Inc. 7.375% Series A Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "MDY", name: "SPDR S&P MidCap 400 ETF Trust" },
-    { symbol: "MDYG", name: "SPDR S&P 400 Mid Cap Growth ETF (based on S&P MidCap 400 Growth Index--symbol: MUV)" },
-    { symbol: "MDYV", name: "SPDR S&P 400 Mid Cap Value ETF (based on S&P MidCap 400 Value Index--symbol: MGD" },
-    { symbol: "MEAR", name: "iShares Short Maturity Municipal Bond Active ETF" },
-    { symbol: "MEC", name: "Mayville Engineering Company, Inc. Common Stock" },
-    { symbol: "MED", name: "MEDIFAST INC Common Stock" },
-    { symbol: "MEDI", name: "Harbor ETF Trust Harbor Health Care ETF" },
-    { symbol: "MEG", name: "Montrose Environmental Group, Inc. Common Stock" },
-    { symbol: "MEGI", name: "NYLI CBRE Global Infrastructure Megatrends Term Fund Common Shares" },
-    { symbol: "MEI", name: "Methode Electronics, Inc. Common Stock" },
-    { symbol: "MEM", name: "Matthews International Funds Matthews Emerging Markets Equity Active ETF" },
-    { symbol: "MEMX", name: "Matthews International Funds Matthews Emerging Markets ex China Active ETF" },
-    { symbol: "MER$K", name: "Bank of America Corporation Income Capital Obligation Notes initially due December 15, 2066" },
-    { symbol: "MET", name: "MetLife, Inc. Common Stock" },
-    { symbol: "MET$A", name: "MetLife, Inc. Preferred Series A Floating Rate" },
-    { symbol: "MET$E", name: "MetLife, Inc. Depositary Shares " },
-    { symbol: "MET$F", name: "MetLife, Inc. Depositary Shares, each representing a 1/1,000th interest in a share of 4.75% Non-Cumulative Preferred Stock, Series F" },
-    { symbol: "METV", name: "Roundhill Ball Metaverse ETF" },
-    { symbol: "METW", name: "Roundhill ETF Trust Roundhill META WeeklyPay ETF" },
-    { symbol: "MEXX", name: "Direxion Daily MSCI Mexico Bull 3X Shares" },
-    { symbol: "MFA", name: "MFA Financial, Inc." },
-    { symbol: "MFA$B", name: "MFA Financial, Inc. Preferred Series B" },
-    { symbol: "MFA$C", name: "MFA Financial, Inc. 6.50% Series C Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "MFAN", name: "MFA Financial, Inc. 8.875% Senior Notes due 2029" },
-    { symbol: "MFAO", name: "MFA Financial, Inc. 9.000% Senior Notes due 2029" },
-    { symbol: "MFC", name: "Manulife Financial Corporation Common Stock" },
-    { symbol: "MFDX", name: "PIMCO Equitiy Series PIMCO RAFI Dynamic Multi-Factor International Equity ETF" },
-    { symbol: "MFEM", name: "PIMCO Equitiy Series PIMCO RAFI Dynamic Multi-Factor Emerging Markets Equity ETF" },
-    { symbol: "MFG", name: "Mizuho Financial Group, Inc. Sponosred ADR (Japan)" },
-    { symbol: "MFM", name: "MFS Municipal Income Trust Common Stock" },
-    { symbol: "MFSB", name: "MFS Active Exchange Traded Funds Trust MFS Active Core Plus Bond ETF" },
-    { symbol: "MFSG", name: "MFS Active Exchange Traded Funds Trust MFS Active Growth ETF" },
-    { symbol: "MFSI", name: "MFS Active Exchange Traded Funds Trust MFS Active International ETF" },
-    { symbol: "MFSM", name: "MFS Active Exchange Traded Funds Trust MFS Active Intermediate Muni Bond ETF" },
-    { symbol: "MFSV", name: "MFS Active Exchange Traded Funds Trust MFS Active Value ETF" },
-    { symbol: "MFUL", name: "Mindful Conservative ETF" },
-    { symbol: "MFUS", name: "PIMCO Equitiy Series PIMCO RAFI Dynamic Multi-Factor U.S. Equity ETF" },
-    { symbol: "MFUT", name: "Tidal Trust II Cambria Chesapeake Pure Trend ETF" },
-    { symbol: "MG", name: "Mistras Group Inc Common Stock" },
-    { symbol: "MGA", name: "Magna International, Inc. Common Stock" },
-    { symbol: "MGC", name: "Vanguard Mega Cap ETF" },
-    { symbol: "MGF", name: "MFS Government Markets Income Trust Common Stock" },
-    { symbol: "MGK", name: "Vanguard Mega Cap Growth ETF" },
-    { symbol: "MGLD", name: "The Marygold Companies, Inc. Common Stock" },
-    { symbol: "MGM", name: "MGM Resorts International Common Stock" },
-    { symbol: "MGMT", name: "Ballast Small/Mid Cap ETF" },
-    { symbol: "MGNR", name: "American Beacon Select Funds American Beacon GLG Natural Resources ETF" },
-    { symbol: "MGOV", name: "First Trust Exchange-Traded Fund IV First Trust Intermediate Government Opportunities ETF" },
-    { symbol: "MGR", name: "Affiliated Managers Group, Inc. 5.875% Junior Subordinated Notes due 2059" },
-    { symbol: "MGRB", name: "Affiliated Managers Group, Inc. 4.750% Junior Subordinated Notes due 2060" },
-    { symbol: "MGRD", name: "Affiliated Managers Group, Inc. 4.200% Junior Subordinated Notes due 2061" },
-    { symbol: "MGRE", name: "Affiliated Managers Group, Inc. 6.750% Junior Subordinated Notes due 2064" },
-    { symbol: "MGRO", name: "VanEck ETF Trust VanEck Morningstar Wide Moat Growth ETF" },
-    { symbol: "MGV", name: "Vanguard Mega Cap Value ETF" },
-    { symbol: "MGY", name: "Magnolia Oil & Gas Corporation Class A Common Stock" },
-    { symbol: "MH", name: "McGraw Hill, Inc. Common Stock" },
-    { symbol: "MHD", name: "Blackrock MuniHoldings Fund, Inc. Common Stock" },
-    { symbol: "MHF", name: "Western Asset Municipal High Income Fund, Inc. Common Stock" },
-    { symbol: "MHH", name: "Mastech Digital, Inc Common Stock" },
-    { symbol: "MHK", name: "Mohawk Industries, Inc. Common Stock" },
-    { symbol: "MHLA", name: "Maiden Holdings, Ltd. 6.625% Notes due 2046" },
-    { symbol: "MHN", name: "Blackrock MuniHoldings New York Quality Fund, Inc. Common Stock" },
-    { symbol: "MHNC", name: "Maiden Holdings North America, Ltd. 7.75% Notes due 2043" },
-    { symbol: "MHO", name: "M/I Homes, Inc. Common Stock" },
-    { symbol: "MI", name: "NFT Limited Class A Ordinary Share" },
-    { symbol: "MIAX", name: "Miami International Holdings, Inc. Common Stock" },
-    { symbol: "MID", name: "American Century Mid Cap Growth Impact ETF" },
-    { symbol: "MIDE", name: "Xtrackers S&P MidCap 400 Scored & Screened ETF" },
-    { symbol: "MIDU", name: "Direxion Mid Cap Bull 3X Shares" },
-    { symbol: "MIG", name: "VanEck Moody's Analytics IG Corporate Bond ETF" },
-    { symbol: "MILK", name: "Pacer Funds Trust Pacer US Cash Cows Bond ETF" },
-    { symbol: "MIN", name: "MFS Intermediate Income Trust Common Stock" },
-    { symbol: "MINN", name: "Trust for Professional Managers Mairs & Power Minnesota Municipal Bond ETF" },
-    { symbol: "MINO", name: "PIMCO Municipal Income Opportunities Active Exchange-Traded Fund" },
-    { symbol: "MINT", name: "PIMCO Enhanced Short Maturity Active Exchange-Traded Fund" },
-    { symbol: "MINV", name: "Matthews International Funds Matthews Asia Innovators Active ETF" },
-    { symbol: "MIR", name: "Mirion Technologies, Inc. Class A Common Stock" },
-    { symbol: "MISL", name: "First Trust Exchange-Traded Fund First Trust Indxx Aerospace & Defense ETF" },
-    { symbol: "MITN", name: "AG Mortgage Investment Trust, Inc. 9.500% Senior Notes due 2029" },
-    { symbol: "MITP", name: "AG Mortgage Investment Trust, Inc. 9.500% Senior Notes due 2029" },
-    { symbol: "MITQ", name: "Moving iMage Technologies, Inc. Common Stock" },
-    { symbol: "MITT", name: "AG Mortgage Investment Trust, Inc. Common Stock" },
-    { symbol: "MITT$A", name: "AG Mortgage Investment Trust, Inc. 8.25% Preferred Series A" },
-    { symbol: "MITT$B", name: "AG Mortgage Investment Trust, Inc. Preferred Series B" },
-    { symbol: "MITT$C", name: "AG Mortgage Investment Trust, Inc. 8.00% Series C Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock, $0.01 par value per share" },
-    { symbol: "MIY", name: "Blackrock MuniYield Michigan Quality Fund, Inc. Common Stock" },
-    { symbol: "MJ", name: "Amplify ETF Trust Amplify Alternative Harvest ETF" },
-    { symbol: "MKC", name: "McCormick & Company, Incorporated Common Stock" },
-    { symbol: "MKC.V", name: "McCormick & Company, Incorporated Common Stock" },
-    { symbol: "MKL", name: "Markel Group Inc. Common Stock" },
-    { symbol: "MKOR", name: "Matthews International Funds Matthews Korea Active ETF" },
-    { symbol: "MLDR", name: "Global X Funds Global X Intermediate-Term Treasury Ladder ETF" },
-    { symbol: "MLI", name: "Mueller Industries, Inc. Common Stock" },
-    { symbol: "MLM", name: "Martin Marietta Materials, Inc. Common Stock" },
-    { symbol: "MLN", name: "VanEck ETF Trust VanEck Long Muni ETF" },
-    { symbol: "MLNK", name: "MeridianLink, Inc. Common Stock" },
-    { symbol: "MLP", name: "Maui Land & Pineapple Company, Inc. Common Stock" },
-    { symbol: "MLPA", name: "Global X MLP ETF" },
-    { symbol: "MLPB", name: "ETRACS Alerian MLP Infrastructure Index ETN Series B due April 2, 2040" },
-    { symbol: "MLPD", name: "Global X Funds Global X MLP & Energy Infrastructure Covered Call ETF" },
-    { symbol: "MLPR", name: "ETRACS Quarterly Pay 1.5X Leveraged Alerian MLP Index ETN" },
-    { symbol: "MLPX", name: "Global X MLP & Energy Infrastructure ETF" },
-    { symbol: "MLR", name: "Miller Industries, Inc. Common Stock" },
-    { symbol: "MLSS", name: "Milestone Scientific, Inc. Common Stock" },
-    { symbol: "MMA", name: "Mixed Martial Arts Group Limited Ordinary Shares" },
-    { symbol: "MMAX", name: "iShares Trust iShares Large Cap Max Buffer Mar ETF" },
-    { symbol: "MMC", name: "Marsh & McLennan Companies, Inc. Common Stock" },
-    { symbol: "MMCA", name: "NYLI MacKay California Muni Intermediate ETF" },
-    { symbol: "MMD", name: "NYLI MacKay DefinedTerm Muni Opportunities Fund Common Shares" },
-    { symbol: "MMI", name: "Marcus & Millichap, Inc. Common Stock" },
-    { symbol: "MMIN", name: "NYLI MacKay Muni Insured ETF" },
-    { symbol: "MMIT", name: "NYLI MacKay Muni Intermediate ETF" },
-    { symbol: "MMKT", name: "Texas Capital Funds Trust Texas Capital Government Money Market ETF" },
-    { symbol: "MMLG", name: "First Trust Multi-Manager Large Growth ETF" },
-    { symbol: "MMM", name: "3M Company Common Stock" },
-    { symbol: "MMS", name: "Maximus, Inc. Common Stock" },
-    { symbol: "MMSC", name: "First Trust Multi-Manager Small Cap Opportunities ETF" },
-    { symbol: "MMSD", name: "New York Life Investments Active ETF Trust NYLI MacKay Muni Short Duration ETF" },
-    { symbol: "MMT", name: "MFS Multimarket Income Trust Common Stock" },
-    { symbol: "MMTM", name: "SPDR S&P 1500 Momentum Tilt ETF" },
-    { symbol: "MMU", name: "Western Asset Managed Municipals Fund, Inc. Common Stock" },
-    { symbol: "MNA", name: "NYLI Merger Arbitrage ETF" },
-    { symbol: "MNBD", name: "ALPS ETF Trust ALPS Intermediate Municipal Bond ETF" },
-    { symbol: "MNR", name: "Mach Natural Resources LP Common Units representing Limited Partner Interests" },
-    { symbol: "MNRS", name: "Grayscale Funds Trust Grayscale Bitcoin Miners ETF" },
-    { symbol: "MNSO", name: "MINISO Group Holding Limited American Depositary Shares, each representing four Ordinary Shares" },
-    { symbol: "MNTN", name: "MNTN, Inc. Class A Common Stock" },
-    { symbol: "MO", name: "Altria Group, Inc." },
-    { symbol: "MOAT", name: "VanEck Morningstar Wide Moat ETF" },
-    { symbol: "MOD", name: "Modine Manufacturing Company Common Stock" },
-    { symbol: "MODG", name: "Topgolf Callaway Brands Corp. Common Stock" },
-    { symbol: "MOG.A", name: "Moog Inc. Class A Common Stock" },
-    { symbol: "MOG.B", name: "Moog Inc. Class B Common Stock" },
-    { symbol: "MOGU", name: "MOGU Inc. American Depositary Shares (each  representing 25 Class A Ordinary Shares)" },
-    { symbol: "MOH", name: "Molina Healthcare Inc Common Stock" },
-    { symbol: "MOO", name: "VanEck Agribusiness ETF " },
-    { symbol: "MORT", name: "VanEck Mortgage REIT Income ETF" },
-    { symbol: "MOS", name: "Mosaic Company (The) Common Stock" },
-    { symbol: "MOTE", name: "VanEck Morningstar ESG Moat ETF" },
-    { symbol: "MOTG", name: "VanEck Morningstar Global Wide Moat ETF" },
-    { symbol: "MOTI", name: "VanEck Morningstar International Moat ETF" },
-    { symbol: "MOTO", name: "SmartETFs Smart Transportation & Technology ETF" },
-    { symbol: "MOV", name: "Movado Group Inc. Common Stock" },
-    { symbol: "MP", name: "MP Materials Corp. Common Stock" },
-    { symbol: "MPA", name: "Blackrock MuniYield Pennsylvania Quality Fund Common Stock" },
-    { symbol: "MPC", name: "Marathon Petroleum Corporation Common Stock" },
-    { symbol: "MPLX", name: "MPLX LP Common Units Representing Limited Partner Interests" },
-    { symbol: "MPLY", name: "Strategy Shares Monopoly ETF" },
-    { symbol: "MPRO", name: "Monarch ProCap Index ETF" },
-    { symbol: "MPTI", name: "M-tron Industries, Inc. Common Stock" },
-    { symbol: "MPTI.W", name: "M-tron Industries, Inc. Warrants to Purchase Shares of Common Stock, Expiring on or before April 25, 2028" },
-    { symbol: "MPU", name: "Mega Matrix Inc. Class A Ordinary Shares" },
-    { symbol: "MPV", name: "Barings Participation Investors Common Stock" },
-    { symbol: "MPW", name: "Medical Properties Trust, Inc. common stock" },
-    { symbol: "MPX", name: "Marine Products Corporation Common Stock" },
-    { symbol: "MQT", name: "Blackrock MuniYield Quality Fund II, Inc. Common Stock" },
-    { symbol: "MQY", name: "Blackrock MuniYield Quality Fund, Inc. Common Stock" },
-    { symbol: "MRC", name: "MRC Global Inc. Common Stock" },
-    { symbol: "MRCP", name: "PGIM S&P 500 Buffer 12 ETF - March" },
-    { symbol: "MRGR", name: "ProShares Merger ETF" },
-    { symbol: "MRK", name: "Merck & Company, Inc. Common Stock (new)" },
-    { symbol: "MRNY", name: "Tidal Trust II YieldMax MRNA Option Income Strategy ETF" },
-    { symbol: "MRP", name: "Millrose Properties, Inc. Class A Common Stock" },
-    { symbol: "MRSK", name: "Toews Agility Shares Managed Risk ETF" },
-    { symbol: "MRT", name: "Marti Technologies, Inc. Class A Ordinary Shares" },
-    { symbol: "MS", name: "Morgan Stanley Common Stock" },
-    { symbol: "MS$A", name: "Morgan Stanley Dep Shs repstg 1/1000 Pfd Ser A" },
-    { symbol: "MS$E", name: "Morgan Stanley DEPOSITARY SHARES REP 1/1000TH SHARES FIXED/FLTG PREFERRED STOCK SERIES E" },
-    { symbol: "MS$F", name: "Morgan Stanley Dep Shs Rpstg 1/1000th Int Prd Ser F Fxd to Flag" },
-    { symbol: "MS$I", name: "Morgan Stanley Depository Shares Representing 1/1000th Preferred Series 1 Fixed to Floating Non (Cum)" },
-    { symbol: "MS$K", name: "Morgan Stanley Depositary Shares, each representing 1/1,000th of a share of Fixed-to-Floating Rate Non-Cumulative Preferred Stock,  Series K" },
-    { symbol: "MS$L", name: "Morgan Stanley Depositary Shares, each representing 1/1,000th of a share of 4.875% Non-Cumulative Preferred Stock, Series L" },
-    { symbol: "MS$O", name: "Morgan Stanley Depositary Shares, each representing 1/1,000th of a share of 4.250% Non-Cumulative Preferred Stock, Series O" },
-    { symbol: "MS$P", name: "Morgan Stanley Depositary Shares, each representing 1/1,000th of a share of 6.500% Non-Cumulative Preferred Stock, Series P" },
-    { symbol: "MS$Q", name: "Morgan Stanley Depositary Shares, each representing 1/1,000th of a share of 6.625% Non-Cumulative Preferred Stock, Series Q" },
-    { symbol: "MSA", name: "MSA Safety Incorporated Common Stock" },
-    { symbol: "MSB", name: "Mesabi Trust Common Stock" },
-    { symbol: "MSC", name: "Studio City International Holdings Limited American depositary shares, each representing four  Class A ordinary shares" },
-    { symbol: "MSCI", name: "MSCI Inc. Common Stock" },
-    { symbol: "MSD", name: "Morgan Stanley Emerging Markets Debt Fund, Inc. Common Stock" },
-    { symbol: "MSDL", name: "Morgan Stanley Direct Lending Fund Common Stock" },
-    { symbol: "MSFO", name: "Tidal ETF Trust II YieldMax MSFT Option Income Strategy ETF" },
-    { symbol: "MSFW", name: "Roundhill ETF Trust Roundhill MSFT WeeklyPay ETF" },
-    { symbol: "MSFX", name: "ETF Opportunities Trust T-Rex 2X Long Microsoft Daily Target ETF" },
-    { symbol: "MSFY", name: "Kurv Yield Premium Strategy Microsoft (MSFT) ETF" },
-    { symbol: "MSGE", name: "Madison Square Garden Entertainment Corp. Class A Common Stock" },
-    { symbol: "MSGS", name: "Madison Square Garden Sports Corp. Class A Common Stock (New)" },
-    { symbol: "MSI", name: "Motorola Solutions, Inc. Common Stock" },
-    { symbol: "MSIF", name: "MSC Income Fund, Inc. Common Stock" },
-    { symbol: "MSII", name: "REX MSTR Growth & Income ETF" },
-    { symbol: "MSLC", name: "Morgan Stanley Pathway Funds Morgan Stanley Pathway Large Cap Equity ETF" },
-    { symbol: "MSM", name: "MSC Industrial Direct Company, Inc. Common Stock" },
-    { symbol: "MSMR", name: "ETF Series Solutions McElhenny Sheffield Managed Risk ETF" },
-    { symbol: "MSN", name: "Emerson Radio Corporation Common Stock" },
-    { symbol: "MSOO", name: "Themes ETF Trust Leverage Shares 2x Capped Accelerated MSTR Monthly ETF" },
-    { symbol: "MSOS", name: "AdvisorShares Trust AdvisorShares Pure US Cannabis ETF" },
-    { symbol: "MSOX", name: "AdvisorShares MSOS Daily Leveraged ETF" },
-    { symbol: "MSSM", name: "Morgan Stanley Pathway Funds Morgan Stanley Pathway Small-Mid Cap Equity ETF" },
-    { symbol: "MSSS", name: "Northern Lights Fund Trust IV Monarch Select Subsector Index ETF" },
-    { symbol: "MSTB", name: "LHA Market State Tactical Beta ETF" },
-    { symbol: "MSTI", name: "Madison ETFs Trust Madison Short Term Strategic Income ETF" },
-    { symbol: "MSTQ", name: "ETF Series Solutions LHA Market State Tactical Q ETF" },
-    { symbol: "MSTU", name: "ETF Opportunities Trust T-Rex 2X Long MSTR Daily Target ETF" },
-    { symbol: "MSTW", name: "Roundhill ETF Trust Roundhill MSTR WeeklyPay ETF" },
-    { symbol: "MSTY", name: "Tidal Trust II YieldMax MSTR Option Income Strategy ETF" },
-    { symbol: "MSTZ", name: "ETF Opportunities Trust T-Rex 2X Inverse MSTR Daily Target ETF" },
-    { symbol: "MT", name: "Arcelor Mittal NY Registry Shares NEW" },
-    { symbol: "MTA", name: "Metalla Royalty & Streaming Ltd. Common Shares" },
-    { symbol: "MTAL", name: "MAC Copper Limited Ordinary Shares" },
-    { symbol: "MTB", name: "M&T Bank Corporation Common Stock" },
-    { symbol: "MTB$H", name: "M&T Bank Corporation Perpetual Fixed-to-Floating Rate Non-Cumulative Preferred Stock, Series H" },
-    { symbol: "MTB$J", name: "M&T Bank Corporation Depositary Shares each representing a 1/400th ownership interest in a share of Perpetual 7.500% Non-Cumulative Preferred Stock, Series J" },
-    { symbol: "MTBA", name: "Simplify Exchange Traded Funds Simplify MBS ETF" },
-    { symbol: "MTD", name: "Mettler-Toledo International, Inc. Common Stock" },
-    { symbol: "MTDR", name: "Matador Resources Company Common Stock" },
-    { symbol: "MTEST", name: "NYSE Texas, Inc. TEST Common Stock" },
-    { symbol: "MTG", name: "MGIC Investment Corporation Common Stock" },
-    { symbol: "MTGP", name: "WisdomTree Mortgage Plus Bond Fund" },
-    { symbol: "MTH", name: "Meritage Homes Corporation Common Stock" },
-    { symbol: "MTN", name: "Vail Resorts, Inc. Common Stock" },
-    { symbol: "MTNB", name: "Matinas Biopharma Holdings, Inc. Common Stock" },
-    { symbol: "MTR", name: "Mesa Royalty Trust Common Stock" },
-    { symbol: "MTRA", name: "Invesco International Growth Focus ETF" },
-    { symbol: "MTRN", name: "Materion Corporation" },
-    { symbol: "MTUL", name: "ETRACS 2x Leveraged MSCI US Momentum Factor TR ETN" },
-    { symbol: "MTUM", name: "iShares MSCI USA Momentum Factor ETF" },
-    { symbol: "MTUS", name: "Metallus Inc. Common Shares" },
-    { symbol: "MTW", name: "Manitowoc Company, Inc. (The) Common Stock" },
-    { symbol: "MTX", name: "Minerals Technologies Inc. Common Stock" },
-    { symbol: "MTZ", name: "MasTec, Inc. Common Stock" },
-    { symbol: "MUA", name: "Blackrock MuniAssets Fund, Inc Common Stock" },
-    { symbol: "MUB", name: "iShares National Muni Bond ETF" },
-    { symbol: "MUC", name: "Blackrock MuniHoldings California Quality Fund, Inc.  Common Stock" },
-    { symbol: "MUE", name: "Blackrock MuniHoldings Quality Fund II, Inc. Common Stock" },
-    { symbol: "MUFG", name: "Mitsubishi UFJ Financial Group, Inc. Common Stock" },
-    { symbol: "MUJ", name: "Blackrock MuniHoldings New Jersey Quality Fund, Inc. Common Stock" },
-    { symbol: "MUNA", name: "Northern Funds Northern Trust 2030 Tax-Exempt Distributing Ladder ETF" },
-    { symbol: "MUNB", name: "Northern Funds Northern Trust 2035 Tax-Exempt Distributing Ladder ETF" },
-    { symbol: "MUNC", name: "Northern Funds Northern Trust 2045 Tax-Exempt Distributing Ladder ETF" },
-    { symbol: "MUND", name: "Northern Funds Northern Trust 2055 Tax-Exempt Distributing Ladder ETF" },
-    { symbol: "MUNI", name: "PIMCO Intermediate Municipal Bond Active Exchange-Traded Fund" },
-    { symbol: "MUNY", name: "Vanguard New York Tax-Exempt Bond ETF" },
-    { symbol: "MUR", name: "Murphy Oil Corporation Common Stock" },
-    { symbol: "MUSA", name: "Murphy USA Inc. Common Stock" },
-    { symbol: "MUSE", name: "TCW Multisector Credit Income ETF" },
-    { symbol: "MUSI", name: "American Century Multisector Income ETF" },
-    { symbol: "MUSQ", name: "MUSQ Global Music Industry Index ETF" },
-    { symbol: "MUST", name: "Columbia Multi-Sector Municipal Income ETF" },
-    { symbol: "MUX", name: "McEwen Inc. Common Stock" },
-    { symbol: "MVAL", name: "VanEck ETF Trust VanEck Morningstar Wide Moat Value ETF" },
-    { symbol: "MVF", name: "Blackrock MuniVest Fund, Inc. Common Stock" },
-    { symbol: "MVFD", name: "Northern Lights Fund Trust IV Monarch Volume Factor Dividend Tree Index ETF" },
-    { symbol: "MVFG", name: "Northern Lights Fund Trust IV Monarch Volume Factor Global Unconstrained Index ETF" },
-    { symbol: "MVO", name: "MV Oil Trust Units of Beneficial Interests" },
-    { symbol: "MVPA", name: "Advisor Managed Portfolios Miller Value Partners Appreciation ETF" },
-    { symbol: "MVPL", name: "Advisor Managed Portfolios Miller Value Partners Leverage ETF" },
-    { symbol: "MVRL", name: "ETRACS Monthly Pay 1.5X Leveraged Mortgage REIT ETN" },
-    { symbol: "MVT", name: "Blackrock MuniVest Fund II, Inc.  Common Stock" },
-    { symbol: "MVV", name: "ProShares Ultra MidCap400" },
-    { symbol: "MWA", name: "MUELLER WATER PRODUCTS Common Stock" },
-    { symbol: "MWG", name: "Multi Ways Holdings Limited Ordinary Shares" },
-    { symbol: "MX", name: "Magnachip Semiconductor Corporation Common Stock" },
-    { symbol: "MXC", name: "Mexco Energy Corporation Common Stock" },
-    { symbol: "MXE", name: "Mexico Equity and Income Fund, Inc. (The) Common Stock" },
-    { symbol: "MXF", name: "Mexico Fund, Inc. (The) Common Stock" },
-    { symbol: "MXI", name: "iShares Global Materials ETF" },
-    { symbol: "MYD", name: "Blackrock MuniYield Fund, Inc.  Common Stock" },
-    { symbol: "MYE", name: "Myers Industries, Inc. Common Stock" },
-    { symbol: "MYI", name: "Blackrock MuniYield Quality Fund III, Inc Common Stock" },
-    { symbol: "MYLD", name: "Cambria ETF Trust Cambria Micro and SmallCap Shareholder Yield ETF" },
-    { symbol: "MYN", name: "Blackrock MuniYield New York Quality Fund, Inc.Common Stock" },
-    { symbol: "MYND", name: "Mynd.ai, Inc. American Depositary Shares" },
-    { symbol: "MYO", name: "Myomo Inc. Common Stock" },
-    { symbol: "MYY", name: "ProShares Short MidCap400" },
-    { symbol: "MZZ", name: "ProShares UltraShort MidCap400" },
-    { symbol: "NABL", name: "N-able, Inc. Common Stock" },
-    { symbol: "NAC", name: "Nuveen California Quality Municipal Income Fund" },
-    { symbol: "NACP", name: "Impact Shares Trust I Impact Shares NAACP Minority Empowerment ETF" },
-    { symbol: "NAD", name: "Nuveen Quality Municipal Income Fund Common Stock" },
-    { symbol: "NAIL", name: "Direxion Daily Homebuilders & Supplies Bull 3X Shares" },
-    { symbol: "NAK", name: "Northern Dynasty Minerals, Ltd. Common Stock" },
-    { symbol: "NAN", name: "Nuveen New York Quality Municipal Income Fund Common Stock" },
-    { symbol: "NANC", name: "Unusual Whales Subversive Democratic Trading ETF" },
-    { symbol: "NANR", name: "SPDR S&P North American Natural Resources ETF" },
-    { symbol: "NAPR", name: "Innovator Growth-100 Power Buffer ETF - April" },
-    { symbol: "NAT", name: "Nordic American Tankers Limited Common Stock" },
-    { symbol: "NATL", name: "NCR Atleos Corporation Common Stock" },
-    { symbol: "NAUG", name: "Innovator ETFs Trust Innovator Growth-100 Power Buffer ETF - August" },
-    { symbol: "NAZ", name: "Nuveen Arizona Quality Municipal Income Fund Common Stock" },
-    { symbol: "NBB", name: "Nuveen Taxable Municipal Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "NBCE", name: "Neuberger Berman ETF Trust Neuberger Berman China Equity ETF" },
-    { symbol: "NBCM", name: "Neuberger Berman ETF Trust Neuberger Berman Commodity Strategy ETF" },
-    { symbol: "NBCR", name: "Neuberger Berman ETF Trust Neuberger Berman Core Equity ETF" },
-    { symbol: "NBDS", name: "Neuberger Berman ETF Trust Neuberger Berman Disrupters ETF" },
-    { symbol: "NBET", name: "Neuberger Berman Energy Transition & Infrastructure ETF" },
-    { symbol: "NBFC", name: "Neuberger Berman ETF Trust Neuberger Berman Flexible Credit Income ETF" },
-    { symbol: "NBGX", name: "Neuberger Berman ETF Trust Neuberger Berman Growth ETF" },
-    { symbol: "NBH", name: "Neuberger Berman Municipal Fund Inc. Common Stock" },
-    { symbol: "NBHC", name: "National Bank Holdings Corporation Common Stock" },
-    { symbol: "NBJP", name: "Neuberger Berman ETF Trust Neuberger Berman Japan Equity ETF" },
-    { symbol: "NBOS", name: "Neuberger Berman ETF Trust Neuberger Berman Option Strategy ETF" },
-    { symbol: "NBR", name: "Nabors Industries Ltd." },
-    { symbol: "NBSD", name: "Neuberger Berman ETF Trust Neuberger Berman Short Duration Income ETF" },
-    { symbol: "NBSM", name: "Neuberger Berman ETF Trust Neuberger Berman Small-Mid Cap ETF" },
-    { symbol: "NBTR", name: "Neuberger Berman ETF Trust Neuberger Berman Total Return Bond ETF" },
-    { symbol: "NBXG", name: "Neuberger Berman Next Generation Connectivity Fund Inc. Common Stock" },
-    { symbol: "NBY", name: "NovaBay Pharmaceuticals, Inc. Common Stock" },
-    { symbol: "NC", name: "NACCO Industries, Inc. Common Stock" },
-    { symbol: "NCA", name: "Nuveen California Municipal Value Fund" },
-    { symbol: "NCDL", name: "Nuveen Churchill Direct Lending Corp. Common Stock" },
-    { symbol: "NCL", name: "Northann Corp. Common Stock" },
-    { symbol: "NCLH", name: "Norwegian Cruise Line Holdings Ltd. Ordinary Shares" },
-    { symbol: "NCLO", name: "NuShares ETF Trust Nuveen AA-BBB CLO ETF" },
-    { symbol: "NCV", name: "Virtus Convertible & Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "NCV$A", name: "Virtus Convertible & Income Fund 5.625% Series A Cumulative Preferred Shares" },
-    { symbol: "NCZ", name: "Virtus Convertible & Income Fund II Common Shares of Beneficial Interest" },
-    { symbol: "NCZ$A", name: "Virtus Convertible & Income Fund II 5.50% Series A Cumulative Preferred Shares" },
-    { symbol: "NDEC", name: "Innovator ETFs Trust Innovator Growth-100 Power Buffer ETF - December" },
-    { symbol: "NDIA", name: "Global X Funds Global X India Active ETF" },
-    { symbol: "NDIV", name: "Amplify ETF Trust Amplify Natural Resources Dividend Income ETF" },
-    { symbol: "NDMO", name: "Nuveen Dynamic Municipal Opportunities Fund Common Shares of Beneficial Interest" },
-    { symbol: "NDOW", name: "Collaborative Investment Series Trust Anydrus Advantage ETF" },
-    { symbol: "NDVG", name: "Nuveen Dividend Growth ETF" },
-    { symbol: "NE", name: "Noble Corporation plc A Ordinary Shares" },
-    { symbol: "NE.A", name: "Noble Corporation plc Tranche 2 Warrants" },
-    { symbol: "NE.W", name: "Noble Corporation plc Tranche 1 Warrants" },
-    { symbol: "NEA", name: "Nuveen AMT-Free Quality Municipal Income Fund Common Shares of Beneficial Interest Par Value $.01" },
-    { symbol: "NEAR", name: "iShares Short Duration Bond Active ETF" },
-    { symbol: "NEBX", name: "Tradr 2X Long NBIS Daily ETF" },
-    { symbol: "NEE", name: "NextEra Energy, Inc. Common Stock" },
-    { symbol: "NEE$N", name: "NextEra Energy, Inc. Series N Junior Subordinated Debentures due March 1, 2079" },
-    { symbol: "NEE$S", name: "NextEra Energy, Inc. 7.299% Corporate Units" },
-    { symbol: "NEE$T", name: "NextEra Energy, Inc. 7.234% Corporate Units" },
-    { symbol: "NEE$U", name: "NextEra Energy, Inc. Series U Junior Subordinated Debentures due June 1, 2085" },
-    { symbol: "NEM", name: "Newmont Corporation" },
-    { symbol: "NEMD", name: "Neuberger Berman ETF Trust Neuberger Berman Emerging Markets Debt Hard Currency ETF" },
-    { symbol: "NEN", name: "New England Realty Associates Limited Partnership Class A Depositary Receipts Evidencing Units of Limited Partnership" },
-    { symbol: "NET", name: "Cloudflare, Inc. Class A Common Stock" },
-    { symbol: "NETL", name: "NETLease Corporate Real Estate ETF" },
-    { symbol: "NEU", name: "NewMarket Corp Common Stock" },
-    { symbol: "NEUE", name: "NeueHealth, Inc. Common Stock" },
-    { symbol: "NEWP", name: "New Pacific Metals Corp. Common Shares" },
-    { symbol: "NEXA", name: "Nexa Resources S.A. Common Shares" },
-    { symbol: "NFEB", name: "Innovator ETFs Trust Innovator Growth-100 Power Buffer ETF - February" },
-    { symbol: "NFG", name: "National Fuel Gas Company Common Stock" },
-    { symbol: "NFGC", name: "New Found Gold Corp Common Shares" },
-    { symbol: "NFJ", name: "Virtus Dividend, Interest & Premium Strategy Fund Common Shares of Beneficial Interest" },
-    { symbol: "NFLP", name: "Kurv Yield Premium Strategy Netflix (NFLX) ETF" },
-    { symbol: "NFLT", name: "Virtus Newfleet Multi-Sector Bond ETF" },
-    { symbol: "NFLU", name: "ETF Opportunities Trust T-Rex 2X Long NFLX Daily Target ETF" },
-    { symbol: "NFLW", name: "Roundhill ETF Trust Roundhill NFLX WeeklyPay ETF" },
-    { symbol: "NFLY", name: "Tidal ETF Trust II YieldMax NFLX Option Income Strategy ETF" },
-    { symbol: "NFRA", name: "FlexShares STOXX Global Broad Infrastructure Index Fund" },
-    { symbol: "NG", name: "Novagold Resources Inc." },
-    { symbol: "NGD", name: "New Gold Inc." },
-    { symbol: "NGG", name: "National Grid Transco, PLC National Grid PLC (NEW) American Depositary Shares" },
-    { symbol: "NGL", name: "NGL ENERGY PARTNERS LP Common Units representing Limited Partner Interests" },
-    { symbol: "NGL$B", name: "NGL ENERGY PARTNERS LP 9.00% Class B Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Units representing limited partnership interests" },
-    { symbol: "NGL$C", name: "NGL ENERGY PARTNERS LP 9.625% Class C Fixed-to-Floating Rate Cumulative  Redeemable Perpetual Preferred Units representing  limited partner interests" },
-    { symbol: "NGS", name: "Natural Gas Services Group, Inc. Common Stock" },
-    { symbol: "NGVC", name: "Natural Grocers by Vitamin Cottage, Inc. Common Stock" },
-    { symbol: "NGVT", name: "Ingevity Corporation Common Stock " },
-    { symbol: "NHC", name: "National HealthCare Corporation Common Stock" },
-    { symbol: "NHI", name: "National Health Investors, Inc. Common Stock" },
-    { symbol: "NHS", name: "Neuberger Berman High Yield Strategies Fund" },
-    { symbol: "NHYM", name: "NuShares ETF Trust Nuveen High Yield Municipal Income ETF" },
-    { symbol: "NI", name: "NiSource Inc Common Stock" },
-    { symbol: "NIC", name: "Nicolet Bankshares Inc. Common Stock" },
-    { symbol: "NIE", name: "Virtus Equity & Convertible Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "NIM", name: "Nuveen Select Maturities Municipal Fund Common Stock" },
-    { symbol: "NINE", name: "Nine Energy Service, Inc. Common Stock" },
-    { symbol: "NIO", name: "NIO Inc. American depositary shares, each  representing one Class A ordinary share" },
-    { symbol: "NIQ", name: "NIQ Global Intelligence plc Ordinary Shares" },
-    { symbol: "NITE", name: "Capitol Series Trust The Nightview Fund NITE" },
-    { symbol: "NJAN", name: "Innovator Growth-100 Power Buffer ETF - January" },
-    { symbol: "NJNK", name: "Columbia ETF Trust I Columbia U.S. High Yield ETF" },
-    { symbol: "NJR", name: "NewJersey Resources Corporation Common Stock" },
-    { symbol: "NJUL", name: "Innovator Growth-100 Power Buffer ETF - July" },
-    { symbol: "NJUN", name: "SHL Telemedicine Ltd Innovator Growth-100 Power Buffer ETF - June" },
-    { symbol: "NKE", name: "Nike, Inc. Common Stock" },
-    { symbol: "NKX", name: "Nuveen California AMT-Free Quality Municipal Income Fund" },
-    { symbol: "NL", name: "NL Industries, Inc. Common Stock" },
-    { symbol: "NLOP", name: "Net Lease Office Properties Common Shares of Beneficial Interest" },
-    { symbol: "NLR", name: "VanEck Uranium and Nuclear ETF" },
-    { symbol: "NLY", name: "Annaly Capital Management Inc. Common Stock" },
-    { symbol: "NLY$F", name: "Annaly Capital Management Inc 6.95% Series F" },
-    { symbol: "NLY$G", name: "Annaly Capital Management Inc 6.50% Series G Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "NLY$I", name: "Annaly Capital Management Inc 6.750% Series I Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "NLY$J", name: "Annaly Capital Management Inc. 8.875% Series J Fixed-Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "NMAI", name: "Nuveen Multi-Asset Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "NMAR", name: "Innovator ETFs Trust Innovator Growth-100 Power Buffer ETF - March" },
-    { symbol: "NMAX", name: "Newsmax, Inc. Class B Common Stock" },
-    { symbol: "NMAY", name: "Innovator ETFs Trust Innovator Growth-100 Power Buffer ETF - May" },
-    { symbol: "NMB", name: "Simplify Exchange Traded Funds Simplify National Muni Bond ETF" },
-    { symbol: "NMCO", name: "Nuveen Municipal Credit Opportunities Fund Common Shares" },
-    { symbol: "NMG", name: "Nouveau Monde Graphite Inc. Common Shares" },
-    { symbol: "NMI", name: "Nuveen Municipal Income Fund, Inc. Common Stock" },
-    { symbol: "NML", name: "Neuberger Berman Energy Infrastructure and Income Fund Inc. Common Stock" },
-    { symbol: "NMM", name: "Navios Maritime Partners LP Common Units Representing Limited Partner Interests" },
-    { symbol: "NMR", name: "Nomura Holdings Inc ADR American Depositary Shares" },
-    { symbol: "NMS", name: "Nuveen Minnesota Quality Municipal Income Fund " },
-    { symbol: "NMT", name: "Nuveen Massachusetts Quality Municipal Income Fund Common Stock" },
-    { symbol: "NMZ", name: "Nuveen Municipal High Income Opportunity Fund Common Stock, $0.01 par value, per share" },
-    { symbol: "NNI", name: "Nelnet, Inc. Common Stock" },
-    { symbol: "NNN", name: "NNN REIT, Inc. Common Stock" },
-    { symbol: "NNOV", name: "Innovator ETFs Trust Innovator Growth-100 Power Buffer ETF - November" },
-    { symbol: "NNVC", name: "NanoViricides, Inc. Common Stock" },
-    { symbol: "NNY", name: "Nuveen New York Municipal Value Fund Common Stock" },
-    { symbol: "NOA", name: "North American Construction Group Ltd. Common Shares (no par)" },
-    { symbol: "NOAH", name: "Noah Holdings Limited American Depositary Shares" },
-    { symbol: "NOBL", name: "ProShares S&P 500 Dividend Aristocrats ETF" },
-    { symbol: "NOC", name: "Northrop Grumman Corporation Common Stock" },
-    { symbol: "NOCT", name: "Innovator Growth-100 Power Buffer ETF- October" },
-    { symbol: "NODE", name: "VanEck Onchain Economy ETF" },
-    { symbol: "NOG", name: "Northern Oil and Gas, Inc. Common Stock" },
-    { symbol: "NOK", name: "Nokia Corporation Sponsored American Depositary Shares" },
-    { symbol: "NOM", name: "Nuveen Missouri Quality Municipal Income Fund " },
-    { symbol: "NOMD", name: "Nomad Foods Limited Ordinary Shares" },
-    { symbol: "NORW", name: "Global X MSCI Norway ETF" },
-    { symbol: "NOTE", name: "FiscalNote Holdings, Inc. Class A common stock" },
-    { symbol: "NOTE.W", name: "FiscalNote Holdings, Inc. Warrants to purchase one share of Class A common stock, each at an exercise price of $11.50 per share" },
-    { symbol: "NOV", name: "NOV Inc. Common Stock" },
-    { symbol: "NOVM", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Max Buffer ETF - November" },
-    { symbol: "NOVP", name: "PGIM S&P 500 Buffer 12 ETF - November" },
-    { symbol: "NOVZ", name: "TrueShares Structured Outcome (November) ETF" },
-    { symbol: "NOW", name: "ServiceNow, Inc. Common Stock" },
-    { symbol: "NPB", name: "Northpointe Bancshares, Inc. Common Stock" },
-    { symbol: "NPCT", name: "Nuveen Core Plus Impact Fund Common Shares of Beneficial Interest" },
-    { symbol: "NPFD", name: "Nuveen Variable Rate Preferred & Income Fund Common Shares" },
-    { symbol: "NPK", name: "National Presto Industries, Inc. Common Stock" },
-    { symbol: "NPKI", name: "NPK International Inc. Common Stock" },
-    { symbol: "NPO", name: "Enpro Inc. Common Stock" },
-    { symbol: "NPV", name: "Nuveen Virginia Quality Municipal Income Fund Common Stock" },
-    { symbol: "NPWR", name: "NET Power Inc. Class A Common Stock" },
-    { symbol: "NPWR.W", name: "NET Power Inc. Redeemable warrants, each whole warrant exercisable for one share of Class A Common Stock at an exercise price of $11.50" },
-    { symbol: "NQP", name: "Nuveen Pennsylvania Quality Municipal Income Fund Common Stock" },
-    { symbol: "NRDY", name: "Nerdy Inc. Class A Common Stock" },
-    { symbol: "NREF", name: "NexPoint Real Estate Finance, Inc. Common Stock" },
-    { symbol: "NREF$A", name: "NexPoint Real Estate Finance, Inc. 8.50% Series A Cumulative Redeemable Preferred Stock" },
-    { symbol: "NRG", name: "NRG Energy, Inc. Common Stock" },
-    { symbol: "NRGD", name: "Bank Of Montreal MicroSectors  U.S. Big Oil -3  Inverse Leveraged ETNs due February 17, 2045" },
-    { symbol: "NRGU", name: "Bank Of Montreal MicroSectors U.S. Big Oil 3 Leveraged ETNs due February 17, 2045" },
-    { symbol: "NRGV", name: "Energy Vault Holdings, Inc. Common Stock" },
-    { symbol: "NRK", name: "Nuveen New York AMT-Free Quality Municipal Income Fund " },
-    { symbol: "NRO", name: "Neuberger Berman Real Estate Securities Income Fund, Inc." },
-    { symbol: "NRP", name: "Natural Resource Partners LP Limited Partnership" },
-    { symbol: "NRSH", name: "Aztlan North America Nearshoring Stock Selection ETF" },
-    { symbol: "NRT", name: "North European Oil Royality Trust Common Stock" },
-    { symbol: "NRUC", name: "National Rural Utilities Cooperative Finance Corporation 5.500% Subordinated Notes due 2064 (Subordinated Deferrable Interest Notes)" },
-    { symbol: "NRXS", name: "Neuraxis, Inc. Common Stock" },
-    { symbol: "NSA", name: "National Storage Affiliates Trust Common Shares of Beneficial Interest" },
-    { symbol: "NSA$A", name: "National Storage Affiliates Trust 6.000% Series A Cumulative Redeemable Preferred Shares of Beneficial Interest (Liquidation Preference $25.00 per share)" },
-    { symbol: "NSA$B", name: "National Storage Affiliates Trust 6.000% Series B Cumulative Redeemable Preferred Shares of Beneficial Interest" },
-    { symbol: "NSC", name: "Norfolk Southern Corporation Common Stock" },
-    { symbol: "NSEP", name: "Innovator U.S. Small Cap Power Buffer ETF - September Innovator Growth-100 Power Buffer ETF - September" },
-    { symbol: "NSP", name: "Insperity, Inc. Common Stock" },
-    { symbol: "NSRX", name: "Nasus Pharma Ltd. Ordinary Shares" },
-    { symbol: "NTB", name: "Bank of N.T. Butterfield & Son Limited (The) Voting Ordinary Shares" },
-    { symbol: "NTEST", name: "NYSE Tick Pilot Test Sym-Control" },
-    { symbol: "NTEST.A", name: "NYSE Tick Pilot Test Sym-G1" },
-    { symbol: "NTEST.B", name: "NYSE Tick Pilot Test Sym-G2" },
-    { symbol: "NTEST.C", name: "Tick Pilot Test C Common Stock" },
-    { symbol: "NTIP", name: "Network-1 Technologies, Inc. Common Stock" },
-    { symbol: "NTR", name: "Nutrien Ltd. Common Shares" },
-    { symbol: "NTSE", name: "WisdomTree Trust WisdomTree Emerging Markets Efficient Core Fund" },
-    { symbol: "NTSI", name: "WisdomTree Trust WisdomTree International Efficient Core Fund" },
-    { symbol: "NTST", name: "NetSTREIT Corp. Common Stock" },
-    { symbol: "NTSX", name: "WisdomTree U.S. Efficient Core Fund" },
-    { symbol: "NTZ", name: "Natuzzi, S.p.A." },
-    { symbol: "NU", name: "Nu Holdings Ltd. Class A Ordinary Shares" },
-    { symbol: "NUAG", name: "Nuveen Enhanced Yield U.S. Aggregate Bond ETF" },
-    { symbol: "NUBD", name: "Nuveen ESG U.S. Aggregate Bond ETF" },
-    { symbol: "NUDM", name: "Nuveen ESG International Developed Markets Equity ETF" },
-    { symbol: "NUDV", name: "Nuveen ESG Dividend ETF" },
-    { symbol: "NUE", name: "Nucor Corporation Common Stock" },
-    { symbol: "NUEM", name: "Nuveen ESG Emerging Markets Equity ETF" },
-    { symbol: "NUGO", name: "Nuveen Growth Opportunities ETF" },
-    { symbol: "NUGT", name: "Direxion Daily Gold Miners Index Bull 2XShares" },
-    { symbol: "NUHY", name: "Nuveen ESG High Yield Corporate Bond ETF" },
-    { symbol: "NUKZ", name: "Exchange Traded Concepts Trust Range Nuclear Renaissance Index ETF" },
-    { symbol: "NULC", name: "Nuveen ESG Large-Cap ETF" },
-    { symbol: "NULG", name: "Nuveen ESG Large-Cap Growth ETF" },
-    { symbol: "NULV", name: "Nuveen ESG Large-Cap Value ETF" },
-    { symbol: "NUMG", name: "Nuveen ESG Mid-Cap Growth ETF" },
-    { symbol: "NUMI", name: "NuShares ETF Trust Nuveen Municipal Income ETF" },
-    { symbol: "NUMV", name: "Nuveen ESG Mid-Cap Value ETF" },
-    { symbol: "NURE", name: "Nuveen Short-Term REIT ETF" },
-    { symbol: "NUS", name: "Nu Skin Enterprises, Inc. Common Stock" },
-    { symbol: "NUSA", name: "Nuveen ESG 1-5 Year U.S. Aggregate Bond ETF" },
-    { symbol: "NUSC", name: "Nuveen ESG Small-Cap ETF" },
-    { symbol: "NUV", name: "Nuveen Municipal Value Fund, Inc. Common Stock" },
-    { symbol: "NUVB", name: "Nuvation Bio Inc. Class A Common Stock" },
-    { symbol: "NUVB.W", name: "Nuvation Bio Inc. Warrants" },
-    { symbol: "NUW", name: "Nuveen AMT-Free Municipal Value Fund" },
-    { symbol: "NVBT", name: "AIM ETF Products Trust AllianzIM U.S. Large Cap Buffer10 Nov ETF" },
-    { symbol: "NVBU", name: "AIM ETF Products Trust AllianzIM U.S. Equity Buffer15 Uncapped Nov ETF" },
-    { symbol: "NVBW", name: "AIM ETF Products Trust AllianzIM U.S. Large Cap Buffer20 Nov ETF" },
-    { symbol: "NVDO", name: "Themes ETF Trust Leverage Shares 2x Capped Accelerated NVDA Monthly ETF" },
-    { symbol: "NVDQ", name: "ETF Opportunities Trust T-Rex 2X Inverse NVIDIA Daily Target ETF" },
-    { symbol: "NVDW", name: "Roundhill ETF Trust Roundhill NVDA WeeklyPay ETF" },
-    { symbol: "NVDX", name: "ETF Opportunities Trust T-Rex 2X Long NVIDIA Daily Target ETF" },
-    { symbol: "NVDY", name: "Tidal ETF Trust II YieldMax NVDA Option Income Strategy ETF" },
-    { symbol: "NVG", name: "Nuveen AMT-Free Municipal Credit Income Fund " },
-    { symbol: "NVGS", name: "Navigator Holdings Ltd. Ordinary Shares (Marshall Islands)" },
-    { symbol: "NVII", name: "REX NVDA Growth & Income ETF" },
-    { symbol: "NVIR", name: "Listed Funds Trust Horizon Kinetics Energy and Remediation ETF" },
-    { symbol: "NVO", name: "Novo Nordisk A/S Common Stock" },
-    { symbol: "NVOH", name: "Precidian ETFs Trust Novo Nordisk A/S B Shares ADRhedged" },
-    { symbol: "NVOX", name: "Tidal Trust II Defiance Daily Target 2X Long NVO ETF" },
-    { symbol: "NVR", name: "NVR, Inc. Common Stock" },
-    { symbol: "NVRI", name: "Enviri Corporation Common Stock" },
-    { symbol: "NVS", name: "Novartis AG Common Stock" },
-    { symbol: "NVST", name: "Envista Holdings Corporation Common Stock" },
-    { symbol: "NVT", name: "nVent Electric plc Ordinary Shares " },
-    { symbol: "NVTX", name: "Tradr 2X Long NVTS Daily ETF" },
-    { symbol: "NWG", name: "NatWest Group plc American Depositary Shares, (each representing two (2) Ordinary Shares)" },
-    { symbol: "NWLG", name: "Nuveen Winslow Large-Cap Growth ESG ETF" },
-    { symbol: "NWN", name: "Northwest Natural Holding Company Common Stock" },
-    { symbol: "NX", name: "Quanex Building Products Corporation Common Stock" },
-    { symbol: "NXC", name: "Nuveen California Select Tax-Free Income Portfolio Common Stock" },
-    { symbol: "NXDR", name: "Nextdoor Holdings, Inc. Class A Common Stock" },
-    { symbol: "NXDT", name: "NexPoint Diversified Real Estate Trust Common Stock" },
-    { symbol: "NXDT$A", name: "NexPoint Diversified Real Estate Trust 5.50% Series A Cumulative Preferred Shares ($25.00 liquidation preference per share)" },
-    { symbol: "NXE", name: "Nexgen Energy Ltd. Common Shares" },
-    { symbol: "NXG", name: "NXG NextGen Infrastructure Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "NXJ", name: "Nuveen New Jersey Qualified Municipal Fund " },
-    { symbol: "NXN", name: "Nuveen New York Select Tax-Free Income Portfolio Common Stock" },
-    { symbol: "NXP", name: "Nuveen Select Tax Free Income Portfolio Common Stock" },
-    { symbol: "NXRT", name: "NexPoint Residential Trust, Inc. Common Stock" },
-    { symbol: "NXTE", name: "Investment Managers Series Trust II AXS Green Alpha ETF" },
-    { symbol: "NXTI", name: "Simplify Exchange Traded Funds Simplify Next Intangible Core Index ETF" },
-    { symbol: "NYC", name: "American Strategic Investment Co. Class A Common Stock" },
-    { symbol: "NYF", name: "iShares New York Muni Bond ETF" },
-    { symbol: "NYT", name: "New York Times Company (The) Common Stock" },
-    { symbol: "NZF", name: "Nuveen Municipal Credit Income Fund " },
-    { symbol: "O", name: "Realty Income Corporation Common Stock" },
-    { symbol: "OACP", name: "Unified Series Trust OneAscent Core Plus Bond ETF" },
-    { symbol: "OAEM", name: "Unified Series Trust OneAscent Emerging Markets ETF" },
-    { symbol: "OAIM", name: "Unified Series Trust OneAscent International Equity ETF" },
-    { symbol: "OAK$A", name: "Brookfield Oaktree Holdings, LLC 6.625% Series A Preferred Units" },
-    { symbol: "OAK$B", name: "Brookfield Oaktree Holdings, LLC 6.550% Series B Preferred Units" },
-    { symbol: "OAKM", name: "Harris Oakmark ETF Trust Oakmark U.S. Large Cap ETF" },
-    { symbol: "OALC", name: "Unified Series Trust OneAscent Large Cap Core ETF" },
-    { symbol: "OARK", name: "YieldMax Innovation Option Income Strategy ETF" },
-    { symbol: "OASC", name: "Unified Series Trust OneAscent Small Cap Core ETF" },
-    { symbol: "OBDC", name: "Blue Owl Capital Corporation Common Stock" },
-    { symbol: "OBE", name: "Obsidian Energy Ltd. Common Shares" },
-    { symbol: "OBK", name: "Origin Bancorp, Inc. Common Stock" },
-    { symbol: "OBND", name: "SPDR Loomis Sayles Opportunistic Bond ETF" },
-    { symbol: "OBOR", name: "KraneShares MSCI One Belt One Road Index ETF" },
-    { symbol: "OC", name: "Owens Corning Inc Common Stock New" },
-    { symbol: "OCFS", name: "Professionally Managed Portfolios Otter Creek Focus Strategy ETF" },
-    { symbol: "OCFT", name: "OneConnect Financial Technology Co., Ltd. American Depositary Shares, each representing thirty ordinary shares" },
-    { symbol: "OCIO", name: "ClearShares OCIO ETF" },
-    { symbol: "OCTD", name: "Innovator ETFs Trust Innovator Premium Income 10 Barrier ETF - October" },
-    { symbol: "OCTH", name: "Innovator ETFs Trust Innovator Premium Income 20 Barrier ETF - October" },
-    { symbol: "OCTJ", name: "Innovator ETFs Trust Innovator Premium Income 30 Barrier ETF - October" },
-    { symbol: "OCTM", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Max Buffer ETF - October" },
-    { symbol: "OCTP", name: "PGIM S&P 500 Buffer 12 ETF - October" },
-    { symbol: "OCTQ", name: "Innovator ETFs Trust Innovator Premium Income 40 Barrier ETF - October" },
-    { symbol: "OCTT", name: "AllianzIM U.S. Large Cap Buffer10 Oct ETF" },
-    { symbol: "OCTU", name: "AIM ETF Products Trust AllianzIM U.S. Equity Buffer15 Uncapped Oct ETF" },
-    { symbol: "OCTW", name: "AllianzIM U.S. Large Cap Buffer20 Oct ETF" },
-    { symbol: "OCTZ", name: "TrueShares Structured Outcome (October) ETF" },
-    { symbol: "ODC", name: "Oil-Dri Corporation Of America Common Stock" },
-    { symbol: "ODHY", name: "Spinnaker ETF Series Obra Defensive High Yield ETF" },
-    { symbol: "ODV", name: "Osisko Development Corp. Common Shares" },
-    { symbol: "OEC", name: "Orion S.A. Common Shares" },
-    { symbol: "OEF", name: "iShares S&P 100 ETF" },
-    { symbol: "OEUR", name: "ALPS OShares Europe Quality Dividend ETF" },
-    { symbol: "OFG", name: "OFG Bancorp Common Stock" },
-    { symbol: "OGCP", name: "Empire State Realty OP, L.P. Series 60 Operating Partnership Units Representing Limited Partnership Interests" },
-    { symbol: "OGE", name: "OGE Energy Corp Common Stock" },
-    { symbol: "OGEN", name: "Oragenics Inc. Common Stock" },
-    { symbol: "OGIG", name: "ALPS O'Shares Global Internet Giants ETF" },
-    { symbol: "OGN", name: "Organon & Co. Common Stock " },
-    { symbol: "OGS", name: "ONE Gas, Inc. Common Stock" },
-    { symbol: "OGSP", name: "Spinnaker ETF Series Obra High Grade Structured Products ETF" },
-    { symbol: "OHI", name: "Omega Healthcare Investors, Inc. Common Stock" },
-    { symbol: "OI", name: "O-I Glass, Inc. Common Stock" },
-    { symbol: "OIA", name: "Invesco Municipal Income Opportunities Trust Common Stock" },
-    { symbol: "OIH", name: "VanEck Oil Services ETF" },
-    { symbol: "OII", name: "Oceaneering International, Inc. Common Stock" },
-    { symbol: "OILD", name: "MicroSectors Oil & Gas Exp. & Prod. -3x Inverse Leveraged ETN" },
-    { symbol: "OILK", name: "ProShares K-1 Free Crude Oil ETF" },
-    { symbol: "OILT", name: "Texas Capital Funds Trust Texas Capital Texas Oil Index ETF" },
-    { symbol: "OILU", name: "MicroSectors Oil & Gas Exp. & Prod. 3x Leveraged ETN" },
-    { symbol: "OIS", name: "Oil States International, Inc. Common Stock" },
-    { symbol: "OKE", name: "ONEOK, Inc. Common Stock" },
-    { symbol: "OKLO", name: "Oklo Inc. Class A common stock" },
-    { symbol: "OLN", name: "Olin Corporation Common Stock" },
-    { symbol: "OLO", name: "Olo Inc. Class A Common Stock" },
-    { symbol: "OLP", name: "One Liberty Properties, Inc. Common Stock" },
-    { symbol: "OMAH", name: "Tidal Trust III VistaShares Target 15 Berkshire Select Income ETF" },
-    { symbol: "OMC", name: "Omnicom Group Inc. Common Stock" },
-    { symbol: "OMF", name: "OneMain Holdings, Inc. Common Stock" },
-    { symbol: "OMFL", name: "Invesco Exchange-Traded Self-Indexed Fund Trust Invesco Russell 1000 Dynamic Multifactor ETF" },
-    { symbol: "OMFS", name: "Invesco Exchange-Traded Self-Indexed Fund Trust Invesco Russell 2000 Dynamic Multifactor ETF" },
-    { symbol: "OMI", name: "Owens & Minor, Inc. Common Stock" },
-    { symbol: "OND", name: "ProShares On-Demand ETF" },
-    { symbol: "ONEO", name: "SPDR Russell 1000 Momentum Focus ETF" },
-    { symbol: "ONEV", name: "SPDR Russell 1000 Low Volatility Focus ETF" },
-    { symbol: "ONEY", name: "SPDR Russell 1000 Yield Focus ETF" },
-    { symbol: "ONEZ", name: "Elevation Series Trust TrueShares Seasonality Laddered Buffered ETF" },
-    { symbol: "ONIT", name: "Onity Group Inc. Common Stock" },
-    { symbol: "ONL", name: "Orion Properties Inc. Common Stock" },
-    { symbol: "ONLN", name: "ProShares Online Retail ETF" },
-    { symbol: "ONOF", name: "Global X Adaptive U.S. Risk Management ETF" },
-    { symbol: "ONON", name: "On Holding AG Class A Ordinary Shares" },
-    { symbol: "ONTF", name: "ON24, Inc. Common Stock" },
-    { symbol: "ONTO", name: "Onto Innovation Inc. Common Stock" },
-    { symbol: "OOMA", name: "Ooma, Inc. Common Stock" },
-    { symbol: "OOSP", name: "Spinnaker ETF Series Obra Opportunistic Structured Products ETF" },
-    { symbol: "OPAD", name: "Offerpad Solutions Inc. Class A Common Stock" },
-    { symbol: "OPER", name: "ETF Series Solutions ETF ClearShares Ultra-Short Maturity ETF" },
-    { symbol: "OPFI", name: "OppFi Inc. Class A Common Stock" },
-    { symbol: "OPFI.W", name: "OppFi Inc. Warrants" },
-    { symbol: "OPHC", name: "OptimumBank Holdings, Inc. Common Stock" },
-    { symbol: "OPP", name: "RiverNorth/DoubleLine Strategic Opportunity Fund, Inc. Common Stock" },
-    { symbol: "OPP$A", name: "RiverNorth/DoubleLine Strategic Opportunity Fund, Inc. 4.375% Series A Cumulative Preferred Stock" },
-    { symbol: "OPP$B", name: "RiverNorth/DoubleLine Strategic Opportunity Fund, Inc. 4.75% Series B Cumulative Preferred Stock" },
-    { symbol: "OPP$C", name: "RiverNorth/DoubleLine Strategic Opportunity Fund, Inc. 6.00% Series C Term Preferred Stock (Liquidation Preference $10.00 per share)" },
-    { symbol: "OPPE", name: "WisdomTree European Opportunities Fund" },
-    { symbol: "OPTT", name: "Ocean Power Technologies, Inc. Common Stock" },
-    { symbol: "OPY", name: "Oppenheimer Holdings, Inc. Class A Common Stock (DE)" },
-    { symbol: "OR", name: "OR Royalties Inc. Common Shares" },
-    { symbol: "ORA", name: "Ormat Technologies, Inc. Common Stock" },
-    { symbol: "ORC", name: "Orchid Island Capital, Inc. Common Stock" },
-    { symbol: "ORCL", name: "Oracle Corporation Common Stock" },
-    { symbol: "ORI", name: "Old Republic International Corporation Common Stock" },
-    { symbol: "ORLA", name: "Orla Mining Ltd. Common Shares" },
-    { symbol: "ORN", name: "Orion Group Holdings, Inc. Common" },
-    { symbol: "OSCR", name: "Oscar Health, Inc. Class A Common Stock" },
-    { symbol: "OSCV", name: "Opus Small Cap Value ETF" },
-    { symbol: "OSEA", name: "Harbor ETF Trust Harbor International Compounders ETF" },
-    { symbol: "OSK", name: "Oshkosh Corporation (Holding Company)Common Stock" },
-    { symbol: "OSTX", name: "OS Therapies Incorporated Common Stock" },
-    { symbol: "OTF", name: "Blue Owl Technology Finance Corp. Common Stock" },
-    { symbol: "OTIS", name: "Otis Worldwide Corporation Common Stock " },
-    { symbol: "OUNZ", name: "VanEck Merk Gold ETF" },
-    { symbol: "OUSA", name: "ALPS O'Shares U.S. Quality Dividend ETF" },
-    { symbol: "OUSM", name: "ALPS O'Shares U.S. Small-Cap Quality Dividend ETF" },
-    { symbol: "OUT", name: "OUTFRONT Media Inc. Common Stock" },
-    { symbol: "OVB", name: "Overlay Shares Core Bond ETF" },
-    { symbol: "OVF", name: "Overlay Shares Foreign Equity ETF" },
-    { symbol: "OVL", name: "Overlay Shares Large Cap Equity ETF" },
-    { symbol: "OVLH", name: "Overlay Shares Hedged Large Cap Equity ETF" },
-    { symbol: "OVM", name: "Overlay Shares Municipal Bond ETF" },
-    { symbol: "OVS", name: "Overlay Shares Small Cap Equity ETF" },
-    { symbol: "OVT", name: "Overlay Shares Short Term Bond ETF" },
-    { symbol: "OVV", name: "Ovintiv Inc. (DE)" },
-    { symbol: "OWL", name: "Blue Owl Capital Inc. Class A Common Stock" },
-    { symbol: "OWLT", name: "Owlet, Inc. Class A Common Stock" },
-    { symbol: "OWNB", name: "Bitwise Funds Trust Bitwise Bitcoin Standard Corporations ETF" },
-    { symbol: "OWNS", name: "Quaker Investment Trust CCM Affordable Housing MBS ETF" },
-    { symbol: "OXM", name: "Oxford Industries, Inc. Common Stock" },
-    { symbol: "OXY", name: "Occidental Petroleum Corporation Common Stock" },
-    { symbol: "OXY.W", name: "Occidental Petroleum Corporation Warrants " },
-    { symbol: "OZ", name: "Belpointe PREP, LLC Class A Units" },
-    { symbol: "PAAA", name: "PGIM ETF Trust PGIM AAA CLO ETF" },
-    { symbol: "PAAS", name: "Pan American Silver Corp. Common Stock" },
-    { symbol: "PAB", name: "PGIM Active Aggregate Bond ETF" },
-    { symbol: "PAC", name: "Grupo Aeroportuario Del Pacifico, S.A. B. de C.V. Grupo Aeroportuario Del Pacifico, S.A. de C.V. (each representing 10 Series B shares)" },
-    { symbol: "PACK", name: "Ranpak Holdings Corp Class A Common Stock" },
-    { symbol: "PACS", name: "PACS Group, Inc. Common Stock" },
-    { symbol: "PAG", name: "Penske Automotive Group, Inc. Common Stock" },
-    { symbol: "PAGS", name: "PagSeguro Digital Ltd. Class A Common Shares" },
-    { symbol: "PAI", name: "Western Asset Investment Grade Income Fund Inc." },
-    { symbol: "PAII", name: "Pyrophyte Acquisition Corp. II Class A Ordinary Shares" },
-    { symbol: "PAII.U", name: "Pyrophyte Acquisition Corp. II Units, each consisting of one Class A ordinary share and one-half of one redeemable warrant" },
-    { symbol: "PAII.W", name: "Pyrophyte Acquisition Corp. II Warrants, each whole warrant exercisable for one Class A Ordinary Share at an exercise price of $11.50 per share" },
-    { symbol: "PALC", name: "Pacer Lunt Large Cap Multi-Factor Alternator ETF" },
-    { symbol: "PALL", name: "abrdn Physical Palladium Shares ETF" },
-    { symbol: "PAM", name: "Pampa Energia S.A." },
-    { symbol: "PAMC", name: "Pacer Lunt MidCap Multi-Factor Alternator ETF" },
-    { symbol: "PAPI", name: "Morgan Stanley ETF Trust Parametric Equity Premium Income ETF" },
-    { symbol: "PAPL", name: "Pineapple Financial Inc. Common Stock" },
-    { symbol: "PAPR", name: "Innovator U.S. Equity Power Buffer ETF - April" },
-    { symbol: "PAR", name: "PAR Technology Corporation Common Stock" },
-    { symbol: "PARR", name: "Par Pacific Holdings, Inc.  Common Stock" },
-    { symbol: "PATH", name: "UiPath, Inc. Class A Common Stock" },
-    { symbol: "PAUG", name: "Innovator U.S. Equity Power Buffer ETF - August" },
-    { symbol: "PAVE", name: "Global X Funds Global X U.S. Infrastructure Development ETF" },
-    { symbol: "PAWZ", name: "ProShares Pet Care ETF" },
-    { symbol: "PAXS", name: "PIMCO Access Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "PAY", name: "Paymentus Holdings, Inc. Class A Common Stock" },
-    { symbol: "PAYC", name: "Paycom Software, Inc. Common Stock" },
-    { symbol: "PB", name: "Prosperity Bancshares, Inc. Common Stock" },
-    { symbol: "PBA", name: "Pembina Pipeline Corp. Ordinary Shares (Canada)" },
-    { symbol: "PBAP", name: "PGIM S&P 500 Buffer 20 ETF - April" },
-    { symbol: "PBAU", name: "PGIM S&P 500 Buffer 20 ETF - August" },
-    { symbol: "PBD", name: "Invesco Global Clean Energy ETF" },
-    { symbol: "PBDC", name: "Putnam ETF Trust Putnam BDC Income ETF" },
-    { symbol: "PBDE", name: "PGIM S&P 500 Buffer 20 ETF - December" },
-    { symbol: "PBE", name: "Invesco Biotechnology & Genome ETF" },
-    { symbol: "PBF", name: "PBF Energy Inc. Class A Common Stock" },
-    { symbol: "PBFB", name: "PGIM S&P 500 Buffer 20 ETF - February" },
-    { symbol: "PBFR", name: "PGIM Laddered S&P 500 Buffer 20 ETF" },
-    { symbol: "PBH", name: "Prestige Consumer Healthcare Inc. Common Stock" },
-    { symbol: "PBI", name: "Pitney Bowes Inc. Common Stock" },
-    { symbol: "PBI$B", name: "Pitney Bowes Inc 6.70% Notes Due 2043" },
-    { symbol: "PBJ", name: "Invesco Food & Beverage ETF" },
-    { symbol: "PBJA", name: "PGIM S&P 500 Buffer 20 ETF - January" },
-    { symbol: "PBJL", name: "PGIM S&P 500 Buffer 20 ETF - July" },
-    { symbol: "PBJN", name: "PGIM S&P 500 Buffer 20 ETF - June" },
-    { symbol: "PBL", name: "PGIM ETF Trust PGIM Portfolio Ballast ETF" },
-    { symbol: "PBMR", name: "PGIM S&P 500 Buffer 20 ETF - March" },
-    { symbol: "PBMY", name: "PGIM S&P 500 Buffer 20 ETF - May" },
-    { symbol: "PBNV", name: "PGIM S&P 500 Buffer 20 ETF - November" },
-    { symbol: "PBOC", name: "PGIM S&P 500 Buffer 20 ETF - October" },
-    { symbol: "PBP", name: "Invesco S&P 500 BuyWrite ETF" },
-    { symbol: "PBR", name: "Petroleo Brasileiro S.A. Petrobras ADS" },
-    { symbol: "PBR.A", name: "Petroleo Brasileiro S.A. Petrobras American Depositary Shares representing Preferred Shares" },
-    { symbol: "PBSE", name: "PGIM S&P 500 Buffer 20 ETF - September" },
-    { symbol: "PBT", name: "Permian Basin Royalty Trust Common Stock" },
-    { symbol: "PBTP", name: "Invesco 0-5 Yr US TIPS ETF" },
-    { symbol: "PBUS", name: "Invesco MSCI USA ETF" },
-    { symbol: "PBW", name: "Invesco WilderHill Clean Energy ETF" },
-    { symbol: "PCCE", name: "Litman Gregory Funds Trust Polen Capital China Growth ETF" },
-    { symbol: "PCEF", name: "Invesco CEF Income Composite ETF" },
-    { symbol: "PCEM", name: "Litman Gregory Funds Trust Polen Capital Emerging Markets ex China Growth ETF" },
-    { symbol: "PCF", name: "High Income Securities Fund Common Stock" },
-    { symbol: "PCFI", name: "FundVantage Trust Polen Floating Rate Income ETF" },
-    { symbol: "PCG", name: "Pacific Gas & Electric Co. Common Stock" },
-    { symbol: "PCG$A", name: "Pacific Gas & Electric Co. 6% Preferred Stock" },
-    { symbol: "PCG$B", name: "Pacific Gas & Electric Co. 5 1/2% Preferred Stock" },
-    { symbol: "PCG$C", name: "Pacific Gas & Electric Co. 5% 1st Preferred Stock" },
-    { symbol: "PCG$D", name: "Pacific Gas & Electric Co. 5% 1st  Red. Preferred Stock" },
-    { symbol: "PCG$E", name: "Pacific Gas & Electric Co. 5% 1st A Preferred Stock" },
-    { symbol: "PCG$G", name: "Pacific Gas & Electric Co. 4.80% 1st Preferred Stock" },
-    { symbol: "PCG$H", name: "Pacific Gas & Electric Co. 4.50% 1st Preferred Stock" },
-    { symbol: "PCG$I", name: "Pacific Gas & Electric Co. 4.36% 1st Preferred Stock" },
-    { symbol: "PCG$X", name: "PG&E Corp 6.000% Series A Mandatory Convertible Preferred Stock" },
-    { symbol: "PCGG", name: "Litman Gregory Funds Trust Polen Capital Global Growth ETF" },
-    { symbol: "PCHI", name: "FundVantage Trust Polen High Income ETF" },
-    { symbol: "PCI", name: "PGIM ETF Trust PGIM Corporate Bond 5-10 Year ETF" },
-    { symbol: "PCIG", name: "Litman Gregory Funds Trust Polen Capital International Growth ETF" },
-    { symbol: "PCL", name: "PGIM ETF Trust PGIM Corporate Bond 10+ Year ETF" },
-    { symbol: "PCLO", name: "Virtus ETF Trust II VIRTUS SEIX AAA Private Credit CLO ETF" },
-    { symbol: "PCM", name: "PCM Fund, Inc. Common Stock" },
-    { symbol: "PCN", name: "Pimco Corporate & Income Strategy Fund Common Stock" },
-    { symbol: "PCOR", name: "Procore Technologies, Inc. Common Stock" },
-    { symbol: "PCQ", name: "PIMCO California Municipal Income Fund Common Stock" },
-    { symbol: "PCRB", name: "Putnam ETF Trust Putnam ESG Core Bond ETF" },
-    { symbol: "PCS", name: "PGIM ETF Trust PGIM Corporate Bond 0-5 Year ETF" },
-    { symbol: "PCY", name: "Invesco Emerging Markets Sovereign Debt ETF" },
-    { symbol: "PD", name: "PagerDuty, Inc. Common Stock" },
-    { symbol: "PDCC", name: "Pearl Diver Credit Company Inc. Common Stock" },
-    { symbol: "PDEC", name: "Innovator U.S. Equity Power Buffer ETF - December" },
-    { symbol: "PDI", name: "PIMCO Dynamic Income Fund Common Stock" },
-    { symbol: "PDM", name: "Piedmont Realty Trust, Inc. Class A Common Stock" },
-    { symbol: "PDN", name: "Invesco RAFI Developed Markets ex-U.S. Small-Mid ETF" },
-    { symbol: "PDO", name: "PIMCO Dynamic Income Opportunities Fund Common Shares of Beneficial Interest" },
-    { symbol: "PDPA", name: "Pearl Diver Credit Company Inc. 8.00% Series A Preferred Stock Due 2029" },
-    { symbol: "PDS", name: "Precision Drilling Corporation Common Stock" },
-    { symbol: "PDT", name: "John Hancock Premium Dividend Fund" },
-    { symbol: "PDX", name: "PIMCO Dynamic Income Strategy Fund Common Shares of Beneficial Interest" },
-    { symbol: "PEB", name: "Pebblebrook Hotel Trust Common Shares of Beneficial Interest" },
-    { symbol: "PEB$E", name: "Pebblebrook Hotel Trust 6.375% Series E Cumulative Redeemable Preferred Shares of Beneficial Interest" },
-    { symbol: "PEB$F", name: "Pebblebrook Hotel Trust 6.3% Series F Cumulative Redeemable Preferred Shares of Beneficial Interest" },
-    { symbol: "PEB$G", name: "Pebblebrook Hotel Trust 6.375% Series G Cumulative Redeemable Preferred Shares of Beneficial Interest" },
-    { symbol: "PEB$H", name: "Pebblebrook Hotel Trust 5.700% Series H Cumulative Redeemable Preferred Shares of Beneficial Interest" },
-    { symbol: "PED", name: "Pedevco Corp. Common Stock" },
-    { symbol: "PEG", name: "Public Service Enterprise Group Incorporated Common Stock" },
-    { symbol: "PEJ", name: "Invesco Leisure and Entertainment ETF" },
-    { symbol: "PEMX", name: "Putnam ETF Trust Putnam Emerging Markets ex-China ETF" },
-    { symbol: "PEN", name: "Penumbra, Inc. Common Stock" },
-    { symbol: "PEO", name: "Adams Natural Resources Fund, Inc. Common Stock" },
-    { symbol: "PERF", name: "Perfect Corp. Class A Ordinary Share" },
-    { symbol: "PERF.W", name: "Perfect Corp. Warrants, each exercisable for one Class A Ordinary Share at a price of $11.50 per share" },
-    { symbol: "PEVC", name: "Pacer Funds Trust Pacer PE/VC ETF" },
-    { symbol: "PEW", name: "GrabAGun Digital Holdings Inc. Common Stock" },
-    { symbol: "PEW.W", name: "GrabAGun Digital Holdings Inc. Warrants, each whole warrant exercisable to purchase one share of Common Stock at an exercise price of $11.50 per share" },
-    { symbol: "PEX", name: "ProShares Global Listed Private Equity ETF" },
-    { symbol: "PEXL", name: "Pacer US Export Leaders ETF" },
-    { symbol: "PFD", name: "Flaherty & Crumrine Preferred and Income Fund Incorporated" },
-    { symbol: "PFE", name: "Pfizer, Inc. Common Stock" },
-    { symbol: "PFEB", name: "Innovator U.S. Equity Power Buffer ETF - February" },
-    { symbol: "PFFA", name: "Virtus InfraCap U.S. Preferred Stock ETF" },
-    { symbol: "PFFD", name: "Global X U.S. Preferred ETF" },
-    { symbol: "PFFL", name: "ETRACS 2xMonthly Pay Leveraged Preferred Stock Index ETN due September 25, 2048" },
-    { symbol: "PFFR", name: "InfraCap REIT Preferred ETF" },
-    { symbol: "PFFV", name: "Global X Variable Rate Preferred ETF" },
-    { symbol: "PFGC", name: "Performance Food Group Company Common Stock" },
-    { symbol: "PFH", name: "Prudential Financial, Inc. 4.125% Junior Subordinated Notes due 2060" },
-    { symbol: "PFIG", name: "Invesco Fundamental Investment Grade Corporate Bond  ETF" },
-    { symbol: "PFIX", name: "Simplify Interest Rate Hedge ETF" },
-    { symbol: "PFL", name: "PIMCO Income Strategy Fund Shares of Beneficial Interest" },
-    { symbol: "PFLD", name: "AAM Low Duration Preferred and Income Securities ETF" },
-    { symbol: "PFLT", name: "PennantPark Floating Rate Capital Ltd. Common Stock" },
-    { symbol: "PFN", name: "PIMCO Income Strategy Fund II" },
-    { symbol: "PFO", name: "Flaherty & Crumrine Preferred and Income Opportunity Fund Incorporated" },
-    { symbol: "PFRL", name: "PGIM ETF Trust PGIM Floating Rate Income ETF" },
-    { symbol: "PFS", name: "Provident Financial Services, Inc Common Stock" },
-    { symbol: "PFSI", name: "PennyMac Financial Services, Inc. Common Stock" },
-    { symbol: "PFUT", name: "Putnam Sustainable Future ETF" },
-    { symbol: "PFXF", name: "VanEck Preferred Securities ex Financials ETF" },
-    { symbol: "PG", name: "Procter & Gamble Company (The) Common Stock" },
-    { symbol: "PGF", name: "Invesco Financial Preferred ETF" },
-    { symbol: "PGHY", name: "Invesco Global ex-US High Yield Corporate Bond ETF" },
-    { symbol: "PGP", name: "Pimco Global StocksPlus & Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "PGR", name: "Progressive Corporation (The) Common Stock" },
-    { symbol: "PGRE", name: "Paramount Group, Inc. Common Stock" },
-    { symbol: "PGRO", name: "Putnam Focused Large Cap Growth ETF" },
-    { symbol: "PGX", name: "Invesco Preferred ETF" },
-    { symbol: "PGZ", name: "Principal Real Estate Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "PH", name: "Parker-Hannifin Corporation Common Stock" },
-    { symbol: "PHB", name: "Invesco Fundamental High Yield Corporate Bond ETF" },
-    { symbol: "PHD", name: "Pioneer Floating Rate Fund, Inc." },
-    { symbol: "PHDG", name: "Invesco S&P 500 Downside Hedged ETF" },
-    { symbol: "PHEQ", name: "Morgan Stanley ETF Trust Parametric Hedged Equity ETF" },
-    { symbol: "PHG", name: "Koninklijke Philips N.V. NY Registry Shares" },
-    { symbol: "PHGE", name: "BiomX Inc. COmmon Stock" },
-    { symbol: "PHI", name: "PLDT Inc. Sponsored ADR" },
-    { symbol: "PHIN", name: "PHINIA Inc. Common Stock" },
-    { symbol: "PHK", name: "Pimco High Income Fund" },
-    { symbol: "PHM", name: "PulteGroup, Inc. Common Stock" },
-    { symbol: "PHR", name: "Phreesia, Inc. Common Stock" },
-    { symbol: "PHT", name: "Pioneer High Income Fund, Inc." },
-    { symbol: "PHYD", name: "Putnam ETF Trust Putnam ESG High Yield ETF" },
-    { symbol: "PHYL", name: "PGIM Active High Yield Bond ETF" },
-    { symbol: "PHYS", name: "Sprott Physical Gold Trust ETV" },
-    { symbol: "PICB", name: "Invesco International Corporate Bond ETF" },
-    { symbol: "PICK", name: "iShares MSCI Global Select Metals & Mining Producers Fund" },
-    { symbol: "PIEQ", name: "Principal Exchange-Traded Funds Principal International Equity ETF" },
-    { symbol: "PIFI", name: "ClearShares Piton Intermediate Fixed income ETF" },
-    { symbol: "PII", name: "Polaris Inc. Common Stock" },
-    { symbol: "PILL", name: "Direxion Daily Pharmaceutical & Medical Bull 3X Shares" },
-    { symbol: "PIM", name: "Putnam Master Intermediate Income Trust Common Stock" },
-    { symbol: "PIN", name: "Invesco India ETF" },
-    { symbol: "PINE", name: "Alpine Income Property Trust, Inc. Common Stock" },
-    { symbol: "PINK", name: "Simplify Health Care ETF" },
-    { symbol: "PINS", name: "Pinterest, Inc. Class A Common Stock" },
-    { symbol: "PIPE", name: "Invesco Actively Managed Exchange-Traded Fund Trust Invesco SteelPath MLP & Energy Infrastructure ETF" },
-    { symbol: "PIPR", name: "Piper Sandler Companies Common Stock" },
-    { symbol: "PIT", name: "VanEck ETF Trust VanEck Commodity Strategy ETF" },
-    { symbol: "PJAN", name: "Innovator U.S. Equity Power Buffer ETF - January" },
-    { symbol: "PJBF", name: "PGIM ETF Trust PGIM Jennison Better Future ETF" },
-    { symbol: "PJFG", name: "PGIM ETF Trust PGIM Jennison Focused Growth ETF" },
-    { symbol: "PJFM", name: "PGIM ETF Trust PGIM Jennison Focused Mid-Cap ETF" },
-    { symbol: "PJFV", name: "PGIM ETF Trust PGIM Jennison Focused Value ETF" },
-    { symbol: "PJIO", name: "PGIM ETF Trust PGIM Jennison International Opportunities ETF" },
-    { symbol: "PJP", name: "Invesco Pharmaceuticals ETF" },
-    { symbol: "PJT", name: "PJT Partners Inc. Class A Common Stock" },
-    { symbol: "PJUL", name: "Innovator U.S. Equity Power Buffer ETF - July" },
-    { symbol: "PJUN", name: "Innovator U.S. Equity Power Buffer ETF - June" },
-    { symbol: "PK", name: "Park Hotels & Resorts Inc. Common Stock " },
-    { symbol: "PKB", name: "Invesco Building & Construction ETF" },
-    { symbol: "PKE", name: "Park Aerospace Corp. Common Stock" },
-    { symbol: "PKG", name: "Packaging Corporation of America Common Stock" },
-    { symbol: "PKST", name: "Peakstone Realty Trust Common Shares" },
-    { symbol: "PKX", name: "POSCO HOLDINGS INC. American Depositary Shares (Each representing 1/4th of a share of Common Stock)" },
-    { symbol: "PL", name: "Planet Labs PBC Class A Common Stock" },
-    { symbol: "PL.W", name: "Planet Labs PBC Redeemable warrants, each whole warrant exercisable for one share of Class A common stock, each at an exercise price of $11.50 per share" },
-    { symbol: "PLAG", name: "Planet Green Holdings Corp. Common Stock" },
-    { symbol: "PLD", name: "Prologis, Inc. Common Stock" },
-    { symbol: "PLDR", name: "Putnam Sustainable Leaders ETF" },
-    { symbol: "PLG", name: "Platinum Group Metals Ltd. Ordinary Shares (Canada)" },
-    { symbol: "PLNT", name: "Planet Fitness, Inc. Common Stock" },
-    { symbol: "PLOO", name: "Themes ETF Trust Leverage Shares 2x Capped Accelerated PLTR Monthly ETF" },
-    { symbol: "PLOW", name: "Douglas Dynamics, Inc. Common Stock" },
-    { symbol: "PLTM", name: "GraniteShares Platinum Shares ETF" },
-    { symbol: "PLTW", name: "Roundhill ETF Trust Roundhill PLTR WeeklyPay ETF" },
-    { symbol: "PLTY", name: "Tidal Trust II YieldMax PLTR Option Income Strategy ETF" },
-    { symbol: "PLX", name: "Protalix BioTherapeutics, Inc. (DE) Common Stock" },
-    { symbol: "PLYM", name: "Plymouth Industrial REIT, Inc. Common Stock" },
-    { symbol: "PM", name: "Philip Morris International Inc Common Stock" },
-    { symbol: "PMAP", name: "PGIM Rock ETF Trust PGIM S&P 500 Max Buffer ETF - April" },
-    { symbol: "PMAR", name: "Innovator U.S. Equity Power Buffer ETF - March" },
-    { symbol: "PMAU", name: "PGIM Rock ETF Trust PGIM S&P 500 Max Buffer ETF - August" },
-    { symbol: "PMAY", name: "Innovator U.S. Equity Power Buffer ETF - May" },
-    { symbol: "PMFB", name: "PGIM Rock ETF Trust PGIM S&P 500 Max Buffer ETF - February" },
-    { symbol: "PMI", name: "Picard Medical, Inc. Common Stock" },
-    { symbol: "PMIO", name: "PGIM ETF Trust PGIM Municipal Income Opportunities ETF" },
-    { symbol: "PMJA", name: "PGIM Rock ETF Trust PGIM S&P 500 Max Buffer ETF - January" },
-    { symbol: "PMJL", name: "PGIM Rock ETF Trust PGIM S&P 500 Max Buffer ETF - July" },
-    { symbol: "PMJN", name: "PGIM Rock ETF Trust PGIM S&P 500 Max Buffer ETF - June" },
-    { symbol: "PML", name: "Pimco Municipal Income Fund II Common Shares of Beneficial Interest" },
-    { symbol: "PMM", name: "Putnam Managed Municipal Income Trust Common Stock" },
-    { symbol: "PMMF", name: "BlackRock ETF Trust iShares Prime Money Market ETF" },
-    { symbol: "PMMR", name: "PGIM Rock ETF Trust PGIM S&P 500 Max Buffer ETF - March" },
-    { symbol: "PMMY", name: "PGIM Rock ETF Trust PGIM S&P 500 Max Buffer ETF - May" },
-    { symbol: "PMNT", name: "Perfect Moment Ltd. Common Stock" },
-    { symbol: "PMO", name: "Putnam Municipal Opportunities Trust Common Stock" },
-    { symbol: "PMSE", name: "PGIM Rock ETF Trust PGIM S&P 500 Max Buffer ETF - September" },
-    { symbol: "PMT", name: "PennyMac Mortgage Investment Trust Common Shares of Beneficial Interest" },
-    { symbol: "PMT$A", name: "PennyMac Mortgage Investment Trust 8.125% Series A Fixed-to-Floating Rate Cumulative Redeemable Preferred Shares of Beneficial Interest" },
-    { symbol: "PMT$B", name: "PennyMac Mortgage Investment Trust 8.00% Series B Fixed-to-Floating Rate Cumulative Redeemable Preferred Shares of Beneficial Interest" },
-    { symbol: "PMT$C", name: "PennyMac Mortgage Investment Trust 6.75% Series C Cumulative Redeemable Preferred Shares of Beneficial Interest" },
-    { symbol: "PMTU", name: "PennyMac Mortgage Investment Trust 8.50% Senior Notes due 2028" },
-    { symbol: "PMTV", name: "PennyMac Mortgage Investment Trust 9.00% Senior Notes due 2030" },
-    { symbol: "PMTW", name: "PennyMac Mortgage Investment Trust 9.00% Senior Notes due 2030" },
-    { symbol: "PNC", name: "PNC Financial Services Group, Inc. (The) Common Stock" },
-    { symbol: "PNI", name: "Pimco New York Municipal Income Fund II Common Shares of Beneficial Interest" },
-    { symbol: "PNNT", name: "PennantPark Investment Corporation Common Stock" },
-    { symbol: "PNOV", name: "Innovator U.S. Equity Power Buffer ETF - November" },
-    { symbol: "PNR", name: "Pentair plc. Ordinary Share" },
-    { symbol: "PNW", name: "Pinnacle West Capital Corporation Common Stock" },
-    { symbol: "POCT", name: "Innovator U.S. Equity Power Buffer ETF - October" },
-    { symbol: "PONX", name: "Investment Managers Series Trust II Tradr 2X Long PONY Daily ETF" },
-    { symbol: "POR", name: "Portland General Electric Co Common Stock" },
-    { symbol: "POST", name: "Post Holdings, Inc. Common Stock" },
-    { symbol: "POWA", name: "Invesco Bloomberg Pricing Power ETF" },
-    { symbol: "PPA", name: "Invesco Aerospace & Defense ETF " },
-    { symbol: "PPEM", name: "Putnam ETF Trust Putnam PanAgora ESG Emerging Markets Equity ETF" },
-    { symbol: "PPG", name: "PPG Industries, Inc. Common Stock" },
-    { symbol: "PPIE", name: "Putnam ETF Trust Putnam PanAgora ESG International Equity ETF" },
-    { symbol: "PPL", name: "PPL Corporation Common Stock" },
-    { symbol: "PPLT", name: "abrdn Physical Platinum Shares ETF" },
-    { symbol: "PPT", name: "Putnam Premier Income Trust Common Stock" },
-    { symbol: "PPTY", name: "U.S. Diversified Real Estate ETF" },
-    { symbol: "PQDI", name: "Principal Spectrum Tax-Advantaged Dividend Active ETF" },
-    { symbol: "PR", name: "Permian Resources Corporation Class A Common Stock" },
-    { symbol: "PRA", name: "ProAssurance Corporation Common Stock" },
-    { symbol: "PRAE", name: "Northern Lights Fund Trust III PlanRock Alternative Growth ETF" },
-    { symbol: "PRAY", name: "NEOS ETF Trust FIS Christian Stock Fund" },
-    { symbol: "PRCS", name: "Parnassus Income Funds Parnassus Core Select ETF" },
-    { symbol: "PREF", name: "Principal Spectrum Preferred Securities Active ETF" },
-    { symbol: "PRF", name: "Invesco RAFI US 1000 ETF" },
-    { symbol: "PRFD", name: "PIMCO U.S. Treasury Index Fund PIMCO Preferred and Capital Securities Active Exchange-Traded Fund" },
-    { symbol: "PRG", name: "PROG Holdings, Inc. Common Stock" },
-    { symbol: "PRGO", name: "Perrigo Company plc Ordinary Shares" },
-    { symbol: "PRH", name: "Prudential Financial, Inc. 5.950% Junior Subordinated Notes due 2062" },
-    { symbol: "PRI", name: "Primerica, Inc. Common Stock" },
-    { symbol: "PRIF$D", name: "Priority Income Fund, Inc. 7.00% Series D Term Preferred Stock due 2029" },
-    { symbol: "PRIF$J", name: "Priority Income Fund, Inc. 6.000% Series J Term Preferred Stock due 2028" },
-    { symbol: "PRIF$K", name: "Priority Income Fund, Inc. 7.000% Series K Cumulative Preferred Stock" },
-    { symbol: "PRIF$L", name: "Priority Income Fund, Inc. 6.375% Series L Term Preferred Stock Due 2029" },
-    { symbol: "PRIM", name: "Primoris Services Corporation Common Stock" },
-    { symbol: "PRIV", name: "SPDR SSGA IG Public & Private Credit ETF" },
-    { symbol: "PRK", name: "Park National Corporation Common Stock" },
-    { symbol: "PRKS", name: "United Parks & Resorts Inc. Common Stock" },
-    { symbol: "PRLB", name: "Proto Labs, Inc. Common stock" },
-    { symbol: "PRM", name: "Perimeter Solutions, SA Common Stock" },
-    { symbol: "PRMB", name: "Primo Brands Corporation Class A Common Stock" },
-    { symbol: "PRNT", name: "3D Printing (The) ETF" },
-    { symbol: "PRO", name: "PROS Holdings, Inc. Common Stock" },
-    { symbol: "PRS", name: "Prudential Financial, Inc. 5.625% Junior Subordinated Notes due 2058" },
-    { symbol: "PRSU", name: "Pursuit Attractions and Hospitality, Inc. Common Stock" },
-    { symbol: "PRT", name: "PermRock Royalty Trust Trust Units" },
-    { symbol: "PRU", name: "Prudential Financial, Inc. Common Stock" },
-    { symbol: "PRVS", name: "Parnassus Income Funds Parnassus Value Select ETF" },
-    { symbol: "PRXG", name: "Praxis Funds Praxis Impact Large Cap Growth ETF" },
-    { symbol: "PRXV", name: "Praxis Funds Praxis Impact Large Cap Value ETF" },
-    { symbol: "PSA", name: "Public Storage Common Stock" },
-    { symbol: "PSA$F", name: "Public Storage Depositary Shares Each Representing 1/1,000 of a 5.15% Cumulative Preferred Share of Beneficial Interest, Series F, par value $0.01 per share" },
-    { symbol: "PSA$G", name: "Public Storage Depositary Shares, Each Representing 1/1,000 of a 5.05% Cumulative Preferred Share of Beneficial Interest, Series G" },
-    { symbol: "PSA$H", name: "Public Storage Depositary Shares Each Representing 1/1,000 of a  5.60% Cumulative Preferred  Share of Beneficial Interest, Series H" },
-    { symbol: "PSA$I", name: "Public Storage Depositary Shares Each Representing 1/1,000 of a 4.875% Cumulative Preferred Share of Beneficial Interest, Series I, par value $0.01 per share" },
-    { symbol: "PSA$J", name: "Public Storage Depositary Shares Each Representing 1/1,000 of a 4.700% Cumulative Preferred Share of Beneficial Interest, Series J, par value $0.01 per share" },
-    { symbol: "PSA$K", name: "Public Storage Depositary Shares Each Representing 1/1,000 of a 4.75% Cumulative Preferred Share of Beneficial Interest, Series K" },
-    { symbol: "PSA$L", name: "Public Storage Depositary Shares Each Representing 1/1,000 of a 4.625% Cumulative Preferred Share of Beneficial Interest, Series L, par value $0.01 per share" },
-    { symbol: "PSA$M", name: "Public Storage Depositary Shares Each Representing 1/1,000 of a 4.125% Cumulative Preferred Share of Beneficial Interest, Series M" },
-    { symbol: "PSA$N", name: "Public Storage Depositary Shares Each Representing 1/1,000 of a 3.875% Cumulative Preferred Share of Beneficial Interest, Series N" },
-    { symbol: "PSA$O", name: "Public Storage Depositary Shares Each Representing 1/1,000 of a 3.900% Cumulative Preferred Share of Beneficial Interest, Series O" },
-    { symbol: "PSA$P", name: "Public Storage Depositary Shares Each Representing 1/1,000 of a 4.000% Cumulative Preferred Share of Bene cial Interest, Series P" },
-    { symbol: "PSA$Q", name: "Public Storage Depositary Shares Each Representing 1/1,000 of a 3.950% Cumulative Preferred Share of Beneficial Interest, Series Q, par value $0.01 per share" },
-    { symbol: "PSA$R", name: "Public Storage Depositary Shares Each Representing 1/1,000 of a 4.00% Cumulative Preferred Share of Bene cial Interest, Series R" },
-    { symbol: "PSA$S", name: "Public Storage Depositary Shares Each Representing 1/1,000 of a 4.100% Cumulative Preferred Share of Beneficial Interest, Series S" },
-    { symbol: "PSBD", name: "Palmer Square Capital BDC Inc. Common Stock" },
-    { symbol: "PSCJ", name: "Pacer Swan SOS Conservative (July) ETF" },
-    { symbol: "PSCQ", name: "Pacer Swan SOS Conservative (October) ETF" },
-    { symbol: "PSCW", name: "Pacer Swan SOS Conservative (April) ETF" },
-    { symbol: "PSCX", name: "Pacer Swan SOS Conservative (January) ETF" },
-    { symbol: "PSDM", name: "PGIM ETF Trust PGIM Short Duration Multi-Sector Bond ETF" },
-    { symbol: "PSEC$A", name: "Prospect Capital Corporation 5.35% Series A Fixed Rate Cumulative Perpetual Preferred Stock" },
-    { symbol: "PSEP", name: "Innovator U.S. Equity Power Buffer ETF - September" },
-    { symbol: "PSF", name: "Cohen & Steers Select Preferred and Income Fund, Inc. Common Stock" },
-    { symbol: "PSFD", name: "Pacer Swan SOS Flex (January) ETF" },
-    { symbol: "PSFE", name: "Paysafe Limited Common Shares" },
-    { symbol: "PSFE.W", name: "Paysafe Limited Warrants, exercisable for one Common Share of Paysafe Limited at a price of $11.50 per share" },
-    { symbol: "PSFF", name: "Pacer Swan SOS Fund of Funds ETF" },
-    { symbol: "PSFJ", name: "Pacer Swan SOS Flex (July) ETF" },
-    { symbol: "PSFM", name: "Pacer Swan SOS Flex (April) ETF" },
-    { symbol: "PSFO", name: "Pacer Swan SOS Flex (October) ETF" },
-    { symbol: "PSH", name: "PGIM ETF Trust PGIM Short Duration High Yield ETF" },
-    { symbol: "PSI", name: "Invesco Semiconductors ETF" },
-    { symbol: "PSIL", name: "AdvisorShares Psychedelics ETF" },
-    { symbol: "PSK", name: "SPDR ICE Preferred Securities ETF" },
-    { symbol: "PSLV", name: "Sprott Physical Silver Trust ETV" },
-    { symbol: "PSMD", name: "Pacer Swan SOS Moderate (January) ETF" },
-    { symbol: "PSMJ", name: "Pacer Swan SOS Moderate (July) ETF" },
-    { symbol: "PSMO", name: "Pacer Swan SOS Moderate (October) ETF" },
-    { symbol: "PSMR", name: "Pacer Swan SOS Moderate (April) ETF" },
-    { symbol: "PSN", name: "Parsons Corporation Common Stock" },
-    { symbol: "PSO", name: "Pearson, Plc Common Stock" },
-    { symbol: "PSP", name: "Invesco Global Listed Private Equity ETF" },
-    { symbol: "PSQ", name: "ProShares Short QQQ" },
-    { symbol: "PSQA", name: "Palmer Square Funds Trust Palmer Square CLO Senior Debt ETF" },
-    { symbol: "PSQH", name: "PSQ Holdings, Inc. Class A Common Stock" },
-    { symbol: "PSQH.W", name: "PSQ Holdings, Inc. Warrants, each exercisable for one share of Class A common stock at an exercise price of $11.50 per share" },
-    { symbol: "PSQO", name: "Palmer Square Funds Trust Palmer Square Credit Opportunities ETF" },
-    { symbol: "PSR", name: "Invesco Active U.S. Real Estate Fund" },
-    { symbol: "PST", name: "ProShares UltraShort Lehman 7-10 Year Treasury" },
-    { symbol: "PSTG", name: "Pure Storage, Inc. Class A Common Stock" },
-    { symbol: "PSTL", name: "Postal Realty Trust, Inc. Class A Common Stock" },
-    { symbol: "PSTP", name: "Innovator ETFs Trust Innovator Power Buffer Step-Up Strategy ETF" },
-    { symbol: "PSX", name: "Phillips 66 Common Stock" },
-    { symbol: "PTA", name: "Cohen & Steers Tax-Advantaged Preferred Securities and Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "PTBD", name: "Pacer Trendpilot US Bond ETF" },
-    { symbol: "PTEU", name: "Pacer TrendpilotTM European Index ETF" },
-    { symbol: "PTHS", name: "Pelthos Therapeutics Inc. Common Stock" },
-    { symbol: "PTIN", name: "Pacer Trendpilot International ETF" },
-    { symbol: "PTL", name: "Northern Lights Fund Trust IV Inspire 500 ETF" },
-    { symbol: "PTLC", name: "Pacer Fund Trust Pacer Trendpilot US Large Cap ETF" },
-    { symbol: "PTMC", name: "Pacer Trendpilot US Mid Cap ETF" },
-    { symbol: "PTRB", name: "PGIM ETF Trust PGIM Total Return Bond ETF" },
-    { symbol: "PTY", name: "Pimco Corporate & Income Opportunity Fund" },
-    { symbol: "PUK", name: "Prudential Public Limited Company Common Stock" },
-    { symbol: "PULS", name: "PGIM Ultra Short Bond ETF" },
-    { symbol: "PULT", name: "Putnam ETF Trust Putnam ESG Ultra Short ETF" },
-    { symbol: "PUMP", name: "ProPetro Holding Corp. Common Stock" },
-    { symbol: "PUSH", name: "PGIM ETF Trust PGIM Ultra Short Municipal Bond ETF" },
-    { symbol: "PUTD", name: "Cboe Validus S&P 500 Dynamic PutWrite Index ETF" },
-    { symbol: "PVAL", name: "Putnam Focused Large Cap Value ETF" },
-    { symbol: "PVEX", name: "Elevation Series Trust TrueShares ConVex Protect ETF" },
-    { symbol: "PVH", name: "PVH Corp. Common Stock" },
-    { symbol: "PVI", name: "Invesco Floating Rate Municipal Income ETF" },
-    { symbol: "PVL", name: "Permianville Royalty Trust Trust Units " },
-    { symbol: "PW", name: "Power REIT (MD) Common Stock" },
-    { symbol: "PW$A", name: "Power REIT 7.75% Series A Cumulative Perpetual Preferred Stock" },
-    { symbol: "PWB", name: "Invesco Large Cap Growth ETF" },
-    { symbol: "PWER", name: "Macquarie ETF Trust Macquarie Energy Transition ETF" },
-    { symbol: "PWR", name: "Quanta Services, Inc. Common Stock" },
-    { symbol: "PWS", name: "Pacer WealthShield ETF " },
-    { symbol: "PWV", name: "Invesco Large Cap Value ETF" },
-    { symbol: "PWZ", name: "Invesco California AMT-Free Municipal Bond Portfolio" },
-    { symbol: "PX", name: "P10, Inc. Class A Common Stock" },
-    { symbol: "PXE", name: "Invesco Energy Exploration & Production ETF" },
-    { symbol: "PXF", name: "Invesco RAFI Developed Markets ex-U.S. ETF" },
-    { symbol: "PXH", name: "Invesco RAFI Emerging Markets ETF" },
-    { symbol: "PXJ", name: "Invesco Oil & Gas Services ETF" },
-    { symbol: "PYLD", name: "PIMCO U.S. Treasury Index Fund PIMCO Multisector Bond Active Exchange-Traded Fund" },
-    { symbol: "PYPY", name: "Tidal Trust II YieldMax PYPL Option Income Strategy ETF" },
-    { symbol: "PYT", name: "PPlus Tr GSC-2 Tr Ctf Fltg Rate" },
-    { symbol: "PZA", name: "Invesco National AMT-Free Municipal Bond ETFo" },
-    { symbol: "PZG", name: "Paramount Gold Nevada Corp. Common Stock" },
-    { symbol: "PZT", name: "Invesco New York AMT-Free Municipal Bond ETF" },
-    { symbol: "QAI", name: "NYLI Hedge Multi-Strategy Tracker ETF" },
-    { symbol: "QARP", name: "Xtrackers Russell 1000 US Quality at a Reasonable Price ETF ETF" },
-    { symbol: "QBER", name: "Elevation Series Trust TrueShares Quarterly Bear Hedge ETF" },
-    { symbol: "QBF", name: "Innovator ETFs Trust Innovator Uncapped Bitcoin 20 Floor ETF - Quarterly" },
-    { symbol: "QBSF", name: "AIM ETF Products Trust AllianzIM U.S. Equity Buffer15 ETF" },
-    { symbol: "QBTS", name: "D-Wave Quantum Inc. Common Shares" },
-    { symbol: "QBTS.W", name: "D-Wave Quantum Inc. Warrants, each whole warrant exercisable for 1.4541326 Common Shares at an exercise price of $11.50" },
-    { symbol: "QBTX", name: "Tradr 2X Long QBTS Daily ETF" },
-    { symbol: "QBUL", name: "Elevation Series Trust TrueShares Quarterly Bull Hedge ETF" },
-    { symbol: "QCAP", name: "First Trust Exchange-Traded Fund VIII FT Vest Nasdaq-100 Conservative Buffer ETF - April" },
-    { symbol: "QCJA", name: "First Trust Exchange-Traded Fund VIII FT Vest Nasdaq-100 Conservative Buffer ETF - January" },
-    { symbol: "QCJL", name: "First Trust Exchange-Traded Fund VIII FT Vest Nasdaq-100 Conservative Buffer ETF - July" },
-    { symbol: "QCOC", name: "First Trust Exchange-Traded Fund VIII FT Vest Nasdaq-100 Conservative Buffer ETF - October" },
-    { symbol: "QD", name: "Qudian Inc. American Depositary Shares, each representing one Class A Ordinary Share" },
-    { symbol: "QDEC", name: "FT Vest Nasdaq-100 Buffer ETF - December" },
-    { symbol: "QDEF", name: "FlexShares Quality Dividend Defensive Index Fund" },
-    { symbol: "QDF", name: "FlexShares Quality Dividend Index Fund" },
-    { symbol: "QDIV", name: "Global X S&P 500 Quality Dividend ETF" },
-    { symbol: "QDPL", name: "Pacer Metaurus US Large Cap Dividend Multiplier 400 ETF" },
-    { symbol: "QDTE", name: "Roundhill Innovation-100 0DTE Covered Call Strategy ETF" },
-    { symbol: "QDVO", name: "Amplify ETF Trust Amplify CWP Growth & Income ETF" },
-    { symbol: "QDWN", name: "Strategic Trust DailyDelta  Q100 Downside Option Strategy ETF" },
-    { symbol: "QEFA", name: "SPDR MSCI EAFE StrategicFactors ETF" },
-    { symbol: "QEMM", name: "SPDR MSCI Emerging Markets StrategicFactors ETF" },
-    { symbol: "QETH", name: "Invesco Galaxy Ethereum ETF " },
-    { symbol: "QFLR", name: "Innovator ETFs Trust Innovator Nasdaq-100 Managed Floor ETF" },
-    { symbol: "QGEN", name: "Qiagen N.V. Common Shares" },
-    { symbol: "QGRO", name: "American Century U.S. Quality Growth ETF" },
-    { symbol: "QGRW", name: "WisdomTree Trust WisdomTree U.S. Quality Growth Fund" },
-    { symbol: "QHY", name: "WisdomTree U.S. High Yield Corporate Bond Fund" },
-    { symbol: "QID", name: "ProShares UltraShort QQQ" },
-    { symbol: "QIDX", name: "Spinnaker ETF Series Indexperts Quality Earnings Focused ETF" },
-    { symbol: "QIG", name: "WisdomTree U.S. Corporate Bond Fund" },
-    { symbol: "QINT", name: "American Century Quality Diversified International ETF" },
-    { symbol: "QIS", name: "Simplify Exchange Traded Funds Simplify Multi-QIS Alternative ETF" },
-    { symbol: "QJUN", name: "FT Vest Nasdaq-100 Buffer ETF - June" },
-    { symbol: "QLC", name: "FlexShares Trust FlexShares US Quality Large Cap Index Fund" },
-    { symbol: "QLD", name: "ProShares Ultra QQQ" },
-    { symbol: "QLTA", name: "iShares Aaa A Rated Corporate Bond ETF" },
-    { symbol: "QLTI", name: "The 2023 ETF Series Trust II GMO International Quality ETF" },
-    { symbol: "QLTY", name: "The 2023 ETF Series Trust II GMO U.S. Quality ETF" },
-    { symbol: "QLV", name: "FlexShares US Quality Low Volatility Index Fund" },
-    { symbol: "QLVD", name: "FlexShares Developed Markets ex-US Quality Low Volatility Index Fund" },
-    { symbol: "QLVE", name: "FlexShares Emerging Markets  Quality Low Volatility Index Fund" },
-    { symbol: "QMAG", name: "First Trust Exchange-Traded Fund VIII FT Vest Nasdaq-100 Moderate Buffer ETF - August" },
-    { symbol: "QMAR", name: "FT Vest Nasdaq-100 Buffer ETF - March" },
-    { symbol: "QMFE", name: "First Trust Exchange-Traded Fund VIII FT Vest Nasdaq-100 Moderate Buffer ETF - February" },
-    { symbol: "QMMY", name: "First Trust Exchange-Traded Fund VIII FT Vest Nasdaq-100 Moderate Buffer ETF - May" },
-    { symbol: "QMNV", name: "First Trust Exchange-Traded Fund VIII FT Vest Nasdaq-100 Moderate Buffer ETF - November" },
-    { symbol: "QPX", name: "AdvisorShares Q Dynamic Growth ETF" },
-    { symbol: "QQH", name: "HCM Defender 100 Index ETF" },
-    { symbol: "QQQD", name: "Direxion Daily Magnificent 7 Bear 1X Shares" },
-    { symbol: "QQQU", name: "Direxion Daily Magnificent 7 Bull 2X Shares" },
-    { symbol: "QRFT", name: "QRAFT AI-Enhanced U.S. Large Cap ETF" },
-    { symbol: "QS", name: "QuantumScape Corporation Class A Common Stock" },
-    { symbol: "QSIG", name: "WisdomTree U.S. Short Term Corporate Bond Fund" },
-    { symbol: "QSPT", name: "FT Vest Nasdaq-100 Buffer ETF - September" },
-    { symbol: "QSR", name: "Restaurant Brands International Inc. Common Shares" },
-    { symbol: "QTAP", name: "Innovator Growth Accelerated Plus ETF - April" },
-    { symbol: "QTJA", name: "Innovator ETFs Trust Innovator Growth Accelerated Plus ETF - January" },
-    { symbol: "QTJL", name: "Innovator Growth Accelerated Plus ETF - July" },
-    { symbol: "QTOC", name: "Innovator Growth Accelerated Plus ETF - October" },
-    { symbol: "QTPI", name: "Exchange Place Advisors Trust North Square RCIM Tax-Advantaged Preferred and Income Securities ETF" },
-    { symbol: "QTWO", name: "Q2 Holdings, Inc. Common Stock" },
-    { symbol: "QUAD", name: "Quad Graphics, Inc Class A Common Stock" },
-    { symbol: "QUAL", name: "iShares MSCI USA Quality Factor ETF" },
-    { symbol: "QUBX", name: "Tradr 2X Long QUBT Daily ETF" },
-    { symbol: "QUIZ", name: "Zacks Trust Zacks Quality International ETF" },
-    { symbol: "QULL", name: "ETRACS 2x Leveraged MSCI US Quality Factor TR ETN" },
-    { symbol: "QUP", name: "Strategic Trust DailyDelta  Q100 Upside Option Strategy ETF" },
-    { symbol: "QUS", name: "SPDR MSCI USA StrategicFactors ETF" },
-    { symbol: "QUSA", name: "Tidal Trust III VistaShares Target 15 USA Quality Income ETF" },
-    { symbol: "QUVU", name: "Hartford Funds Exchange-Traded Trust Hartford Quality Value ETF" },
-    { symbol: "QVCC", name: "QVC, Inc. 6.250% Senior Secured Notes due 2068" },
-    { symbol: "QVCD", name: "QVC, Inc. 6.375% Senior Secured Notes due 2067" },
-    { symbol: "QVML", name: "Invesco S&P 500 QVM Multi-factor ETF" },
-    { symbol: "QVMM", name: "Invesco S&P MidCap 400 QVM Multi-factor ETF" },
-    { symbol: "QVMS", name: "Invesco S&P SmallCap 600 QVM Multi-factor ETF" },
-    { symbol: "QVOY", name: "Q3 All-Season Active Rotation ETF Q3 All-Season Active Rotation ETF" },
-    { symbol: "QWLD", name: "SPDR MSCI World StrategicFactors ETF" },
-    { symbol: "QXO", name: "QXO, Inc. Common Stock" },
-    { symbol: "QXO$B", name: "QXO, Inc.  Depositary Shares, each representing a 1/20th interest in a share of 5.50% Series B Mandatory Convertible Preferred Stock" },
-    { symbol: "R", name: "Ryder System, Inc. Common Stock" },
-    { symbol: "RA", name: "Brookfield Real Assets Income Fund Inc. Common Stock" },
-    { symbol: "RAAA", name: "Advisor Managed Portfolios Reckoner Leveraged AAA CLO ETF" },
-    { symbol: "RAAX", name: "VanEck Real Assets ETF" },
-    { symbol: "RAC", name: "Rithm Acquisition Corp. Class A Ordinary Shares" },
-    { symbol: "RAC.U", name: "Rithm Acquisition Corp. Units (each consists of one Class A Ordinary Share and one-third of one redeemable Warrant)" },
-    { symbol: "RAC.W", name: "Rithm Acquisition Corp. Redeemable warrants, each whole warrant exercisable for one Class A ordinary share at an exercise price of $11.50" },
-    { symbol: "RACE", name: "Ferrari N.V. Common Shares" },
-    { symbol: "RAFE", name: "PIMCO RAFI ESG U.S. ETF" },
-    { symbol: "RAL", name: "Ralliant Corporation Common Stock" },
-    { symbol: "RAMP", name: "LiveRamp Holdings, Inc. Common Stock" },
-    { symbol: "RAVI", name: "FlexShares Ultra-Short Income Fund" },
-    { symbol: "RAYC", name: "Rayliant Quantamental China Equity ETF" },
-    { symbol: "RAYD", name: "The Advisors' Inner Circle Fund III Rayliant Quantitative Developed Market Equity ETF" },
-    { symbol: "RAYE", name: "Rayliant Quantamental Emerging Market ex-China Equity ETF" },
-    { symbol: "RAYJ", name: "The Advisors' Inner Circle Fund III Rayliant SMDAM Japan Equity ETF" },
-    { symbol: "RB", name: "ProShares Trust ProShares Russell 2000 Dynamic Buffer ETF" },
-    { symbol: "RBA", name: "RB Global, Inc. Common Stock" },
-    { symbol: "RBC", name: "RBC Bearings Incorporated Common Stock" },
-    { symbol: "RBLD", name: "First Trust Alerian US NextGen Infrastructure ETF" },
-    { symbol: "RBLU", name: "ETF Opportunities Trust T-REX 2X Long RBLX Daily Target ETF" },
-    { symbol: "RBLX", name: "Roblox Corporation Class A Common Stock" },
-    { symbol: "RBLY", name: "Tidal Trust II YieldMax RBLX Option Income Strategy ETF" },
-    { symbol: "RBOT", name: "Vicarious Surgical Inc. Class A Common Stock" },
-    { symbol: "RBOT.W", name: "Vicarious Surgical Inc. Warrants, each whole warrant exercisable for one share of Class A Common Stock at an exercise price of $11.50 per share" },
-    { symbol: "RBRK", name: "Rubrik, Inc. Class A Common Stock" },
-    { symbol: "RBUF", name: "SHL Telemedicine Ltd Innovator U.S. Small Cap 10 Buffer ETF - Quarterly" },
-    { symbol: "RC", name: "Ready Capital Corporation Common Stock" },
-    { symbol: "RC$C", name: "Ready Capital Corporation 6.25% Series C Cumulative Convertible Preferred Stock" },
-    { symbol: "RC$E", name: "Ready Capital Corporation 6.50% Series E Cumulative Redeemable Preferred Stock" },
-    { symbol: "RCB", name: "Ready Capital Corporation 6.20% Senior Notes due 2026" },
-    { symbol: "RCC", name: "Ready Capital Corporation 5.75% Senior Notes due 2026" },
-    { symbol: "RCD", name: "Ready Capital Corporation 9.00% Senior Notes due 2029" },
-    { symbol: "RCG", name: "RENN Fund, Inc Common Stock" },
-    { symbol: "RCI", name: "Rogers Communication, Inc. Common Stock" },
-    { symbol: "RCL", name: "Royal Caribbean Cruises Ltd. Common Stock" },
-    { symbol: "RCS", name: "PIMCO Strategic Income Fund, Inc." },
-    { symbol: "RCTR", name: "First Trust Exchange-Traded Fund II First Trust Bloomberg Nuclear Power ETF" },
-    { symbol: "RCUS", name: "Arcus Biosciences, Inc. Common Stock" },
-    { symbol: "RDDT", name: "Reddit, Inc. Class A Common Stock" },
-    { symbol: "RDFI", name: "Rareview Dynamic Fixed Income ETF" },
-    { symbol: "RDIV", name: "Invesco Exchange-Traded Fund Trust II Invesco S&P Ultra Dividend Revenue ETF" },
-    { symbol: "RDN", name: "Radian Group Inc. Common Stock" },
-    { symbol: "RDOG", name: "ALPS ETF Trust ALPS REIT Dividend Dogs ETF" },
-    { symbol: "RDTE", name: "Roundhill Russell 2000 0DTE Covered Call Strategy ETF" },
-    { symbol: "RDVI", name: "FT Vest Rising Dividend Achievers Target Income ETF" },
-    { symbol: "RDW", name: "Redwire Corporation Common Stock" },
-    { symbol: "RDY", name: "Dr. Reddy's Laboratories Ltd Common Stock" },
-    { symbol: "RDYY", name: "Tidal Trust II YieldMax RDDT Option Income Strategy ETF" },
-    { symbol: "RECS", name: "Columbia Research Enhanced Core ETF" },
-    { symbol: "REET", name: "iShares Trust iShares Global REIT ETF" },
-    { symbol: "REGL", name: "ProShares S&P MidCap 400 Dividend Aristocrats ETF" },
-    { symbol: "REI", name: "Ring Energy, Inc. Common Stock" },
-    { symbol: "REK", name: "ProShares Short Real Estate" },
-    { symbol: "REKT", name: "Direxion Shares ETF Trust Direxion Daily Crypto Industry Bear 1X Shares" },
-    { symbol: "RELX", name: "RELX PLC PLC American Depositary Shares (Each representing One Ordinary Share)" },
-    { symbol: "REM", name: "iShares Trust iShares Mortgage Real Estate ETF" },
-    { symbol: "REMX", name: "VanEck Rare Earth and Strategic Metals ETF" },
-    { symbol: "REPX", name: "Riley Exploration Permian, Inc. Common Stock" },
-    { symbol: "RERE", name: "ATRenew Inc. American Depositary Shares (every three of which representing two Class A ordinary shares)" },
-    { symbol: "RES", name: "RPC, Inc. Common Stock" },
-    { symbol: "RETL", name: "Direxion Daily Retail Bull 3X Shares ETF" },
-    { symbol: "REVG", name: "REV Group, Inc. Common Stock" },
-    { symbol: "REVS", name: "Columbia Research Enhanced Value ETF" },
-    { symbol: "REW", name: "ProShares UltraShort Technology" },
-    { symbol: "REX", name: "REX American Resources Corporation" },
-    { symbol: "REXR", name: "Rexford Industrial Realty, Inc. Common Stock" },
-    { symbol: "REXR$B", name: "Rexford Industrial Realty, Inc. 5.875% Series B Cumulative Redeemable Preferred Stock" },
-    { symbol: "REXR$C", name: "Rexford Industrial Realty, Inc. 5.625% Series C Cumulative Redeemable Preferred Stock, par value $0.01 per share" },
-    { symbol: "REZ", name: "iShares Residential and Multisector Real Estate ETF" },
-    { symbol: "REZI", name: "Resideo Technologies, Inc. Common Stock " },
-    { symbol: "RF", name: "Regions Financial Corporation Common Stock" },
-    { symbol: "RF$C", name: "Regions Financial Corporation Depositary Shares, each Representing a 1/40th Interest in a  Share of 5.700% Fixed-to-Floating Rate Non-Cumulative  Perpetual Preferred Stock, Series C" },
-    { symbol: "RF$E", name: "Regions Financial Corporation Depositary Shares, Each Representing a 1/40th Interest in a Share of 4.45% Non-Cumulative Perpetual Preferred Stock, Series E" },
-    { symbol: "RF$F", name: "Regions Financial Corporation Depositary Shares Each Representing a 1/40th Interest in a Share of Non-Cumulative Perpetual Preferred Stock, Series F" },
-    { symbol: "RFCI", name: "RiverFront Dynamic Core Income ETF" },
-    { symbol: "RFDA", name: "RiverFront Dynamic US Dividend Advantage ETF" },
-    { symbol: "RFFC", name: "ALPS Active Equity Opportunity ETF" },
-    { symbol: "RFG", name: "Invesco S&P Midcap 400 Pure Growth ETF" },
-    { symbol: "RFI", name: "Cohen & Steers Total Return Realty Fund, Inc. Common Stock" },
-    { symbol: "RFIX", name: "Simplify Bond Bull ETF" },
-    { symbol: "RFL", name: "Rafael Holdings, Inc. Class B Common Stock" },
-    { symbol: "RFL.W", name: "Rafael Holdings, Inc. Warrants to Purchase Shares of Class B Common Stock" },
-    { symbol: "RFLR", name: "Innovator U.S. Small Cap Managed Floor ETF" },
-    { symbol: "RFM", name: "RiverNorth Flexible Municipal Income Fund, Inc. Common Stock" },
-    { symbol: "RFMZ", name: "RiverNorth Flexible Municipal Income Fund II, Inc. Common Stock" },
-    { symbol: "RFV", name: "Invesco S&P Midcap 400 Pure Value ETF" },
-    { symbol: "RGA", name: "Reinsurance Group of America, Incorporated Common Stock" },
-    { symbol: "RGEF", name: "Tidal Trust III Rockefeller Global Equity ETF" },
-    { symbol: "RGR", name: "Sturm, Ruger & Company, Inc. Common Stock" },
-    { symbol: "RGT", name: "Royce Global Trust, Inc. Common Stock" },
-    { symbol: "RGTU", name: "Tradr 2X Long RGTI Daily ETF" },
-    { symbol: "RH", name: "RH Common Stock" },
-    { symbol: "RHI", name: "Robert Half Inc. Common Stock" },
-    { symbol: "RHP", name: "Ryman Hospitality Properties, Inc. (REIT)" },
-    { symbol: "RHRX", name: "RH Tactical Rotation ETF" },
-    { symbol: "RHTX", name: "RH Tactical Outlook ETF" },
-    { symbol: "RIET", name: "Hoya Capital High Dividend Yield ETF" },
-    { symbol: "RIG", name: "Transocean Ltd (Switzerland) Common Stock" },
-    { symbol: "RIGS", name: "RiverFront Strategic Income Fund" },
-    { symbol: "RILA", name: "Spinnaker ETF Series Indexperts Gorilla Aggressive Growth ETF" },
-    { symbol: "RINC", name: "Investment Managers Series Trust II AXS Real Estate Income ETF" },
-    { symbol: "RINF", name: "ProShares Inflation Expectations ETF" },
-    { symbol: "RIO", name: "Rio Tinto Plc Common Stock" },
-    { symbol: "RIOX", name: "Tidal Trust II Defiance Daily Target 2X Long RIOT ETF" },
-    { symbol: "RISN", name: "Inspire Tactical Balanced ETF" },
-    { symbol: "RISR", name: "FolioBeyond Alternative Income and Interest Rate Hedge ETF" },
-    { symbol: "RITA", name: "ETF Series Solutions ETFB Green SRI REITs ETF" },
-    { symbol: "RITM", name: "Rithm Capital Corp. Common Stock" },
-    { symbol: "RITM$A", name: "Rithm Capital Corp. 7.50% Series A Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "RITM$B", name: "Rithm Capital Corp. 7.125% Series B Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "RITM$C", name: "Rithm Capital Corp. 6.375% Series C Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "RITM$D", name: "Rithm Capital Corp. 7.00% Fixed-Rate Reset Series D Cumulative Redeemable Preferred Stock" },
-    { symbol: "RIV", name: "RiverNorth Opportunities Fund, Inc. Common Stock" },
-    { symbol: "RIV$A", name: "RiverNorth Opportunities Fund, Inc. 6.00% Series A Perpetual Preferred Stock" },
-    { symbol: "RJF", name: "Raymond James Financial, Inc. Common Stock" },
-    { symbol: "RJF$B", name: "Raymond James Financial, Inc. Depositary Shares, each representing a 1/40th interest in a share of 6.375% Fixed-to-Floating Rate Series B Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "RJMG", name: "First Trust Exchange-Traded Fund VIII FT Raymond James Multicap Growth Equity ETF" },
-    { symbol: "RKT", name: "Rocket Companies, Inc. Class A Common Stock" },
-    { symbol: "RL", name: "Ralph Lauren Corporation Common Stock" },
-    { symbol: "RLGT", name: "Radiant Logistics, Inc. Common Stock" },
-    { symbol: "RLI", name: "RLI Corp. Common Stock (DE)" },
-    { symbol: "RLJ", name: "RLJ Lodging Trust Common Shares of Beneficial Interest $0.01 par value" },
-    { symbol: "RLJ$A", name: "RLJ Lodging Trust $1.95 Series A Cumulative Convertible  Preferred Shares" },
-    { symbol: "RLTY", name: "Cohen & Steers Real Estate Opportunities and Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "RLX", name: "RLX Technology Inc. American Depositary Shares, each representing the right to receive one (1) Class A ordinary share" },
-    { symbol: "RLY", name: "SPDR SSgA Multi Asset Real Return ETF" },
-    { symbol: "RM", name: "Regional Management Corp. Common Stock" },
-    { symbol: "RMAX", name: "RE/MAX Holdings, Inc. Class A Common Stock" },
-    { symbol: "RMCA", name: "Tidal Trust III Rockefeller California Municipal Bond ETF" },
-    { symbol: "RMD", name: "ResMed Inc. Common Stock" },
-    { symbol: "RMI", name: "RiverNorth Opportunistic Municipal Income Fund, Inc. Common Stock" },
-    { symbol: "RMIF", name: "ETF Series Solutions LHA Risk-Managed Income ETF" },
-    { symbol: "RMM", name: "RiverNorth Managed Duration Municipal Income Fund, Inc. Common Stock" },
-    { symbol: "RMMZ", name: "RiverNorth Managed Duration Municipal Income Fund II, Inc. Common Stock" },
-    { symbol: "RMNY", name: "Tidal Trust III Rockefeller New York Municipal Bond ETF" },
-    { symbol: "RMOP", name: "Tidal Trust III Rockefeller Opportunistic Municipal Bond ETF" },
-    { symbol: "RMT", name: "Royce Micro-Cap Trust, Inc. Common Stock" },
-    { symbol: "RND", name: "First Trust Exchange-Traded Fund VI First Trust Bloomberg R&D Leaders ETF" },
-    { symbol: "RNG", name: "RingCentral, Inc. Class A Common Stock" },
-    { symbol: "RNGR", name: "Ranger Energy Services, Inc. Class A Common Stock" },
-    { symbol: "RNP", name: "Cohen & Steers REIT and Preferred and Income Fund, Inc. Common Shares" },
-    { symbol: "RNR", name: "RenaissanceRe Holdings Ltd. Common Stock" },
-    { symbol: "RNR$F", name: "RenaissanceRe Holdings Ltd. Depositary Shares, each Representing a 1/1,000th Interest in a 5.750% Series F Preference Share" },
-    { symbol: "RNR$G", name: "RenaissanceRe Holdings Ltd. Depositary Shares, each representing a 1/1,000th interest in a share of 4.20% Series G Preference Shares" },
-    { symbol: "RNST", name: "Renasant Corporation Common Stock" },
-    { symbol: "RNTY", name: "Tidal Trust II YieldMax  Target 12  Real Estate Option Income ETF" },
-    { symbol: "RNWZ", name: "Listed Funds Trust TrueShares Eagle Global Renewable Energy Income ETF" },
-    { symbol: "ROAM", name: "Hartford Multifactor Emerging Markets ETF" },
-    { symbol: "ROBN", name: "ETF Opportunities Trust T-Rex 2X Long HOOD Daily Target ETF" },
-    { symbol: "ROBO", name: "Exchange Traded Concepts Trust ROBO Global Robotics and Automation Index ETF" },
-    { symbol: "RODM", name: "Hartford Multifactor Developed Markets (ex-US) ETF" },
-    { symbol: "ROG", name: "Rogers Corporation Common Stock" },
-    { symbol: "ROK", name: "Rockwell Automation, Inc. Common Stock" },
-    { symbol: "ROKT", name: "SPDR S&P Kensho Final Frontiers ETF" },
-    { symbol: "ROL", name: "Rollins, Inc. Common Stock" },
-    { symbol: "ROLR", name: "High Roller Technologies, Inc. Common Stock" },
-    { symbol: "ROM", name: "ProShares Ultra Technology" },
-    { symbol: "ROMO", name: "Strategy Shares Newfound/ReSolve Robust Momentum ETF" },
-    { symbol: "ROPE", name: "EA Series Trust Coastal Compass 100 ETF" },
-    { symbol: "RORO", name: "ATAC US Rotation ETF" },
-    { symbol: "ROSC", name: "Hartford Multifactor Small Cap ETF" },
-    { symbol: "ROUS", name: "Hartford Multifactor U.S. Equity ETF" },
-    { symbol: "RPAR", name: "RPAR Risk Parity ETF" },
-    { symbol: "RPG", name: "Invesco S&P 500 Pure Growth ETF" },
-    { symbol: "RPHS", name: "Two Roads Shared Trust Regents Park Hedged Market Strategy ETF" },
-    { symbol: "RPM", name: "RPM International Inc. Common Stock" },
-    { symbol: "RPT", name: "Rithm Property Trust Inc. Common stock" },
-    { symbol: "RPT$C", name: "Rithm Property Trust Inc. 9.875% Series C Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "RPV", name: "Invesco S&P 500 Pure Value ETF" },
-    { symbol: "RQI", name: "Cohen & Steers Quality Income Realty Fund Inc Common Shares" },
-    { symbol: "RRC", name: "Range Resources Corporation Common Stock" },
-    { symbol: "RRX", name: "Regal Rexnord Corporation Common Stock" },
-    { symbol: "RS", name: "Reliance, Inc. Common Stock" },
-    { symbol: "RSBA", name: "Tidal Trust II Return Stacked Bonds & Merger Arbitrage ETF" },
-    { symbol: "RSBT", name: "Return Stacked Bonds & Managed Futures ETF" },
-    { symbol: "RSBY", name: "Tidal Trust II Return Stacked Bonds & Futures Yield ETF" },
-    { symbol: "RSDE", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Equal Weight Buffer ETF - December" },
-    { symbol: "RSEE", name: "Collaborative Investment Series Trust Rareview Systematic Equity ETF" },
-    { symbol: "RSF", name: "RiverNorth Capital and Income Fund Common Stock" },
-    { symbol: "RSG", name: "Republic Services, Inc. Common Stock" },
-    { symbol: "RSHO", name: "Tema ETF Trust Tema American Reshoring ETF" },
-    { symbol: "RSI", name: "Rush Street Interactive, Inc. Class A Common Stock" },
-    { symbol: "RSJN", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Equal Weight Buffer ETF - June" },
-    { symbol: "RSKD", name: "Riskified Ltd. Class A Ordinary Shares" },
-    { symbol: "RSMC", name: "Tidal Trust III Rockefeller U.S. Small-Mid Cap ETF" },
-    { symbol: "RSMR", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Equal Weight Buffer ETF - March" },
-    { symbol: "RSMV", name: "Listed Funds Trust Relative Strength Managed Volatility Strategy ETF" },
-    { symbol: "RSP", name: "Invesco S&P 500 Equal Weight ETF" },
-    { symbol: "RSPA", name: "Invesco Actively Managed Exchange-Traded Fund Trus Invesco S&P 500 Equal Weight Income Advantage ETF" },
-    { symbol: "RSPC", name: "Invesco S&P 500 Equal Weight Communication Services ETF" },
-    { symbol: "RSPD", name: "Invesco S&P 500 Equal Weight Consumer Discretionary ETF" },
-    { symbol: "RSPE", name: "Invesco ESG S&P 500 Equal Weight ETF" },
-    { symbol: "RSPF", name: "Invesco S&P 500 Equal Weight Financial ETF" },
-    { symbol: "RSPG", name: "Invesco S&P 500 Equal Weight Energy ETF" },
-    { symbol: "RSPH", name: "Invesco S&P 500 Equal Weight Health Care ETF" },
-    { symbol: "RSPM", name: "Invesco S&P 500 Equal Weight Materials ETF" },
-    { symbol: "RSPN", name: "Invesco S&P 500 Equal Weight Industrials Portfolio" },
-    { symbol: "RSPR", name: "Invesco S&P 500 Equal Weight Real Estate ETF" },
-    { symbol: "RSPS", name: "Invesco S&P 500 Equal Weight Consumer Staples ETF  " },
-    { symbol: "RSPT", name: "Invesco S&P 500 Equal Weight Technology ETF" },
-    { symbol: "RSPU", name: "Invesco S&P 500 Equal Weight Utilities ETF" },
-    { symbol: "RSSB", name: "Tidal Trust II Return Stacked Global Stocks & Bonds ETF" },
-    { symbol: "RSSE", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Equal Weight Buffer ETF  September" },
-    { symbol: "RSSL", name: "Global X Funds Global X Russell 2000 ETF" },
-    { symbol: "RSST", name: "Tidal Trust II Return Stacked U.S. Stocks & Managed Futures ETF" },
-    { symbol: "RSSX", name: "Tidal Trust II Return Stacked U.S. Stocks & Gold/Bitcoin ETF" },
-    { symbol: "RSSY", name: "Tidal Trust II Return Stacked U.S. Stocks & Futures Yield ETF" },
-    { symbol: "RTAI", name: "Rareview Tax Advantaged Income ETF" },
-    { symbol: "RTO", name: "Rentokil Initial plc American Depositary Shares (each representing five (5) Ordinary Shares)" },
-    { symbol: "RTRE", name: "Collaborative Investment Series Trust Rareview Total Return Bond ETF" },
-    { symbol: "RTX", name: "RTX Corporation Common Stock" },
-    { symbol: "RULE", name: "Adaptive Core ETF" },
-    { symbol: "RVER", name: "Advisor Managed Portfolios Trenchless Fund ETF" },
-    { symbol: "RVLV", name: "Revolve Group, Inc. Class A Common Stock" },
-    { symbol: "RVNU", name: "Xtrackers Municipal Infrastructure Revenue Bond ETF" },
-    { symbol: "RVP", name: "Retractable Technologies, Inc. Common Stock" },
-    { symbol: "RVRB", name: "Advisors Series Trust Reverb ETF" },
-    { symbol: "RVT", name: "Royce Small-Cap Trust, Inc. Common Stock" },
-    { symbol: "RVTY", name: "Revvity, Inc. Common Stock" },
-    { symbol: "RW", name: "EA Series Trust Rainwater Equity ETF" },
-    { symbol: "RWJ", name: "Invesco Exchange-Traded Fund Trust II Invesco S&P SmallCap 600 Revenue ETF" },
-    { symbol: "RWK", name: "Invesco Exchange-Traded Fund Trust II Invesco S&P MidCap 400 Revenue ETF" },
-    { symbol: "RWL", name: "Invesco Exchange-Traded Fund Trust II Invesco S&P 500 Revenue ETF" },
-    { symbol: "RWM", name: "ProShares Short Russell2000" },
-    { symbol: "RWO", name: "SPDR DJ Wilshire Global Real Estate ETF" },
-    { symbol: "RWR", name: "SPDR DJ Wilshire REIT ETF" },
-    { symbol: "RWT", name: "Redwood Trust, Inc. Common Stock" },
-    { symbol: "RWT$A", name: "Redwood Trust, Inc. 10.00% Series A Fixed-Rate Reset Cumulative Redeemable Preferred Stock" },
-    { symbol: "RWTN", name: "Redwood Trust, Inc. 9.125% Senior Notes Due 2029" },
-    { symbol: "RWTO", name: "Redwood Trust, Inc. 9.00% Senior Notes Due 2029" },
-    { symbol: "RWTP", name: "Redwood Trust, Inc. 9.125% Senior Notes Due 2030" },
-    { symbol: "RWX", name: "SPDR DJ Wilshire Intl Real Estate" },
-    { symbol: "RXD", name: "ProShares UltraShort Health Care" },
-    { symbol: "RXI", name: "iShares Global Consumer Discretionary ETF" },
-    { symbol: "RXL", name: "ProShares Ultra Health Care" },
-    { symbol: "RXO", name: "RXO, Inc. Common Stock" },
-    { symbol: "RY", name: "Royal Bank Of Canada Common Stock" },
-    { symbol: "RYAM", name: "Rayonier Advanced Materials Inc. Common Stock" },
-    { symbol: "RYAN", name: "Ryan Specialty Holdings, Inc. Class A Common Stock" },
-    { symbol: "RYDE", name: "Ryde Group Ltd. Class A Ordinary Shares" },
-    { symbol: "RYI", name: "Ryerson Holding Corporation Common Stock" },
-    { symbol: "RYLD", name: "Global X Russell 2000 Covered Call ETF" },
-    { symbol: "RYLG", name: "Global X Funds Global X Russell 2000 Covered Call & Growth ETF" },
-    { symbol: "RYN", name: "Rayonier Inc. REIT Common Stock" },
-    { symbol: "RYSE", name: "Vest 10 Year Interest Rate Hedge ETF" },
-    { symbol: "RZB", name: "Reinsurance Group of America, Incorporated 5.75% Fixed-To-Floating Rate Subordinated Debentures due 2056" },
-    { symbol: "RZC", name: "Reinsurance Group of America, Incorporated 7.125% Fixed-Rate Reset Subordinated Debentures due 2052" },
-    { symbol: "RZG", name: "Invesco S&P Smallcap 600 Pure Growth ETF" },
-    { symbol: "RZV", name: "Invesco S&P Smallcap 600 Pure Value ETF" },
-    { symbol: "S", name: "SentinelOne, Inc. Class A Common Stock" },
-    { symbol: "SA", name: "Seabridge Gold, Inc. Ordinary Shares (Canada)" },
-    { symbol: "SAA", name: "ProShares Ultra SmallCap600" },
-    { symbol: "SABA", name: "Saba Capital Income & Opportunities Fund II Shares of Beneficial Interest" },
-    { symbol: "SACH", name: "Sachem Capital Corp. Common Shares" },
-    { symbol: "SACH$A", name: "Sachem Capital Corp. 7.75% Series A Cumulative Redeemable Preferred Stock" },
-    { symbol: "SAEF", name: "Schwab Ariel Opportunities ETF" },
-    { symbol: "SAFE", name: "Safehold Inc. New Common Stock " },
-    { symbol: "SAGP", name: "The Advisors' Inner Circle Fund III Strategas Global Policy Opportunities ETF" },
-    { symbol: "SAH", name: "Sonic Automotive, Inc. Common Stock" },
-    { symbol: "SAJ", name: "Saratoga Investment Corp 8.00% Notes due 2027" },
-    { symbol: "SAM", name: "Boston Beer Company, Inc. (The) Common Stock" },
-    { symbol: "SAMM", name: "The Advisors' Inner Circle Fund III Strategas Macro Momentum ETF" },
-    { symbol: "SAMT", name: "The Advisors' Inner Circle Fund III Strategas Macro Thematic Opportunities ETF" },
-    { symbol: "SAN", name: "Banco Santander, S.A. Sponsored ADR (Spain)" },
-    { symbol: "SAND", name: "Sandstorm Gold Ltd. Ordinary Shares (Canada)" },
-    { symbol: "SAP", name: "SAP  SE ADS" },
-    { symbol: "SAPH", name: "Precidian ETFs Trust SAP SE ADRhedged" },
-    { symbol: "SAR", name: "Saratoga Investment Corp New" },
-    { symbol: "SARO", name: "StandardAero, Inc. Common Stock" },
-    { symbol: "SAT", name: "Saratoga Investment Corp 6.00% Notes due 2027" },
-    { symbol: "SATO", name: "Invesco Alerian Galaxy Crypto Economy ETF" },
-    { symbol: "SAUG", name: "FT Vest U.S. Small Cap Moderate Buffer ETF - August" },
-    { symbol: "SAWG", name: "ETF Series Solutions AAM Sawgrass US Large Cap Quality Growth ETF" },
-    { symbol: "SAWS", name: "ETF Series Solutions AAM Sawgrass US Small Cap Quality Growth ETF" },
-    { symbol: "SAY", name: "Saratoga Investment Corp 8.125% Notes due 2027" },
-    { symbol: "SAZ", name: "Saratoga Investment Corp 8.50% Notes due 2028" },
-    { symbol: "SB", name: "Safe Bulkers, Inc Common Stock ($0.001 par value)" },
-    { symbol: "SB$C", name: "Safe Bulkers, Inc Cumulative Redeemable Perpetual Preferred Series C (Marshall Islands)" },
-    { symbol: "SB$D", name: "Safe Bulkers, Inc Perpetual Preferred Series D (Marshall Islands)" },
-    { symbol: "SBAR", name: "Simplify Exchange Traded Funds Simplify Barrier Income ETF" },
-    { symbol: "SBB", name: "ProShares Short SmallCap600" },
-    { symbol: "SBDS", name: "Solo Brands, Inc. Class A Common Stock" },
-    { symbol: "SBEV", name: "Splash Beverage Group, Inc. (NV) Common Stock" },
-    { symbol: "SBH", name: "Sally Beauty Holdings, Inc. (Name to be changed from Sally Holdings, Inc.) Common Stock" },
-    { symbol: "SBI", name: "Western Asset Intermediate Muni Fund Inc Common Stock" },
-    { symbol: "SBIL", name: "Simplify Exchange Traded Funds Simplify Government Money Market ETF" },
-    { symbol: "SBIO", name: "ALPS Medical Breakthroughs ETF" },
-    { symbol: "SBIT", name: "ProShares Trust ProShares UltraShort Bitcoin ETF" },
-    { symbol: "SBND", name: "Columbia Short Duration Bond ETF" },
-    { symbol: "SBR", name: "Sabine Royalty Trust Common Stock" },
-    { symbol: "SBS", name: "Companhia de saneamento Basico Do Estado De Sao Paulo - Sabesp American Depositary Shares (Each repstg 250 Common Shares)" },
-    { symbol: "SBSI", name: "Southside Bancshares, Inc. Common Stock" },
-    { symbol: "SBSW", name: "D/B/A Sibanye-Stillwater Limited ADS" },
-    { symbol: "SBXD", name: "SilverBox Corp IV Class A Ordinary Shares" },
-    { symbol: "SBXD.U", name: "SilverBox Corp IV Units, each consisting of one Class A ordinary share and one-third of one redeemable warrant" },
-    { symbol: "SBXD.W", name: "SilverBox Corp IV Redeemable warrants, each whole warrant exercisable for one Class A Ordinary Share at an exercise price of $11.50" },
-    { symbol: "SCAP", name: "Infrastructure Capital Small Cap Income ETF" },
-    { symbol: "SCC", name: "ProShares UltraShort Consumer Discretionary" },
-    { symbol: "SCCC", name: "Sachem Capital Corp. 7.75% Notes due 2025" },
-    { symbol: "SCCD", name: "Sachem Capital Corp. 6.00% Notes due 2026" },
-    { symbol: "SCCE", name: "Sachem Capital Corp. 6.00% Notes due 2027" },
-    { symbol: "SCCF", name: "Sachem Capital Corp. 7.125% Notes due 2027" },
-    { symbol: "SCCG", name: "Sachem Capital Corp. 8.00% Notes due 2027" },
-    { symbol: "SCCO", name: "Southern Copper Corporation Common Stock" },
-    { symbol: "SCCR", name: "Schwab Strategic Trust Schwab Core Bond ETF" },
-    { symbol: "SCD", name: "LMP Capital and Income Fund Inc. Common Stock" },
-    { symbol: "SCDL", name: "ETRACS 2x Leveraged US Dividend Factor TR ETN" },
-    { symbol: "SCDV", name: "ETF Series Solutions Bahl & Gaynor Small Cap Dividend ETF" },
-    { symbol: "SCE$G", name: "SCE Trust II Trust Preferred Securities" },
-    { symbol: "SCE$J", name: "Southern California Edison Company 5.375% Fixed-to-Floating Rate Trust Preference Securities" },
-    { symbol: "SCE$K", name: "Southern California Edison Company 5.45% Fixed-to-Floating Rate Trust Preference Securities" },
-    { symbol: "SCE$L", name: "SCE TRUST VI" },
-    { symbol: "SCE$M", name: "SCE Trust VII 7.50% Trust Preference Securities" },
-    { symbol: "SCE$N", name: "SCE Trust VIII 6.95% Trust Preference Securities" },
-    { symbol: "SCEC", name: "Capitol Series Trust Sterling Capital Enhanced Core Bond ETF" },
-    { symbol: "SCHA", name: "Schwab U.S. Small-Cap ETF" },
-    { symbol: "SCHB", name: "Schwab U.S. Broad Market ETF" },
-    { symbol: "SCHC", name: "Schwab International Small-Cap Equity ETF" },
-    { symbol: "SCHD", name: "Schwab US Dividend Equity ETF" },
-    { symbol: "SCHE", name: "Schwab Emerging Markets Equity ETF" },
-    { symbol: "SCHF", name: "Schwab International Equity ETF" },
-    { symbol: "SCHG", name: "Schwab U.S. Large-Cap Growth ETF" },
-    { symbol: "SCHH", name: "Schwab U.S. REIT ETF" },
-    { symbol: "SCHI", name: "Schwab 5-10 Year Corporate Bond ETF" },
-    { symbol: "SCHJ", name: "Schwab 1-5 Year Corporate Bond ETF" },
-    { symbol: "SCHK", name: "Schwab 1000 Index ETF" },
-    { symbol: "SCHM", name: "Schwab U.S. Mid Cap ETF" },
-    { symbol: "SCHO", name: "Schwab Short-Term U.S. Treasury ETF" },
-    { symbol: "SCHP", name: "Schwab U.S. TIPs ETF" },
-    { symbol: "SCHQ", name: "Schwab Long-Term U.S. Treasury ETF" },
-    { symbol: "SCHR", name: "Schwab Intermediate-Term U.S. Treasury ETF" },
-    { symbol: "SCHV", name: "Schwab U.S. Large-Cap Value ETF" },
-    { symbol: "SCHW", name: "Charles Schwab Corporation (The) Common Stock" },
-    { symbol: "SCHW$D", name: "The Charles Schwab Corporation Depositary Shares each representing 1/40th interest in a share of 5.95% Non-Cumulative Perpetual Preferred Stock, Series D" },
-    { symbol: "SCHW$J", name: "The Charles Schwab Corporation Depositary Shares, Each Representing a 1/40th Interest in a Share of 4.450% Non-Cumulative Perpetual Preferred Stock, Series J" },
-    { symbol: "SCHX", name: "Schwab U.S. Large-Cap ETF" },
-    { symbol: "SCHY", name: "Schwab International Dividend Equity ETF" },
-    { symbol: "SCHZ", name: "Schwab US Aggregate Bond ETF" },
-    { symbol: "SCI", name: "Service Corporation International Common Stock" },
-    { symbol: "SCIO", name: "First Trust Exchange-Traded Fund IV First Trust Structured Credit Income Opportunities ETF" },
-    { symbol: "SCJ", name: "iShares MSCI Japan Sm Cap" },
-    { symbol: "SCL", name: "Stepan Company Common Stock" },
-    { symbol: "SCLZ", name: "Northern Lights Fund Trust III Swan Enhanced Dividend Income ETF" },
-    { symbol: "SCM", name: "Stellus Capital Investment Corporation Common Stock" },
-    { symbol: "SCMB", name: "Schwab Strategic Trust Schwab Municipal Bond ETF" },
-    { symbol: "SCO", name: "ProShares UltraShort Bloomberg Crude Oil" },
-    { symbol: "SCOW", name: "Pacer Funds Trust Pacer S&P SmallCap 600 Quality FCF Aristocrats ETF" },
-    { symbol: "SCS", name: "Steelcase Inc. Common Stock" },
-    { symbol: "SCUS", name: "Schwab Strategic Trust Schwab Ultra-Short Income ETF" },
-    { symbol: "SCYB", name: "Schwab Strategic Trust Schwab High Yield Bond ETF" },
-    { symbol: "SD", name: "SandRidge Energy, Inc. Common Stock" },
-    { symbol: "SDCI", name: "USCF SummerHaven Dynamic Commodity Strategy No K-1 Fund" },
-    { symbol: "SDCP", name: "Virtus ETF Trust II Virtus Newfleet Short Duration Core Plus Bond ETF" },
-    { symbol: "SDD", name: "ProShares UltraShort SmallCap600" },
-    { symbol: "SDEM", name: "Global X MSCI SuperDividend Emerging Markets ETF" },
-    { symbol: "SDFI", name: "AB Active ETFs, Inc. AB Short Duration Income ETF" },
-    { symbol: "SDHC", name: "Smith Douglas Homes Corp. Class A Common Stock" },
-    { symbol: "SDHY", name: "PGIM Short Duration High Yield Opportunities Fund Common Shares" },
-    { symbol: "SDIV", name: "Global X SuperDividend ETF" },
-    { symbol: "SDOG", name: "ALPS Sector Dividend Dogs ETF" },
-    { symbol: "SDOW", name: "UltraPro Short Dow30" },
-    { symbol: "SDP", name: "ProShares UltraShort Utilities" },
-    { symbol: "SDRL", name: "Seadrill Limited Common Shares" },
-    { symbol: "SDS", name: "ProShares UltraShort S&P500" },
-    { symbol: "SDVD", name: "FT Vest SMID Rising Dividend Achievers Target Income ETF" },
-    { symbol: "SDY", name: "SPDR S&P Dividend ETF" },
-    { symbol: "SE", name: "Sea Limited American Depositary Shares, each representing one Class A Ordinary Share" },
-    { symbol: "SEA", name: "ETF Series Solutions U.S. Global Sea to Sky Cargo ETF" },
-    { symbol: "SEAL$A", name: "Seapeak LLC 9.00% Series A Cumulative Redeemable Perpetual Preferred Units" },
-    { symbol: "SEAL$B", name: "Seapeak LLC 8.50% Series B Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Units" },
-    { symbol: "SEB", name: "Seaboard Corporation Common Stock" },
-    { symbol: "SECR", name: "NYLI MacKay Securitized Income ETF" },
-    { symbol: "SECT", name: "Northern Lights Fund Trust IV Main Sector Rotation ETF" },
-    { symbol: "SEE", name: "Sealed Air Corporation Common Stock" },
-    { symbol: "SEF", name: "ProShares Short Financials" },
-    { symbol: "SEG", name: "Seaport Entertainment Group Inc. Common Stock" },
-    { symbol: "SEI", name: "Solaris Energy Infrastructure, Inc. Class A Common Stock" },
-    { symbol: "SEIM", name: "SEI Enhanced U.S. Large Cap Momentum Factor ETF" },
-    { symbol: "SEIQ", name: "SEI Enhanced U.S. Large Cap Quality Factor ETF" },
-    { symbol: "SEIV", name: "SEI Enhanced U.S. Large Cap Value Factor ETF" },
-    { symbol: "SEIX", name: "Virtus Seix Senior Loan ETF" },
-    { symbol: "SELV", name: "SEI Enhanced Low Volatility U.S. Large Cap ETF" },
-    { symbol: "SEM", name: "Select Medical Holdings Corporation Common Stock" },
-    { symbol: "SEMG", name: "EA Series Trust Suncoast Select Growth ETF" },
-    { symbol: "SEMI", name: "Columbia Select Technology ETF" },
-    { symbol: "SEMR", name: "SEMrush Holdings, Inc. Class A Common Stock" },
-    { symbol: "SENS", name: "Senseonics Holdings, Inc. Common Stock" },
-    { symbol: "SEPI", name: "SCM Trust Shelton Equity Premium Income ETF" },
-    { symbol: "SEPM", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Max Buffer ETF - September" },
-    { symbol: "SEPP", name: "PGIM S&P 500 Buffer 12 ETF - September" },
-    { symbol: "SEPT", name: "AIM ETF Products Trust AllianzIM U.S. Large Cap Buffer10 Sep ETF" },
-    { symbol: "SEPU", name: "AIM ETF Products Trust AllianzIM U.S. Equity Buffer15 Uncapped Sep ETF" },
-    { symbol: "SEPW", name: "AIM ETF Products Trust AllianzIM U.S. Large Cap Buffer20 Sep ETF" },
-    { symbol: "SEPZ", name: "TrueShares Structured Outcome (September) ETF" },
-    { symbol: "SER", name: "Serina Therapeutics, Inc. Common Stock" },
-    { symbol: "SES", name: "SES AI Corporation Class A Common Stock" },
-    { symbol: "SES.W", name: "SES AI Corporation Warrants, each whole warrant exercisable for one share of Class A Common Stock at an exercise price of $11.50 per share" },
-    { symbol: "SETH", name: "ProShares Short Ether ETF" },
-    { symbol: "SF", name: "Stifel Financial Corporation Common Stock" },
-    { symbol: "SF$B", name: "Stifel Financial Corporation Depositary Shares, Each Representing 1/1,000th  Interest in a Share of 6.25% Non-Cumulative  Preferred Stock, Series B" },
-    { symbol: "SF$C", name: "Stifel Financial Corporation Depositary Shares, Each Representing 1/1,000th Interest in a Share of 6.125% Non Cumulative Preferred Stock, Series C" },
-    { symbol: "SF$D", name: "Stifel Financial Corporation Depositary Shares, Each Representing 1/1,000th Interest in a Share of 4.50% Non-Cumulative Preferred Stock, Series D" },
-    { symbol: "SFB", name: "Stifel Financial Corporation 5.20% Senior Notes due 2047" },
-    { symbol: "SFBS", name: "ServisFirst Bancshares, Inc. Common Stock" },
-    { symbol: "SFEB", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Small Cap Moderate Buffer ETF - February" },
-    { symbol: "SFL", name: "SFL Corporation Ltd" },
-    { symbol: "SFLR", name: "Innovator ETFs Trust Innovator Equity Managed Floor ETF" },
-    { symbol: "SFTY", name: "Horizon Funds Horizon Managed Risk ETF" },
-    { symbol: "SFY", name: "SoFi Select 500 ETF" },
-    { symbol: "SFYF", name: "SoFi Social 50 ETF" },
-    { symbol: "SFYX", name: "SoFi Next 500 ETF" },
-    { symbol: "SG", name: "Sweetgreen, Inc. Class A Common Stock" },
-    { symbol: "SGDJ", name: "Sprott Junior Gold Miners ETF" },
-    { symbol: "SGDM", name: "Sprott Gold Miners ETF" },
-    { symbol: "SGHC", name: "Super Group (SGHC) Limited Ordinary Shares" },
-    { symbol: "SGI", name: "Somnigroup International Inc. Common Stock" },
-    { symbol: "SGLC", name: "The RBB Fund, Inc. SGI U.S. Large Cap Core ETF" },
-    { symbol: "SGN", name: "Signing Day Sports, Inc. Common Stock" },
-    { symbol: "SGOL", name: "abrdn Physical Gold Shares ETF" },
-    { symbol: "SGOV", name: "iShares 0-3 Month Treasury Bond ETF" },
-    { symbol: "SGRT", name: "Tidal Trust I SMART Earnings Growth 30 ETF" },
-    { symbol: "SGU", name: "Star Group L.P. Common Stock" },
-    { symbol: "SGVT", name: "Schwab Strategic Trust Schwab Government Money Market ETF" },
-    { symbol: "SH", name: "ProShares Short S&P500" },
-    { symbol: "SHAG", name: "WisdomTree Yield Enhanced U.S. Short-Term Aggregate Bond Fund" },
-    { symbol: "SHAK", name: "Shake Shack, Inc. Class A Common Stock" },
-    { symbol: "SHCO", name: "Soho House & Co Inc. Class A Common Stock" },
-    { symbol: "SHDG", name: "Trust For Advised Portfolios Soundwatch Hedged Equity ETF" },
-    { symbol: "SHE", name: "SPDR MSCI USA Gender Diversity ETF" },
-    { symbol: "SHEH", name: "Precidian ETFs Trust Shell plc ADRhedged" },
-    { symbol: "SHEL", name: "Shell PLC American Depositary Shares (each representing two (2) Ordinary Shares) " },
-    { symbol: "SHG", name: "Shinhan Financial Group Co Ltd American Depositary Shares" },
-    { symbol: "SHLD", name: "Global X Funds Global X Defense Tech ETF" },
-    { symbol: "SHM", name: "SPDR Nuveen ICE Short Term Municipal Bond ETF" },
-    { symbol: "SHNY", name: "Bank Of Montreal MicroSectors Gold 3X Leveraged ETNs due January 29, 2043" },
-    { symbol: "SHO", name: "Sunstone Hotel Investors, Inc. Sunstone Hotel Investors, Inc. Common Shares" },
-    { symbol: "SHO$H", name: "Sunstone Hotel Investors, Inc. 6.125% Series H Cumulative Redeemable Preferred Stock" },
-    { symbol: "SHO$I", name: "Sunstone Hotel Investors, Inc. 5.70% Series I Cumulative Redeemable Preferred Stock" },
-    { symbol: "SHOC", name: "EA Series Trust Strive U.S. Semiconductor ETF" },
-    { symbol: "SHPP", name: "Pacer Funds Pacer Industrials and Logistics ETF" },
-    { symbol: "SHRT", name: "Gotham Short Strategies ETF" },
-    { symbol: "SHUS", name: "Exchange Listed Funds Trust Stratified LargeCap Hedged ETF" },
-    { symbol: "SHW", name: "Sherwin-Williams Company (The) Common Stock" },
-    { symbol: "SHYD", name: "VanEck ETF Trust VanEck Short High Yield Muni ETF" },
-    { symbol: "SHYG", name: "iShares 0-5 Year High Yield Corporate Bond ETF" },
-    { symbol: "SHYL", name: "Xtrackers Short Duration High Yield Bond ETF" },
-    { symbol: "SHYM", name: "iShares Short Duration High Yield Muni Active ETF" },
-    { symbol: "SI", name: "Shoulder Innovations, Inc. Common Stock" },
-    { symbol: "SID", name: "Companhia Siderurgica Nacional S.A. Common Stock" },
-    { symbol: "SIF", name: "SIFCO Industries, Inc. Common Stock" },
-    { symbol: "SIFI", name: "Harbor Scientific Alpha Income ETF" },
-    { symbol: "SIG", name: "Signet Jewelers Limited Common Shares" },
-    { symbol: "SIHY", name: "Harbor Scientific Alpha High-Yield ETF" },
-    { symbol: "SII", name: "Sprott Inc. Common Shares" },
-    { symbol: "SIJ", name: "ProShares UltraShort Industrials" },
-    { symbol: "SIL", name: "Global X Silver Miners ETF" },
-    { symbol: "SILA", name: "Sila Realty Trust, Inc. Common Stock" },
-    { symbol: "SILJ", name: "Amplify ETF Trust Amplify Junior Silver Miners ETF" },
-    { symbol: "SIM", name: "Grupo Simec, S.A.B. de C.V. American Depositary Shares" },
-    { symbol: "SIMS", name: "SPDR S&P Kensho Intelligent Structures ETF " },
-    { symbol: "SIO", name: "Touchstone Strategic Income ETF" },
-    { symbol: "SITC", name: "SITE Centers Corp. Common Stock" },
-    { symbol: "SITE", name: "SiteOne Landscape Supply, Inc. Common Stock" },
-    { symbol: "SIVR", name: "abrdn Physical Silver Shares ETF" },
-    { symbol: "SIXA", name: "ETC 6 Meridian Mega Cap Equity ETF" },
-    { symbol: "SIXD", name: "SHL Telemedicine Ltd AllianzIM U.S. Large Cap 6 Month Buffer10 Jun/Dec ETF" },
-    { symbol: "SIXF", name: "AIM ETF Products Trust AllianzIM U.S. Large Cap 6 Month Buffer10 Feb/Aug ETF" },
-    { symbol: "SIXH", name: "ETC 6 Meridian Hedged Equity Index Option ETF" },
-    { symbol: "SIXJ", name: "AIM ETF Products Trust AllianzIM U.S. Large Cap 6 Month Buffer10 Jan/Jul ETF" },
-    { symbol: "SIXL", name: "ETC 6 Meridian Low Beta Equity ETF" },
-    { symbol: "SIXO", name: "AllianzIM U.S. Large Cap 6 Month Buffer10 Apr/Oct ETF" },
-    { symbol: "SIXP", name: "AIM ETF Products Trust AllianzIM U.S. Large Cap 6 Month Buffer10 Mar/Sep ETF" },
-    { symbol: "SIXS", name: "ETC 6 Meridian Small Cap Equity ETF" },
-    { symbol: "SIXZ", name: "SHL Telemedicine Ltd AllianzIM U.S. Large Cap 6 Month Buffer10 May/Nov ETF" },
-    { symbol: "SIZE", name: "iShares MSCI USA Size Factor ETF" },
-    { symbol: "SJB", name: "ProShares Short High Yield" },
-    { symbol: "SJM", name: "The J.M. Smucker Company Common Stock" },
-    { symbol: "SJNK", name: "SPDR Bloomberg Short Term High Yield Bond ETF" },
-    { symbol: "SJT", name: "San Juan Basin Royalty Trust Common Stock" },
-    { symbol: "SKE", name: "Skeena Resources Limited Common Shares" },
-    { symbol: "SKF", name: "ProShares UltraShort Financials" },
-    { symbol: "SKIL", name: "Skillsoft Corp. Class A Common Stock" },
-    { symbol: "SKLZ", name: "Skillz Inc. Class A Common Stock" },
-    { symbol: "SKM", name: "SK Telecom Co., Ltd. Common Stock" },
-    { symbol: "SKT", name: "Tanger Inc. Common Stock" },
-    { symbol: "SKX", name: "Skechers U.S.A., Inc. Common Stock" },
-    { symbol: "SKY", name: "Champion Homes, Inc. Common Stock" },
-    { symbol: "SKYH", name: "Sky Harbour Group Corporation Class A Common Stock" },
-    { symbol: "SKYH.W", name: "Sky Harbour Group Corporation Warrants, each whole warrant exercisable for one share of Class A common stock at an exercise price of $11.50 per share" },
-    { symbol: "SLB", name: "Schlumberger N.V. Common Stock" },
-    { symbol: "SLDR", name: "Global X Funds Global X Short-Term Treasury Ladder ETF" },
-    { symbol: "SLF", name: "Sun Life Financial Inc. Common Stock" },
-    { symbol: "SLG", name: "SL Green Realty Corp Common Stock" },
-    { symbol: "SLG$I", name: "SL Green Realty Corporation Preferred Series I" },
-    { symbol: "SLGN", name: "Silgan Holdings Inc. Common Stock" },
-    { symbol: "SLI", name: "Standard Lithium Ltd. Common Shares" },
-    { symbol: "SLJY", name: "Amplify ETF Trust Amplify SILJ Covered Call ETF" },
-    { symbol: "SLND", name: "Southland Holdings, Inc. Common Stock" },
-    { symbol: "SLND.W", name: "Southland Holdings, Inc. Warrants" },
-    { symbol: "SLNZ", name: "TCW Senior Loan ETF" },
-    { symbol: "SLON", name: "ProShares Trust ProShares Ultra Solana ETF" },
-    { symbol: "SLQT", name: "SelectQuote, Inc. Common Stock" },
-    { symbol: "SLSR", name: "Solaris Resources Inc. Common Shares" },
-    { symbol: "SLTY", name: "Tidal Trust II YieldMax Ultra Short Option Income Strategy ETF" },
-    { symbol: "SLV", name: "iShares Silver Trust" },
-    { symbol: "SLVM", name: "Sylvamo Corporation Common Stock" },
-    { symbol: "SLVP", name: "iShares MSCI Global Silver Miners Fund" },
-    { symbol: "SLX", name: "VanEck Steel ETF" },
-    { symbol: "SLYG", name: "SPDR S&P 600 Small Cap Growth ETF (based on S&P SmallCap 600 Growth Index --symbol CGK)" },
-    { symbol: "SLYV", name: "SPDR S&P 600 Small Cap Value ETF (based on S&P SmallCap Value Index--symbol--CVK" },
-    { symbol: "SM", name: "SM Energy Company Common Stock" },
-    { symbol: "SMA", name: "SmartStop Self Storage REIT, Inc. Common Stock" },
-    { symbol: "SMAP", name: "Amplify ETF Trust Amplify Small-Mid Cap Equity ETF" },
-    { symbol: "SMAX", name: "iShares Trust iShares Large Cap Max Buffer Sep ETF" },
-    { symbol: "SMAY", name: "FT Vest U.S. Small Cap Moderate Buffer ETF - May" },
-    { symbol: "SMB", name: "VanEck ETF Trust VanEck Short Muni ETF" },
-    { symbol: "SMBK", name: "SmartFinancial, Inc. Common Stock" },
-    { symbol: "SMBS", name: "Schwab Strategic Trust Schwab Mortgage-Backed Securities ETF" },
-    { symbol: "SMC", name: "Summit Midstream Corporation Common Stock" },
-    { symbol: "SMCY", name: "Tidal Trust II YieldMax SMCI Option Income Strategy ETF" },
-    { symbol: "SMDD", name: "UltraPro Short MidCap400" },
-    { symbol: "SMDV", name: "ProShares Russell 2000 Dividend Growers ETF" },
-    { symbol: "SMDX", name: "Tidal Trust III Intech S&P Small-Mid Cap Diversified Alpha ETF" },
-    { symbol: "SMFG", name: "Sumitomo Mitsui Financial Group Inc Unsponsored American Depositary Shares (Japan)" },
-    { symbol: "SMG", name: "Scotts Miracle-Gro Company (The) Common Stock" },
-    { symbol: "SMHB", name: "ETRACS Monthly Pay 2x Leveraged Small Cap High Dividend ETN Series B" },
-    { symbol: "SMHI", name: "SEACOR Marine Holdings Inc. Common Stock " },
-    { symbol: "SMIG", name: "Bahl & Gaynor Small/Mid Cap Income Growth ETF" },
-    { symbol: "SMIN", name: "Ishares MSCI India Small Cap ETF" },
-    { symbol: "SMIZ", name: "Zacks Trust Zacks Small/Mid Cap ETF" },
-    { symbol: "SMLF", name: "iShares U.S. Small-Cap Equity Factor ETF" },
-    { symbol: "SMLL", name: "Harbor ETF Trust Harbor Active Small Cap ETF" },
-    { symbol: "SMLV", name: "SPDR SSGA US Small Cap Low Volatility Index ETF" },
-    { symbol: "SMMD", name: "iShares Trust iShares Russell 2500 ETF" },
-    { symbol: "SMMU", name: "Short Term Municipal Bond Active Exchange-Traded Fund" },
-    { symbol: "SMMV", name: "iShares MSCI USA Small-Cap Min Vol Factor ETF" },
-    { symbol: "SMN", name: "ProShares UltraShort Materials" },
-    { symbol: "SMOG", name: "VanEck Low Carbon Energy ETF" },
-    { symbol: "SMOT", name: "VanEck ETF Trust VanEck Morningstar SMID Moat ETF" },
-    { symbol: "SMP", name: "Standard Motor Products, Inc. Common Stock" },
-    { symbol: "SMR", name: "NuScale Power Corporation Class A Common Stock" },
-    { symbol: "SMRT", name: "SmartRent, Inc. Class A Common Stock" },
-    { symbol: "SMTH", name: "ALPS ETF Trust ALPS" },
-    { symbol: "SMU", name: "Tradr 2X Long SMR Daily ETF" },
-    { symbol: "SMUP", name: "ETF Opportunities Trust T-REX 2X Long SMR Daily Target ETF" },
-    { symbol: "SMWB", name: "Similarweb Ltd. Ordinary Shares" },
-    { symbol: "SN", name: "SharkNinja, Inc. Ordinary Shares" },
-    { symbol: "SNA", name: "Snap-On Incorporated Common Stock" },
-    { symbol: "SNAP", name: "Snap Inc. Class A Common Stock" },
-    { symbol: "SNAV", name: "Collaborative Investment Series Trust Mohr Sector Nav ETF" },
-    { symbol: "SNDA", name: "Sonida Senior Living, Inc. Common Stock" },
-    { symbol: "SNDR", name: "Schneider National, Inc. Common Stock" },
-    { symbol: "SNN", name: "Smith & Nephew SNATS, Inc. Common Stock" },
-    { symbol: "SNOU", name: "ETF Opp Tr T-REX 2X Long SNOW Daily Target ETF" },
-    { symbol: "SNOV", name: "FT Vest U.S. Small Cap Moderate Buffer ETF - November" },
-    { symbol: "SNOW", name: "Snowflake Inc. Common Stock" },
-    { symbol: "SNOY", name: "Tidal Trust II YieldMax SNOW Option Income Strategy ETF" },
-    { symbol: "SNPD", name: "Xtrackers S&P Dividend Aristocrats Screened ETF" },
-    { symbol: "SNPE", name: "Xtrackers S&P 500 Scored & Screened ETF" },
-    { symbol: "SNPG", name: "Xtrackers S&P 500 Growth Scored & Screened ETF" },
-    { symbol: "SNPV", name: "Xtrackers S&P 500 Value Scored & Screened ETF" },
-    { symbol: "SNTH", name: "Tidal Trust III MRP SynthEquity ETF" },
-    { symbol: "SNV", name: "Synovus Financial Corp. Common Stock" },
-    { symbol: "SNV$D", name: "Synovus Financial Corp. Fixed-to-Floating Rate Non-Cumulative Perpetual Preferred Stock, Series D Liquation Preference $25.00 per Share" },
-    { symbol: "SNV$E", name: "Synovus Financial Corp. 5.875% Fixed-Rate Reset Non-Cumulative Perpetual Preferred Stock, Series E" },
-    { symbol: "SNX", name: "TD SYNNEX Corporation Common Stock" },
-    { symbol: "SO", name: "Southern Company (The) Common Stock" },
-    { symbol: "SOAR", name: "Volato Group, Inc. Class A Common Stock" },
-    { symbol: "SOBO", name: "South Bow Corporation Common Shares" },
-    { symbol: "SOC", name: "Sable Offshore Corp. Common Stock" },
-    { symbol: "SOFL", name: "Tidal Trust III 2x Daily Software Platform ETF" },
-    { symbol: "SOFR", name: "Amplify ETF Trust Amplify Samsung SOFR ETF" },
-    { symbol: "SOJC", name: "Southern Company (The) Series 2017B 5.25% Junior Subordinated Notes due December 1, 2077" },
-    { symbol: "SOJD", name: "Southern Company (The) Series 2020A 4.95% Junior Subordinated Notes due January 30, 2080" },
-    { symbol: "SOJE", name: "Southern Company (The) Series 2020C 4.20% Junior Subordinated Notes due October 15, 2060" },
-    { symbol: "SOJF", name: "Southern Company (The) Series 2025A 6.50% Junior Subordinated Notes due March 15, 2085" },
-    { symbol: "SOL", name: "Emeren Group Ltd American Depositary Shares, each representing 10 shares" },
-    { symbol: "SOLR", name: "SmartETFs Sustainable Energy II ETF" },
-    { symbol: "SOLV", name: "Solventum Corporation Common Stock" },
-    { symbol: "SON", name: "Sonoco Products Company Common Stock" },
-    { symbol: "SONY", name: "Sony Group Corporation American Depositary Shares " },
-    { symbol: "SOR", name: "Source Capital, Inc. Cmn Shs of BI" },
-    { symbol: "SOS", name: "SOS Limited Class A Ordinary Shares" },
-    { symbol: "SOUL", name: "Soulpower Acquisition Corporation Class A Ordinary Shares" },
-    { symbol: "SOUL.R", name: "Soulpower Acquisition Corporation Rights, each right entitling the holder to receive one-tenth (1/10) of one Class A Ordinary Share" },
-    { symbol: "SOUL.U", name: "Soulpower Acquisition Corporation Units, each consisting of one Class A ordinary share and one right" },
-    { symbol: "SOVF", name: "Elevation Series Trust Sovereign's Capital Flourish Fund" },
-    { symbol: "SOXL", name: "Direxion Daily Semiconductor Bull 3x Shares" },
-    { symbol: "SOXS", name: "Direxion Daily Semiconductor Bear 3x Shares" },
-    { symbol: "SOXY", name: "Tidal Trust II YieldMax Target 12 Semiconductor Option Income ETF" },
-    { symbol: "SOYB", name: "Teucrium Soybean Fund ETV" },
-    { symbol: "SPAB", name: "SPDR Portfolio Aggregate Bond ETF" },
-    { symbol: "SPB", name: "Spectrum Brands Holdings, Inc. Common Stock" },
-    { symbol: "SPBO", name: "SPDR Portfolio Corporate Bond ETF" },
-    { symbol: "SPBU", name: "AIM ETF Products Trust AllianzIM Buffer15 Uncapped Allocation ETF" },
-    { symbol: "SPBW", name: "AIM ETF Products Trust AllianzIM Buffer20 Allocation ETF" },
-    { symbol: "SPBX", name: "AIM ETF Products Trust AllianzIM 6 Month Buffer10 Allocation ETF" },
-    { symbol: "SPCE", name: "Virgin Galactic Holdings, Inc. Common Stock" },
-    { symbol: "SPCZ", name: "Listed Funds Trust RiverNorth Enhanced Pre-Merger SPAC ETF" },
-    { symbol: "SPD", name: "Simplify Exchange Traded Funds Simplify US Equity PLUS Downside Convexity ETF" },
-    { symbol: "SPDG", name: "SPDR Series Trust SPDR Portfolio S&P Sector Neutral Dividend ETF" },
-    { symbol: "SPDN", name: "Direxion Daily S&P 500 Bear 1X Shares" },
-    { symbol: "SPDV", name: "AAM S&P 500 High Dividend Value ETF" },
-    { symbol: "SPDW", name: "SPDR Portfolio Developed World ex-US ETF" },
-    { symbol: "SPE", name: "Special Opportunities Fund, Inc Common Stock" },
-    { symbol: "SPE$C", name: "Special Opportunities Fund Inc. 2.75% Convertible Preferred Stock, Series C" },
-    { symbol: "SPEM", name: "SPDR Index Shares Fund SPDR Portfolio Emerging Markets ETF" },
-    { symbol: "SPEU", name: "SPDR Portfolio Europe ETF" },
-    { symbol: "SPFF", name: "Global X SuperIncome Preferred ETF" },
-    { symbol: "SPG", name: "Simon Property Group, Inc. Common Stock" },
-    { symbol: "SPG$J", name: "Simon Property Group, Inc. Simon Property Group 8 3/8% Series J Cumulative Redeemable Preferred Stock" },
-    { symbol: "SPGI", name: "S&P Global Inc. Common Stock" },
-    { symbol: "SPGM", name: "SPDR Portfolio MSCI Global Stock Market ETF" },
-    { symbol: "SPGP", name: "Invesco S&P 500 GARP ETF" },
-    { symbol: "SPH", name: "Suburban Propane Partners, L.P. Common Stock" },
-    { symbol: "SPHB", name: "Invesco S&P 500 High Beta ETF" },
-    { symbol: "SPHD", name: "Invesco S&P 500 High Dividend Low Volatility ETF" },
-    { symbol: "SPHQ", name: "Invesco S&P 500 Quality ETF" },
-    { symbol: "SPHR", name: "Sphere Entertainment Co. Class A Common Stock" },
-    { symbol: "SPHY", name: "SPDR Portfolio High Yield Bond ETF" },
-    { symbol: "SPIB", name: "SPDR Portfolio Intermediate Term Corporate Bond ETF" },
-    { symbol: "SPIN", name: "SSGA Active Trust SPDR SSGA US Equity Premium Income ETF" },
-    { symbol: "SPIP", name: "SPDR Portfolio TIPS ETF" },
-    { symbol: "SPIR", name: "Spire Global, Inc. Class A Common Stock" },
-    { symbol: "SPLB", name: "SPDR Portfolio Long Term Corporate Bond ETF" },
-    { symbol: "SPLG", name: "SPDR Portfolio S&P 500 ETF" },
-    { symbol: "SPLV", name: "Invesco S&P 500 Low Volatility ETF" },
-    { symbol: "SPMA", name: "Sound Point Meridian Capital, Inc. 8.00% Series A Preferred Shares Due 2029" },
-    { symbol: "SPMB", name: "SPDR Portfolio Mortgage Backed Bond ETF" },
-    { symbol: "SPMC", name: "Sound Point Meridian Capital, Inc. Common Stock" },
-    { symbol: "SPMD", name: "SPDR Portfolio S&P 400 Mid Cap ETF  " },
-    { symbol: "SPME", name: "Sound Point Meridian Capital, Inc. 7.875% Series B Preferred Shares due 2030" },
-    { symbol: "SPMO", name: "Invesco S&P 500 Momentum ETF" },
-    { symbol: "SPMV", name: "Invesco S&P 500 Minimum Variance ETF" },
-    { symbol: "SPNT", name: "SiriusPoint Ltd. Common Shares" },
-    { symbol: "SPNT$B", name: "SiriusPoint Ltd. 8.00% Resettable Fixed Rate Preference Shares, Series B, $25.00 liquidation preference per share" },
-    { symbol: "SPOT", name: "Spotify Technology S.A. Ordinary Shares" },
-    { symbol: "SPPP", name: "Sprott Physical Platinum and Palladium Trust" },
-    { symbol: "SPR", name: "Spirit Aerosystems Holdings, Inc. Common Stock" },
-    { symbol: "SPRE", name: "SP Funds S&P Global REIT Sharia ETF" },
-    { symbol: "SPRU", name: "Spruce Power Holding Corporation Class A Common Stock" },
-    { symbol: "SPSB", name: "SPDR Portfolio Short Term Corporate Bond ETF" },
-    { symbol: "SPSK", name: "SP Funds Dow Jones Global Sukuk ETF" },
-    { symbol: "SPSM", name: "SPDR Portfolio S&P 600 Small Cap ETF" },
-    { symbol: "SPTB", name: "SPDR Series Trust SPDR Portfolio Treasury ETF" },
-    { symbol: "SPTE", name: "SP Funds Trust SP Funds S&P Global Technology ETF" },
-    { symbol: "SPTI", name: "SPDR Portfolio Intermediate Term Treasury ETF" },
-    { symbol: "SPTL", name: "SPDR Portfolio Long Term Treasury ETF" },
-    { symbol: "SPTM", name: "SPDR Portfolio S&P 1500 Composite Stock Market ETF" },
-    { symbol: "SPTS", name: "SPDR Portfolio Short Term Treasury ETF" },
-    { symbol: "SPUC", name: "Simplify Exchange Traded Funds Simplify US Equity PLUS Upside Convexity ETF" },
-    { symbol: "SPUS", name: "SP Funds S&P 500 Sharia Industry Exclusions ETF" },
-    { symbol: "SPUT", name: "Innovator ETFs Trust Innovator Equity Premium Income - Daily PutWrite ETF" },
-    { symbol: "SPUU", name: "Direxion Daily S&P 500 Bull 2X Shares" },
-    { symbol: "SPVM", name: "Invesco S&P 500 Value with Momentum ETF" },
-    { symbol: "SPVU", name: "Invesco S&P 500 Enhanced Value ETF" },
-    { symbol: "SPWO", name: "SP Funds Trust SP Funds S&P World (ex-US) ETF" },
-    { symbol: "SPXC", name: "SPX Technologies, Inc. Common Stock" },
-    { symbol: "SPXE", name: "ProShares S&P 500 Ex-Energy ETF" },
-    { symbol: "SPXL", name: "Direxion Daily S&P 500 Bull 3X Shares" },
-    { symbol: "SPXM", name: "Tidal Trust III Azoria 500 Meritocracy ETF" },
-    { symbol: "SPXN", name: "ProShares S&P 500 Ex-Financials ETF" },
-    { symbol: "SPXS", name: "Direxion Daily S&P 500 Bear 3X" },
-    { symbol: "SPXT", name: "ProShares S&P 500 Ex-Technology ETF" },
-    { symbol: "SPXU", name: "ProShares UltraPro Short S&P500" },
-    { symbol: "SPXV", name: "ProShares S&P 500 Ex-Health Care ETF" },
-    { symbol: "SPXX", name: "Nuveen S&P 500 Dynamic Overwrite Fund" },
-    { symbol: "SPY", name: "SPDR S&P 500" },
-    { symbol: "SPYA", name: "The RBB Fund Trust Twin Oak Endure ETF" },
-    { symbol: "SPYC", name: "Simplify Exchange Traded Funds Simplify US Equity PLUS Convexity ETF" },
-    { symbol: "SPYD", name: "SPDR Series Trust SPDR Portfolio S&P 500 High Dividend ETF" },
-    { symbol: "SPYG", name: "SPDR Series Trust SPDR Portfolio S&P 500 Growth ETF" },
-    { symbol: "SPYH", name: "NEOS ETF Trust NEOS S&P 500 Hedged Equity Income ETF" },
-    { symbol: "SPYI", name: "NEOS S&P 500 High Income ETF" },
-    { symbol: "SPYT", name: "Tidal Trust II Defiance S&P 500 Target Income ETF" },
-    { symbol: "SPYU", name: "Bank Of Montreal MAX S&P 500 4X Leveraged ETNs due October 30, 2043" },
-    { symbol: "SPYV", name: "SPDR Series Trust SPDR Portfolio S&P 500 Value ETF" },
-    { symbol: "SPYX", name: "SPDR S&P 500 Fossil Fuel Reserves Free ETF" },
-    { symbol: "SQEW", name: "LeaderShares Equity Skew ETF" },
-    { symbol: "SQM", name: "Sociedad Quimica y Minera S.A. Common Stock" },
-    { symbol: "SQMX", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Quarterly Max Buffer ETF" },
-    { symbol: "SQNS", name: "Sequans Communications S.A. American Depositary Shares (each representing ten (10) Ordinary Shares)" },
-    { symbol: "SR", name: "Spire Inc. Common Stock" },
-    { symbol: "SR$A", name: "Spire Inc. Depositary Shares, each representing a 1/1,000th interest in a share of 5.90% Series A Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "SRE", name: "DBA Sempra Common Stock" },
-    { symbol: "SREA", name: "DBA Sempra 5.750% Junior Subordinated Notes due 2079" },
-    { symbol: "SRFM", name: "Surf Air Mobility Inc. Common Stock" },
-    { symbol: "SRG", name: "Seritage Growth Properties Class A Common Stock" },
-    { symbol: "SRG$A", name: "Seritage Growth Properties 7.00% Series A Cumulative Redeemable Preferred Shares of Beneficial Interest" },
-    { symbol: "SRHQ", name: "SRH U.S. Quality GARP ETF" },
-    { symbol: "SRHR", name: "Elevation Series Trust SRH REIT Covered Call ETF" },
-    { symbol: "SRI", name: "Stoneridge, Inc. Common Stock" },
-    { symbol: "SRL", name: "Scully Royalty Ltd." },
-    { symbol: "SRLN", name: "SPDR Blackstone Senior Loan ETF" },
-    { symbol: "SROI", name: "Calamos ETF Trust Calamos Antetokounmpo Global Sustainable Equities ETF" },
-    { symbol: "SRS", name: "ProShares UltraShort Real Estate" },
-    { symbol: "SRTY", name: "ProShares UltraPro Short Russell2000" },
-    { symbol: "SRV", name: "NXG Cushing Midstream Energy Fund Common Shares of Beneficial Interest" },
-    { symbol: "SRVR", name: "Pacer Data & Infrastructure Real Estate ETF" },
-    { symbol: "SRXH", name: "SRX Health Solutions, Inc. Common Stock" },
-    { symbol: "SSB", name: "SouthState Bank Corporation Common Stock" },
-    { symbol: "SSD", name: "Simpson Manufacturing Company, Inc. Common Stock" },
-    { symbol: "SSFI", name: "Day Hagan Smart Sector Fixed Income ETF" },
-    { symbol: "SSG", name: "ProShares UltraShort Semiconductors" },
-    { symbol: "SSK", name: "ETF Opportunities Trust REX-Osprey SOL + Staking ETF" },
-    { symbol: "SSL", name: "Sasol Ltd. American Depositary Shares" },
-    { symbol: "SSO", name: "ProShares Ultra S&P500" },
-    { symbol: "SSPX", name: "Janus Henderson U.S. Sustainable Equity ETF" },
-    { symbol: "SSPY", name: "Exchange Listed Funds Trust Stratified LargeCap Index ETF" },
-    { symbol: "SST", name: "System1, Inc. Class A Common Stock" },
-    { symbol: "SSTK", name: "Shutterstock, Inc. Common Stock" },
-    { symbol: "SSUS", name: "Day Hagan Smart Sector ETF" },
-    { symbol: "SSXU", name: "Day Hagan Smart Sector International ETF" },
-    { symbol: "ST", name: "Sensata Technologies Holding plc Ordinary Shares" },
-    { symbol: "STAG", name: "Stag Industrial, Inc. Common Stock" },
-    { symbol: "STAX", name: "Macquarie ETF Trust Macquarie Tax-Free USA Short Term ETF" },
-    { symbol: "STBF", name: "Trust for Professional Managers Performance Trust Short Term Bond ETF" },
-    { symbol: "STC", name: "Stewart Information Services Corporation Common Stock" },
-    { symbol: "STCE", name: "Schwab Strategic Trust Schwab Crypto Thematic ETF" },
-    { symbol: "STE", name: "STERIS plc (Ireland) Ordinary Shares" },
-    { symbol: "STEL", name: "Stellar Bancorp, Inc. Common Stock" },
-    { symbol: "STEM", name: "Stem, Inc. Class A Common Stock" },
-    { symbol: "STEW", name: "SRH Total Return Fund, Inc. Common Stock" },
-    { symbol: "STG", name: "Sunlands Technology Group American Depositary Shares, representing Class A ordinary shares" },
-    { symbol: "STHH", name: "Precidian ETFs Trust STMicroelectronics NV ADRhedged" },
-    { symbol: "STIP", name: "iShares 0-5 Year TIPS Bond ETF" },
-    { symbol: "STK", name: "Columbia Seligman Premium Technology Growth Fund Inc" },
-    { symbol: "STLA", name: "Stellantis N.V. Common Shares" },
-    { symbol: "STM", name: "STMicroelectronics N.V. Common Stock" },
-    { symbol: "STN", name: "Stantec Inc Common Stock" },
-    { symbol: "STNG", name: "Scorpio Tankers Inc. Common Shares" },
-    { symbol: "STOT", name: "SPDR DoubleLine Short Duration Total Return Tactical ETF" },
-    { symbol: "STOX", name: "Horizon Funds Horizon Core Equity ETF" },
-    { symbol: "STPZ", name: "PIMCO 1-5 Year U.S. TIPS Index Exchange-Traded Fund" },
-    { symbol: "STRN", name: "Tidal Trust I SMART Trend 25 ETF" },
-    { symbol: "STRV", name: "EA Series Trust Strive 500 ETF" },
-    { symbol: "STRW", name: "Strawberry Fields REIT, Inc. Common Stock" },
-    { symbol: "STT", name: "State Street Corporation Common Stock" },
-    { symbol: "STT$G", name: "State Street Corporation Depositary shares, each representing a 1/4,000th ownership interest in a share of Fixed-to-Floating Rate Non-Cumulative" },
-    { symbol: "STVN", name: "Stevanato Group S.p.A. Ordinary Shares" },
-    { symbol: "STWD", name: "STARWOOD PROPERTY TRUST, INC. Starwood Property Trust Inc." },
-    { symbol: "STXD", name: "EA Series Trust Strive 1000 Dividend Growth ETF" },
-    { symbol: "STXE", name: "EA Series Trust Strive Emerging Markets Ex-China ETF" },
-    { symbol: "STXG", name: "EA Series Trust Strive 1000 Growth ETF" },
-    { symbol: "STXI", name: "EA Series Trust Strive International Developed Markets ETF" },
-    { symbol: "STXK", name: "EA Series Trust Strive Small-Cap ETF" },
-    { symbol: "STXM", name: "EA Series Trust Strive Mid-Cap ETF" },
-    { symbol: "STXS", name: "Stereotaxis, Inc. Common Stock" },
-    { symbol: "STXT", name: "EA Series Trust Strive Total Return Bond ETF" },
-    { symbol: "STXV", name: "EA Series Trust Strive 1000 Value ETF" },
-    { symbol: "STZ", name: "Constellation Brands, Inc. Common Stock" },
-    { symbol: "SU", name: "Suncor Energy  Inc. Common Stock" },
-    { symbol: "SUB", name: "iShares Short-Term National Muni Bond ETF" },
-    { symbol: "SUI", name: "Sun Communities, Inc. Common Stock" },
-    { symbol: "SUN", name: "Sunoco LP Common Units representing limited partner interests" },
-    { symbol: "SUPL", name: "ProShares Trust ProShares Supply Chain Logistics ETF" },
-    { symbol: "SUPV", name: "Grupo Supervielle S.A. American Depositary Shares each Representing five Class B shares" },
-    { symbol: "SURE", name: "AdvisorShares Insider Advantage ETF" },
-    { symbol: "SURI", name: "Simplify Exchange Traded Funds Simplify Propel Opportunities ETF" },
-    { symbol: "SUSA", name: "iShares ESG Optimized MSCI USA ETF" },
-    { symbol: "SUZ", name: "Suzano S.A. American Depositary Shares (each representing One Ordinary Share)" },
-    { symbol: "SVAL", name: "iShares US Small Cap Value Factor ETF" },
-    { symbol: "SVIX", name: "VS TR -1x Short VIX Futures ETF" },
-    { symbol: "SVM", name: "Silvercorp Metals Inc. Common Shares" },
-    { symbol: "SVOL", name: "Simplify Volatility Premium ETF" },
-    { symbol: "SVV", name: "Savers Value Village, Inc. Common Stock" },
-    { symbol: "SVXY", name: "ProShares Short VIX Short Term Futures ETF" },
-    { symbol: "SW", name: "Smurfit WestRock plc Ordinary Shares" },
-    { symbol: "SWAN", name: "Amplify ETF Trust Amplify BlackSwan Growth & Treasury Core ETF" },
-    { symbol: "SWK", name: "Stanley Black & Decker, Inc. Common Stock" },
-    { symbol: "SWX", name: "Southwest Gas Holdings, Inc. Common Stock (DE)" },
-    { symbol: "SWZ", name: "Total Return Securities Fund Common Stock" },
-    { symbol: "SXC", name: "SunCoke Energy, Inc. Common Stock" },
-    { symbol: "SXI", name: "Standex International Corporation Common Stock" },
-    { symbol: "SXQG", name: "ETC 6 Meridian Quality Growth ETF" },
-    { symbol: "SXT", name: "Sensient Technologies Corporation Common Stock" },
-    { symbol: "SYF", name: "Synchrony Financial Common Stock" },
-    { symbol: "SYF$A", name: "Synchrony Financial Depositary Shares, each Representing a 1/40th Interest in a Share of 5.625% Fixed Rate Non-Cumulative Perpetual Preferred Stock, Series A" },
-    { symbol: "SYF$B", name: "Synchrony Financial Depositary Shares Each Representing a 1/40th Interest in a Share of 8.250% Fixed Rate Reset Non-Cumulative Perpetual Preferred Stock, Series B" },
-    { symbol: "SYFI", name: "AB Active ETFs, Inc. AB Short Duration High Yield ETF" },
-    { symbol: "SYK", name: "Stryker Corporation Common Stock" },
-    { symbol: "SYLD", name: "Cambria Shareholder Yield ETF" },
-    { symbol: "SYNB", name: "Putnam ETF Trust Putnam BioRevolution ETF" },
-    { symbol: "SYNX", name: "Silynxcom Ltd. Ordinary Shares" },
-    { symbol: "SYSB", name: "iShares Systematic Bond ETF" },
-    { symbol: "SYY", name: "Sysco Corporation Common Stock" },
-    { symbol: "SZK", name: "ProShares UltraShort Consumer Staples" },
-    { symbol: "SZNE", name: "Pacer CFRA-Stovall Equal Weight Seasonal Rotation ETF" },
-    { symbol: "T", name: "AT&T Inc." },
-    { symbol: "T$A", name: "AT&T Inc. Depositary Shares, each representing a 1/1,000th interest in a share of 5.000% Perpetual Preferred Stock, Series A" },
-    { symbol: "T$C", name: "AT&T Inc. Depositary Shares, each representing a 1/1,000th interest in a share of 4.750% Perpetual Preferred Stock, Series C" },
-    { symbol: "TAC", name: "TransAlta Corporation Ordinary Shares" },
-    { symbol: "TACK", name: "Capitol Series Trust Fairlead Tactical Sector ETF" },
-    { symbol: "TAFI", name: "AB Active ETFs, Inc. AB Tax-Aware Short Duration Municipal ETF" },
-    { symbol: "TAFL", name: "AB Active ETFs, Inc. AB Tax-Aware Long Municipal ETF" },
-    { symbol: "TAFM", name: "AB Active ETFs, Inc. AB Tax-Aware Intermediate Municipal ETF" },
-    { symbol: "TAGG", name: "T. Rowe Price QM U.S. Bond ETF" },
-    { symbol: "TAGS", name: "Teucrium Agricultural Fund ETV" },
-    { symbol: "TAIL", name: "Cambria Tail Risk ETF" },
-    { symbol: "TAK", name: "Takeda Pharmaceutical Company Limited American Depositary Shares (each representing 1/2 of a share of Common Stock)" },
-    { symbol: "TAL", name: "TAL Education Group American Depositary Shares" },
-    { symbol: "TALO", name: "Talos Energy, Inc. Common Stock" },
-    { symbol: "TAN", name: "Invesco Solar ETF" },
-    { symbol: "TAP", name: "Molson Coors Beverage Company Class B Common Stock" },
-    { symbol: "TAP.A", name: "Molson Coors Beverage Company Class A Common Stock" },
-    { symbol: "TAPR", name: "Innovator ETFs Trust Innovator Equity Defined Protection ETF - 2 Yr to April 2027" },
-    { symbol: "TAXF", name: "American Century Diversified Municipal Bond ETF" },
-    { symbol: "TAXM", name: "BondBloxx ETF Trust BondBloxx IR+M Tax-Aware ETF for Massachusetts Residents" },
-    { symbol: "TAXX", name: "BondBloxx ETF Trust BondBloxx IR+M Tax-Aware Short Duration ETF" },
-    { symbol: "TBB", name: "AT&T Inc. 5.350% Global Notes due 2066" },
-    { symbol: "TBBB", name: "BBB Foods Inc. Class A Common Shares" },
-    { symbol: "TBF", name: "ProShares Short 20+ Year Treasury" },
-    { symbol: "TBFC", name: "ETF Series Solutions The Brinsmere Fund  Conservative ETF" },
-    { symbol: "TBFG", name: "ETF Series Solutions The Brinsmere Fund Growth ETF" },
-    { symbol: "TBG", name: "EA Series Trust TBG Dividend Focus ETF" },
-    { symbol: "TBI", name: "TrueBlue, Inc. Common Stock" },
-    { symbol: "TBJL", name: "Innovator 20  Year Treasury Bond 9 Buffer ETF - July" },
-    { symbol: "TBLL", name: "Invesco Short Term Treasury ETF" },
-    { symbol: "TBLU", name: "Tortoise Capital Series Trust Tortoise Global Water Fund" },
-    { symbol: "TBN", name: "Tamboran Resources Corporation Common stock" },
-    { symbol: "TBT", name: "ProShares UltraShort Lehman 20  Year Treasury" },
-    { symbol: "TBUX", name: "T. Rowe Price Ultra Short-Term Bond ETF" },
-    { symbol: "TBX", name: "ProShares Short 7 10 Year Treasury" },
-    { symbol: "TCAF", name: "T. Rowe Price Exchange-Traded Funds, Inc. T. Rowe Price Capital Appreciation Equity ETF" },
-    { symbol: "TCAI", name: "Tortoise Capital Series Trust Tortoise AI Infrastructure ETF" },
-    { symbol: "TCAL", name: "T. Rowe Price Exchange-Traded Funds, Inc. T. Rowe Price Capital Appreciation Premium Income ETF" },
-    { symbol: "TCHP", name: "T. Rowe Price Blue Chip Growth ETF" },
-    { symbol: "TCI", name: "Transcontinental Realty Investors, Inc. Common Stock" },
-    { symbol: "TCPB", name: "Thrivent ETF Trust Thrivent Core Plus Bond ETF" },
-    { symbol: "TCV", name: "EA Series Trust Towle Value ETF" },
-    { symbol: "TD", name: "Toronto Dominion Bank (The) Common Stock" },
-    { symbol: "TDAQ", name: "ETF Opportunities Trust TappAlpha Innovation 100 Growth & Daily Income ETF" },
-    { symbol: "TDC", name: "Teradata Corporation Common Stock" },
-    { symbol: "TDEC", name: "First Trust Exchange-Traded Fund VIII FT Vest Emerging Markets Buffer ETF - December" },
-    { symbol: "TDF", name: "Templeton Dragon Fund, Inc. Common Stock" },
-    { symbol: "TDG", name: "Transdigm Group Incorporated Common Stock" },
-    { symbol: "TDOC", name: "Teladoc Health, Inc. Common Stock" },
-    { symbol: "TDS", name: "Telephone and Data Systems, Inc. Common Shares" },
-    { symbol: "TDS$U", name: "Telephone and Data Systems, Inc. Depositary Shares, Each Representing a 1/1,000th Interest in a 6.625% Series UU Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "TDS$V", name: "Telephone and Data Systems, Inc. Depositary Shares, Each Representing a 1/1,000th Interest in a 6.000% Series VV Cumulative Redeemable Perpetual Preferred Stock" },
-    { symbol: "TDTF", name: "FlexShares iBoxx 5 Year Target Duration TIPS Index Fund" },
-    { symbol: "TDTT", name: "FlexShares iBoxx 3 Year Target Duration TIPS Index Fund" },
-    { symbol: "TDV", name: "ProShares S&P Technology Dividend Aristocrats ETF" },
-    { symbol: "TDVG", name: "T. Rowe Price Dividend Growth ETF" },
-    { symbol: "TDVI", name: "FT Vest Technology Dividend Target Income ETF" },
-    { symbol: "TDW", name: "Tidewater Inc. Common Stock" },
-    { symbol: "TDY", name: "Teledyne Technologies Incorporated Common Stock" },
-    { symbol: "TE", name: "T1 Energy Inc. Common Stock" },
-    { symbol: "TE.W", name: "T1 Energy Inc. Warrants, each whole warrant exercisable to purchase one Common Stock at an exercise price of $11.50 per share" },
-    { symbol: "TEAF", name: "Tortoise Sustainable and Social Impact Term Fund Common shares of beneficial interest" },
-    { symbol: "TEC", name: "Harbor ETF Trust Harbor Transformative Technologies ETF" },
-    { symbol: "TECB", name: "iShares U.S. Tech Breakthrough Multisector ETF" },
-    { symbol: "TECK", name: "Teck Resources Ltd Ordinary Shares" },
-    { symbol: "TECL", name: "Direxion Technology Bull 3X Shares" },
-    { symbol: "TECS", name: "Direxion Technology Bear 3X Shares" },
-    { symbol: "TEF", name: "Telefonica SA Common Stock" },
-    { symbol: "TEI", name: "Templeton Emerging Markets Income Fund, Inc. Common Stock" },
-    { symbol: "TEK", name: "BlackRock ETF Trust iShares Technology Opportunities Active ETF" },
-    { symbol: "TEL", name: "TE Connectivity plc Ordinary Shares" },
-    { symbol: "TEMP", name: "J.P. Morgan Exchange-Traded Fund Trust JPMorgan Climate Change Solutions ETF" },
-    { symbol: "TEMT", name: "Tradr 2X Long TEM Daily ETF" },
-    { symbol: "TEMX", name: "Touchstone ETF Trust Touchstone Sands Capital Emerging Markets ex-China Growth ETF" },
-    { symbol: "TEN", name: "Tsakos Energy Navigation Ltd Common Shares" },
-    { symbol: "TEN$E", name: "Tsakos Energy Navigation Ltd Series E Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Shares, par value $1.00" },
-    { symbol: "TEN$F", name: "Tsakos Energy Navigation Ltd Series F Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Shares, par value $1.00" },
-    { symbol: "TEO", name: "Telecom Argentina SA" },
-    { symbol: "TEQI", name: "T. Rowe Price Equity Income ETF" },
-    { symbol: "TESL", name: "Simplify Volt TSLA Revolution ETF" },
-    { symbol: "TETH", name: "21Shares Ethereum ETF" },
-    { symbol: "TEVA", name: "Teva Pharmaceutical Industries Limited American Depositary Shares" },
-    { symbol: "TEX", name: "Terex Corporation Common Stock" },
-    { symbol: "TFC", name: "Truist Financial Corporation Common Stock" },
-    { symbol: "TFC$I", name: "Truist Financial Corporation Depositary Shares" },
-    { symbol: "TFC$O", name: "Truist Financial Corporation Depositary Shares, Each Representing a 1/1,000th Interest in a Share of Series O Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "TFC$R", name: "Truist Financial Corporation Depositary Shares, each representing 1/1,000th interest in a share of Series R Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "TFI", name: "SPDR Nuveen ICE Municipal Bond ETF" },
-    { symbol: "TFII", name: "TFI International Inc. Common Shares" },
-    { symbol: "TFIN", name: "Triumph Financial, Inc. Common Stock" },
-    { symbol: "TFIN$", name: "Triumph Financial, Inc. Depositary Shares, Each Representing a 1/40th Interest in a Share of 7.125% Series C Fixed-Rate Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "TFJL", name: "Innovator 20  Year Treasury Bond 5 Floor ETF - July" },
-    { symbol: "TFLO", name: "iShares Treasury Floating Rate Bond ETF" },
-    { symbol: "TFLR", name: "T. Rowe Price Exchange-Traded Funds, Inc. T. Rowe Price Floating Rate ETF" },
-    { symbol: "TFPM", name: "Triple Flag Precious Metals Corp. Common Shares" },
-    { symbol: "TFPN", name: "Blueprint Chesapeake Multi-Asset Trend ETF" },
-    { symbol: "TFSA", name: "Terra Income Fund 6, LLC 7.00% Notes due 2026" },
-    { symbol: "TFX", name: "Teleflex Incorporated Common Stock" },
-    { symbol: "TG", name: "Tredegar Corporation Common Stock" },
-    { symbol: "TGB", name: "Taseko Mines, Ltd. Common Stock" },
-    { symbol: "TGE", name: "The Generation Essentials Group Class A Ordinary Shares" },
-    { symbol: "TGE.W", name: "The Generation Essentials Group Warrants, each whole warrant exercisable for one Class A Ordinary Share" },
-    { symbol: "TGEN", name: "Tecogen Inc. Common Stock" },
-    { symbol: "TGLB", name: "T. Rowe Price Exchange-Traded Funds, Inc. T. Rowe Price Global Equity ETF" },
-    { symbol: "TGLR", name: "ETF Opportunities Trust LAFFER TENGLER Equity Income ETF" },
-    { symbol: "TGLS", name: "Tecnoglass Inc. Ordinary Shares" },
-    { symbol: "TGNA", name: "TEGNA Inc" },
-    { symbol: "TGRT", name: "T. Rowe Price Exchange-Traded Funds, Inc. T. Rowe Price Growth ETF" },
-    { symbol: "TGRW", name: "T. Rowe Price Growth Stock ETF" },
-    { symbol: "TGS", name: "Transportadora de Gas del Sur SA TGS Common Stock" },
-    { symbol: "TGT", name: "Target Corporation Common Stock" },
-    { symbol: "THC", name: "Tenet Healthcare Corporation Common Stock" },
-    { symbol: "THD", name: "iShares Inc iShares MSCI Thailand ETF" },
-    { symbol: "THEQ", name: "T. Rowe Price Exchange-Traded Funds, Inc. T. Rowe Price Hedged Equity ETF" },
-    { symbol: "THG", name: "Hanover Insurance Group Inc" },
-    { symbol: "THIR", name: "THOR Financial Technologies Trust THOR Index Rotation ETF" },
-    { symbol: "THLV", name: "THOR Equal Weight Low Volatility ETF" },
-    { symbol: "THM", name: "International Tower Hill Mines, Ltd. Ordinary Shares (Canada)" },
-    { symbol: "THNQ", name: "ROBO Global Artificial Intelligence ETF" },
-    { symbol: "THNR", name: "Amplify ETF Trust Amplify Weight Loss Drug & Treatment ETF" },
-    { symbol: "THO", name: "Thor Industries, Inc. Common Stock" },
-    { symbol: "THQ", name: "abrdn Healthcare Opportunities Fund Shares of Beneficial Interest" },
-    { symbol: "THR", name: "Thermon Group Holdings, Inc. Common Stock" },
-    { symbol: "THRO", name: "iShares U.S. Thematic Rotation Active ETF" },
-    { symbol: "THS", name: "Treehouse Foods, Inc. Common Stock" },
-    { symbol: "THTA", name: "SoFi Enhanced Yield ETF" },
-    { symbol: "THW", name: "abrdn World Healthcare Fund Shares of Beneficial Interest" },
-    { symbol: "THY", name: "Toews Agility Shares Dynamic Tactical Income ETF" },
-    { symbol: "THYF", name: "T. Rowe Price Exchange-Traded Funds, Inc. T. Rowe Price U.S. High Yield ETF" },
-    { symbol: "TIC", name: "Acuren Corporation Common Stock" },
-    { symbol: "TIER", name: "T. Rowe Price Exchange-Traded Funds, Inc. T. Rowe Price International Equity Research ETF" },
-    { symbol: "TIIV", name: "ETF Series Solutions AAM Todd International Intrinsic Value ETF" },
-    { symbol: "TILL", name: "Listed Funds Trust Teucrium Agricultural Strategy No K-1 ETF" },
-    { symbol: "TILT", name: "FlexShares Mornigstar US Market Factors Tilt Index Fund ETF" },
-    { symbol: "TIMB", name: "TIM S.A. American Depositary Shares (Each representing 5 Common Shares) " },
-    { symbol: "TIME", name: "Tidal Trust II Clockwise Core Equity & Innovation ETF" },
-    { symbol: "TINT", name: "ProShares Smart Materials ETF" },
-    { symbol: "TINY", name: "ProShares Nanotechnology ETF" },
-    { symbol: "TIP", name: "iShares TIPS Bond ETF" },
-    { symbol: "TIPA", name: "Northern Funds Northern Trust 2030 Inflation-Linked Distributing Ladder ETF" },
-    { symbol: "TIPB", name: "Northern Funds Northern Trust 2035 Inflation-Linked Distributing Ladder ETF" },
-    { symbol: "TIPC", name: "Northern Funds Northern Trust 2045 Inflation-Linked Distributing Ladder ETF" },
-    { symbol: "TIPD", name: "Northern Funds Northern Trust 2055 Inflation-Linked Distributing Ladder ETF" },
-    { symbol: "TIPX", name: "SPDR Bloomberg 1-10 Year TIPS ETF" },
-    { symbol: "TIPZ", name: "PIMCO Broad U.S. TIPS Index Exchange-Traded Fund" },
-    { symbol: "TISI", name: "Team, Inc. Common Stock" },
-    { symbol: "TIXT", name: "TELUS International (Cda) Inc. Subordinate Voting Shares" },
-    { symbol: "TJAN", name: "Innovator ETFs Trust Innovator Equity Defined Protection ETF - 2 Yr to January 2027" },
-    { symbol: "TJUL", name: "Innovator Equity Defined Protection ETF - 2 Yr to July 2027" },
-    { symbol: "TJUN", name: "First Trust Exchange-Traded Fund VIII FT Vest Emerging Markets Buffer ETF - June" },
-    { symbol: "TJX", name: "TJX Companies, Inc. (The) Common Stock" },
-    { symbol: "TK", name: "Teekay Corporation Ltd. Common Stock" },
-    { symbol: "TKC", name: "Turkcell Iletisim Hizmetleri AS Common Stock" },
-    { symbol: "TKO", name: "TKO Group Holdings, Inc. Class A Common Stock" },
-    { symbol: "TKR", name: "Timken Company (The) Common Stock" },
-    { symbol: "TLCI", name: "Touchstone ETF Trust Touchstone International Equity ETF" },
-    { symbol: "TLH", name: "iShares 10-20 Year Treasury Bond ETF" },
-    { symbol: "TLK", name: "PT Telekomunikasi Indonesia, Tbk" },
-    { symbol: "TLTD", name: "FlexShares Morningstar Developed Markets ex-US Factor Tilt Index Fund" },
-    { symbol: "TLTE", name: "FlexShares Morningstar Emerging Markets Factor Tilt Index Fund" },
-    { symbol: "TLTI", name: "NEOS ETF Trust NEOS Enhanced Income 20+ Year Treasury Bond ETF" },
-    { symbol: "TLTP", name: "Amplify Bloomberg U.S. Treasury 12% Premium Income ETF" },
-    { symbol: "TLTW", name: "iShares Trust iShares 20+ Year Treasury Bond BuyWrite Strategy ETF" },
-    { symbol: "TLTX", name: "Global X Funds Global X Treasury Bond Enhanced Income ETF" },
-    { symbol: "TLYS", name: "Tilly's, Inc. Common Stock" },
-    { symbol: "TM", name: "Toyota Motor Corporation Common Stock" },
-    { symbol: "TMAR", name: "First Trust Exchange-Traded Fund VIII FT Vest Emerging Markets Buffer ETF - March" },
-    { symbol: "TMAT", name: "Main Thematic Innovation ETF" },
-    { symbol: "TMDE", name: "TMD Energy Limited Ordinary Shares" },
-    { symbol: "TMDV", name: "ProShares Russell US Dividend Growers ETF" },
-    { symbol: "TME", name: "Tencent Music Entertainment Group American Depositary Shares, each representing two Class A Ordinary Shares" },
-    { symbol: "TMF", name: "Direxion Daily 20-Yr Treasury Bull 3x Shrs" },
-    { symbol: "TMFC", name: "Motley Fool 100 Index ETF ETF" },
-    { symbol: "TMFE", name: "The RBB Fund, Inc. Motley Fool Capital Efficiency 100 Index ETF" },
-    { symbol: "TMFG", name: "Motley Fool Global Opportunities ETF" },
-    { symbol: "TMFM", name: "Motley Fool Mid-Cap Growth ETF" },
-    { symbol: "TMFS", name: "Motley Fool Small-Cap Growth ETF" },
-    { symbol: "TMFX", name: "The RBB Fund, Inc. Motley Fool Next Index ETF" },
-    { symbol: "TMH", name: "Precidian ETFs Trust Toyota Motor Corporation ADRhedged" },
-    { symbol: "TMHC", name: "Taylor Morrison Home Corporation Common Stock" },
-    { symbol: "TMO", name: "Thermo Fisher Scientific Inc Common Stock" },
-    { symbol: "TMP", name: "Tompkins Financial Corporation Common Stock" },
-    { symbol: "TMQ", name: "Trilogy Metals Inc. Common Stock" },
-    { symbol: "TMSL", name: "T. Rowe Price Exchange-Traded Funds, Inc. T. Rowe Price Small-Mid Cap ETF" },
-    { symbol: "TMV", name: "Direxion Daily 20-Year Treasury Bear 3X" },
-    { symbol: "TNA", name: "Direxion Small Cap Bull 3X Shares" },
-    { symbol: "TNC", name: "Tennant Company Common Stock" },
-    { symbol: "TNET", name: "TriNet Group, Inc. Common Stock" },
-    { symbol: "TNGY", name: "Tortoise Capital Series Trust Tortoise Energy Fund" },
-    { symbol: "TNK", name: "Teekay Tankers Ltd." },
-    { symbol: "TNL", name: "Travel   Leisure Co. Common  Stock" },
-    { symbol: "TOAK", name: "Manager Directed Portfolios Twin Oak Short Horizon Absolute Return ETF" },
-    { symbol: "TOGA", name: "Managed Portfolio Series Tremblant Global ETF" },
-    { symbol: "TOK", name: "iShares MSCI Kokusai ETF" },
-    { symbol: "TOKE", name: "Cambria Cannabis ETF" },
-    { symbol: "TOL", name: "Toll Brothers, Inc. Common Stock" },
-    { symbol: "TOLL", name: "Tema ETF Trust Tema Monopolies and Oligopolies ETF" },
-    { symbol: "TOLZ", name: "ProShares DJ Brookfield Global Infrastructure ETF" },
-    { symbol: "TOON", name: "Kartoon Studios, Inc. Common Stock" },
-    { symbol: "TOPC", name: "iShares Trust iShares S&P 500 3% Capped ETF" },
-    { symbol: "TOPP", name: "Toppoint Holdings Inc. Common Stock" },
-    { symbol: "TOPS", name: "TOP Ships, Inc. Common Stock" },
-    { symbol: "TOPT", name: "iShares Trust iShares Top 20 U.S. Stocks ETF" },
-    { symbol: "TOST", name: "Toast, Inc. Class A Common Stock" },
-    { symbol: "TOT", name: "Advisor Managed Portfolios LionShares U.S. Equity Total Return ETF" },
-    { symbol: "TOTL", name: "SPDR DoubleLine Total Return Tactical ETF" },
-    { symbol: "TOTR", name: "T. Rowe Price Total Return ETF" },
-    { symbol: "TOUS", name: "T. Rowe Price Exchange-Traded Funds, Inc. T. Rowe Price International Equity ETF" },
-    { symbol: "TOV", name: "EA Series Trust JLens 500 Jewish Advocacy U.S. ETF" },
-    { symbol: "TOVX", name: "Theriva Biologics, Inc. Common Stock" },
-    { symbol: "TPB", name: "Turning Point Brands, Inc. Common Stock" },
-    { symbol: "TPC", name: "Tutor Perini Corporation Common Stock" },
-    { symbol: "TPET", name: "Trio Petroleum Corp. Common Stock" },
-    { symbol: "TPH", name: "Tri Pointe Homes, Inc. Common Stock" },
-    { symbol: "TPHD", name: "Timothy Plan High Dividend Stock ETF" },
-    { symbol: "TPHE", name: "Timothy Plan High Dividend Stock Enhanced ETF" },
-    { symbol: "TPIF", name: "Timothy Plan International ETF" },
-    { symbol: "TPL", name: "Texas Pacific Land Corporation Common Stock" },
-    { symbol: "TPLC", name: "Timothy Plan US Large/Mid Cap Core ETF" },
-    { symbol: "TPLE", name: "Timothy Plan US Large/Mid Cap Core Enhanced ETF" },
-    { symbol: "TPOR", name: "Direxion Daily Transportation Bull 3X Shares" },
-    { symbol: "TPR", name: "Tapestry, Inc. Common Stock" },
-    { symbol: "TPSC", name: "Timothy Plan US Small Cap Core ETF" },
-    { symbol: "TPTA", name: "Terra Property Trust, Inc. 6.00% Notes due 2026" },
-    { symbol: "TPVG", name: "TriplePoint Venture Growth BDC Corp. Common Stock" },
-    { symbol: "TPYP", name: "Tortoise Capital Series Trust Tortoise North American Pipeline Fund" },
-    { symbol: "TPZ", name: "Tortoise Essential Energy Fund" },
-    { symbol: "TR", name: "Tootsie Roll Industries, Inc. Common Stock" },
-    { symbol: "TRAK", name: "ReposiTrak, Inc. Common Stock" },
-    { symbol: "TRC", name: "Tejon Ranch Co Common Stock" },
-    { symbol: "TREX", name: "Trex Company, Inc. Common Stock" },
-    { symbol: "TRFK", name: "Pacer Funds Pacer Data and Digital Revolution ETF" },
-    { symbol: "TRFM", name: "ETF Series Solutions AAM Transformers ETF" },
-    { symbol: "TRGP", name: "Targa Resources, Inc. Common Stock" },
-    { symbol: "TRIO", name: "EA Series Trust MC Trio Equity Buffered ETF" },
-    { symbol: "TRN", name: "Trinity Industries, Inc. Common Stock" },
-    { symbol: "TRND", name: "Pacer Trendpilot Fund of Funds ETF" },
-    { symbol: "TRNO", name: "Terreno Realty Corporation Common Stock" },
-    { symbol: "TROX", name: "Tronox Holdings plc Ordinary Shares (UK)" },
-    { symbol: "TRP", name: "TC Energy Corporation Common Stock" },
-    { symbol: "TRPA", name: "Hartford AAA CLO ETF" },
-    { symbol: "TRSY", name: "DBX ETF Trust Xtrackers US 0-1 Year Treasury ETF" },
-    { symbol: "TRT", name: "Trio-Tech International Common Stock" },
-    { symbol: "TRTN$A", name: "Triton International Limited 8.50% Series A Cumulative Redeemable Perpetual  Preference Shares" },
-    { symbol: "TRTN$B", name: "Triton International Limited 8.00% Series B Cumulative Redeemable Perpetual Preference Shares" },
-    { symbol: "TRTN$C", name: "Triton International Limited 7.375% Series C Cumulative Redeemable Perpetual Preference Shares" },
-    { symbol: "TRTN$D", name: "Triton International Limited 6.875% Series D Cumulative Redeemable Perpetual Preference Shares" },
-    { symbol: "TRTN$E", name: "Triton International Limited 5.75% Series E Cumulative Redeemable Perpetual Preference Shares" },
-    { symbol: "TRTN$F", name: "Triton International Limited 7.625% Series F Cumulative Redeemable Perpetual Preference Shares" },
-    { symbol: "TRTX", name: "TPG RE Finance Trust, Inc. Common Stock" },
-    { symbol: "TRTX$C", name: "TPG RE Finance Trust, Inc. 6.25% Series C Cumulative Redeemable Preferred Stock, $0.001 par value per share" },
-    { symbol: "TRTY", name: "Cambria Trinity ETF" },
-    { symbol: "TRU", name: "TransUnion Common Stock" },
-    { symbol: "TRV", name: "The Travelers Companies, Inc. Common Stock" },
-    { symbol: "TRX", name: "TRX Gold Corporation Common Stock" },
-    { symbol: "TS", name: "Tenaris S.A. American Depositary Shares" },
-    { symbol: "TSE", name: "Trinseo PLC Ordinary Shares " },
-    { symbol: "TSEC", name: "Touchstone ETF Trust Touchstone Securitized Income ETF" },
-    { symbol: "TSEP", name: "First Trust Exchange-Traded Fund VIII FT Vest Emerging Market Buffer ETF - September" },
-    { symbol: "TSI", name: "TCW Strategic Income Fund, Inc. Common Stock" },
-    { symbol: "TSII", name: "REX TSLA Growth & Income ETF" },
-    { symbol: "TSLO", name: "Themes ETF Trust Leverage Shares 2x Capped Accelerated TSLA Monthly ETF" },
-    { symbol: "TSLP", name: "Kurv Yield Premium Strategy Tesla (TSLA) ETF" },
-    { symbol: "TSLT", name: "ETF Opportunities Trust T-REX 2X Long Tesla Daily Target ETF" },
-    { symbol: "TSLW", name: "Roundhill ETF Trust Roundhill TSLA WeeklyPay ETF" },
-    { symbol: "TSLX", name: "Sixth Street Specialty Lending, Inc. Common Stock" },
-    { symbol: "TSLY", name: "Tidal ETF Trust II YieldMax TSLA Option Income Strategy ETF" },
-    { symbol: "TSLZ", name: "ETF Opportunities Trust T-Rex 2X Inverse Tesla Daily Target ETF" },
-    { symbol: "TSM", name: "Taiwan Semiconductor Manufacturing Company Ltd." },
-    { symbol: "TSME", name: "Thrivent Small-Mid Cap Equity ETF" },
-    { symbol: "TSMY", name: "Tidal Trust II YieldMax TSM Option Income Strategy ETF" },
-    { symbol: "TSN", name: "Tyson Foods, Inc. Common Stock" },
-    { symbol: "TSPA", name: "T. Rowe Price U.S. Equity Research ETF" },
-    { symbol: "TSPX", name: "Manager Directed Portfolios Twin Oak Active Opportunities ETF" },
-    { symbol: "TSQ", name: "Townsquare Media, Inc. Class A Common Stock" },
-    { symbol: "TT", name: "Trane Technologies plc" },
-    { symbol: "TTAM", name: "Titan America SA Common Shares" },
-    { symbol: "TTC", name: "Toro Company (The) Common Stock" },
-    { symbol: "TTE", name: "TotalEnergies SE" },
-    { symbol: "TTI", name: "Tetra Technologies, Inc. Common Stock" },
-    { symbol: "TTT", name: "ProShares UltraPro Short 20 Year Treasury" },
-    { symbol: "TU", name: "Telus Corporation Ordinary Shares" },
-    { symbol: "TUA", name: "Simplify Exchange Traded Funds Simplify Short Term Treasury Futures Strategy ETF" },
-    { symbol: "TUSB", name: "Thrivent ETF Trust Thrivent Ultra Short Bond ETF" },
-    { symbol: "TUSI", name: "Touchstone ETF Trust Touchstone Ultra Short Income ETF" },
-    { symbol: "TUYA", name: "Tuya Inc. American Depositary Shares, each representing one Class A Ordinary Share" },
-    { symbol: "TV", name: "Grupo Televisa S.A.B. Common Stock" },
-    { symbol: "TVAL", name: "T. Rowe Price Exchange-Traded Funds, Inc. T. Rowe Price Value ETF" },
-    { symbol: "TVC", name: "Tennessee Valley Authority Common Stock" },
-    { symbol: "TVE", name: "Tennessee Valley Authority" },
-    { symbol: "TWI", name: "Titan International, Inc. (DE) Common Stock" },
-    { symbol: "TWLO", name: "Twilio Inc. Class A Common Stock" },
-    { symbol: "TWM", name: "ProShares UltraShort Russell2000" },
-    { symbol: "TWN", name: "Taiwan Fund, Inc. (The) Common Stock" },
-    { symbol: "TWO", name: "Two Harbors Investment Corp" },
-    { symbol: "TWO$A", name: "Two Harbors Investments Corp 8.125% Series A Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock ($25.00 liquidation preference per share)" },
-    { symbol: "TWO$B", name: "Two Harbors Investments Corp 7.625% Series B Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "TWO$C", name: "Two Harbors Investments Corp 7.25% Series C Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" },
-    { symbol: "TWOD", name: "Two Harbors Investments Corp 9.375% Senior Notes due 2030" },
-    { symbol: "TWOX", name: "iShares Large Cap Accelerated Outcome ETF" },
-    { symbol: "TX", name: "Ternium S.A. Ternium S.A. American Depositary Shares (each representing ten shares, USD1.00 par value)" },
-    { symbol: "TXNM", name: "TXNM Energy, Inc. Common Stock" },
-    { symbol: "TXO", name: "TXO Partners, L.P. Common Units Representing Limited Partner Interests" },
-    { symbol: "TXS", name: "Texas Capital Funds Trust Texas Capital Texas Equity Index ETF" },
-    { symbol: "TXT", name: "Textron Inc. Common Stock" },
-    { symbol: "TXXI", name: "BondBloxx ETF Trust BondBloxx IR+M Tax-Aware Intermediate Duration ETF" },
-    { symbol: "TY", name: "Tri Continental Corporation Common Stock" },
-    { symbol: "TY$", name: "Tri Continental Corporation Preferred Stock" },
-    { symbol: "TYA", name: "Simplify Intermediate Term Treasury Futures Strategy ETF" },
-    { symbol: "TYD", name: "Direxion Daily 10-Yr Treasury Bull 3x Shrs" },
-    { symbol: "TYG", name: "Tortoise Energy Infrastructure Corporation Common Stock" },
-    { symbol: "TYL", name: "Tyler Technologies, Inc. Common Stock" },
-    { symbol: "TYLD", name: "Cambria ETF Trust Cambria Tactical Yield ETF" },
-    { symbol: "TYLG", name: "Global X Funds Global X Information Technology Covered Call & Growth ETF" },
-    { symbol: "TYO", name: "Direxion Daily 10-Yr Treasury Bear 3x Shrs" },
-    { symbol: "TZA", name: "Direxion Small Cap Bear 3X Shares" },
-    { symbol: "U", name: "Unity Software Inc. Common Stock" },
-    { symbol: "UA", name: "Under Armour, Inc. Class C Common Stock" },
-    { symbol: "UAA", name: "Under Armour, Inc. Class A Common Stock" },
-    { symbol: "UAMY", name: "United States Antimony Corporation Common Stock" },
-    { symbol: "UAN", name: "CVR Partners, LP Common Units representing Limited Partner Interests" },
-    { symbol: "UAPR", name: "Innovator U.S. Equity Ultra Buffer ETF - April" },
-    { symbol: "UAUG", name: "Innovator U.S. Equity Ultra Buffer ETF - August" },
-    { symbol: "UAVS", name: "AgEagle Aerial Systems, Inc. Common Stock" },
-    { symbol: "UBER", name: "Uber Technologies, Inc. Common Stock" },
-    { symbol: "UBOT", name: "Direxion Daily Robotics, Artificial Intelligence & Automation Index Bull 2X Shares" },
-    { symbol: "UBR", name: "ProShares Ultra MSCI Brazil Capped" },
-    { symbol: "UBS", name: "UBS Group AG Registered Ordinary Shares" },
-    { symbol: "UBT", name: "ProShares Ultra 20+ Year Treasury" },
-    { symbol: "UCB", name: "United Community Banks, Inc. Common Stock" },
-    { symbol: "UCB$I", name: "United Community Banks, Inc. Depositary Shares, each representing 1/1000th interest in a share of Series I Non-Cumulative Preferred Stock" },
-    { symbol: "UCC", name: "ProShares Ultra Consumer Discretionary" },
-    { symbol: "UCIB", name: "ETRACS UBS Bloomberg Constant Maturity Commodity Index (CMCI) Total Return ETN Series B due April 5, 2038" },
-    { symbol: "UCO", name: "ProShares Ultra Bloomberg Crude Oil" },
-    { symbol: "UCON", name: "First Trust Smith Unconstrained Bond ETF" },
-    { symbol: "UDEC", name: "Innovator U.S. Equity Ultra Buffer ETF - December" },
-    { symbol: "UDI", name: "USCF ETF Trust USCF Dividend Income Fund" },
-    { symbol: "UDIV", name: "Franklin U.S. Core Dividend Tilt Index ETF" },
-    { symbol: "UDN", name: "Invesco DB USD Index Bearish ETF" },
-    { symbol: "UDOW", name: "ProShares UltraPro Dow30" },
-    { symbol: "UDR", name: "UDR, Inc. Common Stock" },
-    { symbol: "UE", name: "Urban Edge Properties Common Shares of Beneficial Interest" },
-    { symbol: "UEC", name: "Uranium Energy Corp. Common Stock" },
-    { symbol: "UFEB", name: "Innovator U.S. Equity Ultra Buffer ETF - February" },
-    { symbol: "UFI", name: "Unifi, Inc. New Common Stock" },
-    { symbol: "UGA", name: "United States Gasoline Fund LP" },
-    { symbol: "UGE", name: "ProShares Ultra Consumer Staples" },
-    { symbol: "UGI", name: "UGI Corporation Common Stock" },
-    { symbol: "UGL", name: "ProShares Ultra Gold" },
-    { symbol: "UGP", name: "Ultrapar Participacoes S.A. (New) American Depositary Shares (Each representing one Common Share)" },
-    { symbol: "UHAL", name: "U-Haul Holding Company Common Stock" },
-    { symbol: "UHAL.B", name: "U-Haul Holding Company Series N Non-Voting Common Stock " },
-    { symbol: "UHS", name: "Universal Health Services, Inc. Common Stock" },
-    { symbol: "UHT", name: "Universal Health Realty Income Trust Common Stock" },
-    { symbol: "UI", name: "Ubiquiti Inc. Common Stock" },
-    { symbol: "UIS", name: "Unisys Corporation New Common Stock" },
-    { symbol: "UJAN", name: "Innovator U.S. Equity Ultra Buffer ETF - January" },
-    { symbol: "UJB", name: "ProShares Ultra High Yield ETF" },
-    { symbol: "UJUL", name: "Innovator U.S. Equity Ultra Buffer ETF - July" },
-    { symbol: "UJUN", name: "Innovator U.S. Equity Ultra Buffer ETF - June" },
-    { symbol: "UL", name: "Unilever PLC Common Stock" },
-    { symbol: "ULE", name: "ProShares Ultra Euro" },
-    { symbol: "ULS", name: "UL Solutions Inc. Class A Common Stock" },
-    { symbol: "ULST", name: "SPDR SSgA Ultra Short Term Bond ETF" },
-    { symbol: "ULTY", name: "Tidal Trust II YieldMax Ultra Option Income Strategy ETF" },
-    { symbol: "UMAC", name: "Unusual Machines, Inc. Common Stock" },
-    { symbol: "UMAR", name: "Innovator U.S. Equity Ultra Buffer ETF - March" },
-    { symbol: "UMAY", name: "Innovator U.S. Equity Ultra Buffer ETF - May" },
-    { symbol: "UMC", name: "United Microelectronics Corporation (NEW) Common Stock" },
-    { symbol: "UMDD", name: "UltraPro MidCap400" },
-    { symbol: "UMH", name: "UMH Properties, Inc. Common Stock" },
-    { symbol: "UMH$D", name: "UMH Properties, Inc. 6.375% Series D Cumulative Redeemable Preferred Stock, Liquidation Preference $25 per share" },
-    { symbol: "UMI", name: "USCF Midstream Energy Income Fund ETF" },
-    { symbol: "UNF", name: "Unifirst Corporation Common Stock" },
-    { symbol: "UNFI", name: "United Natural Foods, Inc. Common Stock" },
-    { symbol: "UNG", name: "United States Natural Gas Fund LP" },
-    { symbol: "UNH", name: "UnitedHealth Group Incorporated Common Stock (DE)" },
-    { symbol: "UNL", name: "United States 12 Month Natural Gas Fund" },
-    { symbol: "UNM", name: "Unum Group Common Stock" },
-    { symbol: "UNMA", name: "Unum Group 6.250% Junior Subordinated Notes due 2058" },
-    { symbol: "UNOV", name: "Innovator U.S. Equity Ultra Buffer ETF - November" },
-    { symbol: "UNP", name: "Union Pacific Corporation Common Stock" },
-    { symbol: "UOCT", name: "Innovator U.S. Equity Ultra Buffer ETF - October" },
-    { symbol: "UP", name: "Wheels Up Experience Inc. Class A Common Stock" },
-    { symbol: "UPAR", name: "UPAR Ultra Risk Parity ETF" },
-    { symbol: "UPGD", name: "Invesco Bloomberg Analyst Rating Improvers ETF" },
-    { symbol: "UPRO", name: "ProShares UltraPro S&P 500" },
-    { symbol: "UPS", name: "United Parcel Service, Inc. Common Stock" },
-    { symbol: "UPSD", name: "ETF Series Solutions Aptus Large Cap Upside ETF" },
-    { symbol: "UPSX", name: "Tradr 2X Long UPST Daily ETF" },
-    { symbol: "UPV", name: "ProShares Ultra FTSE Europe" },
-    { symbol: "UPW", name: "ProShares Ultra Utilities" },
-    { symbol: "URA", name: "Global X Uranium ETF" },
-    { symbol: "URAA", name: "Direxion Shares ETF Trust Direxion Daily Uranium Industry Bull 2X Shares" },
-    { symbol: "URAN", name: "Themes ETF Trust Themes Uranium & Nuclear ETF" },
-    { symbol: "URE", name: "ProShares Ultra Real Estate" },
-    { symbol: "URG", name: "Ur Energy Inc Common Shares (Canada)" },
-    { symbol: "URI", name: "United Rentals, Inc. Common Stock" },
-    { symbol: "URNM", name: "Sprott Uranium Miners ETF" },
-    { symbol: "URSP", name: "ProShares Trust ProShares Ultra S&P 500 Equal Weight" },
-    { symbol: "URTH", name: "iShares, Inc. iShares MSCI World ETF" },
-    { symbol: "URTY", name: "ProShares UltraPro Russell2000" },
-    { symbol: "USA", name: "Liberty All-Star Equity Fund Common Stock" },
-    { symbol: "USAC", name: "USA Compression Partners, LP Common Units Representing Limited Partner Interests" },
-    { symbol: "USAI", name: "Pacer American Energy Independence ETF" },
-    { symbol: "USAS", name: "Americas Gold and Silver Corporation Common Shares, no par value" },
-    { symbol: "USB", name: "U.S. Bancorp Common Stock" },
-    { symbol: "USB$A", name: "U.S. Bancorp Depositary Shares, Each representing a 1/100th interest in a share of Series A Non-CumulativePerpetual Pfd Stock" },
-    { symbol: "USB$H", name: "U.S. Bancorp Depositary Shares repstg 1/1000th Pfd Ser B" },
-    { symbol: "USB$P", name: "U.S. Bancorp Depositary Shares each representing a 1/1,000th interest in a share of Series K Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "USB$Q", name: "U.S. Bancorp Depositary Shares, Each Representing a 1/1,000th Interest in a Share of Series L Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "USB$R", name: "U.S. Bancorp Depositary Shares, Each Representing a 1/1,000th Interest in a Share of Series M Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "USB$S", name: "U.S. Bancorp Depositary Shares, each representing a 1/1,000th interest in a share of Series O Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "USBC", name: "USBC, Inc. Common Stock" },
-    { symbol: "USCA", name: "DBX ETF Trust Xtrackers MSCI USA Climate Action Equity ETF" },
-    { symbol: "USCI", name: "United States Commodity Index Fund ETV" },
-    { symbol: "USD", name: "ProShares Ultra Semiconductors" },
-    { symbol: "USDU", name: "WisdomTree Bloomberg U.S. Dollar Bullish Fund" },
-    { symbol: "USE", name: "USCF ETF Trust USCF Energy Commodity Strategy Absolute Return Fund" },
-    { symbol: "USEP", name: "Innovator U.S. Equity Ultra Buffer ETF - September" },
-    { symbol: "USFD", name: "US Foods Holding Corp. Common Stock" },
-    { symbol: "USFR", name: "WisdomTree Floating Rate Treasury Fund" },
-    { symbol: "USG", name: "USCF Gold Strategy Plus Income Fund" },
-    { symbol: "USHY", name: "iShares Broad USD High Yield Corporate Bond ETF" },
-    { symbol: "USL", name: "United States 12 Month Oil" },
-    { symbol: "USMF", name: "WisdomTree U.S. Multifactor Fund" },
-    { symbol: "USML", name: "ETRACS 2x Leveraged MSCI US Minimum Volatility Factor TR ETN" },
-    { symbol: "USMV", name: "iShares MSCI USA Min Vol Factor ETF" },
-    { symbol: "USNA", name: "USANA Health Sciences, Inc. Common Stock" },
-    { symbol: "USNG", name: "Amplify ETF Trust Amplify Samsung U.S. Natural Gas Infrastructure ETF" },
-    { symbol: "USNZ", name: "DBX ETF Trust Xtrackers Net Zero Pathway Paris Aligned US Equity ETF" },
-    { symbol: "USO", name: "United States Oil Fund" },
-    { symbol: "USPH", name: "U.S. Physical Therapy, Inc. Common Stock" },
-    { symbol: "USPX", name: "Franklin U.S. Equity Index ETF" },
-    { symbol: "USRT", name: "iShares Core U.S. REIT ETF" },
-    { symbol: "USSE", name: "Segall Bryant & Hamill Trust Segall Bryant & Hamill Select Equity ETF" },
-    { symbol: "USSG", name: "Xtrackers MSCI USA Selection Equity ETF" },
-    { symbol: "UST", name: "ProShares Ultra 7-10 Year Treasury" },
-    { symbol: "UTES", name: "Virtus Reaves Utilities ETF" },
-    { symbol: "UTF", name: "Cohen & Steers Infrastructure Fund, Inc Common Stock" },
-    { symbol: "UTG", name: "Reaves Utility Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "UTI", name: "Universal Technical Institute Inc Common Stock" },
-    { symbol: "UTL", name: "UNITIL Corporation Common Stock" },
-    { symbol: "UTSL", name: "Direxion Daily Utilities Bull 3X Shares" },
-    { symbol: "UTZ", name: "Utz Brands Inc Class A Common Stock " },
-    { symbol: "UUP", name: "Invesco DB USD Index Bullish Fund ETF" },
-    { symbol: "UUU", name: "Universal Safety Products, Inc. Common Stock" },
-    { symbol: "UUUU", name: "Energy Fuels Inc Ordinary Shares (Canada)" },
-    { symbol: "UVE", name: "UNIVERSAL INSURANCE HOLDINGS INC Common Stock" },
-    { symbol: "UVIX", name: "VS TR 2x Long VIX Futures ETF" },
-    { symbol: "UVV", name: "Universal Corporation Common Stock" },
-    { symbol: "UVXY", name: "ProShares Trust Ultra VIX Short Term Futures ETF" },
-    { symbol: "UWM", name: "ProShares Ultra Russell2000" },
-    { symbol: "UWMC", name: "UWM Holdings Corporation Class A Common Stock" },
-    { symbol: "UWMC.W", name: "UWM Holdings Corporation Warrant" },
-    { symbol: "UX", name: "Roundhill ETF Trust Roundhill Uranium ETF" },
-    { symbol: "UXAP", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Uncapped Accelerator ETF - April" },
-    { symbol: "UXI", name: "ProShares Ultra Industrials" },
-    { symbol: "UXJA", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Uncapped Accelerator ETF - January" },
-    { symbol: "UXJL", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Uncapped Accelerator ETF - July" },
-    { symbol: "UXOC", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Uncapped Accelerator ETF - October" },
-    { symbol: "UXRP", name: "ProShares Trust ProShares Ultra XRP ETF" },
-    { symbol: "UYG", name: "ProShares Ultra Financials" },
-    { symbol: "UYM", name: "ProShares Ultra Materials" },
-    { symbol: "UZD", name: "Array Digital Infrastructure, Inc. 6.250% Senior Notes due 2069" },
-    { symbol: "UZE", name: "Array Digital Infrastructure, Inc. 5.500% Senior Notes due 2070" },
-    { symbol: "UZF", name: "Array Digital Infrastructure, Inc. 5.500% Senior Notes due 2070" },
-    { symbol: "V", name: "Visa Inc." },
-    { symbol: "VABS", name: "Virtus Newfleet ABS/MBS ETF" },
-    { symbol: "VAC", name: "Marriott Vacations Worldwide Corporation Common Stock" },
-    { symbol: "VAL", name: "Valaris Limited Common Shares" },
-    { symbol: "VAL.W", name: "Valaris Limited Warrants" },
-    { symbol: "VALE", name: "VALE S.A.  American Depositary Shares Each Representing one common share" },
-    { symbol: "VALQ", name: "American Century U.S. Quality Value ETF" },
-    { symbol: "VAMO", name: "Cambria ETF Trust Cambria Value and Momentum ETF" },
-    { symbol: "VATE", name: "INNOVATE Corp. Common Stock" },
-    { symbol: "VAW", name: "Vanguard Materials ETF" },
-    { symbol: "VB", name: "Vanguard Small-Cap ETF" },
-    { symbol: "VBF", name: "Invesco Bond Fund Common Stock" },
-    { symbol: "VBK", name: "Vanguard Small-Cap Growth ETF" },
-    { symbol: "VBND", name: "Vident U.S. Bond Strategy ETF" },
-    { symbol: "VBR", name: "Vanguard Small-Cap Value ETF" },
-    { symbol: "VCEB", name: "Vanguard World Funds ETF" },
-    { symbol: "VCLN", name: "Virtus Duff & Phelps Clean Energy ETF" },
-    { symbol: "VCR", name: "Vanguard Consumer Discretion ETF" },
-    { symbol: "VCRM", name: "Vanguard Tax-Managed Funds Vanguard Core Tax-Exempt Bond ETF" },
-    { symbol: "VCV", name: "Invesco California Value Municipal Income Trust Common Stock" },
-    { symbol: "VDC", name: "Vanguard Consumer Staples ETF" },
-    { symbol: "VDE", name: "Vanguard Energy ETF" },
-    { symbol: "VEA", name: "Vanguard FTSE Developed Markets ETF" },
-    { symbol: "VEEV", name: "Veeva Systems Inc. Class A Common Stock" },
-    { symbol: "VEGA", name: "AdvisorShares STAR Global Buy-Write ETF" },
-    { symbol: "VEGI", name: "iShares MSCI Agriculture Producers ETF" },
-    { symbol: "VEGN", name: "US Vegan Climate Index" },
-    { symbol: "VEL", name: "Velocity Financial, Inc. Common Stock" },
-    { symbol: "VEMY", name: "Virtus ETF Trust II Virtus Stone Harbor Emerging Markets High Yield Bond ETF" },
-    { symbol: "VENU", name: "Venu Holding Corporation Common Stock" },
-    { symbol: "VERS", name: "ProShares Trust ProShares Metaverse ETF" },
-    { symbol: "VET", name: "Vermilion Energy Inc. Common (Canada)" },
-    { symbol: "VETZ", name: "Academy Veteran Bond ETF" },
-    { symbol: "VEU", name: "Vanguard FTSE All World Ex US ETF" },
-    { symbol: "VFC", name: "V.F. Corporation Common Stock" },
-    { symbol: "VFH", name: "Vanguard Financials ETF" },
-    { symbol: "VFL", name: "abrdn National Municipal Income Fund Common Stock" },
-    { symbol: "VFMF", name: "Vanguard U.S. Multifactor ETF" },
-    { symbol: "VFMO", name: "Vanguard U.S. Momentum Factor ETF" },
-    { symbol: "VFMV", name: "Vanguard U.S. Minimum Volatility ETF" },
-    { symbol: "VFQY", name: "Vanguard U.S. Quality Factor ETF" },
-    { symbol: "VFVA", name: "Vanguard U.S. Value Factor ETF" },
-    { symbol: "VG", name: "Venture Global, Inc. Class A common stock" },
-    { symbol: "VGI", name: "Virtus Global Multi-Sector Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "VGK", name: "Vanguard FTSEEuropean ETF" },
-    { symbol: "VGM", name: "Invesco Trust for Investment Grade Municipals Common Stock (DE)" },
-    { symbol: "VGMS", name: "Vanguard Malvern Funds Vanguard Multi-Sector Income Bond ETF" },
-    { symbol: "VGT", name: "Vanguard Information Tech ETF" },
-    { symbol: "VGVT", name: "Vanguard Malvern Funds Vanguard Government Securities Active ETF" },
-    { symbol: "VGZ", name: "Vista Gold Corp Common Stock" },
-    { symbol: "VHC", name: "VirnetX Holding Corp Common Stock" },
-    { symbol: "VHI", name: "Valhi, Inc. Common Stock" },
-    { symbol: "VHT", name: "Vanguard Health Care ETF" },
-    { symbol: "VICE", name: "AdvisorShares Trust AdvisorShares Vice ETF" },
-    { symbol: "VICI", name: "VICI Properties Inc. Common Stock" },
-    { symbol: "VIDI", name: "Vident International Equity Strategy ETF" },
-    { symbol: "VIG", name: "Vanguard Div Appreciation ETF" },
-    { symbol: "VIK", name: "Viking Holdings Ltd Ordinary Shares" },
-    { symbol: "VIOG", name: "Vanguard S&P Small-Cap 600 Growth ETF" },
-    { symbol: "VIOO", name: "Vanguard S&P Small-Cap 600 ETF" },
-    { symbol: "VIOV", name: "Vanguard S&P Small-Cap 600 Value ETF" },
-    { symbol: "VIPS", name: "Vipshop Holdings Limited American Depositary Shares, each representing two ordinary shares" },
-    { symbol: "VIRT", name: "Virtu Financial, Inc. Class A Common Stock" },
-    { symbol: "VIS", name: "Vanguard Industrials ETF" },
-    { symbol: "VIST", name: "Vista Energy S.A.B. de C.V. American Depositary Shares, each representing one series A share, with no par value" },
-    { symbol: "VIV", name: "Telefonica Brasil S.A. American Depositary Shares (Each representing One Common Share)" },
-    { symbol: "VIXM", name: "ProShares Trust VIX Mid-Term Futures ETF" },
-    { symbol: "VIXY", name: "ProShares Trust VIX Short-Term Futures ETF" },
-    { symbol: "VKI", name: "Invesco Advantage Municipal Income Trust II Common Shares of Beneficial Interest (DE)" },
-    { symbol: "VKQ", name: "Invesco Municipal Trust Common Stock" },
-    { symbol: "VLLU", name: "Harbor ETF Trust Harbor AlphaEdge Large Cap Value ETF" },
-    { symbol: "VLN", name: "Valens Semiconductor Ltd. Ordinary Shares" },
-    { symbol: "VLN.W", name: "Valens Semiconductor Ltd. Warrants, each warrant to purchase one-half of one Ordinary Share" },
-    { symbol: "VLO", name: "Valero Energy Corporation Common Stock" },
-    { symbol: "VLRS", name: "Controladora Vuela Compania de Aviacion, S.A.B. de C.V. American Depositary Shares, each representing ten (10) Ordinary Participation Certificates" },
-    { symbol: "VLT", name: "Invesco High Income Trust II" },
-    { symbol: "VLTO", name: "Veralto Corp Common Stock " },
-    { symbol: "VLU", name: "SPDR S&P 1500 Value Tilt ETF" },
-    { symbol: "VLUE", name: "iShares MSCI USA Value Factor ETF" },
-    { symbol: "VMAX", name: "Lattice Strategies Trust Hartford US Value ETF" },
-    { symbol: "VMC", name: "Vulcan Materials Company (Holding Company) Common Stock" },
-    { symbol: "VMI", name: "Valmont Industries, Inc. Common Stock" },
-    { symbol: "VMO", name: "Invesco Municipal Opportunity Trust Common Stock" },
-    { symbol: "VNAM", name: "Global X Funds Global X MSCI Vietnam ETF" },
-    { symbol: "VNCE", name: "Vince Holding Corp. Common Stock" },
-    { symbol: "VNIE", name: "The Advisors Inner Circle Fund II Vontobel International Equity Active ETF" },
-    { symbol: "VNLA", name: "Janus Henderson Short Duration Income ETF" },
-    { symbol: "VNM", name: "VanEck Vietnam ETF" },
-    { symbol: "VNO", name: "Vornado Realty Trust Common Stock" },
-    { symbol: "VNO$L", name: "Vornado Realty Trust Pfd Ser L %" },
-    { symbol: "VNO$M", name: "Vornado Realty Trust 5.25% Series M Cumulative Redeemable Preferred Shares of Beneficial Interest, liquidation preference $25.00 per share, no par value per share" },
-    { symbol: "VNO$N", name: "Vornado Realty Trust 5.25% Series N Cumulative Redeemable Preferred Shares of Beneficial Interest, liquidation preference $25.00 per share" },
-    { symbol: "VNO$O", name: "Vornado Realty Trust 4.45% Series O Cumulative Redeemable Preferred Shares, Liquidation Preference $25.00 Per Share" },
-    { symbol: "VNQ", name: "Vanguard Real Estate ETF" },
-    { symbol: "VNRX", name: "VolitionRX Limited Common Stock" },
-    { symbol: "VNSE", name: "Natixis Vaughan Nelson Select ETF" },
-    { symbol: "VNT", name: "Vontier Corporation Common Stock " },
-    { symbol: "VNTG", name: "Vantage Corp Class A Ordinary Shares" },
-    { symbol: "VO", name: "Vanguard Mid-Cap ETF" },
-    { symbol: "VOC", name: "VOC Energy Trust Units of Beneficial Interest" },
-    { symbol: "VOE", name: "Vanguard Mid-Cap Value ETF" },
-    { symbol: "VOO", name: "Vanguard S&P 500 ETF" },
-    { symbol: "VOOG", name: "Vanguard S&P 500 Growth ETF" },
-    { symbol: "VOOV", name: "Vanguard S&P 500 Value ETF" },
-    { symbol: "VOT", name: "Vanguard Mid-Cap Growth ETF" },
-    { symbol: "VOX", name: "Vanguard Communication Services  ETF" },
-    { symbol: "VOYA", name: "Voya Financial, Inc. Common Stock" },
-    { symbol: "VOYA$B", name: "Voya Financial, Inc. Depositary Shares, each representing a 1/40th interest in a share of 5.35% Fixed-Rate Reset Non-Cumulative Preferred Stock, Series B" },
-    { symbol: "VOYG", name: "Voyager Technologies, Inc. Class A Common Stock" },
-    { symbol: "VOYX", name: "Tradr 2X Long VOYG Daily ETF" },
-    { symbol: "VPC", name: "Virtus Private Credit Strategy ETF" },
-    { symbol: "VPG", name: "Vishay Precision Group, Inc. Common Stock" },
-    { symbol: "VPL", name: "Vanguard FTSE Pacific ETF" },
-    { symbol: "VPU", name: "Vanguard Utilities ETF" },
-    { symbol: "VPV", name: "Invesco Pennsylvania Value Municipal Income Trust Common Stock (DE)" },
-    { symbol: "VRAI", name: "Virtus Real Asset Income ETF" },
-    { symbol: "VRE", name: "Veris Residential, Inc. Common Stock" },
-    { symbol: "VRP", name: "Invesco Variable Rate Preferred ETF" },
-    { symbol: "VRT", name: "Vertiv Holdings, LLC Class A Common Stock" },
-    { symbol: "VRTS", name: "Virtus Investment Partners, Inc. Common Stock" },
-    { symbol: "VSCO", name: "Victorias Secret & Co. Common Stock " },
-    { symbol: "VSDB", name: "Vanguard Malvern Funds Vanguard Short Duration Bond ETF" },
-    { symbol: "VSDM", name: "Vanguard Tax-Managed Funds Vanguard Short Duration Tax-Exempt Bond ETF" },
-    { symbol: "VSGX", name: "Vanguard ESG International Stock ETF" },
-    { symbol: "VSH", name: "Vishay Intertechnology, Inc. Common Stock" },
-    { symbol: "VSHY", name: "Virtus Newfleet Short Duration High Yield Bond ETF" },
-    { symbol: "VSLU", name: "Applied Finance Valuation Large Cap ETF" },
-    { symbol: "VSS", name: "Vanguard FTSE All-Wld ex-US SmCp Idx ETF" },
-    { symbol: "VST", name: "Vistra Corp. Common Stock" },
-    { symbol: "VSTS", name: "Vestis Corporation Common Stock" },
-    { symbol: "VT", name: "Vanguard Total World Stock Index ETF" },
-    { symbol: "VTAK", name: "Catheter Precision, Inc. Common Stock" },
-    { symbol: "VTEB", name: "Vanguard Tax-Exempt Bond ETF" },
-    { symbol: "VTEC", name: "Vanguard California Tax-Exempt Bond ETF" },
-    { symbol: "VTEI", name: "Vanguard Tax-Managed Funds Vanguard Intermediate-Term Tax-Exempt Bond ETF" },
-    { symbol: "VTEL", name: "Vanguard Tax-Managed Funds Vanguard Long-Term Tax-Exempt Bond ETF" },
-    { symbol: "VTES", name: "Vanguard Wellington Fund Vanguard Short-Term Tax Exempt Bond ETF" },
-    { symbol: "VTEX", name: "VTEX Class A Common Shares" },
-    { symbol: "VTG", name: "Vanguard Malvern Funds Vanguard Total Treasury ETF" },
-    { symbol: "VTI", name: "Vanguard Total Stock Market ETF" },
-    { symbol: "VTLE", name: "Vital Energy, Inc. Common Stock, par value $0.01 per share" },
-    { symbol: "VTMX", name: "Corporacion Inmobiliaria Vesta, S.A.B de C.V. American Depositary Shares, each representing ten (10) Common Shares" },
-    { symbol: "VTN", name: "Invesco Trust for Investment Grade New York Municipals Common Stock" },
-    { symbol: "VTOL", name: "Bristow Group, Inc. Common Stock" },
-    { symbol: "VTP", name: "Vanguard Malvern Funds Vanguard Total Inflation-Protected Securities ETF" },
-    { symbol: "VTR", name: "Ventas, Inc. Common Stock" },
-    { symbol: "VTS", name: "Vitesse Energy, Inc. Common Stock" },
-    { symbol: "VTV", name: "Vanguard Value ETF" },
-    { symbol: "VUG", name: "Vanguard Growth ETF" },
-    { symbol: "VUSB", name: "Vanguard Ultra-Short Bond ETF" },
-    { symbol: "VUSE", name: "Vident U.S. Equity Strategy ETF" },
-    { symbol: "VV", name: "Vanguard Large-Cap ETF" },
-    { symbol: "VVR", name: "Invesco Senior Income Trust Common Stock (DE)" },
-    { symbol: "VVV", name: "Valvoline Inc. Common Stock" },
-    { symbol: "VVX", name: "V2X, Inc. Common Stock" },
-    { symbol: "VWID", name: "Virtus WMC International Dividend ETF" },
-    { symbol: "VWO", name: "Vanguard FTSE Emerging Markets ETF" },
-    { symbol: "VXF", name: "Vanguard Extended Market ETF" },
-    { symbol: "VXX", name: "iPath Series B S&P 500 VIX Short-Term Futures ETN" },
-    { symbol: "VXZ", name: "iPath Series B S&P 500 VIX Mid-Term Futures ETN" },
-    { symbol: "VYLD", name: "J P Morgan Chase & Co Inverse VIX  Short-Term Futures ETNs due March 22, 2045" },
-    { symbol: "VYM", name: "Vanguard High Dividend Yield ETF" },
-    { symbol: "VYX", name: "NCR Voyix Corporation Common Stock" },
-    { symbol: "VZ", name: "Verizon Communications Inc. Common Stock" },
-    { symbol: "VZLA", name: "Vizsla Silver Corp. Common Shares" },
-    { symbol: "W", name: "Wayfair Inc. Class A Common Stock" },
-    { symbol: "WAB", name: "Westinghouse Air Brake Technologies Corporation Common Stock" },
-    { symbol: "WAL", name: "Western Alliance Bancorporation Common Stock (DE)" },
-    { symbol: "WAL$A", name: "Western Alliance Bancorporation Depositary Shares, Each Representing a 1/400th Interest in a Share of 4.250% Fixed-Rate Non-Cumulative Perpetual Preferred Stock, Series A" },
-    { symbol: "WANT", name: "Direxion Daily Consumer Discretionary Bull 3X Shares" },
-    { symbol: "WAR", name: "ETF Series Solutions U.S. Global Technology and Aerospace & Defense ETF" },
-    { symbol: "WAT", name: "Waters Corporation Common Stock" },
-    { symbol: "WBIF", name: "WBI BullBear Value 3000 ETF" },
-    { symbol: "WBIG", name: "WBI BullBear Yield 3000 ETF" },
-    { symbol: "WBIL", name: "WBI BullBear Quality 3000 ETF" },
-    { symbol: "WBIY", name: "WBI Power Factor High Dividend ETF" },
-    { symbol: "WBS", name: "Webster Financial Corporation Common Stock" },
-    { symbol: "WBS$F", name: "Webster Financial Corporation Depositary Shares, Each Representing 1/1,000th Interest in a Share of 5.25% Series F Non-Cumulative Perpetual Preferred Stock" },
-    { symbol: "WBS$G", name: "Webster Financial Corporation Depositary Shares, each representing a 1/40th interest in a share of 6.50% Series G non-cumulative perpetual preferred stock" },
-    { symbol: "WBX", name: "Wallbox N.V. Class A Ordinary Shares" },
-    { symbol: "WCC", name: "WESCO International, Inc. Common Stock" },
-    { symbol: "WCEO", name: "Hypatia Women CEO ETF" },
-    { symbol: "WCME", name: "First Trust Exchange-Traded Fund First Trust WCM Developing World Equity ETF" },
-    { symbol: "WCMI", name: "First Trust Exchange-Traded Fund First Trust WCM International Equity ETF" },
-    { symbol: "WCN", name: "Waste Connections, Inc. Common Shares" },
-    { symbol: "WCPB", name: "Northern Lights Fund Trust II Weitz Core Plus Bond ETF" },
-    { symbol: "WD", name: "Walker & Dunlop, Inc Common Stock" },
-    { symbol: "WDEF", name: "WisdomTree Trust WisdomTree Europe Defense Fund" },
-    { symbol: "WDH", name: "Waterdrop Inc. American Depositary Shares (each representing the right to receive 10 Class A Ordinary Shares)" },
-    { symbol: "WDI", name: "Western Asset Diversified Income Fund Common Shares of Beneficial Interest" },
-    { symbol: "WDIV", name: "SPDR S&P Global Dividend" },
-    { symbol: "WDNA", name: "WisdomTree BioRevolution Fund" },
-    { symbol: "WDS", name: "Woodside Energy Group Limited American Depositary Shares, each representing one Ordinary Share" },
-    { symbol: "WDTE", name: "Defiance S&P 500 Enhanced Options & 0DTE Income ETF" },
-    { symbol: "WEA", name: "Western Asset Bond Fund Share of Beneficial Interest" },
-    { symbol: "WEAT", name: "Teucrium Wheat Fund ETV" },
-    { symbol: "WEAV", name: "Weave Communications, Inc. Common Stock" },
-    { symbol: "WEBL", name: "Direxion Daily Dow Jones Internet Bull 3X Shares" },
-    { symbol: "WEBS", name: "Direxion Daily Dow Jones Internet Bear 3X Shares" },
-    { symbol: "WEC", name: "WEC Energy Group, Inc. Common Stock" },
-    { symbol: "WEED", name: "Listed Funds Trust Roundhill Cannabis ETF" },
-    { symbol: "WEEK", name: "Roundhill ETF Trust Roundhill Weekly T-Bill ETF" },
-    { symbol: "WEEL", name: "Tidal Trust II Peerless Option Income Wheel ETF" },
-    { symbol: "WELL", name: "Welltower Inc. Common Stock" },
-    { symbol: "WES", name: "Western Midstream Partners, LP Common Units Representing Limited Partner Interests" },
-    { symbol: "WEX", name: "WEX Inc. common stock" },
-    { symbol: "WF", name: "Woori Financial Group Inc. American Depositary Shares (each representing three (3) shares of Common Stock)" },
-    { symbol: "WFC", name: "Wells Fargo & Company Common Stock" },
-    { symbol: "WFC$A", name: "Wells Fargo & Company Depositary Shares, each representing a 1/1,000th interest in a share of Non-Cumulative Perpetual Class A Preferred Stock, Series AA" },
-    { symbol: "WFC$C", name: "Wells Fargo & Company Depositary Shares, each representing a 1/1,000th interest in a share of Non-Cumulative Perpetual Class A Preferred Stock, Series CC" },
-    { symbol: "WFC$D", name: "Wells Fargo & Company Depositary Shares, each representing a 1/1,000th interest in  a share of Non-Cumulative Perpetual Class A Preferred Stock, Series DD" },
-    { symbol: "WFC$L", name: "Wells Fargo & Company 7.50% Non-Cumulative Perpetual Convertible Class A Preferred Stock, Series L" },
-    { symbol: "WFC$Y", name: "Wells Fargo & Company Depositary Shares, each representing a 1/1,000th interest in a share of Non-Cumulative Perpetual Class A Preferred Stock, Series Y" },
-    { symbol: "WFC$Z", name: "Wells Fargo & Company Depositary Shares, each representing a 1/1,000th interest in a share of Non-Cumulative Perpetual Class A Preferred Stock, Series Z" },
-    { symbol: "WFG", name: "West Fraser Timber Co. Ltd Common stock" },
-    { symbol: "WFH", name: "Direxion Work From Home ETF" },
-    { symbol: "WGO", name: "Winnebago Industries, Inc. Common Stock" },
-    { symbol: "WH", name: "Wyndham Hotels & Resorts, Inc. Common Stock " },
-    { symbol: "WHD", name: "Cactus, Inc. Class A Common Stock" },
-    { symbol: "WHG", name: "Westwood Holdings Group Inc Common Stock" },
-    { symbol: "WHR", name: "Whirlpool Corporation Common Stock" },
-    { symbol: "WHTX", name: "Volatility Shares Trust 2x Wheat ETF" },
-    { symbol: "WIA", name: "Western Asset Inflation-Linked Income Fund" },
-    { symbol: "WILD", name: "Tidal Trust III VistaShares Animal Spirits Daily 2X Strategy ETF" },
-    { symbol: "WINN", name: "Harbor ETF Trust Harbor Long-Term Growers ETF" },
-    { symbol: "WIP", name: "SPDR FTSE International Government Inflation-Protected Bond ETF" },
-    { symbol: "WIT", name: "Wipro Limited Common Stock" },
-    { symbol: "WIW", name: "Western Asset Inflation-Linked Opportunities & Income Fund" },
-    { symbol: "WK", name: "Workiva Inc. Class A Common Stock" },
-    { symbol: "WKC", name: "World Kinect Corporation Common Stock" },
-    { symbol: "WLDR", name: "Affinity World Leaders Equity ETF " },
-    { symbol: "WLK", name: "Westlake Corporation Common Stock" },
-    { symbol: "WLKP", name: "Westlake Chemical Partners LP Common Units representing limited partner interests" },
-    { symbol: "WLTG", name: "ETF Opportunities Trust WealthTrust DBS Long Term Growth ETF" },
-    { symbol: "WLY", name: "John Wiley & Sons, Inc. Common Stock" },
-    { symbol: "WLYB", name: "John Wiley & Sons, Inc. Common Stock" },
-    { symbol: "WM", name: "Waste Management, Inc. Common Stock" },
-    { symbol: "WMB", name: "Williams Companies, Inc. (The) Common Stock" },
-    { symbol: "WMK", name: "Weis Markets, Inc. Common Stock" },
-    { symbol: "WMS", name: "Advanced Drainage Systems, Inc. Common Stock" },
-    { symbol: "WMT", name: "Walmart Inc. Common Stock" },
-    { symbol: "WNC", name: "Wabash National Corporation Common Stock" },
-    { symbol: "WNS", name: "WNS (Holdings) Limited Ordinary Shares" },
-    { symbol: "WNTR", name: "Tidal Trust II YieldMax  MSTR Short Option Income Strategy ETF" },
-    { symbol: "WOLF", name: "Wolfspeed, Inc. Common Stock" },
-    { symbol: "WOMN", name: "Tidal Trust III Impact Shares Women's Empowerment ETF" },
-    { symbol: "WOR", name: "Worthington Enterprises, Inc. Common Shares" },
-    { symbol: "WOW", name: "WideOpenWest, Inc. Common Stock" },
-    { symbol: "WPAY", name: "Roundhill ETF Trust Roundhill WeeklyPay Universe ETF" },
-    { symbol: "WPC", name: "W. P. Carey Inc. REIT" },
-    { symbol: "WPM", name: "Wheaton Precious Metals Corp Common Shares (Canada)" },
-    { symbol: "WPP", name: "WPP plc American Depositary Shares" },
-    { symbol: "WRB", name: "W.R. Berkley Corporation Common Stock" },
-    { symbol: "WRB$E", name: "W.R. Berkley Corporation 5.70% Subordinated Debentures due 2058" },
-    { symbol: "WRB$F", name: "W.R. Berkley Corporation 5.10% Subordinated Debentures due 2059" },
-    { symbol: "WRB$G", name: "W.R. Berkley Corporation 4.25% Subordinated Debentures due 2060" },
-    { symbol: "WRB$H", name: "W.R. Berkley Corporation 4.125% Subordinated Debentures due 2061" },
-    { symbol: "WRBY", name: "Warby Parker Inc. Class A Common Stock" },
-    { symbol: "WRN", name: "Western Copper and Gold Corporation Common Stock" },
-    { symbol: "WS", name: "Worthington Steel, Inc. Common Shares" },
-    { symbol: "WSM", name: "Williams-Sonoma, Inc. Common Stock (DE)" },
-    { symbol: "WSO", name: "Watsco, Inc. Common Stock" },
-    { symbol: "WSO.B", name: "Watsco, Inc. Class B Common Stock" },
-    { symbol: "WSR", name: "Whitestone REIT Common Shares" },
-    { symbol: "WST", name: "West Pharmaceutical Services, Inc. Common Stock" },
-    { symbol: "WT", name: "WisdomTree, Inc. Common Stock" },
-    { symbol: "WTAI", name: "WisdomTree Trust WisdomTree Artificial Intelligence and Innovation Fund" },
-    { symbol: "WTI", name: "W&T Offshore, Inc. Common Stock" },
-    { symbol: "WTID", name: "Bank Of Montreal MicroSectors Energy 3X Inverse Leveraged ETNs" },
-    { symbol: "WTIU", name: "Bank Of Montreal MicroSectors Energy 3X Leveraged ETNs" },
-    { symbol: "WTM", name: "White Mountains Insurance Group, Ltd. Common Stock" },
-    { symbol: "WTMF", name: "WisdomTree Managed Futures Strategy Fund" },
-    { symbol: "WTPI", name: "WisdomTree Equity Premium Income Fund" },
-    { symbol: "WTRE", name: "WisdomTree New Economy Real Estate Fund" },
-    { symbol: "WTRG", name: "Essential Utilities, Inc. Common Stock" },
-    { symbol: "WTS", name: "Watts Water Technologies, Inc. Class A Common Stock" },
-    { symbol: "WTTR", name: "Select Water Solutions, Inc. Class A common stock" },
-    { symbol: "WTV", name: "WisdomTree U.S. Value Fund" },
-    { symbol: "WU", name: "Western Union Company (The) Common Stock" },
-    { symbol: "WUGI", name: "AXS Esoterica NextG Economy ETF" },
-    { symbol: "WWJD", name: "Inspire International ETF" },
-    { symbol: "WWR", name: "Westwater Resources, Inc. Common Stock" },
-    { symbol: "WWW", name: "Wolverine World Wide, Inc. Common Stock" },
-    { symbol: "WXET", name: "Listed Funds Trust Teucrium 2x Daily Wheat ETF" },
-    { symbol: "WY", name: "Weyerhaeuser Company Common Stock" },
-    { symbol: "WYY", name: "WidePoint Corporation Common Stock" },
-    { symbol: "WZRD", name: "ETF Opportunities Trust Opportunistic Trader ETF" },
-    { symbol: "XAPR", name: "SHL Telemedicine Ltd FT Vest U.S. Equity Enhance & Moderate Buffer ETF - April" },
-    { symbol: "XAR", name: "SPDR S&P Aerospace & Defense ETF" },
-    { symbol: "XAUG", name: "FT Vest U.S. Equity Enhance & Moderate Buffer ETF - August" },
-    { symbol: "XB", name: "BondBloxx ETF Trust BondBloxx B-Rated USD High Yield Corporate Bond ETF" },
-    { symbol: "XBAP", name: "Innovator U.S. Equity Accelerated 9 Buffer ETF - April" },
-    { symbol: "XBB", name: "BondBloxx ETF Trust BondBloxx BB-Rated USD High Yield Corporate Bond ETF" },
-    { symbol: "XBI", name: "SPDR Series Trust  SPDR S&P Biotech ETF" },
-    { symbol: "XBJA", name: "Innovator ETFs Trust Innovator U.S. Equity Accelerated 9 Buffer ETF - January" },
-    { symbol: "XBJL", name: "Innovator U.S. Equity Accelerated 9 Buffer ETF - July" },
-    { symbol: "XBOC", name: "Innovator U.S. Equity Accelerated 9 Buffer ETF - October" },
-    { symbol: "XC", name: "WisdomTree True Emerging Markets Fund" },
-    { symbol: "XCCC", name: "BondBloxx ETF Trust BondBloxx CCC-Rated USD High Yield Corporate Bond ETF" },
-    { symbol: "XCEM", name: "Columbia EM Core ex-China ETF" },
-    { symbol: "XCLR", name: "Global X Funds Global X S&P 500 Collar 95-110 ETF" },
-    { symbol: "XCOR", name: "FundX Investment Trust FundX ETF" },
-    { symbol: "XDAT", name: "Franklin Exponential Data ETF" },
-    { symbol: "XDEC", name: "FT Vest U.S. Equity Enhance & Moderate Buffer ETF - December" },
-    { symbol: "XDIV", name: "Roundhill ETF Trust Roundhill S&P 500 No Dividend Target ETF" },
-    { symbol: "XDOC", name: "Innovator U.S. Equity Accelerated ETF - October" },
-    { symbol: "XDQQ", name: "Innovator Growth Accelerated ETF - Quarterly" },
-    { symbol: "XDSQ", name: "Innovator ETFs Trust Innovator U.S. Equity Accelerated ETF - Quarterly" },
-    { symbol: "XDTE", name: "Roundhill ETF Trust Roundhill S&P 500 0DTE Covered Call Strategy ETF" },
-    { symbol: "XEMD", name: "BondBloxx ETF Trust BondBloxx JP Morgan USD Emerging Markets 1-10 Year Bond ETF" },
-    { symbol: "XES", name: "SPDR Series Trust SPDR S&P Oil & Gas Equipment & Services ETF" },
-    { symbol: "XFEB", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Enhance & Moderate Buffer ETF - February" },
-    { symbol: "XFIV", name: "BondBloxx ETF Trust BondBloxx Bloomberg Five Year Target Duration US Treasury ETF" },
-    { symbol: "XFLT", name: "XAI Octagon Floating Rate & Alternative Income Trust Common Shares of Beneficial Interest" },
-    { symbol: "XFLT$A", name: "XAI Octagon Floating Rate & Alternative Income Trust 6.50% Series 2026 Term Preferred Shares, (Liquidation Preference $25.00)" },
-    { symbol: "XFLX", name: "FundX Investment Trust FundX Flexible ETF" },
-    { symbol: "XHB", name: "SPDR Series Trust SPDR Homebuilders ETF" },
-    { symbol: "XHE", name: "SPDR S&P Health Care Equipment" },
-    { symbol: "XHLF", name: "BondBloxx ETF Trust BondBloxx Bloomberg Six Month Target Duration US Treasury ETF" },
-    { symbol: "XHR", name: "Xenia Hotels & Resorts, Inc. Common Stock" },
-    { symbol: "XHS", name: "SPDR S&P Health Care Services ETF" },
-    { symbol: "XHYC", name: "BondBloxx ETF Trust BondBloxx USD High Yield Bond Consumer Cyclicals Sector ETF" },
-    { symbol: "XHYD", name: "BondBloxx ETF Trust BondBloxx USD High Yield Bond Consumer Non-Cyclicals Sector ETF" },
-    { symbol: "XHYE", name: "BondBloxx ETF Trust BondBloxx USD High Yield Bond Energy Sector ETF" },
-    { symbol: "XHYF", name: "BondBloxx ETF Trust BondBloxx USD High Yield Bond Financial & REIT Sector ETF" },
-    { symbol: "XHYH", name: "BondBloxx ETF Trust BondBloxx USD High Yield Bond Healthcare Sector ETF" },
-    { symbol: "XHYI", name: "BondBloxx ETF Trust BondBloxx USD High Yield Bond Industrial Sector ETF" },
-    { symbol: "XHYT", name: "BondBloxx ETF Trust BondBloxx USD High Yield Bond Telecom, Media & Technology Sector ETF" },
-    { symbol: "XIDE", name: "FT Vest U.S. Equity Buffer & Premium Income  ETF - December" },
-    { symbol: "XIDV", name: "Franklin International Dividend Booster Index ETF" },
-    { symbol: "XIFR", name: "XPLR Infrastructure, LP Common Units representing limited partner interests" },
-    { symbol: "XIJN", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Buffer & Premium Income ETF - June" },
-    { symbol: "XIMR", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Buffer & Premium Income ETF - March" },
-    { symbol: "XISE", name: "FT Vest U.S. Equity Buffer & Premium Income ETF - September" },
-    { symbol: "XITK", name: "SPDR FactSet Innovative Technology ETF" },
-    { symbol: "XJAN", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Enhance & Moderate Buffer ETF - January" },
-    { symbol: "XJH", name: "iShares ESG Select Screened S&P Mid-Cap ETF" },
-    { symbol: "XJR", name: "iShares ESG Select Screened S&P Small-Cap ETF" },
-    { symbol: "XJUL", name: "FT Vest U.S. Equity Enhance & Moderate Buffer ETF - July" },
-    { symbol: "XJUN", name: "FT Vest U.S. Equity Enhance & Moderate Buffer ETF - June" },
-    { symbol: "XLB", name: "Materials Select Sector SPDR" },
-    { symbol: "XLBI", name: "Select Sector SPDR Trust (The) The Materials Select Sector SPDR Premium Income Fund" },
-    { symbol: "XLC", name: "The Communication Services Select Sector SPDR Fund" },
-    { symbol: "XLCI", name: "Select Sector SPDR Trust (The) The Communication Services Select Sector SPDR Premium Income Fund" },
-    { symbol: "XLE", name: "SPDR Select Sector Fund - Energy Select Sector" },
-    { symbol: "XLEI", name: "Select Sector SPDR Trust (The) The Energy Select Sector SPDR Premium Income Fund" },
-    { symbol: "XLF", name: "SPDR Select Sector Fund - Financial" },
-    { symbol: "XLFI", name: "Select Sector SPDR Trust (The) The Financial Select Sector SPDR Premium Income Fund" },
-    { symbol: "XLG", name: "Invesco S&P 500 Top 50 ETF" },
-    { symbol: "XLI", name: "SPDR Select Sector Fund - Industrial" },
-    { symbol: "XLII", name: "Select Sector SPDR Trust (The) The Industrial Select Sector SPDR Premium Income Fund" },
-    { symbol: "XLK", name: "SPDR Select Sector Fund - Technology" },
-    { symbol: "XLKI", name: "Select Sector SPDR Trust (The) The Technology Select Sector SPDR Premium Income Fund" },
-    { symbol: "XLP", name: "SPDR Select Sector Fund - Consumer Staples" },
-    { symbol: "XLRE", name: "Real Estate Select Sector SPDR Fund (The)" },
-    { symbol: "XLRI", name: "Select Sector SPDR Trust (The) The Real Estate Select Sector SPDR Premium Income Fund" },
-    { symbol: "XLSI", name: "Select Sector SPDR Trust (The) The Consumer Staples Select Sector SPDR Premium Income Fund" },
-    { symbol: "XLSR", name: "SPDR SSGA U.S. Sector Rotation ETF" },
-    { symbol: "XLU", name: "SPDR Select Sector Fund - Utilities" },
-    { symbol: "XLUI", name: "Select Sector SPDR Trust (The) The Utilities Select Sector SPDR Premium Income Fund" },
-    { symbol: "XLV", name: "SPDR Select Sector Fund - Health Care" },
-    { symbol: "XLVI", name: "Select Sector SPDR Trust (The) The Health Care Select Sector SPDR Premium Income Fund" },
-    { symbol: "XLY", name: "SPDR Select Sector Fund - Consumer Discretionary" },
-    { symbol: "XLYI", name: "Select Sector SPDR Trust (The) The Consumer Discretionary Select Sector SPDR Premium Income Fund" },
-    { symbol: "XMAR", name: "FT Vest U.S. Equity Enhance & Moderate Buffer ETF - March" },
-    { symbol: "XMAY", name: "First Trust Exchange-Traded Fund VIII FT Vest U.S. Equity Enhance & Moderate Buffer ETF - May" },
-    { symbol: "XME", name: "SPDR S&P Metals & Mining ETF" },
-    { symbol: "XMHQ", name: "Invesco S&P MidCap Quality ETF" },
-    { symbol: "XMLV", name: "Invesco S&P MidCap Low Volatility ETF" },
-    { symbol: "XMMO", name: "Invesco S&P MidCap Momentum ETF" },
-    { symbol: "XMPT", name: "VanEck CEF Muni Income ETF" },
-    { symbol: "XMVM", name: "Invesco S&P MidCap Value with Momentum ETF" },
-    { symbol: "XNAV", name: "FundX Investment Trust FundX Aggressive ETF" },
-    { symbol: "XNOV", name: "FT Vest U.S. Equity Enhance & Moderate Buffer ETF - November" },
-    { symbol: "XNTK", name: "SPDR NYSE Technology ETF" },
-    { symbol: "XOCT", name: "FT Vest U.S. Equity Enhance & Moderate Buffer ETF - October" },
-    { symbol: "XOEF", name: "iShares Trust iShares S&P 500 ex S&P 100 ETF" },
-    { symbol: "XOM", name: "Exxon Mobil Corporation Common Stock" },
-    { symbol: "XOMO", name: "Tidal ETF Trust II YieldMax XOM Option Income Strategy ETF" },
-    { symbol: "XONE", name: "BondBloxx ETF Trust BondBloxx Bloomberg One Year Target Duration US Treasury ETF" },
-    { symbol: "XOP", name: "SPDR S&P Oil & Gas Explor & Product" },
-    { symbol: "XPAY", name: "Roundhill ETF Trust Roundhill S&P 500 Target 20 Managed Distribution ETF" },
-    { symbol: "XPER", name: "Xperi Inc. Common Stock " },
-    { symbol: "XPEV", name: "XPeng Inc. American depositary shares, each representing two Class A ordinary shares" },
-    { symbol: "XPH", name: "SPDR S&P Pharmaceuticals ETF" },
-    { symbol: "XPL", name: "Solitario Resources Corp. Common Stock" },
-    { symbol: "XPND", name: "First Trust Expanded Technology ETF" },
-    { symbol: "XPO", name: "XPO, Inc. Common Stock" },
-    { symbol: "XPOF", name: "Xponential Fitness, Inc. Class A Common Stock" },
-    { symbol: "XPP", name: "ProShares Ultra FTSE China 50" },
-    { symbol: "XPRO", name: "Expro Group Holdings N.V. Common Stock" },
-    { symbol: "XRLV", name: "Invesco S&P 500 ex-Rate Sensitive Low Volatility ETF" },
-    { symbol: "XRLX", name: "FundX Investment Trust FundX Conservative ETF" },
-    { symbol: "XRMI", name: "Global X Funds Global X S&P 500 Risk Managed Income ETF" },
-    { symbol: "XRT", name: "SPDR S&P Retail ETF" },
-    { symbol: "XSD", name: "SPDR S&P Semiconductor ETF" },
-    { symbol: "XSEP", name: "FT Vest U.S. Equity Enhance & Moderate Buffer ETF - September" },
-    { symbol: "XSHD", name: "Invesco S&P SmallCap High Dividend Low Volatility ETF" },
-    { symbol: "XSHQ", name: "Invesco S&P SmallCap Quality ETF" },
-    { symbol: "XSLV", name: "Invesco S&P SmallCap Low Volatility ETF" },
-    { symbol: "XSMO", name: "Invesco S&P SmallCap Momentum ETF" },
-    { symbol: "XSOE", name: "WisdomTree Emerging Markets Ex-State Owned Enterprises Fund" },
-    { symbol: "XSVM", name: "Invesco S&P SmallCap Value with Momentum ETF" },
-    { symbol: "XSVN", name: "BondBloxx ETF Trust BondBloxx Bloomberg Seven Year Target Duration US Treasury ETF" },
-    { symbol: "XSW", name: "SPDR S&P Software & Services ETF" },
-    { symbol: "XTAP", name: "Innovator U.S. Equity Accelerated Plus ETF - April" },
-    { symbol: "XTEN", name: "BondBloxx ETF Trust BondBloxx Bloomberg Ten Year Target Duration US Treasury ETF" },
-    { symbol: "XTJA", name: "Innovator ETFs Trust Innovator U.S. Equity Accelerated Plus ETF - January" },
-    { symbol: "XTJL", name: "Innovator U.S. Equity Accelerated Plus ETF - July" },
-    { symbol: "XTL", name: "SPDR S&P Telecom ETF" },
-    { symbol: "XTN", name: "SPDR S&P Transportation ETF" },
-    { symbol: "XTNT", name: "Xtant Medical Holdings, Inc. Common Stock" },
-    { symbol: "XTOC", name: "Innovator U.S. Equity Accelerated Plus ETF - October" },
-    { symbol: "XTR", name: "Global X Funds Global X S&P 500 Tail Risk ETF" },
-    { symbol: "XTRE", name: "BondBloxx ETF Trust BondBloxx Bloomberg Three Year Target Duration US Treasury ETF" },
-    { symbol: "XTWO", name: "BondBloxx ETF Trust BondBloxx Bloomberg Two Year Target Duration US Treasury ETF" },
-    { symbol: "XTWY", name: "BondBloxx ETF Trust BondBloxx Bloomberg Twenty Year Target Duration US Treasury ETF" },
-    { symbol: "XUDV", name: "Franklin U.S. Dividend Booster Index ETF" },
-    { symbol: "XUSP", name: "Innovator ETFs Trust Innovator Uncapped Accelerated U.S. Equity ETF" },
-    { symbol: "XV", name: "Simplify Exchange Traded Funds Simplify Target 15 Distribution ETF" },
-    { symbol: "XVOL", name: "Acruence Active Hedge U.S. Equity ETF" },
-    { symbol: "XVV", name: "iShares ESG Select Screened S&P 500 ETF" },
-    { symbol: "XXCH", name: "Direxion Shares ETF Trust Direxion Daily MSCI Emerging Markets ex China Bull 2X Shares" },
-    { symbol: "XXRP", name: "Listed Funds Trust Teucrium 2x Long Daily XRP ETF" },
-    { symbol: "XYF", name: "X Financial American Depositary Shares, each representing six Class A Ordinary Shares" },
-    { symbol: "XYL", name: "Xylem Inc. Common Stock New" },
-    { symbol: "XYLD", name: "Global X Funds Global X S&P 500 Covered Call ETF" },
-    { symbol: "XYLG", name: "Global X S&P 500 Covered Call & Growth ETF" },
-    { symbol: "XYZ", name: "Block, Inc. Class A Common Stock," },
-    { symbol: "XYZY", name: "Tidal Trust II YieldMax XYZ Option Income Strategy ETF" },
-    { symbol: "YALA", name: "Yalla Group Limited American Depositary Shares, each representing one Class A Ordinary Share" },
-    { symbol: "YALL", name: "God Bless America ETF" },
-    { symbol: "YANG", name: "Direxion Daily FTSE China Bear 3x Shares" },
-    { symbol: "YBIT", name: "Tidal Trust II YieldMax Bitcoin Option Income Strategy ETF" },
-    { symbol: "YBTC", name: "Roundhill ETF Trust Roundhill Bitcoin Covered Call Strategy ETF" },
-    { symbol: "YCBD", name: "cbdMD, Inc. Common Stock" },
-    { symbol: "YCL", name: "ProShares Ultra Yen" },
-    { symbol: "YCS", name: "ProShares UltraShort Yen New" },
-    { symbol: "YDEC", name: "FT Vest International Equity Moderate Buffer ETF - December" },
-    { symbol: "YEAR", name: "AB Active ETFs, Inc. AB Ultra Short Income ETF" },
-    { symbol: "YELP", name: "Yelp Inc. Common Stock" },
-    { symbol: "YETH", name: "Roundhill ETF Trust Roundhill Ether Covered Call Strategy ETF" },
-    { symbol: "YETI", name: "YETI Holdings, Inc. Common Stock" },
-    { symbol: "YEXT", name: "Yext, Inc. Common Stock" },
-    { symbol: "YFFI", name: "Spinnaker ETF Series Indexperts Yield Focused Fixed Income ETF" },
-    { symbol: "YFYA", name: "Yields for You Income Strategy A ETF" },
-    { symbol: "YGLD", name: "Simplify Exchange Traded Funds Simplify Gold Strategy PLUS Income ETF" },
-    { symbol: "YINN", name: "Direxion Daily FTSE China Bull 3x Shares" },
-    { symbol: "YJUN", name: "FT Vest International Equity Moderate Buffer ETF - June" },
-    { symbol: "YLD", name: "Principal Active High Yield ETF" },
-    { symbol: "YMAG", name: "Tidal Trust II YieldMax Magnificent 7 Fund of Option Income ETFs" },
-    { symbol: "YMAR", name: "FT Vest International Equity Moderate Buffer ETF - March" },
-    { symbol: "YMAX", name: "Tidal Trust II YieldMax Universe Fund of Option Income ETFs" },
-    { symbol: "YMM", name: "Full Truck Alliance Co. Ltd. American Depositary Shares (each representing 20 Class A Ordinary Shares)" },
-    { symbol: "YOLO", name: "AdvisorShares Pure Cannabis ETF" },
-    { symbol: "YOU", name: "Clear Secure, Inc. Class A Common Stock" },
-    { symbol: "YPF", name: "YPF Sociedad Anonima Common Stock" },
-    { symbol: "YRD", name: "Yiren Digital Ltd. American Depositary Shares, each representing two ordinary shares" },
-    { symbol: "YSEP", name: "FT Vest International Equity Buffer ETF - September" },
-    { symbol: "YSG", name: "Yatsen Holding Limited American Depositary Shares, each representing twenty (20) Class A Ordinary Shares" },
-    { symbol: "YUM", name: "Yum! Brands, Inc." },
-    { symbol: "YUMC", name: "Yum China Holdings, Inc. Common Stock" },
-    { symbol: "YXI", name: "ProShares Short FTSE China 50" },
-    { symbol: "YYY", name: "Amplify High Income ETF" },
-    { symbol: "ZALT", name: "Innovator ETFs Trust Innovator U.S. Equity 10 Buffer ETF - Quarterly" },
-    { symbol: "ZAPR", name: "Innovator ETFs Trust Innovator Equity Defined Protection ETF - 1 Yr April" },
-    { symbol: "ZAUG", name: "Innovator ETFs Trust Innovator Equity Defined Protection ETF - 1 Yr August" },
-    { symbol: "ZBH", name: "Zimmer Biomet Holdings, Inc. Common Stock" },
-    { symbol: "ZBZX", name: "BATS BZX Exchange test issue" },
-    { symbol: "ZDEK", name: "Innovator ETFs Trust Innovator Equity Defined Protection ETF - 1 Yr December" },
-    { symbol: "ZDGE", name: "Zedge, Inc. Class B Common Stock " },
-    { symbol: "ZECP", name: "Zacks Trust Zacks Earnings Consistent Portfolio ETF" },
-    { symbol: "ZEPP", name: "Zepp Health Corporation American depositary shares, each representing sixteen Class A ordinary shares" },
-    { symbol: "ZETA", name: "Zeta Global Holdings Corp. Class A Common Stock" },
-    { symbol: "ZEXIT", name: "IEX Test Company Test Symbol Two for IEX" },
-    { symbol: "ZFEB", name: "Innovator ETFs Trust Innovator Equity Defined Protection ETF - 1 Yr February" },
-    { symbol: "ZGN", name: "Ermenegildo Zegna N.V. Ordinary Shares" },
-    { symbol: "ZH", name: "Zhihu Inc. American Depositary Shares, each representing three (3) Class A Ordinary Shares" },
-    { symbol: "ZHDG", name: "ZEGA Buy and Hedge ETF" },
-    { symbol: "ZIEXT", name: "IEX Test Company Test Symbol One for IEX" },
-    { symbol: "ZIG", name: "The Acquirers Fund" },
-    { symbol: "ZIM", name: "ZIM Integrated Shipping Services Ltd. Ordinary Shares" },
-    { symbol: "ZIP", name: "ZipRecruiter, Inc. Class A Common Stock" },
-    { symbol: "ZJAN", name: "Innovator ETFs Trust Innovator Equity Defined Protection ETF - 1 Yr January" },
-    { symbol: "ZJUL", name: "SHL Telemedicine Ltd Innovator Equity Defined Protection ETF - 1 Yr July" },
-    { symbol: "ZJUN", name: "Innovator ETFs Trust Innovator Equity Defined Protection ETF - 1 Yr June" },
-    { symbol: "ZK", name: "ZEEKR Intelligent Technology Holding Limited American Depositary Shares (each representing ten (10) Ordinary Shares)" },
-    { symbol: "ZKH", name: "ZKH Group Limited American Depositary Shares, each representing thirty-five (35) Class A Ordinary Shares" },
-    { symbol: "ZMAR", name: "Innovator ETFs Trust Innovator Equity Defined Protection ETF - 1 Yr March" },
-    { symbol: "ZMAY", name: "Innovator ETFs Trust Innovator Equity Defined Protection ETF - 1 Yr May" },
-    { symbol: "ZNOV", name: "Innovator ETFs Trust Innovator Equity Defined Protection ETF - 1 Yr November" },
-    { symbol: "ZOCT", name: "Innovator Equity Defined Protection ETF - 1 Yr October" },
-    { symbol: "ZONE", name: "CleanCore Solutions Inc. Class B Common Stock" },
-    { symbol: "ZROZ", name: "PIMCO 25  Year Zero Coupon U.S. Treasury Index Exchange-Traded Fund" },
-    { symbol: "ZSB", name: "USCF ETF Trust USCF Sustainable Battery Metals Strategy Fund" },
-    { symbol: "ZSC", name: "USCF ETF Trust USCF Sustainable Commodity Strategy Fund" },
-    { symbol: "ZSEP", name: "Innovator Equity Defined Protection ETF - 1 Yr September" },
-    { symbol: "ZSL", name: "ProShares UltraShort Silver" },
-    { symbol: "ZTAX", name: "X-Square Municipal Income ETF" },
-    { symbol: "ZTEST", name: "BATS BZX Exchange Common Stock (test issue)" },
-    { symbol: "ZTO", name: "ZTO Express (Cayman) Inc. American Depositary Shares, each representing one Class A ordinary share." },
-    { symbol: "ZTR", name: "Virtus Total Return Fund Inc." },
-    { symbol: "ZTS", name: "Zoetis Inc. Class A Common Stock" },
-    { symbol: "ZVIA", name: "Zevia PBC Class A Common Stock" },
-    { symbol: "ZVOL", name: "Volatility Premium Plus ETF" },
-    { symbol: "ZVV", name: "NYSE ARCA test stock" },
-    { symbol: "ZWS", name: "Zurn Elkay Water Solutions Corporation Common Stock" },
-    { symbol: "ZXIET", name: "IEX Test Company Test Symbol Three for IEX" },
-];
@@ -0,0 +1,183 @@
+import sys
+import os
+import glob
+import time
+import numpy as np
+import pandas as pd
+import yfinance as yf
+from flask_app.model_serving.numpy_lstm import load_numpy_lstm_model
+from flask_app.model_serving.forecasting import ForecastEngine
+from flask_app.market_data.forecast_table import ForecastTable
+from stock_prediction.utils.main_utils import MainUtils
+from exception import MyException
+from logger import logging
+from stock_prediction.constants import *
+
+BEST_MODELS_DIR = "./flask_app/artifacts/models/best_models"
+QUANTIZED_MODELS_DIR = "./flask_app/artifacts/models/quantized"
+STOCK_SCALERS_DIR = "./flask_app/artifacts/scalers/stock_scalers"
+GENERAL_SCALER_PATH = "./flask_app/artifacts/scalers/general_stock_scalers/general_stock_scaler.pkl"
+TICKER_ICONS_DIR = "./flask_app/static/ticker_icons"
+FORECAST_TABLE_DIR = "./flask_app/artifacts/forecasts"
+
+
+def load_universe(tickers) -> list:
+    """Every symbol the site has an icon for, plus the per-ticker model symbols."""
+    icons = [os.path.splitext(name)[0].upper() for name in os.listdir(TICKER_ICONS_DIR) if name.endswith(".png")]
+    return sorted(set(icons) | set(tickers))
+
+
+def download_closes(symbols, period: str, chunk_size: int, max_retries: int = 2, backoff_seconds: float = 5.0) -> dict:
+    """
+    Downloads daily closes for `symbols` with one yf.download call per chunk.
+    Returns {symbol: (last bar date, closes)}; symbols without data are left out.
+    """
+    closes = {}
+    for start in range(0, len(symbols), chunk_size):
+        chunk = symbols[start:start + chunk_size]
+        for attempt in range(max_retries + 1):
+            try:
+                df = yf.download(chunk, period=period, interval="1d", group_by="ticker",
+                                 progress=False, threads=True)
+                break
+            except Exception as e:
+                if attempt == max_retries:
+                    logging.error(f"Giving up on chunk {chunk[0]}..{chunk[-1]}: {e}")
+                    df = None
+                    break
+                delay = backoff_seconds * (2 ** attempt)
+                logging.warning(f"Download of chunk {chunk[0]}..{chunk[-1]} failed ({e}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+        if df is None or df.empty:
+            continue
+        for symbol in chunk:
+            try:
+                series = (df[symbol] if isinstance(df.columns, pd.MultiIndex) else df)["Close"].dropna()
+            except KeyError:
+                continue
+            if not series.empty:
+                closes[symbol] = (series.index[-1], series.to_numpy(dtype=np.float64))
+        logging.info(f"Downloaded chunk {start // chunk_size + 1}: {len(closes)} symbol(s) with data so far")
+    return closes
+
+
+def served_model_path(model_name: str, precision: str) -> str:
+    """Same artifact the app serves for `model_name` under MODEL_PRECISION=`precision`."""
+    if precision == "float32":
+        return os.path.join(BEST_MODELS_DIR, f"best_model_{model_name}.h5")
+    return os.path.join(QUANTIZED_MODELS_DIR, f"best_model_{model_name}.{precision}.npz")
+
+
+def forecast_model_path(model_name: str, precision: str, forecast_days: int) -> str:
+    """
+    The multi-horizon model the app would pick for `forecast_days` (the shortest
+    trained horizon covering it, else the longest), or the next-day model.
+    """
+    prefix, suffix = served_model_path(f"{model_name}_h", precision).rsplit("_h", 1)
+    horizons = {}
+    for path in glob.glob(glob.escape(prefix) + "_h*" + suffix):
+        horizon = path[len(prefix) + 2:len(path) - len(suffix)]
+        if horizon.isdigit():
+            horizons[int(horizon)] = path
+    if not horizons:
+        return served_model_path(model_name, precision)
+    covering = [h for h in horizons if h >= forecast_days]
+    return horizons[min(covering) if covering else max(horizons)]
+
+
+def group_by_model(symbols, tickers, precision: str, forecast_days: int) -> dict:
+    """
+    {(next-day model path, forecast model path, scaler path): [symbols]}. Per-ticker
+    models serve their own symbol, everything else shares the general model.
+    Paths follow the app's choice for the same precision, so rows match what it serves.
+    """
+    groups = {}
+    for symbol in symbols:
+        if symbol in tickers:
+            model_name, scaler_path = symbol, os.path.join(STOCK_SCALERS_DIR, f"{symbol}_scaler.pkl")
+        else:
+            model_name, scaler_path = "general", GENERAL_SCALER_PATH
+        paths = (served_model_path(model_name, precision), forecast_model_path(model_name, precision, forecast_days))
+        groups.setdefault((*paths, scaler_path), []).append(symbol)
+    return groups
+
+
+def score_group(model, forecast_model, scaler, closes, forecast_days: int, batch_size: int):
+    """
+    Large-batch inference for symbols sharing a model: `closes` is (n, time_step).
+    Returns next-day prices, confidences and (n, forecast_days) forecast prices.
+    """
+    engine = ForecastEngine(time_step=closes.shape[1])
+    next_day = np.empty(len(closes))
+    forecasts = np.empty((len(closes), forecast_days))
+    for start in range(0, len(closes), batch_size):
+        batch = closes[start:start + batch_size]
+        scaled = scaler.transform(batch.reshape(-1, 1)).reshape(batch.shape)
+        pred_scaled = np.asarray(model.predict_on_batch(scaled[:, :, None]), dtype=np.float64).reshape(-1, 1)
+        next_day[start:start + len(batch)] = scaler.inverse_transform(pred_scaled).reshape(-1)
+        forecasts[start:start + len(batch)] = engine.forecast(forecast_model, scaler, batch, steps=forecast_days)
+    # Same confidence as the app: inverse of the recent price spread relative to the prediction
+    with np.errstate(divide="ignore", invalid="ignore"):
+        confidence = np.clip(100 - closes.std(axis=1) / next_day * 100, 0, 100)
+    return next_day, confidence, forecasts
+
+
+def run_batch_forecast(params) -> int:
+    """Scores the whole universe and writes the forecast table. Returns the number of symbols written."""
+    try:
+        tickers = params['data_ingestion']['tickers']
+        time_step = params['lstm_model'].get('time_step', 60)
+        job_params = params.get('batch_forecast', {})
+        forecast_days = job_params.get('forecast_days', 60)
+        # Score the variant the app serves; the app only uses rows scored with its own model files
+        precision = os.getenv('MODEL_PRECISION', job_params.get('precision', 'float32'))
+
+        universe = load_universe(tickers)
+        logging.info(f"Batch forecast over {len(universe)} symbol(s)")
+        closes = download_closes(universe, job_params.get('history_period', '6mo'), job_params.get('chunk_size', 200),
+                                 job_params.get('max_retries', 2), job_params.get('backoff_seconds', 5.0))
+
+        scorable = [symbol for symbol in universe if symbol in closes and len(closes[symbol][1]) >= time_step]
+        groups = group_by_model(scorable, tickers, precision, forecast_days)
+        symbols, as_of, next_day, confidence, forecasts, model_paths = [], [], [], [], [], []
+        for (model_path, forecast_path, scaler_path), group in groups.items():
+            if not os.path.exists(model_path) or not os.path.exists(scaler_path):
+                logging.warning(f"Skipping {len(group)} symbol(s): {model_path} or {scaler_path} not found.")
+                continue
+            model = load_numpy_lstm_model(model_path)
+            forecast_model = model if forecast_path == model_path else load_numpy_lstm_model(forecast_path)
+            scaler = MainUtils.load_object(scaler_path)
+            windows = np.stack([closes[symbol][1][-time_step:] for symbol in group])
+
+            start = time.perf_counter()
+            group_next_day, group_confidence, group_forecasts = score_group(
+                model, forecast_model, scaler, windows, forecast_days, job_params.get('batch_size', 512))
+            logging.info(f"Scored {len(group)} symbol(s) with {os.path.basename(forecast_path)} "
+                         f"in {time.perf_counter() - start:.2f}s")
+
+            symbols.extend(group)
+            model_paths.extend([(model_path, forecast_path)] * len(group))
+            as_of.extend(pd.Timestamp(closes[symbol][0]).date() for symbol in group)
+            next_day.append(group_next_day)
+            confidence.append(group_confidence)
+            forecasts.append(group_forecasts)
+
+        if not symbols:
+            raise RuntimeError("No symbol could be scored; the forecast table was not written.")
+        ForecastTable.write(FORECAST_TABLE_DIR, symbols, as_of, np.concatenate(next_day),
+                            np.concatenate(confidence), np.concatenate(forecasts), model_paths=model_paths,
+                            time_step=time_step, precision=precision)
+        logging.info(f"Forecast table written to {FORECAST_TABLE_DIR}: {len(symbols)}/{len(universe)} symbol(s)")
+        return len(symbols)
+
+    except Exception as e:
+        logging.error(f"Batch forecast failed: {e}")
+        raise MyException(e, sys)
+
+
+def main():
+    params = MainUtils.load_params(PARAMS_FILE_PATH)
+    run_batch_forecast(params)
+
+if __name__ == "__main__":
+    main()
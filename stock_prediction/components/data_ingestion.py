@@ -2,6 +2,8 @@
 import pandas as pd
 pd.set_option('future.no_silent_downcasting', True)
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from logger import logging
 from exception import MyException
 import sys
@@ -10,25 +12,74 @@ from stock_prediction.utils.main_utils import MainUtils
 from stock_prediction.constants import *
 
 
-def fetch_stock_data(ticker: str, start_date=DEFAULT_START_DATE, end_date=DEFAULT_END_DATE) -> pd.DataFrame:
-    """Fetch stock data from Yahoo Finance."""
+def fetch_stock_data(ticker: str, start_date=DEFAULT_START_DATE, end_date=DEFAULT_END_DATE, interval: str = "1d",
+                     max_retries: int = 4, backoff_seconds: float = 1.0) -> pd.DataFrame:
+    """
+    Fetch stock data from Yahoo Finance, retrying with exponential backoff
+    (backoff_seconds, 2x, 4x, ...) when the download fails or comes back empty.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            df = yf.download(ticker, start=start_date, end=end_date, interval=interval, progress=False)
+            if df.empty:
+                raise ValueError(f"No rows returned for {ticker} from {start_date}")
+            df.reset_index(inplace=True)
+
+            # Flatten multi-level columns
+            #Your DataFrame has multi-level (hierarchical) column names. That’s why you’re seeing things like:
+            #(Date, ) , (Close, GOOG), (High, GOOG) ...
+            df.columns = [col[0] if col[1] == '' else f"{col[0]}" for col in df.columns.values]
+            # Intraday intervals index by Datetime instead of Date
+            df.rename(columns={"Datetime": "Date"}, inplace=True)
+
+            logging.info(f'Data fetched for {ticker} with {len(df)} rows')
+            return df
+        except Exception as e:
+            if attempt == max_retries:
+                logging.error(f'Failed to fetch data for {ticker} after {attempt + 1} attempts: {e}')
+                raise MyException(e, sys)
+            delay = backoff_seconds * (2 ** attempt)
+            logging.warning(f'Fetch for {ticker} failed ({e}); retrying in {delay:.1f}s')
+            time.sleep(delay)
+
+
+def load_raw_data(data_path: str, filename: str) -> pd.DataFrame:
+    """Load previously saved train + test rows for `filename`, or None if nothing is stored yet."""
+    train_file = os.path.join(data_path, 'train', f"{filename}_train.csv")
+    test_file = os.path.join(data_path, 'test', f"{filename}_test.csv")
+    if not os.path.exists(train_file) or not os.path.exists(test_file):
+        return None
+    df = pd.concat([pd.read_csv(train_file), pd.read_csv(test_file)], axis=0, ignore_index=True)
+    df['Date'] = pd.to_datetime(df['Date'])
+    return df
+
+
+def update_ticker(ticker: str, interval: str, max_retries: int, backoff_seconds: float):
+    """
+    Bring one ticker's raw data up to date. Only bars from the last stored date onwards
+    are downloaded; the last stored bar is re-fetched since it may have been partial.
+    Returns (all rows, newly fetched rows), both with a Ticker column.
+    """
+    existing = load_raw_data('./data/raw/stock_data', ticker)
+    start_date = DEFAULT_START_DATE if existing is None else existing['Date'].max().strftime('%Y-%m-%d')
     try:
-        df = yf.download(ticker, start=start_date, end=end_date)
-        df.reset_index(inplace=True)
+        # end_date=None: keep extending the history up to the latest available bar
+        new_rows = fetch_stock_data(ticker, start_date=start_date, end_date=None, interval=interval,
+                                    max_retries=max_retries, backoff_seconds=backoff_seconds)
+    except MyException:
+        if existing is None:
+            raise
+        logging.warning(f'Keeping stored data for {ticker}; no new rows could be fetched.')
+        return existing, existing.iloc[0:0]
+
+    new_rows['Date'] = pd.to_datetime(new_rows['Date'])
+    new_rows['Ticker'] = ticker  # add Ticker as a proper column
+    frames = [new_rows] if existing is None else [existing, new_rows]
+    merged = pd.concat(frames, axis=0, ignore_index=True)
+    merged = merged.drop_duplicates(subset=['Date'], keep='last').sort_values(by='Date').reset_index(drop=True)
+    logging.info(f'{ticker}: {len(new_rows)} row(s) fetched since {start_date}, {len(merged)} total')
+    return merged, new_rows
 
-        # Flatten multi-level columns
-        #Your DataFrame has multi-level (hierarchical) column names. That’s why you’re seeing things like:
-        #(Date, ) , (Close, GOOG), (High, GOOG) ...
-        df.columns = [col[0] if col[1] == '' else f"{col[0]}" for col in df.columns.values]
-
-        logging.info(f'Data fetched for {ticker} with {len(df)} rows')
-
-        #Some Preprocessing
-        return df
-    except Exception as e:
-        logging.error(f'Failed to fetch data for {ticker}: {e}')
-        raise MyException(e, sys)
-    
 
 def save_data(train_data: pd.DataFrame, test_data: pd.DataFrame, data_path: str, filename: str) -> None:
     """Save train and test data in separate folders."""
@@ -51,16 +102,24 @@ def main():
     try:
         # Load parameters
         params = MainUtils.load_params(PARAMS_FILE_PATH)
-        test_size = params['data_ingestion']['test_size']
-        TOP_10_STOCKS = params['data_ingestion']['tickers']
-
-        all_stocks_data = []
-
-        # Fetch data for top 10 stocks individually
+        ingestion_params = params['data_ingestion']
+        test_size = ingestion_params['test_size']
+        TOP_10_STOCKS = ingestion_params['tickers']
+        interval = ingestion_params.get('interval', '1d')
+        max_workers = ingestion_params.get('max_workers', 4)
+        max_retries = ingestion_params.get('max_retries', 4)
+        backoff_seconds = ingestion_params.get('backoff_seconds', 1.0)
+
+        # Fetch only new bars for every ticker, a bounded number at a time
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = dict(zip(TOP_10_STOCKS, executor.map(
+                lambda ticker: update_ticker(ticker, interval, max_retries, backoff_seconds), TOP_10_STOCKS
+            )))
+
+        new_stock_rows = []
         for ticker in TOP_10_STOCKS:
-            df = fetch_stock_data(ticker)
-            df['Ticker'] = ticker  # add Ticker as a proper column
-            all_stocks_data.append(df)
+            df, new_rows = results[ticker]
+            new_stock_rows.append(new_rows)
 
             # Split and save individual stock data
             split_idx = int(len(df) * (1 - test_size))
@@ -68,8 +127,14 @@ def main():
 
             save_data(train_data, test_data, data_path='./data/raw/stock_data', filename=ticker)
 
-        # Create generalized dataset for all stocks
-        general_df = pd.concat(all_stocks_data, axis=0)
+        # Update the generalized dataset by merging the new rows into what is already stored
+        existing_general = load_raw_data('./data/raw/general_stock_data', 'all_stocks')
+        if existing_general is None:
+            general_frames = [results[ticker][0] for ticker in TOP_10_STOCKS]
+        else:
+            general_frames = [existing_general[existing_general['Ticker'].isin(TOP_10_STOCKS)]] + new_stock_rows
+        general_df = pd.concat(general_frames, axis=0, ignore_index=True)
+        general_df = general_df.drop_duplicates(subset=['Date', 'Ticker'], keep='last')
         general_df = general_df.sort_values(by=["Date", "Ticker"]).reset_index(drop=True)
 
         # Split and save generalized dataset
@@ -1,24 +1,23 @@
 import sys
 import os
 import pandas as pd
-import numpy as np
 from sklearn.preprocessing import MinMaxScaler
 
 from stock_prediction.constants import *
 from exception import MyException
 from logger import logging
 from stock_prediction.utils.main_utils import MainUtils
+from stock_prediction.utils.windowing import make_sequences
 
 
-def preprocess_stock_data(train_file_path: str, test_file_path: str, scaler_path: str):
+def scale_stock_data(train_file_path: str, test_file_path: str, scaler_path: str, refit: bool = True):
     """
-    Preprocess stock data for training/evaluation:
-    - Keeps only numeric features: ['Open','High','Low','Close','Volume']
-    - Scales both features and target (Close) with MinMaxScaler
-    - Saves the fitted scaler
-    - Returns X (scaled features), y (scaled target) for train and test
+    Loads the raw train/test CSVs, fits a MinMaxScaler on the training Close prices,
+    saves it and returns the scaled (timesteps, 1) train/test series with the scaler.
+    With refit=False an existing scaler at `scaler_path` is reused as is, so models
+    trained with it stay valid.
     """
-    logging.info("Entered preprocess_stock_data method")
+    logging.info("Entered scale_stock_data method")
     try:
         # Load data
         train_data = pd.read_csv(train_file_path)
@@ -29,6 +28,11 @@ def preprocess_stock_data(train_file_path: str, test_file_path: str, scaler_path
         train_close_prices = train_data[["Close"]]
         test_close_prices = test_data[["Close"]]
 
+        if not refit and os.path.exists(scaler_path):
+            scaler = MainUtils.load_object(scaler_path)
+            logging.info(f"Reusing scaler: {scaler_path}")
+            return scaler.transform(train_close_prices), scaler.transform(test_close_prices), scaler
+
         # Fit scaler on training set only
         scaler = MinMaxScaler(feature_range=(0,1))
         train_close_prices_scaled = scaler.fit_transform(train_close_prices)
@@ -39,8 +43,27 @@ def preprocess_stock_data(train_file_path: str, test_file_path: str, scaler_path
         MainUtils.save_object(scaler_path, scaler)
         logging.info(f"Scaler saved: {scaler_path}")
 
-        X_train, y_train = create_sequences(train_close_prices_scaled)
-        X_test, y_test = create_sequences(test_close_prices_scaled)
+        return train_close_prices_scaled, test_close_prices_scaled, scaler
+
+    except Exception as e:
+        raise MyException(e, sys)
+
+
+def preprocess_stock_data(train_file_path: str, test_file_path: str, scaler_path: str, horizon: int = 1):
+    """
+    Preprocess stock data for training/evaluation:
+    - Keeps only numeric features: ['Open','High','Low','Close','Volume']
+    - Scales both features and target (Close) with MinMaxScaler
+    - Saves the fitted scaler
+    - Returns X (scaled features), y (scaled target) for train and test;
+      y holds the next `horizon` Close values per window when horizon > 1
+    """
+    logging.info("Entered preprocess_stock_data method")
+    try:
+        train_scaled, test_scaled, scaler = scale_stock_data(train_file_path, test_file_path, scaler_path)
+
+        X_train, y_train = create_sequences(train_scaled, horizon=horizon)
+        X_test, y_test = create_sequences(test_scaled, horizon=horizon)
 
         return X_train, y_train, X_test, y_test, scaler
 
@@ -49,19 +72,13 @@ def preprocess_stock_data(train_file_path: str, test_file_path: str, scaler_path
     
 
 # 4. Create training sequences
-def create_sequences(dataset, seq_length=60):
-    X, y = [], []
-    for i in range(seq_length, len(dataset)):
-        X.append(dataset[i-seq_length:i, 0])  # shape: (seq_length,)
-        y.append(dataset[i, 0])
-    
-    X = np.array(X)
-    y = np.array(y)
-
-    # Reshape X to 3D for LSTM: (samples, timesteps, features)
-    X = X.reshape((X.shape[0], X.shape[1], 1))  # 1 feature
-
-    return X, y
+def create_sequences(dataset, seq_length=60, horizon=1):
+    """
+    Windows a (timesteps, 1) scaled series into X: (samples, seq_length, 1) and
+    y: (samples,), or y: (samples, horizon) multi-step targets when horizon > 1.
+    Both are strided views of `dataset`, so no per-window copies are made.
+    """
+    return make_sequences(dataset[:, :1], dataset[:, 0], seq_length=seq_length, horizon=horizon)
 
 
 
@@ -69,6 +86,8 @@ def create_sequences(dataset, seq_length=60):
 def main():
     try:
         params = MainUtils.load_params(PARAMS_FILE_PATH)
+        # Incremental training fine-tunes the current models, which must keep the scalers they were trained with
+        refit = params.get("training", {}).get("mode", "full") != "incremental"
 
         # === Top 10 stocks ===
         TOP_10_STOCKS = params["data_ingestion"]["tickers"]
@@ -84,12 +103,13 @@ def main():
             test_file = f"./data/raw/stock_data/test/{ticker}_test.csv"
             scaler_file = os.path.join(scaler_path, f"{ticker}_scaler.pkl")
 
-            X_train, y_train, X_test, y_test, scaler = preprocess_stock_data(
-                train_file, test_file, scaler_file
-            )
+            train_scaled, test_scaled, scaler = scale_stock_data(train_file, test_file, scaler_file, refit)
 
-            MainUtils.save_object(os.path.join(train_processed_data_path, f"{ticker}_train_processed.pkl"), (X_train, y_train))
-            MainUtils.save_object(os.path.join(test_processed_data_path, f"{ticker}_test_processed.pkl"), (X_test, y_test))
+            # Only the 1-D scaled series is stored; training and evaluation window it on the fly
+            MainUtils.save_array(os.path.join(train_processed_data_path, f"{ticker}_train_series.npy"), train_scaled.reshape(-1),
+                                 ticker=ticker, split="train", scaler=scaler_file)
+            MainUtils.save_array(os.path.join(test_processed_data_path, f"{ticker}_test_series.npy"), test_scaled.reshape(-1),
+                                 ticker=ticker, split="test", scaler=scaler_file)
             logging.info(f"Processed data saved for {ticker}")
 
         # === General dataset ===
@@ -104,12 +124,12 @@ def main():
         general_test = "./data/raw/general_stock_data/test/all_stocks_test.csv"
         general_scaler_file = os.path.join(general_scaler_path, "general_stock_scaler.pkl")
 
-        X_train, y_train, X_test, y_test, scaler = preprocess_stock_data(
-            general_train, general_test, general_scaler_file
-        )
+        train_scaled, test_scaled, scaler = scale_stock_data(general_train, general_test, general_scaler_file, refit)
 
-        MainUtils.save_object(os.path.join(train_general_processed_path, "general_train_processed.pkl"), (X_train, y_train))
-        MainUtils.save_object(os.path.join(test_general_processed_path, "general_test_processed.pkl"), (X_test, y_test))
+        MainUtils.save_array(os.path.join(train_general_processed_path, "general_train_series.npy"), train_scaled.reshape(-1),
+                             ticker="general", split="train", scaler=general_scaler_file)
+        MainUtils.save_array(os.path.join(test_general_processed_path, "general_test_series.npy"), test_scaled.reshape(-1),
+                             ticker="general", split="test", scaler=general_scaler_file)
         logging.info("Processed general stock data saved")
 
     except Exception as e:
@@ -0,0 +1,193 @@
+import sys
+import os
+import math
+import time
+import random
+import shutil
+import itertools
+import tempfile
+import numpy as np
+from tensorflow.keras.models import load_model
+from stock_prediction.components.model_trainer import (build_lstm_model, training_candidates, TUNABLE_PARAMS,
+                                                       TUNED_HYPERPARAMETERS_PATH)
+from stock_prediction.utils.main_utils import MainUtils
+from stock_prediction.utils.streaming import window_dataset
+from stock_prediction.utils.training_scheduler import run_training_jobs
+from exception import MyException
+from logger import logging
+from stock_prediction.constants import *
+
+SEARCH_REPORT_PATH = "./flask_app/artifacts/hyperparameter_search/search_report.json"
+
+
+def sample_configs(search_space: dict, n_configs: int, seed: int) -> list:
+    """Up to `n_configs` distinct configurations drawn from the grid spanned by `search_space`."""
+    names = sorted(search_space)
+    grid = [dict(zip(names, values)) for values in itertools.product(*(search_space[name] for name in names))]
+    return random.Random(seed).sample(grid, min(n_configs, len(grid)))
+
+
+def rung_budgets(min_epochs: int, max_epochs: int, eta: int) -> list:
+    """Cumulative epochs per rung: min_epochs, min_epochs * eta, ... capped at max_epochs."""
+    budgets = [min_epochs]
+    while budgets[-1] < max_epochs:
+        budgets.append(min(budgets[-1] * eta, max_epochs))
+    return budgets
+
+
+def run_trial(train_data_path: str, test_data_path: str, params, config: dict,
+              initial_epoch: int, epochs: int, checkpoint_path: str) -> dict:
+    """
+    Process-pool entry point: trains one configuration from `initial_epoch` up to `epochs`,
+    resuming from its checkpoint when it survived an earlier rung, and saves it again.
+    Returns its best val_loss, the epoch it was reached at and the CPU seconds spent.
+    A failing trial scores inf instead of aborting the search.
+    """
+    cpu_start = time.process_time()
+    try:
+        seq_length = params['lstm_model'].get('time_step', 60)
+        train_ds = window_dataset(
+            MainUtils.load_array(train_data_path), seq_length=seq_length, batch_size=config['batch_size'],
+            shuffle_buffer=params['lstm_model'].get('shuffle_buffer', 10000)
+        )
+        val_ds = window_dataset(MainUtils.load_array(test_data_path), seq_length=seq_length,
+                                batch_size=config['batch_size'])
+
+        if os.path.exists(checkpoint_path):
+            model = load_model(checkpoint_path)
+        else:
+            model = build_lstm_model(
+                input_shape=(seq_length, 1),
+                units=config['units'],
+                dropout=config['dropout'],
+                activation=params['lstm_model']['activation'],
+                optimizer=params['lstm_model']['optimizer'],
+                loss=params['lstm_model']['loss']
+            )
+        history = model.fit(train_ds, validation_data=val_ds, initial_epoch=initial_epoch, epochs=epochs, verbose=0)
+        model.save(checkpoint_path)
+
+        losses = history.history['val_loss']
+        best = int(np.nanargmin(losses))
+        return {"val_loss": float(losses[best]), "best_epoch": initial_epoch + best + 1,
+                "cpu_seconds": time.process_time() - cpu_start}
+    except Exception as e:
+        logging.error(f"Trial {config} failed at epochs {initial_epoch}-{epochs}: {e}")
+        return {"val_loss": float("inf"), "best_epoch": initial_epoch,
+                "cpu_seconds": time.process_time() - cpu_start, "error": str(e)}
+
+
+def successive_halving(candidates, params) -> dict:
+    """
+    Searches the lstm_model hyperparameters of every candidate model at once.
+
+    Each model starts with `n_configs` sampled configurations trained for `min_epochs`.
+    After every rung only the best 1/eta of each model's trials survive and continue
+    from their checkpoint up to eta times the epochs, so most of the budget goes to
+    the promising configurations and poor ones are dropped after a few epochs.
+    All trials of a rung, across models, run in one process pool.
+    Returns {model_name: {"best": winning config, "trials": [...], "cpu_seconds": ...}}.
+    """
+    search = params['hyperparameter_search']
+    training_params = params.get('training', {})
+    eta = search.get('eta', 3)
+    budgets = rung_budgets(search.get('min_epochs', 2), search.get('max_epochs', params['lstm_model']['epochs']), eta)
+    configs = sample_configs(search['search_space'], search.get('n_configs', 12), search.get('seed', 42))
+
+    checkpoint_dir = tempfile.mkdtemp(prefix="hyperparameter_search_")
+    trials = {
+        model_name: [{"id": i, "config": config, "val_loss": float("inf"), "best_epoch": 0, "epochs": 0,
+                      "cpu_seconds": 0.0, "rungs": 0,
+                      "checkpoint": os.path.join(checkpoint_dir, f"{model_name}_{i:02d}.keras")}
+                     for i, config in enumerate(configs)]
+        for model_name, _, _ in candidates
+    }
+    paths = {model_name: (train_path, test_path) for model_name, train_path, test_path in candidates}
+    alive = {model_name: list(model_trials) for model_name, model_trials in trials.items()}
+    try:
+        for rung, epochs in enumerate(budgets):
+            jobs = []
+            for model_name, model_trials in alive.items():
+                for trial in model_trials:
+                    # Larger networks and more remaining epochs first, so the pool drains evenly
+                    size = trial["config"]['units'] * (epochs - trial["epochs"]) / trial["config"]['batch_size']
+                    jobs.append((f"{model_name}/trial{trial['id']:02d}", size,
+                                 (*paths[model_name], params, trial["config"], trial["epochs"], epochs,
+                                  trial["checkpoint"])))
+            logging.info(f"Rung {rung}: {len(jobs)} trial(s) up to {epochs} epoch(s)")
+
+            results = run_training_jobs(
+                jobs,
+                run_trial,
+                max_workers=search.get('max_workers', 0),
+                intra_op_threads=training_params.get('intra_op_threads', 2),
+                inter_op_threads=training_params.get('inter_op_threads', 1),
+            )
+            for model_name, model_trials in alive.items():
+                for trial in model_trials:
+                    result = results[f"{model_name}/trial{trial['id']:02d}"]
+                    trial["cpu_seconds"] += result["cpu_seconds"]
+                    trial["epochs"], trial["rungs"] = epochs, rung + 1
+                    if result["val_loss"] < trial["val_loss"]:
+                        trial["val_loss"], trial["best_epoch"] = result["val_loss"], result["best_epoch"]
+
+                if rung < len(budgets) - 1:
+                    keep = max(1, math.ceil(len(model_trials) / eta))
+                    alive[model_name] = sorted(model_trials, key=lambda trial: trial["val_loss"])[:keep]
+                    logging.info(f"{model_name}: kept {keep}/{len(model_trials)} trial(s), best val_loss "
+                                 f"{alive[model_name][0]['val_loss']:.6f}")
+    finally:
+        shutil.rmtree(checkpoint_dir, ignore_errors=True)
+
+    report = {}
+    for model_name, model_trials in trials.items():
+        winner = min(model_trials, key=lambda trial: trial["val_loss"])
+        if not math.isfinite(winner["val_loss"]):
+            logging.warning(f"Every trial failed for {model_name}; no tuned config written.")
+            continue
+        best = {**winner["config"], "epochs": winner["best_epoch"], "val_loss": winner["val_loss"]}
+        report[model_name] = {
+            "best": best,
+            "cpu_seconds": sum(trial["cpu_seconds"] for trial in model_trials),
+            "trials": [{key: value for key, value in trial.items() if key != "checkpoint"} for trial in model_trials],
+        }
+    return report
+
+
+def main():
+    try:
+        params = MainUtils.load_params(PARAMS_FILE_PATH)
+        search = params['hyperparameter_search']
+        # epochs is not sampled: it is the budget successive halving hands out
+        searchable = set(TUNABLE_PARAMS) - {"epochs"}
+        unknown = set(search['search_space']) - searchable
+        if unknown:
+            raise ValueError(f"Only {sorted(searchable)} can be searched, got {sorted(unknown)}")
+
+        candidates = []
+        for model_name, train_path, test_path in training_candidates(params['data_ingestion']['tickers']):
+            if not os.path.exists(train_path):
+                logging.warning(f"Skipping {model_name}. Processed training data not found.")
+                continue
+            candidates.append((model_name, train_path, test_path))
+
+        start = time.perf_counter()
+        report = successive_halving(candidates, params)
+        wall_seconds = time.perf_counter() - start
+
+        MainUtils.save_json(TUNED_HYPERPARAMETERS_PATH, {model_name: entry["best"] for model_name, entry in report.items()})
+        MainUtils.save_json(SEARCH_REPORT_PATH, {
+            "wall_seconds": wall_seconds,
+            "cpu_hours": sum(entry["cpu_seconds"] for entry in report.values()) / 3600,
+            "models": report,
+        })
+        for model_name, entry in report.items():
+            logging.info(f"Best config for {model_name}: {entry['best']} ({entry['cpu_seconds'] / 60:.1f} CPU-min)")
+        logging.info(f"Hyperparameter search finished in {wall_seconds:.0f}s; winners saved at {TUNED_HYPERPARAMETERS_PATH}")
+
+    except Exception as e:
+        logging.error(f"Hyperparameter search failed: {e}")
+        raise MyException(e, sys)
+
+if __name__ == "__main__":
+    main()
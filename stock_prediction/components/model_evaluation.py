@@ -1,38 +1,216 @@
 import sys
 import os
+import time
 import numpy as np
-import pandas as pd
-import yfinance as yf
-import matplotlib.pyplot as plt
-from sklearn.preprocessing import MinMaxScaler
-from tensorflow.keras.models import load_model
 from stock_prediction.utils.main_utils import MainUtils
+from stock_prediction.utils.windowing import make_sequences
+from stock_prediction.components.model_export import BEST_MODELS_DIR, QUANTIZED_MODELS_DIR, variant_path
+from flask_app.model_serving.numpy_lstm import load_numpy_lstm_model
 from exception import MyException
 from logger import logging
 from stock_prediction.constants import *
 
+METRICS_PATH = "./flask_app/artifacts/model_eval/metrics.json"
+GENERAL_SCALER_PATH = "./flask_app/artifacts/scalers/general_stock_scalers/general_stock_scaler.pkl"
+
 def reshape_for_lstm(data, sequence_length):
     """
     Convert processed stock data into sequences for LSTM.
-    Last column is assumed to be the target.
+    Last column is assumed to be the target. Returns strided views, not copies.
+    """
+    return make_sequences(data[:, :-1], data[:, -1], seq_length=sequence_length)
+
+def median_latency_ms(predict, X, repeat=20):
+    """Median wall time of `predict(X)` in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        predict(X)
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings) * 1e3)
+
+def compare_precision_variants(model_name, X_test, y_test, precisions, accuracy_budget, repeat=20, batch_size=256):
+    """
+    Runs the float32 best model and its exported reduced-precision variants on the same
+    test windows with the NumPy serving backend, `batch_size` windows per forward pass.
+
+    Per variant it reports the test RMSE (scaled units), its increase over float32, the
+    largest prediction difference to float32, the median batch-1 latency, the resident
+    weight memory and the file size. `recommended` is the variant with the least
+    memory whose RMSE stays within `accuracy_budget` (relative increase) of float32.
     """
-    X, y = [], []
-    for i in range(len(data) - sequence_length):
-        X.append(data[i:i + sequence_length, :-1])
-        y.append(data[i + sequence_length, -1])
-    return np.array(X), np.array(y)
+    try:
+        paths = {"float32": os.path.join(BEST_MODELS_DIR, f"best_model_{model_name}.h5")}
+        paths.update({p: variant_path(QUANTIZED_MODELS_DIR, model_name, p) for p in precisions})
+
+        y_test = np.asarray(y_test, dtype=np.float32).reshape(-1)
+        variants, baseline = {}, None
+        for precision, path in paths.items():
+            if not os.path.exists(path):
+                logging.warning(f"Skipping {precision} variant of {model_name}: {path} not found.")
+                continue
+            model = load_numpy_lstm_model(path)
+            predictions = batched_predict(model, X_test, batch_size)
+            if baseline is None:
+                baseline = predictions
+            variants[precision] = {
+                "rmse": float(np.sqrt(np.mean((predictions - y_test) ** 2))),
+                "max_abs_diff_vs_float32": float(np.abs(predictions - baseline).max()),
+                "latency_ms": median_latency_ms(model.predict, X_test[:1], repeat),
+                "memory_bytes": int(model.nbytes),
+                "file_bytes": os.path.getsize(path),
+            }
+
+        report = {"variants": variants, "accuracy_budget": accuracy_budget, "recommended": None}
+        if "float32" in variants:
+            budget_rmse = variants["float32"]["rmse"] * (1 + accuracy_budget)
+            for stats in variants.values():
+                stats["rmse_increase"] = stats["rmse"] / variants["float32"]["rmse"] - 1
+            within_budget = [p for p, stats in variants.items() if stats["rmse"] <= budget_rmse]
+            report["recommended"] = min(within_budget, key=lambda p: variants[p]["memory_bytes"])
+        return report
+
+    except Exception as e:
+        raise MyException(e, sys)
+
+def walk_forward_windows(train_series, test_series, sequence_length):
+    """
+    One-step walk-forward samples covering every test point: the last `sequence_length`
+    train values are prepended as context, so the first test value is predicted too.
+    Returns X (n, sequence_length, 1), y (n,) and the value preceding each target (n,),
+    all views of one concatenated series.
+    """
+    series = np.concatenate([np.asarray(train_series).reshape(-1)[-sequence_length:], np.asarray(test_series).reshape(-1)])
+    X, y = make_sequences(series, seq_length=sequence_length)
+    return X, y, series[sequence_length - 1:-1]
+
+def batched_predict(model, X, batch_size=256):
+    """Runs `model` over X in batches of `batch_size` windows and returns the flat predictions."""
+    return np.concatenate([
+        np.asarray(model.predict_on_batch(X[start:start + batch_size]), dtype=np.float64).reshape(-1)
+        for start in range(0, len(X), batch_size)
+    ]) if len(X) else np.empty(0)
+
+def compute_metrics(model_ids, y_true, y_pred, y_prev, model_names):
+    """
+    RMSE, MAPE (%) and directional accuracy (%) per model in one vectorized pass over the
+    concatenated walk-forward predictions of all models; `model_ids` maps every sample
+    to its index in `model_names`. Directional accuracy counts samples whose predicted
+    move from the previous close has the sign of the actual move.
+    Also returns MAPE and directional accuracy pooled over every sample under "overall";
+    RMSE is not pooled, since it is in each series' own price scale.
+    """
+    n_models = len(model_names)
+    errors = y_pred - y_true
+    nonzero = y_true != 0
+    ape = np.where(nonzero, np.abs(errors) / np.where(nonzero, np.abs(y_true), 1), 0.0)
+    hits = (np.sign(y_pred - y_prev) == np.sign(y_true - y_prev)).astype(np.float64)
+
+    def totals(ids, length):
+        return (np.bincount(ids, minlength=length),
+                np.bincount(ids, weights=errors ** 2, minlength=length),
+                np.bincount(ids, weights=ape, minlength=length),
+                np.bincount(ids, weights=nonzero.astype(np.float64), minlength=length),
+                np.bincount(ids, weights=hits, minlength=length))
+
+    def as_dicts(names, count, squared, ape_sum, ape_count, hit_sum):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rmse = np.sqrt(squared / count)
+            mape = ape_sum / ape_count * 100
+            directional = hit_sum / count * 100
+        return {name: {"samples": int(count[i]), "rmse": float(rmse[i]), "mape": float(mape[i]),
+                       "directional_accuracy": float(directional[i])}
+                for i, name in enumerate(names) if count[i]}
+
+    metrics = as_dicts(model_names, *totals(model_ids, n_models))
+    overall = as_dicts(["overall"], *totals(np.zeros_like(model_ids), 1))
+    for values in overall.values():
+        del values["rmse"]
+    metrics.update(overall)
+    return metrics
+
+def rescale(series, from_scaler, to_scaler):
+    """`series` scaled with `from_scaler`, mapped through price units onto `to_scaler`'s scale."""
+    prices = from_scaler.inverse_transform(np.asarray(series, dtype=np.float64).reshape(-1, 1))
+    return to_scaler.transform(prices).reshape(-1)
+
+def evaluate_models(candidates, sequence_length, batch_size=256):
+    """
+    Walk-forward evaluation of the float32 best models with the NumPy serving backend.
+
+    Every candidate is scored on one ticker's own series, so the previous close used for
+    directional accuracy always belongs to the same stock. The general model is scored
+    once per ticker: its series are moved from the ticker's scaler to the general one,
+    as the app does with raw prices.
+
+    :param candidates: iterable of (label, model_name, model_path, train_series_path,
+                       test_series_path, model_scaler_path). `model_scaler_path` is None
+                       when the model was trained on the series' own scaler.
+    :return: (metrics per label, per-label samples) where samples holds the model name, the
+             scaled X/y used for the precision comparison and the price-unit y_true/y_pred
+             used for plotting.
+    """
+    labels, samples, parts, models = [], {}, [], {}
+    for label, model_name, model_path, train_path, test_path, model_scaler_path in candidates:
+        if not os.path.exists(model_path) or not os.path.exists(test_path):
+            logging.warning(f"Skipping {label}. Model or test data not found.")
+            continue
+        if model_path not in models:
+            models[model_path] = load_numpy_lstm_model(model_path)
+        model = models[model_path]
+        test_series = MainUtils.load_array(test_path)
+        if test_series.ndim != 1 or model.input_size != 1:
+            logging.error(f"Data shape mismatch for {label}: model expects {model.input_size} feature(s), "
+                          f"test data has shape {test_series.shape}. Please check your preprocessing pipeline. Skipping.")
+            continue
+        train_series = MainUtils.load_array(train_path) if os.path.exists(train_path) else test_series[:0]
+
+        series_scaler_path = MainUtils.load_array_manifest(test_path).get("scaler")
+        series_scaler = MainUtils.load_object(series_scaler_path) if series_scaler_path and os.path.exists(series_scaler_path) else None
+        scaler = series_scaler
+        if model_scaler_path is not None:
+            if series_scaler is None or not os.path.exists(model_scaler_path):
+                logging.warning(f"Skipping {label}. Scaler of the series or of the model not found.")
+                continue
+            scaler = MainUtils.load_object(model_scaler_path)
+            train_series = rescale(train_series, series_scaler, scaler)
+            test_series = rescale(test_series, series_scaler, scaler)
+
+        X, y, previous = walk_forward_windows(train_series, test_series, sequence_length)
+        predictions = batched_predict(model, X, batch_size)
+
+        # Metrics in price units when the scaler is known
+        columns = np.column_stack([y, predictions, previous])
+        if scaler is not None:
+            columns = scaler.inverse_transform(columns.reshape(-1, 1)).reshape(columns.shape)
+        else:
+            logging.warning(f"No scaler recorded for {label}; its metrics are in scaled units.")
+
+        parts.append((len(labels), columns))
+        samples[label] = {"model": model_name, "X": X, "y": y, "y_true": columns[:, 0], "y_pred": columns[:, 1]}
+        labels.append(label)
+
+    if not parts:
+        return {}, samples
+    model_ids = np.concatenate([np.full(len(columns), model_id) for model_id, columns in parts])
+    columns = np.concatenate([columns for _, columns in parts])
+    return compute_metrics(model_ids, columns[:, 0], columns[:, 1], columns[:, 2], labels), samples
 
 def plot_and_save(original_prices, predicted_prices, model_name, save_path):
     """
     Generates a plot of original vs. predicted prices and saves it.
     """
     try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(14, 7))
         plt.plot(original_prices, color='blue', label=f'Original {model_name} Price')
         plt.plot(predicted_prices, color='red', linestyle='--', label=f'Predicted {model_name} Price')
         plt.title(f'Original vs. Predicted Stock Prices for {model_name}')
         plt.xlabel('Time (Trading Days)')
-        plt.ylabel('Price (Scaled)')
+        plt.ylabel('Price')
         plt.legend()
         plt.grid(True)
 
@@ -45,85 +223,73 @@ def plot_and_save(original_prices, predicted_prices, model_name, save_path):
         raise MyException(e, sys)
 
 
+def save_precision_report(precision_report, save_path="./flask_app/artifacts/model_eval/precision_report.json"):
+    MainUtils.save_json(save_path, precision_report)
+    for model_name, report in precision_report.items():
+        summary = ", ".join(
+            f"{p}: rmse={v['rmse']:.5f} {v['latency_ms']:.1f}ms {v['memory_bytes'] / 1024:.0f}KiB"
+            for p, v in report["variants"].items()
+        )
+        logging.info(f"Precision variants for {model_name} ({summary}); recommended: {report['recommended']}")
+    logging.info(f"Precision report saved at {save_path}")
+
+
 def main():
     try:
         logging.info("Starting model evaluation process.")
-        
+        start = time.perf_counter()
+
         # Load parameters and tickers from your params file
         params = MainUtils.load_params(PARAMS_FILE_PATH)
         tickers = params['data_ingestion']['tickers']
         sequence_length = params['lstm_model'].get('time_step', 60)
-        
-        # --- Evaluate and plot for individual tickers ---
+        eval_params = params.get('model_evaluation', {})
+        export_params = params.get('model_export', {})
+        precisions = export_params.get('precisions', ["float16", "int8"])
+        accuracy_budget = export_params.get('accuracy_budget', 0.01)
+
+        # The general series interleaves every ticker by date, so the general model is
+        # scored on each ticker's own series instead (labelled general/<ticker>)
+        candidates = []
         for ticker in tickers:
-            logging.info(f"Evaluating model for {ticker}...")
-            
-            model_path = f"./flask_app/artifacts/models/best_models/best_model_{ticker}.h5"
-            test_data_path = f"./data/interim/stock_data/test/{ticker}_test_processed.pkl"
-            
-            if not os.path.exists(model_path) or not os.path.exists(test_data_path):
-                logging.warning(f"Skipping {ticker}. Model or test data not found.")
-                continue
+            series_paths = (f"./data/interim/stock_data/train/{ticker}_train_series.npy",
+                            f"./data/interim/stock_data/test/{ticker}_test_series.npy")
+            candidates.append((ticker, ticker, os.path.join(BEST_MODELS_DIR, f"best_model_{ticker}.h5"),
+                               *series_paths, None))
+            candidates.append((f"general/{ticker}", "general", os.path.join(BEST_MODELS_DIR, "best_model_general.h5"),
+                               *series_paths, GENERAL_SCALER_PATH))
 
-            # Load the model and interim test data
-            model = load_model(model_path)
-            test_data = MainUtils.load_object(test_data_path)
-            
-            # --- FIX: Added validation for data shape before reshaping and predicting
-            num_features_in_data = test_data.shape[1] - 1
-            num_features_in_model = model.input_shape[-1]
-            
-            if num_features_in_data != num_features_in_model:
-                logging.error(
-                    f"Data shape mismatch for {ticker}. "
-                    f"Model trained with {num_features_in_model} features, "
-                    f"but test data has {num_features_in_data} features. "
-                    f"Please check your preprocessing pipeline. Skipping."
-                )
-                continue
+        metrics, samples = evaluate_models(candidates, sequence_length, eval_params.get('batch_size', 256))
+        MainUtils.save_json(METRICS_PATH, {
+            "sequence_length": sequence_length,
+            "seconds": time.perf_counter() - start,
+            "metrics": metrics,
+        })
+        for label, values in metrics.items():
+            rmse = f"rmse={values['rmse']:.4f} " if "rmse" in values else ""
+            logging.info(f"{label}: {rmse}mape={values['mape']:.2f}% "
+                         f"directional_accuracy={values['directional_accuracy']:.1f}% ({values['samples']} samples)")
+        logging.info(f"Metrics saved at {METRICS_PATH} after {time.perf_counter() - start:.1f}s")
+
+        if eval_params.get('precision_report', True):
+            by_model = {}
+            for sample in samples.values():
+                by_model.setdefault(sample["model"], []).append(sample)
+            save_precision_report({
+                model_name: compare_precision_variants(
+                    model_name, np.concatenate([sample["X"] for sample in group]),
+                    np.concatenate([sample["y"] for sample in group]), precisions, accuracy_budget,
+                    batch_size=eval_params.get('batch_size', 256))
+                for model_name, group in by_model.items()
+            })
 
-            # Reshape data for evaluation
-            X_test, y_test = reshape_for_lstm(test_data, sequence_length)
-            
-            # Make predictions
-            predictions = model.predict(X_test)
-            
-            # Plot and save
-            plot_save_path = f"./flask_app/artifacts/model_eval/evaluation_{ticker}.png"
-            plot_and_save(y_test, predictions, ticker, plot_save_path)
-        
-        # --- Evaluate and plot for generalized model ---
-        logging.info("Evaluating generalized model...")
-        model_path_general = "./flask_app/artifacts/models/best_models/best_model_general.h5"
-        test_data_path_general = "./data/interim/general_stock_data/test/general_test_processed.pkl"
-
-        if not os.path.exists(model_path_general) or not os.path.exists(test_data_path_general):
-            logging.warning("Skipping generalized model. Model or test data not found.")
-            return
-
-        model_general = load_model(model_path_general)
-        test_data_general = MainUtils.load_object(test_data_path_general)
-        
-        # --- FIX: Added validation for data shape for generalized model
-        num_features_in_data_general = test_data_general.shape[1] - 1
-        num_features_in_model_general = model_general.input_shape[-1]
-
-        if num_features_in_data_general != num_features_in_model_general:
-            logging.error(
-                f"Data shape mismatch for generalized model. "
-                f"Model trained with {num_features_in_model_general} features, "
-                f"but test data has {num_features_in_data_general} features. "
-                f"Please check your preprocessing pipeline. Skipping."
-            )
-            return
-
-        X_test_general, y_test_general = reshape_for_lstm(test_data_general, sequence_length)
-        predictions_general = model_general.predict(X_test_general)
-
-        plot_save_path_general = "./flask_app/artifacts/model_eval/evaluation_general.png"
-        plot_and_save(y_test_general, predictions_general, "General", plot_save_path_general)
-        
-        logging.info("All models evaluated and plots saved.")
+        # Plots are for humans only; they run last and are off unless asked for
+        if eval_params.get('plots', False):
+            for label, sample in samples.items():
+                plot_and_save(sample["y_true"], sample["y_pred"], label,
+                              f"./flask_app/artifacts/model_eval/evaluation_{label.replace('/', '_')}.png")
+
+        logging.info(f"All models evaluated in {time.perf_counter() - start:.1f}s.")
 
     except Exception as e:
         logging.error(f"Model evaluation failed: {e}")
@@ -131,4 +297,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
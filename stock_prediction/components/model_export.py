@@ -0,0 +1,59 @@
+import sys
+import os
+import glob
+from flask_app.model_serving.numpy_lstm import load_numpy_lstm_model
+from stock_prediction.utils.main_utils import MainUtils
+from exception import MyException
+from logger import logging
+from stock_prediction.constants import *
+
+BEST_MODELS_DIR = "./flask_app/artifacts/models/best_models"
+QUANTIZED_MODELS_DIR = "./flask_app/artifacts/models/quantized"
+
+
+def variant_path(output_dir: str, model_name: str, precision: str) -> str:
+    return os.path.join(output_dir, f"best_model_{model_name}.{precision}.npz")
+
+
+def export_model_variants(model_path: str, output_dir: str, precisions) -> dict:
+    """
+    Writes one reduced-precision .npz per entry of `precisions` for a best_model_*.h5
+    (weight-only quantization, served by the NumPy LSTM backend).
+    Returns {precision: exported file path}.
+    """
+    try:
+        model_name = os.path.basename(model_path)[len("best_model_"):-len(".h5")]
+        model = load_numpy_lstm_model(model_path)
+        exported = {}
+        for precision in precisions:
+            path = variant_path(output_dir, model_name, precision)
+            model.save(path, precision=precision)
+            exported[precision] = path
+            logging.info(f"Exported {precision} variant of {model_name}: {path} ({os.path.getsize(path) / 1024:.0f} KiB)")
+        return exported
+    except Exception as e:
+        raise MyException(e, sys)
+
+
+def main():
+    try:
+        params = MainUtils.load_params(PARAMS_FILE_PATH)
+        precisions = params.get('model_export', {}).get('precisions', ["float16", "int8"])
+
+        model_paths = sorted(glob.glob(os.path.join(BEST_MODELS_DIR, "best_model_*.h5")))
+        if not model_paths:
+            logging.warning(f"No best models found in {BEST_MODELS_DIR}. Nothing to export.")
+            return
+
+        os.makedirs(QUANTIZED_MODELS_DIR, exist_ok=True)
+        for model_path in model_paths:
+            export_model_variants(model_path, QUANTIZED_MODELS_DIR, precisions)
+
+        logging.info(f"Exported {len(model_paths)} model(s) as {precisions}.")
+
+    except Exception as e:
+        logging.error(f"Model export failed: {e}")
+        raise MyException(e, sys)
+
+if __name__ == "__main__":
+    main()
@@ -1,72 +1,97 @@
 import sys
 import os
-from tensorflow.keras.models import Sequential
+import numpy as np
+from tensorflow.keras.models import Sequential, load_model
 from tensorflow.keras.layers import LSTM, Dense, Dropout
-from tensorflow.keras.callbacks import ModelCheckpoint
+from tensorflow.keras.callbacks import ModelCheckpoint, EarlyStopping
+from tensorflow.keras import optimizers
 from stock_prediction.utils.main_utils import MainUtils
+from stock_prediction.utils.streaming import window_dataset
+from stock_prediction.utils.training_scheduler import run_training_jobs
 from exception import MyException
 from logger import logging
 from stock_prediction.constants import *
 
-def build_lstm_model(input_shape, units, dropout, activation, optimizer, loss):
+BEST_MODELS_DIR = "./flask_app/artifacts/models/best_models"
+FINAL_MODELS_DIR = "./flask_app/artifacts/models/final_models"
+# Written by hyperparameter_search: {model_name: {units, dropout, batch_size, epochs, ...}}
+TUNED_HYPERPARAMETERS_PATH = "./flask_app/artifacts/hyperparameter_search/best_hyperparameters.json"
+TUNABLE_PARAMS = ("units", "dropout", "batch_size", "epochs")
+
+def build_lstm_model(input_shape, units, dropout, activation, optimizer, loss, horizon=1):
     """
     Build and compile a simple multi-layer LSTM model for single-feature regression.
+    With horizon > 1 the output layer predicts the next `horizon` Close values at once
+    (direct multi-horizon forecasting) instead of only the next one.
     """
     model = Sequential([
         LSTM(units=units, return_sequences=True, input_shape=input_shape),
         Dropout(dropout),
         LSTM(units=units, return_sequences=False),
         Dropout(dropout),
-        Dense(1, activation=activation)  # Output layer predicts Close
+        Dense(horizon, activation=activation)  # Output layer predicts the next `horizon` Close values
     ])
     model.compile(optimizer=optimizer, loss=loss)
     return model
 
-def initiate_model_training(train_data_path: str, test_data_path: str, params, model_name: str):
+def model_artifact_name(model_name: str, horizon: int = 1) -> str:
+    """One-step models keep their plain name; multi-horizon ones are saved as <name>_h<horizon>."""
+    return model_name if horizon == 1 else f"{model_name}_h{horizon}"
+
+def initiate_model_training(train_data_path: str, test_data_path: str, params, model_name: str, horizon: int = 1):
     """
     Train LSTM model on a specific stock or generalized dataset.
-    Assumes X_train/X_test are already 3D and y_train/y_test are 1D.
+    Expects the 1-D scaled train/test series; windows are streamed through tf.data,
+    so memory scales with the series length rather than with every materialized window.
+    With horizon > 1 each window is paired with its next `horizon` values and the
+    model is saved as best_model_<model_name>_h<horizon>.h5.
     """
+    model_name = model_artifact_name(model_name, horizon)
     logging.info(f"Training model for {model_name}")
     try:
-        # Load preprocessed data (X_train, y_train), (X_test, y_test)
-        X_train, y_train = MainUtils.load_object(train_data_path)
-        X_test, y_test = MainUtils.load_object(test_data_path)
+        # Open the preprocessed 1-D scaled series memory-mapped
+        train_series = MainUtils.load_array(train_data_path)
+        test_series = MainUtils.load_array(test_data_path)
+        seq_length = params['lstm_model'].get('time_step', 60)
+        batch_size = params['lstm_model']['batch_size']
 
-        logging.info(f"X_train shape: {X_train.shape}, y_train shape: {y_train.shape}")
-        logging.info(f"X_test shape: {X_test.shape}, y_test shape: {y_test.shape}")
+        logging.info(f"Train series length: {len(train_series)}, test series length: {len(test_series)}")
+
+        train_ds = window_dataset(
+            train_series, seq_length=seq_length, batch_size=batch_size, horizon=horizon,
+            shuffle_buffer=params['lstm_model'].get('shuffle_buffer', 10000)
+        )
+        val_ds = window_dataset(test_series, seq_length=seq_length, batch_size=batch_size, horizon=horizon)
 
         # Build LSTM model
-        input_shape = (X_train.shape[1], X_train.shape[2])  # (timesteps, features)
+        input_shape = (seq_length, 1)  # (timesteps, features)
         model = build_lstm_model(
             input_shape=input_shape,
             units=params['lstm_model']['units'],
             dropout=params['lstm_model']['dropout'],
             activation=params['lstm_model']['activation'],
             optimizer=params['lstm_model']['optimizer'],
-            loss=params['lstm_model']['loss']
+            loss=params['lstm_model']['loss'],
+            horizon=horizon
         )
 
         # Checkpoint to save best model
-        checkpoint_dir = "./flask_app/artifacts/models/best_models"
-        os.makedirs(checkpoint_dir, exist_ok=True)
-        checkpoint_path = os.path.join(checkpoint_dir, f"best_model_{model_name}.h5")
+        os.makedirs(BEST_MODELS_DIR, exist_ok=True)
+        checkpoint_path = os.path.join(BEST_MODELS_DIR, f"best_model_{model_name}.h5")
         checkpoint = ModelCheckpoint(checkpoint_path, monitor='val_loss', save_best_only=True, verbose=1)
 
         # Train model
         history = model.fit(
-            X_train, y_train,
-            validation_data=(X_test, y_test),
+            train_ds,
+            validation_data=val_ds,
             epochs=params['lstm_model']['epochs'],
-            batch_size=params['lstm_model']['batch_size'],
             callbacks=[checkpoint],
             verbose=2
         )
 
         # Save final model
-        final_model_dir = "./flask_app/artifacts/models/final_models"
-        os.makedirs(final_model_dir, exist_ok=True)
-        final_model_path = os.path.join(final_model_dir, f"final_model_{model_name}.h5")
+        os.makedirs(FINAL_MODELS_DIR, exist_ok=True)
+        final_model_path = os.path.join(FINAL_MODELS_DIR, f"final_model_{model_name}.h5")
         model.save(final_model_path)
         logging.info(f"Final model saved at {final_model_path}")
 
@@ -76,30 +101,164 @@ def initiate_model_training(train_data_path: str, test_data_path: str, params, m
         logging.error(f"Model training failed for {model_name}: {e}")
         raise MyException(e, sys)
 
+def initiate_incremental_training(train_data_path: str, test_data_path: str, params, model_name: str, horizon: int = 1):
+    """
+    Warm-starts from the current best_model_<model_name>.h5 and fine-tunes it on the newest
+    bars: train and test series are joined in time order, the last
+    `training.incremental.holdout_points` values are held out for early stopping and the
+    `recent_points` values before them are trained on. Newly ingested bars land at the end
+    of the test split, so they are trained on as soon as they leave the hold-out tail.
+
+    The current best model's val_loss on the hold-out tail is the bar to beat: the
+    checkpoint only overwrites the best model once an epoch improves on it, so a worse
+    fine-tune is never promoted. The scaler is not refit in incremental mode (see
+    data_preprocessing), so whichever model is kept matches the scaler it is served with.
+    Falls back to full training when there is no best model yet.
+    Returns (model, best val_loss, promoted).
+    """
+    best_model_path = os.path.join(BEST_MODELS_DIR, f"best_model_{model_artifact_name(model_name, horizon)}.h5")
+    if not os.path.exists(best_model_path):
+        logging.warning(f"No best model at {best_model_path} yet; running full training instead.")
+        model, history = initiate_model_training(train_data_path, test_data_path, params, model_name, horizon)
+        return model, float(min(history.history['val_loss'])), True
+
+    model_name = model_artifact_name(model_name, horizon)
+    logging.info(f"Incremental training for {model_name} from {best_model_path}")
+    try:
+        incremental = params.get('training', {}).get('incremental', {})
+        seq_length = params['lstm_model'].get('time_step', 60)
+        batch_size = params['lstm_model']['batch_size']
+
+        recent_points = incremental.get('recent_points', 250)
+        holdout_points = incremental.get('holdout_points', 60)
+        # Every slice keeps a full window of context in front of its first target
+        context = seq_length + horizon - 1
+        needed = context + recent_points + holdout_points
+        train_series = MainUtils.load_array(train_data_path)
+        test_series = MainUtils.load_array(test_data_path)
+        series = np.concatenate([train_series[-needed:], test_series[-needed:]])[-needed:]
+        if len(series) < context + 2 * holdout_points:
+            raise ValueError(f"Only {len(series)} values for {model_name}; incremental training needs "
+                             f"at least {context + 2 * holdout_points}.")
+
+        train_ds = window_dataset(
+            series[:-holdout_points], seq_length=seq_length, batch_size=batch_size, horizon=horizon,
+            shuffle_buffer=params['lstm_model'].get('shuffle_buffer', 10000)
+        )
+        val_ds = window_dataset(series[-(context + holdout_points):], seq_length=seq_length,
+                                batch_size=batch_size, horizon=horizon)
+
+        model = load_model(best_model_path, compile=False)  # recompiled below with the fine-tuning optimizer
+        # Fine-tune with a smaller step so the warm start is refined rather than overwritten
+        optimizer = optimizers.get({
+            "class_name": params['lstm_model']['optimizer'],
+            "config": {"learning_rate": incremental.get('learning_rate', 1e-4)},
+        })
+        model.compile(optimizer=optimizer, loss=params['lstm_model']['loss'])
+        baseline_loss = float(model.evaluate(val_ds, verbose=0))
+        logging.info(f"Current best val_loss for {model_name}: {baseline_loss:.6f}")
+
+        checkpoint = ModelCheckpoint(best_model_path, monitor='val_loss', save_best_only=True,
+                                     initial_value_threshold=baseline_loss, verbose=1)
+        early_stopping = EarlyStopping(monitor='val_loss', patience=incremental.get('patience', 3),
+                                       restore_best_weights=True)
+        history = model.fit(
+            train_ds,
+            validation_data=val_ds,
+            epochs=incremental.get('epochs', 10),
+            callbacks=[checkpoint, early_stopping],
+            verbose=2
+        )
+
+        candidate_loss = float(min(history.history['val_loss']))
+        promoted = candidate_loss < baseline_loss
+        if promoted:
+            logging.info(f"Promoted fine-tuned {model_name}: val_loss {baseline_loss:.6f} -> {candidate_loss:.6f} "
+                         f"after {len(history.history['val_loss'])} epoch(s)")
+        else:
+            logging.info(f"Kept current best {model_name}: fine-tuned val_loss {candidate_loss:.6f} "
+                         f"did not beat {baseline_loss:.6f}")
+
+        os.makedirs(FINAL_MODELS_DIR, exist_ok=True)
+        final_model_path = os.path.join(FINAL_MODELS_DIR, f"final_model_{model_name}.h5")
+        model.save(final_model_path)
+
+        return model, min(candidate_loss, baseline_loss), promoted
+
+    except Exception as e:
+        logging.error(f"Incremental training failed for {model_name}: {e}")
+        raise MyException(e, sys)
+
+def training_candidates(tickers) -> list:
+    """(model_name, train series path, test series path) for every individual stock plus the generalized dataset."""
+    candidates = [
+        (ticker,
+         f"./data/interim/stock_data/train/{ticker}_train_series.npy",
+         f"./data/interim/stock_data/test/{ticker}_test_series.npy")
+        for ticker in tickers
+    ]
+    candidates.append((
+        "general",
+        "./data/interim/general_stock_data/train/general_train_series.npy",
+        "./data/interim/general_stock_data/test/general_test_series.npy",
+    ))
+    return candidates
+
+def load_tuned_hyperparameters(path: str = TUNED_HYPERPARAMETERS_PATH) -> dict:
+    """The per-model winners of the last hyperparameter search, or {} if none was run."""
+    if not os.path.exists(path):
+        return {}
+    return MainUtils.load_json(path)
+
+def params_for_model(params, model_name: str, tuned: dict, horizon: int = 1):
+    """
+    `params` with the lstm_model block overridden by the tuned config of `model_name`, if there is one.
+    The search only tunes the one-step models, so multi-horizon models keep the defaults.
+    """
+    config = tuned.get(model_name)
+    if not config or horizon != 1:
+        return params
+    overrides = {key: config[key] for key in TUNABLE_PARAMS if key in config}
+    logging.info(f"Using tuned hyperparameters for {model_name}: {overrides}")
+    return {**params, 'lstm_model': {**params['lstm_model'], **overrides}}
+
+def run_training_job(train_data_path: str, test_data_path: str, params, model_name: str, horizon: int = 1) -> float:
+    """Process-pool entry point: trains one model and returns its best validation loss."""
+    if params.get('training', {}).get('mode', 'full') == 'incremental':
+        _, val_loss, _ = initiate_incremental_training(train_data_path, test_data_path, params, model_name, horizon)
+        return val_loss
+    _, history = initiate_model_training(train_data_path, test_data_path, params, model_name, horizon)
+    return float(min(history.history['val_loss']))
+
 def main():
     try:
         params = MainUtils.load_params(PARAMS_FILE_PATH)
         TOP_10_STOCKS = params['data_ingestion']['tickers']
+        training_params = params.get('training', {})
+        forecast_horizon = params['lstm_model'].get('forecast_horizon', 1)
+        horizons = [1] if forecast_horizon <= 1 else [1, forecast_horizon]
+        tuned = load_tuned_hyperparameters() if training_params.get('use_tuned_hyperparameters', True) else {}
 
-        # Train individual stocks
-        for ticker in TOP_10_STOCKS:
-            train_path = f"./data/interim/stock_data/train/{ticker}_train_processed.pkl"
-            test_path = f"./data/interim/stock_data/test/{ticker}_test_processed.pkl"
-
+        # Collect one job per individual stock plus the generalized dataset
+        jobs = []
+        for model_name, train_path, test_path in training_candidates(TOP_10_STOCKS):
             if not os.path.exists(train_path):
-                logging.warning(f"Skipping {ticker}. Processed training data not found.")
+                logging.warning(f"Skipping {model_name}. Processed training data not found.")
                 continue
+            dataset_size = MainUtils.load_array_manifest(train_path)["shape"][0]
+            for horizon in horizons:
+                jobs.append((model_artifact_name(model_name, horizon), dataset_size,
+                             (train_path, test_path, params_for_model(params, model_name, tuned, horizon), model_name, horizon)))
 
-            initiate_model_training(train_path, test_path, params, ticker)
-
-        # Train generalized dataset
-        train_path_gen = "./data/interim/general_stock_data/train/general_train_processed.pkl"
-        test_path_gen = "./data/interim/general_stock_data/test/general_test_processed.pkl"
-
-        if os.path.exists(train_path_gen):
-            initiate_model_training(train_path_gen, test_path_gen, params, "general")
-        else:
-            logging.warning("General dataset not found. Skipping generalized training.")
+        best_val_losses = run_training_jobs(
+            jobs,
+            run_training_job,
+            max_workers=training_params.get('max_workers', 0),
+            intra_op_threads=training_params.get('intra_op_threads', 2),
+            inter_op_threads=training_params.get('inter_op_threads', 1),
+        )
+        for model_name, val_loss in best_val_losses.items():
+            logging.info(f"Best val_loss for {model_name}: {val_loss:.6f}")
 
         logging.info("All model training completed successfully.")
 
@@ -2,7 +2,9 @@ import sys
 import os
 
 import pickle
+import json
 import yaml
+import numpy as np
 
 from stock_prediction.constants import *
 from exception import MyException
@@ -62,6 +64,86 @@ class MainUtils:
         
 
 
+    @staticmethod
+    def save_array(file_path: str, array: np.ndarray, **metadata) -> None:
+        """
+        Save an array as a typed .npy artifact plus a small JSON manifest next to it
+        (same name, .json extension) holding shape, dtype and any extra metadata
+        such as the ticker and the scaler it was produced with.
+        """
+        logging.info("Entered the save_array method of MainUtils class")
+
+        try:
+            array = np.ascontiguousarray(array)
+            np.save(file_path, array)
+            manifest = {
+                "file": os.path.basename(file_path),
+                "shape": list(array.shape),
+                "dtype": str(array.dtype),
+                **metadata,
+            }
+            with open(os.path.splitext(file_path)[0] + ".json", "w") as manifest_file:
+                json.dump(manifest, manifest_file, indent=2)
+
+            logging.info("Exited the save_array method of MainUtils class")
+
+        except Exception as e:
+            raise MyException(e, sys) from e
+
+    @staticmethod
+    def load_array_manifest(file_path: str) -> dict:
+        try:
+            with open(os.path.splitext(file_path)[0] + ".json", "r") as manifest_file:
+                return json.load(manifest_file)
+
+        except Exception as e:
+            raise MyException(e, sys) from e
+
+    @staticmethod
+    def load_array(file_path: str, mmap_mode: str = "r") -> np.ndarray:
+        """
+        Open an array artifact written by save_array. By default the array is
+        memory-mapped read-only, so loading is near-instant and the OS page cache
+        is shared between processes reading the same file.
+        """
+        logging.info("Entered the load_array method of MainUtils class")
+
+        try:
+            manifest = MainUtils.load_array_manifest(file_path)
+            array = np.load(file_path, mmap_mode=mmap_mode)
+            if list(array.shape) != manifest["shape"] or str(array.dtype) != manifest["dtype"]:
+                raise ValueError(
+                    f"Array artifact {file_path} does not match its manifest: "
+                    f"{array.shape}/{array.dtype} vs {manifest['shape']}/{manifest['dtype']}"
+                )
+
+            logging.info("Exited the load_array method of MainUtils class")
+
+            return array
+
+        except Exception as e:
+            raise MyException(e, sys) from e
+
+    @staticmethod
+    def save_json(file_path: str, obj) -> None:
+        """Write a machine-readable report (metrics, comparisons, ...) as indented JSON."""
+        try:
+            os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+            with open(file_path, "w") as json_file:
+                json.dump(obj, json_file, indent=2)
+
+        except Exception as e:
+            raise MyException(e, sys) from e
+
+    @staticmethod
+    def load_json(file_path: str):
+        try:
+            with open(file_path, "r") as json_file:
+                return json.load(json_file)
+
+        except Exception as e:
+            raise MyException(e, sys) from e
+
     @staticmethod
     def load_params(params_path: str = PARAMS_FILE_PATH) -> dict:
         """Load parameters from a YAML file."""
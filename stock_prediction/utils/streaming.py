@@ -0,0 +1,30 @@
+import numpy as np
+import tensorflow as tf
+
+
+def window_dataset(series: np.ndarray, seq_length: int = 60, batch_size: int = 32, horizon: int = 1,
+                   shuffle_buffer: int = None, seed: int = None) -> tf.data.Dataset:
+    """
+    Streams (X, y) LSTM batches from a 1-D scaled series without materializing the windows.
+
+    Only window start indices are shuffled and batched; each batch then gathers its
+    windows from the series, so memory stays proportional to the series length
+    instead of series length x seq_length.
+
+    :return: dataset of X: (batch, seq_length, 1) and y: (batch,) or (batch, horizon).
+    """
+    series = np.asarray(series, dtype=np.float32).reshape(-1)
+    n_windows = max(0, series.shape[0] - seq_length - horizon + 1)
+    data = tf.constant(series)
+    window_offsets = tf.range(seq_length, dtype=tf.int64)
+    target_offsets = tf.range(horizon, dtype=tf.int64) + seq_length
+
+    def gather(starts):
+        X = tf.gather(data, starts[:, None] + window_offsets)[..., None]
+        y = tf.gather(data, starts[:, None] + target_offsets)
+        return X, (y[:, 0] if horizon == 1 else y)
+
+    ds = tf.data.Dataset.range(n_windows)
+    if shuffle_buffer:
+        ds = ds.shuffle(min(shuffle_buffer, max(n_windows, 1)), seed=seed, reshuffle_each_iteration=True)
+    return ds.batch(batch_size).map(gather, num_parallel_calls=tf.data.AUTOTUNE).prefetch(tf.data.AUTOTUNE)
@@ -0,0 +1,69 @@
+import os
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from logger import logging
+
+
+def configure_tf_threads(intra_op_threads: int, inter_op_threads: int) -> None:
+    """
+    Limit TensorFlow's thread pools for this process. Must run before TensorFlow
+    executes its first op, so it is used as the process-pool initializer.
+    """
+    import tensorflow as tf
+
+    tf.config.threading.set_intra_op_parallelism_threads(intra_op_threads)
+    tf.config.threading.set_inter_op_parallelism_threads(inter_op_threads)
+
+
+def _timed_job(fn, name: str, args: tuple):
+    start = time.perf_counter()
+    result = fn(*args)
+    return name, time.perf_counter() - start, result
+
+
+def resolve_workers(max_workers: int, intra_op_threads: int) -> int:
+    """0/None means: as many workers as fit on the machine without oversubscribing cores."""
+    if max_workers:
+        return max_workers
+    return max(1, (os.cpu_count() or 1) // max(1, intra_op_threads))
+
+
+def run_training_jobs(jobs, fn, max_workers: int = 0, intra_op_threads: int = 2, inter_op_threads: int = 1) -> dict:
+    """
+    Run independent training jobs in a process pool.
+
+    :param jobs: iterable of (name, size, args); larger jobs are started first so the
+                 longest one (usually the general model) does not finish last on its own.
+    :param fn: picklable top-level function called as fn(*args) in a worker process.
+    :return: {name: result} for every job. Raises after all jobs finished if any failed.
+    """
+    jobs = sorted(jobs, key=lambda job: job[1], reverse=True)
+    workers = min(resolve_workers(max_workers, intra_op_threads), max(1, len(jobs)))
+    logging.info(
+        f"Scheduling {len(jobs)} training job(s) on {workers} worker(s) "
+        f"(intra_op={intra_op_threads}, inter_op={inter_op_threads}): {[name for name, _, _ in jobs]}"
+    )
+
+    results, failures = {}, {}
+    total_start = time.perf_counter()
+    # spawn gives every worker a fresh TensorFlow runtime that honours the thread limits
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=configure_tf_threads,
+                             initargs=(intra_op_threads, inter_op_threads)) as executor:
+        futures = {executor.submit(_timed_job, fn, name, args): name for name, _, args in jobs}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                _, elapsed, result = future.result()
+                results[name] = result
+                logging.info(f"Training job {name} finished in {elapsed:.1f}s")
+            except Exception as e:
+                failures[name] = e
+                logging.error(f"Training job {name} failed: {e}")
+
+    logging.info(f"All training jobs finished in {time.perf_counter() - total_start:.1f}s wall time")
+    if failures:
+        raise RuntimeError(f"Training failed for: {', '.join(sorted(failures))}")
+    return results
@@ -0,0 +1,49 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def window_view(features: np.ndarray, seq_length: int = 60, horizon: int = 1) -> np.ndarray:
+    """
+    Input windows over a (timesteps, n_features) array as a read-only strided view.
+
+    Window i covers rows [i, i + seq_length) and is followed by `horizon` target rows,
+    so the result has shape (timesteps - seq_length - horizon + 1, seq_length, n_features)
+    and shares memory with `features` (no copy).
+    """
+    features = np.asarray(features)
+    if features.ndim == 1:
+        features = features[:, None]
+    n_windows = features.shape[0] - seq_length - horizon + 1
+    if n_windows <= 0:
+        return np.empty((0, seq_length, features.shape[1]), dtype=features.dtype)
+    # sliding_window_view puts the window axis last: (n_windows, n_features, seq_length)
+    windows = sliding_window_view(features[:features.shape[0] - horizon], seq_length, axis=0)
+    return windows.transpose(0, 2, 1)
+
+
+def target_view(targets: np.ndarray, seq_length: int = 60, horizon: int = 1) -> np.ndarray:
+    """
+    Targets aligned with `window_view`: the `horizon` values right after each window.
+    Returns shape (n_windows,) when horizon == 1, otherwise (n_windows, horizon), as a view.
+    """
+    targets = np.asarray(targets).reshape(-1)
+    n_windows = targets.shape[0] - seq_length - horizon + 1
+    if n_windows <= 0:
+        return np.empty((0,) if horizon == 1 else (0, horizon), dtype=targets.dtype)
+    if horizon == 1:
+        return targets[seq_length:]
+    return sliding_window_view(targets[seq_length:], horizon)
+
+
+def make_sequences(features: np.ndarray, targets: np.ndarray = None, seq_length: int = 60, horizon: int = 1):
+    """
+    Builds (X, y) LSTM samples without copying the data.
+
+    :param features: (timesteps,) or (timesteps, n_features) input series.
+    :param targets: (timesteps,) target series; defaults to the first feature column.
+    :return: X of shape (n, seq_length, n_features) and y of shape (n,) or (n, horizon).
+    """
+    features = np.asarray(features)
+    if targets is None:
+        targets = features if features.ndim == 1 else features[:, 0]
+    return window_view(features, seq_length, horizon), target_view(targets, seq_length, horizon)